@@ -106,7 +106,7 @@ setup(
 
     # additional package data files that goes into the package itself
     package_data = {
-            '': ['*.json'],
+            '': ['*.json', '*.index'],
     },
 
     # console entry point
@@ -123,6 +123,7 @@ setup(
                 'restview',
                 'Sphinx',
                 'sphinx-rtd-theme'],
+        'columnar': ['numpy'],
     },
 
     # external modules
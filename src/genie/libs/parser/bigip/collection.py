@@ -0,0 +1,372 @@
+'''Concurrent collection of the BIG-IP iControl REST resources
+
+Each BIG-IP parser gets one resource, like `/mgmt/tm/ltm/pool`, with its
+own device.get(), so the snapshot of a load balancer is as many round trips
+one after the other. BigipCollector gets the resources of a list of
+parsers concurrently, and gives the result of each parser as it completes:
+
+    example:
+
+        >>> from genie.libs.parser.bigip.get_ltm_pool import LtmPool
+        >>> from genie.libs.parser.bigip.get_ltm_virtual import LtmVirtual
+        >>> with BigipCollector(device, max_workers=8) as collector:
+        ...     for result in collector.collect([LtmPool, LtmVirtual]):
+        ...         snapshot[result.parser.cli_command] = result.parsed
+
+The resources are read through `device.get()`, the REST connection of the
+device, or through a RestSession, a pool of keep-alive connections to the
+iControl REST API which reads the bodies as a stream:
+
+    example:
+
+        >>> session = RestSession('lb1.example.com',
+        ...                       auth=('admin', 'password'))
+        >>> collector = BigipCollector(session, page_size=500)
+
+A collection is read one page at a time with `$top`/`$skip`, when a
+page_size is given, and the `nextLink` of each page is followed. The items
+of each page are decoded as the body is read, see
+`BigipCollector.iter_items()`.
+'''
+
+# python
+import ssl
+import base64
+import logging
+import threading
+import http.client
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
+
+from genie.libs.parser.utils.stream import CHUNK_SIZE
+from genie.libs.parser.utils.json_stream import iter_json_items
+
+log = logging.getLogger(__name__)
+
+# Members of a page which do not describe the whole collection
+PAGE_MEMBERS = ('nextLink', 'previousLink', 'currentItemCount',
+                'itemsPerPage', 'pageIndex', 'startIndex', 'totalPages')
+
+# Outcome of a parser, `index` is the position of the parser in the list
+RestResult = namedtuple('RestResult', ['index', 'parser', 'parsed',
+                                       'error'])
+
+
+class RestResponse(object):
+    '''Body of a RestSession response, read as a stream. The connection
+    goes back to the pool once the body is read.'''
+
+    def __init__(self, session, connection, response):
+        self.session = session
+        self.status_code = response.status
+        self.reason = response.reason
+        self._connection = connection
+        self._response = response
+
+    def iter_content(self, chunk_size=CHUNK_SIZE):
+        '''Yield the blocks of the body. The connection is closed when the
+        body is not read to its end, on an error or when the caller stops
+        early.'''
+        read = False
+        try:
+            chunk = self._response.read(chunk_size)
+            while chunk:
+                yield chunk
+                chunk = self._response.read(chunk_size)
+            read = True
+        finally:
+            self.close(reuse=read)
+
+    def json(self):
+        '''Return the decoded body'''
+        members = {}
+        items = list(iter_json_items(self.iter_content(), members=members))
+        if 'items' in members:
+            members['items'] = items
+        return members
+
+    def close(self, reuse=True):
+        '''Give the connection back, closed if the body was not read'''
+        if self._connection is None:
+            return
+        connection, self._connection = self._connection, None
+        reuse = reuse and self._response.isclosed() and \
+            not self._response.will_close
+        self.session._release(connection, reuse)
+
+
+class RestSession(object):
+    '''Pool of keep-alive connections to an iControl REST API, shared by
+    the threads of a collection
+
+        Args:
+            host (`str`): address of the management interface
+            port (`int`): port, the default port of the scheme by default
+            scheme (`str`): 'https' or 'http'
+            auth (`tuple`): (username, password) of the basic authentication
+            headers (`dict`): headers of every request, like an
+                              X-F5-Auth-Token
+            maxsize (`int`): number of idle connections kept
+            timeout (`float`): timeout of the connections, in seconds
+            context (`ssl.SSLContext`): context of the https connections,
+                                        without certificate verification
+                                        by default, as the management
+                                        certificates are self-signed
+    '''
+
+    def __init__(self, host, port=None, scheme='https', auth=None,
+                 headers=None, maxsize=8, timeout=30, context=None):
+        if scheme not in ('http', 'https'):
+            raise ValueError("Unsupported scheme '{}'".format(scheme))
+        self.host = host
+        self.port = port
+        self.scheme = scheme
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self.headers = {'Accept': 'application/json',
+                        'Connection': 'keep-alive'}
+        if auth is not None:
+            token = base64.b64encode(
+                '{}:{}'.format(*auth).encode()).decode('ascii')
+            self.headers['Authorization'] = 'Basic ' + token
+        self.headers.update(headers or {})
+        if scheme == 'https' and context is None:
+            context = ssl.create_default_context()
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        self.context = context
+        self.connections = 0
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _connect(self):
+        with self._lock:
+            self.connections += 1
+        if self.scheme == 'https':
+            return http.client.HTTPSConnection(
+                self.host, self.port, timeout=self.timeout,
+                context=self.context)
+        return http.client.HTTPConnection(self.host, self.port,
+                                          timeout=self.timeout)
+
+    def _acquire(self):
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+        return self._connect(), False
+
+    def _release(self, connection, reuse):
+        with self._lock:
+            if reuse and len(self._idle) < self.maxsize:
+                self._idle.append(connection)
+                return
+        connection.close()
+
+    def get(self, path):
+        '''Get a resource, its body is read from the response
+
+            Args:
+                path (`str`): path of the resource, with its query
+
+            Returns:
+                RestResponse
+
+            Raises:
+                Exception: status of the response is not 200
+        '''
+        connection, reused = self._acquire()
+        try:
+            connection.request('GET', path, headers=self.headers)
+            response = connection.getresponse()
+        except (http.client.HTTPException, ConnectionError):
+            connection.close()
+            if not reused:
+                raise
+            # Idle connection closed by the server, once on a new one
+            connection = self._connect()
+            try:
+                connection.request('GET', path, headers=self.headers)
+                response = connection.getresponse()
+            except Exception:
+                connection.close()
+                raise
+        except Exception:
+            connection.close()
+            raise
+
+        response = RestResponse(self, connection, response)
+        if response.status_code != 200:
+            body = b''.join(response.iter_content())
+            raise Exception("GET '{}' failed with status {} {}: {}".format(
+                path, response.status_code, response.reason,
+                body.decode(errors='replace')))
+        return response
+
+    def close(self):
+        '''Close the idle connections'''
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+
+def _page_path(path, page_size, skip):
+    return '{}{}$top={}&$skip={}'.format(path, '&' if '?' in path else '?',
+                                         page_size, skip)
+
+
+class BigipCollector(object):
+    '''Concurrent collection of the resources of the BIG-IP parsers
+
+        Args:
+            device (`Device` or `RestSession`): gets the resources, with
+                                                get(path)
+            max_workers (`int`): number of concurrent gets, not above the
+                                 connection pool of the device
+            page_size (`int`): items per page of the collections, the
+                               device default when None
+            executor (`Executor`): use this executor instead of a thread
+                                   pool, it is not shut down by the
+                                   collector
+    '''
+
+    def __init__(self, device, max_workers=8, page_size=None, executor=None):
+        self.device = device
+        self.max_workers = max_workers
+        self.page_size = page_size
+        self._owned = executor is None
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.executor = executor
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    def shutdown(self, wait=True):
+        if self._owned:
+            self.executor.shutdown(wait=wait)
+
+    def iter_items(self, path, members=None):
+        '''Yield the items of a collection, one page after the other
+
+        The next page is requested once the items of the page are read.
+
+            Args:
+                path (`str`): path of the collection
+                members (`dict`): updated with the other members of the
+                                  first page, and the number of pages as
+                                  `pages`
+
+            Returns:
+                generator of the items
+        '''
+        if self.page_size:
+            path = _page_path(path, self.page_size, 0)
+        pages = 0
+        while path:
+            response = self.device.get(path)
+            page = {}
+            if hasattr(response, 'iter_content'):
+                yield from iter_json_items(response.iter_content(CHUNK_SIZE),
+                                           members=page)
+            else:
+                page = dict(response.json() or {})
+                if 'items' in page:
+                    yield from page['items']
+                    page['items'] = []
+            pages += 1
+            if members is not None:
+                if pages == 1:
+                    members.update(page)
+                members['pages'] = pages
+
+            # nextLink holds the address of the device as the device sees
+            # itself, like https://localhost/mgmt/tm/ltm/pool?$skip=500
+            next_link = page.get('nextLink')
+            if next_link:
+                link = urlsplit(next_link)
+                path = link.path + ('?' + link.query if link.query else '')
+            else:
+                path = None
+
+    def fetch(self, path):
+        '''Return the resource of a parser, with the items of every page
+
+            Args:
+                path (`str`): path of the resource
+
+            Returns:
+                `dict`, as the rest() of the parser
+        '''
+        members = {}
+        items = list(self.iter_items(path, members=members))
+        pages = members.pop('pages', 0)
+        if pages > 1:
+            for member in PAGE_MEMBERS:
+                members.pop(member, None)
+        if 'items' in members:
+            members['items'] = items
+        return members
+
+    def collect(self, parsers):
+        '''Get the resources of the parsers concurrently
+
+            Args:
+                parsers (`list`): BIG-IP parser classes or instances, with
+                                  their resource as cli_command
+
+            Returns:
+                generator of RestResult, in completion order, with the
+                exception as `error` for a resource which failed
+        '''
+        futures = {}
+        for index, parser in enumerate(parsers):
+            future = self.executor.submit(self.fetch, parser.cli_command)
+            futures[future] = (index, parser)
+
+        for future in as_completed(futures):
+            index, parser = futures[future]
+            try:
+                parsed = future.result()
+            except Exception as e:
+                log.debug("Could not get '{}': {}".format(
+                    parser.cli_command, e))
+                yield RestResult(index, parser, None, e)
+                continue
+            yield RestResult(index, parser, parsed, None)
+
+
+def collect(device, parsers, max_workers=8, page_size=None):
+    '''Get the resources of BIG-IP parsers concurrently
+
+        Args:
+            device (`Device` or `RestSession`): gets the resources
+            parsers (`list`): BIG-IP parser classes or instances
+            max_workers (`int`): number of concurrent gets
+            page_size (`int`): items per page of the collections
+
+        Returns:
+            `dict` of the resource of each parser, by cli_command
+
+        Raises:
+            the error of the first resource which failed
+    '''
+    results = {}
+    with BigipCollector(device, max_workers=max_workers,
+                        page_size=page_size) as collector:
+        for result in sorted(collector.collect(parsers),
+                             key=lambda result: result.index):
+            if result.error is not None:
+                raise result.error
+            results[result.parser.cli_command] = result.parsed
+    return results
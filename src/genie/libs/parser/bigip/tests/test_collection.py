@@ -0,0 +1,173 @@
+
+import json
+import threading
+import unittest
+from unittest.mock import Mock, patch, ANY
+from socketserver import ThreadingMixIn
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+from genie.libs.parser.bigip.collection import (
+    RestSession,
+    BigipCollector,
+    collect
+)
+from genie.libs.parser.bigip.get_ltm_pool import LtmPool
+from genie.libs.parser.bigip.get_ltm_virtual import LtmVirtual
+from genie.libs.parser.bigip.get_sys_version import SysVersion
+
+
+pools = [{'kind': 'tm:ltm:pool:poolstate', 'name': 'pool{}'.format(index),
+          'fullPath': '/Common/pool{}'.format(index),
+          'loadBalancingMode': 'round-robin'} for index in range(5)]
+
+resources = {
+    '/mgmt/tm/ltm/virtual': {
+        'kind': 'tm:ltm:virtual:virtualcollectionstate',
+        'selfLink': 'https://localhost/mgmt/tm/ltm/virtual?ver=13.1.0',
+        'items': []},
+    '/mgmt/tm/sys/version': {
+        'kind': 'tm:sys:version:versionstats',
+        'entries': {'https://localhost/mgmt/tm/sys/version/0': {
+            'nestedStats': {'entries': {'Version': {
+                'description': '13.1.0'}}}}}},
+}
+
+
+class IControlHandler(BaseHTTPRequestHandler):
+    '''Stand-in of the iControl REST API, the pools are paginated with
+    $top and $skip'''
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.server.ports.add(self.client_address[1])
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+
+        if url.path == '/mgmt/tm/ltm/pool':
+            top = int(query.get('$top', [len(pools)])[0])
+            skip = int(query.get('$skip', [0])[0])
+            body = {'kind': 'tm:ltm:pool:poolcollectionstate',
+                    'selfLink': 'https://localhost/mgmt/tm/ltm/pool',
+                    'currentItemCount': len(pools[skip:skip + top]),
+                    'pageIndex': skip // top + 1,
+                    'items': pools[skip:skip + top]}
+            if skip + top < len(pools):
+                body['nextLink'] = 'https://localhost/mgmt/tm/ltm/pool' \
+                                   '?$top={}&$skip={}&ver=13.1.0'.format(
+                                       top, skip + top)
+        elif url.path in resources:
+            body = resources[url.path]
+        else:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class IControlServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class TestBigipCollector(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = IControlServer(('127.0.0.1', 0), IControlHandler)
+        cls.server.ports = set()
+        cls.thread = threading.Thread(target=cls.server.serve_forever)
+        cls.thread.daemon = True
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.ports.clear()
+        self.session = RestSession('127.0.0.1', self.server.server_port,
+                                   scheme='http', auth=('admin', 'admin'))
+        self.addCleanup(self.session.close)
+
+    def test_pages(self):
+        collector = BigipCollector(self.session, page_size=2)
+        members = {}
+        self.assertEqual(list(collector.iter_items('/mgmt/tm/ltm/pool',
+                                                   members=members)), pools)
+        self.assertEqual(members['pages'], 3)
+        self.assertEqual(members['pageIndex'], 1)
+
+        # The page members are not kept
+        self.assertEqual(collector.fetch('/mgmt/tm/ltm/pool'), {
+            'kind': 'tm:ltm:pool:poolcollectionstate',
+            'selfLink': 'https://localhost/mgmt/tm/ltm/pool',
+            'items': pools})
+        collector.shutdown()
+
+        # Keep-alive
+        self.assertEqual(self.session.connections, 1)
+        self.assertEqual(len(self.server.ports), 1)
+
+    def test_stopped(self):
+        collector = BigipCollector(self.session, page_size=2)
+        items = collector.iter_items('/mgmt/tm/ltm/pool')
+        self.assertEqual(next(items), pools[0])
+        with patch.object(self.session, '_release',
+                          wraps=self.session._release) as release:
+            items.close()
+        collector.shutdown()
+
+        # The body was not read, the connection is closed
+        release.assert_called_once_with(ANY, False)
+        self.assertEqual(self.session._idle, [])
+        self.assertEqual(collector.fetch('/mgmt/tm/ltm/pool')['items'],
+                         pools)
+        self.assertEqual(self.session.connections, 2)
+
+    def test_collect(self):
+        parsers = [LtmPool, LtmVirtual, SysVersion]
+        with BigipCollector(self.session, max_workers=3) as collector:
+            results = sorted(collector.collect(parsers))
+        self.assertEqual([result.parser for result in results], parsers)
+        self.assertEqual(results[0].parsed['items'], pools)
+        # As the rest() of the parsers
+        self.assertEqual(results[1].parsed, resources['/mgmt/tm/ltm/virtual'])
+        self.assertEqual(results[2].parsed, resources['/mgmt/tm/sys/version'])
+        self.assertLessEqual(self.session.connections, 3)
+
+    def test_error(self):
+        missing = Mock(cli_command='/mgmt/tm/missing')
+        with BigipCollector(self.session) as collector:
+            results = sorted(collector.collect([missing, SysVersion]),
+                             key=lambda result: result.index)
+        self.assertIn('404', str(results[0].error))
+        self.assertIsNone(results[0].parsed)
+        self.assertIsNone(results[1].error)
+
+        with self.assertRaises(Exception):
+            collect(self.session, [missing])
+
+    def test_device(self):
+        # A device whose REST connection gives decoded responses
+        device = Mock()
+        device.get.side_effect = lambda path: Mock(
+            spec=['json'], **{'json.return_value': resources[path]})
+        self.assertEqual(collect(device, [LtmVirtual, SysVersion]), {
+            '/mgmt/tm/ltm/virtual': resources['/mgmt/tm/ltm/virtual'],
+            '/mgmt/tm/sys/version': resources['/mgmt/tm/sys/version']})
+
+
+if __name__ == '__main__':
+    unittest.main()
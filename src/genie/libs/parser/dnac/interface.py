@@ -12,6 +12,7 @@ import re
 import unittest
 from genie import parsergen
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 from pyats.log.utils import banner
 
@@ -26,9 +27,101 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Use
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.ttl_cache import TtlCache
+
+from pyats import configuration as cfg
 
 logger = logging.getLogger(__name__)
 
+HOSTNAME_CACHE_TTL = 'genie.libs.parser.dnac_hostname_ttl'
+
+# Network devices per bulk lookup, within the url length and page size
+# limits of the controller
+LOOKUP_CHUNK_SIZE = 100
+
+# Concurrent lookups on the controller
+LOOKUP_WORKERS = 4
+
+# Hostnames of the network devices, by controller and device id, shared by
+# the parse calls
+hostname_cache = TtlCache(ttl=float(cfg.get(HOSTNAME_CACHE_TTL, 300)),
+                          maxsize=65536)
+
+
+def _lookup_hostnames(device, device_ids):
+    '''Get the hostnames of network devices from the controller
+
+    One device is looked up by its id, as before. Several are looked up
+    with the network-device listing of their ids, LOOKUP_CHUNK_SIZE at a
+    time and concurrently, and those not listed by their own id.
+    '''
+    single_cmd = '/dna/intent/api/v1/network-device/{device_id}'
+    bulk_cmd = '/dna/intent/api/v1/network-device?id={device_ids}'
+
+    def single(device_id):
+        device_info = device.get(
+            single_cmd.format(device_id=device_id)).json()['response']
+        return {device_id: device_info['hostname']}
+
+    def bulk(chunk):
+        devices = device.get(bulk_cmd.format(
+            device_ids=','.join(chunk))).json()['response']
+        # Ids which are not found are listed as null
+        return {device_info['id']: device_info['hostname']
+                for device_info in devices or []
+                if device_info and device_info.get('id') in chunk}
+
+    if len(device_ids) == 1:
+        return single(device_ids[0])
+
+    chunks = [device_ids[index:index + LOOKUP_CHUNK_SIZE]
+              for index in range(0, len(device_ids), LOOKUP_CHUNK_SIZE)]
+    hostnames = {}
+    with ThreadPoolExecutor(max_workers=min(LOOKUP_WORKERS,
+                                            len(chunks))) as executor:
+        for found in executor.map(bulk, chunks):
+            hostnames.update(found)
+
+        missing = [device_id for device_id in device_ids
+                   if device_id not in hostnames]
+        for found in executor.map(single, missing):
+            hostnames.update(found)
+    return hostnames
+
+
+def get_hostnames(device, device_ids):
+    '''Return the hostnames of network devices of the controller, from the
+    hostname cache or looked up together
+
+        Args:
+            device (`Device`): DNA Center controller
+            device_ids (`list`): ids of the network devices
+
+        Returns:
+            `dict` of the hostname of each device id
+    '''
+    hostnames = {}
+    missing = []
+    for device_id in dict.fromkeys(device_ids):
+        cached = hostname_cache.get((id(device), device_id))
+        # The controller is kept with its hostnames, so its id is not reused
+        if cached is not None and cached[0] is device:
+            hostnames[device_id] = cached[1]
+        else:
+            missing.append(device_id)
+
+    if missing:
+        for device_id, hostname in _lookup_hostnames(device,
+                                                     missing).items():
+            hostname_cache.set((id(device), device_id), (device, hostname))
+            hostnames[device_id] = hostname
+    return hostnames
+
+
+def clear_hostname_cache():
+    '''Forget the hostnames of the network devices'''
+    hostname_cache.clear()
+
 # ============================================
 # Schema for '/dna/intent/api/v1/interface'
 # ============================================
@@ -101,20 +194,13 @@ class Interface(InterfaceSchema):
         else:
             out = output
 
-        # get device by id
-        cmd = '/dna/intent/api/v1/network-device/{device_id}'
+        # get the hostnames of the devices together
+        id_to_hostname = get_hostnames(
+            self.device, [intf_dict['deviceId'] for intf_dict in out])
 
         result_dict={}
-        id_to_hostname = {}
         for intf_dict in out:
-            device_id = intf_dict['deviceId']
-            if device_id not in id_to_hostname:
-                device_id_cmd = cmd.format(device_id=device_id)
-                device_info = self.device.get(device_id_cmd).json()['response']
-                hostname = device_info['hostname']
-                id_to_hostname[device_id] = hostname
-            else:
-                hostname = id_to_hostname[device_id]
+            hostname = id_to_hostname[intf_dict['deviceId']]
 
             host_info = result_dict.setdefault('hostname', {}).setdefault(hostname, {}).setdefault('interfaces', {})
             # remove None values
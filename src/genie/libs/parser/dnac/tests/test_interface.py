@@ -1,6 +1,8 @@
 # Python
+import threading
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
+from urllib.parse import urlsplit, parse_qs
 from requests.models import Response
 # ATS
 from pyats.topology import Device
@@ -9,6 +11,8 @@ from genie.metaparser.util.exceptions import SchemaEmptyParserError, \
     SchemaMissingKeyError
 
 # Parser
+from genie.libs.parser.utils.ttl_cache import TtlCache
+from genie.libs.parser.dnac import interface
 from genie.libs.parser.dnac.interface import Interface
 
 
@@ -215,5 +219,102 @@ class TestInterfaceRest(unittest.TestCase):
         self.assertEqual(parsed_output, self.golden_parsed_output)
 
 
+class MockController(object):
+    '''DNA Center with network devices of two interfaces each'''
+
+    def __init__(self, devices):
+        self.devices = {'device-{}'.format(index): 'host{}'.format(index)
+                        for index in range(devices)}
+        self.paths = []
+        self._lock = threading.Lock()
+
+    def _response(self, response):
+        reply = Mock(spec=Response)
+        reply.json.return_value = {'response': response, 'version': '1.0'}
+        reply.status_code = 200
+        return reply
+
+    def get(self, path):
+        with self._lock:
+            self.paths.append(path)
+        url = urlsplit(path)
+        if url.path == '/dna/intent/api/v1/interface':
+            return self._response([
+                dict(TestInterfaceRest.golden_response_output1['response'][
+                    port], deviceId=device_id, portName='Gi0/0/{}'.format(
+                        port))
+                for device_id in self.devices for port in (0, 1)])
+        if url.path == '/dna/intent/api/v1/network-device':
+            device_ids = parse_qs(url.query)['id'][0].split(',')
+            # The last device is not listed
+            return self._response([
+                {'id': device_id, 'hostname': self.devices[device_id]}
+                if device_id in self.devices and
+                device_id != 'device-{}'.format(len(self.devices) - 1)
+                else None for device_id in device_ids])
+        device_id = url.path.rpartition('/')[2]
+        return self._response({'id': device_id,
+                               'hostname': self.devices[device_id]})
+
+
+class TestInterfaceHostnames(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 0
+        cache = TtlCache(ttl=300, timer=lambda: self.now)
+        patcher = patch.object(interface, 'hostname_cache', cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def expected(self, controller):
+        parsed = {'hostname': {}}
+        for reply in controller.get(
+                '/dna/intent/api/v1/interface').json()['response']:
+            parsed['hostname'].setdefault(
+                controller.devices[reply['deviceId']],
+                {'interfaces': {}})['interfaces'][reply['portName']] = {
+                    k: v for k, v in reply.items() if v is not None}
+        return parsed
+
+    def test_bulk(self):
+        controller = MockController(250)
+        parsed_output = Interface(device=controller).parse()
+
+        # 3 listings of 100 devices, and the device which is not listed
+        lookups = controller.paths[1:]
+        self.assertEqual(len(lookups), 4)
+        self.assertEqual(sum('network-device?id=' in path
+                             for path in lookups), 3)
+        self.assertEqual(lookups[-1],
+                         '/dna/intent/api/v1/network-device/device-249')
+
+        self.assertEqual(parsed_output, self.expected(controller))
+        self.assertEqual(list(parsed_output['hostname'])[:2],
+                         ['host0', 'host1'])
+
+    def test_cached(self):
+        controller = MockController(3)
+        Interface(device=controller).parse()
+        self.assertEqual(len(controller.paths), 3)
+
+        # Shared by the parse calls
+        del controller.paths[:]
+        self.assertEqual(Interface(device=controller).parse(),
+                         self.expected(controller))
+        self.assertEqual(controller.paths,
+                         ['/dna/intent/api/v1/interface'] * 2)
+
+        # Not by the controllers
+        other = MockController(3)
+        Interface(device=other).parse()
+        self.assertEqual(len(other.paths), 3)
+
+        # Expired
+        self.now = 300
+        del controller.paths[:]
+        Interface(device=controller).parse()
+        self.assertEqual(len(controller.paths), 3)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -22,6 +22,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.records import RecordParser
 
 
 # =============================================
@@ -64,7 +65,7 @@ class ShowArpSchema(MetaParser):
     }
 
 
-class ShowArp(ShowArpSchema):
+class ShowArp(ShowArpSchema, RecordParser):
     """ Parser for show arp
                   show arp <WROD>
                   show arp vrf <vrf>
@@ -73,7 +74,24 @@ class ShowArp(ShowArpSchema):
     cli_command = ['show arp','show arp vrf {vrf}','show arp vrf {vrf} {intf_or_ip}','show arp {intf_or_ip}']
     exclude = ['age']
 
+    record_keys = ('interface',)
+
     def cli(self, vrf='', intf_or_ip='', cmd=None, output=None):
+        return self.aggregate(self.cli_iter(vrf=vrf, intf_or_ip=intf_or_ip,
+                                            cmd=cmd, output=output))
+
+    def add_record(self, parsed, record):
+        if 'interface' in record:
+            parsed.setdefault('interfaces', {}).setdefault(
+                record['interface'], {}).setdefault('ipv4', {}).setdefault(
+                'neighbors', {}).setdefault(record['ip'], {}).update(
+                self.record_data(record))
+        else:
+            parsed.setdefault('global_static_table', {}).setdefault(
+                record['ip_address'], {}).update(record)
+
+    def cli_iter(self, vrf='', intf_or_ip='', cmd=None, output=None):
+        """Yield one record per arp entry"""
         if output is None:
             if not cmd:
                 cmd = self.cli_command[0]
@@ -92,8 +110,6 @@ class ShowArp(ShowArpSchema):
         # Internet  10.169.197.93          -   fa16.3eff.b7ad  ARPA
         p1 = re.compile(r'^(?P<protocol>\w+) +(?P<address>[\d\.\:]+) +(?P<age>[\d\-]+) +'
                          '(?P<mac>[\w\.]+) +(?P<type>\w+)( +(?P<interface>[\w\.\/\-]+))?$')
-        # initial variables
-        ret_dict = {}
 
         for line in out.splitlines():
             line = line.strip()
@@ -106,30 +122,25 @@ class ShowArp(ShowArpSchema):
                 address = group['address']
                 interface = group['interface']
                 if interface:
-                    final_dict = ret_dict.setdefault('interfaces', {}).setdefault(
-                        interface, {}).setdefault('ipv4', {}).setdefault(
-                        'neighbors', {}).setdefault(address, {})
-                    
-                    final_dict['ip'] = address
-                    final_dict['link_layer_address'] = group['mac']
-                    final_dict['type'] = group['type']
+                    record = {'interface': interface}
+                    record['ip'] = address
+                    record['link_layer_address'] = group['mac']
+                    record['type'] = group['type']
                     if group['age'] == '-':
-                        final_dict['origin'] = 'static'
+                        record['origin'] = 'static'
                     else:
-                        final_dict['origin'] = 'dynamic'
+                        record['origin'] = 'dynamic'
                 else:
-                    final_dict = ret_dict.setdefault(
-                        'global_static_table', {}).setdefault(address, {})
-                    final_dict['ip_address'] = address
-                    final_dict['mac_address'] = group['mac']
-                    final_dict['encap_type'] = group['type']
+                    record = {}
+                    record['ip_address'] = address
+                    record['mac_address'] = group['mac']
+                    record['encap_type'] = group['type']
 
-                final_dict['age'] = group['age']
-                final_dict['protocol'] = group['protocol']
+                record['age'] = group['age']
+                record['protocol'] = group['protocol']
+                yield record
                 continue
 
-        return ret_dict
-
 # =====================================
 # Parser for 'show ip arp, show ip arp vrf <vrf>'
 # =====================================
@@ -138,6 +149,9 @@ class ShowIpArp(ShowArp):
     cli_command = ['show ip arp', 'show ip arp vrf {vrf}']
 
     def cli(self, vrf='', output=None):
+        return self.aggregate(self.cli_iter(vrf=vrf, output=output))
+
+    def cli_iter(self, vrf='', output=None):
         if output is None:
             if vrf:
                 cmd = self.cli_command[1].format(vrf=vrf)
@@ -146,7 +160,7 @@ class ShowIpArp(ShowArp):
             out = self.device.execute(cmd)
         else:
             out = output
-        return super().cli(output=out)
+        yield from super().cli_iter(output=out)
 # =====================================
 # Schema for 'show ip arp summary'
 # =====================================
@@ -20,6 +20,7 @@ from genie.metaparser.util.schemaengine import Schema, \
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.records import RecordParser
 
 
 class ShowMacAddressTableSchema(MetaParser):
@@ -54,13 +55,41 @@ class ShowMacAddressTableSchema(MetaParser):
         Optional('total_mac_addresses'): int,
     }
 
-class ShowMacAddressTable(ShowMacAddressTableSchema):
+class ShowMacAddressTable(ShowMacAddressTableSchema, RecordParser):
     """Parser for show mac address-table"""
 
     cli_command = ['show mac address-table',
                    'show mac address-table vlan {vlan}']
 
+    record_keys = ('vlan', 'mac_address')
+
     def cli(self, vlan='', output=None):
+        return self.aggregate(self.cli_iter(vlan=vlan, output=output))
+
+    def add_record(self, parsed, record):
+        if 'total_mac_addresses' in record:
+            parsed.update(record)
+            return
+
+        vlan = record['vlan']
+        mac = record['mac_address']
+        vlan_dict = parsed.setdefault('mac_table', {}) \
+            .setdefault('vlans', {}).setdefault(str(vlan), {})
+        vlan_dict['vlan'] = vlan
+        mac_dict = vlan_dict.setdefault('mac_addresses', {}) \
+                            .setdefault(mac, {})
+        mac_dict.update({'mac_address': mac})
+
+        if record.get('drop'):
+            mac_dict.setdefault('drop', {}).update(self.record_data(record))
+        else:
+            mac_dict.setdefault('interfaces', {}) \
+                    .setdefault(record['interface'], {}) \
+                    .update(self.record_data(record))
+
+    def cli_iter(self, vlan='', output=None):
+        """Yield one record per interface of each mac address, one per
+        dropped mac address and one with the total of mac addresses"""
         if output is None:
             # get output from device
             if vlan:
@@ -70,8 +99,8 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
         else:
             out = output
 
-        # initial return dictionary
-        ret_dict = mac_dict = {}
+        # current mac address
+        vlan = mac = None
         entry_type = entry = learn = age = ''
 
         # Total Mac Addresses for this criterion: 93
@@ -107,7 +136,7 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
             # Total Mac Addresses for this criterion: 93
             m = p1.match(line)
             if m:
-                ret_dict.update({'total_mac_addresses': int(m.groupdict()['val'])})
+                yield {'total_mac_addresses': int(m.groupdict()['val'])}
                 continue
 
             # 10    aaaa.bbff.8888    STATIC      Gi1/0/8 Gi1/0/9
@@ -120,56 +149,49 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                 vlan = int(group['vlan']) if re.search('\d+', group['vlan']) \
                                           else group['vlan'].lower()
                 intfs = group['intfs'].strip()
-                vlan_dict = ret_dict.setdefault('mac_table', {}) \
-                .setdefault('vlans', {}).setdefault(str(vlan), {})
-                vlan_dict['vlan'] = vlan
-                mac_dict = vlan_dict.setdefault('mac_addresses', {}) \
-                                    .setdefault(mac, {})
-                mac_dict.update({'mac_address': mac})
 
                 if 'drop' in intfs.lower():
-                    drop_dict = mac_dict.setdefault('drop', {})
-                    drop_dict.update({'drop': True})
-                    drop_dict.update({'entry_type': group['entry_type'].lower()})
+                    yield {'vlan': vlan, 'mac_address': mac, 'drop': True,
+                           'entry_type': group['entry_type'].lower()}
                     continue
 
                 for intf in intfs.replace(' ',',').split(','):
                     intf = Common.convert_intf_name(intf)
-                    intf_dict = mac_dict.setdefault('interfaces', {}) \
-                                        .setdefault(intf, {})
-                    intf_dict.update({'interface': intf})
                     entry_type = group['entry_type'].lower()
-                    intf_dict.update({'entry_type': entry_type})
+                    record = {'vlan': vlan, 'mac_address': mac,
+                              'interface': intf, 'entry_type': entry_type}
                     if group['entry']:
                         entry = group['entry'].strip()
-                        intf_dict.update({'entry': entry})
+                        record.update({'entry': entry})
+                    yield record
                 continue
 
             # Gi1/9,Gi1/10,Gi1/11,Gi1/12
             #               Router,Switch
             m = p3.match(line)
             if m:
+                if mac is None:
+                    # No mac address to add the interfaces to
+                    continue
                 group = m.groupdict()
                 intfs = group['intfs'].strip()
 
                 if 'drop' in intfs.lower():
-                    drop_dict = mac_dict.setdefault('drop', {})
-                    drop_dict.update({'drop': True})
-                    drop_dict.update({'entry_type': entry_type})
+                    yield {'vlan': vlan, 'mac_address': mac, 'drop': True,
+                           'entry_type': entry_type}
                     continue
 
                 for intf in intfs.split(','):
                     intf = Common.convert_intf_name(intf)
-                    intf_dict = mac_dict.setdefault('interfaces', {}) \
-                                        .setdefault(intf, {})
-                    intf_dict.update({'interface': intf})
-                    intf_dict.update({'entry_type': entry_type})
+                    record = {'vlan': vlan, 'mac_address': mac,
+                              'interface': intf, 'entry_type': entry_type}
                     if entry:
-                        intf_dict.update({'entry': entry})
+                        record.update({'entry': entry})
                     if learn:
-                        intf_dict.update({'learn': learn})
+                        record.update({'learn': learn})
                     if age:
-                        intf_dict.update({'age': age})
+                        record.update({'age': age})
+                    yield record
                 continue
 
             # *  101  44dd.eeff.55bb   dynamic  Yes         10   Gi1/40
@@ -183,38 +205,30 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                 vlan = int(group['vlan']) if re.search('\d+', group['vlan']) \
                                           else group['vlan'].lower()
                 intfs = group['intfs'].strip()
-                vlan_dict = ret_dict.setdefault('mac_table', {}) \
-                .setdefault('vlans', {}).setdefault(str(vlan), {})
-                vlan_dict['vlan'] = vlan
-                mac_dict = vlan_dict.setdefault('mac_addresses', {}) \
-                                    .setdefault(mac, {})
-                mac_dict.update({'mac_address': mac})
 
                 if 'drop' in intfs.lower():
-                    drop_dict = mac_dict.setdefault('drop', {})
-                    drop_dict.update({'drop': True})
-                    drop_dict.update({'entry_type': group['entry_type'].lower()})
+                    yield {'vlan': vlan, 'mac_address': mac, 'drop': True,
+                           'entry_type': group['entry_type'].lower()}
                     continue
 
                 for intf in intfs.split(','):
                     intf = Common.convert_intf_name(intf)
-                    intf_dict = mac_dict.setdefault('interfaces', {}) \
-                                        .setdefault(intf, {})
-                    intf_dict.update({'interface': intf})
                     entry_type = group['entry_type'].lower()
-                    intf_dict.update({'entry_type': entry_type})
+                    record = {'vlan': vlan, 'mac_address': mac,
+                              'interface': intf, 'entry_type': entry_type}
                     if group['entry']:
                         entry = group['entry'].strip()
-                        intf_dict.update({'entry': entry})
+                        record.update({'entry': entry})
                     if group['learn']:
                         learn = group['learn']
-                        intf_dict.update({'learn': learn})
+                        record.update({'learn': learn})
                     if group['age']:
                         if group['age'].isdigit():
                             age = int(group['age'])
-                            intf_dict.update({'age': age})
+                            record.update({'age': age})
                         else:
                             age = None
+                    yield record
                 continue
 
             # 964    0000.0000.0000   dynamic ip,ipx                Router
@@ -225,37 +239,26 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                 vlan = int(group['vlan']) if re.search('\d+', group['vlan']) \
                                           else group['vlan'].lower()
                 intfs = group['intfs'].strip()
-                vlan_dict = ret_dict.setdefault('mac_table', {}) \
-                .setdefault('vlans', {}).setdefault(str(vlan), {})
-                vlan_dict['vlan'] = vlan
-                mac_dict = vlan_dict.setdefault('mac_addresses', {}) \
-                                    .setdefault(mac, {})
-                mac_dict.update({'mac_address': mac})
 
                 if 'drop' in intfs.lower():
-                    drop_dict = mac_dict.setdefault('drop', {})
-                    drop_dict.update({'drop': True})
-                    drop_dict.update({'entry_type': group['entry_type'].lower()})
+                    yield {'vlan': vlan, 'mac_address': mac, 'drop': True,
+                           'entry_type': group['entry_type'].lower()}
                     continue
 
                 for intf in intfs.replace(' ',',').split(','):
                     intf = Common.convert_intf_name(intf)
-                    intf_dict = mac_dict.setdefault('interfaces', {}) \
-                                        .setdefault(intf, {})
-                    intf_dict.update({'interface': intf})
                     entry_type = group['entry_type'].lower()
-                    intf_dict.update({'entry_type': entry_type})
+                    record = {'vlan': vlan, 'mac_address': mac,
+                              'interface': intf, 'entry_type': entry_type}
                     if group['entry']:
                         entry = group['entry'].strip()
-                        intf_dict.update({'entry': entry})
+                        record.update({'entry': entry})
 
                     if group['protocols']:
-                        intf_dict.update({'protocols': group['protocols'].split(',')})
+                        record.update({'protocols': group['protocols'].split(',')})
+                    yield record
                 continue
 
-        return ret_dict
-
-
 class ShowMacAddressTableAgingTimeSchema(MetaParser):
     """Schema for show mac address-table aging-time"""
     schema = {
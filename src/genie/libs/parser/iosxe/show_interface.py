@@ -47,6 +47,9 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Use
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.projection import Projection
+from genie.libs.parser.utils.mechanisms import run_mechanisms
 
 logger = logging.getLogger(__name__)
 
@@ -208,63 +211,97 @@ class ShowInterfaces(ShowInterfacesSchema):
         'out_lost_carrier', '(Tunnel.*)', 'input_queue_flushes',
         'reliability']
 
-    def cli(self,interface="",output=None):
-        if output is None:
-            if interface:
-                cmd = self.cli_command[1].format(interface=interface)
-            else:
-                cmd = self.cli_command[0]
-            out = self.device.execute(cmd)
-        else:
-            out = output
+    # Keys of an interface filled by the lines of each pattern, for the
+    # projection of the output. p1 and p1_1 give the interface.
+    pattern_fields = {
+        'p2': ('type', 'mac_address', 'phys_address'),
+        'p2_2': ('type', 'mac_address', 'phys_address'),
+        'p3': ('description',),
+        'p4': ('ipv4',),
+        'p5': ('ipv4',),
+        'p6': ('mtu', 'sub_mtu', 'bandwidth', 'delay'),
+        'p7': ('reliability', 'txload', 'rxload'),
+        'p8': ('encapsulations', 'medium'),
+        'p10': ('keepalive',),
+        'p11': ('duplex_mode', 'port_speed', 'link_type', 'auto_negotiate',
+                'media_type'),
+        'p12': ('flow_control',),
+        'p_cd': ('carrier_delay',),
+        'p_cd_2': ('carrier_delay_up', 'carrier_delay_down'),
+        'p13': ('arp_type', 'arp_timeout'),
+        'p14': ('last_input', 'last_output', 'output_hang'),
+        'p15': ('port_channel',),
+        'p15_1': ('port_channel',),
+        'p15_2': ('port_channel',),
+        'p15_3': ('port_channel',),
+        'p17': ('queues',),
+        'p18': ('queues',),
+        'p19': ('queues',),
+        'p35': ('ipv4',),
+        'p36': ('maximum_active_vcs', 'vcs_per_vp', 'current_vccs'),
+        'p37': ('vc_auto_creation',),
+        'p38': ('vc_idle_disconnect_time',),
+        'p39': ('aal5_crc_errors',),
+        'p40': ('aal5_oversized_sdus',),
+        'p41': ('aal5_sar_timeouts',),
+        'p42': ('lcp_state', 'lcp_loopack'),
+        'p43': ('base_pppoatm',),
+        'p44': ('vaccess_status', 'vaccess_loopback'),
+        'p45': ('dtr_pulsed',),
+    }
+    # The counter lines build on the counters of the previous lines
+    pattern_fields.update(dict.fromkeys(
+        ['p16', 'p20', 'p21', 'p22', 'p23', 'p24', 'p25', 'p26', 'p27',
+         'p28', 'p29', 'p30', 'p31', 'p32', 'p33', 'p34'], ('counters',)))
 
-        # GigabitEthernet1 is up, line protocol is up 
+    patterns = Patterns(
+        # GigabitEthernet1 is up, line protocol is up
         # Port-channel12 is up, line protocol is up (connected)
         # Vlan1 is administratively down, line protocol is down , Autostate Enabled
         # Dialer1 is up (spoofing), line protocol is up (spoofing)
-        p1 = re.compile(r'^(?P<interface>[\w\/\.\-]+) +is +(?P<enabled>[\w\s]+)(?: '
-                        r'+\S+)?, +line +protocol +is +(?P<line_protocol>\w+)(?: '
-                        r'*\((?P<attribute>\S+)\)|( +\, +Autostate +(?P<autostate>\S+)))?.*$')
-        p1_1 =  re.compile(r'^(?P<interface>[\w\/\.\-]+) +is'
-                           r' +(?P<enabled>[\w\s]+),'
-                           r' +line +protocol +is +(?P<line_protocol>\w+)'
-                           r'( *, *(?P<attribute>[\w\s]+))?$')
+        p1=r'^(?P<interface>[\w\/\.\-]+) +is +(?P<enabled>[\w\s]+)(?: '
+           r'+\S+)?, +line +protocol +is +(?P<line_protocol>\w+)(?: '
+           r'*\((?P<attribute>\S+)\)|( +\, +Autostate +(?P<autostate>\S+)))?.*$',
+        p1_1=r'^(?P<interface>[\w\/\.\-]+) +is'
+             r' +(?P<enabled>[\w\s]+),'
+             r' +line +protocol +is +(?P<line_protocol>\w+)'
+             r'( *, *(?P<attribute>[\w\s]+))?$',
 
         # Hardware is Gigabit Ethernet, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
         # Hardware is Loopback
-        p2 = re.compile(r'^Hardware +is +(?P<type>[a-zA-Z0-9\-\/\s\+]+)'
-                        r'(, *address +is +(?P<mac_address>[a-z0-9\.]+)'
-                        r' *\(bia *(?P<phys_address>[a-z0-9\.]+)\))?$')
+        p2=r'^Hardware +is +(?P<type>[a-zA-Z0-9\-\/\s\+]+)'
+           r'(, *address +is +(?P<mac_address>[a-z0-9\.]+)'
+           r' *\(bia *(?P<phys_address>[a-z0-9\.]+)\))?$',
 
-        # Hardware is LTE Adv CAT6 - Multimode LTE/DC-HSPA+/HSPA+/HSPA/UMTS/EDGE/GPRS 
-        p2_2 = re.compile(r'Hardware +is +(?P<type>[a-zA-Z0-9\-\/\+ ]+)'
-                          r'(?P<mac_address>.*)(?P<phys_address>.*)')
+        # Hardware is LTE Adv CAT6 - Multimode LTE/DC-HSPA+/HSPA+/HSPA/UMTS/EDGE/GPRS
+        p2_2=r'Hardware +is +(?P<type>[a-zA-Z0-9\-\/\+ ]+)'
+             r'(?P<mac_address>.*)(?P<phys_address>.*)',
 
         # Description: desc
         # Description: Pim Register Tunnel (Encap) for RP 10.186.1.1
-        p3 = re.compile(r'^Description: *(?P<description>.*)$')
+        p3=r'^Description: *(?P<description>.*)$',
 
         # Secondary address 10.2.2.2/24
-        p4 = re.compile(r'^Secondary +Address +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
-                        r'\/(?P<prefix_length>[0-9]+))$')
+        p4=r'^Secondary +Address +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
+           r'\/(?P<prefix_length>[0-9]+))$',
 
         # Internet address is 10.4.4.4/24
-        p5 = re.compile(r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[0-9\.x]+)'
-                        r'\/(?P<prefix_length>[0-9]+))$')
+        p5=r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[0-9\.x]+)'
+           r'\/(?P<prefix_length>[0-9]+))$',
 
         # MTU 1500 bytes, BW 768 Kbit/sec, DLY 3330 usec,
-        # MTU 1500 bytes, BW 10000 Kbit, DLY 1000 usec, 
+        # MTU 1500 bytes, BW 10000 Kbit, DLY 1000 usec,
         # MTU 1600 bytes, sub MTU 1600, BW 3584 Kbit/sec, DLY 410 usec,
-        # MTU 1500 bytes, BW 5200 Kbit/sec, RxBW 25000 Kbit/sec, DLY 100 usec, 
-        p6 = re.compile(r'^MTU +(?P<mtu>\d+) +bytes(, +sub +MTU +'
-                        r'(?P<sub_mtu>\d+))?, +BW +(?P<bandwidth>[0-9]+) +Kbit(\/sec)?'
-                        r'(, +RxBW +[0-9]+ +Kbit(\/sec)?)?, +'
-                        r'DLY +(?P<delay>[0-9]+) +usec,$')
+        # MTU 1500 bytes, BW 5200 Kbit/sec, RxBW 25000 Kbit/sec, DLY 100 usec,
+        p6=r'^MTU +(?P<mtu>\d+) +bytes(, +sub +MTU +'
+           r'(?P<sub_mtu>\d+))?, +BW +(?P<bandwidth>[0-9]+) +Kbit(\/sec)?'
+           r'(, +RxBW +[0-9]+ +Kbit(\/sec)?)?, +'
+           r'DLY +(?P<delay>[0-9]+) +usec,$',
 
         # reliability 255/255, txload 1/255, rxload 1/255
-        p7 = re.compile(r'^reliability +(?P<reliability>[\d\/]+),'
-                        r' +txload +(?P<txload>[\d\/]+), +rxload'
-                        r' +(?P<rxload>[\d\/]+)$')
+        p7=r'^reliability +(?P<reliability>[\d\/]+),'
+           r' +txload +(?P<txload>[\d\/]+), +rxload'
+           r' +(?P<rxload>[\d\/]+)$',
 
         # Encapsulation LOOPBACK, loopback not set
         # Encapsulation 802.1Q Virtual LAN, Vlan ID 20, medium is p2p
@@ -273,13 +310,12 @@ class ShowInterfaces(ShowInterfacesSchema):
         # Encapsulation 802.1Q Virtual LAN, Vlan ID  1., loopback not set
         # Encapsulation 802.1Q Virtual LAN, Vlan ID  105.
         # Encapsulation(s): AAL5
-        p8 = re.compile(r'^Encapsulation(\(s\):)? +(?P<encapsulation>[\w\s\.]+)'
-                r'(, +(?P<rest>.*))?$')
-            
-        # Keepalive set (10 sec)
-        p10 = re.compile(r'^Keepalive +set +\((?P<keepalive>[0-9]+)'
-                        r' +sec\)$')
+        p8=r'^Encapsulation(\(s\):)? +(?P<encapsulation>[\w\s\.]+)'
+           r'(, +(?P<rest>.*))?$',
 
+        # Keepalive set (10 sec)
+        p10=r'^Keepalive +set +\((?P<keepalive>[0-9]+)'
+            r' +sec\)$',
 
         # Auto-duplex, 1000Mb/s, media type is 10/100/1000BaseTX
         # Full-duplex, 1000Mb/s, link type is auto, media type is
@@ -291,196 +327,224 @@ class ShowInterfaces(ShowInterfacesSchema):
         # auto-duplex, 10 Gb/s, media type is 10G
         # Full Duplex, 10000Mbps, link type is force-up, media type is SFP-LR
         # Full-duplex, 100Gb/s, link type is force-up, media type is QSFP 100G SR4
-        p11 = re.compile(r'^(?P<duplex_mode>\w+)[\-\s]+[d|D]uplex\, '
-                         r'+(?P<port_speed>[\w\s\/]+|[a|A]uto-[S|s]peed|Auto '
-                         r'(S|s)peed)(?:(?:\, +link +type +is '
-                         r'+(?P<link_type>\S+))?(?:\, *(media +type +is| )'
-                         r'*(?P<media_type>[\w\/\- ]+)?)(?: +media +type)?)?$')
+        p11=r'^(?P<duplex_mode>\w+)[\-\s]+[d|D]uplex\, '
+            r'+(?P<port_speed>[\w\s\/]+|[a|A]uto-[S|s]peed|Auto '
+            r'(S|s)peed)(?:(?:\, +link +type +is '
+            r'+(?P<link_type>\S+))?(?:\, *(media +type +is| )'
+            r'*(?P<media_type>[\w\/\- ]+)?)(?: +media +type)?)?$',
 
         # input flow-control is off, output flow-control is unsupported
-        p12 = re.compile(r'^(input|output) +flow-control +is +(?P<receive>\w+), +'
-                          '(output|input) +flow-control +is +(?P<send>\w+)$')
+        p12=r'^(input|output) +flow-control +is +(?P<receive>\w+), +'
+            '(output|input) +flow-control +is +(?P<send>\w+)$',
+
+        # Carrier delay is 10 sec
+        p_cd=r'^Carrier +delay +is +(?P<carrier_delay>\d+).*$',
+
+        # Asymmetric Carrier-Delay Up Timer is 2 sec
+        # Asymmetric Carrier-Delay Down Timer is 10 sec
+        p_cd_2=r'^Asymmetric +Carrier-Delay +(?P<type>Down|Up)'
+               ' +Timer +is +(?P<carrier_delay>\d+).*$',
 
         # ARP type: ARPA, ARP Timeout 04:00:00
-        p13 = re.compile(r'^ARP +type: +(?P<arp_type>\w+), +'
-                          'ARP +Timeout +(?P<arp_timeout>[\w\:\.]+)$')
+        p13=r'^ARP +type: +(?P<arp_type>\w+), +'
+            'ARP +Timeout +(?P<arp_timeout>[\w\:\.]+)$',
 
         # Last input never, output 00:01:05, output hang never
-        p14 = re.compile(r'^Last +input +(?P<last_input>[\w\.\:]+), +'
-                          'output +(?P<last_output>[\w\.\:]+), '
-                          'output +hang +(?P<output_hang>[\w\.\:]+)$')
+        p14=r'^Last +input +(?P<last_input>[\w\.\:]+), +'
+            'output +(?P<last_output>[\w\.\:]+), '
+            'output +hang +(?P<output_hang>[\w\.\:]+)$',
 
         # Members in this channel: Gi1/0/2
         # Members in this channel: Fo1/0/2 Fo1/0/4
-        p15 = re.compile(r'^Members +in +this +channel: +'
-                          '(?P<port_channel_member_intfs>[\w\/\.\s\,]+)$')   
+        p15=r'^Members +in +this +channel: +'
+            '(?P<port_channel_member_intfs>[\w\/\.\s\,]+)$',
 
-        # No. of active members in this channel: 12 
-        p15_1 = re.compile(r'^No\. +of +active +members +in +this +'
-                            'channel: +(?P<active_members>\d+)$')
+        # No. of active members in this channel: 12
+        p15_1=r'^No\. +of +active +members +in +this +'
+              'channel: +(?P<active_members>\d+)$',
 
         # Member 2 : GigabitEthernet0/0/10 , Full-duplex, 900Mb/s
-        p15_2 = re.compile(r'^Member +\d+ +: +(?P<interface>\S+) +,'
-                            ' +\S+, +\S+$')
+        p15_2=r'^Member +\d+ +: +(?P<interface>\S+) +,'
+              ' +\S+, +\S+$',
 
         # No. of PF_JUMBO supported members in this channel : 0
-        p15_3 = re.compile(r'^No\. +of +PF_JUMBO +supported +members +'
-                            'in +this +channel +: +(?P<number>\d+)$')
+        p15_3=r'^No\. +of +PF_JUMBO +supported +members +'
+              'in +this +channel +: +(?P<number>\d+)$',
 
         # Last clearing of "show interface" counters 1d02h
-        p16 = re.compile(r'^Last +clearing +of +\"show +interface\" +counters +'
-                          '(?P<last_clear>[\w\:\.]+)$')
+        p16=r'^Last +clearing +of +\"show +interface\" +counters +'
+            '(?P<last_clear>[\w\:\.]+)$',
 
         # Input queue: 0/375/0/0 (size/max/drops/flushes); Total output drops: 0
-        p17 = re.compile(r'^Input +queue: +(?P<size>\d+)\/(?P<max>\d+)\/'
-                          '(?P<drops>\d+)\/(?P<flushes>\d+) +'
-                          '\(size\/max\/drops\/flushes\); +'
-                          'Total +output +drops: +(?P<output_drop>\d+)$')
+        p17=r'^Input +queue: +(?P<size>\d+)\/(?P<max>\d+)\/'
+            '(?P<drops>\d+)\/(?P<flushes>\d+) +'
+            '\(size\/max\/drops\/flushes\); +'
+            'Total +output +drops: +(?P<output_drop>\d+)$',
 
         # Queueing strategy: fifo
         # Queueing strategy: Class-based queueing
-        p18 = re.compile(r'^Queueing +strategy: +(?P<queue_strategy>\S+).*$')
+        p18=r'^Queueing +strategy: +(?P<queue_strategy>\S+).*$',
 
         # Output queue: 0/0 (size/max)
         # Output queue: 0/1000/64/0 (size/max total/threshold/drops)
-        p19 = re.compile(r'^Output +queue: +(?P<size>\d+)\/(?P<max>\d+)'
-                          '(?:\/(?P<threshold>\d+)\/(?P<drops>\d+))? '
-                          '+\(size\/max(?: +total\/threshold\/drops\))?.*$')
+        p19=r'^Output +queue: +(?P<size>\d+)\/(?P<max>\d+)'
+            '(?:\/(?P<threshold>\d+)\/(?P<drops>\d+))? '
+            '+\(size\/max(?: +total\/threshold\/drops\))?.*$',
 
         # 5 minute input rate 0 bits/sec, 0 packets/sec
-        p20 = re.compile(r'^(?P<load_interval>[0-9\#]+)'
-                          ' *(?P<unit>(minute|second|minutes|seconds)) *input *rate'
-                          ' *(?P<in_rate>[0-9]+) *bits/sec,'
-                          ' *(?P<in_rate_pkts>[0-9]+) *packets/sec$')
+        p20=r'^(?P<load_interval>[0-9\#]+)'
+            ' *(?P<unit>(minute|second|minutes|seconds)) *input *rate'
+            ' *(?P<in_rate>[0-9]+) *bits/sec,'
+            ' *(?P<in_rate_pkts>[0-9]+) *packets/sec$',
 
         # 5 minute output rate 0 bits/sec, 0 packets/sec
-        p21 = re.compile(r'^(?P<load_interval>[0-9\#]+)'
-                          ' *(minute|second|minutes|seconds) *output *rate'
-                          ' *(?P<out_rate>[0-9]+) *bits/sec,'
-                          ' *(?P<out_rate_pkts>[0-9]+) *packets/sec$')
+        p21=r'^(?P<load_interval>[0-9\#]+)'
+            ' *(minute|second|minutes|seconds) *output *rate'
+            ' *(?P<out_rate>[0-9]+) *bits/sec,'
+            ' *(?P<out_rate_pkts>[0-9]+) *packets/sec$',
 
         # 0 packets input, 0 bytes, 0 no buffer
         # 13350 packets input, 2513375 bytes
-        p22 = re.compile(r'^(?P<in_pkts>[0-9]+) +packets +input, +(?P<in_octets>[0-9]+) '
-                          '+bytes(?:, +(?P<in_no_buffer>[0-9]+) +no +buffer)?$')
+        p22=r'^(?P<in_pkts>[0-9]+) +packets +input, +(?P<in_octets>[0-9]+) '
+            '+bytes(?:, +(?P<in_no_buffer>[0-9]+) +no +buffer)?$',
 
         # Received 4173 broadcasts (0 IP multicasts)
         # Received 535996 broadcasts (535961 multicasts)
-        p23 = re.compile(r'^Received +(?P<in_broadcast_pkts>\d+) +broadcasts +'
-                          '\((?P<in_multicast_pkts>\d+) *(IP)? *multicasts\)$')
+        p23=r'^Received +(?P<in_broadcast_pkts>\d+) +broadcasts +'
+            '\((?P<in_multicast_pkts>\d+) *(IP)? *multicasts\)$',
 
         # 0 runts, 0 giants, 0 throttles
-        p24 = re.compile(r'^(?P<in_runts>[0-9]+) *runts,'
-                          ' *(?P<in_giants>[0-9]+) *giants,'
-                          ' *(?P<in_throttles>[0-9]+) *throttles$')
+        p24=r'^(?P<in_runts>[0-9]+) *runts,'
+            ' *(?P<in_giants>[0-9]+) *giants,'
+            ' *(?P<in_throttles>[0-9]+) *throttles$',
 
         # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
         # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-        p25 = re.compile(r'^(?P<in_errors>[0-9]+) +input +errors, +'
-                          '(?P<in_crc_errors>[0-9]+) +CRC, +'
-                          '(?P<in_frame>[0-9]+) +frame, +'
-                          '(?P<in_overrun>[0-9]+) +overrun, +'
-                          '(?P<in_ignored>[0-9]+) +ignored'
-                          '(, *(?P<in_abort>[0-9]+) +abort)?$')
+        p25=r'^(?P<in_errors>[0-9]+) +input +errors, +'
+            '(?P<in_crc_errors>[0-9]+) +CRC, +'
+            '(?P<in_frame>[0-9]+) +frame, +'
+            '(?P<in_overrun>[0-9]+) +overrun, +'
+            '(?P<in_ignored>[0-9]+) +ignored'
+            '(, *(?P<in_abort>[0-9]+) +abort)?$',
 
         # 0 watchdog, 535961 multicast, 0 pause input
-        p26 = re.compile(r'^(?P<in_watchdog>[0-9]+) +watchdog, +'
-                          '(?P<in_multicast_pkts>[0-9]+) +multicast, +'
-                          '(?P<in_pause_input>[0-9]+) +pause +input$')
+        p26=r'^(?P<in_watchdog>[0-9]+) +watchdog, +'
+            '(?P<in_multicast_pkts>[0-9]+) +multicast, +'
+            '(?P<in_pause_input>[0-9]+) +pause +input$',
 
         # 0 input packets with dribble condition detected
-        p27 = re.compile(r'^(?P<in_with_dribble>[0-9]+) +input +packets +with +'
-                          'dribble +condition +detected$')
+        p27=r'^(?P<in_with_dribble>[0-9]+) +input +packets +with +'
+            'dribble +condition +detected$',
 
         # 23376 packets output, 3642296 bytes, 0 underruns
         # 13781 packets output, 2169851 bytes
-        p28 = re.compile(r'^(?P<out_pkts>[0-9]+) +packets +output, +(?P<out_octets>[0-9]+) '
-                          '+bytes(?:\, +(?P<out_underruns>[0-9]+) +underruns)?$')
+        p28=r'^(?P<out_pkts>[0-9]+) +packets +output, +(?P<out_octets>[0-9]+) '
+            '+bytes(?:\, +(?P<out_underruns>[0-9]+) +underruns)?$',
 
         # Received 4173 broadcasts (0 IP multicasts)
         # Received 535996 broadcasts (535961 multicasts)
-        p29 = re.compile(r'^Received +(?P<out_broadcast_pkts>\d+) +broadcasts +'
-                          '\((?P<out_multicast_pkts>\d+) *(IP)? *multicasts\)$')
+        p29=r'^Received +(?P<out_broadcast_pkts>\d+) +broadcasts +'
+            '\((?P<out_multicast_pkts>\d+) *(IP)? *multicasts\)$',
 
         # 0 output errors, 0 collisions, 2 interface resets
         # 0 output errors, 0 interface resets
-        p30 = re.compile(r'^(?P<out_errors>[0-9]+) +output +errors,'
-                          '( *(?P<out_collision>[0-9]+) +collisions,)? +'
-                          '(?P<out_interface_resets>[0-9]+) +interface +resets$')
+        p30=r'^(?P<out_errors>[0-9]+) +output +errors,'
+            '( *(?P<out_collision>[0-9]+) +collisions,)? +'
+            '(?P<out_interface_resets>[0-9]+) +interface +resets$',
 
         # 0 unknown protocol drops
-        p31 = re.compile(r'^(?P<out_unknown_protocl_drops>[0-9]+) +'
-                          'unknown +protocol +drops$')
+        p31=r'^(?P<out_unknown_protocl_drops>[0-9]+) +'
+            'unknown +protocol +drops$',
 
         # 0 babbles, 0 late collision, 0 deferred
-        p32 = re.compile(r'^(?P<out_babble>[0-9]+) +babbles, +'
-                          '(?P<out_late_collision>[0-9]+) +late +collision, +'
-                          '(?P<out_deferred>[0-9]+) +deferred$')
+        p32=r'^(?P<out_babble>[0-9]+) +babbles, +'
+            '(?P<out_late_collision>[0-9]+) +late +collision, +'
+            '(?P<out_deferred>[0-9]+) +deferred$',
 
         # 0 lost carrier, 0 no carrier, 0 pause output
         # 0 lost carrier, 0 no carrier
-        p33 = re.compile(r'^(?P<out_lost_carrier>\d+) +lost +carrier, +'
-                r'(?P<out_no_carrier>\d+) +no +carrier(, +(?P<out_pause_output>\d+) +'
-                r'pause +output)?$')
+        p33=r'^(?P<out_lost_carrier>\d+) +lost +carrier, +'
+            r'(?P<out_no_carrier>\d+) +no +carrier(, +(?P<out_pause_output>\d+) +'
+            r'pause +output)?$',
 
         # 0 output buffer failures, 0 output buffers swapped out
-        p34 = re.compile(r'^(?P<out_buffer_failure>[0-9]+) +output +buffer +failures, +'
-                          '(?P<out_buffers_swapped>[0-9]+) +output +buffers +swapped +out$')
+        p34=r'^(?P<out_buffer_failure>[0-9]+) +output +buffer +failures, +'
+            '(?P<out_buffers_swapped>[0-9]+) +output +buffers +swapped +out$',
 
         # Interface is unnumbered. Using address of Loopback0 (10.4.1.1)
         # Interface is unnumbered. Using address of GigabitEthernet0/2.1 (192.168.154.1)
-        p35 = re.compile(r'^Interface +is +unnumbered. +Using +address +of +'
-                          '(?P<unnumbered_intf>[\w\/\.]+) +'
-                          '\((?P<unnumbered_ip>[\w\.\:]+)\)$')
-        
+        p35=r'^Interface +is +unnumbered. +Using +address +of +'
+            '(?P<unnumbered_intf>[\w\/\.]+) +'
+            '\((?P<unnumbered_ip>[\w\.\:]+)\)$',
+
         # 8 maximum active VCs, 1024 VCs per VP, 1 current VCCs
-        p36 = re.compile(r'^(?P<maximum_active_vcs>\d+) +maximum +active +VCs, +'
-                r'(?P<vcs_per_vp>\d+) +VCs +per +VP, +(?P<current_vccs>\d+) +current +VCCs$')
-        
+        p36=r'^(?P<maximum_active_vcs>\d+) +maximum +active +VCs, +'
+            r'(?P<vcs_per_vp>\d+) +VCs +per +VP, +(?P<current_vccs>\d+) +current +VCCs$',
+
         # VC Auto Creation Disabled.
-        p37 = re.compile(r'^VC +Auto +Creation +(?P<vc_auto_creation>\S+)\.$')
+        p37=r'^VC +Auto +Creation +(?P<vc_auto_creation>\S+)\.$',
 
         # VC idle disconnect time: 300 seconds
-        p38 = re.compile(r'^VC +idle +disconnect +time: +(?P<vc_idle_disconnect_time>\d+) +'
-                r'seconds$')
-        
+        p38=r'^VC +idle +disconnect +time: +(?P<vc_idle_disconnect_time>\d+) +'
+            r'seconds$',
+
         # AAL5 CRC errors : 0
-        p39 = re.compile(r'^(?P<key>\S+ +CRC +errors) +: +(?P<val>\d+)$')
-        
+        p39=r'^(?P<key>\S+ +CRC +errors) +: +(?P<val>\d+)$',
+
         # AAL5 SAR Timeouts : 0
-        p40 = re.compile(r'^(?P<key>\S+ +SAR +Timeouts) +: +(?P<val>\d+)$')
-        
+        p40=r'^(?P<key>\S+ +SAR +Timeouts) +: +(?P<val>\d+)$',
+
         # AAL5 Oversized SDUs : 0
-        p41 = re.compile(r'^(?P<key>\S+ +Oversized +SDUs) +: +(?P<val>\d+)$')
+        p41=r'^(?P<key>\S+ +Oversized +SDUs) +: +(?P<val>\d+)$',
 
         # LCP Closed
         # LCP Closed, loopback not set
-        p42 = re.compile(r'^LCP\s+(?P<state>\S+)(,\s+loopback\s+(?P<loopback>[\S\s]+))?$')
+        p42=r'^LCP\s+(?P<state>\S+)(,\s+loopback\s+(?P<loopback>[\S\s]+))?$',
 
         # Base PPPoATM vaccess
-        p43 = re.compile(r'^Base PPPoATM +(?P<base_pppoatm>\S+)$')
+        p43=r'^Base PPPoATM +(?P<base_pppoatm>\S+)$',
 
         # Vaccess status 0x44, loopback not set
-        p44 = re.compile(r'^Vaccess\s+status\s+(?P<status>\S+),\s+'
-                r'loopback\s+(?P<loopback>[\S\s]+)$')
+        p44=r'^Vaccess\s+status\s+(?P<status>\S+),\s+'
+            r'loopback\s+(?P<loopback>[\S\s]+)$',
 
         # DTR is pulsed for 5 seconds on reset
-        p45 = re.compile(r'^DTR +is +pulsed +for +(?P<dtr_pulsed>\d+) +'
-                r'seconds +on +reset$')
+        p45=r'^DTR +is +pulsed +for +(?P<dtr_pulsed>\d+) +'
+            r'seconds +on +reset$',
+    )
+
+    def cli(self,interface="",output=None, fields=None, volatile=True):
+        if output is None:
+            if interface:
+                cmd = self.cli_command[1].format(interface=interface)
+            else:
+                cmd = self.cli_command[0]
+            out = self.device.execute(cmd)
+        else:
+            out = output
+
+        p = ShowInterfaces.patterns
+
+        # Only the patterns of the requested keys
+        projection = Projection.from_parser(self, fields, volatile)
+        if projection is None:
+            match = p.match
+        else:
+            match = projection.match(p, ShowInterfaces.pattern_fields,
+                                     prefix=('*',))
 
         interface_dict = {}
         unnumbered_dict = {}
         for line in out.splitlines():
             line = line.strip()
+            name, m = match(line)
+
             # GigabitEthernet1 is up, line protocol is up 
             # Port-channel12 is up, line protocol is up (connected)
             # Vlan1 is administratively down, line protocol is down , Autostate Enabled
             # Dialer1 is up (spoofing), line protocol is up (spoofing)
 
-            m = p1.match(line)
-            m1 = p1_1.match(line)
-            m = m if m else m1
-            if m:
+            if name in ('p1', 'p1_1'):
                 interface = m.groupdict()['interface']
                 enabled = m.groupdict()['enabled']
                 line_protocol = m.groupdict()['line_protocol']
@@ -518,12 +582,8 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Hardware is Gigabit Ethernet, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
             # Hardware is Loopback
-            m = p2.match(line)
-
             # Hardware is LTE Adv CAT6 - Multimode LTE/DC-HSPA+/HSPA+/HSPA/UMTS/EDGE/GPRS 
-            m1 = p2_2.match(line)
-            m = m if m else m1
-            if m:
+            if name in ('p2', 'p2_2'):
                 types = m.groupdict()['type']
                 mac_address = m.groupdict()['mac_address']
                 phys_address = m.groupdict()['phys_address']
@@ -535,16 +595,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
             # Description: desc
             # Description: Pim Register Tunnel (Encap) for RP 10.186.1.1
-            m = p3.match(line)
-            if m:
+            if name == 'p3':
                 description = m.groupdict()['description']
 
                 interface_dict[interface]['description'] = description
                 continue
 
             # Secondary address 10.2.2.2/24
-            m = p4.match(line)
-            if m:
+            if name == 'p4':
                 ip_sec = m.groupdict()['ip']
                 prefix_length_sec = m.groupdict()['prefix_length']
                 address_sec = m.groupdict()['ipv4']
@@ -563,8 +621,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Internet Address is 10.4.4.4/24
-            m = p5.match(line)
-            if m:
+            if name == 'p5':
                 ip = m.groupdict()['ip']
                 prefix_length = m.groupdict()['prefix_length']
                 address = m.groupdict()['ipv4']
@@ -582,8 +639,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             
             # MTU 1500 bytes, BW 768 Kbit/sec, DLY 3330 usec,
             # MTU 1500 bytes, BW 10000 Kbit, DLY 1000 usec, 
-            m = p6.match(line)
-            if m:
+            if name == 'p6':
                 mtu = m.groupdict()['mtu']
                 sub_mtu = m.groupdict().get('sub_mtu', None)
                 bandwidth = m.groupdict()['bandwidth']
@@ -598,8 +654,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # reliability 255/255, txload 1/255, rxload 1/255
-            m = p7.match(line)
-            if m:
+            if name == 'p7':
                 reliability = m.groupdict()['reliability']
                 txload = m.groupdict()['txload']
                 rxload = m.groupdict()['rxload']
@@ -614,8 +669,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # Encapsulation QinQ Virtual LAN, outer ID  10, inner ID 20
             # Encapsulation 802.1Q Virtual LAN, Vlan ID  1., loopback not set
             # Encapsulation 802.1Q Virtual LAN, Vlan ID  105.
-            m = p8.match(line)
-            if m:
+            if name == 'p8':
                 encapsulation = m.groupdict()['encapsulation']
                 encapsulation = m.groupdict()['encapsulation'].lower()
                 encapsulation = encapsulation.replace("802.1q virtual lan","dot1q")
@@ -665,8 +719,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Keepalive set (10 sec)
-            m = p10.match(line)
-            if m:
+            if name == 'p10':
                 keepalive = m.groupdict()['keepalive']
                 if keepalive:
                     interface_dict[interface]['keepalive'] = int(keepalive)
@@ -682,8 +735,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # auto-duplex, 10 Gb/s, media type is 10G
             # Full Duplex, 10000Mbps, link type is force-up, media type is SFP-LR
             # Full-duplex, 100Gb/s, link type is force-up, media type is QSFP 100G SR4
-            m = p11.match(line)
-            if m:
+            if name == 'p11':
                 duplex_mode = m.groupdict()['duplex_mode'].lower()
                 port_speed = m.groupdict()['port_speed'].lower().replace('-speed', '')
                 link_type = m.groupdict()['link_type']
@@ -706,8 +758,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # input flow-control is off, output flow-control is unsupported
-            m = p12.match(line)
-            if m:
+            if name == 'p12':
                 receive = m.groupdict()['receive'].lower()
                 send = m.groupdict()['send'].lower()
                 if 'flow_control' not in interface_dict[interface]:
@@ -724,19 +775,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Carrier delay is 10 sec
-            p_cd = re.compile(r'^Carrier +delay +is +(?P<carrier_delay>\d+).*$')
-            m = p_cd.match(line)
-            if m:
+            if name == 'p_cd':
                 group = m.groupdict()
                 sub_dict = interface_dict.setdefault(interface, {})
                 sub_dict['carrier_delay'] = int(group['carrier_delay'])
 
             # Asymmetric Carrier-Delay Up Timer is 2 sec
             # Asymmetric Carrier-Delay Down Timer is 10 sec
-            p_cd_2 = re.compile(r'^Asymmetric +Carrier-Delay +(?P<type>Down|Up)'
-                                 ' +Timer +is +(?P<carrier_delay>\d+).*$')
-            m = p_cd_2.match(line)
-            if m:
+            if name == 'p_cd_2':
                 group = m.groupdict()
                 tp = group['type'].lower()
                 sub_dict = interface_dict.setdefault(interface, {})
@@ -746,8 +792,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                     sub_dict['carrier_delay_down'] = int(group['carrier_delay'])
 
             # ARP type: ARPA, ARP Timeout 04:00:00
-            m = p13.match(line)
-            if m:
+            if name == 'p13':
                 arp_type = m.groupdict()['arp_type'].lower()
                 arp_timeout = m.groupdict()['arp_timeout']
                 interface_dict[interface]['arp_type'] = arp_type
@@ -755,8 +800,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Last input never, output 00:01:05, output hang never
-            m = p14.match(line)
-            if m:
+            if name == 'p14':
                 last_input = m.groupdict()['last_input']
                 last_output = m.groupdict()['last_output']
                 output_hang = m.groupdict()['output_hang']
@@ -767,8 +811,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Members in this channel: Gi1/0/2
             # Members in this channel: Fo1/0/2 Fo1/0/4
-            m = p15.match(line)
-            if m:
+            if name == 'p15':
                 interface_dict[interface]['port_channel']\
                     ['port_channel_member'] = True
                 intfs = m.groupdict()['port_channel_member_intfs'].split(' ')
@@ -787,8 +830,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # No. of active members in this channel: 12 
-            m = p15_1.match(line)
-            if m:
+            if name == 'p15_1':
                 group = m.groupdict()
                 active_members = int(group['active_members'])
                 interface_dict[interface]['port_channel']\
@@ -798,8 +840,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Member 2 : GigabitEthernet0/0/10 , Full-duplex, 900Mb/s
-            m = p15_2.match(line)
-            if m:
+            if name == 'p15_2':
                 group = m.groupdict()
                 intf = group['interface']
                 if 'port_channel_member_intfs' not in interface_dict[interface]['port_channel']:
@@ -812,8 +853,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # No. of PF_JUMBO supported members in this channel : 0
-            m = p15_3.match(line)
-            if m:
+            if name == 'p15_3':
                 group = m.groupdict()
                 number = int(group['number'])
                 interface_dict[interface]['port_channel']\
@@ -821,14 +861,12 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Last clearing of "show interface" counters 1d02h
-            m = p16.match(line)
-            if m:                
+            if name == 'p16':
                 last_clear = m.groupdict()['last_clear']
                 continue
 
             # Input queue: 0/375/0/0 (size/max/drops/flushes); Total output drops: 0
-            m = p17.match(line)
-            if m:
+            if name == 'p17':
                 if 'queues' not in interface_dict[interface]:
                     interface_dict[interface]['queues'] = {}
 
@@ -846,8 +884,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Queueing strategy: fifo
             # Queueing strategy: Class-based queueing
-            m = p18.match(line)
-            if m:
+            if name == 'p18':
                 if 'queues' not in interface_dict[interface]:
                     interface_dict[interface]['queues'] = {}
                 interface_dict[interface]['queues']['queue_strategy'] = \
@@ -856,8 +893,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Output queue: 0/0 (size/max)
             # Output queue: 0/1000/64/0 (size/max total/threshold/drops)
-            m = p19.match(line)
-            if m:
+            if name == 'p19':
                 if 'queues' not in interface_dict[interface]:
                     interface_dict[interface]['queues'] = {}
                 interface_dict[interface]['queues']['output_queue_size'] = \
@@ -872,8 +908,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 5 minute input rate 0 bits/sec, 0 packets/sec
-            m = p20.match(line)
-            if m:
+            if name == 'p20':
                 load_interval = int(m.groupdict()['load_interval'])
                 in_rate = int(m.groupdict()['in_rate'])
                 in_rate_pkts = int(m.groupdict()['in_rate_pkts'])
@@ -906,8 +941,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 5 minute output rate 0 bits/sec, 0 packets/sec
-            m = p21.match(line)
-            if m:
+            if name == 'p21':
                 out_rate = int(m.groupdict()['out_rate'])
                 out_rate_pkts = int(m.groupdict()['out_rate_pkts'])
 
@@ -918,8 +952,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 packets input, 0 bytes, 0 no buffer
-            m = p22.match(line)
-            if m:
+            if name == 'p22':
                 if 'counters' not in interface_dict[interface]:
                     interface_dict[interface]['counters'] = {}
 
@@ -934,8 +967,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Received 4173 broadcasts (0 IP multicasts)
             # Received 535996 broadcasts (535961 multicasts)
-            m = p23.match(line)
-            if m:
+            if name == 'p23':
                 interface_dict[interface]['counters']['in_multicast_pkts'] = \
                     int(m.groupdict()['in_broadcast_pkts'])
                 interface_dict[interface]['counters']['in_broadcast_pkts'] = \
@@ -943,8 +975,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 runts, 0 giants, 0 throttles
-            m = p24.match(line)
-            if m:
+            if name == 'p24':
                 interface_dict[interface]['counters']['in_runts'] = \
                     int(m.groupdict()['in_runts'])
                 interface_dict[interface]['counters']['in_giants'] = \
@@ -955,8 +986,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
             # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-            m = p25.match(line)
-            if m:
+            if name == 'p25':
                 interface_dict[interface]['counters']['in_errors'] = \
                     int(m.groupdict()['in_errors'])
                 interface_dict[interface]['counters']['in_crc_errors'] = \
@@ -973,8 +1003,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 watchdog, 535961 multicast, 0 pause input
-            m = p26.match(line)
-            if m:
+            if name == 'p26':
                 interface_dict[interface]['counters']['in_watchdog'] = \
                     int(m.groupdict()['in_watchdog'])
                 interface_dict[interface]['counters']['in_multicast_pkts'] = \
@@ -984,15 +1013,13 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 input packets with dribble condition detected
-            m = p27.match(line)
-            if m:
+            if name == 'p27':
                 interface_dict[interface]['counters']['in_with_dribble'] = \
                     int(m.groupdict()['in_with_dribble'])
                 continue
 
             # 23376 packets output, 3642296 bytes, 0 underruns
-            m = p28.match(line)
-            if m:
+            if name == 'p28':
                 interface_dict[interface]['counters']['out_pkts'] = \
                     int(m.groupdict()['out_pkts'])
                 interface_dict[interface]['counters']['out_octets'] = \
@@ -1004,8 +1031,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Received 4173 broadcasts (0 IP multicasts)
             # Received 535996 broadcasts (535961 multicasts)
-            m = p29.match(line)
-            if m:
+            if name == 'p29':
                 interface_dict[interface]['counters']['out_broadcast_pkts'] = \
                     int(m.groupdict()['out_broadcast_pkts'])
                 interface_dict[interface]['counters']['out_multicast_pkts'] = \
@@ -1014,8 +1040,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # 0 output errors, 0 collisions, 2 interface resets
             # 0 output errors, 0 interface resets
-            m = p30.match(line)
-            if m:
+            if name == 'p30':
                 interface_dict[interface]['counters']['out_errors'] = \
                     int(m.groupdict()['out_errors'])
                 interface_dict[interface]['counters']['out_interface_resets'] = \
@@ -1026,15 +1051,13 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 unknown protocol drops
-            m = p31.match(line)
-            if m:
+            if name == 'p31':
                 interface_dict[interface]['counters']['out_unknown_protocl_drops'] = \
                     int(m.groupdict()['out_unknown_protocl_drops'])
                 continue
 
             # 0 babbles, 0 late collision, 0 deferred
-            m = p32.match(line)
-            if m:
+            if name == 'p32':
                 interface_dict[interface]['counters']['out_babble'] = \
                     int(m.groupdict()['out_babble'])
                 interface_dict[interface]['counters']['out_late_collision'] = \
@@ -1044,8 +1067,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 lost carrier, 0 no carrier, 0 pause output
-            m = p33.match(line)
-            if m:
+            if name == 'p33':
                 interface_dict[interface]['counters']['out_lost_carrier'] = \
                     int(m.groupdict()['out_lost_carrier'])
                 interface_dict[interface]['counters']['out_no_carrier'] = \
@@ -1057,8 +1079,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 output buffer failures, 0 output buffers swapped out
-            m = p34.match(line)
-            if m:
+            if name == 'p34':
                 interface_dict[interface]['counters']['out_buffer_failure'] = \
                     int(m.groupdict()['out_buffer_failure'])
                 interface_dict[interface]['counters']['out_buffers_swapped'] = \
@@ -1067,16 +1088,14 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Interface is unnumbered. Using address of Loopback0 (10.4.1.1)
             # Interface is unnumbered. Using address of GigabitEthernet0/2.1 (192.168.154.1)
-            m = p35.match(line)
-            if m:
+            if name == 'p35':
                 unnumbered_dict[interface] = {}
                 unnumbered_dict[interface]['unnumbered_intf'] = m.groupdict()['unnumbered_intf']
                 unnumbered_dict[interface]['unnumbered_ip'] = m.groupdict()['unnumbered_ip']
                 continue
 
             # 8 maximum active VCs, 1024 VCs per VP, 1 current VCCs
-            m = p36.match(line)
-            if m:
+            if name == 'p36':
                 group = m.groupdict()
                 maximum_active_vcs = group['maximum_active_vcs']
                 vcs_per_vp = group['vcs_per_vp']
@@ -1087,45 +1106,39 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
             
             # VC Auto Creation Disabled.
-            m = p37.match(line)
-            if m:
+            if name == 'p37':
                 group = m.groupdict()
                 vc_auto_creation = group['vc_auto_creation']
                 interface_dict[interface].update({'vc_auto_creation': vc_auto_creation})
                 continue
 
             # VC idle disconnect time: 300 seconds
-            m = p38.match(line)
-            if m:
+            if name == 'p38':
                 group = m.groupdict()
                 vc_idle_disconnect_time = group['vc_idle_disconnect_time']
                 interface_dict[interface].update({'vc_idle_disconnect_time': vc_idle_disconnect_time})
                 continue
 
             # AAL5 CRC errors : 0
-            m = p39.match(line)
-            if m:
+            if name == 'p39':
                 group = m.groupdict()
                 interface_dict[interface].update({'aal5_crc_errors': int(group['val'])})
                 continue
             
             # AAL5 SAR Timeouts : 0
-            m = p40.match(line)
-            if m:
+            if name == 'p40':
                 group = m.groupdict()
                 interface_dict[interface].update({'aal5_oversized_sdus': int(group['val'])})
                 continue
 
             # AAL5 Oversized SDUs : 0
-            m = p41.match(line)
-            if m:
+            if name == 'p41':
                 group = m.groupdict()
                 interface_dict[interface].update({'aal5_sar_timeouts': int(group['val'])})
                 continue
 
             # LCP Closed
-            m = p42.match(line)
-            if m:
+            if name == 'p42':
                 group = m.groupdict()
                 interface_dict[interface].update({'lcp_state': group['state']})
                 loopback = group.get('loopback', None)
@@ -1134,29 +1147,28 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Base PPPoATM vaccess
-            m = p43.match(line)
-            if m:
+            if name == 'p43':
                 group = m.groupdict()
                 interface_dict[interface].update({'base_pppoatm': group['base_pppoatm']})
                 continue
 
             # Vaccess status 0x44, loopback not set
-            m = p44.match(line)
-            if m:
+            if name == 'p44':
                 group = m.groupdict()
                 interface_dict[interface].update({'vaccess_status': group['status']})
                 interface_dict[interface].update({'vaccess_loopback': group['loopback']})
                 continue
 
             # DTR is pulsed for 5 seconds on reset
-            m = p45.match(line)
-            if m:
+            if name == 'p45':
                 group = m.groupdict()
                 interface_dict[interface].update({'dtr_pulsed': group['dtr_pulsed']})
                 continue
 
         # create strucutre for unnumbered interface
         if not unnumbered_dict:
+            if projection is not None:
+                return projection.project(interface_dict)
             return(interface_dict)
 
         for intf in unnumbered_dict:
@@ -1177,6 +1189,8 @@ class ShowInterfaces(ShowInterfacesSchema):
                             interface_dict[intf]['ipv4']['unnumbered']\
                                 ['interface_ref'] = unnumbered_intf
 
+        if projection is not None:
+            return projection.project(interface_dict)
         return(interface_dict)
 
 
@@ -1278,11 +1292,13 @@ class ShowIpInterfaceBrief(ShowIpInterfaceBriefSchema):
         """
         pass
 
-    def yang_cli(self):
-        cli_output = self.cli()
-        yang_output = self.yang()
-        merged_output = merge_dict(yang_output,cli_output)
-        return merged_output
+    def yang_cli(self, timeouts=None):
+        """ parsing mechanisms: yang and cli, run concurrently
+
+        Function yang_cli() merges the cli output into the yang output,
+        the output of a mechanism which fails or times out is left out
+        """
+        return run_mechanisms(self, ['yang', 'cli'], timeouts=timeouts)
 
 
 class ShowIpInterfaceBriefPipeVlan(ShowIpInterfaceBrief):
@@ -1373,8 +1389,9 @@ class ShowIpInterfaceBriefPipeVlan(ShowIpInterfaceBrief):
 
         return ret
 
-    def yang_cli(self):
-        super(ShowIpInterfaceBriefPipeVlan, self).yang_cli()
+    def yang_cli(self, timeouts=None):
+        return super(ShowIpInterfaceBriefPipeVlan, self).yang_cli(
+            timeouts=timeouts)
 
 
 class ShowIpInterfaceBriefPipeIpSchema(MetaParser):
@@ -1403,6 +1420,14 @@ class ShowIpInterfaceBriefPipeIp(ShowIpInterfaceBriefPipeIpSchema):
     # parsing mechanisms (cli(), yang(), xml()).
 
     cli_command = 'show ip interface brief | include {ip}'
+    patterns = Patterns(
+        # GigabitEthernet0/0     10.1.18.80      YES manual up                    up
+        p=r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) '
+          '+(?P<ip_address>[a-z0-9\.]+) +(?P<interface_ok>[A-Z]+) '
+          '+(?P<method>[a-zA-Z]+) +(?P<interface_status>[a-z\s]+) '
+          '+(?P<protocol_status>[a-z]+)$',
+    )
+
     def cli(self, ip,output=None):
         if output is None:
             out = self.device.execute(self.cli_command.format(ip=ip))
@@ -1410,16 +1435,12 @@ class ShowIpInterfaceBriefPipeIp(ShowIpInterfaceBriefPipeIpSchema):
             out = output
         interface_dict = {}
 
-        # GigabitEthernet0/0     10.1.18.80      YES manual up                    up
-        p = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) '
-            '+(?P<ip_address>[a-z0-9\.]+) +(?P<interface_ok>[A-Z]+) '
-            '+(?P<method>[a-zA-Z]+) +(?P<interface_status>[a-z\s]+) '
-            '+(?P<protocol_status>[a-z]+)$')
+        regex = ShowIpInterfaceBriefPipeIp.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
-            m = p.match(line)
+            m = regex.p.match(line)
             if m:
                 interface = m.groupdict()['interface']
                 if 'interface' not in interface_dict:
@@ -3033,19 +3054,23 @@ class ShowInterfacesTrunk(ShowInterfacesTrunkSchema):
     """parser for show interfaces trunk"""
     cli_command = 'show interfaces trunk'
 
+    patterns = Patterns(
+        # initial regexp pattern
+        p1=r'^(?P<name>[\w\-\/\.]+) +(?P<mode>\w+) +(?P<encapsulation>\S+) +'
+           '(?P<status>\w+) +(?P<native_vlan>\d+)$',
+        p2='^Port +Vlans +allowed +on +trunk$',
+        p3='^Port +Vlans +allowed +and +active +in +management +domain$',
+        p4='^Port +Vlans +in +spanning +tree +forwarding +state +and +not +pruned$',
+        p5='^(?P<name>[\w\-\/\.]+) +(?P<vlans>none\s*|[\d\-\,\s]+)$',
+    )
+
     def cli(self,output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
         else:
             out = output
 
-        # initial regexp pattern
-        p1 = re.compile(r'^(?P<name>[\w\-\/\.]+) +(?P<mode>\w+) +(?P<encapsulation>\S+) +'
-                         '(?P<status>\w+) +(?P<native_vlan>\d+)$')
-        p2 = re.compile('^Port +Vlans +allowed +on +trunk$')
-        p3 = re.compile('^Port +Vlans +allowed +and +active +in +management +domain$')
-        p4 = re.compile('^Port +Vlans +in +spanning +tree +forwarding +state +and +not +pruned$')
-        p5 = re.compile('^(?P<name>[\w\-\/\.]+) +(?P<vlans>none\s*|[\d\-\,\s]+)$')
+        p = ShowInterfacesTrunk.patterns
         # initial variables
         ret_dict = {}
         vlan_list_type = None
@@ -3058,7 +3083,7 @@ class ShowInterfacesTrunk(ShowInterfacesTrunkSchema):
             # Gi1/0/23    on               isl            trunking      1
             # Gi1/0/24    on               802.1q         trunking      1
             # Po12        auto             n-802.1q       trunking      1
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 intf = Common.convert_intf_name(group.pop('name'))
@@ -3068,22 +3093,22 @@ class ShowInterfacesTrunk(ShowInterfacesTrunkSchema):
                 continue
 
             # Port        Vlans allowed on trunk
-            if p2.match(line):
+            if p.p2.match(line):
                 vlan_list_type = 'vlans_allowed_on_trunk'
                 continue
 
             # Port        Vlans allowed and active in management domain
-            if p3.match(line):
+            if p.p3.match(line):
                 vlan_list_type = 'vlans_allowed_active_in_mgmt_domain'
                 continue
 
             # Port        Vlans in spanning tree forwarding state and not pruned
-            if p4.match(line):
+            if p.p4.match(line):
                 vlan_list_type = 'vlans_in_stp_forwarding_not_pruned'
                 continue
 
             # Gi1/0/4     200-211
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 intf = Common.convert_intf_name(group['name'])
@@ -3115,17 +3140,21 @@ class ShowInterfacesCounters(ShowInterfacesCountersSchema):
 
     cli_command = 'show interfaces {interface} counters'
 
+    patterns = Patterns(
+        # initial regexp pattern
+        p1=r'^(?P<name>[\w\-\/\.]+) +(?P<octets>\d+) +(?P<ucast_pkts>\d+) +'
+           '(?P<mcast_pkts>\d+) +(?P<bcast_pkts>\d+)$',
+        p2=r'Port +InOctets +InUcastPkts +InMcastPkts +InBcastPkts',
+        p2_1=r'Port +OutOctets +OutUcastPkts +OutMcastPkts +OutBcastPkts',
+    )
+
     def cli(self, interface,output=None):
         if output is None:
             out = self.device.execute(self.cli_command.format(interface=interface))
         else:
             out = output
 
-        # initial regexp pattern
-        p1 = re.compile(r'^(?P<name>[\w\-\/\.]+) +(?P<octets>\d+) +(?P<ucast_pkts>\d+) +'
-                         '(?P<mcast_pkts>\d+) +(?P<bcast_pkts>\d+)$')
-        p2 = re.compile(r'Port +InOctets +InUcastPkts +InMcastPkts +InBcastPkts')
-        p2_1 = re.compile(r'Port +OutOctets +OutUcastPkts +OutMcastPkts +OutBcastPkts')
+        p = ShowInterfacesCounters.patterns
 
         # initial variables
         ret_dict = {}
@@ -3134,16 +3163,16 @@ class ShowInterfacesCounters(ShowInterfacesCountersSchema):
             line = line.strip()
 
             # decide the in or out packets
-            if p2.match(line):
+            if p.p2.match(line):
                 in_out = 'in'
                 continue
 
-            if p2_1.match(line):
+            if p.p2_1.match(line):
                 in_out = 'out'
                 continue
 
             # Gi1/0/4     on               802.1q         trunking      1
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 intf = Common.convert_intf_name(group.pop('name'))
@@ -3179,6 +3208,25 @@ class ShowInterfacesAccounting(ShowInterfacesAccountingSchema):
     cli_command = ['show interfaces {interface} accounting','show interfaces accounting']
     exclude = ['pkts_in', 'pkts_out', 'chars_in', 'chars_out']
 
+    patterns = Patterns(
+        # initial regexp pattern
+        # GigabitEthernet0/0/0/0
+        # GigabitEthernet11 OOB Net
+        p1=r'^(?P<interface>[a-zA-Z\-\d\/\.]+)(?P<description>( (\S)+)*)$',
+
+        # Tunnel0 Pim Register Tunnel (Encap) for RP 10.186.1.1
+        p1_1=r'^(?P<interface>Tunnel\d+) +Pim +Register +'
+             'Tunnel +\(Encap\) +for +RP +(?P<rp>[\w\.]+)$',
+
+        #   IPV4_UNICAST             9943           797492           50             3568
+        p2=r'^(?P<protocol>[\w\_\-\s]+)\s+(?P<pkts_in>\d+)\s+'
+           '(?P<chars_in>\d+)\s+(?P<pkts_out>\d+)\s+'
+           '(?P<chars_out>\d+)',
+
+        # No traffic sent or received on this interface.
+        p3=r'^No +traffic +sent +or +received +on +this +interface\.$',
+    )
+
     def cli(self, interface=None,output=None):
         if output is None:
             if not interface:
@@ -3192,22 +3240,7 @@ class ShowInterfacesAccounting(ShowInterfacesAccountingSchema):
         # initial return disctionary
         ret_dict = {}
 
-        # initial regexp pattern
-        # GigabitEthernet0/0/0/0
-        # GigabitEthernet11 OOB Net
-        p1 = re.compile(r'^(?P<interface>[a-zA-Z\-\d\/\.]+)(?P<description>( (\S)+)*)$')
-
-        # Tunnel0 Pim Register Tunnel (Encap) for RP 10.186.1.1
-        p1_1 = re.compile(r'^(?P<interface>Tunnel\d+) +Pim +Register +'
-                           'Tunnel +\(Encap\) +for +RP +(?P<rp>[\w\.]+)$')
-
-        #   IPV4_UNICAST             9943           797492           50             3568
-        p2 = re.compile(r'^(?P<protocol>[\w\_\-\s]+)\s+(?P<pkts_in>\d+)\s+'
-                         '(?P<chars_in>\d+)\s+(?P<pkts_out>\d+)\s+'
-                         '(?P<chars_out>\d+)')
-
-        # No traffic sent or received on this interface.
-        p3 = re.compile(r'^No +traffic +sent +or +received +on +this +interface\.$')
+        p = ShowInterfacesAccounting.patterns
 
         for line in out.splitlines():
             if line:
@@ -3215,20 +3248,20 @@ class ShowInterfacesAccounting(ShowInterfacesAccountingSchema):
             else:
                 continue
 
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 continue
 
             # GigabitEthernet0/0/0/0
             # GigabitEthernet11 OOB Net
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 intf = m.groupdict()['interface']
                 description = m.groupdict()['description']
                 continue
 
             #   IPV4_UNICAST             9943           797492           50             3568
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 protocol_dict = m.groupdict()
                 protocol = protocol_dict.pop('protocol').lower().strip()
@@ -3276,6 +3309,16 @@ class ShowInterfacesStats(ShowInterfacesStatsSchema):
     cli_command = ['show interfaces stats' ,'show interfaces {interface} stats']
     exclude = ['chars_in' , 'chars_out', 'pkts_in', 'pkts_out']
 
+    patterns = Patterns(
+        # GigabitEthernet0/0/0
+        p1=r'^\s*(?P<interface>[\w./]+)$',
+
+        #    Switching path    Pkts In   Chars In   Pkts Out  Chars Out
+        #         Processor         33       2507         33       2490
+        p2=r'^\s*(?P<path>[\w\- ]*?) +(?P<pkts_in>[\d]+) +(?P<chars_in>[\d]+)'
+           ' +(?P<pkts_out>[\d]+) +(?P<chars_out>[\d]+)$',
+    )
+
     def cli(self, interface="", output=None):
         if output is None:
             if interface:
@@ -3289,24 +3332,18 @@ class ShowInterfacesStats(ShowInterfacesStatsSchema):
         # initialize result dict
         result_dict = {}
         
-        # GigabitEthernet0/0/0
-        p1 = re.compile(r'^\s*(?P<interface>[\w./]+)$')
-
-        #    Switching path    Pkts In   Chars In   Pkts Out  Chars Out
-        #         Processor         33       2507         33       2490
-        p2 = re.compile(r'^\s*(?P<path>[\w\- ]*?) +(?P<pkts_in>[\d]+) +(?P<chars_in>[\d]+)'
-                        ' +(?P<pkts_out>[\d]+) +(?P<chars_out>[\d]+)$')
+        p = ShowInterfacesStats.patterns
 
         for line in out.splitlines():
             line = line.rstrip()
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 interface = m.groupdict()['interface']
                 path_dict = result_dict.setdefault(interface, {}).setdefault('switching_path', {})
                 continue
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 path = group.pop('path').replace(" ", "_").replace("-", "_").lower()
@@ -3341,6 +3378,13 @@ class ShowInterfacesDescription(ShowInterfacesDescriptionSchema):
 
     cli_command = ['show interfaces description', 'show interfaces {interface} description']
 
+    patterns = Patterns(
+        #Interface                      Status         Protocol Description
+        #Gi0/0                          up             up
+        #Gi0/1                          admin down     down     to router2
+        p1=r'(?P<interface>(\S+)) +(?P<status>(\S+)([\s+](\S+))?) +(?P<protocol>(\S+))(?: +(?P<description>(.*)))?$',
+    )
+
     def cli(self, interface="", output=None):
         if output is None:
             if interface:
@@ -3354,17 +3398,14 @@ class ShowInterfacesDescription(ShowInterfacesDescriptionSchema):
         result_dict = {}
         index = 1
 
-        #Interface                      Status         Protocol Description
-        #Gi0/0                          up             up 
-        #Gi0/1                          admin down     down     to router2
-        p1 = re.compile(r'(?P<interface>(\S+)) +(?P<status>(\S+)([\s+](\S+))?) +(?P<protocol>(\S+))(?: +(?P<description>(.*)))?$')
+        p = ShowInterfacesDescription.patterns
 
         for line in out.splitlines():
             line = line.strip()
             #Interface                      Status         Protocol Description
             #Gi0/0                          up             up 
             #Gi0/1                          admin down     down     to router2
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m and m.groupdict()['protocol'] != 'Protocol':
                 group = m.groupdict()
                 interface = Common.convert_intf_name(group['interface'])
@@ -3412,6 +3453,12 @@ class ShowInterfacesStatus(ShowInterfacesStatusSchema):
 
     cli_command = 'show interfaces status'
 
+    patterns = Patterns(
+        p1=r'^(?P<interfaces>\S+)(?:\s+(?P<name>([\S\s]+)))?'
+           r'\s+(?P<status>(connected|notconnect|suspended|inactive|disabled|err-disabled|monitoring))'
+           r'\s+(?P<vlan>\S+)\s+(?P<duplex_code>[\S\-]+)\s+(?P<port_speed>[\S\-]+)(\s+(?P<type>.+))?$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -3431,14 +3478,12 @@ class ShowInterfacesStatus(ShowInterfacesStatusSchema):
         # Te2/1/21  VSL LINK1          disabled     1            full   auto No XCVR
         # Po10      VSL LINK2          connected    trunk      a-full  a-10G
 
-        p1 = re.compile(r'^(?P<interfaces>\S+)(?:\s+(?P<name>([\S\s]+)))?'
-                        r'\s+(?P<status>(connected|notconnect|suspended|inactive|disabled|err-disabled|monitoring))'
-                        r'\s+(?P<vlan>\S+)\s+(?P<duplex_code>[\S\-]+)\s+(?P<port_speed>[\S\-]+)(\s+(?P<type>.+))?$')
+        p = ShowInterfacesStatus.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
 
@@ -3497,6 +3542,17 @@ class ShowInterfaceTransceiverDetail(ShowInterfaceTransceiverDetailSchema):
 
     cli_command = 'show interface {interface} transceiver detail'
 
+    patterns = Patterns(
+        # transceiver is present
+        # type is 10Gbase-LR
+        # name is CISCO-FINISAR
+        # part number is FTLX1474D3BCL-CS
+        p1=r'^(?P<key>[\S\s]+) +is +(?P<value>[\S\s]+)$',
+
+        # number of lanes 1
+        p2=r'^number +of +lanes +(?P<lanes>[\d]+)$',
+    )
+
     def cli(self, interface, output=None):
 
         if output is None:
@@ -3506,21 +3562,14 @@ class ShowInterfaceTransceiverDetail(ShowInterfaceTransceiverDetailSchema):
 
         result_dict = {}
 
-        # transceiver is present
-        # type is 10Gbase-LR
-        # name is CISCO-FINISAR
-        # part number is FTLX1474D3BCL-CS
-        p1 = re.compile(r'^(?P<key>[\S\s]+) +is +(?P<value>[\S\s]+)$')
-
-        # number of lanes 1
-        p2 = re.compile(r'^number +of +lanes +(?P<lanes>[\d]+)$')
+        p = ShowInterfaceTransceiverDetail.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # transceiver is present
             # type is 10Gbase-LR
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 key = group['key'].strip().replace(" ", '_').lower()
@@ -3531,7 +3580,7 @@ class ShowInterfaceTransceiverDetail(ShowInterfaceTransceiverDetailSchema):
                 continue
             
             # number of lanes 1
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 intf_dict['number_of_lanes'] = m.groupdict()['lanes']
                 continue
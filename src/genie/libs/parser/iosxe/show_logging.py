@@ -11,6 +11,7 @@ import re
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional, Or
+from genie.libs.parser.utils.patterns import Patterns
 
 
 class ShowLoggingSchema(MetaParser):
@@ -160,99 +161,103 @@ class ShowLogging(ShowLoggingSchema):
                    'show logging | include {include}',
                    'show logging']
 
-    def cli(self, exclude='', include='', output=None):
-
-        if output is None:
-            # Build the command
-            if exclude:
-                cmd = self.cli_command[0].format(exclude=exclude)
-            elif include:
-                cmd = self.cli_command[1].format(include=include)
-            else:
-                cmd = self.cli_command[2]
-            # Execute the command
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
-        # Init vars
-        log_lines = []
-
+    patterns = Patterns(
         #Syslog logging: enabled (0 messages dropped, 0 messages rate-limited, 0 flushes, 0 overruns, xml disabled, filtering disabled)
-        p1 = re.compile(r'Syslog +logging: +(?P<enable_disable>\S+) +\(+(?P<messages_dropped>\d+) '
-                        r'+messages +dropped, +(?P<messages_rate_limited>\d+) +messages +rate-limited, '
-                        r'+(?P<flushes>\d+) +flushes, +(?P<overruns>\d+) +overruns, +xml +(?P<xml>\S+), '
-                        r'filtering +(?P<filtering>\S+)\)$')
+        p1=r'Syslog +logging: +(?P<enable_disable>\S+) +\(+(?P<messages_dropped>\d+) '
+           r'+messages +dropped, +(?P<messages_rate_limited>\d+) +messages +rate-limited, '
+           r'+(?P<flushes>\d+) +flushes, +(?P<overruns>\d+) +overruns, +xml +(?P<xml>\S+), '
+           r'filtering +(?P<filtering>\S+)\)$',
 
         #Console logging: disabled
-        p2 = re.compile(r'(?P<tag>\S+) +logging: +(?P<status>\S+)$')
+        p2=r'(?P<tag>\S+) +logging: +(?P<status>\S+)$',
 
         #Monitor logging: level debugging, 13 messages logged, xml disabled,
         #Console logging: level debugging, 9789 messages logged, xml disabled,
-        p3 = re.compile(r'(?P<tag>\S+) +logging: +level '
-                        r'+(?P<level>\S+), +(?P<messages_logged>\d+) '
-                        r'+messages +logged, +xml +(?P<xml>\S+),$')
+        p3=r'(?P<tag>\S+) +logging: +level '
+           r'+(?P<level>\S+), +(?P<messages_logged>\d+) '
+           r'+messages +logged, +xml +(?P<xml>\S+),$',
 
         #filtering disabled
-        p4 = re.compile(r'filtering +(?P<filtering>\S+)$')
+        p4=r'filtering +(?P<filtering>\S+)$',
 
         #Exception Logging: size (4096 bytes)
-        p6 = re.compile(r'Exception +Logging: size +\((?P<size_bytes>\d+) +bytes+\)$')
+        p6=r'Exception +Logging: size +\((?P<size_bytes>\d+) +bytes+\)$',
 
         #Count and timestamp logging messages: disabled
-        p7 = re.compile(r'Count +and +timestamp +logging +messages: '
-                        r'+(?P<count_and_time_stamp_logging_messages>\S+)$')
+        p7=r'Count +and +timestamp +logging +messages: '
+           r'+(?P<count_and_time_stamp_logging_messages>\S+)$',
 
         #File logging: disabled
-        p8 = re.compile(r'(?P<tag>File +logging): +(?P<status>\S+)$')
+        p8=r'(?P<tag>File +logging): +(?P<status>\S+)$',
 
         #Persistent logging: disabled
         #Persistent logging: enabled, url bootflash:/syslog, disk space 104857600 bytes, file size 10485760 bytes, batch size 4096 bytes
-        p9 = re.compile(r'Persistent\s+logging:\s+(?P<status>\w+)(,\s+url\s+(?P<url>[\w:/]+),\s+disk\s+space\s+(?P<disk_space_bytes>\d+)\s+bytes,\s+file\s+size\s+(?P<file_size_bytes>\d+)\s+bytes,\s+batch\s+size\s+(?P<batch_size_bytes>\d+)\s+bytes)?$')
+        p9=r'Persistent\s+logging:\s+(?P<status>\w+)(,\s+url\s+(?P<url>[\w:/]+),\s+disk\s+space\s+(?P<disk_space_bytes>\d+)\s+bytes,\s+file\s+size\s+(?P<file_size_bytes>\d+)\s+bytes,\s+batch\s+size\s+(?P<batch_size_bytes>\d+)\s+bytes)?$',
 
         #Trap logging: level informational, 1570 message lines logged
-        p10 = re.compile(r'(?P<tag>Trap) +logging: +level +'
-                         r'(?P<level>\S+), +(?P<message_lines_logged>\d+) '
-                         r'+message +lines +logged$')
+        p10=r'(?P<tag>Trap) +logging: +level +'
+            r'(?P<level>\S+), +(?P<message_lines_logged>\d+) '
+            r'+message +lines +logged$',
 
         #Logging to 192.168.1.3  (tcp port 1514, audit disabled,
-        p11 = re.compile(r'Logging +to (?P<logging_to>[\d\.]+) +\((?P<protocol>\S+) '
-                        r'+port +(?P<port>\d+), +audit +(?P<audit>\S+),$')
+        p11=r'Logging +to (?P<logging_to>[\d\.]+) +\((?P<protocol>\S+) '
+            r'+port +(?P<port>\d+), +audit +(?P<audit>\S+),$',
 
         #link down),
-        p12 = re.compile(r'link +(?P<link>\S+)\),$')
+        p12=r'link +(?P<link>\S+)\),$',
 
         #787 message lines logged,
-        p13 = re.compile(r'(?P<message_lines_logged>\d+) +message +lines +logged,$')
+        p13=r'(?P<message_lines_logged>\d+) +message +lines +logged,$',
 
         #0 message lines rate-limited,
-        p14 = re.compile(r'(?P<message_lines_rate_limited>\d+) '
-                         r'+message +lines +rate-limited,$')
+        p14=r'(?P<message_lines_rate_limited>\d+) '
+            r'+message +lines +rate-limited,$',
 
         #0 message lines dropped-by-MD,
-        p15 = re.compile(r'(?P<message_lines_dropped_by_md>\d+) '
-                         r'+message +lines +dropped-by-MD,$')
+        p15=r'(?P<message_lines_dropped_by_md>\d+) '
+            r'+message +lines +dropped-by-MD,$',
 
         #xml disabled, sequence number disabled
-        p16 = re.compile(r'xml +(?P<xml>\S+), +sequence +number +(?P<sequence_number>\S+)$')
+        p16=r'xml +(?P<xml>\S+), +sequence +number +(?P<sequence_number>\S+)$',
 
         #Logging Source-Interface:       VRF Name:
-        p17 = re.compile(r'Logging Source-Interface: +VRF +Name:$')
+        p17=r'Logging Source-Interface: +VRF +Name:$',
 
         #Vlan200
-        p18 = re.compile(r'(?P<interface>\S+)+(?P<vrf>\S+)?$')
+        p18=r'(?P<interface>\S+)+(?P<vrf>\S+)?$',
 
         #Log Buffer (32000 bytes):
-        p19 = re.compile(r'Log +Buffer +\((?P<vrf>\d+) +bytes+\):$')
+        p19=r'Log +Buffer +\((?P<vrf>\d+) +bytes+\):$',
+    )
+
+    def cli(self, exclude='', include='', output=None):
+
+        if output is None:
+            # Build the command
+            if exclude:
+                cmd = self.cli_command[0].format(exclude=exclude)
+            elif include:
+                cmd = self.cli_command[1].format(include=include)
+            else:
+                cmd = self.cli_command[2]
+            # Execute the command
+            out = self.device.execute(cmd)
+        else:
+            out = output
+
+        # Init vars
+        log_lines = []
+
+        p = ShowLogging.patterns
 
         ret_dict = {}
         for line in out.splitlines():
 
             line = line.strip()
+            name, m = p.match(line)
 
             #Syslog logging: enabled (0 messages dropped, 0 messages rate-limited, 0 flushes, 0 overruns, xml disabled, filtering disabled)
-            m = p1.match(line)
-            if m:
+            if name == 'p1':
                 group = m.groupdict()
                 sys_log_entry = ret_dict.setdefault("syslog_logging", {})
                 logging_entry = ret_dict.setdefault("logging", {})
@@ -278,8 +283,7 @@ class ShowLogging(ShowLoggingSchema):
                 continue
 
             #Console logging: disabled
-            m = p2.match(line)
-            if m:
+            if name == 'p2':
                 group = m.groupdict()
                 current_tag = group['tag'].lower()
                 logging_entry.setdefault(current_tag, {}).setdefault(
@@ -288,8 +292,7 @@ class ShowLogging(ShowLoggingSchema):
 
             #Monitor logging: level debugging, 13 messages logged, xml disabled,
             #Console logging: level debugging, 9789 messages logged, xml disabled,
-            m = p3.match(line)
-            if m:
+            if name == 'p3':
                 group = m.groupdict()
                 current_tag = group['tag'].lower()
                 logging_entry.setdefault(current_tag,
@@ -301,8 +304,7 @@ class ShowLogging(ShowLoggingSchema):
                 continue
 
             #filtering disabled
-            m = p4.match(line)
-            if m:
+            if name == 'p4':
                 group = m.groupdict()
                 if current_tag == 'trap':
                     logging_entry.setdefault(current_tag, {}).setdefault(
@@ -316,24 +318,21 @@ class ShowLogging(ShowLoggingSchema):
                 continue
 
             #Exception Logging: size (4096 bytes)
-            m = p6.match(line)
-            if m:
+            if name == 'p6':
                 group = m.groupdict()
                 exception_dict = {'size_bytes': int(group['size_bytes'])}
                 logging_entry['exception'] = exception_dict
                 continue
 
             #Count and timestamp logging messages: disabled
-            m = p7.match(line)
-            if m:
+            if name == 'p7':
                 group = m.groupdict()
                 logging_entry['count_and_time_stamp_logging_messages'] = group[
                     'count_and_time_stamp_logging_messages']
                 continue
 
             #File logging: disabled
-            m = p8.match(line)
-            if m:
+            if name == 'p8':
                 group = m.groupdict()
                 file_dict = {'status': group['status']}
                 logging_entry['file'] = file_dict
@@ -341,8 +340,7 @@ class ShowLogging(ShowLoggingSchema):
 
             #Persistent logging: disabled
             #Persistent logging: enabled, url bootflash:/syslog, disk space 104857600 bytes, file size 10485760 bytes, batch size 4096 bytes
-            m = p9.match(line)
-            if m:
+            if name == 'p9':
                 group = m.groupdict()
                 for item in group:
                     if group[item]:
@@ -353,8 +351,7 @@ class ShowLogging(ShowLoggingSchema):
                 continue
 
             #Trap logging: level informational, 1570 message lines logged
-            m = p10.match(line)
-            if m:
+            if name == 'p10':
                 group = m.groupdict()
                 trap_dict = {}
                 current_tag = group['tag'].lower()
@@ -367,8 +364,7 @@ class ShowLogging(ShowLoggingSchema):
                 continue
 
             #Logging to 192.168.1.3  (tcp port 1514, audit disabled,
-            m = p11.match(line)
-            if m:
+            if name == 'p11':
                 group = m.groupdict()
                 logging_dict = {}
                 current_logging_to = group['logging_to']
@@ -382,54 +378,47 @@ class ShowLogging(ShowLoggingSchema):
                 continue
 
             #link down),
-            m = p12.match(line)
-            if m:
+            if name == 'p12':
                 group = m.groupdict()
                 logging_dict['link'] = group['link']
                 continue
 
             #787 message lines logged,
-            m = p13.match(line)
-            if m:
+            if name == 'p13':
                 group = m.groupdict()
                 logging_dict['message_lines_logged'] = int(
                     group['message_lines_logged'])
                 continue
 
             #0 message lines rate-limited,
-            m = p14.match(line)
-            if m:
+            if name == 'p14':
                 group = m.groupdict()
                 logging_dict['message_lines_rate_limited'] = int(
                     group['message_lines_rate_limited'])
                 continue
 
             #0 message lines dropped-by-MD,
-            m = p15.match(line)
-            if m:
+            if name == 'p15':
                 group = m.groupdict()
                 logging_dict['message_lines_dropped_by_md'] = int(
                     group['message_lines_dropped_by_md'])
                 continue
 
             #xml disabled, sequence number disabled
-            m = p16.match(line)
-            if m:
+            if name == 'p16':
                 group = m.groupdict()
                 logging_dict['xml'] = group['xml']
                 logging_dict['sequence_number'] = group['sequence_number']
                 continue
 
             #Logging Source-Interface:       VRF Name:
-            m = p17.match(line)
-            if m:
+            if name == 'p17':
                 # do nothing, but need to parse for skipping this line
                 continue
 
             #Vlan200
             #Vlan200                         VRF-A
-            m = p18.match(line)
-            if m:
+            if name == 'p18':
                 group = m.groupdict()
                 logging_source_dict = {}
                 if group['vrf']:
@@ -443,8 +432,7 @@ class ShowLogging(ShowLoggingSchema):
                 continue
 
             #Log Buffer (32000 bytes):
-            m = p19.match(line)
-            if m:
+            if name == 'p19':
                 group = m.groupdict()
                 ret_dict['log_buffer_bytes'] = int(group['vrf'])
 
@@ -40,6 +40,7 @@ from netaddr import IPAddress, IPNetwork
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import Patterns
 
 # ===========================================================
 # Schema for:
@@ -84,6 +85,24 @@ class ShowIpOspfSegmentRoutingLocalBlock(ShowIpOspfSegmentRoutingLocalBlockSchem
     cli_command = ['show ip ospf segment-routing local-block',
                    'show ip ospf {process_id} segment-routing local-block']
 
+    patterns = Patterns(
+        # OSPF Router with ID (10.4.1.1) (Process ID 65109)
+        p1=r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+           ' +\(Process +ID +(?P<pid>(\S+))\)$',
+
+        # OSPF Segment Routing Local Blocks in Area 8
+        p2=r'^OSPF +Segment +Routing +Local +Blocks +in +Area'
+           ' +(?P<area>(\d+))$',
+
+        # Router ID        SR Capable   SRLB Base   SRLB Range
+        # --------------------------------------------------------
+        # *10.4.1.1          Yes          15000       1000
+        # 10.16.2.2          Yes          15000       1000
+        # 10.169.197.252    No
+        p3=r'^(?P<value>\*)?(?P<router_id>\S+) +(?P<sr_capable>Yes|No)'
+           '( +(?P<srlb_base>\d+) +(?P<srlb_range>\d+))?$',
+    )
+
     def cli(self, process_id=None, output=None):
         if output is None:
             if process_id:
@@ -98,27 +117,13 @@ class ShowIpOspfSegmentRoutingLocalBlock(ShowIpOspfSegmentRoutingLocalBlockSchem
         # Init vars
         ret_dict = {}
 
-        # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                         ' +\(Process +ID +(?P<pid>(\S+))\)$')
-
-        # OSPF Segment Routing Local Blocks in Area 8
-        p2 = re.compile(r'^OSPF +Segment +Routing +Local +Blocks +in +Area'
-                         ' +(?P<area>(\d+))$')
-
-        # Router ID        SR Capable   SRLB Base   SRLB Range
-        # --------------------------------------------------------
-        # *10.4.1.1          Yes          15000       1000
-        # 10.16.2.2          Yes          15000       1000
-        # 10.169.197.252    No 
-        p3 = re.compile(r'^(?P<value>\*)?(?P<router_id>\S+) +(?P<sr_capable>Yes|No)'
-                         '( +(?P<srlb_base>\d+) +(?P<srlb_range>\d+))?$')
+        p = ShowIpOspfSegmentRoutingLocalBlock.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 inst_dict = ret_dict.setdefault('instance', {}).\
@@ -127,7 +132,7 @@ class ShowIpOspfSegmentRoutingLocalBlock(ShowIpOspfSegmentRoutingLocalBlockSchem
                 continue
 
             # OSPF Segment Routing Local Blocks in Area 8
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 area_dict = inst_dict.setdefault('areas', {}).\
                     setdefault(str(IPAddress(str(m.groupdict()['area']))), {})
@@ -137,7 +142,7 @@ class ShowIpOspfSegmentRoutingLocalBlock(ShowIpOspfSegmentRoutingLocalBlockSchem
             # --------------------------------------------------------
             # *10.4.1.1          Yes          15000       1000
             # 10.16.2.2          Yes          15000       1000
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 smgt_dict = area_dict.setdefault('router_id', {}).\
@@ -339,232 +344,236 @@ class ShowIpOspf(ShowIpOspfSchema):
     cli_command = 'show ip ospf'
     exclude = ['area_scope_lsa_cksum_sum' , ]
 
-    def cli(self, output=None):
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
+    patterns = Patterns(
+        p1=r'(?:^VRF +(?P<vrf>(\S+)) +in +)?Routing +Process'
+           ' +\"(?:ospf)? +(?P<instance>([a-zA-Z0-9\s]+))\"'
+           ' +with +ID +(?P<router_id>(\S+))$',
 
-        # Init vars
-        ret_dict = {}
-        af = 'ipv4' # this is ospf - always ipv4
+        p1_1=r'^Routing +Process +is +shutdown$',
 
-        p1 = re.compile(r'(?:^VRF +(?P<vrf>(\S+)) +in +)?Routing +Process'
-                            ' +\"(?:ospf)? +(?P<instance>([a-zA-Z0-9\s]+))\"'
-                            ' +with +ID +(?P<router_id>(\S+))$')
+        p2=r'^Domain +ID +type +(?P<domain_id>(\S+)), +value'
+           ' +(?P<value>(\S+))$',
 
-        p1_1 = re.compile(r'^Routing +Process +is +shutdown$')
+        p3=r'^Start +time: +(?P<start>([0-9\:\.]+)), +Time'
+           ' +elapsed: +(?P<elapsed>(\S+))$',
 
-        p2 = re.compile(r'^Domain +ID +type +(?P<domain_id>(\S+)), +value'
-                            ' +(?P<value>(\S+))$')
+        p4=r'^Supports +only +single +TOS(TOS0) routes$',
 
-        p3 = re.compile(r'^Start +time: +(?P<start>([0-9\:\.]+)), +Time'
-                            ' +elapsed: +(?P<elapsed>(\S+))$')
+        p5=r'^Supports +opaque +LSA$',
 
-        p4 = re.compile(r'^Supports +only +single +TOS(TOS0) routes$')
+        p6=r'^Supports +Link-local +Signaling +\(LLS\)$',
 
-        p5 = re.compile(r'^Supports +opaque +LSA$')
+        p7=r'^Supports +area +transit +capability$',
 
-        p6 = re.compile(r'^Supports +Link-local +Signaling +\(LLS\)$')
+        p8=r'^Supports +NSSA +\(compatible +with +RFC +3101\)$',
 
-        p7 = re.compile(r'^Supports +area +transit +capability$')
+        p9=r'^Supports +Database +Exchange +Summary +List'
+           ' +Optimization +\(RFC +5243\)$',
 
-        p8 = re.compile(r'^Supports +NSSA +\(compatible +with +RFC +3101\)$')
+        p10=r'^Event-log +(?P<event_log>(enabled|disabled)),'
+            '(?: +Maximum +number +of +events:'
+            ' +(?P<max_events>(\d+)),'
+            ' +Mode: +(?P<mode>(\S+)))?$',
 
-        p9 = re.compile(r'^Supports +Database +Exchange +Summary +List'
-                            ' +Optimization +\(RFC +5243\)$')
+        p11=r'^It +is +an'
+            '(?: +(?P<abr>(area border)))?'
+            '(?: +and)?'
+            '(?: +(?P<asbr>(autonomous system boundary)))?'
+            ' +router$',
 
-        p10 = re.compile(r'^Event-log +(?P<event_log>(enabled|disabled)),'
-                            '(?: +Maximum +number +of +events:'
-                            ' +(?P<max_events>(\d+)),'
-                            ' +Mode: +(?P<mode>(\S+)))?$')
+        p12_1=r'^Redistributing +External +Routes +from,$',
 
-        p11 = re.compile(r'^It +is +an'
-                            '(?: +(?P<abr>(area border)))?'
-                            '(?: +and)?'
-                            '(?: +(?P<asbr>(autonomous system boundary)))?'
-                            ' +router$')
+        p12_2=r'^(?P<type>(connected|static))(?: +with +metric'
+              ' +mapped +to +(?P<metric>(\d+)))?$',
 
-        p12_1 = re.compile(r'^Redistributing +External +Routes +from,$')
+        p12_2_1=r'^(?P<type>(connected|static|isis))'
+                ', +includes +(?P<redist>(subnets)) +in +redistribution',
 
-        p12_2 = re.compile(r'^(?P<type>(connected|static))(?: +with +metric'
-                            ' +mapped +to +(?P<metric>(\d+)))?$')
+        p12_3=r'^(?P<prot>(bgp|isis)) +(?P<pid>(\d+))'
+              '(?: +with +metric +mapped +to +(?P<metric>(\d+)))?'
+              '(?:, +includes +(?P<redist>(subnets)) +in +redistribution)?'
+              '(?:, +(?P<nssa>(nssa areas only)))?$',
 
-        p12_2_1 = re.compile(r'^(?P<type>(connected|static|isis))'
-                                ', +includes +(?P<redist>(subnets)) +in +redistribution')
+        p12_4=r'^Maximum +number +of +redistributed +prefixes'
+              ' +(?P<num_prefix>(\d+))'
+              '(?: +\((?P<warn>(warning-only))\))?',
 
-        p12_3 = re.compile(r'^(?P<prot>(bgp|isis)) +(?P<pid>(\d+))'
-                            '(?: +with +metric +mapped +to +(?P<metric>(\d+)))?'
-                            '(?:, +includes +(?P<redist>(subnets)) +in +redistribution)?'
-                            '(?:, +(?P<nssa>(nssa areas only)))?$')
+        p12_5=r'^Threshold +for +warning +message'
+              ' +(?P<thld>(\d+))\%$',
 
-        p12_4 = re.compile(r'^Maximum +number +of +redistributed +prefixes'
-                            ' +(?P<num_prefix>(\d+))'
-                            '(?: +\((?P<warn>(warning-only))\))?')
+        p13=r'^Router +is +not +originating +router-LSAs'
+            ' +with +maximum +metric$',
 
-        p12_5 = re.compile(r'^Threshold +for +warning +message'
-                            ' +(?P<thld>(\d+))\%$')
+        p14_1=r'^Originating +router-LSAs +with +maximum'
+              ' +metric$',
 
-        p13 = re.compile(r'^Router +is +not +originating +router-LSAs'
-                            ' +with +maximum +metric$')
+        p14_3=r'^Advertise +stub +links +with +maximum +metric'
+              ' +in +router\-LSAs$',
 
-        p14_1 = re.compile(r'^Originating +router-LSAs +with +maximum'
-                            ' +metric$')
+        p14_4=r'^Advertise +summary\-LSAs +with +metric'
+              ' +(?P<metric>(\d+))$',
 
-        p14_2 = re.compile(r'^Condition:'
-                            ' +(?P<condition>(always|on \S+))'
-                            '(?: +for +(?P<seconds>(\d+)) +seconds,)?'
-                            ' +State: +(?P<state>(\S+))$')
+        p14_5=r'^^Advertise +external\-LSAs +with +metric'
+              ' +(?P<metric>(\d+))$',
 
-        p14_3 = re.compile(r'^Advertise +stub +links +with +maximum +metric'
-                            ' +in +router\-LSAs$')
+        p15=r'^Initial +SPF +schedule +delay +(?P<time>(\S+))'
+            ' +msecs$',
 
-        p14_4 = re.compile(r'^Advertise +summary\-LSAs +with +metric'
-                            ' +(?P<metric>(\d+))$')
+        p16=r'^Minimum +hold +time +between +two +consecutive'
+            ' +SPFs +(?P<time>(\S+)) +msecs$',
 
-        p14_5 = re.compile(r'^^Advertise +external\-LSAs +with +metric'
-                            ' +(?P<metric>(\d+))$')
+        p17=r'^Maximum +wait +time +between +two +consecutive'
+            ' +SPFs +(?P<time>(\S+)) +msecs$',
 
-        p15 = re.compile(r'^Initial +SPF +schedule +delay +(?P<time>(\S+))'
-                            ' +msecs$')
+        p18=r'^Initial +LSA +throttle +delay +(?P<time>(\S+))'
+            ' +msecs$',
 
-        p16 = re.compile(r'^Minimum +hold +time +between +two +consecutive'
-                            ' +SPFs +(?P<time>(\S+)) +msecs$')
+        p19=r'^Minimum +hold +time +for +LSA +throttle'
+            ' +(?P<time>(\S+)) +msecs$',
 
-        p17 = re.compile(r'^Maximum +wait +time +between +two +consecutive'
-                            ' +SPFs +(?P<time>(\S+)) +msecs$')
+        p20=r'^Maximum +wait +time +for +LSA +throttle'
+            ' +(?P<time>(\S+)) +msecs$',
 
-        p18 = re.compile(r'^Initial +LSA +throttle +delay +(?P<time>(\S+))'
-                            ' +msecs$')
+        p21=r'^Minimum +LSA +arrival'
+            ' +(?P<arrival>(\S+)) +msecs$',
 
-        p19 = re.compile(r'^Minimum +hold +time +for +LSA +throttle'
-                            ' +(?P<time>(\S+)) +msecs$')
+        p22=r'^Incremental-SPF +(?P<incr>(disabled|enabled))$',
 
-        p20 = re.compile(r'^Maximum +wait +time +for +LSA +throttle'
-                            ' +(?P<time>(\S+)) +msecs$')
+        p23=r'LSA +group +pacing +timer'
+            ' +(?P<pacing>(\d+)) +secs$',
 
-        p21 = re.compile(r'^Minimum +LSA +arrival'
-                            ' +(?P<arrival>(\S+)) +msecs$')
+        p24=r'Interface +flood +pacing +timer'
+            ' +(?P<interface>(\d+)) +msecs$',
 
-        p22 = re.compile(r'^Incremental-SPF +(?P<incr>(disabled|enabled))$')
+        p25=r'Retransmission +pacing +timer'
+            ' +(?P<retransmission>(\d+)) +msecs$',
 
-        p23 = re.compile(r'LSA +group +pacing +timer'
-                            ' +(?P<pacing>(\d+)) +secs$')
+        p26=r'EXCHANGE/LOADING +adjacency +limit: +initial'
+            ' +(?P<initial>(\S+)), +process +maximum'
+            ' +(?P<maximum>(\d+))$',
 
-        p24 = re.compile(r'Interface +flood +pacing +timer'
-                            ' +(?P<interface>(\d+)) +msecs$')
+        p27=r'^Number +of +external +LSA +(?P<ext>(\d+))\.'
+            ' +Checksum +Sum +(?P<checksum>(\S+))$',
 
-        p25 = re.compile(r'Retransmission +pacing +timer'
-                            ' +(?P<retransmission>(\d+)) +msecs$')
+        p28=r'^Number +of +opaque +AS +LSA +(?P<opq>(\d+))\.'
+            ' +Checksum +Sum +(?P<checksum>(\S+))$',
 
-        p26 = re.compile(r'EXCHANGE/LOADING +adjacency +limit: +initial'
-                            ' +(?P<initial>(\S+)), +process +maximum'
-                            ' +(?P<maximum>(\d+))$')
+        p29=r'^Number +of +DCbitless +external +and +opaque'
+            ' +AS +LSA +(?P<num>(\d+))$',
 
-        p27 = re.compile(r'^Number +of +external +LSA +(?P<ext>(\d+))\.'
-                            ' +Checksum +Sum +(?P<checksum>(\S+))$')
+        p30=r'^Number +of +DoNotAge +external +and +opaque'
+            ' +AS +LSA +(?P<num>(\d+))$',
 
-        p28 = re.compile(r'^Number +of +opaque +AS +LSA +(?P<opq>(\d+))\.'
-                            ' +Checksum +Sum +(?P<checksum>(\S+))$')
+        p31=r'^Number +of +areas +in +this +router +is'
+            ' +(?P<total_areas>(\d+))\. +(?P<normal>(\d+))'
+            ' +normal +(?P<stub>(\d+)) +stub +(?P<nssa>(\d+))'
+            ' +nssa$',
 
-        p29 = re.compile(r'^Number +of +DCbitless +external +and +opaque'
-                            ' +AS +LSA +(?P<num>(\d+))$')
+        p32=r'Number +of +areas +transit +capable +is'
+            ' +(?P<num>(\d+))$',
 
-        p30 = re.compile(r'^Number +of +DoNotAge +external +and +opaque'
-                            ' +AS +LSA +(?P<num>(\d+))$')
+        p33=r'^Maximum +number +of +non +self-generated +LSA'
+            ' +allowed +(?P<max_lsa>(\d+))$',
 
-        p31 = re.compile(r'^Number +of +areas +in +this +router +is'
-                            ' +(?P<total_areas>(\d+))\. +(?P<normal>(\d+))'
-                            ' +normal +(?P<stub>(\d+)) +stub +(?P<nssa>(\d+))'
-                            ' +nssa$')
+        p33_1=r'^Current +number +of +non +self\-generated +LSA +(?P<max_lsa_current>\d+)$',
 
-        p32 = re.compile(r'Number +of +areas +transit +capable +is'
-                            ' +(?P<num>(\d+))$')
+        p33_2=r'^Threshold +for +warning +message +(?P<max_lsa_threshold_value>\d+)\%$',
 
-        p33 = re.compile(r'^Maximum +number +of +non +self-generated +LSA'
-                            ' +allowed +(?P<max_lsa>(\d+))$')
+        p33_3=r'^Ignore\-time +(?P<max_lsa_ignore_time>\d+) +minutes,'
+              ' +reset\-time +(?P<max_lsa_reset_time>\d+) +minutes$',
 
-        p33_1 = re.compile(r'^Current +number +of +non +self\-generated +LSA +(?P<max_lsa_current>\d+)$')
+        p33_4=r'^Ignore\-count +allowed +(?P<max_lsa_ignore_count>\d+),'
+              ' +current ignore\-count +(?P<max_lsa_current_count>\d+)$',
 
-        p33_2 = re.compile(r'^Threshold +for +warning +message +(?P<max_lsa_threshold_value>\d+)\%$')
+        p33_5=r'^Maximum +limit +of +redistributed +prefixes +(?P<max_lsa_limit>\d+) +\(warning\-only\)$',
 
-        p33_3 = re.compile(r'^Ignore\-time +(?P<max_lsa_ignore_time>\d+) +minutes,'
-                            ' +reset\-time +(?P<max_lsa_reset_time>\d+) +minutes$')
+        p34=r'^External +flood +list +length +(?P<num>(\d+))$',
 
-        p33_4 = re.compile(r'^Ignore\-count +allowed +(?P<max_lsa_ignore_count>\d+),'
-                            ' +current ignore\-count +(?P<max_lsa_current_count>\d+)$')
+        p35=r'^(?P<gr_type>(IETF|Cisco)) +Non-Stop +Forwarding'
+            ' +(?P<enable>(enabled|disabled))$',
 
-        p33_5 = re.compile(r'^Maximum +limit +of +redistributed +prefixes +(?P<max_lsa_limit>\d+) +\(warning\-only\)$')
+        p36=r'^(?P<gr_type>(IETF|Cisco)) +NSF +helper +support'
+            ' +(?P<gr_helper>(enabled|disabled))$',
 
-        p34 = re.compile(r'^External +flood +list +length +(?P<num>(\d+))$')
+        p36_1=r'^restart-interval +limit *: +(?P<num>(\d+)) +sec$',
 
-        p35 = re.compile(r'^(?P<gr_type>(IETF|Cisco)) +Non-Stop +Forwarding'
-                            ' +(?P<enable>(enabled|disabled))$')
+        p37=r'^Reference +bandwidth +unit +is'
+            ' +(?P<bd>(\d+)) +(?P<unit>(mbps))$',
 
-        p36 = re.compile(r'^(?P<gr_type>(IETF|Cisco)) +NSF +helper +support'
-                            ' +(?P<gr_helper>(enabled|disabled))$')
+        p38=r'^Area +(?P<area>(\S+))(?: *\((I|i)nactive\))?$',
 
-        p36_1 = re.compile(r'^restart-interval +limit *: +(?P<num>(\d+)) +sec$')
+        p39_1=r'^It +is +a +(?P<area_type>(\S+)) +area'
+              '(?:, +(?P<summary>(no +summary +LSA +in +this'
+              ' +area)))?$',
 
-        p37 = re.compile(r'^Reference +bandwidth +unit +is'
-                            ' +(?P<bd>(\d+)) +(?P<unit>(mbps))$')
+        p39_2=r'^generates +stub +default +route +with +cost'
+              ' +(?P<default_cost>(\d+))$',
 
-        p38 = re.compile(r'^Area +(?P<area>(\S+))(?: *\((I|i)nactive\))?$')
+        p40_1=r'^Area ranges are$',
 
-        p39_1 = re.compile(r'^It +is +a +(?P<area_type>(\S+)) +area'
-                            '(?:, +(?P<summary>(no +summary +LSA +in +this'
-                            ' +area)))?$')
+        p40_2=r'^(?P<prefix>([0-9\.\/]+)) +(Passive|Active)'
+              '(?:\((?P<cost>(\d+)) +\- +configured\))?'
+              ' +(?P<advertise>(Advertise|DoNotAdvertise))$',
 
-        p39_2 = re.compile(r'^generates +stub +default +route +with +cost'
-                            ' +(?P<default_cost>(\d+))$')
+        p41=r'^Number +of +interfaces +in +this +area +is'
+            ' +(?P<num_intf>(\d+))(?:'
+            ' *\((?P<loopback>(\d+)) +loopback\))?$',
 
-        p40_1 = re.compile(r'^Area ranges are$')
+        p42=r'^Area +has +RRR +enabled$',
 
-        p40_2 = re.compile(r'^(?P<prefix>([0-9\.\/]+)) +(Passive|Active)'
-                            '(?:\((?P<cost>(\d+)) +\- +configured\))?'
-                            ' +(?P<advertise>(Advertise|DoNotAdvertise))$')
+        p43=r'^SPF +algorithm +executed +(?P<count>(\d+))'
+            ' +times$',
 
-        p41 = re.compile(r'^Number +of +interfaces +in +this +area +is'
-                            ' +(?P<num_intf>(\d+))(?:'
-                            ' *\((?P<loopback>(\d+)) +loopback\))?$')
+        p44=r'^SPF +algorithm +last +executed'
+            ' +(?P<last_exec>(\S+)) +ago$',
 
-        p42 = re.compile(r'^Area +has +RRR +enabled$')
+        p45=r'^Area +has +no +authentication$',
 
-        p43 = re.compile(r'^SPF +algorithm +executed +(?P<count>(\d+))'
-                            ' +times$')
+        p46=r'^Number +of +LSA +(?P<lsa_count>(\d+))\.'
+            ' +Checksum +Sum +(?P<checksum_sum>(\S+))$',
 
-        p44 = re.compile(r'^SPF +algorithm +last +executed'
-                            ' +(?P<last_exec>(\S+)) +ago$')
+        p47=r'^Number +of opaque +link +LSA'
+            ' +(?P<opaque_count>(\d+))\. +Checksum +Sum'
+            ' +(?P<checksum_sum>(\S+))$',
 
-        p45 = re.compile(r'^Area +has +no +authentication$')
+        p48=r'^Number +of +DCbitless +LSA +(?P<count>(\d+))$',
 
-        p46 = re.compile(r'^Number +of +LSA +(?P<lsa_count>(\d+))\.'
-                            ' +Checksum +Sum +(?P<checksum_sum>(\S+))$')
+        p49=r'^Number +of +indication +LSA +(?P<count>(\d+))$',
 
-        p47 = re.compile(r'^Number +of opaque +link +LSA'
-                            ' +(?P<opaque_count>(\d+))\. +Checksum +Sum'
-                            ' +(?P<checksum_sum>(\S+))$')
+        p50=r'^Number +of +DoNotAge +LSA +(?P<count>(\d+))$',
 
-        p48 = re.compile(r'^Number +of +DCbitless +LSA +(?P<count>(\d+))$')
+        p51=r'^Flood +list +length +(?P<len>(\d+))$',
 
-        p49 = re.compile(r'^Number +of +indication +LSA +(?P<count>(\d+))$')
+        p52=r'^Non-Stop +Routing +(?P<nsr>(enabled))$',
 
-        p50 = re.compile(r'^Number +of +DoNotAge +LSA +(?P<count>(\d+))$')
+        p53_1=r'^BFD +is +enabled +in +strict +mode$',
 
-        p51 = re.compile(r'^Flood +list +length +(?P<len>(\d+))$')
+        p53_2=r'^BFD +is +enabled$',
+    )
 
-        p52 = re.compile(r'^Non-Stop +Routing +(?P<nsr>(enabled))$')
+    def cli(self, output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
 
-        p53_1 = re.compile(r'^BFD +is +enabled +in +strict +mode$')
+        # Init vars
+        ret_dict = {}
+        af = 'ipv4' # this is ospf - always ipv4
 
-        p53_2 = re.compile(r'^BFD +is +enabled$')
+        p = ShowIpOspf.patterns
+
+        p14_2 = re.compile(r'^Condition:'
+                            ' +(?P<condition>(always|on \S+))'
+                            '(?: +for +(?P<seconds>(\d+)) +seconds,)?'
+                            ' +State: +(?P<state>(\S+))$')
 
         for line in out.splitlines():
             line = line.strip()
 
             # Routing Process "ospf 1" with ID 10.36.3.3
             # VRF VRF1 in Routing Process "ospf 1" with ID 10.36.3.3
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 instance = str(m.groupdict()['instance'])
                 router_id = str(m.groupdict()['router_id'])
@@ -604,64 +613,64 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Routing Process is shutdown
-            m = p1_1.match(line)
+            m = p.p1_1.match(line)
             if m:
                 sub_dict['enable'] = False
                 continue
 
             # Domain ID type 0x0005, value 0.0.0.2
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 sub_dict['domain_id_type'] = str(m.groupdict()['domain_id'])
                 sub_dict['domain_id_value'] = str(m.groupdict()['value'])
                 continue
 
             # Start time: 00:23:49.050, Time elapsed: 1d01h
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 sub_dict['start_time'] = str(m.groupdict()['start'])
                 sub_dict['elapsed_time'] = str(m.groupdict()['elapsed'])
                 continue
 
             # Supports only single TOS(TOS0) routes
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 sub_dict['single_tos_route'] = True
                 continue
 
             # Supports opaque LSA
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 sub_dict['opqaue_lsa'] = True
                 continue
 
             # Supports Link-local Signaling (LLS)
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 sub_dict['lls'] = True
                 continue
 
             # Supports area transit capability
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 sub_dict['area_transit'] = True
                 continue
 
             # Supports NSSA (compatible with RFC 3101)
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 sub_dict['nssa'] = True
                 continue
 
             # Supports Database Exchange Summary List Optimization (RFC 5243)
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 sub_dict['db_exchange_summary_list_optimization'] = True
                 continue
 
             # Event-log disabled
             # Event-log enabled, Maximum number of events: 1000, Mode: cyclic
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 if 'event_log' not in sub_dict:
                     sub_dict['event_log'] = {}
@@ -679,7 +688,7 @@ class ShowIpOspf(ShowIpOspfSchema):
             # It is an area border router
             # It is an autonomous system boundary router
             # It is an area border and autonomous system boundary router
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 if 'flags' not in sub_dict:
                     sub_dict['flags'] = {}
@@ -690,7 +699,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Redistributing External Routes from,
-            m = p12_1.match(line)
+            m = p.p12_1.match(line)
             if m:
                 if 'redistribution' not in sub_dict:
                     sub_dict['redistribution'] = {}
@@ -700,7 +709,7 @@ class ShowIpOspf(ShowIpOspfSchema):
             # connected with metric mapped to 10
             # static
             # static with metric mapped to 10
-            m = p12_2.match(line)
+            m = p.p12_2.match(line)
             if m:
                 the_type = str(m.groupdict()['type'])
                 if the_type not in sub_dict['redistribution']:
@@ -714,7 +723,7 @@ class ShowIpOspf(ShowIpOspfSchema):
             # connected, includes subnets in redistribution
             # static, includes subnets in redistribution
             # isis, includes subnets in redistribution
-            m = p12_2_1.match(line)
+            m = p.p12_2_1.match(line)
             if m:
                 the_type = str(m.groupdict()['type'])
                 if the_type not in sub_dict['redistribution']:
@@ -727,7 +736,7 @@ class ShowIpOspf(ShowIpOspfSchema):
             # isis 10 with metric mapped to 3333
             # bgp 100 with metric mapped to 100, includes subnets in redistribution, nssa areas only
             # bgp 100, includes subnets in redistribution
-            m = p12_3.match(line)
+            m = p.p12_3.match(line)
             if m:
                 prot = str(m.groupdict()['prot'])
                 if prot not in sub_dict['redistribution']:
@@ -752,7 +761,7 @@ class ShowIpOspf(ShowIpOspfSchema):
 
             # Maximum number of redistributed prefixes 4000
             # Maximum number of redistributed prefixes 3000 (warning-only)
-            m = p12_4.match(line)
+            m = p.p12_4.match(line)
             if m:
                 if 'max_prefix' not in sub_dict['redistribution']:
                     sub_dict['redistribution']['max_prefix'] = {}
@@ -765,7 +774,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                     continue
 
             # Threshold for warning message 70%
-            m = p12_5.match(line)
+            m = p.p12_5.match(line)
             if m:
                 if 'max_prefix' not in sub_dict['redistribution']:
                     sub_dict['redistribution']['max_prefix'] = {}
@@ -774,7 +783,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Router is not originating router-LSAs with maximum metric
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 if 'stub_router' not in sub_dict:
                     sub_dict['stub_router'] = {}
@@ -788,7 +797,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Originating router-LSAs with maximum metric
-            m = p14_1.match(line)
+            m = p.p14_1.match(line)
             if m:
                 if 'stub_router' not in sub_dict:
                     sub_dict['stub_router'] = {}
@@ -821,13 +830,13 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Advertise stub links with maximum metric in router-LSAs
-            m = p14_3.match(line)
+            m = p.p14_3.match(line)
             if m:
                 sub_dict['stub_router'][condition]['include_stub'] = True
                 continue
 
             # Advertise summary-LSAs with metric 16711680
-            m = p14_4.match(line)
+            m = p.p14_4.match(line)
             if m:
                 sub_dict['stub_router'][condition]['summary_lsa'] = True
                 sub_dict['stub_router'][condition]['summary_lsa_metric'] = \
@@ -835,7 +844,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Advertise external-LSAs with metric 16711680
-            m = p14_5.match(line)
+            m = p.p14_5.match(line)
             if m:
                 sub_dict['stub_router'][condition]['external_lsa'] = True
                 sub_dict['stub_router'][condition]['external_lsa_metric'] = \
@@ -843,7 +852,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Initial SPF schedule delay 50 msecs
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 start = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -856,7 +865,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Minimum hold time between two consecutive SPFs 200 msecs
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 hold = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -869,7 +878,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Maximum wait time between two consecutive SPFs 5000 msecs
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 maximum = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -882,7 +891,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Initial LSA throttle delay 50 msecs
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 start = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -895,7 +904,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Minimum hold time for LSA throttle 200 msecs
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 hold = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -908,7 +917,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Maximum wait time for LSA throttle 5000 msecs
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 maximum = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -922,7 +931,7 @@ class ShowIpOspf(ShowIpOspfSchema):
 
             # Minimum LSA interval 200 msecs. Minimum LSA arrival 100 msecs
             # Minimum LSA arrival 100 msecs
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 if 'lsa' not in sub_dict['spf_control']['throttle']:
                     sub_dict['spf_control']['throttle']['lsa'] = {}
@@ -931,7 +940,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Incremental-SPF disabled
-            m = p22.match(line)
+            m = p.p22.match(line)
             if m:
                 if 'spf_control' not in sub_dict:
                     sub_dict['spf_control'] = {}
@@ -942,28 +951,28 @@ class ShowIpOspf(ShowIpOspfSchema):
                     continue
 
             # LSA group pacing timer 240 secs
-            m = p23.match(line)
+            m = p.p23.match(line)
             if m:
                 sub_dict['lsa_group_pacing_timer'] = \
                     int(float(m.groupdict()['pacing']))
                 continue
 
             # Interface flood pacing timer 33 msecs
-            m = p24.match(line)
+            m = p.p24.match(line)
             if m:
                 sub_dict['interface_flood_pacing_timer'] = \
                     int(float(m.groupdict()['interface']))
                 continue
 
             # Retransmission pacing timer 66 msecs
-            m = p25.match(line)
+            m = p.p25.match(line)
             if m:
                 sub_dict['retransmission_pacing_timer'] = \
                     int(float(m.groupdict()['retransmission']))
                 continue
 
             # EXCHANGE/LOADING adjacency limit: initial 300, process maximum 300
-            m = p26.match(line)
+            m = p.p26.match(line)
             if m:
                 if 'adjacency_stagger' not in sub_dict:
                     sub_dict['adjacency_stagger'] = {}
@@ -977,7 +986,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of external LSA 1. Checksum Sum 0x00607f
-            m = p27.match(line)
+            m = p.p27.match(line)
             if m:
                 if 'numbers' not in sub_dict:
                     sub_dict['numbers'] = {}
@@ -987,7 +996,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of opaque AS LSA 0. Checksum Sum 00000000
-            m = p28.match(line)
+            m = p.p28.match(line)
             if m:
                 if 'numbers' not in sub_dict:
                     sub_dict['numbers'] = {}
@@ -997,7 +1006,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of DCbitless external and opaque AS LSA 0
-            m = p29.match(line)
+            m = p.p29.match(line)
             if m:
                 if 'numbers' not in sub_dict:
                     sub_dict['numbers'] = {}
@@ -1005,7 +1014,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of DoNotAge external and opaque AS LSA 0
-            m = p30.match(line)
+            m = p.p30.match(line)
             if m:
                 if 'numbers' not in sub_dict:
                     sub_dict['numbers'] = {}
@@ -1013,7 +1022,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of areas in this router is 1. 1 normal 0 stub 0 nssa
-            m = p31.match(line)
+            m = p.p31.match(line)
             if m:
                 sub_dict['total_areas'] = int(m.groupdict()['total_areas'])
                 sub_dict['total_normal_areas'] = int(m.groupdict()['normal'])
@@ -1022,13 +1031,13 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of areas transit capable is 0
-            m = p32.match(line)
+            m = p.p32.match(line)
             if m:
                 sub_dict['total_areas_transit_capable'] = int(m.groupdict()['num'])
                 continue
 
             # Maximum number of non self-generated LSA allowed 123
-            m = p33.match(line)
+            m = p.p33.match(line)
             if m:
                 if 'database_control' not in sub_dict:
                     sub_dict['database_control'] = {}
@@ -1037,7 +1046,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Current number of non self-generated LSA 0
-            m = p33_1.match(line)
+            m = p.p33_1.match(line)
             if m:
                 if 'database_control' not in sub_dict:
                     sub_dict['database_control'] = {}
@@ -1046,7 +1055,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Threshold for warning message 75%
-            m = p33_2.match(line)
+            m = p.p33_2.match(line)
             if m:
                 if 'database_control' not in sub_dict:
                     sub_dict['database_control'] = {}
@@ -1055,7 +1064,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Ignore-time 5 minutes, reset-time 10 minutes
-            m = p33_3.match(line)
+            m = p.p33_3.match(line)
             if m:
                 if 'database_control' not in sub_dict:
                     sub_dict['database_control'] = {}
@@ -1066,7 +1075,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Ignore-count allowed 5, current ignore-count 0
-            m = p33_4.match(line)
+            m = p.p33_4.match(line)
             if m:
                 if 'database_control' not in sub_dict:
                     sub_dict['database_control'] = {}
@@ -1077,7 +1086,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Maximum limit of redistributed prefixes 5000 (warning-only)
-            m = p33_5.match(line)
+            m = p.p33_5.match(line)
             if m:
                 if 'database_control' not in sub_dict:
                     sub_dict['database_control'] = {}
@@ -1086,14 +1095,14 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # External flood list length 0
-            m = p34.match(line)
+            m = p.p34.match(line)
             if m:
                 sub_dict['external_flood_list_length'] = int(m.groupdict()['num'])
                 continue
 
             # Non-Stop Forwarding enabled
             # IETF Non-Stop Forwarding enabled
-            m = p35.match(line)
+            m = p.p35.match(line)
             if m:
                 gr_type = str(m.groupdict()['gr_type']).lower()
                 if 'enabled' in m.groupdict()['enable']:
@@ -1110,7 +1119,7 @@ class ShowIpOspf(ShowIpOspfSchema):
 
             # IETF NSF helper support enabled
             # Cisco NSF helper support enabled
-            m = p36.match(line)
+            m = p.p36.match(line)
             if m:
                 gr_type = str(m.groupdict()['gr_type']).lower()
                 if 'enabled' in m.groupdict()['gr_helper']:
@@ -1129,7 +1138,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # restart-interval limit: 11 sec
-            m = p36_1.match(line)
+            m = p.p36_1.match(line)
             if m:
                 sub_dict['graceful_restart'][gr_type]['restart_interval'] = \
                     int(m.groupdict()['num'])
@@ -1137,7 +1146,7 @@ class ShowIpOspf(ShowIpOspfSchema):
 
             # Reference bandwidth unit is 100 mbps
             # Reference bandwidth unit is 4294967 mbps
-            m = p37.match(line)
+            m = p.p37.match(line)
             if m:
                 bd = int(m.groupdict()['bd'])
                 if 'auto_cost' not in sub_dict:
@@ -1154,7 +1163,7 @@ class ShowIpOspf(ShowIpOspfSchema):
             # Area BACKBONE(0)
             # Area BACKBONE(0.0.0.0) (Inactive)
             # Area 1
-            m = p38.match(line)
+            m = p.p38.match(line)
             if m:
                 parsed_area = str(m.groupdict()['area'])
                 n = re.match('BACKBONE\((?P<area_num>(\S+))\)', parsed_area)
@@ -1177,7 +1186,7 @@ class ShowIpOspf(ShowIpOspfSchema):
             # It is a stub area
             # It is a stub area, no summary LSA in this area
             # It is a NSSA area
-            m = p39_1.match(line)
+            m = p.p39_1.match(line)
             if m:
                 area_type = str(m.groupdict()['area_type']).lower()
                 sub_dict['areas'][area]['area_type'] = area_type
@@ -1190,14 +1199,14 @@ class ShowIpOspf(ShowIpOspfSchema):
 
             # generates stub default route with cost 111
             # generates stub default route with cost 222
-            m = p39_2.match(line)
+            m = p.p39_2.match(line)
             if m:
                 sub_dict['areas'][area]['default_cost'] = \
                     int(m.groupdict()['default_cost'])
                 continue
 
             # Area ranges are
-            m = p40_1.match(line)
+            m = p.p40_1.match(line)
             if m:
                 if 'ranges' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['ranges'] = {}
@@ -1206,7 +1215,7 @@ class ShowIpOspf(ShowIpOspfSchema):
             # 10.4.1.0/24 Passive Advertise
             # 10.4.0.0/16 Passive DoNotAdvertise 
             # 10.4.0.0/16 Active(10 - configured) Advertise
-            m = p40_2.match(line)
+            m = p.p40_2.match(line)
             if m:
                 prefix = str(m.groupdict()['prefix'])
                 if 'ranges' not in sub_dict['areas'][area]:
@@ -1225,7 +1234,7 @@ class ShowIpOspf(ShowIpOspfSchema):
 
             # Number of interfaces in this area is 3
             # Number of interfaces in this area is 3 (1 loopback)
-            m = p41.match(line)
+            m = p.p41.match(line)
             if m:
                 if 'areas' not in sub_dict:
                     sub_dict['areas'] = {}
@@ -1241,13 +1250,13 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Area has RRR enabled
-            m = p42.match(line)
+            m = p.p42.match(line)
             if m:
                 sub_dict['areas'][area]['rrr_enabled'] = True
                 continue
 
             # SPF algorithm executed 26 times
-            m = p43.match(line)
+            m = p.p43.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -1256,7 +1265,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # SPF algorithm last executed 00:19:54.849 ago
-            m = p44.match(line)
+            m = p.p44.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -1265,12 +1274,12 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Area has no authentication
-            m = p45.match(line)
+            m = p.p45.match(line)
             if m:
                 continue
 
             # Number of LSA 19.  Checksum Sum 0x0a2fb5
-            m = p46.match(line)
+            m = p.p46.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -1282,7 +1291,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of opaque link LSA 0.  Checksum Sum 00000000
-            m = p47.match(line)
+            m = p.p47.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -1295,7 +1304,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of DCbitless LSA 5
-            m = p48.match(line)
+            m = p.p48.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -1304,7 +1313,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of indication LSA 0
-            m = p49.match(line)
+            m = p.p49.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -1313,7 +1322,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of DoNotAge LSA 0
-            m = p50.match(line)
+            m = p.p50.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -1322,7 +1331,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Flood list length 0
-            m = p51.match(line)
+            m = p.p51.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -1331,13 +1340,13 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
         
             # Non-Stop Routing enabled
-            m = p52.match(line)
+            m = p.p52.match(line)
             if m:
                 sub_dict['nsr']['enable'] = True
                 continue
 
             # BFD is enabled in strict mode
-            m = p53_1.match(line)
+            m = p.p53_1.match(line)
             if m:
                 if 'bfd' not in sub_dict:
                     sub_dict['bfd'] = {}
@@ -1346,7 +1355,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # BFD is enabled
-            m = p53_2.match(line)
+            m = p.p53_2.match(line)
             if m:
                 if 'bfd' not in sub_dict:
                     sub_dict['bfd'] = {}
@@ -1390,6 +1399,12 @@ class ShowIpOspfInterfaceBrief(ShowIpOspfInterfaceBriefSchema):
 
     cli_command = 'show ip ospf interface brief'
 
+    patterns = Patterns(
+        p1=r'^(?P<interface>\S+) +(?P<instance>\S+) +(?P<area>\d+) +'
+           '(?P<address>\S+) +(?P<cost>\d+) +(?P<state>\S+) +(?P<nbrs_full>\d+)'
+           '\/(?P<nbrs_count>\d+)$$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -1399,13 +1414,11 @@ class ShowIpOspfInterfaceBrief(ShowIpOspfInterfaceBriefSchema):
         # Init vars
         ret_dict = {}
         
-        p1 = re.compile(r'^(?P<interface>\S+) +(?P<instance>\S+) +(?P<area>\d+) +'
-            '(?P<address>\S+) +(?P<cost>\d+) +(?P<state>\S+) +(?P<nbrs_full>\d+)'
-            '\/(?P<nbrs_count>\d+)$$')
+        p = ShowIpOspfInterfaceBrief.patterns
 
         for line in out.splitlines():
             line = line.strip()
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 interface = Common.convert_intf_name(
@@ -1764,161 +1777,165 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
         'max_flood_scan_length', 'max_flood_scan_time_msec', 'state']
 
 
-    def cli(self, interface=None, output=None):
-        if output is None:
-            if interface:
-                cmd = self.cli_command[0].format(interface=interface)
-            else:
-                cmd = self.cli_command[1]
+    patterns = Patterns(
+        p1=r'^(?P<interface>(\S+)) +is( +administratively)?'
+           ' +(?P<enable>(unknown|up|down)), +line +protocol'
+           ' +is +(?P<line_protocol>(up|down))'
+           '(?: +\(\S+\))?$',
 
-            out = self.device.execute(cmd)
-        else:
-            out = output
-        
+        p2=r'^Internet +Address +(?P<address>(\S+)),'
+           '(?: +Interface +ID +(?P<intf_id>(\d+)),)?'
+           ' +Area +(?P<area>(\S+))(?:, +Attached +via'
+           ' +(?P<attach>(.*)))?$',
 
-        # Init vars
-        ret_dict = {}
-        af = 'ipv4' # this is ospf - always ipv4
+        p2_1=r'^Attached +via +(?P<attached>([a-zA-Z0-9\s]+))$',
 
-        # Mapping dict
-        bool_dict = {'up': True, 'down': False, 'unknown': False}
+        p3=r'^Process +ID +(?P<pid>(\S+)),'
+           '(?: +VRF +(?P<vrf>(\S+)))?'
+           ' +Router +ID +(?P<router_id>(\S+)),'
+           ' +Network +Type +(?P<interface_type>(\S+)),'
+           ' +Cost: +(?P<cost>(\d+))$',
 
-        
-        p1 = re.compile(r'^(?P<interface>(\S+)) +is( +administratively)?'
-                            ' +(?P<enable>(unknown|up|down)), +line +protocol'
-                            ' +is +(?P<line_protocol>(up|down))'
-                            '(?: +\(\S+\))?$')
- 
-        p2 = re.compile(r'^Internet +Address +(?P<address>(\S+)),'
-                            '(?: +Interface +ID +(?P<intf_id>(\d+)),)?'
-                            ' +Area +(?P<area>(\S+))(?:, +Attached +via'
-                            ' +(?P<attach>(.*)))?$')
- 
-        p2_1 = re.compile(r'^Attached +via +(?P<attached>([a-zA-Z0-9\s]+))$')
- 
-        p3 = re.compile(r'^Process +ID +(?P<pid>(\S+)),'
-                            '(?: +VRF +(?P<vrf>(\S+)))?'
-                            ' +Router +ID +(?P<router_id>(\S+)),'
-                            ' +Network +Type +(?P<interface_type>(\S+)),'
-                            ' +Cost: +(?P<cost>(\d+))$')
+        p5=r'^Configured as demand circuit$',
 
-        p5 = re.compile(r'^Configured as demand circuit$')
- 
-        p6 = re.compile(r'^Run as demand circuit$')
- 
-        p7 = re.compile(r'^DoNotAge +LSA +not +allowed +\(Number +of'
-                            ' +DCbitless +LSA +is +(?P<num>(\d+))\)\.$')
- 
-        p8 = re.compile(r'^Enabled +by +interface +config, +including'
-                            ' +secondary +ip +addresses$')
- 
-        p9 = re.compile(r'^Transmit +Delay is +(?P<delay>(\d+)) +sec,'
-                            ' +State +(?P<state>(\S+))'
-                            '(?:, +Priority +(?P<priority>(\d+)))?'
-                            '(?:, +BFD +(?P<bfd>(enabled|disabled)))?$')
- 
-        p10 = re.compile(r'^Designated +(R|r)outer +\(ID\)'
-                            ' +(?P<dr_router_id>(\S+)), +(I|i)nterface'
-                            ' +(A|a)ddress +(?P<dr_ip_addr>(\S+))$')
- 
-        p11 = re.compile(r'^Backup +(D|d)esignated +(R|r)outer +\(ID\)'
-                            ' +(?P<bdr_router_id>(\S+)), +(I|i)nterface'
-                            ' +(A|a)ddress +(?P<bdr_ip_addr>(\S+))$')
- 
-        p12 = re.compile(r'^Timer +intervals +configured,'
-                            ' +Hello +(?P<hello>(\d+)),'
-                            ' +Dead +(?P<dead>(\d+)),'
-                            ' +Wait +(?P<wait>(\d+)),'
-                            ' +Retransmit +(?P<retransmit>(\d+))$')
- 
-        p12_1 = re.compile(r'^oob-resync +timeout +(?P<oob>(\d+))$')
- 
-        p12_2 = re.compile(r'^Hello +due +in +(?P<hello_timer>(\S+))$')
- 
-        p13 = re.compile(r'^Supports +Link-local +Signaling +\(LLS\)$')
- 
-        p14 = re.compile(r'^(?P<gr_type>(Cisco|IETF)) +NSF +helper +support'
-                            ' +(?P<helper>(enabled|disabled))$')
- 
-        p15 = re.compile(r'^Index +(?P<index>(\S+)),'
-                            ' +flood +queue +length +(?P<length>(\d+))$')
- 
-        p16 = re.compile(r'^Next +(?P<next>(\S+))$')
- 
-        p17 = re.compile(r'^Last +flood +scan +length +is +(?P<num>(\d+)),'
-                            ' +maximum +is +(?P<max>(\d+))$')
- 
-        p18 = re.compile(r'^Last +flood +scan +time +is +(?P<time1>(\d+))'
-                            ' +msec, +maximum +is +(?P<time2>(\d+)) +msec$')
- 
-        p19 = re.compile(r'^Neighbor +Count +is +(?P<nbr_count>(\d+)),'
-                            ' +Adjacent +neighbor +count +is'
-                            ' +(?P<adj_nbr_count>(\d+))$')
- 
-        p20_1 = re.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
-                            ' +\((B|b)ackup +(D|d)esignated +(R|r)outer\)$')
- 
-        p20_2 = re.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
-                            ' +\((D|d)esignated +(R|r)outer\)$')
- 
-        p20_3 = re.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
-                            ' +\(Hello suppressed\)$')
- 
-        p21 = re.compile(r'^Suppress +hello +for +(?P<sup>(\d+))'
-                            ' +neighbor\(s\)$')
- 
-        p22 = re.compile(r'^Loopback +interface +is +treated +as +a +stub'
-                            ' +Host$')
- 
-        p23 = re.compile(r'^Can +be +protected +by per-+prefix +Loop-Free'
-                            ' +FastReroute$')
- 
-        p24 = re.compile(r'^Can +be +used +for +per-prefix +Loop-Free'
-                            ' +FastReroute +repair +paths$')
- 
-        p25 = re.compile(r'^Not +Protected +by +per-prefix +TI-LFA$')
- 
-        p26 = re.compile(r'^Prefix-suppression +is +(?P<ps>(enabled|disabled))$')
- 
-        p27 = re.compile(r'^Strict +TTL +checking'
-                            ' +(?P<strict_ttl>(enabled|disabled))'
-                            '(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$')
- 
-        p28_1 = re.compile(r'^Simple +password +authentication +enabled$')
- 
-        p28_2 = re.compile(r'^Cryptographic +authentication +enabled$')
- 
-        p28_3 = re.compile(r'^Youngest +key +id +is +(?P<id>(\d+))$')
- 
-        p28_4 = re.compile(r'^Rollover +in +progress, +(?P<num>(\d+))'
-                            ' +neighbor(s) +using +the +old +key(s):$')
- 
-        p28_5 = re.compile(r'^key +id +1 +algorithm +MD5$')
+        p6=r'^Run as demand circuit$',
+
+        p7=r'^DoNotAge +LSA +not +allowed +\(Number +of'
+           ' +DCbitless +LSA +is +(?P<num>(\d+))\)\.$',
+
+        p8=r'^Enabled +by +interface +config, +including'
+           ' +secondary +ip +addresses$',
+
+        p9=r'^Transmit +Delay is +(?P<delay>(\d+)) +sec,'
+           ' +State +(?P<state>(\S+))'
+           '(?:, +Priority +(?P<priority>(\d+)))?'
+           '(?:, +BFD +(?P<bfd>(enabled|disabled)))?$',
+
+        p10=r'^Designated +(R|r)outer +\(ID\)'
+            ' +(?P<dr_router_id>(\S+)), +(I|i)nterface'
+            ' +(A|a)ddress +(?P<dr_ip_addr>(\S+))$',
+
+        p11=r'^Backup +(D|d)esignated +(R|r)outer +\(ID\)'
+            ' +(?P<bdr_router_id>(\S+)), +(I|i)nterface'
+            ' +(A|a)ddress +(?P<bdr_ip_addr>(\S+))$',
+
+        p12=r'^Timer +intervals +configured,'
+            ' +Hello +(?P<hello>(\d+)),'
+            ' +Dead +(?P<dead>(\d+)),'
+            ' +Wait +(?P<wait>(\d+)),'
+            ' +Retransmit +(?P<retransmit>(\d+))$',
+
+        p12_1=r'^oob-resync +timeout +(?P<oob>(\d+))$',
+
+        p12_2=r'^Hello +due +in +(?P<hello_timer>(\S+))$',
+
+        p13=r'^Supports +Link-local +Signaling +\(LLS\)$',
+
+        p14=r'^(?P<gr_type>(Cisco|IETF)) +NSF +helper +support'
+            ' +(?P<helper>(enabled|disabled))$',
+
+        p15=r'^Index +(?P<index>(\S+)),'
+            ' +flood +queue +length +(?P<length>(\d+))$',
+
+        p16=r'^Next +(?P<next>(\S+))$',
+
+        p17=r'^Last +flood +scan +length +is +(?P<num>(\d+)),'
+            ' +maximum +is +(?P<max>(\d+))$',
+
+        p18=r'^Last +flood +scan +time +is +(?P<time1>(\d+))'
+            ' +msec, +maximum +is +(?P<time2>(\d+)) +msec$',
+
+        p19=r'^Neighbor +Count +is +(?P<nbr_count>(\d+)),'
+            ' +Adjacent +neighbor +count +is'
+            ' +(?P<adj_nbr_count>(\d+))$',
+
+        p20_1=r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
+              ' +\((B|b)ackup +(D|d)esignated +(R|r)outer\)$',
+
+        p20_2=r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
+              ' +\((D|d)esignated +(R|r)outer\)$',
+
+        p20_3=r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
+              ' +\(Hello suppressed\)$',
+
+        p21=r'^Suppress +hello +for +(?P<sup>(\d+))'
+            ' +neighbor\(s\)$',
+
+        p22=r'^Loopback +interface +is +treated +as +a +stub'
+            ' +Host$',
+
+        p23=r'^Can +be +protected +by per-+prefix +Loop-Free'
+            ' +FastReroute$',
+
+        p24=r'^Can +be +used +for +per-prefix +Loop-Free'
+            ' +FastReroute +repair +paths$',
+
+        p25=r'^Not +Protected +by +per-prefix +TI-LFA$',
+
+        p26=r'^Prefix-suppression +is +(?P<ps>(enabled|disabled))$',
+
+        p27=r'^Strict +TTL +checking'
+            ' +(?P<strict_ttl>(enabled|disabled))'
+            '(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$',
+
+        p28_1=r'^Simple +password +authentication +enabled$',
+
+        p28_2=r'^Cryptographic +authentication +enabled$',
+
+        p28_3=r'^Youngest +key +id +is +(?P<id>(\d+))$',
+
+        p28_4=r'^Rollover +in +progress, +(?P<num>(\d+))'
+              ' +neighbor(s) +using +the +old +key(s):$',
+
+        p28_5=r'^key +id +1 +algorithm +MD5$',
 
         # Segment Routing enabled for MPLS forwarding
-        p29 = re.compile(r'^Segment +Routing +enabled +for +MPLS +forwarding$')
+        p29=r'^Segment +Routing +enabled +for +MPLS +forwarding$',
 
         # TEAPP:
-        p30 = re.compile(r'^TEAPP:$')
+        p30=r'^TEAPP:$',
 
         # Topology Id:0x0
-        p30_1 = re.compile(r'^Topology +Id: *(?P<topology_id>[\w]+)$')
+        p30_1=r'^Topology +Id: *(?P<topology_id>[\w]+)$',
 
         # TEAPP:SRTE
-        p30_2 = re.compile(r'^TEAPP: *(?P<teapp>[\w]+)$')
+        p30_2=r'^TEAPP: *(?P<teapp>[\w]+)$',
 
         # Affinity: length 32, bits 0x00000010
-        p30_3 = re.compile(r'^Affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$')
+        p30_3=r'^Affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$',
 
         # Extended affinity: length 32, bits 0x00000010
-        p30_4 = re.compile(r'^Extended +affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$')
+        p30_4=r'^Extended +affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$',
 
         # SR Policy Manager:
-        p31 = re.compile(r'^SR +Policy +Manager:$')
+        p31=r'^SR +Policy +Manager:$',
 
         # TE Opaque LSA: Source of link information OSPF
-        p31_1 = re.compile(r'^TE +Opaque +LSA: +(?P<te_opaque_lsa>[\S\s]+)$')
+        p31_1=r'^TE +Opaque +LSA: +(?P<te_opaque_lsa>[\S\s]+)$',
+    )
+
+    def cli(self, interface=None, output=None):
+        if output is None:
+            if interface:
+                cmd = self.cli_command[0].format(interface=interface)
+            else:
+                cmd = self.cli_command[1]
 
+            out = self.device.execute(cmd)
+        else:
+            out = output
+        
+
+        # Init vars
+        ret_dict = {}
+        af = 'ipv4' # this is ospf - always ipv4
+
+        # Mapping dict
+        bool_dict = {'up': True, 'down': False, 'unknown': False}
+
+        
+        regex = ShowIpOspfInterface.patterns
+ 
         for line in out.splitlines():
             line = line.strip()
 
@@ -1931,7 +1948,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
             # TenGigabitEthernet1/8 is down, line protocol is down (notconnect)
             # TenGigabitEthernet2/6.3052 is administratively down, line protocol is down (disabled)
             # TenGigabitEthernet1/15 is down, line protocol is down (err-disabled)
-            m = p1.match(line)
+            m = regex.p1.match(line)
             if m:
                 interface = str(m.groupdict()['interface'])
                 enable = str(m.groupdict()['enable'])
@@ -1956,7 +1973,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
             # Internet Address 10.4.1.1/32, Interface ID 11, Area 0
             # Internet Address 0.0.0.0/0, Area 0, Attached via Not Attached
             # Internet Address 10.229.4.4/24, Area 1, Attached via Interface Enable
-            m = p2.match(line)
+            m = regex.p2.match(line)
             if m:
                 ip_address = str(m.groupdict()['address'])
                 area = str(IPAddress(str(m.groupdict()['area'])))
@@ -1967,7 +1984,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
 
             # Attached via Interface Enable
-            m = p2_1.match(line)
+            m = regex.p2_1.match(line)
             if m:
                 attached = str(m.groupdict()['attached']).lower()
                 continue
@@ -1975,7 +1992,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
             # Process ID 1, Router ID 10.64.4.4, Network Type VIRTUAL_LINK, Cost: 1
             # Process ID 2, Router ID 10.229.11.11, Network Type SHAM_LINK, Cost: 111
             # Process ID 1, Router ID 10.4.1.1, Network Type BROADCAST, Cost: 1
-            m = p3.match(line)
+            m = regex.p3.match(line)
             if m:
                 instance = str(m.groupdict()['pid'])
                 router_id = str(m.groupdict()['router_id'])
@@ -2201,26 +2218,26 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                     continue
 
             # Configured as demand circuit
-            m = p5.match(line)
+            m = regex.p5.match(line)
             if m:
                 sub_dict['demand_circuit'] = True
                 continue
 
             # Run as demand circuit
-            m = p6.match(line)
+            m = regex.p6.match(line)
             if m:
                 sub_dict['demand_circuit'] = True
                 continue
 
             # DoNotAge LSA not allowed (Number of DCbitless LSA is 1).
-            m = p7.match(line)
+            m = regex.p7.match(line)
             if m:
                 sub_dict['donotage_lsa'] = False
                 sub_dict['total_dcbitless_lsa'] = int(m.groupdict()['num'])
                 continue
 
             # Enabled by interface config, including secondary ip addresses
-            m = p8.match(line)
+            m = regex.p8.match(line)
             if m:
                 sub_dict['if_cfg'] = True
                 continue
@@ -2228,7 +2245,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
             # Transmit Delay is 1 sec, State POINT_TO_POINT
             # Transmit Delay is 1 sec, State DR, Priority 1
             # Transmit Delay is 1 sec, State DR, Priority 111, BFD enabled
-            m = p9.match(line)
+            m = regex.p9.match(line)
             if m:
                 sub_dict['transmit_delay'] = int(m.groupdict()['delay'])
                 state = str(m.groupdict()['state']).lower()
@@ -2246,21 +2263,21 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                         continue
 
             # Designated Router (ID) 10.36.3.3, Interface address 10.2.3.3
-            m = p10.match(line)
+            m = regex.p10.match(line)
             if m:
                 sub_dict['dr_router_id'] = str(m.groupdict()['dr_router_id'])
                 sub_dict['dr_ip_addr'] = str(m.groupdict()['dr_ip_addr'])
                 continue
 
             # Backup Designated router (ID) 10.16.2.2, Interface address 10.2.3.2
-            m = p11.match(line)
+            m = regex.p11.match(line)
             if m:
                 sub_dict['bdr_router_id'] = str(m.groupdict()['bdr_router_id'])
                 sub_dict['bdr_ip_addr'] = str(m.groupdict()['bdr_ip_addr'])
                 continue
 
             # Timer intervals configured, Hello 10, Dead 40, Wait 40, Retransmit 5
-            m = p12.match(line)
+            m = regex.p12.match(line)
             if m:
                 sub_dict['hello_interval'] = int(m.groupdict()['hello'])
                 sub_dict['dead_interval'] = int(m.groupdict()['dead'])
@@ -2269,27 +2286,27 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
 
             #  oob-resync timeout 40
-            m = p12_1.match(line)
+            m = regex.p12_1.match(line)
             if m:
                 sub_dict['oob_resync_timeout'] = int(m.groupdict()['oob'])
                 continue
             
             # Hello due in 00:00:00
-            m = p12_2.match(line)
+            m = regex.p12_2.match(line)
             if m:
                 sub_dict['passive'] = False
                 sub_dict['hello_timer'] = str(m.groupdict()['hello_timer'])
                 continue
 
             # Supports Link-local Signaling (LLS)
-            m = p13.match(line)
+            m = regex.p13.match(line)
             if m:
                 sub_dict['lls'] = True
                 continue
             
             # Cisco NSF helper support enabled
             # IETF NSF helper support enabled
-            m = p14.match(line)
+            m = regex.p14.match(line)
             if m:
                 gr_type = str(m.groupdict()['gr_type']).lower()
                 if 'graceful_restart' not in sub_dict:
@@ -2304,27 +2321,27 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
 
             # Index 2/2, flood queue length 0
-            m = p15.match(line)
+            m = regex.p15.match(line)
             if m:
                 sub_dict['index'] = str(m.groupdict()['index'])
                 sub_dict['flood_queue_length'] = int(m.groupdict()['length'])
                 continue
 
             # Next 0(0)/0(0)
-            m = p16.match(line)
+            m = regex.p16.match(line)
             if m:
                 sub_dict['next'] = str(m.groupdict()['next'])
                 continue
 
             # Last flood scan length is 0, maximum is 11
-            m = p17.match(line)
+            m = regex.p17.match(line)
             if m:
                 sub_dict['last_flood_scan_length'] = int(m.groupdict()['num'])
                 sub_dict['max_flood_scan_length'] = int(m.groupdict()['max'])
                 continue
 
             # Last flood scan time is 0 msec, maximum is 1 msec
-            m = p18.match(line)
+            m = regex.p18.match(line)
             if m:
                 sub_dict['last_flood_scan_time_msec'] = \
                     int(m.groupdict()['time1'])
@@ -2333,7 +2350,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
 
             # Neighbor Count is 1, Adjacent neighbor count is 1
-            m = p19.match(line)
+            m = regex.p19.match(line)
             if m:
                 if 'statistics' not in sub_dict:
                     sub_dict['statistics'] = {}
@@ -2344,7 +2361,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
 
             # Adjacent with neighbor 10.16.2.2 (Backup Designated Router)
-            m = p20_1.match(line)
+            m = regex.p20_1.match(line)
             if m:
                 neighbor = str(m.groupdict()['nbr'])
                 if 'neighbors' not in sub_dict:
@@ -2355,7 +2372,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
 
             # Adjacent with neighbor 10.36.3.3 (Designated Router)
-            m = p20_2.match(line)
+            m = regex.p20_2.match(line)
             if m:
                 neighbor = str(m.groupdict()['nbr'])
                 if 'neighbors' not in sub_dict:
@@ -2366,7 +2383,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
 
             # Adjacent with neighbor 10.64.4.4 (Hello suppressed)
-            m = p20_3.match(line)
+            m = regex.p20_3.match(line)
             if m:
                 neighbor = str(m.groupdict()['nbr'])
                 if 'neighbors' not in sub_dict:
@@ -2376,7 +2393,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
 
             # Suppress hello for 0 neighbor(s)
-            m = p21.match(line)
+            m = regex.p21.match(line)
             if m:
                 if 'statistics' not in sub_dict:
                     sub_dict['statistics'] = {}
@@ -2385,31 +2402,31 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
 
             # Loopback interface is treated as a stub Host
-            m = p22.match(line)
+            m = regex.p22.match(line)
             if m:
                 sub_dict['stub_host'] = True
                 continue
 
             # Can be protected by per-prefix Loop-Free FastReroute
-            m = p23.match(line)
+            m = regex.p23.match(line)
             if m:
                 sub_dict['ipfrr_protected'] = True
                 continue
 
             # Can be used for per-prefix Loop-Free FastReroute repair paths
-            m = p24.match(line)
+            m = regex.p24.match(line)
             if m:
                 sub_dict['ipfrr_candidate'] = True
                 continue
 
             # Not Protected by per-prefix TI-LFA
-            m = p25.match(line)
+            m = regex.p25.match(line)
             if m:
                 sub_dict['ti_lfa_protected'] = False
                 continue
 
             # Prefix-suppression is enabled
-            m = p26.match(line)
+            m = regex.p26.match(line)
             if m:
                 if 'enabled' in m.groupdict()['ps']:
                     sub_dict['prefix_suppression'] = True
@@ -2417,7 +2434,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                     sub_dict['prefix_suppression'] = False
 
             # Strict TTL checking enabled, up to 3 hops allowed
-            m = p27.match(line)
+            m = regex.p27.match(line)
             if m:
                 if 'ttl_security' not in sub_dict:
                     sub_dict['ttl_security'] = {}
@@ -2430,7 +2447,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                     continue
 
             # Simple password authentication enabled
-            m = p28_1.match(line)
+            m = regex.p28_1.match(line)
             if m:
                 if 'authentication' not in sub_dict:
                     sub_dict['authentication'] = {}
@@ -2441,7 +2458,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
 
             # Cryptographic authentication enabled
-            m = p28_2.match(line)
+            m = regex.p28_2.match(line)
             if m:
                 if 'authentication' not in sub_dict:
                     sub_dict['authentication'] = {}
@@ -2452,7 +2469,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
 
             # Youngest key id is 2
-            m = p28_3.match(line)
+            m = regex.p28_3.match(line)
             if m:
                 if 'authentication' not in sub_dict:
                     sub_dict['authentication'] = {}
@@ -2463,12 +2480,12 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
             
             # Rollover in progress, 1 neighbor(s) using the old key(s):
-            m = p28_4.match(line)
+            m = regex.p28_4.match(line)
             if m:
                 continue
 
             # key id 1 algorithm MD5
-            m = p28_5.match(line)
+            m = regex.p28_5.match(line)
             if m:
                 if 'authentication' not in sub_dict:
                     sub_dict['authentication'] = {}
@@ -2479,19 +2496,19 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
 
             # Segment Routing enabled for MPLS forwarding
-            m = p29.match(line)
+            m = regex.p29.match(line)
             if m:
                 sub_dict.update({'sr_mpls_enabled': True})
                 continue
 
             # TEAPP:
-            m = p30.match(line)
+            m = regex.p30.match(line)
             if m:
                 teapp_dict = sub_dict.setdefault('teapp', {})
                 continue
 
             # Topology Id:0x0
-            m = p30_1.match(line)
+            m = regex.p30_1.match(line)
             if m:
                 topology_id = m.groupdict()['topology_id']
                 teapp_dict = sub_dict.setdefault('teapp', {})
@@ -2499,7 +2516,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
 
             # TEAPP:SRTE
-            m = p30_2.match(line)
+            m = regex.p30_2.match(line)
             if m:
                 teapp = m.groupdict()['teapp']
                 teapp_dict = sub_dict.setdefault('teapp', {})
@@ -2507,7 +2524,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
 
             # Affinity: length 32, bits 0x00000010
-            m = p30_3.match(line)
+            m = regex.p30_3.match(line)
             if m:
                 length = int(m.groupdict()['length'])
                 bits = m.groupdict()['bits']
@@ -2517,7 +2534,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
 
             # Extended affinity: length 32, bits 0x00000010
-            m = p30_4.match(line)
+            m = regex.p30_4.match(line)
             if m:
                 length = int(m.groupdict()['length'])
                 bits = m.groupdict()['bits']
@@ -2527,13 +2544,13 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
             
             # SR Policy Manager:
-            m = p31.match(line)
+            m = regex.p31.match(line)
             if m:
                 mgn_dict = sub_dict.setdefault('sr_policy_manager', {})
                 continue
 
             # TE Opaque LSA: Source of link information OSPF
-            m = p31_1.match(line)
+            m = regex.p31_1.match(line)
             if m:
                 mgn_dict.update({'te_opaque_lsa': m.groupdict()['te_opaque_lsa']})
 
@@ -2855,155 +2872,159 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
 
     cmd = 'show ip ospf interface__'
 
-    def cli(self, output=None):
-        if output is None:
-            out = self.device.execute(self.cmd)
-        else:
-            out = output
+    patterns = Patterns(
+        p1=r'^(?P<interface>(\S+)) +is( +administratively)?'
+           ' +(?P<enable>(unknown|up|down)), +line +protocol'
+           ' +is +(?P<line_protocol>(up|down))'
+           '(?: +\(\S+\))?$',
 
-        # Init vars
-        ret_dict = {}
-        af = 'ipv4' # this is ospf - always ipv4
+        p2=r'^Internet +Address +(?P<address>(\S+)),'
+           '(?: +Interface +ID +(?P<intf_id>(\d+)),)?'
+           ' +Area +(?P<area>(\S+))(?:, +Attached +via'
+           ' +(?P<attach>(.*)))?$',
 
-        # Mapping dict
-        bool_dict = {'up': True, 'down': False, 'unknown': False}
+        p2_1=r'^Attached +via +(?P<attached>([a-zA-Z0-9\s]+))$',
 
-        
-        p1 = re.compile(r'^(?P<interface>(\S+)) +is( +administratively)?'
-                            ' +(?P<enable>(unknown|up|down)), +line +protocol'
-                            ' +is +(?P<line_protocol>(up|down))'
-                            '(?: +\(\S+\))?$')
- 
-        p2 = re.compile(r'^Internet +Address +(?P<address>(\S+)),'
-                            '(?: +Interface +ID +(?P<intf_id>(\d+)),)?'
-                            ' +Area +(?P<area>(\S+))(?:, +Attached +via'
-                            ' +(?P<attach>(.*)))?$')
- 
-        p2_1 = re.compile(r'^Attached +via +(?P<attached>([a-zA-Z0-9\s]+))$')
- 
-        p3 = re.compile(r'^Process +ID +(?P<pid>(\S+)),'
-                            '(?: +VRF +(?P<vrf>(\S+)))?'
-                            ' +Router +ID +(?P<router_id>(\S+)),'
-                            ' +Network +Type +(?P<interface_type>(\S+)),'
-                            ' +Cost: +(?P<cost>(\d+))$')
+        p3=r'^Process +ID +(?P<pid>(\S+)),'
+           '(?: +VRF +(?P<vrf>(\S+)))?'
+           ' +Router +ID +(?P<router_id>(\S+)),'
+           ' +Network +Type +(?P<interface_type>(\S+)),'
+           ' +Cost: +(?P<cost>(\d+))$',
 
-        p5 = re.compile(r'^Configured as demand circuit$')
- 
-        p6 = re.compile(r'^Run as demand circuit$')
- 
-        p7 = re.compile(r'^DoNotAge +LSA +not +allowed +\(Number +of'
-                            ' +DCbitless +LSA +is +(?P<num>(\d+))\)\.$')
- 
-        p8 = re.compile(r'^Enabled +by +interface +config, +including'
-                            ' +secondary +ip +addresses$')
- 
-        p9 = re.compile(r'^Transmit +Delay is +(?P<delay>(\d+)) +sec,'
-                            ' +State +(?P<state>(\S+))'
-                            '(?:, +Priority +(?P<priority>(\d+)))?'
-                            '(?:, +BFD +(?P<bfd>(enabled|disabled)))?$')
- 
-        p10 = re.compile(r'^Designated +(R|r)outer +\(ID\)'
-                            ' +(?P<dr_router_id>(\S+)), +(I|i)nterface'
-                            ' +(A|a)ddress +(?P<dr_ip_addr>(\S+))$')
- 
-        p11 = re.compile(r'^Backup +(D|d)esignated +(R|r)outer +\(ID\)'
-                            ' +(?P<bdr_router_id>(\S+)), +(I|i)nterface'
-                            ' +(A|a)ddress +(?P<bdr_ip_addr>(\S+))$')
- 
-        p12 = re.compile(r'^Timer +intervals +configured,'
-                            ' +Hello +(?P<hello>(\d+)),'
-                            ' +Dead +(?P<dead>(\d+)),'
-                            ' +Wait +(?P<wait>(\d+)),'
-                            ' +Retransmit +(?P<retransmit>(\d+))$')
- 
-        p12_1 = re.compile(r'^oob-resync +timeout +(?P<oob>(\d+))$')
- 
-        p12_2 = re.compile(r'^Hello +due +in +(?P<hello_timer>(\S+))$')
- 
-        p13 = re.compile(r'^Supports +Link-local +Signaling +\(LLS\)$')
- 
-        p14 = re.compile(r'^(?P<gr_type>(Cisco|IETF)) +NSF +helper +support'
-                            ' +(?P<helper>(enabled|disabled))$')
- 
-        p15 = re.compile(r'^Index +(?P<index>(\S+)),'
-                            ' +flood +queue +length +(?P<length>(\d+))$')
- 
-        p16 = re.compile(r'^Next +(?P<next>(\S+))$')
- 
-        p17 = re.compile(r'^Last +flood +scan +length +is +(?P<num>(\d+)),'
-                            ' +maximum +is +(?P<max>(\d+))$')
- 
-        p18 = re.compile(r'^Last +flood +scan +time +is +(?P<time1>(\d+))'
-                            ' +msec, +maximum +is +(?P<time2>(\d+)) +msec$')
- 
-        p19 = re.compile(r'^Neighbor +Count +is +(?P<nbr_count>(\d+)),'
-                            ' +Adjacent +neighbor +count +is'
-                            ' +(?P<adj_nbr_count>(\d+))$')
- 
-        p20_1 = re.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
-                            ' +\((B|b)ackup +(D|d)esignated +(R|r)outer\)$')
- 
-        p20_2 = re.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
-                            ' +\((D|d)esignated +(R|r)outer\)$')
- 
-        p20_3 = re.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
-                            ' +\(Hello suppressed\)$')
- 
-        p21 = re.compile(r'^Suppress +hello +for +(?P<sup>(\d+))'
-                            ' +neighbor\(s\)$')
- 
-        p22 = re.compile(r'^Loopback +interface +is +treated +as +a +stub'
-                            ' +Host$')
- 
-        p23 = re.compile(r'^Can +be +protected +by per-+prefix +Loop-Free'
-                            ' +FastReroute$')
- 
-        p24 = re.compile(r'^Can +be +used +for +per-prefix +Loop-Free'
-                            ' +FastReroute +repair +paths$')
- 
-        p25 = re.compile(r'^Not +Protected +by +per-prefix +TI-LFA$')
- 
-        p26 = re.compile(r'^Prefix-suppression +is +(?P<ps>(enabled|disabled))$')
- 
-        p27 = re.compile(r'^Strict +TTL +checking'
-                            ' +(?P<strict_ttl>(enabled|disabled))'
-                            '(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$')
- 
-        p28_1 = re.compile(r'^Simple +password +authentication +enabled$')
- 
-        p28_2 = re.compile(r'^Cryptographic +authentication +enabled$')
- 
-        p28_3 = re.compile(r'^Youngest +key +id +is +(?P<id>(\d+))$')
- 
-        p28_4 = re.compile(r'^Rollover +in +progress, +(?P<num>(\d+))'
-                            ' +neighbor(s) +using +the +old +key(s):$')
- 
-        p28_5 = re.compile(r'^key +id +1 +algorithm +MD5$')
+        p5=r'^Configured as demand circuit$',
+
+        p6=r'^Run as demand circuit$',
+
+        p7=r'^DoNotAge +LSA +not +allowed +\(Number +of'
+           ' +DCbitless +LSA +is +(?P<num>(\d+))\)\.$',
+
+        p8=r'^Enabled +by +interface +config, +including'
+           ' +secondary +ip +addresses$',
+
+        p9=r'^Transmit +Delay is +(?P<delay>(\d+)) +sec,'
+           ' +State +(?P<state>(\S+))'
+           '(?:, +Priority +(?P<priority>(\d+)))?'
+           '(?:, +BFD +(?P<bfd>(enabled|disabled)))?$',
+
+        p10=r'^Designated +(R|r)outer +\(ID\)'
+            ' +(?P<dr_router_id>(\S+)), +(I|i)nterface'
+            ' +(A|a)ddress +(?P<dr_ip_addr>(\S+))$',
+
+        p11=r'^Backup +(D|d)esignated +(R|r)outer +\(ID\)'
+            ' +(?P<bdr_router_id>(\S+)), +(I|i)nterface'
+            ' +(A|a)ddress +(?P<bdr_ip_addr>(\S+))$',
+
+        p12=r'^Timer +intervals +configured,'
+            ' +Hello +(?P<hello>(\d+)),'
+            ' +Dead +(?P<dead>(\d+)),'
+            ' +Wait +(?P<wait>(\d+)),'
+            ' +Retransmit +(?P<retransmit>(\d+))$',
+
+        p12_1=r'^oob-resync +timeout +(?P<oob>(\d+))$',
+
+        p12_2=r'^Hello +due +in +(?P<hello_timer>(\S+))$',
+
+        p13=r'^Supports +Link-local +Signaling +\(LLS\)$',
+
+        p14=r'^(?P<gr_type>(Cisco|IETF)) +NSF +helper +support'
+            ' +(?P<helper>(enabled|disabled))$',
+
+        p15=r'^Index +(?P<index>(\S+)),'
+            ' +flood +queue +length +(?P<length>(\d+))$',
+
+        p16=r'^Next +(?P<next>(\S+))$',
+
+        p17=r'^Last +flood +scan +length +is +(?P<num>(\d+)),'
+            ' +maximum +is +(?P<max>(\d+))$',
+
+        p18=r'^Last +flood +scan +time +is +(?P<time1>(\d+))'
+            ' +msec, +maximum +is +(?P<time2>(\d+)) +msec$',
+
+        p19=r'^Neighbor +Count +is +(?P<nbr_count>(\d+)),'
+            ' +Adjacent +neighbor +count +is'
+            ' +(?P<adj_nbr_count>(\d+))$',
+
+        p20_1=r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
+              ' +\((B|b)ackup +(D|d)esignated +(R|r)outer\)$',
+
+        p20_2=r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
+              ' +\((D|d)esignated +(R|r)outer\)$',
+
+        p20_3=r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
+              ' +\(Hello suppressed\)$',
+
+        p21=r'^Suppress +hello +for +(?P<sup>(\d+))'
+            ' +neighbor\(s\)$',
+
+        p22=r'^Loopback +interface +is +treated +as +a +stub'
+            ' +Host$',
+
+        p23=r'^Can +be +protected +by per-+prefix +Loop-Free'
+            ' +FastReroute$',
+
+        p24=r'^Can +be +used +for +per-prefix +Loop-Free'
+            ' +FastReroute +repair +paths$',
+
+        p25=r'^Not +Protected +by +per-prefix +TI-LFA$',
+
+        p26=r'^Prefix-suppression +is +(?P<ps>(enabled|disabled))$',
+
+        p27=r'^Strict +TTL +checking'
+            ' +(?P<strict_ttl>(enabled|disabled))'
+            '(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$',
+
+        p28_1=r'^Simple +password +authentication +enabled$',
+
+        p28_2=r'^Cryptographic +authentication +enabled$',
+
+        p28_3=r'^Youngest +key +id +is +(?P<id>(\d+))$',
+
+        p28_4=r'^Rollover +in +progress, +(?P<num>(\d+))'
+              ' +neighbor(s) +using +the +old +key(s):$',
+
+        p28_5=r'^key +id +1 +algorithm +MD5$',
 
         # Segment Routing enabled for MPLS forwarding
-        p29 = re.compile(r'^Segment +Routing +enabled +for +MPLS +forwarding$')
+        p29=r'^Segment +Routing +enabled +for +MPLS +forwarding$',
 
         # TEAPP:
-        p30 = re.compile(r'^TEAPP:$')
+        p30=r'^TEAPP:$',
 
         # Topology Id:0x0
-        p30_1 = re.compile(r'^Topology +Id: *(?P<topology_id>[\w]+)$')
+        p30_1=r'^Topology +Id: *(?P<topology_id>[\w]+)$',
 
         # TEAPP:SRTE
-        p30_2 = re.compile(r'^TEAPP: *(?P<teapp>[\w]+)$')
+        p30_2=r'^TEAPP: *(?P<teapp>[\w]+)$',
 
         # Affinity: length 32, bits 0x00000010
-        p30_3 = re.compile(r'^Affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$')
+        p30_3=r'^Affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$',
 
         # Extended affinity: length 32, bits 0x00000010
-        p30_4 = re.compile(r'^Extended +affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$')
+        p30_4=r'^Extended +affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$',
 
         # SR Policy Manager:
-        p31 = re.compile(r'^SR +Policy +Manager:$')
+        p31=r'^SR +Policy +Manager:$',
 
         # TE Opaque LSA: Source of link information OSPF
-        p31_1 = re.compile(r'^TE +Opaque +LSA: +(?P<te_opaque_lsa>[\S\s]+)$')
+        p31_1=r'^TE +Opaque +LSA: +(?P<te_opaque_lsa>[\S\s]+)$',
+    )
+
+    def cli(self, output=None):
+        if output is None:
+            out = self.device.execute(self.cmd)
+        else:
+            out = output
+
+        # Init vars
+        ret_dict = {}
+        af = 'ipv4' # this is ospf - always ipv4
 
+        # Mapping dict
+        bool_dict = {'up': True, 'down': False, 'unknown': False}
+
+        
+        p = ShowIpOspfInterface2.patterns
+ 
         for line in out.splitlines():
             line = line.strip()
 
@@ -3016,7 +3037,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
             # TenGigabitEthernet1/8 is down, line protocol is down (notconnect)
             # TenGigabitEthernet2/6.3052 is administratively down, line protocol is down (disabled)
             # TenGigabitEthernet1/15 is down, line protocol is down (err-disabled)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 interface = str(m.groupdict()['interface'])
                 enable = str(m.groupdict()['enable'])
@@ -3041,7 +3062,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
             # Internet Address 10.4.1.1/32, Interface ID 11, Area 0
             # Internet Address 0.0.0.0/0, Area 0, Attached via Not Attached
             # Internet Address 10.229.4.4/24, Area 1, Attached via Interface Enable
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 ip_address = str(m.groupdict()['address'])
                 area = str(IPAddress(str(m.groupdict()['area'])))
@@ -3052,7 +3073,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
 
             # Attached via Interface Enable
-            m = p2_1.match(line)
+            m = p.p2_1.match(line)
             if m:
                 attached = str(m.groupdict()['attached']).lower()
                 continue
@@ -3060,7 +3081,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
             # Process ID 1, Router ID 10.64.4.4, Network Type VIRTUAL_LINK, Cost: 1
             # Process ID 2, Router ID 10.229.11.11, Network Type SHAM_LINK, Cost: 111
             # Process ID 1, Router ID 10.4.1.1, Network Type BROADCAST, Cost: 1
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 instance = str(m.groupdict()['pid'])
                 router_id = str(m.groupdict()['router_id'])
@@ -3174,26 +3195,26 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                     continue
 
             # Configured as demand circuit
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 sub_dict['demand_circuit'] = True
                 continue
 
             # Run as demand circuit
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 sub_dict['demand_circuit'] = True
                 continue
 
             # DoNotAge LSA not allowed (Number of DCbitless LSA is 1).
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 sub_dict['donotage_lsa'] = False
                 sub_dict['total_dcbitless_lsa'] = int(m.groupdict()['num'])
                 continue
 
             # Enabled by interface config, including secondary ip addresses
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 sub_dict['if_cfg'] = True
                 continue
@@ -3201,7 +3222,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
             # Transmit Delay is 1 sec, State POINT_TO_POINT
             # Transmit Delay is 1 sec, State DR, Priority 1
             # Transmit Delay is 1 sec, State DR, Priority 111, BFD enabled
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 sub_dict['transmit_delay'] = int(m.groupdict()['delay'])
                 state = str(m.groupdict()['state']).lower()
@@ -3219,21 +3240,21 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                         continue
 
             # Designated Router (ID) 10.36.3.3, Interface address 10.2.3.3
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 sub_dict['dr_router_id'] = str(m.groupdict()['dr_router_id'])
                 sub_dict['dr_ip_addr'] = str(m.groupdict()['dr_ip_addr'])
                 continue
 
             # Backup Designated router (ID) 10.16.2.2, Interface address 10.2.3.2
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 sub_dict['bdr_router_id'] = str(m.groupdict()['bdr_router_id'])
                 sub_dict['bdr_ip_addr'] = str(m.groupdict()['bdr_ip_addr'])
                 continue
 
             # Timer intervals configured, Hello 10, Dead 40, Wait 40, Retransmit 5
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 sub_dict['hello_interval'] = int(m.groupdict()['hello'])
                 sub_dict['dead_interval'] = int(m.groupdict()['dead'])
@@ -3242,27 +3263,27 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
 
             #  oob-resync timeout 40
-            m = p12_1.match(line)
+            m = p.p12_1.match(line)
             if m:
                 sub_dict['oob_resync_timeout'] = int(m.groupdict()['oob'])
                 continue
             
             # Hello due in 00:00:00
-            m = p12_2.match(line)
+            m = p.p12_2.match(line)
             if m:
                 sub_dict['passive'] = False
                 sub_dict['hello_timer'] = str(m.groupdict()['hello_timer'])
                 continue
 
             # Supports Link-local Signaling (LLS)
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 sub_dict['lls'] = True
                 continue
             
             # Cisco NSF helper support enabled
             # IETF NSF helper support enabled
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 gr_type = str(m.groupdict()['gr_type']).lower()
                 if 'graceful_restart' not in sub_dict:
@@ -3277,27 +3298,27 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
 
             # Index 2/2, flood queue length 0
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 sub_dict['index'] = str(m.groupdict()['index'])
                 sub_dict['flood_queue_length'] = int(m.groupdict()['length'])
                 continue
 
             # Next 0(0)/0(0)
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 sub_dict['next'] = str(m.groupdict()['next'])
                 continue
 
             # Last flood scan length is 0, maximum is 11
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 sub_dict['last_flood_scan_length'] = int(m.groupdict()['num'])
                 sub_dict['max_flood_scan_length'] = int(m.groupdict()['max'])
                 continue
 
             # Last flood scan time is 0 msec, maximum is 1 msec
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 sub_dict['last_flood_scan_time_msec'] = \
                     int(m.groupdict()['time1'])
@@ -3306,7 +3327,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
 
             # Neighbor Count is 1, Adjacent neighbor count is 1
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 if 'statistics' not in sub_dict:
                     sub_dict['statistics'] = {}
@@ -3317,7 +3338,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
 
             # Adjacent with neighbor 10.16.2.2 (Backup Designated Router)
-            m = p20_1.match(line)
+            m = p.p20_1.match(line)
             if m:
                 neighbor = str(m.groupdict()['nbr'])
                 if 'neighbors' not in sub_dict:
@@ -3328,7 +3349,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
 
             # Adjacent with neighbor 10.36.3.3 (Designated Router)
-            m = p20_2.match(line)
+            m = p.p20_2.match(line)
             if m:
                 neighbor = str(m.groupdict()['nbr'])
                 if 'neighbors' not in sub_dict:
@@ -3339,7 +3360,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
 
             # Adjacent with neighbor 10.64.4.4 (Hello suppressed)
-            m = p20_3.match(line)
+            m = p.p20_3.match(line)
             if m:
                 neighbor = str(m.groupdict()['nbr'])
                 if 'neighbors' not in sub_dict:
@@ -3349,7 +3370,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
 
             # Suppress hello for 0 neighbor(s)
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 if 'statistics' not in sub_dict:
                     sub_dict['statistics'] = {}
@@ -3358,31 +3379,31 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
 
             # Loopback interface is treated as a stub Host
-            m = p22.match(line)
+            m = p.p22.match(line)
             if m:
                 sub_dict['stub_host'] = True
                 continue
 
             # Can be protected by per-prefix Loop-Free FastReroute
-            m = p23.match(line)
+            m = p.p23.match(line)
             if m:
                 sub_dict['ipfrr_protected'] = True
                 continue
 
             # Can be used for per-prefix Loop-Free FastReroute repair paths
-            m = p24.match(line)
+            m = p.p24.match(line)
             if m:
                 sub_dict['ipfrr_candidate'] = True
                 continue
 
             # Not Protected by per-prefix TI-LFA
-            m = p25.match(line)
+            m = p.p25.match(line)
             if m:
                 sub_dict['ti_lfa_protected'] = False
                 continue
 
             # Prefix-suppression is enabled
-            m = p26.match(line)
+            m = p.p26.match(line)
             if m:
                 if 'enabled' in m.groupdict()['ps']:
                     sub_dict['prefix_suppression'] = True
@@ -3390,7 +3411,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                     sub_dict['prefix_suppression'] = False
 
             # Strict TTL checking enabled, up to 3 hops allowed
-            m = p27.match(line)
+            m = p.p27.match(line)
             if m:
                 if 'ttl_security' not in sub_dict:
                     sub_dict['ttl_security'] = {}
@@ -3403,7 +3424,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                     continue
 
             # Simple password authentication enabled
-            m = p28_1.match(line)
+            m = p.p28_1.match(line)
             if m:
                 if 'authentication' not in sub_dict:
                     sub_dict['authentication'] = {}
@@ -3414,7 +3435,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
 
             # Cryptographic authentication enabled
-            m = p28_2.match(line)
+            m = p.p28_2.match(line)
             if m:
                 if 'authentication' not in sub_dict:
                     sub_dict['authentication'] = {}
@@ -3425,7 +3446,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
 
             # Youngest key id is 2
-            m = p28_3.match(line)
+            m = p.p28_3.match(line)
             if m:
                 if 'authentication' not in sub_dict:
                     sub_dict['authentication'] = {}
@@ -3436,12 +3457,12 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
             
             # Rollover in progress, 1 neighbor(s) using the old key(s):
-            m = p28_4.match(line)
+            m = p.p28_4.match(line)
             if m:
                 continue
 
             # key id 1 algorithm MD5
-            m = p28_5.match(line)
+            m = p.p28_5.match(line)
             if m:
                 if 'authentication' not in sub_dict:
                     sub_dict['authentication'] = {}
@@ -3452,19 +3473,19 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
 
             # Segment Routing enabled for MPLS forwarding
-            m = p29.match(line)
+            m = p.p29.match(line)
             if m:
                 sub_dict.update({'sr_mpls_enabled': True})
                 continue
 
             # TEAPP:
-            m = p30.match(line)
+            m = p.p30.match(line)
             if m:
                 teapp_dict = sub_dict.setdefault('teapp', {})
                 continue
 
             # Topology Id:0x0
-            m = p30_1.match(line)
+            m = p.p30_1.match(line)
             if m:
                 topology_id = m.groupdict()['topology_id']
                 teapp_dict = sub_dict.setdefault('teapp', {})
@@ -3472,7 +3493,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
 
             # TEAPP:SRTE
-            m = p30_2.match(line)
+            m = p.p30_2.match(line)
             if m:
                 teapp = m.groupdict()['teapp']
                 teapp_dict = sub_dict.setdefault('teapp', {})
@@ -3480,7 +3501,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
 
             # Affinity: length 32, bits 0x00000010
-            m = p30_3.match(line)
+            m = p.p30_3.match(line)
             if m:
                 length = int(m.groupdict()['length'])
                 bits = m.groupdict()['bits']
@@ -3490,7 +3511,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
 
             # Extended affinity: length 32, bits 0x00000010
-            m = p30_4.match(line)
+            m = p.p30_4.match(line)
             if m:
                 length = int(m.groupdict()['length'])
                 bits = m.groupdict()['bits']
@@ -3500,13 +3521,13 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
             
             # SR Policy Manager:
-            m = p31.match(line)
+            m = p.p31.match(line)
             if m:
                 mgn_dict = sub_dict.setdefault('sr_policy_manager', {})
                 continue
 
             # TE Opaque LSA: Source of link information OSPF
-            m = p31_1.match(line)
+            m = p.p31_1.match(line)
             if m:
                 mgn_dict.update({'te_opaque_lsa': m.groupdict()['te_opaque_lsa']})
 
@@ -3524,80 +3545,84 @@ class ShowIpOspfLinksParser(MetaParser):
         * 'show ip ospf sham-links'
     '''
 
-    def cli(self, cmd, link_type,output=None):
+    patterns = Patterns(
+        p1=r'^(Virtual|Sham) +Link +(?P<interface>(\S+)) +to'
+           ' +(address|router) +(?P<address>(\S+)) +is'
+           ' +(?P<link_state>(up|down))$',
 
-        assert link_type in ['virtual_links', 'sham_links']
+        p2=r'^Area +(?P<area>(\S+)),? +source +address'
+           ' +(?P<source_address>(\S+))$',
 
-        if output is None:
-            out = self.device.execute(cmd)
-        else:
-            out = output
-        
-        # Init vars
-        ret_dict = {}
-        af = 'ipv4'
+        p3=r'^Run +as +demand +circuit$',
 
-        # crypo_algorithm dict
-        crypto_dict = {'cryptographic': 'md5', 'simple password': 'simple'}
+        p4=r'^DoNotAge +LSA +not +allowed'
+           ' +\(Number +of +DCbitless +LSA +is +(?P<dcbitless>(\d+))\).'
+           '(?: +Cost +of +using +(?P<cost>(\d+)))?'
+           '(?: State +(?P<state>(\S+)))?$',
 
+        p5=r'^Transit +area +(?P<area>(\S+)),'
+           '(?: +via +interface +(?P<intf>(\S+)))?$',
 
-        p1 = re.compile(r'^(Virtual|Sham) +Link +(?P<interface>(\S+)) +to'
-                            ' +(address|router) +(?P<address>(\S+)) +is'
-                            ' +(?P<link_state>(up|down))$')
+        p6=r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
+           ' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
+           ' +(?P<topo_name>(\S+))$',
 
-        p2 = re.compile(r'^Area +(?P<area>(\S+)),? +source +address'
-                            ' +(?P<source_address>(\S+))$')
+        p7=r'^Transmit +Delay +is +(?P<transmit_delay>(\d+))'
+           ' +sec, +State +(?P<state>(\S+)),?$',
 
-        p3 = re.compile(r'^Run +as +demand +circuit$')
+        p8=r'^Timer +intervals +configured,'
+           ' +Hello +(?P<hello>(\d+)),'
+           ' +Dead +(?P<dead>(\d+)),'
+           ' +Wait +(?P<wait>(\d+)),'
+           '(?: +Retransmit +(?P<retransmit>(\d+)))?$',
 
-        p4 = re.compile(r'^DoNotAge +LSA +not +allowed'
-                            ' +\(Number +of +DCbitless +LSA +is +(?P<dcbitless>(\d+))\).'
-                            '(?: +Cost +of +using +(?P<cost>(\d+)))?'
-                            '(?: State +(?P<state>(\S+)))?$')
+        p9=r'^Strict +TTL +checking'
+           ' +(?P<strict_ttl>(enabled|disabled))'
+           '(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$',
 
-        p5 = re.compile(r'^Transit +area +(?P<area>(\S+)),'
-                            '(?: +via +interface +(?P<intf>(\S+)))?$')
+        p10=r'^Hello +due +in +(?P<hello_timer>(\S+))$',
 
-        p6 = re.compile(r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
-                            ' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
-                            ' +(?P<topo_name>(\S+))$')
+        p11=r'^Adjacency +State +(?P<adj_state>(\S+))$',
 
-        p7 = re.compile(r'^Transmit +Delay +is +(?P<transmit_delay>(\d+))'
-                            ' +sec, +State +(?P<state>(\S+)),?$')
+        p12=r'^Index +(?P<index>(\S+)), +retransmission +queue'
+            ' +length +(?P<length>(\d+)), +number +of'
+            ' +retransmission +(?P<retrans>(\d+))$',
 
-        p8 = re.compile(r'^Timer +intervals +configured,'
-                            ' +Hello +(?P<hello>(\d+)),'
-                            ' +Dead +(?P<dead>(\d+)),'
-                            ' +Wait +(?P<wait>(\d+)),'
-                            '(?: +Retransmit +(?P<retransmit>(\d+)))?$')
+        p13=r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$',
 
-        p9 = re.compile(r'^Strict +TTL +checking'
-                            ' +(?P<strict_ttl>(enabled|disabled))'
-                            '(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$')
+        p14=r'^Last +retransmission +scan +length +is'
+            ' +(?P<len>(\d+)), +maximum +is +(?P<max>(\d+))$',
 
-        p10 = re.compile(r'^Hello +due +in +(?P<hello_timer>(\S+))$')
+        p15=r'^Last +retransmission +scan +time +is'
+            ' +(?P<time>(\d+)) +msec, +maximum +is'
+            ' +(?P<max>(\d+)) +msec$',
+    )
 
-        p11 = re.compile(r'^Adjacency +State +(?P<adj_state>(\S+))$')
+    def cli(self, cmd, link_type,output=None):
 
-        p12 = re.compile(r'^Index +(?P<index>(\S+)), +retransmission +queue'
-                            ' +length +(?P<length>(\d+)), +number +of'
-                            ' +retransmission +(?P<retrans>(\d+))$')
+        assert link_type in ['virtual_links', 'sham_links']
+
+        if output is None:
+            out = self.device.execute(cmd)
+        else:
+            out = output
+        
+        # Init vars
+        ret_dict = {}
+        af = 'ipv4'
 
-        p13 = re.compile(r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$')
+        # crypo_algorithm dict
+        crypto_dict = {'cryptographic': 'md5', 'simple password': 'simple'}
 
-        p14 = re.compile(r'^Last +retransmission +scan +length +is'
-                            ' +(?P<len>(\d+)), +maximum +is +(?P<max>(\d+))$')
 
-        p15 = re.compile(r'^Last +retransmission +scan +time +is'
-                            ' +(?P<time>(\d+)) +msec, +maximum +is'
-                            ' +(?P<max>(\d+)) +msec$')
+        regex = ShowIpOspfLinksParser.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # Sham Link OSPF_SL0 to address 10.151.22.22 is up
             # Virtual Link OSPF_VL0 to router 10.64.4.4 is up
-            m = p1.match(line)
+            m = regex.p1.match(line)
             if m:
                 address = str(m.groupdict()['address'])
                 sl_remote_id = vl_router_id = address
@@ -3671,7 +3696,7 @@ class ShowIpOspfLinksParser(MetaParser):
 
             # Area 1, source address 10.21.33.33
             # Area 1 source address 10.229.11.11
-            m = p2.match(line)
+            m = regex.p2.match(line)
             if m:
                 area = str(IPAddress(str(m.groupdict()['area'])))
                 source_address = str(m.groupdict()['source_address'])
@@ -3717,7 +3742,7 @@ class ShowIpOspfLinksParser(MetaParser):
                 continue
 
             # Run as demand circuit
-            m = p3.match(line)
+            m = regex.p3.match(line)
             if m:
                 if link_type == 'sham_links':
                     sub_dict['demand_circuit'] = True
@@ -3727,7 +3752,7 @@ class ShowIpOspfLinksParser(MetaParser):
 
             # DoNotAge LSA not allowed (Number of DCbitless LSA is 7).
             # DoNotAge LSA not allowed (Number of DCbitless LSA is 1). Cost of using 111 State POINT_TO_POINT,
-            m = p4.match(line)
+            m = regex.p4.match(line)
             if m:
                 dcbitless_lsa_count = int(m.groupdict()['dcbitless'])
                 donotage_lsa = 'not allowed'
@@ -3748,7 +3773,7 @@ class ShowIpOspfLinksParser(MetaParser):
 
             # Transit area 1
             # Transit area 1, via interface GigabitEthernet0/1
-            m = p5.match(line)
+            m = regex.p5.match(line)
             if m:
                 area = str(IPAddress(str(m.groupdict()['area'])))
 
@@ -3813,7 +3838,7 @@ class ShowIpOspfLinksParser(MetaParser):
 
             # Topology-MTID    Cost    Disabled     Shutdown      Topology Name
             #             0       1          no           no               Base
-            m = p6.match(line)
+            m = regex.p6.match(line)
             if m:
                 mtid = int(m.groupdict()['mtid'])
                 if 'topology' not in sub_dict:
@@ -3833,7 +3858,7 @@ class ShowIpOspfLinksParser(MetaParser):
                     continue
             
             # Transmit Delay is 1 sec, State POINT_TO_POINT,
-            m = p7.match(line)
+            m = regex.p7.match(line)
             if m:
                 sub_dict['transmit_delay'] = int(m.groupdict()['transmit_delay'])
                 state = str(m.groupdict()['state']).lower()
@@ -3844,7 +3869,7 @@ class ShowIpOspfLinksParser(MetaParser):
             # Timer intervals configured, Hello 3, Dead 13, Wait 13, Retransmit 5
             # Timer intervals configured, Hello 4, Dead 16, Wait 16, Retransmit 44
             # Timer intervals configured, Hello 10, Dead 40, Wait 40,
-            m = p8.match(line)
+            m = regex.p8.match(line)
             if m:
                 if m.groupdict()['hello']:
                     sub_dict['hello_interval'] = int(m.groupdict()['hello'])
@@ -3857,7 +3882,7 @@ class ShowIpOspfLinksParser(MetaParser):
                 continue
 
             # Strict TTL checking enabled, up to 3 hops allowed
-            m = p9.match(line)
+            m = regex.p9.match(line)
             if m:
                 if 'ttl_security' not in sub_dict:
                     sub_dict['ttl_security'] = {}
@@ -3870,19 +3895,19 @@ class ShowIpOspfLinksParser(MetaParser):
                     continue
 
             # Hello due in 00:00:03:179
-            m = p10.match(line)
+            m = regex.p10.match(line)
             if m:
                 sub_dict['hello_timer'] = str(m.groupdict()['hello_timer'])
                 continue          
           
             # Adjacency State FULL
-            m = p11.match(line)
+            m = regex.p11.match(line)
             if m:
                 sub_dict['adjacency_state'] = str(m.groupdict()['adj_state']).lower()
                 continue
 
             # Index 1/2/2, retransmission queue length 0, number of retransmission 2
-            m = p12.match(line)
+            m = regex.p12.match(line)
             if m:
                 sub_dict['index'] = str(m.groupdict()['index'])
                 sub_dict['retrans_qlen'] = int(m.groupdict()['length'])
@@ -3890,14 +3915,14 @@ class ShowIpOspfLinksParser(MetaParser):
                 continue
 
             # First 0x0(0)/0x0(0)/0x0(0) Next 0x0(0)/0x0(0)/0x0(0)
-            m = p13.match(line)
+            m = regex.p13.match(line)
             if m:
                 sub_dict['first'] = str(m.groupdict()['first'])
                 sub_dict['next'] = str(m.groupdict()['next'])
                 continue
 
             # Last retransmission scan length is 1, maximum is 1
-            m = p14.match(line)
+            m = regex.p14.match(line)
             if m:
                 sub_dict['last_retransmission_scan_length'] = \
                     int(m.groupdict()['len'])
@@ -3906,7 +3931,7 @@ class ShowIpOspfLinksParser(MetaParser):
                 continue
 
             # Last retransmission scan time is 0 msec, maximum is 0 msec
-            m = p15.match(line)
+            m = regex.p15.match(line)
             if m:
                 sub_dict['last_retransmission_scan_time'] = \
                     int(m.groupdict()['time'])
@@ -4238,6 +4263,48 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
         'uptime', 'last_retrans_scan_length', 'last_retrans_scan_time_msec']
 
 
+    patterns = Patterns(
+        p1=r'^Neighbor +(?P<neighbor>(\S+)), +interface'
+           ' +address +(?P<address>(\S+))'
+           '(?:, +interface-id +(?P<intf_id>(\S+)))?$',
+
+        p2=r'^In +the +area +(?P<area>(\S+)) +via +interface'
+           ' +(?P<interface>(\S+))(, +BFD +(?P<bfd_state>\S+))?$',
+
+        p3=r'^Neighbor +priority +is +(?P<priority>(\d+)),'
+           ' +State +is +(?P<state>(\S+)),'
+           ' +(?P<num>(\d+)) +state +changes$',
+
+        p4=r'^DR +is +(?P<dr_ip_addr>(\S+))'
+           ' +BDR +is +(?P<bdr_ip_addr>(\S+))$',
+
+        p5=r'^Options +is +(?P<options>(\S+)) +in +Hello'
+           ' +\(E-bit\)$',
+
+        p6=r'^Options +is +(?P<options>(\S+)) +in +DBD'
+           ' +\(E-bit, O-bit\)$',
+
+        p7=r'^Dead +timer +due +in +(?P<dead_timer>(\S+))$',
+
+        p8=r'^Neighbor +is +up +for +(?P<uptime>(\S+))$',
+
+        p9=r'^Index +(?P<index>(\S+)) +retransmission +queue'
+           ' +length +(?P<ql>(\d+)), +number +of'
+           ' +retransmission +(?P<num_retrans>(\d+))$',
+
+        p10=r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$',
+
+        p11=r'^Last +retransmission +scan +length +is'
+            ' +(?P<num1>(\d+)), +maximum +is'
+            ' +(?P<num2>(\d+))$',
+
+        p12=r'^Last +retransmission +scan +time +is'
+            ' +(?P<num1>(\d+)) +msec, +maximum +is'
+            ' +(?P<num2>(\d+)) +msec$',
+
+        p13=r'^SR +adj +label +(?P<sr_adj_label>\d+)$',
+    )
+
     def cli(self, neighbor='', output=None):
 
         if output is None:
@@ -4253,45 +4320,7 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
         ret_dict = {}
         af = 'ipv4' # this is ospf - always ipv4
 
-        p1 = re.compile(r'^Neighbor +(?P<neighbor>(\S+)), +interface'
-                            ' +address +(?P<address>(\S+))'
-                            '(?:, +interface-id +(?P<intf_id>(\S+)))?$')
-        
-        p2 = re.compile(r'^In +the +area +(?P<area>(\S+)) +via +interface'
-                            ' +(?P<interface>(\S+))(, +BFD +(?P<bfd_state>\S+))?$')
-        
-        p3 = re.compile(r'^Neighbor +priority +is +(?P<priority>(\d+)),'
-                            ' +State +is +(?P<state>(\S+)),'
-                            ' +(?P<num>(\d+)) +state +changes$')
-        
-        p4 = re.compile(r'^DR +is +(?P<dr_ip_addr>(\S+))'
-                            ' +BDR +is +(?P<bdr_ip_addr>(\S+))$')
-        
-        p5 = re.compile(r'^Options +is +(?P<options>(\S+)) +in +Hello'
-                            ' +\(E-bit\)$')
-        
-        p6 = re.compile(r'^Options +is +(?P<options>(\S+)) +in +DBD'
-                            ' +\(E-bit, O-bit\)$')
-        
-        p7 = re.compile(r'^Dead +timer +due +in +(?P<dead_timer>(\S+))$')
-        
-        p8 = re.compile(r'^Neighbor +is +up +for +(?P<uptime>(\S+))$')
-        
-        p9 = re.compile(r'^Index +(?P<index>(\S+)) +retransmission +queue'
-                            ' +length +(?P<ql>(\d+)), +number +of'
-                            ' +retransmission +(?P<num_retrans>(\d+))$')
-        
-        p10 = re.compile(r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$')
-        
-        p11 = re.compile(r'^Last +retransmission +scan +length +is'
-                            ' +(?P<num1>(\d+)), +maximum +is'
-                            ' +(?P<num2>(\d+))$')
-        
-        p12 = re.compile(r'^Last +retransmission +scan +time +is'
-                            ' +(?P<num1>(\d+)) +msec, +maximum +is'
-                            ' +(?P<num2>(\d+)) +msec$')
-        
-        p13 = re.compile(r'^SR +adj +label +(?P<sr_adj_label>\d+)$')
+        regex = ShowIpOspfNeighborDetail.patterns
         
         for line in out.splitlines():
             line = line.strip()
@@ -4299,7 +4328,7 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
             # Neighbor 10.16.2.2, interface address 10.1.2.2
             # Neighbor 192.168.111.1, interface address 192.168.70.1, interface-id 192
             # Neighbor 192.168.255.9, interface address 10.0.109.9, interface-id unknown
-            m = p1.match(line)
+            m = regex.p1.match(line)
             if m:
                 neighbor = str(m.groupdict()['neighbor'])
                 address = str(m.groupdict()['address'])
@@ -4309,7 +4338,7 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
 
             # In the area 0 via interface GigabitEthernet2
             # In the area 0 via interface TenGigabitEthernet3/1/1, BFD enabled
-            m = p2.match(line)
+            m = regex.p2.match(line)
             if m:
                 area = str(IPAddress(str(m.groupdict()['area'])))
                 interface = str(m.groupdict()['interface'])
@@ -4515,7 +4544,7 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
                 continue
 
             # Neighbor priority is 1, State is FULL, 6 state changes
-            m = p3.match(line)
+            m = regex.p3.match(line)
             if m:
                 sub_dict['priority'] = int(m.groupdict()['priority'])
                 state = str(m.groupdict()['state']).lower()
@@ -4528,39 +4557,39 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
                 continue
 
             # DR is 10.2.3.3 BDR is 10.2.3.2
-            m = p4.match(line)
+            m = regex.p4.match(line)
             if m:
                 sub_dict['dr_ip_addr'] = str(m.groupdict()['dr_ip_addr'])
                 sub_dict['bdr_ip_addr'] = str(m.groupdict()['bdr_ip_addr'])
                 continue
 
             # Options is 0x2 in Hello (E-bit)
-            m = p5.match(line)
+            m = regex.p5.match(line)
             if m:
                 sub_dict['hello_options'] = str(m.groupdict()['options'])
                 continue
 
             # Options is 0x42 in DBD (E-bit, O-bit)
             # Options is 0x42 in DBD (E-bit, O-bit)
-            m = p6.match(line)
+            m = regex.p6.match(line)
             if m:
                 sub_dict['dbd_options'] = str(m.groupdict()['options'])
                 continue
 
             # Dead timer due in 00:00:38
-            m = p7.match(line)
+            m = regex.p7.match(line)
             if m:
                 sub_dict['dead_timer'] = str(m.groupdict()['dead_timer'])
                 continue
 
             # Neighbor is up for 08:22:07
-            m = p8.match(line)
+            m = regex.p8.match(line)
             if m:
                 sub_dict['uptime'] = str(m.groupdict()['uptime'])
                 continue
 
             # Index 1/2/2, retransmission queue length 0, number of retransmission 0
-            m = p9.match(line)
+            m = regex.p9.match(line)
             if m:
                 sub_dict['index'] = str(m.groupdict()['index'])
                 if 'statistics' not in sub_dict:
@@ -4572,14 +4601,14 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
                 continue
 
             # First 0x0(0)/0x0(0)/0x0(0) Next 0x0(0)/0x0(0)/0x0(0)
-            m = p10.match(line)
+            m = regex.p10.match(line)
             if m:
                 sub_dict['first'] = str(m.groupdict()['first'])
                 sub_dict['next'] = str(m.groupdict()['next'])
                 continue
 
             # Last retransmission scan length is 0, maximum is 0
-            m = p11.match(line)
+            m = regex.p11.match(line)
             if m:
                 if 'statistics' not in sub_dict:
                     sub_dict['statistics'] = {}
@@ -4590,7 +4619,7 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
                 continue
 
             # Last retransmission scan time is 0 msec, maximum is 0 msec
-            m = p12.match(line)
+            m = regex.p12.match(line)
             if m:
                 if 'statistics' not in sub_dict:
                     sub_dict['statistics'] = {}
@@ -4601,7 +4630,7 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
                 continue
             
             # SR adj label 10
-            m = p13.match(line)
+            m = regex.p13.match(line)
             if m:
                 sub_dict['sr_adj_label'] = str(m.groupdict()['sr_adj_label'])
                 continue
@@ -4677,6 +4706,48 @@ class ShowIpOspfNeighborDetail2(ShowIpOspfNeighborDetail2Schema):
 
     cli_command = 'show ip ospf neighbor detail__'
 
+    patterns = Patterns(
+        p1=r'^Neighbor +(?P<neighbor>(\S+)), +interface'
+           ' +address +(?P<address>(\S+))'
+           '(?:, +interface-id +(?P<intf_id>(\S+)))?$',
+
+        p2=r'^In +the +area +(?P<area>(\S+)) +via +interface'
+           ' +(?P<interface>(\S+))(, +BFD +(?P<bfd_state>\S+))?$',
+
+        p3=r'^Neighbor +priority +is +(?P<priority>(\d+)),'
+           ' +State +is +(?P<state>(\S+)),'
+           ' +(?P<num>(\d+)) +state +changes$',
+
+        p4=r'^DR +is +(?P<dr_ip_addr>(\S+))'
+           ' +BDR +is +(?P<bdr_ip_addr>(\S+))$',
+
+        p5=r'^Options +is +(?P<options>(\S+)) +in +Hello'
+           ' +\(E-bit\)$',
+
+        p6=r'^Options +is +(?P<options>(\S+)) +in +DBD'
+           ' +\(E-bit, O-bit\)$',
+
+        p7=r'^Dead +timer +due +in +(?P<dead_timer>(\S+))$',
+
+        p8=r'^Neighbor +is +up +for +(?P<uptime>(\S+))$',
+
+        p9=r'^Index +(?P<index>(\S+)) +retransmission +queue'
+           ' +length +(?P<ql>(\d+)), +number +of'
+           ' +retransmission +(?P<num_retrans>(\d+))$',
+
+        p10=r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$',
+
+        p11=r'^Last +retransmission +scan +length +is'
+            ' +(?P<num1>(\d+)), +maximum +is'
+            ' +(?P<num2>(\d+))$',
+
+        p12=r'^Last +retransmission +scan +time +is'
+            ' +(?P<num1>(\d+)) +msec, +maximum +is'
+            ' +(?P<num2>(\d+)) +msec$',
+
+        p13=r'^SR +adj +label +(?P<sr_adj_label>\d+)$',
+    )
+
     def cli(self, output=None):
 
         if output is None:
@@ -4688,46 +4759,7 @@ class ShowIpOspfNeighborDetail2(ShowIpOspfNeighborDetail2Schema):
         ret_dict = {}
         af = 'ipv4' # this is ospf - always ipv4
 
-        p1 = re.compile(r'^Neighbor +(?P<neighbor>(\S+)), +interface'
-                            ' +address +(?P<address>(\S+))'
-                            '(?:, +interface-id +(?P<intf_id>(\S+)))?$')
-        
-        p2 = re.compile(r'^In +the +area +(?P<area>(\S+)) +via +interface'
-                            ' +(?P<interface>(\S+))(, +BFD +(?P<bfd_state>\S+))?$')
-        
-        p3 = re.compile(r'^Neighbor +priority +is +(?P<priority>(\d+)),'
-                            ' +State +is +(?P<state>(\S+)),'
-                            ' +(?P<num>(\d+)) +state +changes$')
-        
-        p4 = re.compile(r'^DR +is +(?P<dr_ip_addr>(\S+))'
-                            ' +BDR +is +(?P<bdr_ip_addr>(\S+))$')
-        
-        p5 = re.compile(r'^Options +is +(?P<options>(\S+)) +in +Hello'
-                            ' +\(E-bit\)$')
-        
-        p6 = re.compile(r'^Options +is +(?P<options>(\S+)) +in +DBD'
-                            ' +\(E-bit, O-bit\)$')
-        
-        p7 = re.compile(r'^Dead +timer +due +in +(?P<dead_timer>(\S+))$')
-        
-        p8 = re.compile(r'^Neighbor +is +up +for +(?P<uptime>(\S+))$')
-        
-        p9 = re.compile(r'^Index +(?P<index>(\S+)) +retransmission +queue'
-                            ' +length +(?P<ql>(\d+)), +number +of'
-                            ' +retransmission +(?P<num_retrans>(\d+))$')
-        
-        p10 = re.compile(r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$')
-        
-        p11 = re.compile(r'^Last +retransmission +scan +length +is'
-                            ' +(?P<num1>(\d+)), +maximum +is'
-                            ' +(?P<num2>(\d+))$')
-        
-        p12 = re.compile(r'^Last +retransmission +scan +time +is'
-                            ' +(?P<num1>(\d+)) +msec, +maximum +is'
-                            ' +(?P<num2>(\d+)) +msec$')
-        
-        p13 = re.compile(r'^SR +adj +label +(?P<sr_adj_label>\d+)$')
-        
+        p = ShowIpOspfNeighborDetail2.patterns
         
         for line in out.splitlines():
             line = line.strip()
@@ -4735,7 +4767,7 @@ class ShowIpOspfNeighborDetail2(ShowIpOspfNeighborDetail2Schema):
             # Neighbor 10.16.2.2, interface address 10.1.2.2
             # Neighbor 192.168.111.1, interface address 192.168.70.1, interface-id 192
             # Neighbor 192.168.255.9, interface address 10.0.109.9, interface-id unknown
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 neighbor = str(m.groupdict()['neighbor'])
                 address = str(m.groupdict()['address'])
@@ -4744,7 +4776,7 @@ class ShowIpOspfNeighborDetail2(ShowIpOspfNeighborDetail2Schema):
 
             # In the area 0 via interface GigabitEthernet2
             # In the area 0 via interface TenGigabitEthernet3/1/1, BFD enabled
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 area = str(IPAddress(str(m.groupdict()['area'])))
                 interface = str(m.groupdict()['interface'])
@@ -4779,7 +4811,7 @@ class ShowIpOspfNeighborDetail2(ShowIpOspfNeighborDetail2Schema):
                 continue
 
             # Neighbor priority is 1, State is FULL
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 neighbor_dict['priority'] = int(m.groupdict()['priority'])
                 state = str(m.groupdict()['state']).lower()
@@ -4791,39 +4823,39 @@ class ShowIpOspfNeighborDetail2(ShowIpOspfNeighborDetail2Schema):
                 continue
 
             # DR is 10.2.3.3 BDR is 10.2.3.2
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 neighbor_dict['dr_ip_addr'] = str(m.groupdict()['dr_ip_addr'])
                 neighbor_dict['bdr_ip_addr'] = str(m.groupdict()['bdr_ip_addr'])
                 continue
 
             # Options is 0x2 in Hello (E-bit)
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 neighbor_dict['hello_options'] = str(m.groupdict()['options'])
                 continue
 
             # Options is 0x42 in DBD (E-bit, O-bit)
             # Options is 0x42 in DBD (E-bit, O-bit)
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 neighbor_dict['dbd_options'] = str(m.groupdict()['options'])
                 continue
 
             # Dead timer due in 00:00:38
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 neighbor_dict['dead_timer'] = str(m.groupdict()['dead_timer'])
                 continue
 
             # Neighbor is up for 08:22:07
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 neighbor_dict['uptime'] = str(m.groupdict()['uptime'])
                 continue
 
             # Index 1/2/2, retransmission queue length 0, number of retransmission 0
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 neighbor_dict['index'] = str(m.groupdict()['index'])
                 statistics_dict = neighbor_dict.setdefault('statistics', {})
@@ -4834,14 +4866,14 @@ class ShowIpOspfNeighborDetail2(ShowIpOspfNeighborDetail2Schema):
                 continue
 
             # First 0x0(0)/0x0(0)/0x0(0) Next 0x0(0)/0x0(0)/0x0(0)
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 neighbor_dict['first'] = str(m.groupdict()['first'])
                 neighbor_dict['next'] = str(m.groupdict()['next'])
                 continue
 
             # Last retransmission scan length is 0, maximum is 0
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 statistics_dict = neighbor_dict.setdefault('statistics', {})
                 statistics_dict['last_retrans_scan_length'] = \
@@ -4851,7 +4883,7 @@ class ShowIpOspfNeighborDetail2(ShowIpOspfNeighborDetail2Schema):
                 continue
 
             # Last retransmission scan time is 0 msec, maximum is 0 msec
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 statistics_dict = neighbor_dict.setdefault('statistics', {})
                 statistics_dict['last_retrans_scan_time_msec'] = \
@@ -4861,7 +4893,7 @@ class ShowIpOspfNeighborDetail2(ShowIpOspfNeighborDetail2Schema):
                 continue
 
             # SR adj label 10
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 neighbor_dict['sr_adj_label'] = str(m.groupdict()['sr_adj_label'])
                 continue
@@ -4934,6 +4966,28 @@ class ShowIpOspfDatabase(ShowIpOspfDatabaseSchema):
     cli_command = 'show ip ospf database'
     exclude = ['age']
 
+    patterns = Patterns(
+        # OSPF Router with ID (172.16.1.214) (Process ID 65109)
+        # OSPF Router with ID (10.36.3.3) (Process ID 1, VRF VRF1)
+        p1=r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+           ' +\(Process +ID +(?P<instance>(\d+))'
+           '(?:, +VRF +(?P<vrf>(\S+)))?\)$',
+
+        # Router Link States (Area 0)
+        # Net Link States (Area 0)
+        # Summary Net Link States (Area 8)
+        # Summary ASB Link States (Area 8)
+        p2=r'^(?P<lsa_type>([a-zA-Z\s]+)) +Link +States +\(Area'
+           ' +(?P<area>(\S+))\)$',
+
+        # Link ID         ADV Router      Age         Seq#       Checksum Link count
+        # 10.13.202.64    10.120.202.64   2794        0x80000043 0x002254 3
+        # 10.1.1.2        10.169.197.253  70          0x8000003F 0x0015EF
+        p3=r'^(?P<link_id>(\S+)) +(?P<adv_router>(\S+))'
+           ' +(?P<age>(\d+)) +(?P<seq>(\S+)) +(?P<checksum>(\S+))'
+           '(?: *(?P<link_count>(\d+)))?$',
+    )
+
     def cli(self, output=None):
 
         if output is None:
@@ -4965,25 +5019,7 @@ class ShowIpOspfDatabase(ShowIpOspfDatabaseSchema):
             'opaque': 10,
             }
 
-        # OSPF Router with ID (172.16.1.214) (Process ID 65109)
-        # OSPF Router with ID (10.36.3.3) (Process ID 1, VRF VRF1)
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                         ' +\(Process +ID +(?P<instance>(\d+))'
-                         '(?:, +VRF +(?P<vrf>(\S+)))?\)$')
-
-        # Router Link States (Area 0)
-        # Net Link States (Area 0)
-        # Summary Net Link States (Area 8)
-        # Summary ASB Link States (Area 8)
-        p2 = re.compile(r'^(?P<lsa_type>([a-zA-Z\s]+)) +Link +States +\(Area'
-                         ' +(?P<area>(\S+))\)$')
-
-        # Link ID         ADV Router      Age         Seq#       Checksum Link count
-        # 10.13.202.64    10.120.202.64   2794        0x80000043 0x002254 3
-        # 10.1.1.2        10.169.197.253  70          0x8000003F 0x0015EF
-        p3 = re.compile(r'^(?P<link_id>(\S+)) +(?P<adv_router>(\S+))'
-                         ' +(?P<age>(\d+)) +(?P<seq>(\S+)) +(?P<checksum>(\S+))'
-                         '(?: *(?P<link_count>(\d+)))?$')
+        p = ShowIpOspfDatabase.patterns
 
         for line in out.splitlines():
             line = line.strip()
@@ -4992,7 +5028,7 @@ class ShowIpOspfDatabase(ShowIpOspfDatabaseSchema):
             # Time source is NTP, 20:29:26.348 EST Fri Nov 11 2016
 
             # OSPF Router with ID (10.36.3.3) (Process ID 1, VRF VRF1)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 router_id = str(group['router_id'])
@@ -5014,7 +5050,7 @@ class ShowIpOspfDatabase(ShowIpOspfDatabaseSchema):
             # Net Link States (Area 0)
             # Summary Net Link States (Area 8)
             # Summary ASB Link States (Area 8)
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 lsa_type_key = group['lsa_type'].lower()
@@ -5046,7 +5082,7 @@ class ShowIpOspfDatabase(ShowIpOspfDatabaseSchema):
             # Link ID         ADV Router      Age         Seq#       Checksum Link count
             # 10.13.202.64    10.120.202.64   2794        0x80000043 0x002254 3
             # 10.1.1.2        10.169.197.253  70          0x8000003F 0x0015EF
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 lsa_id = group['link_id']
@@ -5092,243 +5128,247 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
         * 'show ip ospf database opaque-area self-originate''
     '''
 
-    def cli(self, db_type, out=None):
+    patterns = Patterns(
+        p1=r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+           ' +\(Process +ID +(?P<instance>(\d+))'
+           '(?:, +VRF +(?P<vrf>(\S+)))?\)$',
 
-        assert db_type in ['external', 'network', 'summary', 'router',
-                           'opaque']
+        p2=r'^(?P<lsa_type_name>(.*)) +Link +States'
+           '(?: +\(Area +(?P<area>(\S+))\))?$',
 
-        # Init vars
-        ret_dict = {}
-        af = 'ipv4'
-        default_mt_id = 0
-        capabilities_flag = False
-        tlv_type_flag = False
-        sub_tlv_type_flag = False
+        p3_1=r'^Routing +Bit +Set +on +this +LSA$',
 
-        # Router
-        # Network Link
-        # Summary Network
-        # Opaque Area
-        # Type-5 AS External
-        lsa_type_mapping = {
-            'router': 1,
-            'network': 2,
-            'summary': 3,
-            'external': 5,
-            'opaque': 10,
-            }
+        p3_2=r'^LS +age: +(?P<age>(\d+))$',
+
+        p3_2_1=r'^LS +age: +\w+\((?P<age>(\d+))\)$',
+
+        p4=r'^Options:(?: +(?P<option>([a-zA-Z0-9]+)))?'
+           '(?: *\((?P<option_desc>(.*))\))?$',
+
+        p5_1=r'^LS +Type: +(?P<lsa_type>(.*))$',
+
+        p5_2=r'^Link +State +ID: +(?P<lsa_id>(\S+))'
+             '(?: +\(.*\))?$',
+
+        p6=r'^Advertising +Router: +(?P<adv_router>(\S+))$',
+
+        p7=r'^LS +Seq +Number: +(?P<ls_seq_num>(\S+))$',
+
+        p8=r'^Checksum: +(?P<checksum>(\S+))$',
+
+        p9=r'^Length *: +(?P<length>(\d+))$',
+
+        p10=r'^Network +Mask: +\/(?P<net_mask>(\S+))$',
+
+        p11_1=r'^Metric +Type: +2 +\(.*\)$',
+
+        p11_2=r'^Metric +Type: +1 +\(.*\)$',
+
+        p12=r'^TOS:? +(?P<tos>(\d+))(?:(\s+|\t+)Metric(?:s)?:'
+            ' +(?P<metric>(\d+)))?$',
+
+        p13=r'^Metric: +(?P<metric>(\d+))$',
+
+        p14=r'^Forward +Address: +(?P<addr>(\S+))$',
+
+        p15=r'^External +Route +Tag: +(?P<tag>(\d+))$',
+
+        p16=r'^Attached +Router: +(?P<att_router>(\S+))$',
+
+        p17=r'^Number +of +(l|L)inks *: +(?P<num>(\d+))$',
+
+        p18=r'^Link +connected +to: +a +(?P<type>(.*))$',
+
+        p18_1=r'^Link\s+connected +to\s*: +(?P<type>(.*))$',
+
+        p19_1=r'^\(Link +ID\) +Network\/(s|S)ubnet +(n|N)umber:'
+              ' +(?P<link_id>(\S+))$',
+
+        p19_2=r'^\(Link +ID\) +(D|d)esignated +(R|r)outer'
+              ' +(a|A)ddress: +(?P<link_id>(\S+))$',
+
+        p19_3=r'^\(Link +ID\) +(N|n)eighboring +(R|r)outer'
+              ' +(I|d)D: +(?P<link_id>(\S+))$',
+
+        p20_1=r'^\(Link +Data\) +Network +Mask:'
+              ' +(?P<link_data>(\S+))$',
+
+        p20_2=r'^\(Link +Data\) +Router +Interface +address:'
+              ' +(?P<link_data>(\S+))$',
 
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                            ' +\(Process +ID +(?P<instance>(\d+))'
-                            '(?:, +VRF +(?P<vrf>(\S+)))?\)$')
-       
-        p2 = re.compile(r'^(?P<lsa_type_name>(.*)) +Link +States'
-                            '(?: +\(Area +(?P<area>(\S+))\))?$')
-       
-        p3_1 = re.compile(r'^Routing +Bit +Set +on +this +LSA$')
-       
-        p3_2 = re.compile(r'^LS +age: +(?P<age>(\d+))$')
-       
-        p3_2_1 = re.compile(r'^LS +age: +\w+\((?P<age>(\d+))\)$')
-       
-        p4 = re.compile(r'^Options:(?: +(?P<option>([a-zA-Z0-9]+)))?'
-                        '(?: *\((?P<option_desc>(.*))\))?$')
-       
-        p5_1 = re.compile(r'^LS +Type: +(?P<lsa_type>(.*))$')
-       
-        p5_2 = re.compile(r'^Link +State +ID: +(?P<lsa_id>(\S+))'
-                            '(?: +\(.*\))?$')
-       
-        p6 = re.compile(r'^Advertising +Router: +(?P<adv_router>(\S+))$')
-       
-        p7 = re.compile(r'^LS +Seq +Number: +(?P<ls_seq_num>(\S+))$')
-       
-        p8 = re.compile(r'^Checksum: +(?P<checksum>(\S+))$')
-       
-        p9 = re.compile(r'^Length *: +(?P<length>(\d+))$')
-       
-        p10 = re.compile(r'^Network +Mask: +\/(?P<net_mask>(\S+))$')
-       
-        p11_1 = re.compile(r'^Metric +Type: +2 +\(.*\)$')
-       
-        p11_2 = re.compile(r'^Metric +Type: +1 +\(.*\)$')
-       
-        p12 = re.compile(r'^TOS:? +(?P<tos>(\d+))(?:(\s+|\t+)Metric(?:s)?:'
-                            ' +(?P<metric>(\d+)))?$')
-       
-        p13 = re.compile(r'^Metric: +(?P<metric>(\d+))$')
-       
-        p14 = re.compile(r'^Forward +Address: +(?P<addr>(\S+))$')
-       
-        p15 = re.compile(r'^External +Route +Tag: +(?P<tag>(\d+))$')
-       
-        p16 = re.compile(r'^Attached +Router: +(?P<att_router>(\S+))$')
-       
-        p17 = re.compile(r'^Number +of +(l|L)inks *: +(?P<num>(\d+))$')
-       
-        p18 = re.compile(r'^Link +connected +to: +a +(?P<type>(.*))$')
-       
-        p18_1 = re.compile(r'^Link\s+connected +to\s*: +(?P<type>(.*))$')
-       
-        p19_1 = re.compile(r'^\(Link +ID\) +Network\/(s|S)ubnet +(n|N)umber:'
-                            ' +(?P<link_id>(\S+))$')
-       
-        p19_2 = re.compile(r'^\(Link +ID\) +(D|d)esignated +(R|r)outer'
-                            ' +(a|A)ddress: +(?P<link_id>(\S+))$')
-       
-        p19_3 = re.compile(r'^\(Link +ID\) +(N|n)eighboring +(R|r)outer'
-                            ' +(I|d)D: +(?P<link_id>(\S+))$')
-       
-        p20_1 = re.compile(r'^\(Link +Data\) +Network +Mask:'
-                            ' +(?P<link_data>(\S+))$')
-       
-        p20_2 = re.compile(r'^\(Link +Data\) +Router +Interface +address:'
-                            ' +(?P<link_data>(\S+))$')
-       
         # MTID 32 Metrics: 1
         # MTID   : 0
-        p21 = re.compile(r'MTID\s*:*\s*(?P<mtid>\d+)\s*(?:(Metrics*\s*:*\s*(?P<metric>\d+)))?')
-       
-        p21_1 = re.compile(r'^Number +of +MTID +metrics: +(?P<num>(\d+))$')
-       
-        p22 = re.compile(r'^Opaque +Type: +(?P<type>(\d+))(?: +\((Traffic Engineering)\))?$')
-       
-        p23 = re.compile(r'^Opaque +ID: +(?P<id>(\d+))$')
-       
-        p24 = re.compile(r'^Fragment +number *: +(?P<num>(\d+))$')
-       
-        p25 = re.compile(r'^MPLS +TE +router +ID *: +(?P<mpls>(\S+))$')
-       
-        p26_1 = re.compile(r'^AS +Boundary +Router$')
-       
-        p26_2 = re.compile(r'^Area +Border +Router$')
-       
-        p27 = re.compile(r'^Link +connected +to\s*\:*\s+(?P<link>(.*))$')
-       
-        p28 = re.compile(r'^Link +ID *: +(?P<id>(\S+))$')
-       
-        p29 = re.compile(r'^Interface +Address *: +(?P<addr>(\S+))$')
-       
-        p30 = re.compile(r'^Admin +Metric *: +(?P<te_metric>(\d+))$')
-       
-        p31 = re.compile(r'^Maximum +(B|b)andwidth *:'
-                            ' +(?P<max_band>(\d+))$')
-       
-        p32 = re.compile(r'^Maximum +(R|r)eservable +(B|b)andwidth'
-                            '(?: +global)? *: +(?P<max_res_band>(\d+))$')
-       
-        p33 = re.compile(r'^Affinity +Bit *: +(?P<admin_group>(\S+))$')
-       
-        p33_1 = re.compile(r'^IGP +Metric *: +(?P<igp_metric>(\d+))$')
-       
-        p33_2 = re.compile(r'^Number +of +Priority *: +(?P<num>(\d+))$')
-       
-        p34 = re.compile(r'^Priority +(?P<num1>(\d+)) *:'
-                            ' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
-                            ' *: +(?P<band2>(\d+)))?$')
-       
-        p35 = re.compile(r'^Unknown +Sub-TLV *: +Type += +(?P<type>(\d+)),'
-                            ' +Length += +(?P<length>(\d+))'
-                            ' +Value += +(?P<value>(.*))$')
-       
-        p36 = re.compile(r'^Extended +Administrative +Group *: +Length *:'
-                            ' +(?P<eag_length>(\d+))$')
-       
-        p37 = re.compile(r'^EAG\[(?P<group_num>(\d+))\]: +(?P<val>(\d+))$')
+        p21=r'MTID\s*:*\s*(?P<mtid>\d+)\s*(?:(Metrics*\s*:*\s*(?P<metric>\d+)))?',
+
+        p21_1=r'^Number +of +MTID +metrics: +(?P<num>(\d+))$',
+
+        p22=r'^Opaque +Type: +(?P<type>(\d+))(?: +\((Traffic Engineering)\))?$',
+
+        p23=r'^Opaque +ID: +(?P<id>(\d+))$',
+
+        p24=r'^Fragment +number *: +(?P<num>(\d+))$',
+
+        p25=r'^MPLS +TE +router +ID *: +(?P<mpls>(\S+))$',
+
+        p26_1=r'^AS +Boundary +Router$',
+
+        p26_2=r'^Area +Border +Router$',
+
+        p27=r'^Link +connected +to\s*\:*\s+(?P<link>(.*))$',
+
+        p28=r'^Link +ID *: +(?P<id>(\S+))$',
+
+        p29=r'^Interface +Address *: +(?P<addr>(\S+))$',
+
+        p30=r'^Admin +Metric *: +(?P<te_metric>(\d+))$',
+
+        p31=r'^Maximum +(B|b)andwidth *:'
+            ' +(?P<max_band>(\d+))$',
+
+        p32=r'^Maximum +(R|r)eservable +(B|b)andwidth'
+            '(?: +global)? *: +(?P<max_res_band>(\d+))$',
+
+        p33=r'^Affinity +Bit *: +(?P<admin_group>(\S+))$',
+
+        p33_1=r'^IGP +Metric *: +(?P<igp_metric>(\d+))$',
+
+        p33_2=r'^Number +of +Priority *: +(?P<num>(\d+))$',
+
+        p34=r'^Priority +(?P<num1>(\d+)) *:'
+            ' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
+            ' *: +(?P<band2>(\d+)))?$',
+
+        p35=r'^Unknown +Sub-TLV *: +Type += +(?P<type>(\d+)),'
+            ' +Length += +(?P<length>(\d+))'
+            ' +Value += +(?P<value>(.*))$',
+
+        p36=r'^Extended +Administrative +Group *: +Length *:'
+            ' +(?P<eag_length>(\d+))$',
+
+        p37=r'^EAG\[(?P<group_num>(\d+))\]: +(?P<val>(\d+))$',
 
         # Neighbor Address : 192.168.220.2
-        p38 = re.compile(r'Neighbor\s+Address\s*:\s*(?P<neighbor_address>\S+)')
+        p38=r'Neighbor\s+Address\s*:\s*(?P<neighbor_address>\S+)',
 
         # TLV Type: Router Information
         # TLV Type: Segment Routing Algorithm
-        p39 = re.compile(r'TLV\s+Type\s*:\s*(?P<tlv_type>.+)')
+        p39=r'TLV\s+Type\s*:\s*(?P<tlv_type>.+)',
 
         # Router Information
-        p39_1 = re.compile(r'(R|r)outer\s+(I|i)nformation')
+        p39_1=r'(R|r)outer\s+(I|i)nformation',
 
         # Segment Routing Algorithm
-        p39_2 = re.compile(r'(S|s)egment\s+(R|r)outing\s+(A|a)lgorithm')
+        p39_2=r'(S|s)egment\s+(R|r)outing\s+(A|a)lgorithm',
 
         # Segment Routing Range
-        p39_3 = re.compile(r'(S|s)egment\s+(R|r)outing\s+(R|r)ange')
+        p39_3=r'(S|s)egment\s+(R|r)outing\s+(R|r)ange',
 
         # Segment Routing Node MSD
-        p39_4 = re.compile(r'(S|s)egment\s+(R|r)outing\s+(N|n)ode\s+MSD')
+        p39_4=r'(S|s)egment\s+(R|r)outing\s+(N|n)ode\s+MSD',
 
         # Segment Routing Local Block
-        p39_5 = re.compile(r'(S|s)egment\s+(R|r)outing\s+(L|l)ocal\s+(B|b)lock')
+        p39_5=r'(S|s)egment\s+(R|r)outing\s+(L|l)ocal\s+(B|b)lock',
 
         # Extended Prefix
-        p39_6 = re.compile(r'(E|e)xtended\s+(P|p)refix')
+        p39_6=r'(E|e)xtended\s+(P|p)refix',
 
         # Extended Link
-        p39_7 = re.compile(r'(E|e)xtended\s+(L|l)ink')
+        p39_7=r'(E|e)xtended\s+(L|l)ink',
 
         # Algorithm: SPF
         # Algorithm: Strict SPF
-        p40 = re.compile(r'Algo(?:(rithm))?\s*:\s*(?P<algorithm>.+)')
+        p40=r'Algo(?:(rithm))?\s*:\s*(?P<algorithm>.+)',
 
         # Range Size: 1000
-        p41 = re.compile(r'Range\s+Size\s*:\s*(?P<range_size>\d+)')
+        p41=r'Range\s+Size\s*:\s*(?P<range_size>\d+)',
 
         # Flags  : L-Bit, V-bit
-        p42 = re.compile(r'Flags\s*\:\s*(?P<flags>.+)')        
+        p42=r'Flags\s*\:\s*(?P<flags>.+)',
 
         # Weight : 0
-        p44 = re.compile(r'Weight\s*:\s*(?P<weight>\d+)')
+        p44=r'Weight\s*:\s*(?P<weight>\d+)',
 
         # Label  : 19
-        p45 = re.compile(r'Label\s*:\s*(?P<label>\d+)')       
-        
+        p45=r'Label\s*:\s*(?P<label>\d+)',
+
         # (Link Data) Interface IP address: 192.168.220.1
-        p46 = re.compile(r'\(Link\s+Data\)\s+Interface\s+IP\s+address\s*:\s*(?P<link_data>\S+)')
+        p46=r'\(Link\s+Data\)\s+Interface\s+IP\s+address\s*:\s*(?P<link_data>\S+)',
 
         # Prefix    : 10.4.1.1/32
-        p47 = re.compile(r'Prefix\s*:\s*(?P<prefix>\S+)')
+        p47=r'Prefix\s*:\s*(?P<prefix>\S+)',
 
         # AF        : 0
-        p48 = re.compile(r'AF\s*:\s*(?P<af>\S+)')
+        p48=r'AF\s*:\s*(?P<af>\S+)',
 
         # Route-type: Intra
-        p49 = re.compile(r'Route\-type\s*:\s*(?P<route_type>.+)')
+        p49=r'Route\-type\s*:\s*(?P<route_type>.+)',
 
         # Sub-TLV Type: Remote Intf Addr
         # Sub-TLV Type: Local / Remote Intf ID
-        p50 = re.compile(r'Sub\-TLV\s+Type\s*:\s*(?P<sub_tlv_type>.+)')
+        p50=r'Sub\-TLV\s+Type\s*:\s*(?P<sub_tlv_type>.+)',
 
         # Remote Interface Address   : 192.168.0.1
-        p51 = re.compile(r'Remote\s+Interface\s+Address\s*:\s*(?P<remote_interface_address>\S+)')
+        p51=r'Remote\s+Interface\s+Address\s*:\s*(?P<remote_interface_address>\S+)',
 
         # Local Interface ID   : 20
-        p52 = re.compile(r'Local\s+Interface\s+ID\s*:\s*(?P<local_interface_id>\S+)')
+        p52=r'Local\s+Interface\s+ID\s*:\s*(?P<local_interface_id>\S+)',
 
         # Remote Interface ID   : 20
-        p53 = re.compile(r'Remote\s+Interface\s+ID\s*:\s*(?P<remote_interface_id>\S+)')
+        p53=r'Remote\s+Interface\s+ID\s*:\s*(?P<remote_interface_id>\S+)',
 
         # SID   : 1
-        p54 = re.compile(r'SID\s*:\s*(?P<sid>\S+)')
+        p54=r'SID\s*:\s*(?P<sid>\S+)',
 
-        # Graceful Restart Helper                
-        p55 = re.compile(r'(G|g)raceful\s+(R|r)estart\s+(H|h)elper')
+        # Graceful Restart Helper
+        p55=r'(G|g)raceful\s+(R|r)estart\s+(H|h)elper',
 
         # Stub Router Support
-        p56 = re.compile(r'(S|s)tub\s+(R|r)outer\s+(S|s)upport')
+        p56=r'(S|s)tub\s+(R|r)outer\s+(S|s)upport',
 
         # SPF
-        p57 = re.compile(r'SPF')
+        p57=r'SPF',
 
         # Strict SPF
-        p58 = re.compile(r'Strict\s+SPF')
+        p58=r'Strict\s+SPF',
+
+        # Sub-type: Node Max Sid Depth, Value: 13
+        p59=r'Sub\-type\s*:\s*Node\s+Max\s+Sid\s+Depth\,\s+Value:\s*(?P<value>\d+)',
+    )
+
+    def cli(self, db_type, out=None):
+
+        assert db_type in ['external', 'network', 'summary', 'router',
+                           'opaque']
+
+        # Init vars
+        ret_dict = {}
+        af = 'ipv4'
+        default_mt_id = 0
+        capabilities_flag = False
+        tlv_type_flag = False
+        sub_tlv_type_flag = False
 
-        # Sub-type: Node Max Sid Depth, Value: 13
-        p59 = re.compile(r'Sub\-type\s*:\s*Node\s+Max\s+Sid\s+Depth\,\s+Value:\s*(?P<value>\d+)')
+        # Router
+        # Network Link
+        # Summary Network
+        # Opaque Area
+        # Type-5 AS External
+        lsa_type_mapping = {
+            'router': 1,
+            'network': 2,
+            'summary': 3,
+            'external': 5,
+            'opaque': 10,
+            }
 
+        p = ShowIpOspfDatabaseTypeParser.patterns
+       
         for line in out.splitlines():
             line = line.strip()
 
             # OSPF Router with ID (10.36.3.3) (Process ID 1)
             # OSPF Router with ID (10.36.3.3) (Process ID 1, VRF VRF1)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 router_id = str(m.groupdict()['router_id'])
                 instance = str(m.groupdict()['instance'])
@@ -5357,7 +5397,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
             # Summary Net Link States (Area 0.0.0.0)
             # Type-5 AS External Link States
             # Type-10 Opaque Link Area Link States (Area 0)
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 lsa_type = lsa_type_mapping[db_type]
                 
@@ -5405,13 +5445,13 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Routing Bit Set on this LSA
-            m = p3_1.match(line)
+            m = p.p3_1.match(line)
             if m:
                 routing_bit_enable = True
                 continue
 
             # LS age: 1565
-            m = p3_2.match(line)
+            m = p.p3_2.match(line)
             if m:
                 tlv_type_flag = False
                 sub_tlv_type_flag = False
@@ -5419,7 +5459,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # LS age: MAXAGE(3601)
-            m = p3_2_1.match(line)
+            m = p.p3_2_1.match(line)
             if m:
                 tlv_type_flag = False
                 sub_tlv_type_flag = False
@@ -5428,14 +5468,14 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
 
             # Options: 0x20 (No TOS-capability, DC)
             # Options: (No TOS-capability, DC)
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 option = str(m.groupdict()['option'])
                 option_desc = str(m.groupdict()['option_desc'])
                 continue
 
             # LS Type: Type-5 AS-External
-            m = p5_1.match(line)
+            m = p.p5_1.match(line)
             if m:
                 lsa_type = lsa_type_mapping[db_type]
                 continue
@@ -5444,13 +5484,13 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
             # Link State ID: 10.94.44.44 (Network address)
             # Link State ID: 10.1.2.1 (Designated Router address)
             # Link State ID: 10.1.2.1 (address of Designated Router)
-            m = p5_2.match(line)
+            m = p.p5_2.match(line)
             if m:
                 lsa_id = str(m.groupdict()['lsa_id'])
                 continue
 
             # Advertising Router: 10.64.4.4
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 adv_router = str(m.groupdict()['adv_router'])
                 lsa = '{} {}'.format(lsa_id, adv_router)
@@ -5543,20 +5583,20 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                     pass
 
             # LS Seq Number: 0x80000002
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 header_dict['seq_num'] = str(m.groupdict()['ls_seq_num'])
                 continue
 
             # Checksum: 0x7d61
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 header_dict['checksum'] = str(m.groupdict()['checksum'])
                 continue
 
             # Length: 36
             # Length : 36
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 length = int(m.groupdict()['length'])
                 if sub_tlv_type_flag:
@@ -5568,7 +5608,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Network Mask: /32
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 dummy = '{}/{}'.format('0.0.0.0', m.groupdict()['net_mask'])
                 db_dict['network_mask'] = str(IPNetwork(dummy).netmask)
@@ -5576,20 +5616,20 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
 
             # Metric Type: 2 (Larger than any link state path)
             # Metric Type: 2 (Larger than any link state path)
-            m = p11_1.match(line)
+            m = p.p11_1.match(line)
             if m:
                 db_topo_dict['flags'] = "E"
                 continue
 
             # Metric Type: 1 (Comparable directly to link state metric)
-            m = p11_2.match(line)
+            m = p.p11_2.match(line)
             if m:
                 # Do nothing
                 continue
 
             # TOS: 0
             # TOS: 0 Metric: 1
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 if db_type == 'router':
                     if m.groupdict()['tos']:
@@ -5606,25 +5646,25 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                         continue
 
             # Metric: 20
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 db_topo_dict['metric'] = int(m.groupdict()['metric'])
                 continue
 
             # Forward Address: 0.0.0.0
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 db_topo_dict['forwarding_address'] = str(m.groupdict()['addr'])
                 continue
 
             # External Route Tag: 0
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 db_topo_dict['external_route_tag'] = int(m.groupdict()['tag'])
                 continue
 
             # Attached Router: 10.84.66.66
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 attached_router = str(m.groupdict()['att_router'])
                 if 'attached_routers' not in db_dict:
@@ -5635,19 +5675,19 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
 
             # Number of links: 3
             # Number of Links: 3
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 db_dict['num_of_links'] = int(m.groupdict()['num'])
                 continue
 
             # Link connected to: a Stub Network
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 link_type = str(m.groupdict()['type']).lower()
                 continue
 
             # Link connected to: another Router (point-to-point)
-            m = p18_1.match(line)
+            m = p.p18_1.match(line)
             if m:
                 if tlv_type_flag:                    
                     sub_link_type = str(m.groupdict()['type']).lower()
@@ -5661,7 +5701,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # (Link ID) Network/subnet number: 10.4.1.1
-            m = p19_1.match(line)
+            m = p.p19_1.match(line)
             if m:
                 link_id = str(m.groupdict()['link_id'])
 
@@ -5687,7 +5727,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # (Link ID) Designated Router address: 10.166.7.6
-            m = p19_2.match(line)
+            m = p.p19_2.match(line)
             if m:
                 link_id = str(m.groupdict()['link_id'])
 
@@ -5718,7 +5758,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # (Link ID) Neighboring Router ID: 10.151.22.22
-            m = p19_3.match(line)
+            m = p.p19_3.match(line)
             if m:
                 link_id = str(m.groupdict()['link_id'])
 
@@ -5748,14 +5788,14 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # (Link Data) Network Mask: 255.255.255.255
-            m = p20_1.match(line)
+            m = p.p20_1.match(line)
             if m:
                 db_dict['links'][link_id]['link_data'] = \
                     str(m.groupdict()['link_data'])
                 continue
 
             # (Link Data) Router Interface address: 10.166.7.6
-            m = p20_2.match(line)
+            m = p.p20_2.match(line)
             if m:
                 db_dict['links'][link_id]['link_data'] = \
                     str(m.groupdict()['link_data'])
@@ -5763,7 +5803,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
 
             # MTID 32 Metrics: 1
             # MTID   : 0
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 mtid = int(m.groupdict()['mtid'])
 
@@ -5788,7 +5828,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Number of MTID metrics: 0
-            m = p21_1.match(line)
+            m = p.p21_1.match(line)
             if m:
                 db_dict['links'][link_id]['num_mtid_metrics'] = \
                     int(m.groupdict()['num'])
@@ -5803,43 +5843,43 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Opaque Type: 1
-            m = p22.match(line)
+            m = p.p22.match(line)
             if m:
                 opaque_type = int(m.groupdict()['type'])
                 continue
             
             # Opaque ID: 38
-            m = p23.match(line)
+            m = p.p23.match(line)
             if m:
                 opaque_id = int(m.groupdict()['id'])
                 continue
 
             # Fragment number: 0
-            m = p24.match(line)
+            m = p.p24.match(line)
             if m:
                 header_dict['fragment_number'] = int(m.groupdict()['num'])
                 continue
 
             # MPLS TE router ID : 10.4.1.1
-            m = p25.match(line)
+            m = p.p25.match(line)
             if m:
                 db_dict['mpls_te_router_id'] = str(m.groupdict()['mpls'])
                 continue
 
             # AS Boundary Router
-            m = p26_1.match(line)
+            m = p.p26_1.match(line)
             if m:
                 header_dict['as_boundary_router'] = True
                 continue
 
             # Area Border Router
-            m = p26_2.match(line)
+            m = p.p26_2.match(line)
             if m:
                 header_dict['area_border_router'] = True
                 continue
 
             # Link connected to Broadcast network
-            m = p27.match(line)
+            m = p.p27.match(line)
             if m:
                 link_tlv_counter += 1
                 if 'link_tlvs' not in db_dict:
@@ -5869,14 +5909,14 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Link ID : 10.1.4.4
-            m = p28.match(line)
+            m = p.p28.match(line)
             if m:
                 db_dict['link_tlvs'][link_tlv_counter]['link_id'] = \
                     str(m.groupdict()['id'])
                 continue
 
             # Interface Address : 10.1.4.1
-            m = p29.match(line)
+            m = p.p29.match(line)
             if m:
                 addr = str(m.groupdict()['addr'])
                 if 'local_if_ipv4_addrs' not in db_dict['link_tlvs']\
@@ -5890,7 +5930,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                     continue
 
             # Admin Metric : 1
-            m = p30.match(line)
+            m = p.p30.match(line)
             if m:
                 db_dict['link_tlvs'][link_tlv_counter]['te_metric'] = \
                     int(m.groupdict()['te_metric'])
@@ -5898,7 +5938,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
 
             # Maximum Bandwidth : 125000000
             # Maximum bandwidth : 125000000
-            m = p31.match(line)
+            m = p.p31.match(line)
             if m:
                 db_dict['link_tlvs'][link_tlv_counter]['max_bandwidth'] = \
                     int(m.groupdict()['max_band'])
@@ -5906,7 +5946,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
 
             # Maximum reservable bandwidth : 93750000
             # Maximum reservable bandwidth global: 93750000
-            m = p32.match(line)
+            m = p.p32.match(line)
             if m:
                 db_dict['link_tlvs'][link_tlv_counter]\
                     ['max_reservable_bandwidth'] = \
@@ -5914,28 +5954,28 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Affinity Bit : 0x0
-            m = p33.match(line)
+            m = p.p33.match(line)
             if m:
                 db_dict['link_tlvs'][link_tlv_counter]['admin_group'] = \
                     str(m.groupdict()['admin_group'])
                 continue
 
             # IGP Metric : 1
-            m = p33_1.match(line)
+            m = p.p33_1.match(line)
             if m:
                 db_dict['link_tlvs'][link_tlv_counter]['igp_metric'] = \
                     int(m.groupdict()['igp_metric'])
                 continue
 
             # Number of Priority : 8
-            m = p33_2.match(line)
+            m = p.p33_2.match(line)
             if m:
                 db_dict['link_tlvs'][link_tlv_counter]['total_priority'] = \
                     int(m.groupdict()['num'])
                 continue
             
             # Priority 0 : 93750000    Priority 1 : 93750000
-            m = p34.match(line)
+            m = p.p34.match(line)
             if m:
                 value1 = '{} {}'.format(str(m.groupdict()['num1']), str(m.groupdict()['band1']))
                 value2 = '{} {}'.format(str(m.groupdict()['num2']), str(m.groupdict()['band2']))
@@ -5966,7 +6006,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                     continue
 
             # Unknown Sub-TLV   :  Type = 32770, Length = 4 Value = 00 00 00 01
-            m = p35.match(line)
+            m = p.p35.match(line)
             if m:
                 unknown_tlvs_counter += 1
                 if 'unknown_tlvs' not in db_dict['link_tlvs'][link_tlv_counter]:
@@ -5984,7 +6024,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Extended Administrative Group : Length: 8
-            m = p36.match(line)
+            m = p.p36.match(line)
             if m:
                 if 'extended_admin_group' not in db_dict['link_tlvs']\
                         [link_tlv_counter]:
@@ -5995,7 +6035,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # EAG[0]: 0
-            m = p37.match(line)
+            m = p.p37.match(line)
             if m:
                 group_num = int(m.groupdict()['group_num'])
                 if 'groups' not in db_dict['link_tlvs'][link_tlv_counter]\
@@ -6011,7 +6051,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Neighbor Address : 192.168.220.2
-            m = p38.match(line)
+            m = p.p38.match(line)
             if m:
                 db_dict['link_tlvs'][link_tlv_counter]['remote_if_ipv4_addrs'] = {m.groupdict()['neighbor_address']: {}}
                 
@@ -6019,7 +6059,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
 
             # TLV Type: Extended Link
             # TLV Type: Segment Routing Node MSD
-            m = p39.match(line)
+            m = p.p39.match(line)
             if m:
                 tlv_type_flag = True
                 sub_tlv_type_flag = False
@@ -6028,31 +6068,31 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 tlv_type = group['tlv_type']
                 
                 # Router Information
-                if p39_1.match(tlv_type):
+                if p.p39_1.match(tlv_type):
                     tlv_type_field = 'router_capabilities_tlv'
 
                 # Segment Routing Algorithm
-                elif p39_2.match(tlv_type):
+                elif p.p39_2.match(tlv_type):
                     tlv_type_field = 'sr_algorithm_tlv'
 
                 # Segment Routing Range
-                elif p39_3.match(tlv_type):
+                elif p.p39_3.match(tlv_type):
                     tlv_type_field = 'sid_range_tlvs'
 
                 # Segment Routing Node MSD
-                elif p39_4.match(tlv_type):
+                elif p.p39_4.match(tlv_type):
                     tlv_type_field = 'node_msd_tlvs'
 
                 # Segment Routing Local Block
-                elif p39_5.match(tlv_type):
+                elif p.p39_5.match(tlv_type):
                     tlv_type_field = 'local_block_tlvs'
 
                 # Extended Prefix
-                elif p39_6.match(tlv_type):
+                elif p.p39_6.match(tlv_type):
                     tlv_type_field = 'extended_prefix_tlvs'
 
                 # Extended Link
-                elif p39_7.match(tlv_type):
+                elif p.p39_7.match(tlv_type):
                     tlv_type_field = 'extended_link_tlvs'
                 
                 tlv_types_index = db_dict.get(tlv_type_field, {}).keys()
@@ -6082,11 +6122,11 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 capability_field = None
 
                 # Graceful Restart Helper
-                if p55.match(line):
+                if p.p55.match(line):
                     capability_field = 'graceful_restart_helper'
 
                 # Stub Router Support
-                elif p56.match(line):
+                elif p.p56.match(line):
                     capability_field = 'stub_router'
 
                 if not capability_field:
@@ -6101,7 +6141,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
 
             # Algorithm: SPF
             # Algorithm: Strict SPF
-            m = p40.match(line)
+            m = p.p40.match(line)
             if m:
                 group = m.groupdict()
                 algorithm = group['algorithm']
@@ -6114,11 +6154,11 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 algo_field = None
 
                 # SPF
-                if p57.match(algorithm):
+                if p.p57.match(algorithm):
                     algo_field = 'spf'
 
                 # Strict SPF
-                if p58.match(algorithm):
+                if p.p58.match(algorithm):
                     algo_field = 'strict_spf'
 
                 if not algo_field:
@@ -6130,7 +6170,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Range Size: 1000
-            m = p41.match(line)
+            m = p.p41.match(line)
             if m:
                 group = m.groupdict()
                 range_size = group['range_size']
@@ -6139,7 +6179,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Flags  : L-Bit, V-bit
-            m = p42.match(line)
+            m = p.p42.match(line)
             if m:
                 group = m.groupdict()
                 flags = group['flags']
@@ -6153,7 +6193,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Weight : 0
-            m = p44.match(line)
+            m = p.p44.match(line)
             if m:                
                 group = m.groupdict()
                 weight = int(group['weight'])
@@ -6167,7 +6207,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Label  : 19
-            m = p45.match(line)
+            m = p.p45.match(line)
             if m:
                 group = m.groupdict()
                 label = group['label']
@@ -6177,7 +6217,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # (Link Data) Interface IP address: 192.168.220.1
-            m = p46.match(line)
+            m = p.p46.match(line)
             if m:
                 group = m.groupdict()
                 tlv_type_dict['link_data'] = group['link_data']
@@ -6185,7 +6225,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Prefix    : 10.4.1.1/32
-            m = p47.match(line)
+            m = p.p47.match(line)
             if m:
                 group = m.groupdict()
                 prefix = group['prefix']
@@ -6195,7 +6235,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # AF        : 0
-            m = p48.match(line)
+            m = p.p48.match(line)
             if m:
                 group = m.groupdict()
                 af = int(group['af'])
@@ -6205,7 +6245,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Route-type: Intra
-            m = p49.match(line)
+            m = p.p49.match(line)
             if m:
                 group = m.groupdict()
                 route_type = group['route_type']            
@@ -6216,7 +6256,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
 
             # Sub-TLV Type: Remote Intf Addr
             # Sub-TLV Type: Local / Remote Intf ID
-            m = p50.match(line)
+            m = p.p50.match(line)
             if m:
                 tlv_type_flag = False
                 sub_tlv_type_flag = True
@@ -6236,7 +6276,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Remote Interface Address   : 192.168.0.1
-            m = p51.match(line)
+            m = p.p51.match(line)
             if m:
                 group = m.groupdict()
                 remote_interface_address = group['remote_interface_address']
@@ -6244,7 +6284,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Local Interface ID   : 20
-            m = p52.match(line)
+            m = p.p52.match(line)
             if m:
                 group = m.groupdict()
                 local_interface_id = int(group['local_interface_id'])
@@ -6252,7 +6292,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue            
 
             # Remote Interface ID   : 20
-            m = p53.match(line)
+            m = p.p53.match(line)
             if m:
                 group = m.groupdict()
                 remote_interface_id = int(group['remote_interface_id'])
@@ -6260,7 +6300,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # SID   : 1
-            m = p54.match(line)                        
+            m = p.p54.match(line)                        
             if m:
                 group = m.groupdict()
                 sid = int(group['sid'])
@@ -6269,7 +6309,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Sub-type: Node Max Sid Depth, Value: 13
-            m = p59.match(line)
+            m = p.p59.match(line)
             if m:
                 group = m.groupdict()
                 sub_type_value = int(group['value'])
@@ -6949,6 +6989,24 @@ class ShowIpOspfMplsLdpInterface(ShowIpOspfMplsLdpInterfaceSchema):
 
     cli_command = ['show ip ospf mpls ldp interface', 'show ip ospf mpls ldp interface {interface}']
 
+    patterns = Patterns(
+        p1=r'^(?P<interface>(Lo.*|.*Gig.*|.*(SL|VL).*|'
+           'Cellular.*|FastEthernet.*|LISP.*|Po.*|Tunnel.*|'
+           'VirtualPortGroup.*|Vlan.*))$',
+
+        p2=r'^Process +ID +(?P<instance>(\S+)),'
+           '(?: +VRF +(?P<vrf>(\S+)),)?'
+           ' +Area +(?P<area>(\S+))$',
+
+        p3=r'^LDP +is'
+           ' +(?P<auto_config>(not configured|configured))'
+           ' +through +LDP +autoconfig$',
+
+        p5=r'^Holddown +timer +is (?P<val>([a-zA-Z\s]+))$',
+        # Interface is down and pending LDP
+        p6=r'^Interface +is (?P<state>(up|down))( +and +(?P<state_info>[\w\s]*))?$',
+    )
+
     def cli(self, interface='', output=None):
 
         if output is None:
@@ -6964,22 +7022,7 @@ class ShowIpOspfMplsLdpInterface(ShowIpOspfMplsLdpInterfaceSchema):
         ret_dict = {}
         af = 'ipv4' # this is ospf - always ipv4
 
-        p1 = re.compile(r'^(?P<interface>(Lo.*|.*Gig.*|.*(SL|VL).*|'
-                            'Cellular.*|FastEthernet.*|LISP.*|Po.*|Tunnel.*|'
-                            'VirtualPortGroup.*|Vlan.*))$')
-
-        p2 = re.compile(r'^Process +ID +(?P<instance>(\S+)),'
-                            '(?: +VRF +(?P<vrf>(\S+)),)?'
-                            ' +Area +(?P<area>(\S+))$')
-
-        p3 = re.compile(r'^LDP +is'
-                            ' +(?P<auto_config>(not configured|configured))'
-                            ' +through +LDP +autoconfig$')
-
-        p5 = re.compile(r'^Holddown +timer +is (?P<val>([a-zA-Z\s]+))$')
-        # Interface is down and pending LDP
-        p6 = re.compile(r'^Interface +is (?P<state>(up|down))( +and +(?P<state_info>[\w\s]*))?$')
-
+        p = ShowIpOspfMplsLdpInterface.patterns
 
         for line in out.splitlines():
             line = line.strip()
@@ -7002,7 +7045,7 @@ class ShowIpOspfMplsLdpInterface(ShowIpOspfMplsLdpInterfaceSchema):
             # Tunnel
             # VirtualPortGroup
             # Vlan
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 interface = str(m.groupdict()['interface'])
                 continue
@@ -7010,7 +7053,7 @@ class ShowIpOspfMplsLdpInterface(ShowIpOspfMplsLdpInterfaceSchema):
             # Process ID 1, Area 0
             # Process ID 100, Area 0.0.0.0
             # Process ID 2, VRF VRF1, Area 1
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 instance = str(m.groupdict()['instance'])
                 try:
@@ -7089,7 +7132,7 @@ class ShowIpOspfMplsLdpInterface(ShowIpOspfMplsLdpInterfaceSchema):
 
             # LDP is not configured through LDP autoconfig
             # LDP is configured through LDP autoconfig
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 if m.groupdict()['auto_config'] == 'configured':
                     intf_dict['autoconfig'] = True
@@ -7112,7 +7155,7 @@ class ShowIpOspfMplsLdpInterface(ShowIpOspfMplsLdpInterfaceSchema):
                     continue
 
             # Holddown timer is disabled
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 if 'enabled' in m.groupdict()['val']:
                     intf_dict['holddown_timer'] = True
@@ -7121,7 +7164,7 @@ class ShowIpOspfMplsLdpInterface(ShowIpOspfMplsLdpInterfaceSchema):
                     continue
 
             # Interface is up 
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 state_info = m.groupdict()['state_info']
                 intf_dict['state'] = str(m.groupdict()['state'])
@@ -7209,61 +7252,64 @@ class ShowIpOspfMplsTrafficEngLink(ShowIpOspfMplsTrafficEngLinkSchema):
 
     cli_command = 'show ip ospf mpls traffic-eng link'
 
-    def cli(self, output=None):
+    patterns = Patterns(
+        p1=r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+           ' +\(Process +ID +(?P<instance>(\S+))\)$',
 
-        if output is None:
-            # Execute command on device
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
+        p2=r'^Area +(?P<area>(\d+)) +has +(?P<links>(\d+))'
+           ' +MPLS +TE +links. +Area +instance +is'
+           ' +(?P<area_instance>(\d+))\.$',
 
-        # Init vars
-        ret_dict = {}
-        af = 'ipv4' # this is ospf - always ipv4
+        p3=r'^Area +(?P<area>(\S+)) +MPLS +TE +not +initialized$',
 
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                            ' +\(Process +ID +(?P<instance>(\S+))\)$')
+        p4=r'^Links +in +hash +bucket +(?P<hash>(\d+))\.$',
 
-        p2 = re.compile(r'^Area +(?P<area>(\d+)) +has +(?P<links>(\d+))'
-                            ' +MPLS +TE +links. +Area +instance +is'
-                            ' +(?P<area_instance>(\d+))\.$')
+        p5=r'^Link +is +associated +with +fragment'
+           ' +(?P<fragment>(\d+))\. +Link +instance +is'
+           ' +(?P<link_instance>(\d+))$',
 
-        p3 = re.compile(r'^Area +(?P<area>(\S+)) +MPLS +TE +not +initialized$')
+        p6=r'^Link +connected +to +(?P<type>([a-zA-Z\s]+))$',
 
-        p4 = re.compile(r'^Links +in +hash +bucket +(?P<hash>(\d+))\.$')
+        p7=r'^Link +ID *: +(?P<link_id>(\S+))$',
 
-        p5 = re.compile(r'^Link +is +associated +with +fragment'
-                            ' +(?P<fragment>(\d+))\. +Link +instance +is'
-                            ' +(?P<link_instance>(\d+))$')
+        p8=r'^Interface +Address *: +(?P<addr>(\S+))$',
 
-        p6 = re.compile(r'^Link +connected +to +(?P<type>([a-zA-Z\s]+))$')
+        p9=r'^Admin +Metric +te: +(?P<te>(\d+)) +igp:'
+           ' +(?P<igp>(\d+))$',
 
-        p7 = re.compile(r'^Link +ID *: +(?P<link_id>(\S+))$')
+        p14=r'^Maximum +(B|b)andwidth *: +(?P<mband>(\d+))$',
 
-        p8 = re.compile(r'^Interface +Address *: +(?P<addr>(\S+))$')
+        p10=r'^Maximum +(R|r)eservable +(B|b)andwidth *:'
+            ' +(?P<res_band>(\d+))$',
 
-        p9 = re.compile(r'^Admin +Metric +te: +(?P<te>(\d+)) +igp:'
-                            ' +(?P<igp>(\d+))$')
+        p11=r'^Affinity +Bit *: +(?P<admin_group>(\S+))$',
 
-        p14 = re.compile(r'^Maximum +(B|b)andwidth *: +(?P<mband>(\d+))$')
+        p12=r'^Number +of +Priority +: +(?P<priority>(\d+))$',
 
-        p10 = re.compile(r'^Maximum +(R|r)eservable +(B|b)andwidth *:'
-                            ' +(?P<res_band>(\d+))$')
+        p13=r'^Priority +(?P<num1>(\d+)) *:'
+            ' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
+            ' *: +(?P<band2>(\d+)))?$',
+    )
 
-        p11 = re.compile(r'^Affinity +Bit *: +(?P<admin_group>(\S+))$')
+    def cli(self, output=None):
 
-        p12 = re.compile(r'^Number +of +Priority +: +(?P<priority>(\d+))$')
+        if output is None:
+            # Execute command on device
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
 
-        p13 = re.compile(r'^Priority +(?P<num1>(\d+)) *:'
-                            ' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
-                            ' *: +(?P<band2>(\d+)))?$')
+        # Init vars
+        ret_dict = {}
+        af = 'ipv4' # this is ospf - always ipv4
 
+        regex = ShowIpOspfMplsTrafficEngLink.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # OSPF Router with ID (10.4.1.1) (Process ID 1)
-            m = p1.match(line)
+            m = regex.p1.match(line)
             if m:
                 router_id = str(m.groupdict()['router_id'])
                 instance = str(m.groupdict()['instance'])
@@ -7319,7 +7365,7 @@ class ShowIpOspfMplsTrafficEngLink(ShowIpOspfMplsTrafficEngLinkSchema):
                 continue
 
             # Area 0 has 2 MPLS TE links. Area instance is 2.
-            m = p2.match(line)
+            m = regex.p2.match(line)
             if m:
                 area = str(IPAddress(str(m.groupdict()['area'])))
                 total_links = int(m.groupdict()['links'])
@@ -7354,7 +7400,7 @@ class ShowIpOspfMplsTrafficEngLink(ShowIpOspfMplsTrafficEngLinkSchema):
 
             # Area 1 MPLS TE not initialized
             # Area 0.0.0.0 MPLS TE not initialized
-            m = p3.match(line)
+            m = regex.p3.match(line)
             if m:
                 try:
                     int(m.groupdict()['area'])
@@ -7384,7 +7430,7 @@ class ShowIpOspfMplsTrafficEngLink(ShowIpOspfMplsTrafficEngLinkSchema):
                 continue
 
             # Links in hash bucket 8.
-            m = p4.match(line)
+            m = regex.p4.match(line)
             if m:
                 link_hash_bucket = int(m.groupdict()['hash'])
                 if 'link_hash_bucket' not in ret_dict['vrf'][vrf]\
@@ -7405,7 +7451,7 @@ class ShowIpOspfMplsTrafficEngLink(ShowIpOspfMplsTrafficEngLinkSchema):
                 continue
 
             # Link is associated with fragment 2. Link instance is 2
-            m = p5.match(line)
+            m = regex.p5.match(line)
             if m:
                 link_fragment = int(m.groupdict()['fragment'])
                 if 'link_fragments' not in link_dict:
@@ -7417,57 +7463,57 @@ class ShowIpOspfMplsTrafficEngLink(ShowIpOspfMplsTrafficEngLinkSchema):
                 continue
 
             # Link connected to Broadcast network
-            m = p6.match(line)
+            m = regex.p6.match(line)
             if m:
                 sub_dict['network_type'] = str(m.groupdict()['type']).lower()
                 continue
 
             # Link ID : 10.1.2.1
-            m = p7.match(line)
+            m = regex.p7.match(line)
             if m:
                 sub_dict['link_id'] = str(m.groupdict()['link_id'])
                 continue
 
             # Interface Address : 10.1.2.1
-            m = p8.match(line)
+            m = regex.p8.match(line)
             if m:
                 sub_dict['interface_address'] = str(m.groupdict()['addr'])
                 continue
 
             # Admin Metric te: 1 igp: 1
-            m = p9.match(line)
+            m = regex.p9.match(line)
             if m:
                 sub_dict['te_admin_metric'] = int(m.groupdict()['te'])
                 sub_dict['igp_admin_metric'] = int(m.groupdict()['igp'])
                 continue
 
             # Maximum bandwidth : 125000000
-            m = p14.match(line) #Modified from p9 to p14
+            m = regex.p14.match(line) #Modified from p9 to p14
             if m:
                 sub_dict['max_bandwidth'] = int(m.groupdict()['mband'])
                 continue
 
             # Maximum reservable bandwidth : 93750000
-            m = p10.match(line)
+            m = regex.p10.match(line)
             if m:
                 sub_dict['max_reservable_bandwidth'] = \
                     int(m.groupdict()['res_band'])
                 continue
 
             # Affinity Bit : 0x0
-            m = p11.match(line)
+            m = regex.p11.match(line)
             if m:
                 sub_dict['affinity_bit'] = str(m.groupdict()['admin_group'])
                 continue
 
             # Number of Priority : 8
-            m = p12.match(line)
+            m = regex.p12.match(line)
             if m:
                 sub_dict['total_priority'] = int(m.groupdict()['priority'])
                 continue
 
             # Priority 0 : 93750000     Priority 1 : 93750000
-            m = p13.match(line)
+            m = regex.p13.match(line)
             if m:
                 value1 = '{} {}'.format(str(m.groupdict()['num1']), str(m.groupdict()['band1']))
                 value2 = '{} {}'.format(str(m.groupdict()['num2']), str(m.groupdict()['band2']))
@@ -7562,61 +7608,64 @@ class ShowIpOspfMplsTrafficEngLink2(ShowIpOspfMplsTrafficEngLink2Schema):
 
     cli_command = 'show ip ospf mpls traffic-eng link__'
 
-    def cli(self, output=None):
+    patterns = Patterns(
+        p1=r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+           ' +\(Process +ID +(?P<instance>(\S+))\)$',
 
-        if output is None:
-            # Execute command on device
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
+        p2=r'^Area +(?P<area>(\d+)) +has +(?P<links>(\d+))'
+           ' +MPLS +TE +links. +Area +instance +is'
+           ' +(?P<area_instance>(\d+))\.$',
 
-        # Init vars
-        ret_dict = {}
-        af = 'ipv4' # this is ospf - always ipv4
+        p3=r'^Area +(?P<area>(\S+)) +MPLS +TE +not +initialized$',
 
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                            ' +\(Process +ID +(?P<instance>(\S+))\)$')
+        p4=r'^Links +in +hash +bucket +(?P<hash>(\d+))\.$',
 
-        p2 = re.compile(r'^Area +(?P<area>(\d+)) +has +(?P<links>(\d+))'
-                            ' +MPLS +TE +links. +Area +instance +is'
-                            ' +(?P<area_instance>(\d+))\.$')
+        p5=r'^Link +is +associated +with +fragment'
+           ' +(?P<fragment>(\d+))\. +Link +instance +is'
+           ' +(?P<link_instance>(\d+))$',
 
-        p3 = re.compile(r'^Area +(?P<area>(\S+)) +MPLS +TE +not +initialized$')
+        p6=r'^Link +connected +to +(?P<type>([a-zA-Z\s]+))$',
 
-        p4 = re.compile(r'^Links +in +hash +bucket +(?P<hash>(\d+))\.$')
+        p7=r'^Link +ID *: +(?P<link_id>(\S+))$',
 
-        p5 = re.compile(r'^Link +is +associated +with +fragment'
-                            ' +(?P<fragment>(\d+))\. +Link +instance +is'
-                            ' +(?P<link_instance>(\d+))$')
+        p8=r'^Interface +Address *: +(?P<addr>(\S+))$',
 
-        p6 = re.compile(r'^Link +connected +to +(?P<type>([a-zA-Z\s]+))$')
+        p9=r'^Admin +Metric +te: +(?P<te>(\d+)) +igp:'
+           ' +(?P<igp>(\d+))$',
 
-        p7 = re.compile(r'^Link +ID *: +(?P<link_id>(\S+))$')
+        p14=r'^Maximum +(B|b)andwidth *: +(?P<mband>(\d+))$',
 
-        p8 = re.compile(r'^Interface +Address *: +(?P<addr>(\S+))$')
+        p10=r'^Maximum +(R|r)eservable +(B|b)andwidth *:'
+            ' +(?P<res_band>(\d+))$',
 
-        p9 = re.compile(r'^Admin +Metric +te: +(?P<te>(\d+)) +igp:'
-                            ' +(?P<igp>(\d+))$')
+        p11=r'^Affinity +Bit *: +(?P<admin_group>(\S+))$',
 
-        p14 = re.compile(r'^Maximum +(B|b)andwidth *: +(?P<mband>(\d+))$')
+        p12=r'^Number +of +Priority +: +(?P<priority>(\d+))$',
 
-        p10 = re.compile(r'^Maximum +(R|r)eservable +(B|b)andwidth *:'
-                            ' +(?P<res_band>(\d+))$')
+        p13=r'^Priority +(?P<num1>(\d+)) *:'
+            ' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
+            ' *: +(?P<band2>(\d+)))?$',
+    )
 
-        p11 = re.compile(r'^Affinity +Bit *: +(?P<admin_group>(\S+))$')
+    def cli(self, output=None):
 
-        p12 = re.compile(r'^Number +of +Priority +: +(?P<priority>(\d+))$')
+        if output is None:
+            # Execute command on device
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
 
-        p13 = re.compile(r'^Priority +(?P<num1>(\d+)) *:'
-                            ' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
-                            ' *: +(?P<band2>(\d+)))?$')
+        # Init vars
+        ret_dict = {}
+        af = 'ipv4' # this is ospf - always ipv4
 
+        p = ShowIpOspfMplsTrafficEngLink2.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # OSPF Router with ID (10.4.1.1) (Process ID 1)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 router_id = str(m.groupdict()['router_id'])
                 instance = str(m.groupdict()['instance'])
@@ -7633,7 +7682,7 @@ class ShowIpOspfMplsTrafficEngLink2(ShowIpOspfMplsTrafficEngLink2Schema):
                 continue
 
             # Area 0 has 2 MPLS TE links. Area instance is 2.
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 area = str(IPAddress(str(m.groupdict()['area'])))
                 total_links = int(m.groupdict()['links'])
@@ -7650,7 +7699,7 @@ class ShowIpOspfMplsTrafficEngLink2(ShowIpOspfMplsTrafficEngLink2Schema):
 
             # Area 1 MPLS TE not initialized
             # Area 0.0.0.0 MPLS TE not initialized
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 try:
                     int(m.groupdict()['area'])
@@ -7667,7 +7716,7 @@ class ShowIpOspfMplsTrafficEngLink2(ShowIpOspfMplsTrafficEngLink2Schema):
                 continue
 
             # Links in hash bucket 8.
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 link_hash_bucket = int(m.groupdict()['hash'])
                 link_dict = area_dict.setdefault('link_hash_bucket', {}).\
@@ -7675,7 +7724,7 @@ class ShowIpOspfMplsTrafficEngLink2(ShowIpOspfMplsTrafficEngLink2Schema):
                 continue
 
             # Link is associated with fragment 2. Link instance is 2
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 link_fragment = int(m.groupdict()['fragment'])
                 sub_dict = link_dict.setdefault('link_fragments', {}).\
@@ -7684,57 +7733,57 @@ class ShowIpOspfMplsTrafficEngLink2(ShowIpOspfMplsTrafficEngLink2Schema):
                 continue
 
             # Link connected to Broadcast network
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 sub_dict['network_type'] = str(m.groupdict()['type']).lower()
                 continue
 
             # Link ID : 10.1.2.1
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 sub_dict['link_id'] = str(m.groupdict()['link_id'])
                 continue
 
             # Interface Address : 10.1.2.1
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 sub_dict['interface_address'] = str(m.groupdict()['addr'])
                 continue
 
             # Admin Metric te: 1 igp: 1
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 sub_dict['te_admin_metric'] = int(m.groupdict()['te'])
                 sub_dict['igp_admin_metric'] = int(m.groupdict()['igp'])
                 continue
 
             # Maximum bandwidth : 125000000
-            m = p14.match(line) #Modified from p9 to p14
+            m = p.p14.match(line) #Modified from p9 to p14
             if m:
                 sub_dict['max_bandwidth'] = int(m.groupdict()['mband'])
                 continue
 
             # Maximum reservable bandwidth : 93750000
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 sub_dict['max_reservable_bandwidth'] = \
                     int(m.groupdict()['res_band'])
                 continue
 
             # Affinity Bit : 0x0
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 sub_dict['affinity_bit'] = str(m.groupdict()['admin_group'])
                 continue
 
             # Number of Priority : 8
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 sub_dict['total_priority'] = int(m.groupdict()['priority'])
                 continue
 
             # Priority 0 : 93750000     Priority 1 : 93750000
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 value1 = '{} {}'.format(str(m.groupdict()['num1']), str(m.groupdict()['band1']))
                 value2 = '{} {}'.format(str(m.groupdict()['num2']), str(m.groupdict()['band2']))
@@ -7813,62 +7862,66 @@ class ShowIpOspfMaxMetric(ShowIpOspfMaxMetricSchema):
 
     cli_command = 'show ip ospf max-metric'
 
-    def cli(self, output=None):
-
-        if output is None:
-            # Execute command on device
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-
-        # Init vars
-        ret_dict = {}
-        address_family = 'ipv4'
-
-        # Load for five secs: 71%/0%; one minute: 11%; five minutes: 9%
-        # Time source is NTP, 20:29:26.348 EST Fri Nov 11 2016
-
+    patterns = Patterns(
         # OSPF Router with ID (172.16.1.214) (Process ID 65109)
         # OSPF Router with ID (10.36.3.3) (Process ID 1, VRF VRF1)
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                         ' +\(Process +ID +(?P<instance>(\d+))'
-                         '(?:, +VRF +(?P<vrf>(\S+)))?\)$')
+        p1=r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+           ' +\(Process +ID +(?P<instance>(\d+))'
+           '(?:, +VRF +(?P<vrf>(\S+)))?\)$',
 
         # Base Topology (MTID 0)
-        p2 = re.compile(r'^Base +Topology +\(MTID +(?P<mtid>(\d+))\)$')
+        p2=r'^Base +Topology +\(MTID +(?P<mtid>(\d+))\)$',
 
         # Start time: 00:01:58.314, Time elapsed: 00:54:43.858
-        p3 = re.compile(r'^Start +time: +(?P<start_time>(\S+)), +Time +elapsed:'
-                         ' +(?P<time_elapsed>(\S+))$')
+        p3=r'^Start +time: +(?P<start_time>(\S+)), +Time +elapsed:'
+           ' +(?P<time_elapsed>(\S+))$',
 
         # Originating router-LSAs with maximum metric
         # Originating router-LSAs with maximum metric, Time remaining: 00:03:55
-        p4_1 = re.compile(r'^Originating +router-LSAs +with +maximum +metric(, +Time +remaining: +(?P<time_remaining>([\d\:]+)))?$')
+        p4_1=r'^Originating +router-LSAs +with +maximum +metric(, +Time +remaining: +(?P<time_remaining>([\d\:]+)))?$',
 
         # Router is not originating router-LSAs with maximum metric
-        p4_2 = re.compile(r'^Router +is +not +originating +router-LSAs +with'
-                           ' +maximum +metric$')
+        p4_2=r'^Router +is +not +originating +router-LSAs +with'
+             ' +maximum +metric$',
 
         # Condition: on startup for 5 seconds, State: inactive
-        p5 = re.compile(r'^Condition: +(?P<condition>(.*)), +State:'
-                          ' +(?P<state>([a-zA-Z\s]+))$')
+        p5=r'^Condition: +(?P<condition>(.*)), +State:'
+           ' +(?P<state>([a-zA-Z\s]+))$',
 
         # Advertise summary-LSAs with metric 16711680
-        p6 = re.compile(r'^Advertise +summary-LSAs +with +metric'
-                         ' +(?P<metric>(\d+))$')
+        p6=r'^Advertise +summary-LSAs +with +metric'
+           ' +(?P<metric>(\d+))$',
 
         # Unset reason: timer expired, Originated for 5 seconds
-        p7 = re.compile(r'^Unset +reason: (?P<reason>(.*))$')
+        p7=r'^Unset +reason: (?P<reason>(.*))$',
 
         # Unset time: 00:02:03.314, Time elapsed: 00:54:38.858
-        p8 = re.compile(r'^Unset +time: +(?P<time>(\S+)), +Time +elapsed:'
-                         ' +(?P<elapsed>(\S+))$')
+        p8=r'^Unset +time: +(?P<time>(\S+)), +Time +elapsed:'
+           ' +(?P<elapsed>(\S+))$',
+    )
+
+    def cli(self, output=None):
+
+        if output is None:
+            # Execute command on device
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        # Init vars
+        ret_dict = {}
+        address_family = 'ipv4'
+
+        # Load for five secs: 71%/0%; one minute: 11%; five minutes: 9%
+        # Time source is NTP, 20:29:26.348 EST Fri Nov 11 2016
+
+        p = ShowIpOspfMaxMetric.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # OSPF Router with ID (10.36.3.3) (Process ID 1, VRF VRF1)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 router_id = str(group['router_id'])
@@ -7888,7 +7941,7 @@ class ShowIpOspfMaxMetric(ShowIpOspfMaxMetricSchema):
                 continue
 
             # Base Topology (MTID 0)
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 mtid = m.groupdict()['mtid']
                 mtid_dict = ospf_dict.setdefault('base_topology_mtid', {}).\
@@ -7896,7 +7949,7 @@ class ShowIpOspfMaxMetric(ShowIpOspfMaxMetricSchema):
                 continue
 
             # Start time: 00:01:58.314, Time elapsed: 00:54:43.858
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 mtid_dict['start_time'] = group['start_time']
@@ -7905,7 +7958,7 @@ class ShowIpOspfMaxMetric(ShowIpOspfMaxMetricSchema):
 
             # Originating router-LSAs with maximum metric
             # Originating router-LSAs with maximum metric, Time remaining: 00:03:55
-            m = p4_1.match(line)
+            m = p.p4_1.match(line)
             if m:
                 rtr_lsa_dict = mtid_dict.\
                                     setdefault('router_lsa_max_metric', {}).\
@@ -7915,7 +7968,7 @@ class ShowIpOspfMaxMetric(ShowIpOspfMaxMetricSchema):
                 continue
 
             # Router is not originating router-LSAs with maximum metric
-            m = p4_2.match(line)
+            m = p.p4_2.match(line)
             if m:
                 rtr_lsa_dict = mtid_dict.\
                                     setdefault('router_lsa_max_metric', {}).\
@@ -7923,7 +7976,7 @@ class ShowIpOspfMaxMetric(ShowIpOspfMaxMetricSchema):
                 continue
 
             # Condition: on startup for 5 seconds, State: inactive
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 rtr_lsa_dict['condition'] = group['condition']
@@ -7931,18 +7984,18 @@ class ShowIpOspfMaxMetric(ShowIpOspfMaxMetricSchema):
                 continue
 
             # Advertise summary-LSAs with metric 16711680
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 rtr_lsa_dict['advertise_lsa_metric'] = int(m.groupdict()['metric'])
 
             # Unset reason: timer expired, Originated for 5 seconds
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 rtr_lsa_dict['unset_reason'] = m.groupdict()['reason']
                 continue
 
             # Unset time: 00:02:03.314, Time elapsed: 00:54:38.858
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 group = m.groupdict()
                 rtr_lsa_dict['unset_time'] = group['time']
@@ -8186,86 +8239,70 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
 
     cli_command = 'show ip ospf traffic'
 
-    def cli(self, output=None):
-
-        if output is None:
-            # Execute command on device
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-
-        # Init vars
-        ret_dict = {}
-        address_family = 'ipv4'
-        vrf = 'default'
-        received = False ; sent = False
-        interface_stats = False ; summary_stats = False
-        max_size_stats = False ; current_size_stats = False
-
+    patterns = Patterns(
         # OSPF statistics:
-        p1 = re.compile(r'^OSPF +statistics:$')
+        p1=r'^OSPF +statistics:$',
 
         # Last clearing of OSPF traffic counters never
         # Last clearing of interface traffic counters never
-        p2 = re.compile(r'^Last +clearing +of +(?P<type>(OSPF|interface)) +traffic'
-                         ' +counters +(?P<last_clear>([a-zA-Z0-9\:\s]+))$')
+        p2=r'^Last +clearing +of +(?P<type>(OSPF|interface)) +traffic'
+           ' +counters +(?P<last_clear>([a-zA-Z0-9\:\s]+))$',
 
         # Rcvd: 2112690 total, 0 checksum errors
-        p3 = re.compile(r'^Rcvd: +(?P<total>(\d+)) total, +(?P<csum_errors>(\d+))'
-                         ' +checksum +errors$')
+        p3=r'^Rcvd: +(?P<total>(\d+)) total, +(?P<csum_errors>(\d+))'
+           ' +checksum +errors$',
 
         # 2024732 hello, 938 database desc, 323 link state req
         # 2381794 hello, 1176 database desc, 43 link state req
-        p4 = re.compile(r'^(?P<hello>(\d+)) +hello, +(?P<db_desc>(\d+))'
-                         ' +database +desc, +(?P<link_state_req>(\d+))'
-                         ' +link +state +req$')
+        p4=r'^(?P<hello>(\d+)) +hello, +(?P<db_desc>(\d+))'
+           ' +database +desc, +(?P<link_state_req>(\d+))'
+           ' +link +state +req$',
 
         # 11030 link state updates, 75666 link state acks
         # 92224 link state updates, 8893 link state acks
-        p5 = re.compile(r'^(?P<link_state_updates>(\d+)) +link +state +updates,'
-                         ' +(?P<link_state_acks>(\d+)) +link +state +acks$')
+        p5=r'^(?P<link_state_updates>(\d+)) +link +state +updates,'
+           ' +(?P<link_state_acks>(\d+)) +link +state +acks$',
 
         # Sent: 2509472 total
-        p6 = re.compile(r'^Sent: +(?P<total>(\d+)) +total$')
-
+        p6=r'^Sent: +(?P<total>(\d+)) +total$',
 
         # OSPF Router with ID (10.169.197.252) (Process ID 65109)
         # OSPF Router with ID (10.36.3.3) (Process ID 1, VRF VRF1)
-        p7 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                         ' +\(Process +ID +(?P<instance>(\d+))'
-                         '(?:, +VRF +(?P<vrf>(\S+)))?\)$')
+        p7=r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+           ' +\(Process +ID +(?P<instance>(\d+))'
+           '(?:, +VRF +(?P<vrf>(\S+)))?\)$',
 
         # OSPF queue statistics for process ID 65109:
-        p8 = re.compile(r'^OSPF +queue +statistics +for +process +ID +(?P<pid>(\d+)):$')
+        p8=r'^OSPF +queue +statistics +for +process +ID +(?P<pid>(\d+)):$',
 
         #                   InputQ   UpdateQ      OutputQ
         # Limit             0        200          0
         # Drops             0          0          0
         # Max delay [msec] 49          2          2
-        p9_1 = re.compile(r'^(?P<item>(Limit|Drops|Max delay \[msec\])) +'
-                        '(?P<inputq>(\d+)) +(?P<updateq>(\d+)) +(?P<outputq>(\d+))$')
-        
+        p9_1=r'^(?P<item>(Limit|Drops|Max delay \[msec\])) +'
+             '(?P<inputq>(\d+)) +(?P<updateq>(\d+)) +(?P<outputq>(\d+))$',
+
         # Invalid           0          0          0
         # Hello             0          0          0
         # DB des            0          0          0
         # LS req            0          0          0
         # LS upd            0          0          0
         # LS ack           14         14          6
-        p9_2 = re.compile(r'^(?P<item>(Invalid|Hello|DB des|LS '
-                        'req|LS upd|LS ack)) +(?P<inputq>(\d+)) '
-                        '+(?P<updateq>(\d+)) +(?P<outputq>(\d+))$')
+        p9_2=r'^(?P<item>(Invalid|Hello|DB des|LS '
+             'req|LS upd|LS ack)) +(?P<inputq>(\d+)) '
+             '+(?P<updateq>(\d+)) +(?P<outputq>(\d+))$',
 
         #                   InputQ   UpdateQ      OutputQ
         # Max size         14         14          6
         # Current size      0          0          0
-        p9_3 = re.compile(r'^(?P<item>(Max size|Current size)) +(?P<inputq>(\d+))'
-                           ' +(?P<updateq>(\d+)) +(?P<outputq>(\d+))$')
+        p9_3=r'^(?P<item>(Max size|Current size)) +(?P<inputq>(\d+))'
+             ' +(?P<updateq>(\d+)) +(?P<outputq>(\d+))$',
 
         # Interface statistics:
-        p10 = re.compile(r'^Interface +statistics:$')
+        p10=r'^Interface +statistics:$',
 
         # Interface GigabitEthernet0/0/6
-        p11 = re.compile(r'^Interface +(?P<intf>(\S+))$')
+        p11=r'^Interface +(?P<intf>(\S+))$',
 
         # OSPF packets received/sent
         # Type          Packets              Bytes
@@ -8283,74 +8320,93 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
         # TX LS upd     12539                12553264
         # TX LS ack     899                  63396
         # TX Total      182893               26212884
-        p12 = re.compile(r'^(?P<type>([a-zA-Z\s]+)) +(?P<packets>(\d+))'
-                          ' +(?P<bytes>(\d+))$')
+        p12=r'^(?P<type>([a-zA-Z\s]+)) +(?P<packets>(\d+))'
+            ' +(?P<bytes>(\d+))$',
 
         # OSPF header errors
-        p13 = re.compile(r'^OSPF +header +errors$')
+        p13=r'^OSPF +header +errors$',
 
         # Length 0, Instance ID 0, Checksum 0, Auth Type 0,
-        p14 = re.compile(r'^Length +(?P<len>(\d+)), +Instance +ID'
-                          ' +(?P<iid>(\d+)), +Checksum +(?P<csum>(\d+)),'
-                          ' +Auth +Type +(?P<auth>(\d+)),?$')
+        p14=r'^Length +(?P<len>(\d+)), +Instance +ID'
+            ' +(?P<iid>(\d+)), +Checksum +(?P<csum>(\d+)),'
+            ' +Auth +Type +(?P<auth>(\d+)),?$',
 
         # Version 0, Bad Source 0, No Virtual Link 0,
-        p15 = re.compile(r'^Version +(?P<version>(\d+)), +Bad +Source'
-                          ' +(?P<bad_source>(\d+)), +No +Virtual +Link'
-                          ' +(?P<no_virtual_link>(\d+)),?$')
+        p15=r'^Version +(?P<version>(\d+)), +Bad +Source'
+            ' +(?P<bad_source>(\d+)), +No +Virtual +Link'
+            ' +(?P<no_virtual_link>(\d+)),?$',
 
         # Area Mismatch 0, No Sham Link 0, Self Originated 0,
-        p16 = re.compile(r'^Area +Mismatch +(?P<area_mismatch>(\d+)),'
-                          ' +No +Sham +Link +(?P<no_sham_link>(\d+)),'
-                          ' +Self +Originated +(?P<self_originated>(\d+)),?$')
+        p16=r'^Area +Mismatch +(?P<area_mismatch>(\d+)),'
+            ' +No +Sham +Link +(?P<no_sham_link>(\d+)),'
+            ' +Self +Originated +(?P<self_originated>(\d+)),?$',
 
         # Duplicate ID 0, Hello 0, MTU Mismatch 0,
-        p17 = re.compile(r'^Duplicate +ID +(?P<duplicate_id>(\d+)),'
-                          ' +Hello +(?P<hello>(\d+)), +MTU +Mismatch'
-                          ' +(?P<mtu_mismatch>(\d+)),$')
+        p17=r'^Duplicate +ID +(?P<duplicate_id>(\d+)),'
+            ' +Hello +(?P<hello>(\d+)), +MTU +Mismatch'
+            ' +(?P<mtu_mismatch>(\d+)),$',
 
         # Nbr Ignored 0, LLS 0, Unknown Neighbor 0,
-        p18 = re.compile(r'^Nbr +Ignored +(?P<nbr_ignored>(\d+)), +LLS'
-                          ' +(?P<lls>(\d+)), +Unknown +Neighbor'
-                          ' +(?P<unknown_neighbor>(\d+)),?$')
+        p18=r'^Nbr +Ignored +(?P<nbr_ignored>(\d+)), +LLS'
+            ' +(?P<lls>(\d+)), +Unknown +Neighbor'
+            ' +(?P<unknown_neighbor>(\d+)),?$',
 
         # Authentication 0, TTL Check Fail 0, Adjacency Throttle 0,
-        p19 = re.compile(r'^Authentication +(?P<authentication>(\d+)), +TTL'
-                          ' +Check +Fail +(?P<ttl_check_fail>(\d+)), +Adjacency'
-                          ' +Throttle +(?P<adjacency_throttle>(\d+)),?$')
+        p19=r'^Authentication +(?P<authentication>(\d+)), +TTL'
+            ' +Check +Fail +(?P<ttl_check_fail>(\d+)), +Adjacency'
+            ' +Throttle +(?P<adjacency_throttle>(\d+)),?$',
 
         # Authentication 0, TTL Check Fail 0, Test discard 0
-        p19_1 = re.compile(r'^Authentication +(?P<authentication>\d+), +TTL'
-                          ' +Check +Fail +(?P<ttl_check_fail>\d+), +Test discard'
-                          ' +(?P<test_discard>\d+),?$')
+        p19_1=r'^Authentication +(?P<authentication>\d+), +TTL'
+              ' +Check +Fail +(?P<ttl_check_fail>\d+), +Test discard'
+              ' +(?P<test_discard>\d+),?$',
 
         # BFD 0, Test discard 0
-        p20 = re.compile(r'^BFD +(?P<bfd>(\d+)), +Test +discard'
-                          ' +(?P<test_discard>(\d+))$')
+        p20=r'^BFD +(?P<bfd>(\d+)), +Test +discard'
+            ' +(?P<test_discard>(\d+))$',
 
         # OSPF LSA errors
-        p21 = re.compile(r'^OSPF +LSA +errors$')
+        p21=r'^OSPF +LSA +errors$',
 
         # Type 0, Length 0, Data 0, Checksum 0
-        p22 = re.compile(r'^Type +(?P<type>(\d+)), +Length +(?P<len>(\d+)),'
-                          ' +Data +(?P<data>(\d+)), +Checksum +(?P<csum>(\d+))$')
+        p22=r'^Type +(?P<type>(\d+)), +Length +(?P<len>(\d+)),'
+            ' +Data +(?P<data>(\d+)), +Checksum +(?P<csum>(\d+))$',
 
         # Summary traffic statistics for process ID 65109:
-        p23 = re.compile(r'^Summary +traffic +statistics +for +process +ID'
-                          ' +(?P<pid>(\d+)):$')
+        p23=r'^Summary +traffic +statistics +for +process +ID'
+            ' +(?P<pid>(\d+)):$',
+    )
+
+    def cli(self, output=None):
+
+        if output is None:
+            # Execute command on device
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        # Init vars
+        ret_dict = {}
+        address_family = 'ipv4'
+        vrf = 'default'
+        received = False ; sent = False
+        interface_stats = False ; summary_stats = False
+        max_size_stats = False ; current_size_stats = False
+
+        p = ShowIpOspfTraffic.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # OSPF statistics:
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 ospf_stats_dict = ret_dict.setdefault('ospf_statistics', {})
                 continue
 
             # Last clearing of OSPF traffic counters never
             # Last clearing of interface traffic counters never
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 if m.groupdict()['type'] == 'OSPF':
                     ospf_stats_dict['last_clear_traffic_counters'] = \
@@ -8361,7 +8417,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # Rcvd: 2112690 total, 0 checksum errors
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 rcvd_dict = ospf_stats_dict.setdefault('rcvd', {})
@@ -8372,7 +8428,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
 
             # 2024732 hello, 938 database desc, 323 link state req
             # 2381794 hello, 1176 database desc, 43 link state req
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 if received:
@@ -8388,7 +8444,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
 
             # 11030 link state updates, 75666 link state acks
             # 92224 link state updates, 8893 link state acks
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 if received:
@@ -8402,7 +8458,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # Sent: 2509472 total
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 sent_dict = ospf_stats_dict.setdefault('sent', {})
@@ -8412,7 +8468,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
 
             # OSPF Router with ID (10.169.197.252) (Process ID 65109)
             # OSPF Router with ID (10.36.3.3) (Process ID 1, VRF VRF1)
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 group = m.groupdict()
                 router_id = str(group['router_id'])
@@ -8432,7 +8488,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # OSPF queue statistics for process ID 65109:
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 queue_stats_dict = ospf_dict.setdefault('ospf_queue_statistics', {})
                 continue
@@ -8441,7 +8497,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
             # Limit             0        200          0
             # Drops             0          0          0
             # Max delay [msec] 49          2          2
-            m = p9_1.match(line)
+            m = p.p9_1.match(line)
             if m:
                 group = m.groupdict()
                 item = group['item'].strip().lower().replace(" ", "_").\
@@ -8458,7 +8514,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
             # LS req            0          0          0
             # LS upd            0          0          0
             # LS ack           14         14          6
-            m = p9_2.match(line)
+            m = p.p9_2.match(line)
             if m:
                 group = m.groupdict()
                 item = group['item'].strip().lower().replace(" ", "_").\
@@ -8478,7 +8534,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
             #                   InputQ   UpdateQ      OutputQ
             # Max size         14         14          6
             # Current size      0          0          0
-            m = p9_3.match(line)
+            m = p.p9_3.match(line)
             if m:
                 group = m.groupdict()
                 item = group['item'].strip().lower().replace(" ", "_")
@@ -8497,13 +8553,13 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # Interface statistics:
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 intf_stats_dict = ospf_dict.setdefault('interface_statistics', {})
                 continue
 
             # Interface GigabitEthernet0/0/6
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 intf = m.groupdict()['intf']
                 intf_dict = intf_stats_dict.setdefault('interfaces', {}).\
@@ -8526,7 +8582,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
             # TX LS upd     12539                12553264
             # TX LS ack     899                  63396
             # TX Total      182893               26212884
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 group = m.groupdict()
                 if interface_stats:
@@ -8543,7 +8599,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # OSPF header errors
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 group = m.groupdict()
                 if interface_stats:
@@ -8556,7 +8612,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # Length 0, Instance ID 0, Checksum 0, Auth Type 0,
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 group = m.groupdict()
                 ospf_header_errors_dict['length'] = int(group['len'])
@@ -8566,7 +8622,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # Version 0, Bad Source 0, No Virtual Link 0,
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 group = m.groupdict()
                 ospf_header_errors_dict['version'] = int(group['version'])
@@ -8575,7 +8631,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # Area Mismatch 0, No Sham Link 0, Self Originated 0,
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 group = m.groupdict()
                 ospf_header_errors_dict['area_mismatch'] = int(group['area_mismatch'])
@@ -8584,7 +8640,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # Duplicate ID 0, Hello 0, MTU Mismatch 0,
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 group = m.groupdict()
                 ospf_header_errors_dict['duplicate_id'] = int(group['duplicate_id'])
@@ -8593,7 +8649,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # Nbr Ignored 0, LLS 0, Unknown Neighbor 0,
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 group = m.groupdict()
                 ospf_header_errors_dict['nbr_ignored'] = int(group['nbr_ignored'])
@@ -8602,7 +8658,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # Authentication 0, TTL Check Fail 0, Adjacency Throttle 0,
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 group = m.groupdict()
                 ospf_header_errors_dict['authentication'] = int(group['authentication'])
@@ -8611,7 +8667,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # Authentication 0, TTL Check Fail 0, Test discard 0
-            m = p19_1.match(line)
+            m = p.p19_1.match(line)
             if m:
                 group = m.groupdict()
                 ospf_header_errors_dict['authentication'] = int(group['authentication'])
@@ -8620,7 +8676,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # BFD 0, Test discard 0
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 group = m.groupdict()
                 ospf_header_errors_dict['bfd'] = int(group['bfd'])
@@ -8628,7 +8684,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # OSPF LSA errors
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 if interface_stats:
                     sdict = intf_dict
@@ -8640,7 +8696,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # Type 0, Length 0, Data 0, Checksum 0
-            m = p22.match(line)
+            m = p.p22.match(line)
             if m:
                 group = m.groupdict()
                 ospf_lsa_errors_dict['type'] = int(group['type'])
@@ -8650,7 +8706,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # Summary traffic statistics for process ID 65109:
-            m = p23.match(line)
+            m = p.p23.match(line)
             if m:
                 pid = m.groupdict()['pid']
                 ospf_dict = ret_dict.setdefault('vrf', {}).\
@@ -8713,6 +8769,11 @@ class ShowIpOspfNeighbor(ShowIpOspfNeighborSchema):
         'show ip ospf neighbor']
     exclude = ['dead_time']
 
+    patterns = Patterns(
+        p1=r'^(?P<neighbor>\S+) +(?P<pri>\d+) +(?P<state>\S+(?:\s+\S+)?)'
+           ' +(?P<dead_time>\S+) +(?P<address>\S+) +(?P<interface>\S+)$',
+    )
+
     def cli(self, interface='', output=None):
 
         if output is None:
@@ -8733,13 +8794,12 @@ class ShowIpOspfNeighbor(ShowIpOspfNeighborSchema):
         # 172.16.197.253 128   FULL/DR         00:00:30    172.16.165.49  GigabitEthernet0/0/1
         # 10.169.197.252   0   FULL/  -        00:00:36    10.169.197.93  GigabitEthernet2
         
-        p1=re.compile(r'^(?P<neighbor>\S+) +(?P<pri>\d+) +(?P<state>\S+(?:\s+\S+)?)'
-                       ' +(?P<dead_time>\S+) +(?P<address>\S+) +(?P<interface>\S+)$')
+        p = ShowIpOspfNeighbor.patterns
 
         for line in out.splitlines():
 
             line = line.strip()
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 neighbor = m.groupdict()['neighbor']
                 interface = m.groupdict()['interface']
@@ -8812,6 +8872,19 @@ class ShowIpOspfSegmentRoutingAdjacencySid(ShowIpOspfSegmentRoutingAdjacencySidS
         'show ip ospf segment-routing adjacency-sid',
     ]
 
+    patterns = Patterns(
+        # OSPF Router with ID (10.4.1.1) (Process ID 65109)
+        r1=r'OSPF\s+Router\s+with\s+ID\s+\((?P<router_id>\S+)\)\s+'
+           '\(Process\s+ID\s+(?P<process_id>\d+)\)',
+
+        # 16       10.16.2.2         Gi0/1/2            192.168.154.2       D U
+        # 17       10.16.2.2         Gi0/1/1            192.168.4.2       D U
+        r2=r'(?P<adj_sid>\d+)\s+(?P<neighbor_id>\S+)\s+'
+           '(?P<interface>\S+)\s+(?P<neighbor_address>\S+)\s+'
+           '(?P<flags>[SDPUGL\s]+)\s*(?:(?P<backup_nexthop>\S+))?'
+           '\s*(?:(?P<backup_interface>\S+))?',
+    )
+
     def cli(self, process_id=None, output=None):
 
         if output is None:
@@ -8824,16 +8897,7 @@ class ShowIpOspfSegmentRoutingAdjacencySid(ShowIpOspfSegmentRoutingAdjacencySidS
         else:
             out = output
 
-        # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-        r1 = re.compile(r'OSPF\s+Router\s+with\s+ID\s+\((?P<router_id>\S+)\)\s+'
-                         '\(Process\s+ID\s+(?P<process_id>\d+)\)')
-
-        # 16       10.16.2.2         Gi0/1/2            192.168.154.2       D U   
-        # 17       10.16.2.2         Gi0/1/1            192.168.4.2       D U   
-        r2 = re.compile(r'(?P<adj_sid>\d+)\s+(?P<neighbor_id>\S+)\s+'
-                         '(?P<interface>\S+)\s+(?P<neighbor_address>\S+)\s+'
-                         '(?P<flags>[SDPUGL\s]+)\s*(?:(?P<backup_nexthop>\S+))?'
-                         '\s*(?:(?P<backup_interface>\S+))?')
+        p = ShowIpOspfSegmentRoutingAdjacencySid.patterns
 
         parsed_output = {}
 
@@ -8841,7 +8905,7 @@ class ShowIpOspfSegmentRoutingAdjacencySid(ShowIpOspfSegmentRoutingAdjacencySidS
             line = line.strip()
 
             # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-            result = r1.match(line)
+            result = p.r1.match(line)
             if result:
                 group = result.groupdict()
 
@@ -8857,7 +8921,7 @@ class ShowIpOspfSegmentRoutingAdjacencySid(ShowIpOspfSegmentRoutingAdjacencySidS
 
             # 16       10.16.2.2         Gi0/1/2            192.168.154.2       D U
             # 17       10.16.2.2         Gi0/1/1            192.168.4.2       D U
-            result = r2.match(line)
+            result = p.r2.match(line)
             if result:
 
                 group = result.groupdict()
@@ -8920,24 +8984,28 @@ class ShowIpOspfFastRerouteTiLfa(ShowIpOspfFastRerouteTiLfaSchema):
 
     cli_command = 'show ip ospf fast-reroute ti-lfa'
 
-    def cli(self, output=None):
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-
+    patterns = Patterns(
         # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>\S+)'
-            '\) +\(Process +ID +(?P<process_id>\d+)\)')
+        p1=r'^OSPF +Router +with +ID +\((?P<router_id>\S+)'
+           '\) +\(Process +ID +(?P<process_id>\d+)\)',
 
         # Process ID (65109)       no       yes      no          no
         # Area 8                  no       yes      no          no
         # Loopback0               no       no       no          no
         # GigabitEthernet0/1/2    no       yes      no          no
-        p2 = re.compile(r'^(?P<ospf_object>[\S\s]+) +(?P<ipfrr_enabled>(yes|no)'
-                         '( +\(inactive\))?) +(?P<sr_enabled>(yes|no)( +\(inactive\))?) '
-                         '+(?P<ti_lfa_configured>(yes|no)( +\(inactive\))?) +'
-                         '(?P<ti_lfa_enabled>(yes|no)( +\(inactive\))?)$')
+        p2=r'^(?P<ospf_object>[\S\s]+) +(?P<ipfrr_enabled>(yes|no)'
+           '( +\(inactive\))?) +(?P<sr_enabled>(yes|no)( +\(inactive\))?) '
+           '+(?P<ti_lfa_configured>(yes|no)( +\(inactive\))?) +'
+           '(?P<ti_lfa_enabled>(yes|no)( +\(inactive\))?)$',
+    )
+
+    def cli(self, output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        p = ShowIpOspfFastRerouteTiLfa.patterns
 
         # initial variables
         ret_dict = {}
@@ -8946,7 +9014,7 @@ class ShowIpOspfFastRerouteTiLfa(ShowIpOspfFastRerouteTiLfaSchema):
             line = line.strip()
 
             # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 router_id = group['router_id']
@@ -8961,7 +9029,7 @@ class ShowIpOspfFastRerouteTiLfa(ShowIpOspfFastRerouteTiLfaSchema):
             # Area 8                  no       yes      no          no
             # Loopback0               no       no       no          no
             # GigabitEthernet0/1/2    no       yes      no          no
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 ospf_object = group['ospf_object'].strip()
@@ -9025,23 +9093,26 @@ class ShowIpOspfSegmentRoutingProtectedAdjacencies(ShowIpOspfSegmentRoutingProte
 
     cli_command = 'show ip ospf segment-routing protected-adjacencies'
 
+    patterns = Patterns(
+        # OSPF Router with ID (10.4.1.1) (Process ID 65109)
+        p1=r'OSPF +Router +with +ID +\((?P<router_id>\S+)\) +\('
+           'Process +ID +(?P<process_id>\d+)\)',
+
+        # Area with ID (8)
+        p2=r'^Area +with +ID \((?P<area_id>\d+)\)$',
+
+        # 10.234.30.22     Gi10                192.168.10.2       17           192.168.10.3       Gi14
+        p3=r'^(?P<neighbor_id>\S+) +(?P<interface>\S+) +(?P<address>\S+) +('
+           r'?P<adj_sid>\d+)( +(?P<backup_nexthop>\S+))?( +(?P<backup_interface>\S+))?$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
         else:
             out = output
 
-        # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-        p1 = re.compile(r'OSPF +Router +with +ID +\((?P<router_id>\S+)\) +\('
-                         'Process +ID +(?P<process_id>\d+)\)')
-
-        # Area with ID (8)
-        p2 = re.compile(r'^Area +with +ID \((?P<area_id>\d+)\)$')
-
-        # 10.234.30.22     Gi10                192.168.10.2       17           192.168.10.3       Gi14
-        p3 = re.compile(
-            r'^(?P<neighbor_id>\S+) +(?P<interface>\S+) +(?P<address>\S+) +('
-            r'?P<adj_sid>\d+)( +(?P<backup_nexthop>\S+))?( +(?P<backup_interface>\S+))?$')
+        p = ShowIpOspfSegmentRoutingProtectedAdjacencies.patterns
 
         # initial variables
         ret_dict = {}
@@ -9050,7 +9121,7 @@ class ShowIpOspfSegmentRoutingProtectedAdjacencies(ShowIpOspfSegmentRoutingProte
             line = line.strip()
 
             # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 router_id = group['router_id']
@@ -9061,7 +9132,7 @@ class ShowIpOspfSegmentRoutingProtectedAdjacencies(ShowIpOspfSegmentRoutingProte
                 continue
 
             # Area with ID (8)
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 area_id = str(IPAddress(str(group['area_id'])))
@@ -9070,7 +9141,7 @@ class ShowIpOspfSegmentRoutingProtectedAdjacencies(ShowIpOspfSegmentRoutingProte
                 continue
 
             # 10.234.30.22     Gi10                192.168.10.2       17           192.168.10.3       Gi14
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 neighbor_id = group['neighbor_id']
@@ -9131,25 +9202,29 @@ class ShowIpOspfSegmentRoutingSidDatabase(ShowIpOspfSegmentRoutingSidDatabaseSch
 
     cli_command = ['show ip ospf segment-routing sid-database']
 
-    def cli(self, output=None):
-
-        if output is None:
-            out = self.device.execute(self.cli_command[0])
-        else:
-            out = output
-
+    patterns = Patterns(
         # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>[\d+\.]+)\) +'
-                        '\(Process +ID +(?P<pid>\d+)\)$')
+        p1=r'^OSPF +Router +with +ID +\((?P<router_id>[\d+\.]+)\) +'
+           '\(Process +ID +(?P<pid>\d+)\)$',
 
         # 1       (L)     10.4.1.1/32          10.4.1.1          8        Intra     0
         # 2               10.16.2.2/32          10.16.2.2          8        Intra     0
         #                 10.16.2.3/32          10.16.2.2          8        Intra     0
         # 3       (M)     10.16.2.3/32                                    Unknown   0
         #                 10.36.3.3/32               10.16.2.10         0
-        p2 = re.compile(r'(?:(?P<sid>\d+) +)?(?:\((?P<codes>[LNM,]+)\) +)?(?P<prefix>[\d\.\/]+)'
-                        r'( +(?P<adv_rtr_id>[\d\.]+))?( +(?P<area_id>\d+))?(?: +(?P<type>\w+))?'
-                        r'(?: +(?P<algo>\d+))?')
+        p2=r'(?:(?P<sid>\d+) +)?(?:\((?P<codes>[LNM,]+)\) +)?(?P<prefix>[\d\.\/]+)'
+           r'( +(?P<adv_rtr_id>[\d\.]+))?( +(?P<area_id>\d+))?(?: +(?P<type>\w+))?'
+           r'(?: +(?P<algo>\d+))?',
+    )
+
+    def cli(self, output=None):
+
+        if output is None:
+            out = self.device.execute(self.cli_command[0])
+        else:
+            out = output
+
+        p = ShowIpOspfSegmentRoutingSidDatabase.patterns
 
         ret_dict = {}
         sid_entries = 0
@@ -9158,7 +9233,7 @@ class ShowIpOspfSegmentRoutingSidDatabase(ShowIpOspfSegmentRoutingSidDatabaseSch
             line = line.strip()
 
             # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
 
@@ -9171,7 +9246,7 @@ class ShowIpOspfSegmentRoutingSidDatabase(ShowIpOspfSegmentRoutingSidDatabaseSch
             #                 10.16.2.3/32          10.16.2.2          8        Intra     0
             # 3       (M)     10.16.2.3/32                                    Unknown   0
             #                 10.36.3.3/32               10.16.2.10         0
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 sid_entries += 1
@@ -9242,6 +9317,23 @@ class ShowIpOspfSegmentRoutingGlobalBlock(ShowIpOspfSegmentRoutingGlobalBlockSch
     cli_command = ['show ip ospf segment-routing global-block',
                    'show ip ospf {process_id} segment-routing global-block']
 
+    patterns = Patterns(
+        # OSPF Router with ID (10.4.1.1) (Process ID 1234)
+        p1=r'^OSPF +Router +with +ID +\((?P<router_id>[\d+\.]+)\) +'
+           '\(Process +ID +(?P<pid>\d+)\)$',
+
+        # OSPF Segment Routing Global Blocks in Area 3
+        p2=r'^OSPF +Segment +Routing +Global +Blocks +in +Area (?P<area>\d+)$',
+
+        # *10.4.1.1         Yes         SPF,StrictSPF 16000      8000         Label
+        # 10.16.2.2         Yes         SPF,StrictSPF 16000      8000         Label
+        # *10.4.1.1         No
+        # 10.16.2.2         No
+        p3=r'^\*?(?P<router_id>[\d\.]+) +(?P<sr_capable>\w+)'
+           '(?: +(?P<sr_algorithm>[\w,]+) +(?P<srgb_base>\d+) +'
+           '(?P<srgb_range>\d+) +(?P<sid_label>\w+))?$',
+    )
+
     def cli(self, process_id=None, output=None):
 
         if not output:
@@ -9254,20 +9346,7 @@ class ShowIpOspfSegmentRoutingGlobalBlock(ShowIpOspfSegmentRoutingGlobalBlockSch
         else:
             out = output
 
-        # OSPF Router with ID (10.4.1.1) (Process ID 1234)
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>[\d+\.]+)\) +'
-                         '\(Process +ID +(?P<pid>\d+)\)$')
-
-        # OSPF Segment Routing Global Blocks in Area 3
-        p2 = re.compile(r'^OSPF +Segment +Routing +Global +Blocks +in +Area (?P<area>\d+)$')
-
-        # *10.4.1.1         Yes         SPF,StrictSPF 16000      8000         Label
-        # 10.16.2.2         Yes         SPF,StrictSPF 16000      8000         Label
-        # *10.4.1.1         No
-        # 10.16.2.2         No
-        p3 = re.compile(r'^\*?(?P<router_id>[\d\.]+) +(?P<sr_capable>\w+)'
-                         '(?: +(?P<sr_algorithm>[\w,]+) +(?P<srgb_base>\d+) +'
-                         '(?P<srgb_range>\d+) +(?P<sid_label>\w+))?$')
+        p = ShowIpOspfSegmentRoutingGlobalBlock.patterns
 
         ret_dict = {}
 
@@ -9275,7 +9354,7 @@ class ShowIpOspfSegmentRoutingGlobalBlock(ShowIpOspfSegmentRoutingGlobalBlockSch
             line = line.strip()
 
             # OSPF Router with ID (10.4.1.1) (Process ID 1234)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
 
@@ -9284,7 +9363,7 @@ class ShowIpOspfSegmentRoutingGlobalBlock(ShowIpOspfSegmentRoutingGlobalBlockSch
                 continue
 
             # OSPF Segment Routing Global Blocks in Area 3
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
 
@@ -9293,7 +9372,7 @@ class ShowIpOspfSegmentRoutingGlobalBlock(ShowIpOspfSegmentRoutingGlobalBlockSch
 
             # *10.4.1.1         Yes         SPF,StrictSPF 16000      8000         Label
             # 10.16.2.2         Yes         SPF,StrictSPF 16000      8000         Label
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
 
@@ -9401,86 +9480,90 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
 
     cli_command = 'show ip ospf segment-routing'
 
-    def cli(self, output=None):
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-        
+    patterns = Patterns(
         # OSPF Router with ID (10.16.2.2) (Process ID 65109)
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>\S+)\) +\('
-                         'Process +ID +(?P<process_id>\d+)\)$')
+        p1=r'^OSPF +Router +with +ID +\((?P<router_id>\S+)\) +\('
+           'Process +ID +(?P<process_id>\d+)\)$',
 
         # Global segment-routing state: Enabled
-        p2 = re.compile(r'^Global +segment\-routing +state: +'
-                         '(?P<global_segment_routing_state>\S+)$')
-        
+        p2=r'^Global +segment\-routing +state: +'
+           '(?P<global_segment_routing_state>\S+)$',
+
         # Prefer non-SR (LDP) Labels
-        p3 = re.compile(r'^Prefer +non\-SR +\(LDP\) +Labels$')
+        p3=r'^Prefer +non\-SR +\(LDP\) +Labels$',
 
         # Do not advertise Explicit Null
-        p4 = re.compile(r'^Do +not +advertise +Explicit +Null$')
+        p4=r'^Do +not +advertise +Explicit +Null$',
 
         # Global Block (SRGB):
-        p5 = re.compile(r'^Global +Block +\(SRGB\):$')
+        p5=r'^Global +Block +\(SRGB\):$',
 
         # Range: 16000 - 23999
-        p6 = re.compile(r'^Range: +(?P<start>\d+) +\- +(?P<end>\d+)$')
+        p6=r'^Range: +(?P<start>\d+) +\- +(?P<end>\d+)$',
 
         # State: Created
-        p7 = re.compile(r'^State: +(?P<state>\S+)$')
+        p7=r'^State: +(?P<state>\S+)$',
 
         # Local Block (SRLB):
-        p8 = re.compile(r'^Local +Block +\(SRLB\):$')
+        p8=r'^Local +Block +\(SRLB\):$',
 
         # Registered with SR App, client handle: 2
-        p9 = re.compile(r'^Registered +with +(?P<app_name>[\S\s]+), +'
-                         'client +handle: +(?P<client_handle>\d+)$')
+        p9=r'^Registered +with +(?P<app_name>[\S\s]+), +'
+           'client +handle: +(?P<client_handle>\d+)$',
 
         # SR algo 0 Connected map notifications active (handle 0x0), bitmask 0x1
-        p10 = re.compile(r'^SR +algo +(?P<algo>\d+) +(?P<notifications>[\S\s]+) +\('
-                          'handle +(?P<handle>\w+)\), +bitmask +(?P<bitmask>\w+)$')
+        p10=r'^SR +algo +(?P<algo>\d+) +(?P<notifications>[\S\s]+) +\('
+            'handle +(?P<handle>\w+)\), +bitmask +(?P<bitmask>\w+)$',
 
         # Registered with MPLS, client-id: 100
-        p12 = re.compile(r'^Registered +with +(?P<app_name>[\S\s]+), +client\-id: +'
-                          '(?P<client_id>\d+)$')
+        p12=r'^Registered +with +(?P<app_name>[\S\s]+), +client\-id: +'
+            '(?P<client_id>\d+)$',
 
         # Max labels: platform 16, available 13
-        p13 = re.compile(r'^Max +labels: +platform +(?P<platform>\d+), available +(?P<available>\d+)$')
+        p13=r'^Max +labels: +platform +(?P<platform>\d+), available +(?P<available>\d+)$',
 
         # Max labels pushed by OSPF: uloop tunnels 10, TI-LFA tunnels 10
-        p14 = re.compile(r'^Max +labels +pushed +by +OSPF: +uloop +tunnels +(?P<uloop_tunnels>\d+)'
-                          ', +TI\-LFA +tunnels +(?P<ti_lfa_tunnels>\d+)$')
+        p14=r'^Max +labels +pushed +by +OSPF: +uloop +tunnels +(?P<uloop_tunnels>\d+)'
+            ', +TI\-LFA +tunnels +(?P<ti_lfa_tunnels>\d+)$',
 
         # mfi label reservation ack not pending
-        p15 = re.compile(r'^mfi +label +reservation +ack +not +pending$')
+        p15=r'^mfi +label +reservation +ack +not +pending$',
 
         # Bind Retry timer not running
-        p16 = re.compile(r'^Bind +Retry +timer +not +running$')
-        
+        p16=r'^Bind +Retry +timer +not +running$',
+
         # Bind Retry timer running, left ???
-        p16_1 = re.compile(r'^Bind +Retry +timer +running, +left +(?P<bind_retry_timer_left>\S+)$')
+        p16_1=r'^Bind +Retry +timer +running, +left +(?P<bind_retry_timer_left>\S+)$',
 
         # Adj Label Bind Retry timer not running
-        p17 = re.compile(r'^Adj +Label +Bind +Retry +timer +not +running$')
+        p17=r'^Adj +Label +Bind +Retry +timer +not +running$',
 
         # Adj Label Bind Retry timer running, left ???
-        p17_1 = re.compile(r'^Adj +Label +Bind +Retry +timer +running, +left +(?P<adj_label_bind_retry_timer_left>\S+)$')
+        p17_1=r'^Adj +Label +Bind +Retry +timer +running, +left +(?P<adj_label_bind_retry_timer_left>\S+)$',
 
         # sr-app locks requested: srgb 0, srlb 0
-        p18 = re.compile(r'^sr\-app +locks +requested: +srgb +(?P<srgb>\d+), +srlb +(?P<srlb>\d+)$')
+        p18=r'^sr\-app +locks +requested: +srgb +(?P<srgb>\d+), +srlb +(?P<srlb>\d+)$',
 
         # TE Router ID 10.16.2.2
-        p19 = re.compile(r'^TE +Router +ID +(?P<te_router_id>\S+)$')
+        p19=r'^TE +Router +ID +(?P<te_router_id>\S+)$',
 
         # Area Topology name Forwarding Strict SPF
-        p20 = re.compile(r'^Area +Topology +name +Forwarding +Strict +SPF$')
+        p20=r'^Area +Topology +name +Forwarding +Strict +SPF$',
 
         # 8    Base             MPLS          Capable
         # AS external    Base             MPLS          Not applicable
-        p21 = re.compile(r'^(?P<area>(\d+|(\w+ +\w+))) +(?P<topology_name>\w+)'
-                         ' +(?P<forwarding>\w+) +(?P<strict_spf>\w+( +\w+)?)$')
+        p21=r'^(?P<area>(\d+|(\w+ +\w+))) +(?P<topology_name>\w+)'
+            ' +(?P<forwarding>\w+) +(?P<strict_spf>\w+( +\w+)?)$',
+    )
+
+    def cli(self, output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
         
+        p = ShowIpOspfSegmentRouting.patterns
+
         # initial variables
         ret_dict = {}
 
@@ -9488,7 +9571,7 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
             line = line.strip()
 
             # OSPF Router with ID (10.16.2.2) (Process ID 65109)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 router_id = group['router_id']
@@ -9505,7 +9588,7 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
                 continue
             
             # Global segment-routing state: Enabled
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 global_segment_routing_state = group['global_segment_routing_state']
@@ -9513,7 +9596,7 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
                 continue
             
             # Prefer non-SR (LDP) Labels
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 sr_attributes_dict = process_id_dict.setdefault('sr_attributes', {})
@@ -9521,7 +9604,7 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
                 continue
             
             # Do not advertise Explicit Null
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 sr_attributes_dict = process_id_dict.setdefault('sr_attributes', {})
@@ -9529,14 +9612,14 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
                 continue
             
             # Global Block (SRGB):
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 block_dict = process_id_dict.setdefault('global_block_srgb', {})
                 continue
             
             # Range: 16000 - 23999
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 range_dict = block_dict.setdefault('range', {})
@@ -9545,7 +9628,7 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
                 continue
             
             # State: Created
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 group = m.groupdict()
                 state = group['state']
@@ -9553,14 +9636,14 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
                 continue
             
             # Local Block (SRLB):
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 group = m.groupdict()
                 block_dict = process_id_dict.setdefault('local_block_srlb', {})
                 continue
             
             # Registered with SR App, client handle: 2
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 group = m.groupdict()
                 app_name = group['app_name']
@@ -9572,7 +9655,7 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
             
             # SR algo 0 Connected map notifications active (handle 0x0), bitmask 0x1
             # SR algo 0 Active policy map notifications active (handle 0x2), bitmask 0xC
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 group = m.groupdict()
                 algo = int(group['algo'])
@@ -9589,7 +9672,7 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
                 continue
             
             # Registered with MPLS, client-id: 100
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 group = m.groupdict()
                 app_name = group['app_name']
@@ -9600,7 +9683,7 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
                 continue
             
             # Max labels: platform 16, available 13
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 group = m.groupdict()
                 platform = int(group['platform'])
@@ -9611,7 +9694,7 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
                 continue
             
             # Max labels pushed by OSPF: uloop tunnels 10, TI-LFA tunnels 10
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 group = m.groupdict()
                 uloop_tunnels = int(group['uloop_tunnels'])
@@ -9623,19 +9706,19 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
                 continue
 
             # mfi label reservation ack not pending
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 process_id_dict.update({'mfi_label_reservation_ack_pending': False})
                 continue
 
             # Bind Retry timer not running
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 process_id_dict.update({'bind_retry_timer_running': False})
                 continue
             
             # Bind Retry timer running, left ???
-            m = p16_1.match(line)
+            m = p.p16_1.match(line)
             if m:
                 group = m.groupdict()
                 bind_retry_timer_left = group['bind_retry_timer_left']
@@ -9643,13 +9726,13 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
                 continue
 
             # Adj Label Bind Retry timer not running
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 process_id_dict.update({'adj_label_bind_retry_timer_running': False})
                 continue
             
             # adj_label_bind_retry_timer_left
-            m = p17_1.match(line)
+            m = p.p17_1.match(line)
             if m:
                 group = m.groupdict()
                 adj_label_bind_retry_timer_left = group['adj_label_bind_retry_timer_left']
@@ -9657,7 +9740,7 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
                 continue
 
             # sr-app locks requested: srgb 0, srlb 0
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 group = m.groupdict()
                 srgb = int(group['srgb'])
@@ -9668,7 +9751,7 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
                 continue
             
             # TE Router ID 10.16.2.2
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 group = m.groupdict()
                 te_router_id = group['te_router_id']
@@ -9677,14 +9760,14 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
                 continue
 
             # Area Topology name Forwarding Strict SPF
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 segment_routing_enabled_dict = process_id_dict.setdefault('segment_routing_enabled', {})
                 continue
 
             # 8    Base             MPLS          Capable
             # AS external    Base             MPLS          Not applicable
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 group = m.groupdict()
                 area = group['area']
@@ -9716,101 +9799,105 @@ class ShowIpOspfLinksParser2(MetaParser):
         * 'show ip ospf sham-links __'
     '''
 
-    def cli(self, cmd, link_type,output=None):
-
-        assert link_type in ['virtual_links', 'sham_links']
-
-        if output is None:
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
-        # Init vars
-        ret_dict = {}
-        af = 'ipv4'
-
-        # crypo_algorithm dict
-        crypto_dict = {'cryptographic': 'md5', 'simple password': 'simple'}
-
+    patterns = Patterns(
         # Sham Link OSPF_SL0 to address 10.151.22.22 is up
         # Virtual Link OSPF_VL0 to router 10.64.4.4 is up
-        p1 = re.compile(r'^(Virtual|Sham) +Link +(?P<interface>(\S+)) +to'
-                            ' +(address|router) +(?P<address>(\S+)) +is'
-                            ' +(?P<link_state>(up|down))$')
+        p1=r'^(Virtual|Sham) +Link +(?P<interface>(\S+)) +to'
+           ' +(address|router) +(?P<address>(\S+)) +is'
+           ' +(?P<link_state>(up|down))$',
 
         # Area 1, source address 10.21.33.33
         # Area 1 source address 10.229.11.11
-        p2 = re.compile(r'^Area +(?P<area>(\S+)),? +source +address'
-                            ' +(?P<source_address>(\S+))$')
-        
+        p2=r'^Area +(?P<area>(\S+)),? +source +address'
+           ' +(?P<source_address>(\S+))$',
+
         # Run as demand circuit
-        p3 = re.compile(r'^Run +as +demand +circuit$')
+        p3=r'^Run +as +demand +circuit$',
 
         # DoNotAge LSA not allowed (Number of DCbitless LSA is 7).
         # DoNotAge LSA not allowed (Number of DCbitless LSA is 1). Cost of using 111 State POINT_TO_POINT,
-        p4 = re.compile(r'^DoNotAge +LSA +not +allowed'
-                            ' +\(Number +of +DCbitless +LSA +is +(?P<dcbitless>(\d+))\).'
-                            '(?: +Cost +of +using +(?P<cost>(\d+)))?'
-                            '(?: State +(?P<state>(\S+)))?$')
+        p4=r'^DoNotAge +LSA +not +allowed'
+           ' +\(Number +of +DCbitless +LSA +is +(?P<dcbitless>(\d+))\).'
+           '(?: +Cost +of +using +(?P<cost>(\d+)))?'
+           '(?: State +(?P<state>(\S+)))?$',
 
         # Transit area 1
         # Transit area 1, via interface GigabitEthernet0/1
-        p5 = re.compile(r'^Transit +area +(?P<area>(\S+)),'
-                            '(?: +via +interface +(?P<intf>(\S+)))?$')
+        p5=r'^Transit +area +(?P<area>(\S+)),'
+           '(?: +via +interface +(?P<intf>(\S+)))?$',
 
         # Topology-MTID    Cost    Disabled     Shutdown      Topology Name
         #             0       1          no           no               Base
-        p6 = re.compile(r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
-                            ' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
-                            ' +(?P<topo_name>(\S+))$')
+        p6=r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
+           ' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
+           ' +(?P<topo_name>(\S+))$',
 
         # Transmit Delay is 1 sec, State POINT_TO_POINT,
-        p7 = re.compile(r'^Transmit +Delay +is +(?P<transmit_delay>(\d+))'
-                            ' +sec, +State +(?P<state>(\S+)),?$')
+        p7=r'^Transmit +Delay +is +(?P<transmit_delay>(\d+))'
+           ' +sec, +State +(?P<state>(\S+)),?$',
 
         # Timer intervals configured, Hello 3, Dead 13, Wait 13, Retransmit 5
         # Timer intervals configured, Hello 4, Dead 16, Wait 16, Retransmit 44
         # Timer intervals configured, Hello 10, Dead 40, Wait 40,
-        p8 = re.compile(r'^Timer +intervals +configured,'
-                            ' +Hello +(?P<hello>(\d+)),'
-                            ' +Dead +(?P<dead>(\d+)),'
-                            ' +Wait +(?P<wait>(\d+)),'
-                            '(?: +Retransmit +(?P<retransmit>(\d+)))?$')
+        p8=r'^Timer +intervals +configured,'
+           ' +Hello +(?P<hello>(\d+)),'
+           ' +Dead +(?P<dead>(\d+)),'
+           ' +Wait +(?P<wait>(\d+)),'
+           '(?: +Retransmit +(?P<retransmit>(\d+)))?$',
 
         # Strict TTL checking enabled, up to 3 hops allowed
-        p9 = re.compile(r'^Strict +TTL +checking'
-                            ' +(?P<strict_ttl>(enabled|disabled))'
-                            '(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$')
+        p9=r'^Strict +TTL +checking'
+           ' +(?P<strict_ttl>(enabled|disabled))'
+           '(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$',
 
         # Hello due in 00:00:03:179
-        p10 = re.compile(r'^Hello +due +in +(?P<hello_timer>(\S+))$')
+        p10=r'^Hello +due +in +(?P<hello_timer>(\S+))$',
 
         # Adjacency State FULL
-        p11 = re.compile(r'^Adjacency +State +(?P<adj_state>(\S+))$')
+        p11=r'^Adjacency +State +(?P<adj_state>(\S+))$',
 
         # Index 1/2/2, retransmission queue length 0, number of retransmission 2
-        p12 = re.compile(r'^Index +(?P<index>(\S+)), +retransmission +queue'
-                            ' +length +(?P<length>(\d+)), +number +of'
-                            ' +retransmission +(?P<retrans>(\d+))$')
-        
+        p12=r'^Index +(?P<index>(\S+)), +retransmission +queue'
+            ' +length +(?P<length>(\d+)), +number +of'
+            ' +retransmission +(?P<retrans>(\d+))$',
+
         # First 0x0(0)/0x0(0)/0x0(0) Next 0x0(0)/0x0(0)/0x0(0)
-        p13 = re.compile(r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$')
+        p13=r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$',
 
         # Last retransmission scan length is 1, maximum is 1
-        p14 = re.compile(r'^Last +retransmission +scan +length +is'
-                            ' +(?P<len>(\d+)), +maximum +is +(?P<max>(\d+))$')
+        p14=r'^Last +retransmission +scan +length +is'
+            ' +(?P<len>(\d+)), +maximum +is +(?P<max>(\d+))$',
 
         # Last retransmission scan time is 0 msec, maximum is 0 msec
-        p15 = re.compile(r'^Last +retransmission +scan +time +is'
-                            ' +(?P<time>(\d+)) +msec, +maximum +is'
-                            ' +(?P<max>(\d+)) +msec$')
+        p15=r'^Last +retransmission +scan +time +is'
+            ' +(?P<time>(\d+)) +msec, +maximum +is'
+            ' +(?P<max>(\d+)) +msec$',
+    )
+
+    def cli(self, cmd, link_type,output=None):
+
+        assert link_type in ['virtual_links', 'sham_links']
+
+        if output is None:
+            out = self.device.execute(cmd)
+        else:
+            out = output
+
+        # Init vars
+        ret_dict = {}
+        af = 'ipv4'
+
+        # crypo_algorithm dict
+        crypto_dict = {'cryptographic': 'md5', 'simple password': 'simple'}
+
+        p = ShowIpOspfLinksParser2.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # Sham Link OSPF_SL0 to address 10.151.22.22 is up
             # Virtual Link OSPF_VL0 to router 10.64.4.4 is up
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 address = str(m.groupdict()['address'])
                 sl_remote_id = vl_router_id = address
@@ -9832,7 +9919,7 @@ class ShowIpOspfLinksParser2(MetaParser):
 
             # Area 1, source address 10.21.33.33
             # Area 1 source address 10.229.11.11
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 area = str(IPAddress(str(m.groupdict()['area'])))
                 source_address = str(m.groupdict()['source_address'])
@@ -9869,7 +9956,7 @@ class ShowIpOspfLinksParser2(MetaParser):
                 continue
 
             # Run as demand circuit
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 if link_type == 'sham_links':
                     sub_dict['demand_circuit'] = True
@@ -9879,7 +9966,7 @@ class ShowIpOspfLinksParser2(MetaParser):
 
             # DoNotAge LSA not allowed (Number of DCbitless LSA is 7).
             # DoNotAge LSA not allowed (Number of DCbitless LSA is 1). Cost of using 111 State POINT_TO_POINT,
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 dcbitless_lsa_count = int(m.groupdict()['dcbitless'])
                 donotage_lsa = 'not allowed'
@@ -9900,7 +9987,7 @@ class ShowIpOspfLinksParser2(MetaParser):
 
             # Transit area 1
             # Transit area 1, via interface GigabitEthernet0/1
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 area = str(IPAddress(str(m.groupdict()['area'])))
 
@@ -9956,7 +10043,7 @@ class ShowIpOspfLinksParser2(MetaParser):
 
             # Topology-MTID    Cost    Disabled     Shutdown      Topology Name
             #             0       1          no           no               Base
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 mtid = int(m.groupdict()['mtid'])
                 if 'topology' not in sub_dict:
@@ -9976,7 +10063,7 @@ class ShowIpOspfLinksParser2(MetaParser):
                     continue
             
             # Transmit Delay is 1 sec, State POINT_TO_POINT,
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 sub_dict['transmit_delay'] = int(m.groupdict()['transmit_delay'])
                 state = str(m.groupdict()['state']).lower()
@@ -9987,7 +10074,7 @@ class ShowIpOspfLinksParser2(MetaParser):
             # Timer intervals configured, Hello 3, Dead 13, Wait 13, Retransmit 5
             # Timer intervals configured, Hello 4, Dead 16, Wait 16, Retransmit 44
             # Timer intervals configured, Hello 10, Dead 40, Wait 40,
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 if m.groupdict()['hello']:
                     sub_dict['hello_interval'] = int(m.groupdict()['hello'])
@@ -10000,7 +10087,7 @@ class ShowIpOspfLinksParser2(MetaParser):
                 continue
 
             # Strict TTL checking enabled, up to 3 hops allowed
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 if 'ttl_security' not in sub_dict:
                     sub_dict['ttl_security'] = {}
@@ -10013,19 +10100,19 @@ class ShowIpOspfLinksParser2(MetaParser):
                     continue
 
             # Hello due in 00:00:03:179
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 sub_dict['hello_timer'] = str(m.groupdict()['hello_timer'])
                 continue          
           
             # Adjacency State FULL
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 sub_dict['adjacency_state'] = str(m.groupdict()['adj_state']).lower()
                 continue
 
             # Index 1/2/2, retransmission queue length 0, number of retransmission 2
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 sub_dict['index'] = str(m.groupdict()['index'])
                 sub_dict['retrans_qlen'] = int(m.groupdict()['length'])
@@ -10033,14 +10120,14 @@ class ShowIpOspfLinksParser2(MetaParser):
                 continue
 
             # First 0x0(0)/0x0(0)/0x0(0) Next 0x0(0)/0x0(0)/0x0(0)
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 sub_dict['first'] = str(m.groupdict()['first'])
                 sub_dict['next'] = str(m.groupdict()['next'])
                 continue
 
             # Last retransmission scan length is 1, maximum is 1
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 sub_dict['last_retransmission_scan_length'] = \
                     int(m.groupdict()['len'])
@@ -10049,7 +10136,7 @@ class ShowIpOspfLinksParser2(MetaParser):
                 continue
 
             # Last retransmission scan time is 0 msec, maximum is 0 msec
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 sub_dict['last_retransmission_scan_time'] = \
                     int(m.groupdict()['time'])
@@ -34,6 +34,7 @@ from xml.dom import minidom
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import Patterns
 # genie.parsergen
 try:
     import genie.parsergen
@@ -71,40 +72,44 @@ class ShowBootvar(ShowBootvarSchema):
 
     cli_command = 'show bootvar'
 
-    def cli(self, output=None):
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-
-        boot_dict = {}
-        boot_variable = None
-
+    patterns = Patterns(
         # BOOT variable = bootflash:/asr1000rpx.bin,12;
         # BOOT variable = flash:cat3k_caa-universalk9.BLD_POLARIS_DEV_LATEST_20150907_031219.bin;flash:cat3k_caa-universalk9.BLD_POLARIS_DEV_LATEST_20150828_174328.SSA.bin;flash:ISSUCleanGolden;
         # BOOT variable = tftp:/auto/tftp-best/genie_images/genie_clean/asr1000-genie-image 255.255.255.255,12;
         # BOOT variable = tftp:/auto/tftp-best/genie_images/genie_clean/asr1000-genie-image 255.255.255.255,12;harddisk:/asr1000-genie-image_asr-MIB-1,12;
-        p1 = re.compile(r'^BOOT +variable +=( *(?P<var>\S+);?)?$')
+        p1=r'^BOOT +variable +=( *(?P<var>\S+);?)?$',
 
         # Standby BOOT variable = bootflash:/asr1000rpx.bin,12;
-        p2 = re.compile(r'^Standby +BOOT +variable +=( *(?P<var>\S+);)?$')
+        p2=r'^Standby +BOOT +variable +=( *(?P<var>\S+);)?$',
 
         # Configuration register is 0x2002
         # Configuration register is 0x2 (will be 0x2102 at next reload)
         # Configuration Register is 0x102
-        p3 = re.compile(r'Configuration +[R|r]egister +is +(?P<var1>(\S+))'
-                        r'(?: +\(will +be +(?P<var2>(\S+)) +at +next +reload\))?$')
+        p3=r'Configuration +[R|r]egister +is +(?P<var1>(\S+))'
+           r'(?: +\(will +be +(?P<var2>(\S+)) +at +next +reload\))?$',
 
         # Standby Configuration register is 0x2002
         # Standby Configuration register is 0x1  (will be 0x2102 at next reload)
-        p4 = re.compile(r'^Standby +Configuration +register +is +(?P<var>\w+)'
-                        r'(?: +\(will +be +(?P<var2>\S+) +at +next +reload\))?$')
+        p4=r'^Standby +Configuration +register +is +(?P<var>\w+)'
+           r'(?: +\(will +be +(?P<var2>\S+) +at +next +reload\))?$',
 
         # CONFIG_FILE variable =
-        p5 = re.compile(r'^CONFIG_FILE +variable += +(?P<var>\S+)$')
+        p5=r'^CONFIG_FILE +variable += +(?P<var>\S+)$',
 
         # BOOTLDR variable =
-        p6 = re.compile(r'^BOOTLDR +variable += +(?P<var>\S+)$')
+        p6=r'^BOOTLDR +variable += +(?P<var>\S+)$',
+    )
+
+    def cli(self, output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        boot_dict = {}
+        boot_variable = None
+
+        p = ShowBootvar.patterns
 
         # BOOTLDR variable does not exist
         # not parsing
@@ -116,7 +121,7 @@ class ShowBootvar(ShowBootvarSchema):
             line = line.strip()
 
             # BOOT variable = disk0:s72033-adventerprisek9-mz.122-33.SRE0a-ssr-nxos-76k-1,12;
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 boot = m.groupdict()['var']
                 if boot:
@@ -125,7 +130,7 @@ class ShowBootvar(ShowBootvarSchema):
                 continue
 
             # Standby BOOT variable = bootflash:/asr1000rpx.bin,12;
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 boot = m.groupdict()['var']
                 if boot:
@@ -133,7 +138,7 @@ class ShowBootvar(ShowBootvarSchema):
                 continue
 
             # Configuration register is 0x2002
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 boot_dict.setdefault('active', {})['configuration_register'] = m.groupdict()['var1']
                 if m.groupdict()['var2']:
@@ -141,7 +146,7 @@ class ShowBootvar(ShowBootvarSchema):
                 continue
 
             # Standby Configuration register is 0x2002
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 boot_dict.setdefault('standby', {})['configuration_register'] = m.groupdict()['var']
                 if m.groupdict()['var2']:
@@ -149,14 +154,14 @@ class ShowBootvar(ShowBootvarSchema):
                 continue
 
             # CONFIG_FILE variable =
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 if m.groupdict()['var']:
                     boot_dict.update({'config_file': m.groupdict()['var']})
                 continue
 
             # BOOTLDR variable =
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 if m.groupdict()['var']:
                     boot_dict.setdefault('standby', {})['bootldr'] = m.groupdict()['var']
@@ -307,105 +312,87 @@ class ShowVersion(ShowVersionSchema):
     cli_command = 'show version'
     exclude = ['system_restarted_at', 'uptime_this_cp', 'uptime']
 
-    def cli(self, output=None):
-        """parsing mechanism: cli
-
-        Function cli() defines the cli type output parsing mechanism which
-        typically contains 3 steps: exe
-        cuting, transforming, returning
-        """
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-
-        version_dict = {}
-        active_dict = {}
-        rtr_type = ''
-        suite_flag = False
-        license_flag = False
-
+    patterns = Patterns(
         # Cisco IOS XE Software, Version BLD_POLARIS_DEV_LATEST_20200702_122021_V17_4_0_67_2
-        p0 = re.compile(
-            r'^Cisco +([\S\s]+) +Software, +Version +(?P<xe_version>.*)$')
+        p0=r'^Cisco +([\S\s]+) +Software, +Version +(?P<xe_version>.*)$',
 
         # version
         # Cisco IOS Software [Everest], ISR Software (X86_64_LINUX_IOSD-UNIVERSALK9-M), Version 16.6.5, RELEASE SOFTWARE (fc3)
         # Cisco IOS Software, IOS-XE Software, Catalyst 4500 L3 Switch Software (cat4500e-UNIVERSALK9-M), Version 03.03.02.SG RELEASE SOFTWARE (fc1)
-        p1 = re.compile(r'^[Cc]isco +IOS +[Ss]oftware\, +(?P<os>([\S]+)) +Software\, '
-                        r'+(?P<platform>.+) Software +\((?P<image_id>.+)\).+[Vv]ersion '
-                        r'+(?P<version>\S+) +.*$')
+        p1=r'^[Cc]isco +IOS +[Ss]oftware\, +(?P<os>([\S]+)) +Software\, '
+           r'+(?P<platform>.+) Software +\((?P<image_id>.+)\).+[Vv]ersion '
+           r'+(?P<version>\S+) +.*$',
 
         # IOS (tm) Catalyst 4000 L3 Switch Software (cat4000-I9S-M), Version 12.2(18)EW5, RELEASE SOFTWARE (fc1)
         # IOS (tm) s72033_rp Software (s72033_rp-ADVENTERPRISEK9_WAN-M), Version 12.2(18)SXF7, RELEASE SOFTWARE (fc1)
-        p1_1 = re.compile(r'^(?P<os>[A-Z]+) +\(.*\) +(?P<platform>.+) +Software'
-                          r' +\((?P<image_id>.+)\).+( +Experimental)? +[Vv]ersion'
-                          r' +(?P<version>\S+), +RELEASE SOFTWARE .*$')
+        p1_1=r'^(?P<os>[A-Z]+) +\(.*\) +(?P<platform>.+) +Software'
+             r' +\((?P<image_id>.+)\).+( +Experimental)? +[Vv]ersion'
+             r' +(?P<version>\S+), +RELEASE SOFTWARE .*$',
 
         # 16.6.5
-        p2 = re.compile(r'^(?P<ver_short>\d+\.\d+).*')
+        p2=r'^(?P<ver_short>\d+\.\d+).*',
 
         # Cisco IOS Software [Fuji], ASR1000 Software (X86_64_LINUX_IOSD-UNIVERSALK9-M), Version 16.7.1prd4, RELEASE SOFTWARE (fc1)
         # Cisco IOS Software [Fuji], Catalyst L3 Switch Software (CAT3K_CAA-UNIVERSALK9-M), Experimental Version 16.8.20170924:182909 [polaris_dev-/nobackup/mcpre/BLD-BLD_POLARIS_DEV_LATEST_20170924_191550 132]
         # Cisco IOS Software, 901 Software (ASR901-UNIVERSALK9-M), Version 15.6(2)SP4, RELEASE SOFTWARE (fc3)
         # Cisco IOS Software [Amsterdam], Catalyst L3 Switch Software (CAT9K_IOSXE), Experimental Version 17.4.20200702:124009 [S2C-build-polaris_dev-116872-/nobackup/mcpre/BLD-BLD_POLARIS_DEV_LATEST_20200702_122021 243]
         # Cisco IOS Software [Denali], ASR1000 Software (X86_64_LINUX_IOSD-UNIVERSALK9-M), Experimental Version 16.3.20170410:103306 [v163_mr_throttle-BLD-BLD_V163_MR_THROTTLE_LATEST_20170410_093453 118]
-        p3 = re.compile(r'^[Cc]isco +(?P<os>[A-Z]+) +[Ss]oftware(.+)?\, '
-                        r'+(?P<platform>.+) +Software +\((?P<image_id>.+)\).+( '
-                        r'+Experimental)? +[Vv]ersion '
-                        r'+(?P<version>[a-zA-Z0-9\.\:\(\)]+) *,? *'
-                        r'(?P<label>(\[.+?(?P<build_label>BLD_\S+)? \d+\])|.*)$')
+        p3=r'^[Cc]isco +(?P<os>[A-Z]+) +[Ss]oftware(.+)?\, '
+           r'+(?P<platform>.+) +Software +\((?P<image_id>.+)\).+( '
+           r'+Experimental)? +[Vv]ersion '
+           r'+(?P<version>[a-zA-Z0-9\.\:\(\)]+) *,? *'
+           r'(?P<label>(\[.+?(?P<build_label>BLD_\S+)? \d+\])|.*)$',
 
         # Copyright (c) 1986-2016 by Cisco Systems, Inc.
-        p4 = re.compile(r'^Copyright +(.*)$')
+        p4=r'^Copyright +(.*)$',
 
         # Technical Support: http://www.cisco.com/techsupport
-        p5 = re.compile(r'^Technical +Support: +http\:\/\/www'
-                        r'\.cisco\.com\/techsupport')
+        p5=r'^Technical +Support: +http\:\/\/www'
+           r'\.cisco\.com\/techsupport',
 
         # rom
-        p6 = re.compile(r'^ROM\: +(?P<rom>.+)$')
+        p6=r'^ROM\: +(?P<rom>.+)$',
 
         # ROM: Bootstrap program is IOSv
-        p7 = re.compile(r'^Bootstrap +program +is +(?P<os>.+)$')
+        p7=r'^Bootstrap +program +is +(?P<os>.+)$',
 
         # bootldr
-        p8 = re.compile(r'^BOOTLDR\: +(?P<bootldr>.+)$')
+        p8=r'^BOOTLDR\: +(?P<bootldr>.+)$',
 
         # hostname & uptime
-        p9 = re.compile(r'^(?P<hostname>.+) +uptime +is +(?P<uptime>.+)$')
+        p9=r'^(?P<hostname>.+) +uptime +is +(?P<uptime>.+)$',
 
         # uptime_this_cp
-        p10 = re.compile(r'^[Uu]ptime +for +this +control +processor '
-                         r'+is +(?P<uptime_this_cp>.+)$')
+        p10=r'^[Uu]ptime +for +this +control +processor '
+            r'+is +(?P<uptime_this_cp>.+)$',
 
         # system_restarted_at
-        p11 = re.compile(r'^[Ss]ystem +restarted +at '
-                         r'+(?P<system_restarted_at>.+)$')
+        p11=r'^[Ss]ystem +restarted +at '
+            r'+(?P<system_restarted_at>.+)$',
 
         # system_image
         # System image file is "tftp://10.1.6.241//auto/genie-ftp/Edison/cat3k_caa-universalk9.BLD__20170410_174845.SSA.bin"
         # System image file is "harddisk:test-image-PE1-13113029"
-        p12 = re.compile(r'^[Ss]ystem +image +file +is '
-                         r'+\"(?P<system_image>.+)\"')
+        p12=r'^[Ss]ystem +image +file +is '
+            r'+\"(?P<system_image>.+)\"',
 
         # last_reload_reason
-        p13 = re.compile(r'^[Ll]ast +reload +reason\: '
-                         r'+(?P<last_reload_reason>.+)$')
+        p13=r'^[Ll]ast +reload +reason\: '
+            r'+(?P<last_reload_reason>.+)$',
 
         # last_reload_reason
         # Last reset from power-on
-        p14 = re.compile(r'^[Ll]ast +reset +from +(?P<last_reload_reason>.+)$')
+        p14=r'^[Ll]ast +reset +from +(?P<last_reload_reason>.+)$',
 
         # license_type
-        p15 = re.compile(r'^[Ll]icense +[Tt]ype\: +(?P<license_type>.+)$')
+        p15=r'^[Ll]icense +[Tt]ype\: +(?P<license_type>.+)$',
 
         # license_level
-        p16 = re.compile(r'^\s*[Ll]icense +[Ll]evel\: +(?P<license_level>.+)$')
+        p16=r'^\s*[Ll]icense +[Ll]evel\: +(?P<license_level>.+)$',
 
         # next_reload_license_level
-        p17 = re.compile(r'^[Nn]ext +(reload|reboot) +license +Level\: '
-                         r'+(?P<next_reload_license_level>.+)$')
+        p17=r'^[Nn]ext +(reload|reboot) +license +Level\: '
+            r'+(?P<next_reload_license_level>.+)$',
 
         # chassis, processor_type, main_mem and rtr_type
         # cisco WS-C3650-24PD (MIPS) processor (revision H0) with 829481K/6147K bytes of memory.
@@ -416,190 +403,210 @@ class ShowVersion(ShowVersionSchema):
         # cisco ISR4451-X/K9 (2RU) processor with 1795979K/6147K bytes of memory.
         # cisco WS-C4507R+E (MPC8572) processor (revision 10) with 2097152K/20480K bytes of memory.
         # Cisco CISCO1941/K9 (revision 1.0) with 491520K/32768K bytes of memory.
-        p18 = re.compile(r'^(C|c)isco +(?P<chassis>[a-zA-Z0-9\-\/\+]+) '
-                         r'+\((?P<processor_type>[^)]*)\) +(.*?)with '
-                         r'+(?P<main_mem>[0-9]+)[kK](\/[0-9]+[kK])?')
+        p18=r'^(C|c)isco +(?P<chassis>[a-zA-Z0-9\-\/\+]+) '
+            r'+\((?P<processor_type>[^)]*)\) +(.*?)with '
+            r'+(?P<main_mem>[0-9]+)[kK](\/[0-9]+[kK])?',
 
         # Cisco CISCO3945-CHASSIS (revision 1.0) with C3900-SPE150/K9 with 1835264K/261888K bytes of memory.
-        p18_2 = re.compile(r'^(C|c)isco +(?P<chassis>[a-zA-Z0-9\-\/\+]+) +.* '
-                           r'+with +(?P<processor_type>.+) +with +(?P<main_mem>[0-9]+)[kK](\/[0-9]+[kK])?')
+        p18_2=r'^(C|c)isco +(?P<chassis>[a-zA-Z0-9\-\/\+]+) +.* '
+              r'+with +(?P<processor_type>.+) +with +(?P<main_mem>[0-9]+)[kK](\/[0-9]+[kK])?',
 
         # chassis_sn
-        p19 = re.compile(r'^[pP]rocessor +board +ID '
-                         r'+(?P<chassis_sn>[a-zA-Z0-9]+)')
+        p19=r'^[pP]rocessor +board +ID '
+            r'+(?P<chassis_sn>[a-zA-Z0-9]+)',
 
         # number_of_intfs
-        p20 = re.compile(r'^(?P<number_of_ports>\d+) +(?P<interface>.+) '
-                         r'+(interface(?:s)?|line|port(?:s)?)$')
+        p20=r'^(?P<number_of_ports>\d+) +(?P<interface>.+) '
+            r'+(interface(?:s)?|line|port(?:s)?)$',
 
         # mem_size
-        p21 = re.compile(r'^(?P<mem_size>\d+)K +bytes +of '
-                         r'+(?P<memories>.+) +[Mm]emory\.')
+        p21=r'^(?P<mem_size>\d+)K +bytes +of '
+            r'+(?P<memories>.+) +[Mm]emory\.',
 
         # disks, disk_size and type_of_disk
-        p22 = re.compile(r'^(?P<disk_size>\d+)K bytes of '
-                         r'(?P<type_of_disk>.*) at (?P<disks>.+)$')
+        p22=r'^(?P<disk_size>\d+)K bytes of '
+            r'(?P<type_of_disk>.*) at (?P<disks>.+)$',
 
         # os
         # Cisco IOS Software,
-        p23 = re.compile(r'^[Cc]isco +(?P<os>[a-zA-Z\-]+) '
-                         r'+[Ss]oftware\,')
+        p23=r'^[Cc]isco +(?P<os>[a-zA-Z\-]+) '
+            r'+[Ss]oftware\,',
 
         # curr_config_register
-        p24 = re.compile(r'^[Cc]onfiguration +register +is '
-                         r'+(?P<curr_config_register>[a-zA-Z0-9]+)')
+        p24=r'^[Cc]onfiguration +register +is '
+            r'+(?P<curr_config_register>[a-zA-Z0-9]+)',
 
         # next_config_register
-        p25 = re.compile(r'^[Cc]onfiguration +register +is +[a-zA-Z0-9]+ '
-                         r'+\(will be (?P<next_config_register>[a-zA-Z0-9]+) '
-                         r'at next reload\)')
+        p25=r'^[Cc]onfiguration +register +is +[a-zA-Z0-9]+ '
+            r'+\(will be (?P<next_config_register>[a-zA-Z0-9]+) '
+            r'at next reload\)',
 
         # switch_number
-        p26 = re.compile(r'^[Ss]witch +0(?P<switch_number>\d+)$')
+        p26=r'^[Ss]witch +0(?P<switch_number>\d+)$',
 
         # uptime
-        p27 = re.compile(r'^[Ss]witch +[Uu]ptime +\: +(?P<uptime>.+)$')
+        p27=r'^[Ss]witch +[Uu]ptime +\: +(?P<uptime>.+)$',
 
         # mac_address
-        p28 = re.compile(r'^[Bb]ase +[Ee]thernet +MAC +[Aa]ddress '
-                         r'+\: +(?P<mac_address>.+)$')
+        p28=r'^[Bb]ase +[Ee]thernet +MAC +[Aa]ddress '
+            r'+\: +(?P<mac_address>.+)$',
 
         # mb_assembly_num
-        p29 = re.compile(r'^[Mm]otherboard +[Aa]ssembly +[Nn]umber +\: '
-                         r'+(?P<mb_assembly_num>.+)$')
+        p29=r'^[Mm]otherboard +[Aa]ssembly +[Nn]umber +\: '
+            r'+(?P<mb_assembly_num>.+)$',
 
         # mb_sn
-        p30 = re.compile(r'^[Mm]otherboard +[Ss]erial +[Nn]umber +\: '
-                         r'+(?P<mb_sn>.+)$')
+        p30=r'^[Mm]otherboard +[Ss]erial +[Nn]umber +\: '
+            r'+(?P<mb_sn>.+)$',
 
         # model_rev_num
-        p31 = re.compile(r'^[Mm]odel +[Rr]evision +[Nn]umber +\: '
-                         r'+(?P<model_rev_num>.+)$')
+        p31=r'^[Mm]odel +[Rr]evision +[Nn]umber +\: '
+            r'+(?P<model_rev_num>.+)$',
 
         # mb_rev_num
-        p32 = re.compile(r'^[Mm]otherboard +[Rr]evision +[Nn]umber +\: '
-                         r'+(?P<mb_rev_num>.+)$')
+        p32=r'^[Mm]otherboard +[Rr]evision +[Nn]umber +\: '
+            r'+(?P<mb_rev_num>.+)$',
 
         # model_num
-        p33 = re.compile(r'^[Mm]odel +[Nn]umber +\: +(?P<model_num>.+)$')
+        p33=r'^[Mm]odel +[Nn]umber +\: +(?P<model_num>.+)$',
 
         # system_sn
-        p34 = re.compile(r'^[Ss]ystem +[Ss]erial +[Nn]umber +\: +(?P<system_sn>.+)$')
+        p34=r'^[Ss]ystem +[Ss]erial +[Nn]umber +\: +(?P<system_sn>.+)$',
 
         # Compiled Mon 10-Apr-17 04:35 by mcpre
         # Compiled Mon 19-Mar-18 16:39 by prod_rel_team
-        p36 = re.compile(r'^Compiled +(?P<compiled_date>[\S\s]+) +by '
-                         r'+(?P<compiled_by>\w+)$')
+        p36=r'^Compiled +(?P<compiled_date>[\S\s]+) +by '
+            r'+(?P<compiled_by>\w+)$',
 
         # System returned to ROM by reload at 15:57:52 CDT Mon Sep 24 2018
         # System returned to ROM by Reload Command at 07:15:43 UTC Fri Feb 1 2019
         # System returned to ROM by reload
         # System returned to ROM by power cycle at 23:31:24 PDT Thu Sep 27 2007 (SP by power on)
         # System returned to ROM by power-on
-        p37 = re.compile(r'^System +returned +to +ROM +by '
-                         r'+(?P<returned_to_rom_by>[\w\s\-]+)(?: +at '
-                         r'+(?P<returned_to_rom_at>[\w\s\:]+))?(?: +\(SP +by '
-                         r'+(?P<sp_by>[\S\s\-]+)\))?$')
+        p37=r'^System +returned +to +ROM +by '
+            r'+(?P<returned_to_rom_by>[\w\s\-]+)(?: +at '
+            r'+(?P<returned_to_rom_at>[\w\s\:]+))?(?: +\(SP +by '
+            r'+(?P<sp_by>[\S\s\-]+)\))?$',
 
         # Last reload type: Normal Reload
-        p38 = re.compile(
-            r'^Last +reload +type\: +(?P<last_reload_type>[\S ]+)$')
+        p38=r'^Last +reload +type\: +(?P<last_reload_type>[\S ]+)$',
 
         # P2020 CPU at 800MHz, E500v2 core, 512KB L2 Cache
-        p39 = re.compile(r'^(?P<cpu_name>\S+) +(CPU|cpu|Cpu) +at '
-                         r'+(?P<speed>\S+)\,(( +(?P<core>\S+) +core\, '
-                         r'+(?P<l2_cache>\S+) +L2 +[Cc]ache)|( +Supervisor '
-                         r'+(?P<supervisor>\S+)))$')
+        p39=r'^(?P<cpu_name>\S+) +(CPU|cpu|Cpu) +at '
+            r'+(?P<speed>\S+)\,(( +(?P<core>\S+) +core\, '
+            r'+(?P<l2_cache>\S+) +L2 +[Cc]ache)|( +Supervisor '
+            r'+(?P<supervisor>\S+)))$',
 
         # 98304K bytes of processor board System flash (Read/Write)
-        p40 = re.compile(r'^(?P<processor_board_flash>\S+) +bytes .+$')
+        p40=r'^(?P<processor_board_flash>\S+) +bytes .+$',
 
         # Running default software
-        p41 = re.compile(r'^Running +(?P<running_default_software>\S+) +software$')
+        p41=r'^Running +(?P<running_default_software>\S+) +software$',
 
         # Jawa Revision 7, Snowtrooper Revision 0x0.0x1C
-        p42 = re.compile(r'^Jawa +Revision +(?P<jawa_revision>\S+)\, '
-                         r'+Snowtrooper +Revision +(?P<snowtrooper_rev>\S+)$')
+        p42=r'^Jawa +Revision +(?P<jawa_revision>\S+)\, '
+            r'+Snowtrooper +Revision +(?P<snowtrooper_rev>\S+)$',
 
         # ipbase           ipbasek9         Smart License    ipbasek9
         # securityk9       securityk9       RightToUse       securityk9
-        p43 = re.compile(r'^(?P<technology>\w[\w\-]+)(?: {2,}'
-                         r'(?P<license_level>\w+) {2,}(?P<license_type>\w+(?: '
-                         r'+\w+)?) {2,}(?P<next_boot>\w+))?$')
+        p43=r'^(?P<technology>\w[\w\-]+)(?: {2,}'
+            r'(?P<license_level>\w+) {2,}(?P<license_type>\w+(?: '
+            r'+\w+)?) {2,}(?P<next_boot>\w+))?$',
 
         # Suite                 Suite Current         Type           Suite Next reboot
         # Technology    Technology-package           Technology-package
-        p44 = re.compile(r'^(?P<aname>Suite|Technology) +((Suite +Current)|'
-                         r'(Technology\-package))')
+        p44=r'^(?P<aname>Suite|Technology) +((Suite +Current)|'
+            r'(Technology\-package))',
 
         # Suite License Information for Module:'esg'
-        p45 = re.compile(r'^[Ss]uite +[Ll]icense +[Ii]nformation +for '
-                         r'+[Mm]odule\:\'(?P<module>\S+)\'$')
+        p45=r'^[Ss]uite +[Ll]icense +[Ii]nformation +for '
+            r'+[Mm]odule\:\'(?P<module>\S+)\'$',
 
         # License UDI:
-        p46_0 = re.compile(r'^License UDI:$')
+        p46_0=r'^License UDI:$',
 
         #     *0        C3900-SPE150/K9       FOC16050QP6
-        p46 = re.compile(r'^(?P<device_num>[*\d]+) +(?P<pid>[\S]+) +(?P<sn>[A-Z\d]+)$')
+        p46=r'^(?P<device_num>[*\d]+) +(?P<pid>[\S]+) +(?P<sn>[A-Z\d]+)$',
 
         # Image text-base: 0x40101040, data-base: 0x42D98000
-        p47 = re.compile(r'^Image text-base: +(?P<text_base>\S+), '
-                         r'data-base: +(?P<data_base>\S+)$')
+        p47=r'^Image text-base: +(?P<text_base>\S+), '
+            r'data-base: +(?P<data_base>\S+)$',
 
         # 1 Virtual Ethernet/IEEE 802.3 interface(s)
         # 50 Gigabit Ethernet/IEEE 802.3 interface(s)
-        p48 = re.compile(r'^(?P<interface>\d+) +(?P<ethernet_type>Virtual Ethernet|Gigabit Ethernet|FastEthernet)'
-                         r'/IEEE 802\.3 +interface\(s\)$')
+        p48=r'^(?P<interface>\d+) +(?P<ethernet_type>Virtual Ethernet|Gigabit Ethernet|FastEthernet)'
+            r'/IEEE 802\.3 +interface\(s\)$',
 
         # Dagobah Revision 95, Swamp Revision 6
-        p50 = re.compile(r'^(?P<group1>\S+)\s+Revision\s+(?P<group1_int>\d+),'
-                         r'\s+(?P<group2>\S+)\s+Revision\s+(?P<group2_int>\d+)$')
+        p50=r'^(?P<group1>\S+)\s+Revision\s+(?P<group1_int>\d+),'
+            r'\s+(?P<group2>\S+)\s+Revision\s+(?P<group2_int>\d+)$',
 
         # power_supply_part_nr
         # Power supply part number: 444-8888-00
-        p51 = re.compile(r'^[Pp]ower\s+[Ss]upply\s+[Pp]art\s+[Nn]umber\s+\:\s+(?P<power_supply_part_nr>.+)$')
+        p51=r'^[Pp]ower\s+[Ss]upply\s+[Pp]art\s+[Nn]umber\s+\:\s+(?P<power_supply_part_nr>.+)$',
 
         # power_supply_sn
         # Power supply serial number: CCC4466B6LL
-        p52 = re.compile(r'^[Pp]ower\s+[Ss]upply\s+[Ss]erial\s+[Nn]umber\s+\:\s+(?P<power_supply_sn>.+)$')
+        p52=r'^[Pp]ower\s+[Ss]upply\s+[Ss]erial\s+[Nn]umber\s+\:\s+(?P<power_supply_sn>.+)$',
 
         # Daughterboard assembly number   : 73-11111-00
         # db_assembly_num
-        p53 = re.compile(r'^[Dd]aughterboard\s+[Aa]ssembly\s+[Nn]umber\s+\:\s+(?P<db_assembly_num>.+)$')
+        p53=r'^[Dd]aughterboard\s+[Aa]ssembly\s+[Nn]umber\s+\:\s+(?P<db_assembly_num>.+)$',
 
         # Daughterboard serial number     : FOC87654CWW
         # db_sn
-        p54 = re.compile(r'^[Dd]aughterboard\s+[Ss]erial\s+[Nn]umber\s+\:\s+(?P<db_sn>.+)$')
+        p54=r'^[Dd]aughterboard\s+[Ss]erial\s+[Nn]umber\s+\:\s+(?P<db_sn>.+)$',
 
         # top_assembly_part_num
         # Top Assembly Part Number        : 800-55555-11
-        p55 = re.compile(r'^[Tt]op\s+[Aa]ssembly\s+[Pp]art\s+[Nn]umber\s+\:\s+(?P<top_assembly_part_num>.+)$')
+        p55=r'^[Tt]op\s+[Aa]ssembly\s+[Pp]art\s+[Nn]umber\s+\:\s+(?P<top_assembly_part_num>.+)$',
 
         # top_assembly_rev_num
         # Top Assembly Revision Number    : C0
-        p56 = re.compile(r'^[Tt]op\s+[Aa]ssembly\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<top_assembly_rev_num>.+)$')
+        p56=r'^[Tt]op\s+[Aa]ssembly\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<top_assembly_rev_num>.+)$',
 
         # version_id
         # Version ID                      : V02
-        p57 = re.compile(r'^[Vv]ersion\s+ID\s+\:\s+(?P<version_id>.+)$')
+        p57=r'^[Vv]ersion\s+ID\s+\:\s+(?P<version_id>.+)$',
 
         # clei_code_num
         # CLEI Code Number                : AAALJ00ERT
-        p58 = re.compile(r'^CLEI\s+[Cc]ode\s+[Nn]umber\s+\:\s+(?P<clei_code_num>.+)$')
+        p58=r'^CLEI\s+[Cc]ode\s+[Nn]umber\s+\:\s+(?P<clei_code_num>.+)$',
 
         # Daughterboard revision number   : A0
         # db_rev_num
-        p59 = re.compile(r'^[Dd]aughterboard\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<db_rev_num>.+)$')
+        p59=r'^[Dd]aughterboard\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<db_rev_num>.+)$',
 
         # Hardware Board Revision Number  : 0x12
         # hb_rev_num
-        p60 = re.compile(r'^[Hh]ardware\s+[Bb]oard\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<hb_rev_num>.+)$')
+        p60=r'^[Hh]ardware\s+[Bb]oard\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<hb_rev_num>.+)$',
+    )
+
+    def cli(self, output=None):
+        """parsing mechanism: cli
+
+        Function cli() defines the cli type output parsing mechanism which
+        typically contains 3 steps: exe
+        cuting, transforming, returning
+        """
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        version_dict = {}
+        active_dict = {}
+        rtr_type = ''
+        suite_flag = False
+        license_flag = False
+
+        regex = ShowVersion.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # Cisco IOS XE Software, Version BLD_POLARIS_DEV_LATEST_20200702_122021_V17_4_0_67_2
-            m = p0.match(line)
+            m = regex.p0.match(line)
             if m:
                 if 'version' not in version_dict:
                     version_dict['version'] = {}
@@ -612,11 +619,11 @@ class ShowVersion(ShowVersionSchema):
             # Cisco IOS Software, IOS-XE Software, Catalyst 4500 L3 Switch Software (cat4500e-UNIVERSALK9-M), Version 03.03.02.SG RELEASE SOFTWARE (fc1)
             # IOS (tm) Catalyst 4000 L3 Switch Software (cat4000-I9S-M), Version 12.2(18)EW5, RELEASE SOFTWARE (fc1)
             # IOS (tm) s72033_rp Software (s72033_rp-ADVENTERPRISEK9_WAN-M), Version 12.2(18)SXF7, RELEASE SOFTWARE (fc1)
-            m = p1.match(line) or p1_1.match(line)
+            m = regex.p1.match(line) or regex.p1_1.match(line)
             if m:
                 version = m.groupdict()['version']
                 # 16.6.5
-                m2 = p2.match(version)
+                m2 = regex.p2.match(version)
                 if m2:
                     if 'version' not in version_dict:
                         version_dict['version'] = {}
@@ -636,12 +643,12 @@ class ShowVersion(ShowVersionSchema):
             # Cisco IOS Software, 901 Software (ASR901-UNIVERSALK9-M), Version 15.6(2)SP4, RELEASE SOFTWARE (fc3)
             # Cisco IOS Software [Amsterdam], Catalyst L3 Switch Software (CAT9K_IOSXE), Experimental Version 17.4.20200702:124009 [S2C-build-polaris_dev-116872-/nobackup/mcpre/BLD-BLD_POLARIS_DEV_LATEST_20200702_122021 243]
             # Cisco IOS Software [Denali], ASR1000 Software (X86_64_LINUX_IOSD-UNIVERSALK9-M), Experimental Version 16.3.20170410:103306 [v163_mr_throttle-BLD-BLD_V163_MR_THROTTLE_LATEST_20170410_093453 118]
-            m = p3.match(line)
+            m = regex.p3.match(line)
             if m:
                 version = m.groupdict()['version']
                 # 16.6.5
 
-                m2 = p2.match(version)
+                m2 = regex.p2.match(version)
 
                 if m2:
                     if 'version' not in version_dict:
@@ -665,25 +672,25 @@ class ShowVersion(ShowVersionSchema):
                     continue
 
             # Copyright (c) 1986-2016 by Cisco Systems, Inc.
-            m = p4.match(line)
+            m = regex.p4.match(line)
             if m:
                 version_dict.setdefault('version', {}).setdefault('image_type', 'developer image')
                 continue
 
             # Technical Support: http://www.cisco.com/techsupport
-            m = p5.match(line)
+            m = regex.p5.match(line)
             if m:
                 version_dict.setdefault('version', {}).setdefault('image_type', 'production image')
                 continue
 
             # rom
-            m = p6.match(line)
+            m = regex.p6.match(line)
             if m:
                 rom = m.groupdict()['rom']
                 version_dict['version']['rom'] = rom
 
                 # ROM: Bootstrap program is IOSv
-                m = p7.match(rom)
+                m = regex.p7.match(rom)
                 if m:
                     if 'os' not in version_dict['version']:
                         version_dict['version']['os'] = \
@@ -691,14 +698,14 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # bootldr
-            m = p8.match(line)
+            m = regex.p8.match(line)
             if m:
                 version_dict['version']['bootldr'] = \
                     m.groupdict()['bootldr']
                 continue
 
             # hostname & uptime
-            m = p9.match(line)
+            m = regex.p9.match(line)
             if m:
                 version_dict['version']['hostname'] = \
                     m.groupdict()['hostname']
@@ -707,7 +714,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # uptime_this_cp
-            m = p10.match(line)
+            m = regex.p10.match(line)
             if m:
                 version_dict['version']['uptime_this_cp'] = \
                     m.groupdict()['uptime_this_cp']
@@ -715,7 +722,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # system_restarted_at
-            m = p11.match(line)
+            m = regex.p11.match(line)
             if m:
                 version_dict['version']['system_restarted_at'] = \
                     m.groupdict()['system_restarted_at']
@@ -724,14 +731,14 @@ class ShowVersion(ShowVersionSchema):
             # system_image
             # System image file is "tftp://10.1.6.241//auto/tftp-ssr/Edison/cat3k_caa-universalk9.BLD_V164_THROTTLE_LATEST_20170410_174845.SSA.bin"
             # System image file is "harddisk:test-image-PE1-13113029"
-            m = p12.match(line)
+            m = regex.p12.match(line)
             if m:
                 version_dict['version']['system_image'] = \
                     m.groupdict()['system_image']
                 continue
 
             # last_reload_reason
-            m = p13.match(line)
+            m = regex.p13.match(line)
             if m:
                 version_dict['version']['last_reload_reason'] = \
                     m.groupdict()['last_reload_reason']
@@ -739,14 +746,14 @@ class ShowVersion(ShowVersionSchema):
 
             # last_reload_reason
             # Last reset from power-on
-            m = p14.match(line)
+            m = regex.p14.match(line)
             if m:
                 version_dict['version']['last_reload_reason'] = \
                     m.groupdict()['last_reload_reason']
                 continue
 
             # license_type
-            m = p15.match(line)
+            m = regex.p15.match(line)
             if m:
                 version_dict['version']['license_type'] = \
                     m.groupdict()['license_type']
@@ -755,7 +762,7 @@ class ShowVersion(ShowVersionSchema):
             # license_level
             # License Level: entservices   Type: Permanent
             # License Level: AdvancedMetroIPAccess
-            m = p16.match(line)
+            m = regex.p16.match(line)
             if m:
                 group = m.groupdict()
                 if 'Type:' in group['license_level']:
@@ -774,7 +781,7 @@ class ShowVersion(ShowVersionSchema):
             # next_reload_license_level
             # Next reboot license Level: entservices
             # Next reload license Level: advipservices
-            m = p17.match(line)
+            m = regex.p17.match(line)
             if m:
                 version_dict['version']['next_reload_license_level'] = \
                     m.groupdict()['next_reload_license_level']
@@ -787,10 +794,10 @@ class ShowVersion(ShowVersionSchema):
             # Cisco IOSv (revision 1.0) with  with 435457K/87040K bytes of memory.
             # cisco WS-C3750X-24P (PowerPC405) processor (revision W0) with 262144K bytes of memory.
             # cisco ISR4451-X/K9 (2RU) processor with 1795979K/6147K bytes of memory.
-            m = p18.match(line)
+            m = regex.p18.match(line)
 
             # Cisco CISCO3945-CHASSIS (revision 1.0) with C3900-SPE150/K9 with 1835264K/261888K bytes of memory.
-            m2 = p18_2.match(line)
+            m2 = regex.p18_2.match(line)
 
             if m or m2:
                 if m:
@@ -816,7 +823,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # chassis_sn
-            m = p19.match(line)
+            m = regex.p19.match(line)
             if m:
                 version_dict['version']['chassis_sn'] \
                     = m.groupdict()['chassis_sn']
@@ -829,7 +836,7 @@ class ShowVersion(ShowVersionSchema):
             # 2 Ten Gigabit Ethernet interfaces
             # 1 terminal line
             # 8 Channelized T1 ports
-            m = p20.match(line)
+            m = regex.p20.match(line)
             if m:
                 interface = m.groupdict()['interface']
                 if 'number_of_intfs' not in version_dict['version']:
@@ -839,7 +846,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # mem_size
-            m = p21.match(line)
+            m = regex.p21.match(line)
             if m:
                 memories = m.groupdict()['memories']
                 if 'mem_size' not in version_dict['version']:
@@ -849,7 +856,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # disks, disk_size and type_of_disk
-            m = p22.match(line)
+            m = regex.p22.match(line)
             if m:
                 disks = m.groupdict()['disks']
                 if 'disks' not in version_dict['version']:
@@ -863,27 +870,27 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # os
-            m = p23.match(line)
+            m = regex.p23.match(line)
             if m:
                 version_dict['version']['os'] = m.groupdict()['os']
 
                 continue
 
             # curr_config_register
-            m = p24.match(line)
+            m = regex.p24.match(line)
             if m:
                 version_dict['version']['curr_config_register'] \
                     = m.groupdict()['curr_config_register']
 
             # next_config_register
-            m = p25.match(line)
+            m = regex.p25.match(line)
             if m:
                 version_dict['version']['next_config_register'] \
                     = m.groupdict()['next_config_register']
                 continue
 
             # switch_number
-            m = p26.match(line)
+            m = regex.p26.match(line)
             if m:
                 switch_number = m.groupdict()['switch_number']
 
@@ -895,7 +902,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # uptime
-            m = p27.match(line)
+            m = regex.p27.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     continue
@@ -903,7 +910,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # mac_address
-            m = p28.match(line)
+            m = regex.p28.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('mac_address', m.groupdict()['mac_address'])
@@ -912,7 +919,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # mb_assembly_num
-            m = p29.match(line)
+            m = regex.p29.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('mb_assembly_num', m.groupdict()['mb_assembly_num'])
@@ -921,7 +928,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # mb_sn
-            m = p30.match(line)
+            m = regex.p30.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('mb_sn', m.groupdict()['mb_sn'])
@@ -930,7 +937,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # model_rev_num
-            m = p31.match(line)
+            m = regex.p31.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('model_rev_num', m.groupdict()['model_rev_num'])
@@ -939,7 +946,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # mb_rev_num
-            m = p32.match(line)
+            m = regex.p32.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('mb_rev_num', m.groupdict()['mb_rev_num'])
@@ -948,7 +955,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # model_num
-            m = p33.match(line)
+            m = regex.p33.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('model_num', m.groupdict()['model_num'])
@@ -957,7 +964,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # system_sn
-            m = p34.match(line)
+            m = regex.p34.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('system_sn', m.groupdict()['system_sn'])
@@ -966,7 +973,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # power_supply_part_nr
-            m = p51.match(line)
+            m = regex.p51.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('power_supply_part_nr', m.groupdict()['power_supply_part_nr'])
@@ -975,7 +982,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # power_supply_sn
-            m = p52.match(line)
+            m = regex.p52.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('power_supply_sn', m.groupdict()['power_supply_sn'])
@@ -984,7 +991,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # db_assembly_num
-            m = p53.match(line)
+            m = regex.p53.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('db_assembly_num', m.groupdict()['db_assembly_num'])
@@ -993,7 +1000,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # db_sn
-            m = p54.match(line)
+            m = regex.p54.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('db_sn', m.groupdict()['db_sn'])
@@ -1002,7 +1009,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # top_assembly_part_num
-            m = p55.match(line)
+            m = regex.p55.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('top_assembly_part_num', m.groupdict()['top_assembly_part_num'])
@@ -1011,7 +1018,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # top_assembly_rev_num
-            m = p56.match(line)
+            m = regex.p56.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('top_assembly_rev_num', m.groupdict()['top_assembly_rev_num'])
@@ -1020,7 +1027,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # version_id
-            m = p57.match(line)
+            m = regex.p57.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('version_id', m.groupdict()['version_id'])
@@ -1029,7 +1036,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # clei_code_num
-            m = p58.match(line)
+            m = regex.p58.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('clei_code_num', m.groupdict()['clei_code_num'])
@@ -1038,7 +1045,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # db_rev_num
-            m = p59.match(line)
+            m = regex.p59.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('db_rev_num', m.groupdict()['db_rev_num'])
@@ -1047,7 +1054,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # hb_rev_num
-            m = p60.match(line)
+            m = regex.p60.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('hb_rev_num', m.groupdict()['hb_rev_num'])
@@ -1057,7 +1064,7 @@ class ShowVersion(ShowVersionSchema):
 
             # Compiled Mon 10-Apr-17 04:35 by mcpre
             # Compiled Mon 19-Mar-18 16:39 by prod_rel_team
-            m36 = p36.match(line)
+            m36 = regex.p36.match(line)
             if m36:
                 group = m36.groupdict()
                 version_dict['version']['compiled_date'] = group['compiled_date']
@@ -1070,7 +1077,7 @@ class ShowVersion(ShowVersionSchema):
             # System returned to ROM by reload
             # System returned to ROM by power cycle at 23:31:24 PDT Thu Sep 27 2007 (SP by power on)
             # System returned to ROM by power-on
-            m37 = p37.match(line)
+            m37 = regex.p37.match(line)
             if m37:
                 group = m37.groupdict()
 
@@ -1086,7 +1093,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # Last reload type: Normal Reload
-            m38 = p38.match(line)
+            m38 = regex.p38.match(line)
             if m38:
                 version_dict['version']['last_reload_type'] = m38.groupdict()['last_reload_type']
 
@@ -1094,7 +1101,7 @@ class ShowVersion(ShowVersionSchema):
 
             # P2020 CPU at 800MHz, E500v2 core, 512KB L2 Cache
             # MPC8572 CPU at 1.5GHz, Supervisor 7
-            m39 = p39.match(line)
+            m39 = regex.p39.match(line)
             if m39:
                 group = m39.groupdict()
                 cpu_dict = version_dict['version'].setdefault('processor', {})
@@ -1111,7 +1118,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # 98304K bytes of processor board System flash (Read/Write)
-            m40 = p40.match(line)
+            m40 = regex.p40.match(line)
             if m40:
                 flash_dict = version_dict['version']
                 in_kb = m40.groupdict()['processor_board_flash']
@@ -1120,14 +1127,14 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # Running default software
-            m41 = p41.match(line)
+            m41 = regex.p41.match(line)
             if m41:
                 version_dict['version']['running_default_software'] = True
 
                 continue
 
             # Jawa Revision 7, Snowtrooper Revision 0x0.0x1C
-            m42 = p42.match(line)
+            m42 = regex.p42.match(line)
             if m42:
                 version_dict['version']['jawa_revision'] = m42.groupdict()['jawa_revision']
                 version_dict['version']['snowtrooper_revision'] = m42.groupdict()['snowtrooper_rev']
@@ -1136,7 +1143,7 @@ class ShowVersion(ShowVersionSchema):
 
             # ipbase           ipbasek9         Smart License    ipbasek9
             # securityk9       securityk9       RightToUse       securityk9
-            m43 = p43.match(line)
+            m43 = regex.p43.match(line)
             if m43:
                 group = m43.groupdict()
 
@@ -1169,7 +1176,7 @@ class ShowVersion(ShowVersionSchema):
 
             # Suite                 Suite Current         Type           Suite Next reboot
             # Technology    Technology-package           Technology-package
-            m44 = p44.match(line)
+            m44 = regex.p44.match(line)
             if m44:
                 if 'Suite' in m44.groupdict()['aname']:
                     suite_flag = True
@@ -1181,7 +1188,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # Suite License Information for Module:'esg'
-            m45 = p45.match(line)
+            m45 = regex.p45.match(line)
             if m45:
                 module_dict = version_dict['version'].setdefault('module', {})
                 suite_dict = module_dict.setdefault(m45.groupdict()['module'], {})
@@ -1189,14 +1196,14 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # License UDI:
-            m46_0 = p46_0.match(line)
+            m46_0 = regex.p46_0.match(line)
             if m46_0:
                 if 'license_udi' not in version_dict:
                     license_udi_dict = version_dict['version'].setdefault('license_udi', {})
                 continue
 
             # *0        C3900-SPE150/K9       FOC16050QP6
-            m46 = p46.match(line)
+            m46 = regex.p46.match(line)
             if m46:
                 group = m46.groupdict()
                 license_udi_sub = license_udi_dict.setdefault('device_num', {}).\
@@ -1206,7 +1213,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # Image text-base: 0x40101040, data-base: 0x42D98000
-            m = p47.match(line)
+            m = regex.p47.match(line)
             if m:
                 version_dict['version']['image'] = {}
                 version_dict['version']['image']['text_base'] = m.groupdict()['text_base']
@@ -1215,7 +1222,7 @@ class ShowVersion(ShowVersionSchema):
 
             # 1 Virtual Ethernet/IEEE 802.3 interface(s)
             # 50 Gigabit Ethernet/IEEE 802.3 interface(s)
-            m = p48.match(line)
+            m = regex.p48.match(line)
             if m:
                 group = m.groupdict()
                 ethernet_type = '_'.join(group['ethernet_type'].lower().split())
@@ -1227,7 +1234,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # Dagobah Revision 95, Swamp Revision 6
-            m = p50.match(line)
+            m = regex.p50.match(line)
             if m:
                 groupdict = m.groupdict()
                 version_dict['version']['revision'] = {}
@@ -1662,63 +1669,67 @@ class ShowRedundancyStates(ShowRedundancyStatesSchema):
 
     cli_command = 'show redundancy states'
 
-    def cli(self, output=None):
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-
-        # initial variables
-        ret_dict = {}
-
+    patterns = Patterns(
         # my state = 13 -ACTIVE
-        p1 = re.compile(r'^my +state += +(?P<my_state>[\s\S]+)$')
+        p1=r'^my +state += +(?P<my_state>[\s\S]+)$',
 
         # peer state = 8  -STANDBY HOT
-        p2 = re.compile(r'^peer +state += +(?P<peer_state>[\s\S]+)$')
+        p2=r'^peer +state += +(?P<peer_state>[\s\S]+)$',
 
         # Mode = Duplex
-        p3 = re.compile(r'^Mode += +(?P<mode>[\w]+)$')
+        p3=r'^Mode += +(?P<mode>[\w]+)$',
 
         # Unit = Primary
-        p4 = re.compile(r'^Unit += +(?P<unit>[\w]+)$')
+        p4=r'^Unit += +(?P<unit>[\w]+)$',
 
         # Unit ID = 48
-        p5 = re.compile(r'^Unit +ID += +(?P<unit_id>[\d]+)$')
+        p5=r'^Unit +ID += +(?P<unit_id>[\d]+)$',
 
         # Redundancy Mode (Operational) = sso
-        p6 = re.compile(r'^Redundancy +Mode +\(Operational\) += +'
-                        '(?P<redundancy_mode_operational>[\s\S]+)$')
+        p6=r'^Redundancy +Mode +\(Operational\) += +'
+           '(?P<redundancy_mode_operational>[\s\S]+)$',
 
         # Redundancy Mode (Configured)  = sso
-        p7 = re.compile(r'^Redundancy +Mode +\(Configured\) += +'
-                        '(?P<redundancy_mode_configured>[\s\S]+)$')
+        p7=r'^Redundancy +Mode +\(Configured\) += +'
+           '(?P<redundancy_mode_configured>[\s\S]+)$',
 
         # Redundancy State              = sso
-        p8 = re.compile(r'^Redundancy +State += +(?P<redundancy_state>[\s\S]+)$')
+        p8=r'^Redundancy +State += +(?P<redundancy_state>[\s\S]+)$',
 
         # Maintenance Mode = Disabled
-        p9 = re.compile(r'^Maintenance +Mode += +(?P<maintenance_mode>[\w]+)$')
+        p9=r'^Maintenance +Mode += +(?P<maintenance_mode>[\w]+)$',
 
         # Manual Swact = enabled
         # Manual Swact = disabled (system is simplex (no peer unit))
-        p10 = re.compile(r'^Manual +Swact += +(?P<manual_swact>[\w]+)'
-                         '( +\((?P<manual_swact_reason>.*)\))?$')
+        p10=r'^Manual +Swact += +(?P<manual_swact>[\w]+)'
+            '( +\((?P<manual_swact_reason>.*)\))?$',
 
         # Communications = Up
         # Communications = Down      Reason: Simplex mode
-        p11 = re.compile(r'^Communications += +(?P<communications>[\w]+)'
-                         '( +Reason: +(?P<communications_reason>[\s\S]+))?$')
+        p11=r'^Communications += +(?P<communications>[\w]+)'
+            '( +Reason: +(?P<communications_reason>[\s\S]+))?$',
 
         # client count = 76
-        p12 = re.compile(r'^client +count += +(?P<client_count>[\d]+)$')
+        p12=r'^client +count += +(?P<client_count>[\d]+)$',
 
         # client_notification_TMR = 30000 milliseconds
-        p13 = re.compile(r'^client_notification_TMR += +'
-                         '(?P<client_notification_tmr_msec>[\d]+) +milliseconds$')
+        p13=r'^client_notification_TMR += +'
+            '(?P<client_notification_tmr_msec>[\d]+) +milliseconds$',
 
         # RF debug mask = 0x0
-        p14 = re.compile(r'^RF +debug +mask += +(?P<rf_debug_mask>[\w]+)$')
+        p14=r'^RF +debug +mask += +(?P<rf_debug_mask>[\w]+)$',
+    )
+
+    def cli(self, output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        # initial variables
+        ret_dict = {}
+
+        p = ShowRedundancyStates.patterns
 
         for line in out.splitlines():
             line = line.strip()
@@ -1726,65 +1737,65 @@ class ShowRedundancyStates(ShowRedundancyStatesSchema):
                 continue
 
             # my state = 13 -ACTIVE
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 ret_dict['my_state'] = m.groupdict()['my_state']
                 continue
 
             # peer state = 1  -DISABLED
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 ret_dict['peer_state'] = m.groupdict()['peer_state']
                 continue
 
             # Mode = Simplex
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 ret_dict['mode'] = m.groupdict()['mode']
                 continue
 
             # Unit = Primary
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 ret_dict['unit'] = m.groupdict()['unit']
                 continue
 
             # Unit ID = 48
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 ret_dict['unit_id'] = int(m.groupdict()['unit_id'])
                 continue
 
             # Redundancy Mode (Operational) = Non-redundant
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 ret_dict['redundancy_mode_operational'] = \
                     m.groupdict()['redundancy_mode_operational']
                 continue
 
             # Redundancy Mode (Configured)  = Non-redundant
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 ret_dict['redundancy_mode_configured'] = \
                     m.groupdict()['redundancy_mode_configured']
                 continue
 
             # Redundancy State              = sso
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 ret_dict['redundancy_state'] = m.groupdict()[
                     'redundancy_state']
                 continue
 
             # Maintenance Mode = Disabled
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 ret_dict['maintenance_mode'] = m.groupdict()[
                     'maintenance_mode']
                 continue
 
             # Manual Swact = enabled
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 ret_dict['manual_swact'] = m.groupdict()['manual_swact']
                 reason = m.groupdict()['manual_swact_reason']
@@ -1793,7 +1804,7 @@ class ShowRedundancyStates(ShowRedundancyStatesSchema):
                 continue
 
             # Communications = Up
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 ret_dict['communications'] = m.groupdict()['communications']
                 reason = m.groupdict()['communications_reason']
@@ -1802,20 +1813,20 @@ class ShowRedundancyStates(ShowRedundancyStatesSchema):
                 continue
 
             # client count = 76
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 ret_dict['client_count'] = int(m.groupdict()['client_count'])
                 continue
 
             # client_notification_TMR = 30000 milliseconds
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 ret_dict['client_notification_tmr_msec'] = int(
                     m.groupdict()['client_notification_tmr_msec'])
                 continue
 
             # RF debug mask = 0x0
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 ret_dict['rf_debug_mask'] = m.groupdict()['rf_debug_mask']
                 continue
@@ -1931,54 +1942,40 @@ class ShowInventory(ShowInventorySchema):
 
     cli_command = ['show inventory']
 
-    def cli(self, output=None):
-
-        if output is None:
-            # Build command
-            cmd = self.cli_command[0]
-            # Execute command
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
-        # Init vars
-        ret_dict = {}
-        name = descr = slot = subslot = pid = ''
-        asr900_rp = False
-
+    patterns = Patterns(
         # NAME: "Switch 1", DESCR: "WS-C3850-24P-E"
         # NAME: "StackPort5/2", DESCR: "StackPort5/2"
         # NAME: "Switch 5 - Power Supply A", DESCR: "Switch 5 - Power Supply A"
         # NAME: "subslot 0/0 transceiver 2", DESCR: "GE T"
         # NAME: "NIM subslot 0/0", DESCR: "Front Panel 3 ports Gigabitethernet Module"
         # NAME: "Modem 0 on Cellular0/2/0", DESCR: "Sierra Wireless EM7455/EM7430"
-        p1 = re.compile(r'^NAME: +\"(?P<name>.*)\",'
-                        r' +DESCR: +\"(?P<descr>.*)\"$')
+        p1=r'^NAME: +\"(?P<name>.*)\",'
+           r' +DESCR: +\"(?P<descr>.*)\"$',
 
         # Switch 1
         # module 0
-        p1_1 = re.compile(r'^(Switch|[Mm]odule) +(?P<slot>(\S+))')
+        p1_1=r'^(Switch|[Mm]odule) +(?P<slot>(\S+))',
 
         # Power Supply Module 0
         # Power Supply Module 1
-        p1_2 = re.compile(r'Power Supply Module')
+        p1_2=r'Power Supply Module',
 
         # SPA subslot 0/0
         # IM subslot 0/1
         # NIM subslot 0/0
-        p1_3 = re.compile(r'^(SPA|IM|NIM|PVDM) +subslot +(?P<slot>(\d+))/(?P<subslot>(\d+))')
+        p1_3=r'^(SPA|IM|NIM|PVDM) +subslot +(?P<slot>(\d+))/(?P<subslot>(\d+))',
 
         # subslot 0/0 transceiver 0
-        p1_4 = re.compile(r'^subslot +(?P<slot>(\d+))\/(?P<subslot>(.*))')
+        p1_4=r'^subslot +(?P<slot>(\d+))\/(?P<subslot>(.*))',
 
         # StackPort1/1
-        p1_5 = re.compile(r'^StackPort(?P<slot>(\d+))/(?P<subslot>(\d+))$')
+        p1_5=r'^StackPort(?P<slot>(\d+))/(?P<subslot>(\d+))$',
 
         # Fan Tray
-        p1_6 = re.compile(r'^Fan +Tray$')
+        p1_6=r'^Fan +Tray$',
 
         # Modem 0 on Cellular0/2/0
-        p1_7 = re.compile(r'^Modem +(?P<modem>\S+) +on +Cellular(?P<slot>\d+)\/(?P<subslot>.*)$')
+        p1_7=r'^Modem +(?P<modem>\S+) +on +Cellular(?P<slot>\d+)\/(?P<subslot>.*)$',
 
         # PID: ASR-920-24SZ-IM   , VID: V01  , SN: CAT1902V19M
         # PID: SFP-10G-LR        , VID: CSCO , SN: CD180456291
@@ -1988,8 +1985,27 @@ class ShowInventory(ShowInventorySchema):
         # PID: ISR4331/K9        , VID:      , SN: FDO21520TGH
         # PID: ISR4331/K9        , VID:      , SN:
         # PID: , VID: 1.0  , SN: 1162722191
-        p2 = re.compile(r'^PID: +(?P<pid>[\S\s]+)? *, +VID:(?: +(?P<vid>(\S+)))? *,'
-                        r' +SN:(?: +(?P<sn>(\S+)))?$')
+        p2=r'^PID: +(?P<pid>[\S\s]+)? *, +VID:(?: +(?P<vid>(\S+)))? *,'
+           r' +SN:(?: +(?P<sn>(\S+)))?$',
+    )
+
+    def cli(self, output=None):
+
+        if output is None:
+            # Build command
+            cmd = self.cli_command[0]
+            # Execute command
+            out = self.device.execute(cmd)
+        else:
+            out = output
+
+        # Init vars
+        ret_dict = {}
+        name = descr = slot = subslot = pid = ''
+        asr900_rp = False
+
+        p = ShowInventory.patterns
+
         for line in out.splitlines():
             line = line.strip()
 
@@ -1999,7 +2015,7 @@ class ShowInventory(ShowInventorySchema):
             # NAME: "subslot 0/0 transceiver 2", DESCR: "GE T"
             # NAME: "NIM subslot 0/0", DESCR: "Front Panel 3 ports Gigabitethernet Module"
             # NAME: "Modem 0 on Cellular0/2/0", DESCR: "Sierra Wireless EM7455/EM7430"
-            m = p1.match(line)
+            m = p.p1.match(line)
 
             if m:
                 group = m.groupdict()
@@ -2009,13 +2025,13 @@ class ShowInventory(ShowInventorySchema):
                 # ------------------------------------------------------------------
                 # Define slot_dict
                 # ------------------------------------------------------------------
-                m1_1 = p1_1.match(name)
+                m1_1 = p.p1_1.match(name)
                 if m1_1:
                     slot = m1_1.groupdict()['slot']
                     # Creat slot_dict
                     slot_dict = ret_dict.setdefault('slot', {}).setdefault(slot, {})
 
-                m1_2 = p1_2.match(name)
+                m1_2 = p.p1_2.match(name)
                 if m1_2:
                     slot = name.replace('Power Supply Module ', 'P')
                     # Creat slot_dict
@@ -2024,7 +2040,7 @@ class ShowInventory(ShowInventorySchema):
                 # ------------------------------------------------------------------
                 # Define subslot
                 # ------------------------------------------------------------------
-                m = p1_3.match(name) or p1_4.match(name) or p1_5.match(name) or p1_7.match(name)
+                m = p.p1_3.match(name) or p.p1_4.match(name) or p.p1_5.match(name) or p.p1_7.match(name)
                 if m:
                     group = m.groupdict()
                     slot = group['slot']
@@ -2032,7 +2048,7 @@ class ShowInventory(ShowInventorySchema):
                     # Creat slot_dict
                     slot_dict = ret_dict.setdefault('slot', {}).setdefault(slot, {})
 
-                m1_6 = p1_6.match(name)
+                m1_6 = p.p1_6.match(name)
                 if m1_6:
                     slot = name.replace(' ', '_')
                     # Create slot_dict
@@ -2048,7 +2064,7 @@ class ShowInventory(ShowInventorySchema):
             # PID: ISR4331/K9        , VID:      , SN: FDO21520TGH
             # PID: ISR4331/K9        , VID:      , SN:
             # PID: EM7455/EM7430     , VID: 1.0  , SN: 355813070074072
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 if group.get('pid'):
@@ -2258,73 +2274,77 @@ class ShowPlatform(ShowPlatformSchema):
     cli_command = 'show platform'
     exclude = ['insert_time']
 
-    def cli(self, output=None):
-        """parsing mechanism: cli
-
-        Function cli() defines the cli type output parsing mechanism which
-        typically contains 3 steps: exe
-        cuting, transforming, returning
-        """
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-
-        platform_dict = {}
-        sub_dict = {}
-
-        # ----------      C3850    -------------
-
+    patterns = Patterns(
         # Switch/Stack Mac Address : 0057.d2ff.e71b - Local Mac Address
-        p1 = re.compile(r'^[Ss]witch\/[Ss]tack +[Mm]ac +[Aa]ddress +\: +'
-                        r'(?P<switch_mac_address>[\w\.]+) *(?P<local>[\w\s\-]+)?$')
+        p1=r'^[Ss]witch\/[Ss]tack +[Mm]ac +[Aa]ddress +\: +'
+           r'(?P<switch_mac_address>[\w\.]+) *(?P<local>[\w\s\-]+)?$',
 
         # Mac persistency wait time: Indefinite
-        p2 = re.compile(r'^[Mm]ac +persistency +wait +time\: +(?P<mac_persistency_wait_time>[\w\.\:]+)$')
+        p2=r'^[Mm]ac +persistency +wait +time\: +(?P<mac_persistency_wait_time>[\w\.\:]+)$',
 
         # Switch  Ports    Model                Serial No.   MAC address     Hw Ver.       Sw Ver.
         # ------  -----   ---------             -----------  --------------  -------       --------
         #  1       32     WS-C3850-24P-E        FCW1947C0HH  0057.d2ff.e71b  V07           16.6.1
         #  1       32     C9200-24P             JAD2310213C  dc8c.37ff.ad21  V01           17.05.01
-        p3 = re.compile(r'^(?P<switch>\d+) +(?P<ports>\d+) +'
-                        r'(?P<model>[\w\-]+) +(?P<serial_no>\w+) +'
-                        r'(?P<mac_address>[\w\.\:]+) +'
-                        r'(?P<hw_ver>\w+) +(?P<sw_ver>[\w\.]+)$')
+        p3=r'^(?P<switch>\d+) +(?P<ports>\d+) +'
+           r'(?P<model>[\w\-]+) +(?P<serial_no>\w+) +'
+           r'(?P<mac_address>[\w\.\:]+) +'
+           r'(?P<hw_ver>\w+) +(?P<sw_ver>[\w\.]+)$',
 
         #                                     Current
         # Switch#   Role        Priority      State
         # -------------------------------------------
         # *1       Active          3          Ready
-        p4 = re.compile(r'^\*?(?P<switch>\d+) +(?P<role>\w+) +'
-                        r'(?P<priority>\d+) +(?P<state>[\w\s]+)$')
+        p4=r'^\*?(?P<switch>\d+) +(?P<role>\w+) +'
+           r'(?P<priority>\d+) +(?P<state>[\w\s]+)$',
 
         # ----------      ASR1K    -------------
         # Chassis type: ASR1006
         # Chassis type: ASR-903
-        p5 = re.compile(r'^[Cc]hassis +type: +(?P<chassis>\S+)$')
+        p5=r'^[Cc]hassis +type: +(?P<chassis>\S+)$',
 
         # Slot      Type                State                 Insert time (ago)
         # --------- ------------------- --------------------- -----------------
         # 0         ASR1000-SIP40       ok                    00:33:53
         #  0/0      SPA-1XCHSTM1/OC3    ok                    2d00h
-        p6 = re.compile(r'^(?P<slot>\w+)(\/(?P<subslot>\d+))? +(?P<name>\S+) +'
-                        r'(?P<state>\w+(\, \w+)?) +(?P<insert_time>[\w\.\:]+)$')
+        p6=r'^(?P<slot>\w+)(\/(?P<subslot>\d+))? +(?P<name>\S+) +'
+           r'(?P<state>\w+(\, \w+)?) +(?P<insert_time>[\w\.\:]+)$',
 
         # 4                             unknown               2d00h
-        p6_1 = re.compile(r'^(?P<slot>\w+) +(?P<state>\w+(\, \w+)?)'
-                          r' +(?P<insert_time>[\w\.\:]+)$')
+        p6_1=r'^(?P<slot>\w+) +(?P<state>\w+(\, \w+)?)'
+             r' +(?P<insert_time>[\w\.\:]+)$',
 
         # Slot      CPLD Version        Firmware Version
         # --------- ------------------- ---------------------------------------
         # 0         00200800            16.2(1r)
-        p7 = re.compile(r'^(?P<slot>\w+) +(?P<cpld_version>\d+|N\/A) +'
-                        r'(?P<fireware_ver>[\w\.\(\)\/]+)$')
+        p7=r'^(?P<slot>\w+) +(?P<cpld_version>\d+|N\/A) +'
+           r'(?P<fireware_ver>[\w\.\(\)\/]+)$',
+    )
+
+    def cli(self, output=None):
+        """parsing mechanism: cli
+
+        Function cli() defines the cli type output parsing mechanism which
+        typically contains 3 steps: exe
+        cuting, transforming, returning
+        """
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        platform_dict = {}
+        sub_dict = {}
+
+        # ----------      C3850    -------------
+
+        p = ShowPlatform.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # Switch/Stack Mac Address : 0057.d2ff.e71b - Local Mac Address
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 if 'main' not in platform_dict:
                     platform_dict['main'] = {}
@@ -2333,7 +2353,7 @@ class ShowPlatform(ShowPlatformSchema):
                 continue
 
             # Mac persistency wait time: Indefinite
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 if 'main' not in platform_dict:
                     platform_dict['main'] = {}
@@ -2344,7 +2364,7 @@ class ShowPlatform(ShowPlatformSchema):
             # ------  -----   ---------             -----------  --------------  -------       --------
             #  1       32     WS-C3850-24P-E        FCW1947C0HH  0057.d2ff.e71b  V07           16.6.1
             #  1       32     C9200-24P             JAD2310213C  dc8c.37ff.ad21  V01           17.05.01
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 slot = m.groupdict()['switch']
                 model = m.groupdict()['model']
@@ -2374,7 +2394,7 @@ class ShowPlatform(ShowPlatformSchema):
             # Switch#   Role        Priority      State
             # -------------------------------------------
             # *1       Active          3          Ready
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 slot = m.groupdict()['switch']
                 if 'slot' not in platform_dict:
@@ -2391,7 +2411,7 @@ class ShowPlatform(ShowPlatformSchema):
 
             # Chassis type: ASR1006
             # Chassis type: ASR-903
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 if 'main' not in platform_dict:
                     platform_dict['main'] = {}
@@ -2403,7 +2423,7 @@ class ShowPlatform(ShowPlatformSchema):
             # 0         ASR1000-SIP40       ok                    00:33:53
             #  0/0      SPA-1XCHSTM1/OC3    ok                    2d00h
             # 0         C8200-1N-4T         ok                    00:32:26
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 slot = m.groupdict()['slot']
                 subslot = m.groupdict()['subslot']
@@ -2510,7 +2530,7 @@ class ShowPlatform(ShowPlatformSchema):
             # Slot      CPLD Version        Firmware Version
             # --------- ------------------- ---------------------------------------
             # 0         00200800            16.2(1r)
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 fw_ver = m.groupdict()['fireware_ver']
                 cpld_ver = m.groupdict()['cpld_version']
@@ -2527,7 +2547,7 @@ class ShowPlatform(ShowPlatformSchema):
                 continue
 
             # 4                             unknown               2d00h
-            m = p6_1.match(line)
+            m = p.p6_1.match(line)
             if m:
                 slot = m.groupdict()['slot']
                 if 'slot' not in platform_dict:
@@ -2855,29 +2875,14 @@ class ShowSwitchDetail(ShowSwitchDetailSchema):
     cli_command = 'show switch detail'
     STACK_PORT_RANGE = ('1', '2')
 
-    def cli(self, output=None):
-
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-
-        # initial return dictionary
-        ret_dict = {}
-
-        # return empty when no output
-        if not out:
-            return ret_dict
-
-        # initial regexp pattern
-
+    patterns = Patterns(
         # Switch/Stack Mac Address : 0057.d2ff.e71b - Local Mac Address
-        p1 = re.compile(r'^[Ss]witch\/[Ss]tack +[Mm]ac +[Aa]ddress +\: +'
-                        '(?P<switch_mac_address>[\w\.]+) *(?P<local>[\w\s\-]+)?$')
+        p1=r'^[Ss]witch\/[Ss]tack +[Mm]ac +[Aa]ddress +\: +'
+           '(?P<switch_mac_address>[\w\.]+) *(?P<local>[\w\s\-]+)?$',
 
         # Mac persistency wait time: Indefinite
-        p2 = re.compile(r'^[Mm]ac +persistency +wait +time\: +'
-                        '(?P<mac_persistency_wait_time>[\w\.\:]+)$')
+        p2=r'^[Mm]ac +persistency +wait +time\: +'
+           '(?P<mac_persistency_wait_time>[\w\.\:]+)$',
 
         #                                              H/W   Current
         # Switch#   Role    Mac Address     Priority Version  State
@@ -2885,24 +2890,43 @@ class ShowSwitchDetail(ShowSwitchDetailSchema):
         # *1       Active   689c.e2ff.b9d9     3      V04     Ready
         #  2       Standby  689c.e2ff.b9d9     14             Ready
         #  3       Member   bbcc.fcff.7b00     15     0       V-Mismatch
-        p3_0 = re.compile(r'^Switch#\s+Role\s+Mac\sAddress\s+Priority\s+Version\s+State$')
+        p3_0=r'^Switch#\s+Role\s+Mac\sAddress\s+Priority\s+Version\s+State$',
 
-        p3_1 = re.compile(r'^\*?(?P<switch>\d+) +(?P<role>\w+) +'
-                           '(?P<mac_address>[\w\.]+) +'
-                           '(?P<priority>\d+) +'
-                           '(?P<hw_ver>\w+)? +'
-                           '(?P<state>[\w\s-]+)$')
+        p3_1=r'^\*?(?P<switch>\d+) +(?P<role>\w+) +'
+             '(?P<mac_address>[\w\.]+) +'
+             '(?P<priority>\d+) +'
+             '(?P<hw_ver>\w+)? +'
+             '(?P<state>[\w\s-]+)$',
 
         #          Stack Port Status             Neighbors
         # Switch#  Port 1     Port 2           Port 1   Port 2
         #   1         OK         OK               3        2
         #   1       DOWN       DOWN             None     None
-        p4_0 = re.compile(r'^Switch#\s+Port\s1\s+Port\s2\s+Port\s1\s+Port\s2$')
+        p4_0=r'^Switch#\s+Port\s1\s+Port\s2\s+Port\s1\s+Port\s2$',
+
+        p4_1=r'^(?P<switch>\d+) +(?P<status1>\w+) +'
+             '(?P<status2>\w+) +'
+             '(?P<nbr_num_1>\w+) +'
+             '(?P<nbr_num_2>\w+)$',
+    )
+
+    def cli(self, output=None):
+
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
 
-        p4_1 = re.compile(r'^(?P<switch>\d+) +(?P<status1>\w+) +'
-                           '(?P<status2>\w+) +'
-                           '(?P<nbr_num_1>\w+) +'
-                           '(?P<nbr_num_2>\w+)$')
+        # initial return dictionary
+        ret_dict = {}
+
+        # return empty when no output
+        if not out:
+            return ret_dict
+
+        # initial regexp pattern
+
+        p = ShowSwitchDetail.patterns
 
         active_table = 0
 
@@ -2910,25 +2934,25 @@ class ShowSwitchDetail(ShowSwitchDetailSchema):
             line = line.strip()
 
             # Switch/Stack Mac Address : 0057.d2ff.e71b - Local Mac Address
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 ret_dict['mac_address'] = m.groupdict()['switch_mac_address']
                 continue
 
             # Mac persistency wait time: Indefinite
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 ret_dict['mac_persistency_wait_time'] = m.groupdict()['mac_persistency_wait_time'].lower()
                 continue
 
             # In order to know which regex (p3_1 or p4_1) should be used, we use p3_0 and p4_0 to determine which table
             # is currently parsed.
-            m = p3_0.match(line)
+            m = p.p3_0.match(line)
             if m:
                 active_table = 1
                 continue
 
-            m = p4_0.match(line)
+            m = p.p4_0.match(line)
             if m:
                 active_table = 2
                 continue
@@ -2938,7 +2962,7 @@ class ShowSwitchDetail(ShowSwitchDetailSchema):
             # -----------------------------------------------------------
             # *1       Active   689c.e2ff.b9d9     3      V04     Ready
             #  2       Standby  689c.e2ff.b9d9     14             Ready
-            m = p3_1.match(line)
+            m = p.p3_1.match(line)
             if m and active_table == 1:
                 group = m.groupdict()
                 stack = group['switch']
@@ -2952,7 +2976,7 @@ class ShowSwitchDetail(ShowSwitchDetailSchema):
             # --------------------------------------------------------
             #   1         OK         OK               3        2
             #   1       DOWN       DOWN             None     None
-            m = p4_1.match(line)
+            m = p.p4_1.match(line)
             if m and active_table == 2:
                 group = m.groupdict()
                 stack = group['switch']
@@ -3050,47 +3074,51 @@ class ShowEnvironmentAll(ShowEnvironmentAllSchema):
 
     cli_command = 'show environment all'
 
-    def cli(self, output=None):
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-
-        # initial return dictionary
-        ret_dict = {}
-
+    patterns = Patterns(
         # initial regexp pattern
-        p1 = re.compile(r'^Switch\s+(?P<switch>\d+)\s+FAN\s+(?P<fan>\d+)\s+is\s+(?P<state>[\w\s]+)$')
+        p1=r'^Switch\s+(?P<switch>\d+)\s+FAN\s+(?P<fan>\d+)\s+is\s+(?P<state>[\w\s]+)$',
 
         # Switch 1 FAN 1 direction is Front to Back
-        p1_1 = re.compile(r'^Switch\s+(?P<switch>\d+)\s+FAN +(?P<fan>\d+)\s'
-                          r'+direction\s+is\s+(?P<direction>[\w\s]+)$')
+        p1_1=r'^Switch\s+(?P<switch>\d+)\s+FAN +(?P<fan>\d+)\s'
+             r'+direction\s+is\s+(?P<direction>[\w\s]+)$',
 
-        p1_2 = re.compile(r'^(?P<switch>\d+)\s+(?P<fan>\d+)\s+\d+\s+(?P<state>.*)')
+        p1_2=r'^(?P<switch>\d+)\s+(?P<fan>\d+)\s+\d+\s+(?P<state>.*)',
 
-        p2 = re.compile(r'^FAN\s+PS\-(?P<ps>\d+)\s+is\s+(?P<state>[\w\s]+)$')
+        p2=r'^FAN\s+PS\-(?P<ps>\d+)\s+is\s+(?P<state>[\w\s]+)$',
 
-        p3 = re.compile(r'^Switch\s+(?P<switch>\d+):\s+SYSTEM\s+TEMPERATURE\s+is\s+(?P<state>[\w\s]+)$')
+        p3=r'^Switch\s+(?P<switch>\d+):\s+SYSTEM\s+TEMPERATURE\s+is\s+(?P<state>[\w\s]+)$',
 
-        p4 = re.compile(r'^(?P<type>\w+)\s+Temperature\s+Value:\s+(?P<temperature>\d+)\s+Degree\s+Celsius$')
+        p4=r'^(?P<type>\w+)\s+Temperature\s+Value:\s+(?P<temperature>\d+)\s+Degree\s+Celsius$',
 
-        p5 = re.compile(r'^Temperature\s+State:\s+(?P<state>\w+)$')
+        p5=r'^Temperature\s+State:\s+(?P<state>\w+)$',
+
+        p6=r'^(?P<color>\w+)\s+Threshold\s*:\s+(?P<temperature>\d+)\s+Degree\s+Celsius$',
+
+        p7=r'^(?P<sw>\d+)(?P<ps>\w+)\s*'
+           '((?P<pid>[\w\-]+)\s+'
+           '(?P<serial_number>\w+)\s+)?'
+           '(?P<status>(\w+|Not\sPresent|No\s+Input\s+Power))\s*'
+           '((?P<system_power>\w+)\s+'
+           '(?P<poe_power>[\w\/]+)\s+'
+           '(?P<watts>\w+))?$',
+    )
+
+    def cli(self, output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
 
-        p6 = re.compile(r'^(?P<color>\w+)\s+Threshold\s*:\s+(?P<temperature>\d+)\s+Degree\s+Celsius$')
+        # initial return dictionary
+        ret_dict = {}
 
-        p7 = re.compile(r'^(?P<sw>\d+)(?P<ps>\w+)\s*'
-                        '((?P<pid>[\w\-]+)\s+'
-                        '(?P<serial_number>\w+)\s+)?'
-                        '(?P<status>(\w+|Not\sPresent|No\s+Input\s+Power))\s*'
-                        '((?P<system_power>\w+)\s+'
-                        '(?P<poe_power>[\w\/]+)\s+'
-                        '(?P<watts>\w+))?$')
+        p = ShowEnvironmentAll.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # Switch 1 FAN 1 is OK
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 switch = group['switch']
@@ -3100,7 +3128,7 @@ class ShowEnvironmentAll(ShowEnvironmentAllSchema):
                 continue
 
             # Switch 1 FAN 1 direction is Front to Back
-            m = p1_1.match(line)
+            m = p.p1_1.match(line)
             if m:
                 group = m.groupdict()
                 switch = group['switch']
@@ -3110,7 +3138,7 @@ class ShowEnvironmentAll(ShowEnvironmentAllSchema):
                 fan_dict.update({'direction': group['direction'].lower()})
                 continue
 
-            m = p1_2.match(line)
+            m = p.p1_2.match(line)
             if m:
                 group = m.groupdict()
                 switch = group['switch']
@@ -3120,7 +3148,7 @@ class ShowEnvironmentAll(ShowEnvironmentAllSchema):
                 continue
 
             # FAN PS-1 is OK
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 ps = group['ps']
@@ -3129,7 +3157,7 @@ class ShowEnvironmentAll(ShowEnvironmentAllSchema):
                 continue
 
             # Switch 1: SYSTEM TEMPERATURE is OK
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 switch = group['switch']
@@ -3140,7 +3168,7 @@ class ShowEnvironmentAll(ShowEnvironmentAllSchema):
             # Inlet Temperature Value: 34 Degree Celsius
             # Hotspot Temperature Value: 45 Degree Celsius
             # ASIC Temperature Value: 36 Degree Celsius
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 temp_type = group['type'].lower() + '_temperature'
@@ -3149,14 +3177,14 @@ class ShowEnvironmentAll(ShowEnvironmentAllSchema):
                 continue
 
             # Temperature State: GREEN
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 temp_dict['state'] = m.groupdict()['state'].lower()
                 continue
 
             # Yellow Threshold : 46 Degree Celsius
             # Red Threshold    : 56 Degree Celsius
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 color_type = group['color'].lower() + '_threshold'
@@ -3167,7 +3195,7 @@ class ShowEnvironmentAll(ShowEnvironmentAllSchema):
             # --  ------------------  ----------  ---------------  -------  -------  -----
             # 1A  PWR-C1-715WAC       DCB1844G1ZY  OK              Good     Good     715
             # 1B  Not Present
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 group = m.groupdict()
                 switch = group.pop('sw')
@@ -3201,6 +3229,17 @@ class ShowModule(ShowModuleSchema):
 
     cli_command = 'show module'
 
+    patterns = Patterns(
+        # initial regexp pattern
+        p1=r'^(?P<switch>\d+) *'
+           '(?P<port>\w+) +'
+           '(?P<model>[\w\-]+) +'
+           '(?P<serial_number>\w+) +'
+           '(?P<mac_address>[\w\.]+) +'
+           '(?P<hw_ver>\w+) +'
+           '(?P<sw_ver>[\w\.]+)$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -3210,14 +3249,7 @@ class ShowModule(ShowModuleSchema):
         # initial return dictionary
         ret_dict = {}
 
-        # initial regexp pattern
-        p1 = re.compile(r'^(?P<switch>\d+) *'
-                        '(?P<port>\w+) +'
-                        '(?P<model>[\w\-]+) +'
-                        '(?P<serial_number>\w+) +'
-                        '(?P<mac_address>[\w\.]+) +'
-                        '(?P<hw_ver>\w+) +'
-                        '(?P<sw_ver>[\w\.]+)$')
+        p = ShowModule.patterns
 
         for line in out.splitlines():
             line = line.strip()
@@ -3225,7 +3257,7 @@ class ShowModule(ShowModuleSchema):
             # Switch  Ports    Model                Serial No.   MAC address     Hw Ver.       Sw Ver.
             # ------  -----   ---------             -----------  --------------  -------       --------
             #  1       56     WS-C3850-48P-E        FOC1902X062  689c.e2ff.b9d9  V04           16.9.1
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 switch = group.pop('switch')
@@ -3258,6 +3290,17 @@ class ShowPlatformSoftwareSlotActiveMonitorMem(ShowPlatformSoftwareSlotActiveMon
 
     cli_command = 'show platform software process slot switch active R0 monitor | inc Mem :|Swap:'
 
+    patterns = Patterns(
+        # initial regexp pattern
+        p1=r'^KiB +Mem *: +(?P<total>\d+) *total, +'
+           '(?P<free>\d+) *free, +(?P<used>\d+) *used, +'
+           '(?P<buff_cache>\d+) *buff\/cache$',
+
+        p2=r'^KiB +Swap *: +(?P<total>\d+) *total, +'
+           '(?P<free>\d+) *free, +(?P<used>\d+) *used. +'
+           '(?P<available_memory>\d+) *avail +Mem$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -3267,20 +3310,13 @@ class ShowPlatformSoftwareSlotActiveMonitorMem(ShowPlatformSoftwareSlotActiveMon
         # initial return dictionary
         ret_dict = {}
 
-        # initial regexp pattern
-        p1 = re.compile(r'^KiB +Mem *: +(?P<total>\d+) *total, +'
-                        '(?P<free>\d+) *free, +(?P<used>\d+) *used, +'
-                        '(?P<buff_cache>\d+) *buff\/cache$')
-
-        p2 = re.compile(r'^KiB +Swap *: +(?P<total>\d+) *total, +'
-                        '(?P<free>\d+) *free, +(?P<used>\d+) *used. +'
-                        '(?P<available_memory>\d+) *avail +Mem$')
+        p = ShowPlatformSoftwareSlotActiveMonitorMem.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # KiB Mem :  4010000 total,    16756 free,  1531160 used,  2462084 buff/cache
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 name_dict = ret_dict.setdefault('memory', {})
@@ -3288,7 +3324,7 @@ class ShowPlatformSoftwareSlotActiveMonitorMem(ShowPlatformSoftwareSlotActiveMon
                 continue
 
             # KiB Swap:        0 total,        0 free,        0 used.  1778776 avail Mem
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 name_dict = ret_dict.setdefault('swap', {})
@@ -3341,6 +3377,23 @@ class ShowPlatformSoftwareStatusControl(ShowPlatformSoftwareStatusControlSchema)
     exclude = ['idle', 'system', 'user', '1_min', '5_min',
                '15_min', 'free', 'used', 'sirq', 'waiting', 'committed']
 
+    patterns = Patterns(
+        # initial regexp pattern
+        p1=r'^(?P<slot>\S+) +(?P<status>\w+) +'
+           '(?P<min1>[\d\.]+) +(?P<min5>[\d\.]+) +(?P<min15>[\d\.]+)$',
+
+        p2=r'^(?P<slot>\S+) +(?P<status>\w+) +'
+           '(?P<total>\d+) +(?P<used>\d+) +\((?P<used_percentage>[\d\s]+)\%\) +'
+           '(?P<free>\d+) +\((?P<free_percentage>[\d\s]+)\%\) +'
+           '(?P<committed>\d+) +\((?P<committed_percentage>[\d\s]+)\%\)$',
+
+        p3=r'^(?P<slot>\S+)? *(?P<cpu>\d+) +'
+           '(?P<user>[\d\.]+) +(?P<system>[\d\.]+) +'
+           '(?P<nice_process>[\d\.]+) +(?P<idle>[\d\.]+) +'
+           '(?P<irq>[\d\.]+) +(?P<sirq>[\d\.]+) +'
+           '(?P<waiting>[\d\.]+)$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -3350,27 +3403,14 @@ class ShowPlatformSoftwareStatusControl(ShowPlatformSoftwareStatusControlSchema)
         # initial return dictionary
         ret_dict = {}
 
-        # initial regexp pattern
-        p1 = re.compile(r'^(?P<slot>\S+) +(?P<status>\w+) +'
-                        '(?P<min1>[\d\.]+) +(?P<min5>[\d\.]+) +(?P<min15>[\d\.]+)$')
-
-        p2 = re.compile(r'^(?P<slot>\S+) +(?P<status>\w+) +'
-                        '(?P<total>\d+) +(?P<used>\d+) +\((?P<used_percentage>[\d\s]+)\%\) +'
-                        '(?P<free>\d+) +\((?P<free_percentage>[\d\s]+)\%\) +'
-                        '(?P<committed>\d+) +\((?P<committed_percentage>[\d\s]+)\%\)$')
-
-        p3 = re.compile(r'^(?P<slot>\S+)? *(?P<cpu>\d+) +'
-                        '(?P<user>[\d\.]+) +(?P<system>[\d\.]+) +'
-                        '(?P<nice_process>[\d\.]+) +(?P<idle>[\d\.]+) +'
-                        '(?P<irq>[\d\.]+) +(?P<sirq>[\d\.]+) +'
-                        '(?P<waiting>[\d\.]+)$')
+        p = ShowPlatformSoftwareStatusControl.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # Slot  Status  1-Min  5-Min 15-Min
             # 1-RP0 Healthy   0.26   0.35   0.33
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 slot = group.pop('slot').lower()
@@ -3383,7 +3423,7 @@ class ShowPlatformSoftwareStatusControl(ShowPlatformSoftwareStatusControlSchema)
 
             # Slot  Status    Total     Used (Pct)     Free (Pct) Committed (Pct)
             # 1-RP0 Healthy  4010000  2553084 (64%)  1456916 (36%)   3536536 (88%)
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 slot = group.pop('slot').lower()
@@ -3395,7 +3435,7 @@ class ShowPlatformSoftwareStatusControl(ShowPlatformSoftwareStatusControlSchema)
             #  Slot  CPU   User System   Nice   Idle    IRQ   SIRQ IOwait
             # 1-RP0    0   3.89   2.09   0.00  93.80   0.00   0.19   0.00
             #          1   5.70   1.00   0.00  93.20   0.00   0.10   0.00
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 if group['slot']:
@@ -3448,6 +3488,19 @@ class ShowProcessesCpuSorted(ShowProcessesCpuSortedSchema):
     exclude = ['five_min_cpu', 'five_sec_cpu_total', 'nonzero_cpu_processes', 'zero_cpu_processes',
                'five_sec_cpu', 'invoked', 'one_min_cpu', 'runtime', 'usecs', 'pid', 'process', ]
 
+    patterns = Patterns(
+        # initial regexp pattern
+        p1=r'^CPU +utilization +for +five +seconds: +'
+           '(?P<five_sec_cpu_total>\d+)\%\/(?P<five_sec_cpu_interrupts>\d+)\%;'
+           ' +one +minute: +(?P<one_min_cpu>\d+)\%;'
+           ' +five +minutes: +(?P<five_min_cpu>\d+)\%$',
+
+        p2=r'^(?P<pid>\d+) +(?P<runtime>\d+) +(?P<invoked>\d+) +(?P<usecs>\d+) +'
+           '(?P<five_sec_cpu>[\d\.]+)\% +(?P<one_min_cpu>[\d\.]+)\% +'
+           '(?P<five_min_cpu>[\d\.]+)\% +(?P<tty>\d+) +'
+           '(?P<process>[\w\-\/\s]+)$',
+    )
+
     def cli(self, sort_time='', key_word='', output=None):
 
         assert sort_time in ['1min', '5min', '5sec', ''], "Not one from 1min 5min 5sec"
@@ -3467,29 +3520,20 @@ class ShowProcessesCpuSorted(ShowProcessesCpuSortedSchema):
         nonzero_cpu_processes = []
         index = 0
 
-        # initial regexp pattern
-        p1 = re.compile(r'^CPU +utilization +for +five +seconds: +'
-                        '(?P<five_sec_cpu_total>\d+)\%\/(?P<five_sec_cpu_interrupts>\d+)\%;'
-                        ' +one +minute: +(?P<one_min_cpu>\d+)\%;'
-                        ' +five +minutes: +(?P<five_min_cpu>\d+)\%$')
-
-        p2 = re.compile(r'^(?P<pid>\d+) +(?P<runtime>\d+) +(?P<invoked>\d+) +(?P<usecs>\d+) +'
-                        '(?P<five_sec_cpu>[\d\.]+)\% +(?P<one_min_cpu>[\d\.]+)\% +'
-                        '(?P<five_min_cpu>[\d\.]+)\% +(?P<tty>\d+) +'
-                        '(?P<process>[\w\-\/\s]+)$')
+        p = ShowProcessesCpuSorted.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # CPU utilization for five seconds: 5%/1%; one minute: 6%; five minutes: 6%
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 ret_dict.update({k: int(v) for k, v in m.groupdict().items()})
                 continue
 
             # PID Runtime(ms)     Invoked      uSecs   5Sec   1Min   5Min TTY Process
             # 539     6061647    89951558         67  0.31%  0.36%  0.38%   0 HSRP Common
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 index += 1
@@ -3550,6 +3594,23 @@ class ShowProcessesCpuPlatform(ShowProcessesCpuPlatformSchema):
     exclude = ['five_min_cpu', 'nonzero_cpu_processes', 'zero_cpu_processes', 'invoked',
                'runtime', 'usecs', 'five_sec_cpu', 'one_min_cpu']
 
+    patterns = Patterns(
+        # initial regexp pattern
+        p1=r'^CPU +utilization +for +five +seconds: +(?P<cpu_util_five_secs>[\d\%]+),'
+           ' +one +minute: +(?P<cpu_util_one_min>[\d\%]+),'
+           ' +five +minutes: +(?P<cpu_util_five_min>[\d\%]+)$',
+
+        p2=r'^(?P<core>[\w\s]+): +CPU +utilization +for'
+           ' +five +seconds: +(?P<core_cpu_util_five_secs>\d\%+),'
+           ' +one +minute: +(?P<core_cpu_util_one_min>[\d\%]+),'
+           ' +five +minutes: +(?P<core_cpu_util_five_min>[\d\%]+)$',
+
+        p3=r'^(?P<pid>\d+) +(?P<ppid>\d+)'
+           ' +(?P<five_sec>[\d\%]+) +(?P<one_min>[\d\%]+)'
+           ' +(?P<five_min>[\d\%]+) +(?P<status>[\w]+)'
+           ' +(?P<size>\d+) +(?P<name>.*)$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -3559,26 +3620,13 @@ class ShowProcessesCpuPlatform(ShowProcessesCpuPlatformSchema):
         # initial return dictionary
         ret_dict = {}
 
-        # initial regexp pattern
-        p1 = re.compile(r'^CPU +utilization +for +five +seconds: +(?P<cpu_util_five_secs>[\d\%]+),'
-                        ' +one +minute: +(?P<cpu_util_one_min>[\d\%]+),'
-                        ' +five +minutes: +(?P<cpu_util_five_min>[\d\%]+)$')
-
-        p2 = re.compile(r'^(?P<core>[\w\s]+): +CPU +utilization +for'
-                        ' +five +seconds: +(?P<core_cpu_util_five_secs>\d\%+),'
-                        ' +one +minute: +(?P<core_cpu_util_one_min>[\d\%]+),'
-                        ' +five +minutes: +(?P<core_cpu_util_five_min>[\d\%]+)$')
-
-        p3 = re.compile(r'^(?P<pid>\d+) +(?P<ppid>\d+)'
-                        ' +(?P<five_sec>[\d\%]+) +(?P<one_min>[\d\%]+)'
-                        ' +(?P<five_min>[\d\%]+) +(?P<status>[\w]+)'
-                        ' +(?P<size>\d+) +(?P<name>.*)$')
+        p = ShowProcessesCpuPlatform.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # CPU utilization for five seconds:  2%, one minute:  5%, five minutes: 22%
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict.setdefault('cpu_utilization', {})
@@ -3586,7 +3634,7 @@ class ShowProcessesCpuPlatform(ShowProcessesCpuPlatformSchema):
                 continue
 
             # Core 0: CPU utilization for five seconds:  2%, one minute:  8%, five minutes: 18%
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 core = group.pop('core')
@@ -3601,7 +3649,7 @@ class ShowProcessesCpuPlatform(ShowProcessesCpuPlatformSchema):
             #      1       0      0%      0%      0%  S          1863680  init
             #      2       0      0%      0%      0%  S                0  kthreadd
             #      3       2      0%      0%      0%  S                0  migration/0
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 pid = group['pid']
@@ -3645,6 +3693,18 @@ class ShowEnvironment(ShowEnvironmentSchema):
 
     cli_command = ['show environment', 'show environment | include {include}']
 
+    patterns = Patterns(
+        p1=r'^Number +of +Critical +alarms: +(?P<critic_larams>\d+)$',
+
+        p2=r'^Number +of +Major +alarms: +(?P<maj_alarms>\d+)$',
+
+        p3=r'^Number +of +Minor +alarms: +(?P<min_alarms>\d+)$',
+
+        p4=r'(?P<slot>\S+) +(?P<sensor_name>\S+|\w+\: +\S+(:? +\S+)?) +'
+           r'(?P<state>Normal|Fan +Speed +\S+) +(?P<reading>\d+ +\S+'
+           r'(:? +AC)?)(:? +\S+)?$',
+    )
+
     def cli(self, include='', output=None):
         if output is None:
             if include:
@@ -3658,35 +3718,27 @@ class ShowEnvironment(ShowEnvironmentSchema):
         # initial return dictionary
         ret_dict = {}
 
-        p1 = re.compile(r'^Number +of +Critical +alarms: +(?P<critic_larams>\d+)$')
-
-        p2 = re.compile(r'^Number +of +Major +alarms: +(?P<maj_alarms>\d+)$')
-
-        p3 = re.compile(r'^Number +of +Minor +alarms: +(?P<min_alarms>\d+)$')
-
-        p4 = re.compile(r'(?P<slot>\S+) +(?P<sensor_name>\S+|\w+\: +\S+(:? +\S+)?) +'
-                        r'(?P<state>Normal|Fan +Speed +\S+) +(?P<reading>\d+ +\S+'
-                        r'(:? +AC)?)(:? +\S+)?$')
+        p = ShowEnvironment.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # Number of Critical alarms:  0
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['critical_larams'] = int(group['critic_larams'])
                 continue
 
             # Number of Major alarms:     0
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['major_alarms'] = int(group['maj_alarms'])
                 continue
 
             # Number of Minor alarms:     0
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['minor_alarms'] = int(group['min_alarms'])
@@ -3698,7 +3750,7 @@ class ShowEnvironment(ShowEnvironmentSchema):
             #  P6    Temp: FC PWM1    Fan Speed 60%    26 Celsius
             #  P0    Iin              Normal           1 A
             #  P0    Vin              Normal           101 V AC
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 sensor_name = group.pop('sensor_name')
@@ -3770,6 +3822,27 @@ class ShowVersionRp(ShowVersionRpSchema):
     cli_command = ['show version RP {rp} {status}']
     exclude = ['total_enqs_bytes', 'total_enqs_packets']
 
+    patterns = Patterns(
+        # Package: rpbase, version: 03.16.04a.S.155-3.S4a-ext, status: active
+        # Package: Provisioning File, version: n/a, status: active
+        p1=r'^Package: +(?P<package_name>[\w\d\s]+),'
+           ' +version: +(?P<version>[\w\d\.\-\/]+),'
+           ' +status: +(?P<status>[\w\/]+)$',
+
+        #   File: consolidated:asr1000rp2-rpbase.03.16.04a.S.155-3.S4a-ext.pkg, on: RP0
+        p2=r'^File: +consolidated:(?P<file>[\w\d\-\.]+),'
+           ' +on: +(?P<rp_slot>[\w\d\/]+)$',
+
+        # Built: 2016-10-04_12.28, by: mcpre
+        # Built: n/a, by: n/a
+        p3=r'^Built: +(?P<built_time>[\w\d\:\.\_\/\-]+),'
+           ' +by: +(?P<built_by>[\w\d\/]+)$',
+
+        #   File SHA1 checksum: 79e234871520fd480dc1128058160b4e2acee9f7
+        p4=r'^File +SHA1 +checksum:'
+           ' +(?P<file_sha1_checksum>[\w\d]+)$',
+    )
+
     def cli(self, rp='active', status='running', output=None):
 
         if output is None:
@@ -3784,29 +3857,12 @@ class ShowVersionRp(ShowVersionRpSchema):
         rp_slot = ''
         built_time = ''
 
-        # Package: rpbase, version: 03.16.04a.S.155-3.S4a-ext, status: active
-        # Package: Provisioning File, version: n/a, status: active
-        p1 = re.compile(r'^Package: +(?P<package_name>[\w\d\s]+),'
-                        ' +version: +(?P<version>[\w\d\.\-\/]+),'
-                        ' +status: +(?P<status>[\w\/]+)$')
-
-        #   File: consolidated:asr1000rp2-rpbase.03.16.04a.S.155-3.S4a-ext.pkg, on: RP0
-        p2 = re.compile(r'^File: +consolidated:(?P<file>[\w\d\-\.]+),'
-                        ' +on: +(?P<rp_slot>[\w\d\/]+)$')
-
-        # Built: 2016-10-04_12.28, by: mcpre
-        # Built: n/a, by: n/a
-        p3 = re.compile(r'^Built: +(?P<built_time>[\w\d\:\.\_\/\-]+),'
-                        ' +by: +(?P<built_by>[\w\d\/]+)$')
-
-        #   File SHA1 checksum: 79e234871520fd480dc1128058160b4e2acee9f7
-        p4 = re.compile(r'^File +SHA1 +checksum:'
-                        ' +(?P<file_sha1_checksum>[\w\d]+)$')
+        p = ShowVersionRp.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 package_name = group['package_name']
@@ -3814,7 +3870,7 @@ class ShowVersionRp(ShowVersionRpSchema):
                 status = group['status']
                 continue
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 file = group['file']
@@ -3841,7 +3897,7 @@ class ShowVersionRp(ShowVersionRpSchema):
                 ret_dict['rp'][rp]['slot'][rp_slot]['package'][package_name]['file'] = file
                 continue
 
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 # Safer, return empty dictionary instead of an error
                 if not package_name or not rp_slot:
@@ -3854,7 +3910,7 @@ class ShowVersionRp(ShowVersionRpSchema):
                 ret_dict['rp'][rp]['slot'][rp_slot]['package'][package_name]['built_by'] = group['built_by']
                 continue
 
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 # Safer, return empty dictionary instead of an error
                 if not package_name or not rp_slot:
@@ -3924,20 +3980,7 @@ class ShowPlatformHardware(ShowPlatformHardwareSchema):
     cli_command = ['show platform hardware qfp active infrastructure bqs queue output default all',
                    'show platform hardware qfp active infrastructure bqs queue output default interface {interface}']
 
-    def cli(self, interface='', output=None):
-
-        if output is None:
-            if interface:
-                cmd = self.cli_command[1].format(interface=interface)
-            else:
-                cmd = self.cli_command[0]
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
-        # initial return dictionary
-        ret_dict = {}
-
+    patterns = Patterns(
         # Interface: GigabitEthernet1/0/7 QFP: 0.0 if_h: 32 Num Queues/Schedules: 1
         # Interface: Loopback2 QFP: 0.0 if_h: 34 Num Queues/Schedules: 0
         # Interface: GigabitEthernet0/0/1.2 QFP: 0.0 if_h: 35 Num Queues/Schedules: 0
@@ -3945,87 +3988,104 @@ class ShowPlatformHardware(ShowPlatformHardwareSchema):
         # Interface: BG4048.10207e1 QFP: 0.0 if_h: 4079 Num Queues/Schedules: 0
         # Interface: VPLS-2944.10207e2 QFP: 0.0 if_h: 4080 Num Queues/Schedules:
         # Interface: internal0/0/recycle:0 QFP: 0.0 if_h: 1 Num Queues/Schedules: 0
-        p1 = re.compile(r'^Interface: +(?P<intf_name>[\w\d\/\.\-\:]+)'
-                        ' +QFP: +(?P<qfp>[\d\.]+)'
-                        ' +if_h: +(?P<if_h>\d+)'
-                        ' +Num Queues/Schedules: +(?P<num_queues>\d+)$')
+        p1=r'^Interface: +(?P<intf_name>[\w\d\/\.\-\:]+)'
+           ' +QFP: +(?P<qfp>[\d\.]+)'
+           ' +if_h: +(?P<if_h>\d+)'
+           ' +Num Queues/Schedules: +(?P<num_queues>\d+)$',
 
         #     Index 0 (Queue ID:0xa6, Name: GigabitEthernet1/0/7)
-        p2 = re.compile(r'^Index +(?P<index>\d+)'
-                        ' +\(Queue +ID:(?P<queue_id>[\w\d]+),'
-                        ' +Name: +(?P<interf_name>[\w\d\/\.\-\:]+)\)$')
+        p2=r'^Index +(?P<index>\d+)'
+           ' +\(Queue +ID:(?P<queue_id>[\w\d]+),'
+           ' +Name: +(?P<interf_name>[\w\d\/\.\-\:]+)\)$',
 
         #       Software Control Info:
         #  PARQ Software Control Info:
-        p3_1 = re.compile(r'^(PARQ +)?Software Control Info:$')
+        p3_1=r'^(PARQ +)?Software Control Info:$',
 
         #  (cache) queue id: 0x000000a6, wred: 0x88b16ac2, qlimit (bytes): 3281312
         #  (cache) queue id: 0x00000070, wred: 0xe73cfde0, qlimit (pkts ): 418
-        p3_2 = re.compile(r'^\(cache\) +queue +id: +(?P<cache_queue_id>[\w\d]+),'
-                          ' +wred: +(?P<wred>[\w\d]+),'
-                          ' +qlimit +\((?P<type>bytes|pkts +)\): +(?P<qlimit>\d+)$')
+        p3_2=r'^\(cache\) +queue +id: +(?P<cache_queue_id>[\w\d]+),'
+             ' +wred: +(?P<wred>[\w\d]+),'
+             ' +qlimit +\((?P<type>bytes|pkts +)\): +(?P<qlimit>\d+)$',
 
         #       parent_sid: 0x284, debug_name: GigabitEthernet1/0/7
-        p4 = re.compile(r'^parent_sid: +(?P<parent_sid>[\w\d]+),'
-                        ' debug_name: +(?P<debug_name>[\w\d\/\.\-\:]+)$')
+        p4=r'^parent_sid: +(?P<parent_sid>[\w\d]+),'
+           ' debug_name: +(?P<debug_name>[\w\d\/\.\-\:]+)$',
 
         #       sw_flags: 0x08000011, sw_state: 0x00000c01, port_uidb: 245728
-        p5 = re.compile(r'^sw_flags: +(?P<sw_flags>[\w\d]+),'
-                        ' +sw_state: +(?P<sw_state>[\w\d]+),'
-                        ' +port_uidb: +(?P<port_uidb>\d+)$')
+        p5=r'^sw_flags: +(?P<sw_flags>[\w\d]+),'
+           ' +sw_state: +(?P<sw_state>[\w\d]+),'
+           ' +port_uidb: +(?P<port_uidb>\d+)$',
 
         #       orig_min  : 0                   ,      min: 105000000
-        p6 = re.compile(r'^orig_min +: +(?P<orig_min>\d+) +,'
-                        ' +min: +(?P<min>\d+)$')
+        p6=r'^orig_min +: +(?P<orig_min>\d+) +,'
+           ' +min: +(?P<min>\d+)$',
 
         #       min_qos   : 0                   , min_dflt: 0
-        p7 = re.compile(r'^min_qos +: +(?P<min_qos>\d+) +,'
-                        ' +min_dflt: +(?P<min_dflt>\d+)$')
+        p7=r'^min_qos +: +(?P<min_qos>\d+) +,'
+           ' +min_dflt: +(?P<min_dflt>\d+)$',
 
         #       orig_max  : 0                   ,      max: 0
-        p8 = re.compile(r'^orig_max +: +(?P<orig_max>\d+) +,'
-                        ' +max: +(?P<max>\d+)$')
+        p8=r'^orig_max +: +(?P<orig_max>\d+) +,'
+           ' +max: +(?P<max>\d+)$',
 
         #       max_qos   : 0                   , max_dflt: 0
-        p9 = re.compile(r'^max_qos +: +(?P<max_qos>\d+) +,'
-                        ' +max_dflt: +(?P<max_dflt>\d+)$')
+        p9=r'^max_qos +: +(?P<max_qos>\d+) +,'
+           ' +max_dflt: +(?P<max_dflt>\d+)$',
 
         #       share     : 1
-        p10 = re.compile(r'^share +: +(?P<share>\d+)$')
+        p10=r'^share +: +(?P<share>\d+)$',
 
         #       plevel    : 0, priority: 65535
-        p11 = re.compile(r'^plevel +: +(?P<plevel>\d+),'
-                         ' +priority: +(?P<priority>\d+)$')
+        p11=r'^plevel +: +(?P<plevel>\d+),'
+            ' +priority: +(?P<priority>\d+)$',
 
         #       defer_obj_refcnt: 0
         #   defer_obj_refcnt: 0, cp_ppe_addr: 0x00000000
-        p12 = re.compile(r'^defer_obj_refcnt: +(?P<defer_obj_refcnt>\d+)'
-                         r'(, +cp_ppe_addr: +(?P<cp_ppe_addr>\w+))?$')
+        p12=r'^defer_obj_refcnt: +(?P<defer_obj_refcnt>\d+)'
+            r'(, +cp_ppe_addr: +(?P<cp_ppe_addr>\w+))?$',
 
         #     Statistics:
-        p13_1 = re.compile(r'^Statistics:$')
+        p13_1=r'^Statistics:$',
 
         #       tail drops  (bytes): 0                   ,          (packets): 0
-        p13_2 = re.compile(r'^tail +drops +\(bytes\): +(?P<tail_drops_bytes>\d+) +,'
-                           ' +\(packets\): +(?P<tail_drops_packets>\d+)$')
+        p13_2=r'^tail +drops +\(bytes\): +(?P<tail_drops_bytes>\d+) +,'
+              ' +\(packets\): +(?P<tail_drops_packets>\d+)$',
 
         #       total enqs  (bytes): 0                   ,          (packets): 0
-        p14 = re.compile(r'^total +enqs +\(bytes\): +(?P<total_enqs_bytes>\d+) +,'
-                         ' +\(packets\): +(?P<total_enqs_packets>\d+)$')
+        p14=r'^total +enqs +\(bytes\): +(?P<total_enqs_bytes>\d+) +,'
+            ' +\(packets\): +(?P<total_enqs_packets>\d+)$',
 
         #       queue_depth (bytes): 0
         #       queue_depth (pkts ): 0
-        p15 = re.compile(r'^queue_depth +\((?P<type>bytes|pkts +)\): +(?P<queue_depth>\d+)$')
+        p15=r'^queue_depth +\((?P<type>bytes|pkts +)\): +(?P<queue_depth>\d+)$',
 
         #       licensed throughput oversubscription drops:
         #                   (bytes): 0                   ,          (packets): 0
-        p16 = re.compile(r'^\(bytes\): +(?P<lic_throughput_oversub_drops_bytes>\d+) +,'
-                         ' +\(packets\): +(?P<lic_throughput_oversub_drops_packets>\d+)$')
+        p16=r'^\(bytes\): +(?P<lic_throughput_oversub_drops_bytes>\d+) +,'
+            ' +\(packets\): +(?P<lic_throughput_oversub_drops_packets>\d+)$',
+    )
+
+    def cli(self, interface='', output=None):
+
+        if output is None:
+            if interface:
+                cmd = self.cli_command[1].format(interface=interface)
+            else:
+                cmd = self.cli_command[0]
+            out = self.device.execute(cmd)
+        else:
+            out = output
+
+        # initial return dictionary
+        ret_dict = {}
+
+        p = ShowPlatformHardware.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 interface = group['intf_name']
@@ -4033,7 +4093,7 @@ class ShowPlatformHardware(ShowPlatformHardwareSchema):
                 ret_dict[interface]['if_h'] = int(group['if_h'])
                 continue
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 index = group['index']
@@ -4046,12 +4106,12 @@ class ShowPlatformHardware(ShowPlatformHardwareSchema):
                     group['interf_name']
                 continue
 
-            m = p3_1.match(line)
+            m = p.p3_1.match(line)
             if m:
                 ret_dict[interface]['index'][index].setdefault('software_control_info', {})
                 continue
 
-            m = p3_2.match(line)
+            m = p.p3_2.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict[interface]['index'][index]['software_control_info']['cache_queue_id'] = group['cache_queue_id']
@@ -4062,14 +4122,14 @@ class ShowPlatformHardware(ShowPlatformHardwareSchema):
                     ret_dict[interface]['index'][index]['software_control_info']['qlimit_pkts'] = int(group['qlimit'])
                 continue
 
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict[interface]['index'][index]['software_control_info'].\
                     update({k: v for k, v in group.items()})
                 continue
 
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict[interface]['index'][index]['software_control_info']['sw_flags'] = group['sw_flags']
@@ -4077,48 +4137,48 @@ class ShowPlatformHardware(ShowPlatformHardwareSchema):
                 ret_dict[interface]['index'][index]['software_control_info']['port_uidb'] = int(group['port_uidb'])
                 continue
 
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict[interface]['index'][index]['software_control_info'].\
                     update({k: int(v) for k, v in group.items()})
                 continue
 
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict[interface]['index'][index]['software_control_info'].\
                     update({k: int(v) for k, v in group.items()})
                 continue
 
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict[interface]['index'][index]['software_control_info'].\
                     update({k: int(v) for k, v in group.items()})
                 continue
 
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict[interface]['index'][index]['software_control_info'].\
                     update({k: int(v) for k, v in group.items()})
                 continue
 
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict[interface]['index'][index]['software_control_info']['share'] = int(group['share'])
                 continue
 
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict[interface]['index'][index]['software_control_info'].\
                     update({k: int(v) for k, v in group.items()})
                 continue
 
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict[interface]['index'][index]['software_control_info']['defer_obj_refcnt'] = int(group['defer_obj_refcnt'])
@@ -4127,24 +4187,24 @@ class ShowPlatformHardware(ShowPlatformHardwareSchema):
                     ret_dict[interface]['index'][index]['software_control_info']['cp_ppe_addr'] = group['cp_ppe_addr']
                 continue
 
-            m = p13_1.match(line)
+            m = p.p13_1.match(line)
             if m:
                 ret_dict[interface]['index'][index].setdefault('statistics', {})
                 continue
 
-            m = p13_2.match(line)
+            m = p.p13_2.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict[interface]['index'][index]['statistics'].update({k: int(v) for k, v in group.items()})
                 continue
 
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict[interface]['index'][index]['statistics'].update({k: int(v) for k, v in group.items()})
                 continue
 
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 group = m.groupdict()
                 if group['type'].strip() == 'bytes':
@@ -4153,7 +4213,7 @@ class ShowPlatformHardware(ShowPlatformHardwareSchema):
                     ret_dict[interface]['index'][index]['statistics']['queue_depth_pkts'] = int(group['queue_depth'])
                 continue
 
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict[interface]['index'][index]['statistics'].update({k: int(v) for k, v in group.items()})
@@ -4260,119 +4320,123 @@ class ShowPlatformHardwarePlim(ShowPlatformHardwarePlimSchema):
                    'show platform hardware slot {slot} plim statistics internal',
                    'show platform hardware subslot {subslot} plim statistics']
 
-    def cli(self, port=None, slot=None, subslot=None, internal=False, output=None):
-
-        if output is None:
-            if port:
-                cmd = self.cli_command[0].format(port=port)
-            elif slot:
-                if internal:
-                    cmd = self.cli_command[2].format(slot=slot)
-                else:
-                    cmd = self.cli_command[1].format(slot=slot)
-            elif subslot:
-                cmd = self.cli_command[3].format(subslot=subslot)
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
-        # initial return dictionary
-        ret_dict = {}
-
+    patterns = Patterns(
         # Interface 0/0/0
-        p1 = re.compile(r'^Interface +(?P<port>[\d\/]+)$')
+        p1=r'^Interface +(?P<port>[\d\/]+)$',
 
         #   RX Low Priority
         #   RX High Priority
-        p2 = re.compile(r'^RX +(?P<direction>\w+) +Priority$')
+        p2=r'^RX +(?P<direction>\w+) +Priority$',
 
         #     RX Pkts      369         Bytes 27789
-        p3 = re.compile(r'^RX +Pkts +(?P<rx_total_pkts>\d+) +Bytes +(?P<rx_total_bytes>\d+)$')
+        p3=r'^RX +Pkts +(?P<rx_total_pkts>\d+) +Bytes +(?P<rx_total_bytes>\d+)$',
 
         #     RX Drop Pkts 0           Bytes 0
-        p4 = re.compile(r'^RX +Drop +Pkts +(?P<rx_dropped_pkts>\d+) +Bytes +(?P<rx_dropped_bytes>\d+)$')
+        p4=r'^RX +Drop +Pkts +(?P<rx_dropped_pkts>\d+) +Bytes +(?P<rx_dropped_bytes>\d+)$',
 
         #     RX Err  Pkts 0           Bytes 0
-        p5 = re.compile(r'^RX +Err +Pkts +(?P<rx_errored_pkts>\d+) +Bytes +(?P<rx_errored_bytes>\d+)$')
+        p5=r'^RX +Err +Pkts +(?P<rx_errored_pkts>\d+) +Bytes +(?P<rx_errored_bytes>\d+)$',
 
         #   TX Low Priority
         #   TX High Priority
-        p6 = re.compile(r'^TX +(?P<direction>\w+) +Priority$')
+        p6=r'^TX +(?P<direction>\w+) +Priority$',
 
         #     TX Pkts      1265574622  Bytes 250735325722
-        p7 = re.compile(r'^TX +Pkts +(?P<tx_total_pkts>\d+) +Bytes +(?P<tx_total_bytes>\d+)$')
+        p7=r'^TX +Pkts +(?P<tx_total_pkts>\d+) +Bytes +(?P<tx_total_bytes>\d+)$',
 
         #     TX Drop Pkts 0           Bytes 0
-        p8 = re.compile(r'^TX +Drop +Pkts +(?P<tx_dropped_pkts>\d+) +Bytes +(?P<tx_dropped_bytes>\d+)$')
+        p8=r'^TX +Drop +Pkts +(?P<tx_dropped_pkts>\d+) +Bytes +(?P<tx_dropped_bytes>\d+)$',
 
         # 0/3, SPA-1XTENGE-XFP-V2, Online
-        p9 = re.compile(r'^(?P<slot>\d+)/(?P<subslot>\d+),'
-                        ' +(?P<name>[\w\d\-]+),'
-                        ' +(?P<status>\w+)$')
+        p9=r'^(?P<slot>\d+)/(?P<subslot>\d+),'
+           ' +(?P<name>[\w\d\-]+),'
+           ' +(?P<status>\w+)$',
 
         #   RX IPC Pkts 0           Bytes 0
-        p10 = re.compile(r'^RX +IPC +Pkts +(?P<rx_ipc_pkts>\d+) +Bytes +(?P<rx_ipc_bytes>\d+)$')
+        p10=r'^RX +IPC +Pkts +(?P<rx_ipc_pkts>\d+) +Bytes +(?P<rx_ipc_bytes>\d+)$',
 
         #   TX IPC Pkts 0           Bytes 0
-        p11 = re.compile(r'^TX +IPC +Pkts +(?P<tx_ipc_pkts>\d+) +Bytes +(?P<tx_ipc_bytes>\d+)$')
+        p11=r'^TX +IPC +Pkts +(?P<tx_ipc_pkts>\d+) +Bytes +(?P<tx_ipc_bytes>\d+)$',
 
         #   RX IPC Err 0
-        p12 = re.compile(r'^RX +IPC +Err +(?P<rx_ipc_err>\d+)$')
+        p12=r'^RX +IPC +Err +(?P<rx_ipc_err>\d+)$',
 
         #   TX IPC Err 0
-        p13 = re.compile(r'^TX +IPC +Err +(?P<tx_ipc_err>\d+)$')
+        p13=r'^TX +IPC +Err +(?P<tx_ipc_err>\d+)$',
 
         #   RX Spi4 Interrupt Counters
         #   TX Spi4 Interrupt Counters
-        p14 = re.compile(r'^(?P<tx_rx>\w+) +Spi4 +Interrupt +Counters$')
+        p14=r'^(?P<tx_rx>\w+) +Spi4 +Interrupt +Counters$',
 
         #     Out Of Frame 0
-        p15 = re.compile(r'^Out +Of +Frame +(?P<out_of_frame>\d+)$')
+        p15=r'^Out +Of +Frame +(?P<out_of_frame>\d+)$',
 
         #     Dip4 Error 0
-        p16 = re.compile(r'^Dip4 +Error +(?P<rx_dip4_error>\d+)$')
+        p16=r'^Dip4 +Error +(?P<rx_dip4_error>\d+)$',
 
         #     Disabled 0
-        p17 = re.compile(r'^Disabled +(?P<rx_disbaled>\d+)$')
+        p17=r'^Disabled +(?P<rx_disbaled>\d+)$',
 
         #     Loss Of Sync 0
-        p18 = re.compile(r'^Loss +Of +Sync +(?P<rx_loss_of_sync>\d+)$')
+        p18=r'^Loss +Of +Sync +(?P<rx_loss_of_sync>\d+)$',
 
         #     Sequence Error 0
-        p19 = re.compile(r'^Sequence +Error +(?P<rx_sequence_error>\d+)$')
+        p19=r'^Sequence +Error +(?P<rx_sequence_error>\d+)$',
 
         #     Burst Error 0
-        p20 = re.compile(r'^Burst +Error +(?P<rx_burst_error>\d+)$')
+        p20=r'^Burst +Error +(?P<rx_burst_error>\d+)$',
 
         #     EOP Abort 0
-        p21 = re.compile(r'^EOP +Abort +(?P<rx_eop_abort>\d+)$')
+        p21=r'^EOP +Abort +(?P<rx_eop_abort>\d+)$',
 
         #     Packet Gap Error 0
-        p22 = re.compile(r'^Packet +Gap +Error +(?P<rx_packet_gap_error>\d+)$')
+        p22=r'^Packet +Gap +Error +(?P<rx_packet_gap_error>\d+)$',
 
         #     Control Word Error 0
-        p23 = re.compile(r'^Control +Word +Error +(?P<rx_control_word_error>\d+)$')
+        p23=r'^Control +Word +Error +(?P<rx_control_word_error>\d+)$',
 
         #     Frame Error 0
-        p24 = re.compile(r'^Frame +Error +(?P<tx_frame_error>\d+)$')
+        p24=r'^Frame +Error +(?P<tx_frame_error>\d+)$',
 
         #     FIFO Over Flow 0
-        p25 = re.compile(r'^FIFO +Over +Flow +(?P<tx_fifo_over_flow>\d+)$')
+        p25=r'^FIFO +Over +Flow +(?P<tx_fifo_over_flow>\d+)$',
 
         #     Dip2 Error 0
-        p26 = re.compile(r'^Dip2 +Error +(?P<tx_dip2_error>\d+)$')
+        p26=r'^Dip2 +Error +(?P<tx_dip2_error>\d+)$',
+    )
+
+    def cli(self, port=None, slot=None, subslot=None, internal=False, output=None):
+
+        if output is None:
+            if port:
+                cmd = self.cli_command[0].format(port=port)
+            elif slot:
+                if internal:
+                    cmd = self.cli_command[2].format(slot=slot)
+                else:
+                    cmd = self.cli_command[1].format(slot=slot)
+            elif subslot:
+                cmd = self.cli_command[3].format(subslot=subslot)
+            out = self.device.execute(cmd)
+        else:
+            out = output
+
+        # initial return dictionary
+        ret_dict = {}
+
+        p = ShowPlatformHardwarePlim.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 port = group['port']
                 ret_dict.setdefault('port', {}).setdefault(port, {})
                 continue
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 direction = group['direction']
@@ -4385,7 +4449,7 @@ class ShowPlatformHardwarePlim(ShowPlatformHardwarePlimSchema):
                 ret_dict['port'][port]['received'].setdefault(low_high, {})
                 continue
 
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 if 'port' in ret_dict:
@@ -4399,21 +4463,21 @@ class ShowPlatformHardwarePlim(ShowPlatformHardwarePlimSchema):
                     ret_dict['slot'][slot]['subslot'][subslot]['received']['bytes'] = int(group['rx_total_bytes'])
                 continue
 
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['port'][port]['received'][low_high]['dropped_pkts'] = int(group['rx_dropped_pkts'])
                 ret_dict['port'][port]['received'][low_high]['dropped_bytes'] = int(group['rx_dropped_bytes'])
                 continue
 
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['port'][port]['received'][low_high]['errored_pkts'] = int(group['rx_errored_pkts'])
                 ret_dict['port'][port]['received'][low_high]['errored_bytes'] = int(group['rx_errored_bytes'])
                 continue
 
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 direction = group['direction']
@@ -4426,7 +4490,7 @@ class ShowPlatformHardwarePlim(ShowPlatformHardwarePlimSchema):
                 ret_dict['port'][port]['transmitted'].setdefault(low_high, {})
                 continue
 
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 group = m.groupdict()
                 if 'port' in ret_dict:
@@ -4439,14 +4503,14 @@ class ShowPlatformHardwarePlim(ShowPlatformHardwarePlimSchema):
                     ret_dict['slot'][slot]['subslot'][subslot]['transmitted']['bytes'] = int(group['tx_total_bytes'])
                 continue
 
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['port'][port]['transmitted'][low_high]['dropped_pkts'] = int(group['tx_dropped_pkts'])
                 ret_dict['port'][port]['transmitted'][low_high]['dropped_bytes'] = int(group['tx_dropped_bytes'])
                 continue
 
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 group = m.groupdict()
                 slot = group['slot']
@@ -4461,7 +4525,7 @@ class ShowPlatformHardwarePlim(ShowPlatformHardwarePlimSchema):
                     group['status']
                 continue
 
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 group = m.groupdict()
                 if 'received' not in ret_dict['slot'][slot]['subslot'][subslot]:
@@ -4470,7 +4534,7 @@ class ShowPlatformHardwarePlim(ShowPlatformHardwarePlimSchema):
                 ret_dict['slot'][slot]['subslot'][subslot]['received']['ipc_bytes'] = int(group['rx_ipc_bytes'])
                 continue
 
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 group = m.groupdict()
                 if 'transmitted' not in ret_dict['slot'][slot]['subslot'][subslot]:
@@ -4479,21 +4543,21 @@ class ShowPlatformHardwarePlim(ShowPlatformHardwarePlimSchema):
                 ret_dict['slot'][slot]['subslot'][subslot]['transmitted']['ipc_bytes'] = int(group['tx_ipc_bytes'])
                 continue
 
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['slot'][slot]['subslot'][subslot].setdefault('received', {})
                 ret_dict['slot'][slot]['subslot'][subslot]['received']['ipc_err'] = int(group['rx_ipc_err'])
                 continue
 
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['slot'][slot]['subslot'][subslot].setdefault('transmitted', {})
                 ret_dict['slot'][slot]['subslot'][subslot]['transmitted']['ipc_err'] = int(group['tx_ipc_err'])
                 continue
 
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 group = m.groupdict()
                 tx_rx_direction = group['tx_rx']
@@ -4505,73 +4569,73 @@ class ShowPlatformHardwarePlim(ShowPlatformHardwarePlimSchema):
                     setdefault('spi4_interrupt_counters', {})
                 continue
 
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['slot'][slot]['subslot'][subslot][new_direction]['spi4_interrupt_counters']['out_of_frame'] = int(group['out_of_frame'])
                 continue
 
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['slot'][slot]['subslot'][subslot][new_direction]['spi4_interrupt_counters']['dip4_error'] = int(group['rx_dip4_error'])
                 continue
 
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['slot'][slot]['subslot'][subslot][new_direction]['spi4_interrupt_counters']['disabled'] = int(group['rx_disbaled'])
                 continue
 
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['slot'][slot]['subslot'][subslot][new_direction]['spi4_interrupt_counters']['loss_of_sync'] = int(group['rx_loss_of_sync'])
                 continue
 
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['slot'][slot]['subslot'][subslot][new_direction]['spi4_interrupt_counters']['sequence_error'] = int(group['rx_sequence_error'])
                 continue
 
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['slot'][slot]['subslot'][subslot][new_direction]['spi4_interrupt_counters']['burst_error'] = int(group['rx_burst_error'])
                 continue
 
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['slot'][slot]['subslot'][subslot][new_direction]['spi4_interrupt_counters']['eop_abort'] = int(group['rx_eop_abort'])
                 continue
 
-            m = p22.match(line)
+            m = p.p22.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['slot'][slot]['subslot'][subslot][new_direction]['spi4_interrupt_counters']['packet_gap_error'] = int(group['rx_packet_gap_error'])
                 continue
 
-            m = p23.match(line)
+            m = p.p23.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['slot'][slot]['subslot'][subslot][new_direction]['spi4_interrupt_counters']['control_word_error'] = int(group['rx_control_word_error'])
                 continue
 
-            m = p24.match(line)
+            m = p.p24.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['slot'][slot]['subslot'][subslot][new_direction]['spi4_interrupt_counters']['frame_error'] = int(group['tx_frame_error'])
                 continue
 
-            m = p25.match(line)
+            m = p.p25.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['slot'][slot]['subslot'][subslot][new_direction]['spi4_interrupt_counters']['fifo_over_flow'] = int(group['tx_fifo_over_flow'])
                 continue
 
-            m = p26.match(line)
+            m = p.p26.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['slot'][slot]['subslot'][subslot][new_direction]['spi4_interrupt_counters']['dip2_error'] = int(group['tx_dip2_error'])
@@ -4802,46 +4866,50 @@ class ShowPlatformHardwareSerdes(ShowPlatformHardwareSerdesSchema):
 
     cli_command = 'show platform hardware slot {slot} serdes statistics'
 
-    def cli(self, slot, output=None):
-
-        if output is None:
-            cmd = self.cli_command.format(slot=slot)
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
-        # initial return dictionary
-        ret_dict = {}
-
+    patterns = Patterns(
         # From Slot 1-Link B
-        p1 = re.compile(r'^From +Slot +(?P<link>[\w\d\-\s]+)$')
+        p1=r'^From +Slot +(?P<link>[\w\d\-\s]+)$',
 
         #   Pkts  High: 0          Low: 0          Bad: 0          Dropped: 0
-        p2 = re.compile(r'^Pkts +High: +(?P<high>\d+) +Low: +(?P<low>\d+)( +Bad: +(?P<bad>\d+) +Dropped: +(?P<dropped>\d+))?$')
+        p2=r'^Pkts +High: +(?P<high>\d+) +Low: +(?P<low>\d+)( +Bad: +(?P<bad>\d+) +Dropped: +(?P<dropped>\d+))?$',
 
         #   Bytes High: 0          Low: 0          Bad: 0          Dropped: 0
-        p3 = re.compile(r'^Bytes +High: +(?P<high>\d+) +Low: +(?P<low>\d+) +Bad: +(?P<bad>\d+) +Dropped: +(?P<dropped>\d+)$')
+        p3=r'^Bytes +High: +(?P<high>\d+) +Low: +(?P<low>\d+) +Bad: +(?P<bad>\d+) +Dropped: +(?P<dropped>\d+)$',
 
         #   Pkts  Looped: 0          Error: 0
-        p4 = re.compile(r'^Pkts +Looped: +(?P<looped>\d+) +Error: +(?P<errored>\d+)$')
+        p4=r'^Pkts +Looped: +(?P<looped>\d+) +Error: +(?P<errored>\d+)$',
 
         #   Bytes Looped 0
-        p5 = re.compile(r'^Bytes +Looped +(?P<looped>\d+)$')
+        p5=r'^Bytes +Looped +(?P<looped>\d+)$',
 
         #   Qstat count: 0          Flow ctrl count: 3501
-        p6 = re.compile(r'^Qstat +count: +(?P<qstat_count>\d+) +Flow +ctrl +count: +(?P<flow_ctrl_count>\d+)$')
+        p6=r'^Qstat +count: +(?P<qstat_count>\d+) +Flow +ctrl +count: +(?P<flow_ctrl_count>\d+)$',
+    )
+
+    def cli(self, slot, output=None):
+
+        if output is None:
+            cmd = self.cli_command.format(slot=slot)
+            out = self.device.execute(cmd)
+        else:
+            out = output
+
+        # initial return dictionary
+        ret_dict = {}
+
+        p = ShowPlatformHardwareSerdes.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 slot = group['link']
                 from_dict = ret_dict.setdefault('link', {}).setdefault(slot, {}).setdefault('from', {})
                 continue
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 if not group['bad']:
@@ -4853,26 +4921,26 @@ class ShowPlatformHardwareSerdes(ShowPlatformHardwareSerdesSchema):
                 pkts_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 bytes_dict = ret_dict['link'][slot]['from'].setdefault('bytes', {})
                 bytes_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 pkts_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 bytes_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 from_dict.update({k: int(v) for k, v in group.items()})
@@ -4886,58 +4954,48 @@ class ShowPlatformHardwareSerdesInternal(ShowPlatformHardwareSerdesSchema):
 
     cli_command = 'show platform hardware slot {slot} serdes statistics internal'
 
-    def cli(self, slot, output=None):
-
-        if output is None:
-            cmd = self.cli_command.format(slot=slot)
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
-        # initial return dictionary
-        ret_dict = {}
-
+    patterns = Patterns(
         # Network-Processor-0 Link:
         # RP/ESP Link:
-        p1 = re.compile(r'^(?P<link>[\w\d\-\s/]+) +Link:$')
+        p1=r'^(?P<link>[\w\d\-\s/]+) +Link:$',
 
         #   Local TX in sync, Local RX in sync
-        p2 = re.compile(r'^Local +TX +in +sync, +Local +RX +in +sync$')
+        p2=r'^Local +TX +in +sync, +Local +RX +in +sync$',
 
         #   Remote TX in sync, Remote RX in sync
-        p3 = re.compile(r'^Remote +TX +in +sync, +Remote +RX +in +sync$')
+        p3=r'^Remote +TX +in +sync, +Remote +RX +in +sync$',
 
         #   To Network-Processor       Packets:    21763844  Bytes:  7343838083
         #   To Encryption Processor   Packets:           0  Bytes:           0
         #   To RP/ESP Packets: 1150522 Bytes: 166031138
-        p4 = re.compile(r'^To +(?P<link_name_1>[\w\-\d\s/]+) +Packets: +(?P<to_packets>\d+) +Bytes: +(?P<to_bytes>\d+)$')
+        p4=r'^To +(?P<link_name_1>[\w\-\d\s/]+) +Packets: +(?P<to_packets>\d+) +Bytes: +(?P<to_bytes>\d+)$',
 
         #   From Network-Processor     Packets:    21259012  Bytes:  7397920802
         #   From RP/ESP Packets: 4364008 Bytes: 697982854
-        p5 = re.compile(r'^From +(?P<link_name_2>[\w\-\d\s/]+) +Packets: +(?P<from_packets>\d+) +Bytes: +(?P<from_bytes>\d+)$')
+        p5=r'^From +(?P<link_name_2>[\w\-\d\s/]+) +Packets: +(?P<from_packets>\d+) +Bytes: +(?P<from_bytes>\d+)$',
 
         #     Drops                   Packets:           0  Bytes:           0
-        p6 = re.compile(r'^Drops +Packets: +(?P<dropped_packets>\d+) +Bytes: +(?P<dropped_bytes>\d+)$')
+        p6=r'^Drops +Packets: +(?P<dropped_packets>\d+) +Bytes: +(?P<dropped_bytes>\d+)$',
 
         #     Errors                  Packets:           0  Bytes:           0
-        p7 = re.compile(r'^Errors +Packets: +(?P<errored_packets>\d+) +Bytes: +(?P<errored_bytes>\d+)$')
+        p7=r'^Errors +Packets: +(?P<errored_packets>\d+) +Bytes: +(?P<errored_bytes>\d+)$',
 
         #     Errors:
-        p8 = re.compile(r'^Errors:$')
+        p8=r'^Errors:$',
 
         #     RX/TX process: 0/0, RX/TX schedule: 0/0
-        p9 = re.compile(r'^RX/TX +process: +(?P<rx_process>\d+)/(?P<tx_process>\d+), +RX/TX +schedule: +(?P<rx_schedule>\d+)/(?P<tx_schedule>\d+)$')
+        p9=r'^RX/TX +process: +(?P<rx_process>\d+)/(?P<tx_process>\d+), +RX/TX +schedule: +(?P<rx_schedule>\d+)/(?P<tx_schedule>\d+)$',
 
         #     RX/TX statistics: 0/0, RX parity: 0
-        p10 = re.compile(r'^RX/TX +statistics: +(?P<rx_statistics>\d+)/(?P<tx_statistics>\d+), +RX +parity: +(?P<rx_parity>\d+)$')
+        p10=r'^RX/TX +statistics: +(?P<rx_statistics>\d+)/(?P<tx_statistics>\d+), +RX +parity: +(?P<rx_parity>\d+)$',
 
         # Serdes Exception Counts:
-        p11 = re.compile(r'^Serdes +Exception +Counts:$')
+        p11=r'^Serdes +Exception +Counts:$',
 
         #   eqs/fc:
         #   idh-hi:
         #   spi link:
-        p12 = re.compile(r'^(?P<link>[\w\d\-\s\/]+):$')
+        p12=r'^(?P<link>[\w\d\-\s\/]+):$',
 
         #     link 0: msgTypeError: 5
         #     link 0: msgEccError: 5
@@ -4948,31 +5006,45 @@ class ShowPlatformHardwareSerdesInternal(ShowPlatformHardwareSerdesSchema):
         #     link 2: msgTypeError: 3
         #     link 2: msgEccError: 3
         #     link 2: chicoEvent: 3
-        p13 = re.compile(r'^link +(?P<link_number>\d+): +(?P<error_event>\w+): +(?P<count>\d+)$')
+        p13=r'^link +(?P<link_number>\d+): +(?P<error_event>\w+): +(?P<count>\d+)$',
+    )
+
+    def cli(self, slot, output=None):
+
+        if output is None:
+            cmd = self.cli_command.format(slot=slot)
+            out = self.device.execute(cmd)
+        else:
+            out = output
+
+        # initial return dictionary
+        ret_dict = {}
+
+        p = ShowPlatformHardwareSerdesInternal.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 link = group['link']
                 new_dict = ret_dict.setdefault('link', {}).setdefault(link, {})
                 continue
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 new_dict['local_tx_in_sync'] = True
                 new_dict['local_rx_in_sync'] = True
                 continue
 
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 new_dict['remote_tx_in_sync'] = True
                 new_dict['remote_rx_in_sync'] = True
                 continue
 
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 to_not_from = True
@@ -4982,7 +5054,7 @@ class ShowPlatformHardwareSerdesInternal(ShowPlatformHardwareSerdesSchema):
                 new_dict['to']['bytes']['total'] = int(group['to_bytes'])
                 continue
 
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 to_not_from = False
@@ -4992,7 +5064,7 @@ class ShowPlatformHardwareSerdesInternal(ShowPlatformHardwareSerdesSchema):
                 new_dict['from']['bytes']['total'] = int(group['from_bytes'])
                 continue
 
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 if to_not_from:
@@ -5003,7 +5075,7 @@ class ShowPlatformHardwareSerdesInternal(ShowPlatformHardwareSerdesSchema):
                     new_dict['from']['bytes']['dropped'] = int(group['dropped_bytes'])
                 continue
 
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 group = m.groupdict()
                 if to_not_from:
@@ -5014,11 +5086,11 @@ class ShowPlatformHardwareSerdesInternal(ShowPlatformHardwareSerdesSchema):
                     new_dict['from']['bytes']['errored'] = int(group['errored_bytes'])
                 continue
 
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 continue
 
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 group = m.groupdict()
                 new_dict.setdefault('errors', {})
@@ -5026,7 +5098,7 @@ class ShowPlatformHardwareSerdesInternal(ShowPlatformHardwareSerdesSchema):
                                            for k, v in group.items()})
                 continue
 
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 group = m.groupdict()
                 if 'errors' in ret_dict['link'][link]:
@@ -5034,20 +5106,20 @@ class ShowPlatformHardwareSerdesInternal(ShowPlatformHardwareSerdesSchema):
                         {k: int(v) for k, v in group.items()})
                 continue
 
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 serdes_exception_counts = True
                 ret_dict.setdefault('serdes_exception_counts', {})
                 continue
 
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 group = m.groupdict()
                 link = group['link']
                 ret_dict['serdes_exception_counts'].setdefault(link, {})
                 continue
 
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 group = m.groupdict()
                 link_number = group['link_number']
@@ -5090,76 +5162,80 @@ class ShowPlatformPower(ShowPlatformPowerSchema):
     """Parser for show platform power"""
     cli_command = 'show platform power'
 
-    def cli(self, output=None):
-
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-
-        ret_dict = {}
-
+    patterns = Patterns(
         # Chassis type: ASR1006-X
-        p1 = re.compile(r'^\s*Chassis +type\: +(?P<chassis>[\w\-]+)')
+        p1=r'^\s*Chassis +type\: +(?P<chassis>[\w\-]+)',
 
         # Power Redundancy Mode: nplus1
-        p2 = re.compile(r'^\s*Power +Redundancy +Mode\: +(?P<redundancy_mode>[\w]+)')
+        p2=r'^\s*Power +Redundancy +Mode\: +(?P<redundancy_mode>[\w]+)',
 
         # Power Allocation Status: Sufficient
-        p3 = re.compile(r'^\s*Power +Allocation +Status\: +(?P<allocation_status>[\w]+)')
+        p3=r'^\s*Power +Allocation +Status\: +(?P<allocation_status>[\w]+)',
 
         # Slot      Type                State                 Allocation(W)
         # 0         ASR1000-SIP40       ok                    64
         #  0/0      SPA-8X1GE-V2        inserted              14
         #  0/1      SPA-1X10GE-L-V2     inserted              17.40
-        p4 = re.compile(r'^\s*(?P<slot>[\w\/]+) +(?P<type>[\w-]+) '
-                        '+(?P<state>\w+(?:\, \w+)?) +(?P<allocation>[\d.]+)$')
+        p4=r'^\s*(?P<slot>[\w\/]+) +(?P<type>[\w-]+) '
+           '+(?P<state>\w+(?:\, \w+)?) +(?P<allocation>[\d.]+)$',
 
         # Slot      Type                State                 Capacity (W) Load (W)
         # P0        ASR1000X-AC-1100W   ok                    1100         132
-        p5 = re.compile(r'^\s*(?P<slot>[\w\/]+) +(?P<type>[\w\-]+) '
-                        '+(?P<state>\w+(?:\, \w+)?) +(?P<capacity>[\d.]+) +(?P<load>[\d.]+)')
+        p5=r'^\s*(?P<slot>[\w\/]+) +(?P<type>[\w\-]+) '
+           '+(?P<state>\w+(?:\, \w+)?) +(?P<capacity>[\d.]+) +(?P<load>[\d.]+)',
 
         # Total load: 696 W, total capacity: 4400 W. Load / Capacity is 15%
-        p6 = re.compile(r'^\s*Total +load\: +(?P<total_load>\d+) +W\, +total +capacity\: +(?P<total_capacity>\d+) +W\.'
-                        ' +Load +\/ +Capacity +is +(?P<load_capacity_percent>\d+)\%$')
+        p6=r'^\s*Total +load\: +(?P<total_load>\d+) +W\, +total +capacity\: +(?P<total_capacity>\d+) +W\.'
+           ' +Load +\/ +Capacity +is +(?P<load_capacity_percent>\d+)\%$',
 
         # Power capacity:       4400 W
-        p7 = re.compile(r'^\s*Power +capacity\: +(?P<power_capacity>\d+) +W$')
+        p7=r'^\s*Power +capacity\: +(?P<power_capacity>\d+) +W$',
 
         # Redundant allocation: 0 W
-        p8 = re.compile(r'^\s*Redundant +allocation\: +(?P<redundant_alc>\d+) +W$')
+        p8=r'^\s*Redundant +allocation\: +(?P<redundant_alc>\d+) +W$',
 
         # Fan allocation:       250 W
-        p9 = re.compile(r'^\s*Fan +allocation\: +(?P<fan_alc>\d+) +W$')
+        p9=r'^\s*Fan +allocation\: +(?P<fan_alc>\d+) +W$',
 
         # FRU allocation:       949 W
-        p10 = re.compile(r'^\s*FRU +allocation\: +(?P<fru_alc>\d+) +W$')
+        p10=r'^\s*FRU +allocation\: +(?P<fru_alc>\d+) +W$',
 
         # Excess Power in Reserve:   3201 W
-        p11 = re.compile(r'^\s*Excess +Power +in +Reserve\: +(?P<excess_power>\d+) +W$')
+        p11=r'^\s*Excess +Power +in +Reserve\: +(?P<excess_power>\d+) +W$',
 
         # Excess / (Capacity - Redundant) is 72%
-        p12 = re.compile(r'^\s*Excess +\/ +\(Capacity - Redundant\) +is +(?P<excess_capacity_percent>\d+)\%$')
+        p12=r'^\s*Excess +\/ +\(Capacity - Redundant\) +is +(?P<excess_capacity_percent>\d+)\%$',
+    )
+
+    def cli(self, output=None):
+
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        ret_dict = {}
+
+        p = ShowPlatformPower.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 ret_dict['chassis'] = m.groupdict()['chassis']
                 continue
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 ret_dict['redundancy_mode'] = m.groupdict()['redundancy_mode']
                 continue
 
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 ret_dict['allocation_status'] = m.groupdict()['allocation_status']
 
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 slot = m.groupdict()['slot']
                 t = m.groupdict()['type']
@@ -5171,7 +5247,7 @@ class ShowPlatformPower(ShowPlatformPowerSchema):
                 slot_dict.update({"allocation": allocation})
                 continue
 
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 slot = m.groupdict()['slot']
                 t = m.groupdict()['type']
@@ -5185,39 +5261,39 @@ class ShowPlatformPower(ShowPlatformPowerSchema):
                 slot_dict.update({"load": load})
                 continue
 
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 ret_dict['total_load'] = int(m.groupdict()['total_load'])
                 ret_dict['total_capacity'] = int(m.groupdict()['total_capacity'])
                 ret_dict['load_capacity_percent'] = int(m.groupdict()['load_capacity_percent'])
                 continue
 
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 ret_dict['power_capacity'] = int(m.groupdict()['power_capacity'])
                 continue
 
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 ret_dict['redundant_alc'] = int(m.groupdict()['redundant_alc'])
                 continue
 
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 ret_dict['fan_alc'] = int(m.groupdict()['fan_alc'])
                 continue
 
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 ret_dict['fru_alc'] = int(m.groupdict()['fru_alc'])
                 continue
 
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 ret_dict['excess_power'] = int(m.groupdict()['excess_power'])
                 continue
 
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 ret_dict['excess_capacity_percent'] = int(m.groupdict()['excess_capacity_percent'])
                 continue
@@ -5252,6 +5328,18 @@ class ShowPlatformHardwareQfpBqsStatisticsChannelAll(ShowPlatformHardwareQfpBqsS
 
     cli_command = 'show platform hardware qfp {status} bqs {slot} {iotype} statistics channel all'
 
+    patterns = Patterns(
+        # Chan   GoodPkts  GoodBytes    BadPkts   BadBytes
+        # 1 - 0000000000 0000000000 0000000000 0000000000
+        # 2 - 0000c40f64 016a5004b0 0000000000 0000000000
+        p1=r'^(?P<channel>\d+) +- +(?P<goodpkts>\w+) +(?P<goodbytes>\w+) +(?P<badpkts>\w+) +(?P<badbytes>\w+)$',
+
+        #  0-55: OPM Channels
+        # 56-59: Metapacket/Recycle Pools 0-3
+        #    60: Reassembled Packets Sent to QED
+        p2=r'^(?P<channel>\d+)-?(?P<end_channel>\d+)?: +(?P<comment>.+)$',
+    )
+
     def cli(self, status='active', slot='0', iotype='ipm', output=None):
 
         if output is None:
@@ -5264,19 +5352,11 @@ class ShowPlatformHardwareQfpBqsStatisticsChannelAll(ShowPlatformHardwareQfpBqsS
         # initial return dictionary
         ret_dict = {}
 
-        # Chan   GoodPkts  GoodBytes    BadPkts   BadBytes
-        # 1 - 0000000000 0000000000 0000000000 0000000000
-        # 2 - 0000c40f64 016a5004b0 0000000000 0000000000
-        p1 = re.compile(r'^(?P<channel>\d+) +- +(?P<goodpkts>\w+) +(?P<goodbytes>\w+) +(?P<badpkts>\w+) +(?P<badbytes>\w+)$')
-
-        #  0-55: OPM Channels
-        # 56-59: Metapacket/Recycle Pools 0-3
-        #    60: Reassembled Packets Sent to QED
-        p2 = re.compile(r'^(?P<channel>\d+)-?(?P<end_channel>\d+)?: +(?P<comment>.+)$')
+        p = ShowPlatformHardwareQfpBqsStatisticsChannelAll.patterns
 
         for line in out.splitlines():
             line = line.strip()
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 channel = int(group.pop('channel'))
@@ -5284,7 +5364,7 @@ class ShowPlatformHardwareQfpBqsStatisticsChannelAll(ShowPlatformHardwareQfpBqsS
                 chan_dict.update({k: v for k, v in group.items()})
                 continue
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 channel = int(group['channel'])
@@ -5490,6 +5570,21 @@ class ShowPlatformHardwareQfpInterfaceIfnameStatistics(ShowPlatformHardwareQfpIn
 
     cli_command = 'show platform hardware qfp {status} interface if-name {interface} statistics'
 
+    patterns = Patterns(
+        # Platform Handle 7
+        p1=r'^Platform +Handle +(?P<platform_handle>\d+)$',
+
+        # Receive Stats                             Packets        Octets
+        # Transmit Stats                            Packets        Octets
+        # Input Drop Stats                          Packets        Octets
+        # Output Drop Stats                         Packets        Octets
+        p2=r'^(?P<transmit_receive>[\w\s]+) +Stats +Packets +Octets$',
+
+        #   FragmentedIpv6                             0               0
+        #   Other
+        p3=r'^(?P<stats>[\w\d]+) +(?P<packets>[\w\d]+) +(?P<octets>[\w\d]+)$',
+    )
+
     def cli(self, status, interface, output=None):
 
         if output is None:
@@ -5503,23 +5598,12 @@ class ShowPlatformHardwareQfpInterfaceIfnameStatistics(ShowPlatformHardwareQfpIn
         current_stats = None
         final_dict = {}
 
-        # Platform Handle 7
-        p1 = re.compile(r'^Platform +Handle +(?P<platform_handle>\d+)$')
-
-        # Receive Stats                             Packets        Octets
-        # Transmit Stats                            Packets        Octets
-        # Input Drop Stats                          Packets        Octets
-        # Output Drop Stats                         Packets        Octets
-        p2 = re.compile(r'^(?P<transmit_receive>[\w\s]+) +Stats +Packets +Octets$')
-
-        #   FragmentedIpv6                             0               0
-        #   Other
-        p3 = re.compile(r'^(?P<stats>[\w\d]+) +(?P<packets>[\w\d]+) +(?P<octets>[\w\d]+)$')
+        p = ShowPlatformHardwareQfpInterfaceIfnameStatistics.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 converted_interface = Common.convert_intf_name(interface)
@@ -5528,7 +5612,7 @@ class ShowPlatformHardwareQfpInterfaceIfnameStatistics(ShowPlatformHardwareQfpIn
                 final_dict['platform_handle'] = int(group['platform_handle'])
                 continue
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 if not final_dict:
                     converted_interface = Common.convert_intf_name(interface)
@@ -5549,7 +5633,7 @@ class ShowPlatformHardwareQfpInterfaceIfnameStatistics(ShowPlatformHardwareQfpIn
                 final_dict.setdefault(current_stats, {})
                 continue
 
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 stats = group['stats']
@@ -5581,6 +5665,14 @@ class ShowPlatformHardwareQfpStatisticsDrop(ShowPlatformHardwareQfpStatisticsDro
 
     cli_command = 'show platform hardware qfp {status} statistics drop | exclude _0_'
 
+    patterns = Patterns(
+        # Global Drop Stats                         Packets                  Octets
+        # -------------------------------------------------------------------------
+        # Ipv4NoAdj                                       7                     296
+        # Ipv4NoRoute                                   181                    7964
+        p1=r'^(?P<global_drop_stats>\w+) +(?P<packets>\d+) +(?P<octets>\d+)$',
+    )
+
     def cli(self, status='active', output=None):
 
         if output is None:
@@ -5592,15 +5684,11 @@ class ShowPlatformHardwareQfpStatisticsDrop(ShowPlatformHardwareQfpStatisticsDro
         # initial return dictionary
         ret_dict = {}
 
-        # Global Drop Stats                         Packets                  Octets
-        # -------------------------------------------------------------------------
-        # Ipv4NoAdj                                       7                     296
-        # Ipv4NoRoute                                   181                    7964
-        p1 = re.compile(r'^(?P<global_drop_stats>\w+) +(?P<packets>\d+) +(?P<octets>\d+)$')
+        p = ShowPlatformHardwareQfpStatisticsDrop.patterns
 
         for line in out.splitlines():
             line = line.strip()
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 global_drop_stats = group.pop('global_drop_stats')
@@ -5642,26 +5730,30 @@ class ShowProcessesCpuHistory(ShowProcessesCpuHistorySchema):
     cli_command = 'show processes cpu history'
     exclude = ['maximum', 'average']
 
-    def cli(self, output=None):
-
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-
+    patterns = Patterns(
         #           888886666611111                    11111
         # 7777755555996510966664444466666333335555544444666667777777777
-        p1 = re.compile(r'^ *\d+( +\d+)* *$')
+        p1=r'^ *\d+( +\d+)* *$',
 
         #          0    5    0    5    0    5    0    5    0    5    0
-        p2 = re.compile(r'^ *0( +5 +0){5,6} *$')
+        p2=r'^ *0( +5 +0){5,6} *$',
 
         # 80     * **#*#**   * *       *
         # 70  *  * **#*#**   * *       *           *
-        p3 = re.compile(r'^ *(?P<num>[\d]+)(?P<line>.*#.*$)')
+        p3=r'^ *(?P<num>[\d]+)(?P<line>.*#.*$)',
 
         # CPU% per second (last 60 seconds)
-        p4 = re.compile(r'^ *CPU%.*$')
+        p4=r'^ *CPU%.*$',
+    )
+
+    def cli(self, output=None):
+
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        p = ShowProcessesCpuHistory.patterns
 
         # initialize max list & average list & return dictionary
         max_list = []
@@ -5670,13 +5762,13 @@ class ShowProcessesCpuHistory(ShowProcessesCpuHistorySchema):
 
         for line in out.splitlines():
             strip_line = line[6:]
-            m = p1.match(strip_line)
+            m = p.p1.match(strip_line)
             if m:
                 max_list.append(strip_line)
                 continue
 
-            m1 = p3.match(line)
-            m2 = p4.match(line)
+            m1 = p.p3.match(line)
+            m2 = p.p4.match(line)
             if m1 or m2:
                 average_list.append(line)
                 continue
@@ -5685,7 +5777,7 @@ class ShowProcessesCpuHistory(ShowProcessesCpuHistorySchema):
         tmp = [''] * 72
         count = 0
         for line in max_list:
-            m = p2.match(line)
+            m = p.p2.match(line)
             if not m:
                 for i, v in enumerate(line):
                     if v == ' ':
@@ -5713,7 +5805,7 @@ class ShowProcessesCpuHistory(ShowProcessesCpuHistorySchema):
         # parser average value
         count = 0
         for line in average_list:
-            m = p3.match(line)
+            m = p.p3.match(line)
             if count == 0:
                 sub_dict = ret_dict.setdefault('60s', {})
             elif count == 1:
@@ -5782,6 +5874,26 @@ class ShowProcessesMemory(ShowProcessesMemorySchema):
         'show processes memory | include {include}'
     ]
 
+    patterns = Patterns(
+        # Processor Pool Total: 10147887840 Used:  485435960 Free: 9662451880
+        p1=r'^Processor +Pool +Total: +(?P<total>\d+) +'
+           r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$',
+
+        # reserve P Pool Total:     102404 Used:         88 Free:     102316
+        p2=r'^reserve +P +Pool +Total: +(?P<total>\d+) +'
+           r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$',
+
+        # lsmpi_io Pool Total:    6295128 Used:    6294296 Free:        832
+        p3=r'^lsmpi_io +Pool +Total: +(?P<total>\d+) +'
+           r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$',
+
+        # 0   0  678985440  347855496  304892096        428    2134314 *Init*
+        # 1   0    3415536     879912    2565568          0          0 Chunk Manager
+        p4=r'^(?P<pid>\d+) +(?P<tty>\d+) +(?P<allocated>\d+) +'
+           r'(?P<freed>\d+) +(?P<holding>\d+) +(?P<getbufs>\d+) +'
+           r'(?P<retbufs>\d+) +(?P<process>[\S ]+)$',
+    )
+
     def cli(self, include=None, output=None):
 
         ret_dict = {}
@@ -5796,29 +5908,13 @@ class ShowProcessesMemory(ShowProcessesMemorySchema):
         else:
             out = output
 
-        # Processor Pool Total: 10147887840 Used:  485435960 Free: 9662451880
-        p1 = re.compile(r'^Processor +Pool +Total: +(?P<total>\d+) +'
-                        r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
-
-        # reserve P Pool Total:     102404 Used:         88 Free:     102316
-        p2 = re.compile(r'^reserve +P +Pool +Total: +(?P<total>\d+) +'
-                        r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
-
-        # lsmpi_io Pool Total:    6295128 Used:    6294296 Free:        832
-        p3 = re.compile(r'^lsmpi_io +Pool +Total: +(?P<total>\d+) +'
-                        r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
-
-        # 0   0  678985440  347855496  304892096        428    2134314 *Init*
-        # 1   0    3415536     879912    2565568          0          0 Chunk Manager
-        p4 = re.compile(r'^(?P<pid>\d+) +(?P<tty>\d+) +(?P<allocated>\d+) +'
-                        r'(?P<freed>\d+) +(?P<holding>\d+) +(?P<getbufs>\d+) +'
-                        r'(?P<retbufs>\d+) +(?P<process>[\S ]+)$')
+        p = ShowProcessesMemory.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # Processor Pool Total: 10147887840 Used:  485435960 Free: 9662451880
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 processor_pool_dict = ret_dict.setdefault('processor_pool', {})
@@ -5826,7 +5922,7 @@ class ShowProcessesMemory(ShowProcessesMemorySchema):
                 continue
 
             # reserve P Pool Total:     102404 Used:         88 Free:     102316
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 processor_pool_dict = ret_dict.setdefault('reserve_p_pool', {})
@@ -5834,7 +5930,7 @@ class ShowProcessesMemory(ShowProcessesMemorySchema):
                 continue
 
             # lsmpi_io Pool Total:    6295128 Used:    6294296 Free:        832
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 processor_pool_dict = ret_dict.setdefault('lsmi_io_pool', {})
@@ -5843,7 +5939,7 @@ class ShowProcessesMemory(ShowProcessesMemorySchema):
 
             # 0   0  678985440  347855496  304892096        428    2134314 *Init*
             # 1   0    3415536     879912    2565568          0          0 Chunk Manager
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 pid = int(group['pid'])
@@ -5876,7 +5972,17 @@ class ShowPlatformSoftwareMemoryCallsiteSchema(MetaParser):
 class ShowPlatformSoftwareMemoryCallsite(ShowPlatformSoftwareMemoryCallsiteSchema):
     """ Parser for show platform software memory <process> switch active <R0> alloc callsite brief """
 
-    cli_command = 'show platform software memory {process} switch active {slot} alloc callsite brief'
+    cli_command = 'show platform software memory {process} switch active {slot} alloc callsite brief'
+
+    patterns = Patterns(
+        # The current tracekey is   : 1#2315ece11e07bc883d89421df58e37b6
+        p1=r'The +current +tracekey +is\s*: +(?P<tracekey>[#\d\w]*)',
+
+        # callsite      thread    diff_byte               diff_call
+        # ----------------------------------------------------------
+        # 1617611779    31884     57424                   2
+        p2=r'(?P<callsite>(\d+))\s+(?P<thread>(\d+))\s+(?P<diffbyte>(\d+))\s+(?P<diffcall>(\d+))',
+    )
 
     def cli(self, process, slot, output=None):
 
@@ -5890,19 +5996,13 @@ class ShowPlatformSoftwareMemoryCallsite(ShowPlatformSoftwareMemoryCallsiteSchem
         if out:
             callsite_dict = parsed_dict.setdefault('callsites', {})
 
-        # The current tracekey is   : 1#2315ece11e07bc883d89421df58e37b6
-        p1 = re.compile(r'The +current +tracekey +is\s*: +(?P<tracekey>[#\d\w]*)')
-
-        # callsite      thread    diff_byte               diff_call
-        # ----------------------------------------------------------
-        # 1617611779    31884     57424                   2
-        p2 = re.compile(r'(?P<callsite>(\d+))\s+(?P<thread>(\d+))\s+(?P<diffbyte>(\d+))\s+(?P<diffcall>(\d+))')
+        p = ShowPlatformSoftwareMemoryCallsite.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # The current tracekey is   : 1#2315ece11e07bc883d89421df58e37b6
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 parsed_dict['tracekey'] = str(group['tracekey'])
@@ -5911,7 +6011,7 @@ class ShowPlatformSoftwareMemoryCallsite(ShowPlatformSoftwareMemoryCallsiteSchem
             # callsite      thread    diff_byte               diff_call
             # ----------------------------------------------------------
             # 1617611779    31884     57424                   2
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 callsite = int(group['callsite'])
@@ -5943,6 +6043,17 @@ class ShowPlatformSoftwareMemoryBacktrace(ShowPlatformSoftwareMemoryBacktraceSch
 
     cli_command = 'show platform software memory {process} switch active {slot} alloc backtrace'
 
+    patterns = Patterns(
+        # backtrace: 1#2315ece11e07bc883d89421df58e37b6   maroon:7F740DEDC000+61F6 tdllib:7F7474D05000+B2B46 ui:7F74770E4000+4639A ui:7F74770E4000+4718C cdlcore:7F7466A6B000+37C95 cdlcore:7F7466A6B000+37957 uipeer:7F747A7A8000+24F2A evutil:7F747864E000+7966 evutil:7F747864E000+7745
+        p1=r'backtrace: (?P<backtrace>[\w#\d\s:+]+)$',
+
+        #   callsite: 2150603778, thread_id: 31884
+        p2=r'callsite: +(?P<callsite>\d+), +thread_id: +(?P<thread_id>\d+)',
+
+        #   allocs: 1, frees: 0, call_diff: 1
+        p3=r'allocs: +(?P<allocs>(\d+)), +frees: +(?P<frees>(\d+)), +call_diff: +(?P<call_diff>(\d+))',
+    )
+
     def cli(self, process, slot, output=None):
         if output is None:
             out = self.device.execute(
@@ -5955,20 +6066,13 @@ class ShowPlatformSoftwareMemoryBacktrace(ShowPlatformSoftwareMemoryBacktraceSch
         if out:
             backtraces_dict = parsed_dict.setdefault('backtraces', {})
 
-        # backtrace: 1#2315ece11e07bc883d89421df58e37b6   maroon:7F740DEDC000+61F6 tdllib:7F7474D05000+B2B46 ui:7F74770E4000+4639A ui:7F74770E4000+4718C cdlcore:7F7466A6B000+37C95 cdlcore:7F7466A6B000+37957 uipeer:7F747A7A8000+24F2A evutil:7F747864E000+7966 evutil:7F747864E000+7745
-        p1 = re.compile(r'backtrace: (?P<backtrace>[\w#\d\s:+]+)$')
-
-        #   callsite: 2150603778, thread_id: 31884
-        p2 = re.compile(r'callsite: +(?P<callsite>\d+), +thread_id: +(?P<thread_id>\d+)')
-
-        #   allocs: 1, frees: 0, call_diff: 1
-        p3 = re.compile(r'allocs: +(?P<allocs>(\d+)), +frees: +(?P<frees>(\d+)), +call_diff: +(?P<call_diff>(\d+))')
+        p = ShowPlatformSoftwareMemoryBacktrace.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # backtrace: 1#2315ece11e07bc883d89421df58e37b6   maroon:7F740DEDC000+61F6 tdllib:7F7474D05000+B2B46 ui:7F74770E4000+4639A ui:7F74770E4000+4718C cdlcore:7F7466A6B000+37C95 cdlcore:7F7466A6B000+37957 uipeer:7F747A7A8000+24F2A evutil:7F747864E000+7966 evutil:7F747864E000+7745
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 backtrace = str(group['backtrace'])
@@ -5976,7 +6080,7 @@ class ShowPlatformSoftwareMemoryBacktrace(ShowPlatformSoftwareMemoryBacktraceSch
                 continue
 
             #   callsite: 2150603778, thread_id: 31884
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 one_backtrace_dict['callsite'] = int(group['callsite'])
@@ -5984,7 +6088,7 @@ class ShowPlatformSoftwareMemoryBacktrace(ShowPlatformSoftwareMemoryBacktraceSch
                 continue
 
             #   allocs: 1, frees: 0, call_diff: 1
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 one_backtrace_dict['allocs'] = int(group['allocs'])
@@ -6042,6 +6146,26 @@ class ShowProcessesMemorySortedSchema(MetaParser):
 class ShowProcessesMemorySorted(ShowProcessesMemorySortedSchema):
     cli_command = 'show processes memory sorted'
 
+    patterns = Patterns(
+        # Processor Pool Total: 10147887840 Used:  485435960 Free: 9662451880
+        p1=r'^Processor +Pool +Total: +(?P<total>\d+) +'
+           r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$',
+
+        # reserve P Pool Total:     102404 Used:         88 Free:     102316
+        p2=r'^reserve +P +Pool +Total: +(?P<total>\d+) +'
+           r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$',
+
+        # lsmpi_io Pool Total:    6295128 Used:    6294296 Free:        832
+        p3=r'^lsmpi_io +Pool +Total: +(?P<total>\d+) +'
+           r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$',
+
+        # 0   0  678985440  347855496  304892096        428    2134314 *Init*
+        # 1   0    3415536     879912    2565568          0          0 Chunk Manager
+        p4=r'^(?P<pid>\d+) +(?P<tty>\d+) +(?P<allocated>\d+) +'
+           r'(?P<freed>\d+) +(?P<holding>\d+) +(?P<getbufs>\d+) +'
+           r'(?P<retbufs>\d+) +(?P<process>[\S ]+)$',
+    )
+
     def cli(self, include=None, sorted=None, output=None):
 
         ret_dict = {}
@@ -6055,28 +6179,12 @@ class ShowProcessesMemorySorted(ShowProcessesMemorySortedSchema):
         if out:
             per_process_memory_dict = ret_dict.setdefault('per_process_memory', OrderedDict())
 
-        # Processor Pool Total: 10147887840 Used:  485435960 Free: 9662451880
-        p1 = re.compile(r'^Processor +Pool +Total: +(?P<total>\d+) +'
-                        r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
-
-        # reserve P Pool Total:     102404 Used:         88 Free:     102316
-        p2 = re.compile(r'^reserve +P +Pool +Total: +(?P<total>\d+) +'
-                        r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
-
-        # lsmpi_io Pool Total:    6295128 Used:    6294296 Free:        832
-        p3 = re.compile(r'^lsmpi_io +Pool +Total: +(?P<total>\d+) +'
-                        r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
-
-        # 0   0  678985440  347855496  304892096        428    2134314 *Init*
-        # 1   0    3415536     879912    2565568          0          0 Chunk Manager
-        p4 = re.compile(r'^(?P<pid>\d+) +(?P<tty>\d+) +(?P<allocated>\d+) +'
-                        r'(?P<freed>\d+) +(?P<holding>\d+) +(?P<getbufs>\d+) +'
-                        r'(?P<retbufs>\d+) +(?P<process>[\S ]+)$')
+        p = ShowProcessesMemorySorted.patterns
 
         for line in out.splitlines():
             line = line.strip()
             # Processor Pool Total: 10147887840 Used:  485435960 Free: 9662451880
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 processor_pool_dict = ret_dict.setdefault('processor_pool', {})
@@ -6084,7 +6192,7 @@ class ShowProcessesMemorySorted(ShowProcessesMemorySortedSchema):
                 continue
 
             # reserve P Pool Total:     102404 Used:         88 Free:     102316
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 processor_pool_dict = ret_dict.setdefault('reserve_p_pool', {})
@@ -6092,7 +6200,7 @@ class ShowProcessesMemorySorted(ShowProcessesMemorySortedSchema):
                 continue
 
             # lsmpi_io Pool Total:    6295128 Used:    6294296 Free:        832
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 processor_pool_dict = ret_dict.setdefault('lsmi_io_pool', {})
@@ -6101,7 +6209,7 @@ class ShowProcessesMemorySorted(ShowProcessesMemorySortedSchema):
 
             # 0   0  678985440  347855496  304892096        428    2134314 *Init*
             # 1   0    3415536     879912    2565568          0          0 Chunk Manager
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 process_name = str(group['process'])
@@ -6142,52 +6250,56 @@ class ShowPlatformIntegrity(ShowPlatformIntegritySchema):
     # cli_command = 'show platform integrity'
     cli_command = ['show platform integrity', 'show platform integrity sign nonce {nonce}']
 
-    def cli(self, nonce=None, output=None):
-        if not output:
-            if nonce:
-                output = self.device.execute(self.cli_command[1].format(nonce=nonce))
-            else:
-                output = self.device.execute(self.cli_command[0])
-
-        ret_dict = {}
-
+    patterns = Patterns(
         # Platform: C9300-24U
-        p1 = re.compile(r'^Platform: +(?P<platform>\S+)$')
+        p1=r'^Platform: +(?P<platform>\S+)$',
         # Boot 0 Version: F01144R16.216e68ad62019-02-13
-        p2 = re.compile(r'^Boot +(?P<boot>\d+) +Version: +(?P<version>\S+)$')
+        p2=r'^Boot +(?P<boot>\d+) +Version: +(?P<version>\S+)$',
         # Boot 0 Hash: 523DD459C650AF0F5AB5396060605E412C1BE99AF51F4FA88AD26049612921FF
-        p3 = re.compile(r'^Boot +(?P<boot>\d+) +Hash: +(?P<hash>\S+)$')
+        p3=r'^Boot +(?P<boot>\d+) +Hash: +(?P<hash>\S+)$',
         # Boot Loader Version: System Bootstrap, Version 16.10.1r[FC2], DEVELOPMENT SOFTWARE
-        p4 = re.compile(r'^Boot +Loader +Version: +(?P<boot_loader_version>[\S ]+)$')
+        p4=r'^Boot +Loader +Version: +(?P<boot_loader_version>[\S ]+)$',
         # Boot Loader Hash: 523DD459C650AF0F5AB5396060605E412C1BE99AF51F4FA88AD26049612921FF
-        p5 = re.compile(r'^Boot +Loader +Hash: *(?P<hash>\S+)$')
+        p5=r'^Boot +Loader +Hash: *(?P<hash>\S+)$',
         # 51CE6FB9AE606330810EBFFE99D71D56640FD48F780EDE0C19FB5A75E31EF2192A58A196D18B244ADF67D18BF6B3AA6A16229C66DCC03D8A900753760B252C57
-        p6 = re.compile(r'^(?P<hash>\S+)$')
+        p6=r'^(?P<hash>\S+)$',
         # OS Version: 2019-07-11_16.25_mzafar
-        p7 = re.compile(r'^OS +Version: +(?P<os_version>\S+)$')
+        p7=r'^OS +Version: +(?P<os_version>\S+)$',
         # OS Hashes:
-        p8 = re.compile(r'^OS +Hashes:$')
+        p8=r'^OS +Hashes:$',
         # PCR0: BB33E3FE338B82635B1BD3F1401CF442ACC9BB12A405A424FBE0A5776569884E
-        p9 = re.compile(r'^(?P<hash_key>\S+): +(?P<hash_val>\S+)$')
+        p9=r'^(?P<hash_key>\S+): +(?P<hash_val>\S+)$',
         # cat9k_iosxe.2019-07-11_16.25_mzafar.SSA.bin:
-        p10 = re.compile(r'^(?P<os_hash>\S+):$')
+        p10=r'^(?P<os_hash>\S+):$',
         # Signature version: 1
-        p11 = re.compile(r'^Signature version: +(?P<signature_version>\S+)$')
+        p11=r'^Signature version: +(?P<signature_version>\S+)$',
         # Signature:
-        p12 = re.compile(r'^Signature:$')
+        p12=r'^Signature:$',
+    )
+
+    def cli(self, nonce=None, output=None):
+        if not output:
+            if nonce:
+                output = self.device.execute(self.cli_command[1].format(nonce=nonce))
+            else:
+                output = self.device.execute(self.cli_command[0])
+
+        ret_dict = {}
+
+        p = ShowPlatformIntegrity.patterns
 
         for line in output.splitlines():
             line = line.strip()
 
             # Platform: C9300-24U
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict.update({'platform': group['platform']})
                 continue
 
             # Boot 0 Version: F01144R16.216e68ad62019-02-13
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 boot = int(group['boot'])
@@ -6198,7 +6310,7 @@ class ShowPlatformIntegrity(ShowPlatformIntegritySchema):
                 continue
 
             # Boot 0 Hash: 523DD459C650AF0F5AB5396060605E412C1BE99AF51F4FA88AD26049612921FF
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 boot = int(group['boot'])
@@ -6209,7 +6321,7 @@ class ShowPlatformIntegrity(ShowPlatformIntegritySchema):
                 continue
 
             # Boot Loader Version: System Bootstrap, Version 16.10.1r[FC2], DEVELOPMENT SOFTWARE
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 boot_loader_dict = ret_dict.setdefault('boot', {}). \
@@ -6219,7 +6331,7 @@ class ShowPlatformIntegrity(ShowPlatformIntegritySchema):
                 continue
 
             # Boot Loader Hash: 523DD459C650AF0F5AB5396060605E412C1BE99AF51F4FA88AD26049612921FF
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 hash_val = group['hash']
@@ -6232,7 +6344,7 @@ class ShowPlatformIntegrity(ShowPlatformIntegritySchema):
                 continue
 
             # OS Version: 2019-07-11_16.25_mzafar
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 group = m.groupdict()
                 os_version = group['os_version']
@@ -6240,19 +6352,19 @@ class ShowPlatformIntegrity(ShowPlatformIntegritySchema):
                 continue
 
             # OS Hashes:
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 hash_type = 'os_hashes'
                 continue
 
             # Signature:
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 hash_type = 'signature'
                 continue
 
             # PCR0: BB33E3FE338B82635B1BD3F1401CF442ACC9BB12A405A424FBE0A5776569884E
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 group = m.groupdict()
                 hash_type = 'os_hashes'
@@ -6264,7 +6376,7 @@ class ShowPlatformIntegrity(ShowPlatformIntegritySchema):
                 continue
 
             # cat9k_iosxe.2019-07-11_16.25_mzafar.SSA.bin:
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 hash_type = 'os_hashes'
                 group = m.groupdict()
@@ -6274,14 +6386,14 @@ class ShowPlatformIntegrity(ShowPlatformIntegritySchema):
                 continue
 
             # Signature version: 1
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict.update({'signature_version': int(group['signature_version'])})
                 continue
 
             # 51CE6FB9AE606330810EBFFE99D71D56640FD48F780EDE0C19FB5A75E31EF2192A58A196D18B244ADF67D18BF6B3AA6A16229C66DCC03D8A900753760B252C57
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 hash_val = group['hash']
@@ -6432,56 +6544,60 @@ class ShowPlatformHardwareQfpActiveFeatureAppqoe(ShowPlatformHardwareQfpActiveFe
 
     cli_command = ['show platform hardware qfp active feature appqoe stats all']
 
-    def cli(self, output=None):
-
-        # if the user does not provide output to the parser
-        # we need to get it from the device
-        if not output:
-            output = self.device.execute(self.cli_command[0])
-
+    patterns = Patterns(
         # APPQOE Feature Statistics:
-        p1 = re.compile(r'^(?P<feature>\w+) +Feature +Statistics:$')
+        p1=r'^(?P<feature>\w+) +Feature +Statistics:$',
 
         # Global:
-        p2 = re.compile(r'^Global:$')
+        p2=r'^Global:$',
 
         # SDVT Global stats:
-        p3 = re.compile(r'^SDVT +Global +stats:$')
+        p3=r'^SDVT +Global +stats:$',
 
         # SN Index [0 (Green)]
         # SN Index [Default]
-        p4 = re.compile(r'^SN +Index +\[(?P<index>[\s\S]+)\]$')
+        p4=r'^SN +Index +\[(?P<index>[\s\S]+)\]$',
 
         # SDVT Count stats:
         # SDVT Packet stats:
         # SDVT Drop Cause stats:
         # SDVT Errors stats:
-        p5 = re.compile(r'^(?P<sdvt_stats_type>SDVT +[\s\S]+ +stats):$')
+        p5=r'^(?P<sdvt_stats_type>SDVT +[\s\S]+ +stats):$',
 
         # decaps: Processed control messages from SN: 14200
         # decaps: delete requests received total: 14200
         # decaps: delete - protocol decision: 14200
-        p6 = re.compile(r'^decaps: +(?P<decap_type>[\s\S]+): +(?P<value>\d+)$')
+        p6=r'^decaps: +(?P<decap_type>[\s\S]+): +(?P<value>\d+)$',
 
         # Divert packets/bytes: 743013/43313261
         # Reinject packets/bytes: 679010/503129551
-        p7 = re.compile(r'^(?P<type>Divert|Reinject) +packets\/bytes: +(?P<packets>\d+)\/(?P<bytes>\d+)$')
+        p7=r'^(?P<type>Divert|Reinject) +packets\/bytes: +(?P<packets>\d+)\/(?P<bytes>\d+)$',
 
         # ip-non-tcp-pkts: 0
         # not-enabled: 0
         # cft_handle_pkt:  0
         # sdvt_divert_req_fail:  0
         # syn_policer_rate: 800
-        p8 = re.compile(r'^(?P<key>[\s\S]+): +(?P<value>\d+)$')
+        p8=r'^(?P<key>[\s\S]+): +(?P<value>\d+)$',
 
         # SN Index [0 (Green)], IP: 10.136.1.250, oce_id: 1243618816
-        p9 = re.compile(r'^SN +Index +\[(?P<index>[\s\S]+)\], +IP: +(?P<ip>[\s\S]+), +oce_id: +(?P<oce_id>[\s\S]+)$')
+        p9=r'^SN +Index +\[(?P<index>[\s\S]+)\], +IP: +(?P<ip>[\s\S]+), +oce_id: +(?P<oce_id>[\s\S]+)$',
 
         # del 0, key 0x0301, id 1, ver 1, status 1, type 3, sng 0
-        p10 = re.compile(r'^del +(?P<del>[\s\S]+), key +(?P<key>[\s\S]+), id +(?P<id>[\s\S]+), ver +(?P<ver>[\s\S]+), status +(?P<status>[\s\S]+), type +(?P<type>[\s\S]+), sng +(?P<sng>[\s\S]+)$')
+        p10=r'^del +(?P<del>[\s\S]+), key +(?P<key>[\s\S]+), id +(?P<id>[\s\S]+), ver +(?P<ver>[\s\S]+), status +(?P<status>[\s\S]+), type +(?P<type>[\s\S]+), sng +(?P<sng>[\s\S]+)$',
 
         # APPNAV STATS: toSN 2662751642/2206742552009, fromSN 2715505607/2260448392656
-        p11 = re.compile(r'^APPNAV STATS: +(?P<to_sn>[\S]+) +(?P<tosn_packets>[\d]+)\/(?P<tosn_bytes>\d+), +(?P<from_sn>[\S]+) +(?P<frmsn_packets>[\d]+)\/(?P<frmsn_bytes>\d+)$')
+        p11=r'^APPNAV STATS: +(?P<to_sn>[\S]+) +(?P<tosn_packets>[\d]+)\/(?P<tosn_bytes>\d+), +(?P<from_sn>[\S]+) +(?P<frmsn_packets>[\d]+)\/(?P<frmsn_bytes>\d+)$',
+    )
+
+    def cli(self, output=None):
+
+        # if the user does not provide output to the parser
+        # we need to get it from the device
+        if not output:
+            output = self.device.execute(self.cli_command[0])
+
+        p = ShowPlatformHardwareQfpActiveFeatureAppqoe.patterns
 
         ret_dict = {}
 
@@ -6489,7 +6605,7 @@ class ShowPlatformHardwareQfpActiveFeatureAppqoe(ShowPlatformHardwareQfpActiveFe
             line = line.strip()
 
             # APPQOE Feature Statistics:
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 groups = m.groupdict()
                 feature_name = groups['feature'].lower()
@@ -6507,7 +6623,7 @@ class ShowPlatformHardwareQfpActiveFeatureAppqoe(ShowPlatformHardwareQfpActiveFe
                 continue
 
             # Global:
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 global_dict = feature_dict.setdefault('global', {})
 
@@ -6515,7 +6631,7 @@ class ShowPlatformHardwareQfpActiveFeatureAppqoe(ShowPlatformHardwareQfpActiveFe
                 continue
 
             # SDVT Global stats:
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 sdvt_global_dict = global_dict.setdefault('sdvt_global_stats', {})
 
@@ -6524,7 +6640,7 @@ class ShowPlatformHardwareQfpActiveFeatureAppqoe(ShowPlatformHardwareQfpActiveFe
 
             # SN Index [0 (Green)]
             # SN Index [Default]
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 groups = m.groupdict()
                 index_dict = feature_dict.setdefault('sn_index', {}).setdefault(groups['index'], {})
@@ -6533,7 +6649,7 @@ class ShowPlatformHardwareQfpActiveFeatureAppqoe(ShowPlatformHardwareQfpActiveFe
                 continue
 
             # SN Index [0 (Green)], IP: 10.136.1.250, oce_id: 1243618816
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 groups = m.groupdict()
                 index_dict = feature_dict.setdefault('sn_index', {}).setdefault(groups['index'], {})
@@ -6544,7 +6660,7 @@ class ShowPlatformHardwareQfpActiveFeatureAppqoe(ShowPlatformHardwareQfpActiveFe
                 continue
 
             # del 0, key 0x0301, id 1, ver 1, status 1, type 3, sng 0
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 groups = m.groupdict()
                 index_dict.update({'del': int(groups['del'])})
@@ -6559,7 +6675,7 @@ class ShowPlatformHardwareQfpActiveFeatureAppqoe(ShowPlatformHardwareQfpActiveFe
                 continue
 
             # APPNAV STATS: toSN 2662751642/2206742552009, fromSN 2715505607/2260448392656
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 groups = m.groupdict()
                 appnav_stats_dict = index_dict.setdefault('appnav_stats', {})
@@ -6581,7 +6697,7 @@ class ShowPlatformHardwareQfpActiveFeatureAppqoe(ShowPlatformHardwareQfpActiveFe
             # SDVT Packet stats
             # SDVT Drop Cause stats
             # SDVT Errors stats
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 groups = m.groupdict()
                 sdvt_stats_type = groups['sdvt_stats_type'].replace(' ', '_').lower()
@@ -6593,7 +6709,7 @@ class ShowPlatformHardwareQfpActiveFeatureAppqoe(ShowPlatformHardwareQfpActiveFe
             # decaps: Processed control messages from SN: 14200
             # decaps: delete requests received total: 14200
             # decaps: delete - protocol decision: 14200
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 groups = m.groupdict()
                 decap_messages_dict = sdvt_stats_type_dict.setdefault('decap_messages', {})
@@ -6612,7 +6728,7 @@ class ShowPlatformHardwareQfpActiveFeatureAppqoe(ShowPlatformHardwareQfpActiveFe
 
             # Divert packets/bytes: 743013/43313261
             # Reinject packets/bytes: 679010/503129551
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 groups = m.groupdict()
 
@@ -6634,7 +6750,7 @@ class ShowPlatformHardwareQfpActiveFeatureAppqoe(ShowPlatformHardwareQfpActiveFe
             # cft_handle_pkt:  0
             # sdvt_divert_req_fail:  0
             # syn_policer_rate: 800
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 groups = m.groupdict()
                 key = groups['key'].replace('-', '_').replace(' ', '_').replace(':', '').lower()
@@ -6677,18 +6793,10 @@ class ShowPlatformTcamUtilization(ShowPlatformTcamUtilizationSchema):
 
     cli_command = 'show platform hardware fed switch active fwd-asic resource tcam utilization'
 
-    def cli(self, output=None):
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-
-        # initial return dictionary
-        ret_dict = {}
-
+    patterns = Patterns(
         # initial regexp pattern
         # CAM Utilization for ASIC  [0]
-        p1 = re.compile(r'CAM +Utilization +for +ASIC  +\[+(?P<asic>(\d+))\]$')
+        p1=r'CAM +Utilization +for +ASIC  +\[+(?P<asic>(\d+))\]$',
 
         #CTS Cell Matrix/VPN
         #Label                  EM           O       16384        0    0.00%        0        0        0        0
@@ -6696,14 +6804,25 @@ class ShowPlatformTcamUtilization(ShowPlatformTcamUtilizationSchema):
         #Label                  TCAM         O        1024        1    0.10%        0        0        0        1
         # Mac Address Table      EM           I       16384       44    0.27%        0        0        0       44
         # Mac Address Table      TCAM         I        1024       21    2.05%        0        0        0       21
-        p2 = re.compile(r'(?P<table>.*(\S+)) +(?P<subtype>\S+) +(?P<dir>\S+) +(?P<max>\d+) +(?P<used>\d+) +(?P<used_percent>\S+\%) +(?P<v4>\d+) +(?P<v6>\d+) +(?P<mpls>\d+) +(?P<other>\d+)$')
+        p2=r'(?P<table>.*(\S+)) +(?P<subtype>\S+) +(?P<dir>\S+) +(?P<max>\d+) +(?P<used>\d+) +(?P<used_percent>\S+\%) +(?P<v4>\d+) +(?P<v6>\d+) +(?P<mpls>\d+) +(?P<other>\d+)$',
+    )
 
+    def cli(self, output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        # initial return dictionary
+        ret_dict = {}
+
+        p = ShowPlatformTcamUtilization.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # CAM Utilization for ASIC  [0]
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 asic = group['asic']
@@ -6716,7 +6835,7 @@ class ShowPlatformTcamUtilization(ShowPlatformTcamUtilizationSchema):
             #Label                  TCAM         O        1024        1    0.10%        0        0        0        1
             # Mac Address Table      EM           I       16384       44    0.27%        0        0        0       44
             # Mac Address Table      TCAM         I        1024       21    2.05%        0        0        0       21
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 table_ = group.pop('table')
@@ -6771,6 +6890,15 @@ class ShowPlatformHardwareQfpActiveDatapathUtilSum(ShowPlatformHardwareQfpActive
 
     cli_command = ['show platform hardware qfp active datapath utilization summary']
 
+    patterns = Patterns(
+        #CPP 0:                     5 secs        1 min        5 min       60 min
+        p1=r'^CPP (?P<cpp_num>\d)\: +(\d\s\S+) +(\d\s\S+) +(\d\s\S+) +(\d+\s\S+)$',
+        #Input:     Total (pps)            2            2            1            0
+        p2=r'^(?P<dir>\w+)\: +\S+ \((?P<type>\S+)\) +(?P<value5s>\d+) +(?P<value1m>\d+) +(?P<value5m>\d+) +(?P<value60m>\d+)$',
+        #(bps)         2928         1856         1056           88
+        p3=r'^\((?P<type>bps)\) +(?P<value5s>\d+) +(?P<value1m>\d+) +(?P<value5m>\d+) +(?P<value60m>\d+)$',
+    )
+
     def cli(self, output=None):
 
         # if the user does not provide output to the parser
@@ -6779,17 +6907,12 @@ class ShowPlatformHardwareQfpActiveDatapathUtilSum(ShowPlatformHardwareQfpActive
             output = self.device.execute(self.cli_command[0])
 
 
-        #CPP 0:                     5 secs        1 min        5 min       60 min
-        p1 = re.compile(r'^CPP (?P<cpp_num>\d)\: +(\d\s\S+) +(\d\s\S+) +(\d\s\S+) +(\d+\s\S+)$')
-        #Input:     Total (pps)            2            2            1            0
-        p2 = re.compile(r'^(?P<dir>\w+)\: +\S+ \((?P<type>\S+)\) +(?P<value5s>\d+) +(?P<value1m>\d+) +(?P<value5m>\d+) +(?P<value60m>\d+)$')
-        #(bps)         2928         1856         1056           88
-        p3 = re.compile(r'^\((?P<type>bps)\) +(?P<value5s>\d+) +(?P<value1m>\d+) +(?P<value5m>\d+) +(?P<value60m>\d+)$')
+        p = ShowPlatformHardwareQfpActiveDatapathUtilSum.patterns
         ret_dict = {}
         for line in output.splitlines():
             line = line.strip()
             #   CPP 0:                     5 secs        1 min        5 min       60 min
-            m = p1.match(line)
+            m = p.p1.match(line)
 
             if m:
                 groups = m.groupdict()
@@ -6800,7 +6923,7 @@ class ShowPlatformHardwareQfpActiveDatapathUtilSum(ShowPlatformHardwareQfpActive
 
             #Input:     Total (pps)            2            2            1            0
             #Processing: Load (pct)            0            0            0            0
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 groups = m.groupdict()
                 dir_dict = feature_dict.setdefault(groups['dir'], {})
@@ -6814,7 +6937,7 @@ class ShowPlatformHardwareQfpActiveDatapathUtilSum(ShowPlatformHardwareQfpActive
 
 
             #(bps)         2928         1856         1056           88
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 groups = m.groupdict()
                 type_dict = dir_dict.setdefault(groups['type'], {})
@@ -6860,34 +6983,37 @@ class ShowPlatformHardwareQfpActiveTcamResourceManagerUsage(ShowPlatformHardware
     cli_command = ['show platform hardware qfp active tcam resource-manager usage']
 
 
-    def cli(self, output=None):
-
-        # if the user does not provide output to the parser
-        # we need to get it from the device
-        if not output:
-            output = self.device.execute(self.cli_command[0])
-
+    patterns = Patterns(
         #QFP TCAM Usage Information
-        p1 = re.compile(r'^(?P<key>QFP TCAM Usage Information)$')
+        p1=r'^(?P<key>QFP TCAM Usage Information)$',
 
         #80 Bit Region Information
         #Total TCAM Cell Usage Information
-        p2 = re.compile(r'^(?P<num>\d+|Total TCAM)(?P<region>[\s\S]+)$')
+        p2=r'^(?P<num>\d+|Total TCAM)(?P<region>[\s\S]+)$',
 
         # Name                                : Leaf Region #1
         # Number of cells per entry           : 2
         # Current 160 bits entries used       : 19
         # Current used cell entries           : 38
         # Current free cell entries           : 4058
-        p3 = re.compile(r'^(?P<key>[\s\S]+)\:(?P<value>[\s\S]+\S)$')
+        p3=r'^(?P<key>[\s\S]+)\:(?P<value>[\s\S]+\S)$',
+    )
+
+    def cli(self, output=None):
+
+        # if the user does not provide output to the parser
+        # we need to get it from the device
+        if not output:
+            output = self.device.execute(self.cli_command[0])
 
+        p = ShowPlatformHardwareQfpActiveTcamResourceManagerUsage.patterns
 
         ret_dict = {}
         for line in output.splitlines():
             line = line.strip()
 
             #QFP TCAM Usage Information
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 groups = m.groupdict()
                 key1 = groups['key'].replace(' ','_').lower()
@@ -6896,7 +7022,7 @@ class ShowPlatformHardwareQfpActiveTcamResourceManagerUsage(ShowPlatformHardware
 
             #80 Bit Region Information
             #Total TCAM Cell Usage Information
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 groups = m.groupdict()
                 reg = groups['region'].strip().replace(' ','_').lower()
@@ -6909,7 +7035,7 @@ class ShowPlatformHardwareQfpActiveTcamResourceManagerUsage(ShowPlatformHardware
             # Current 160 bits entries used       : 19
             # Current used cell entries           : 38
             # Current free cell entries           : 4058
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 groups = m.groupdict()
                 name = groups['key'].strip().replace(' ','_').lower()
@@ -7066,37 +7192,40 @@ class ShowPlatformResources(ShowPlatformResourcesSchema):
     cli_command = ['show platform resources']
 
 
-    def cli(self, output=None):
-
-        # if the user does not provide output to the parser
-        # we need to get it from the device
-        if not output:
-            output = self.device.execute(self.cli_command[0])
-
-
+    patterns = Patterns(
         #RP0 (ok, active)                                                                               H
         #RP1 (ok, standby)                                                                               H
         #ESP0(ok, active)                                                                               H
         #ESP1(ok, standby)                                                                               H
-        p1 = re.compile(r'^(?P<type>RP|ESP)(?P<key>[0-9]) ?\((?P<status>\S+)\, +(?P<role>\S+)\) +(?P<state>\S)$')
+        p1=r'^(?P<type>RP|ESP)(?P<key>[0-9]) ?\((?P<status>\S+)\, +(?P<role>\S+)\) +(?P<state>\S)$',
 
         #SIP0                                                                                           H
-        p2 = re.compile(r'^SIP(?P<key>[0-9]) +(?P<state>\S)$')
+        p2=r'^SIP(?P<key>[0-9]) +(?P<state>\S)$',
 
         # Control Processor       0.51%                 100%            80%             90%             H
-        p3 = re.compile(r'^Control Processor +(?P<usage>(\d*\.?\d+))\S+ +(?P<max>\d+)\S+ +(?P<warning>\d+)\S+ +(?P<critical>\d+)\S+ +(?P<state>\S)$')
+        p3=r'^Control Processor +(?P<usage>(\d*\.?\d+))\S+ +(?P<max>\d+)\S+ +(?P<warning>\d+)\S+ +(?P<critical>\d+)\S+ +(?P<state>\S)$',
 
         #QFP                                                                                           H
-        p4 = re.compile(r'^QFP +(?P<state>\S)$')
+        p4=r'^QFP +(?P<state>\S)$',
 
         #CPU Utilization        0.00%                 100%            90%             95%             H
-        p5 = re.compile(r'^(?P<resource>[\S\s]+\S) +(?P<usage>(\d*\.?\d+))\S+ +(?P<max>\d+)\S+ +(?P<warning>\d+)\S+ +(?P<critical>\d+)\S+ +(?P<state>\S)$')
+        p5=r'^(?P<resource>[\S\s]+\S) +(?P<usage>(\d*\.?\d+))\S+ +(?P<max>\d+)\S+ +(?P<warning>\d+)\S+ +(?P<critical>\d+)\S+ +(?P<state>\S)$',
 
         # TCAM                   16cells(0%)           1048576cells    65%             85%             H
         # DRAM                   238906KB(5%)          4194304KB       85%             95%             H
         # IRAM                   13014KB(9%)           131072KB        85%             95%             H
-        p6 = re.compile(r'^(?P<resource>[\s\S]+\S) +(?P<use_val>(\d*\.?\d+))(?P<type>\S+)\((?P<val>\d+)\%\) +(?P<max>\d+)(?P<max_type>\S+) +(?P<warning>\d+)\S+ +(?P<critical>\d+)\S+ +(?P<state>\S)$')
+        p6=r'^(?P<resource>[\s\S]+\S) +(?P<use_val>(\d*\.?\d+))(?P<type>\S+)\((?P<val>\d+)\%\) +(?P<max>\d+)(?P<max_type>\S+) +(?P<warning>\d+)\S+ +(?P<critical>\d+)\S+ +(?P<state>\S)$',
+    )
+
+    def cli(self, output=None):
 
+        # if the user does not provide output to the parser
+        # we need to get it from the device
+        if not output:
+            output = self.device.execute(self.cli_command[0])
+
+
+        p = ShowPlatformResources.patterns
 
         ret_dict = {}
         for line in output.splitlines():
@@ -7104,7 +7233,7 @@ class ShowPlatformResources(ShowPlatformResourcesSchema):
 
             #RP1 (ok, standby)                                                                               H
             #ESP0 (ok, active)                                                                               H
-            m = p1.match(line)
+            m = p.p1.match(line)
 
             if m:
                 groups = m.groupdict()
@@ -7119,7 +7248,7 @@ class ShowPlatformResources(ShowPlatformResourcesSchema):
                 continue
 
             #SIP0                                                                                           H
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 groups = m.groupdict()
                 feature_dict = ret_dict.setdefault('sip', {}).setdefault(groups['key'], {})
@@ -7128,7 +7257,7 @@ class ShowPlatformResources(ShowPlatformResourcesSchema):
                 continue
 
             # Control Processor       0.51%                 100%            80%             90%             H
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 groups = m.groupdict()
                 feature_dict = feature_dict.setdefault('control_processer', {})
@@ -7141,7 +7270,7 @@ class ShowPlatformResources(ShowPlatformResourcesSchema):
                 continue
 
             #QFP                                                                                           H
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 groups = m.groupdict()
                 feature_dict = last_dict_ptr1
@@ -7151,7 +7280,7 @@ class ShowPlatformResources(ShowPlatformResourcesSchema):
                 continue
 
             #CPU Utilization        0.00%                 100%            90%             95%             H
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 groups = m.groupdict()
                 feature_dict = last_dict_ptr
@@ -7168,7 +7297,7 @@ class ShowPlatformResources(ShowPlatformResourcesSchema):
             #TCAM                   16cells(0%)           1048576cells    65%             85%             H
             # DRAM                   238906KB(5%)          4194304KB       85%             95%             H
             # IRAM                   13014KB(9%)           131072KB        85%             95%             H
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 groups = m.groupdict()
                 feature_dict = last_dict_ptr
@@ -7199,23 +7328,27 @@ class ShowPlatformSoftwareYangManagementProcess(ShowPlatformSoftwareYangManageme
 
     cli_command = "show platform software yang-management process"
 
+    patterns = Patterns(
+        # confd            : Running
+        # pubd             : Running
+        # gnmib            : Not Running
+        p1=r'^(?P<key>\S+) *: +(?P<data>(Running|Not +Running))$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
         else:
             out = output
 
-        # confd            : Running
-        # pubd             : Running
-        # gnmib            : Not Running
-        p1 = re.compile(r'^(?P<key>\S+) *: +(?P<data>(Running|Not +Running))$')
+        p = ShowPlatformSoftwareYangManagementProcess.patterns
 
         ret_dict = dict()
 
         for line in out.splitlines():
             line = line.strip()
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict.update({
@@ -7252,16 +7385,20 @@ class ShowPlatformSoftwareYangManagementProcessMonitor(ShowPlatformSoftwareYangM
 
     cli_command = "show platform software yang-management process monitor"
 
+    patterns = Patterns(
+        # dmiauthd          551 S 376940 49600  0.0  0.6    21:44:33
+        # ncsshd           1503 S 301344 17592  0.0  0.2    21:44:32
+        p1=r'^(?P<command>\S+) +(?P<pid>\d+) +(?P<s>\S+) +(?P<vsz>\d+) +'
+           r'(?P<rss>\d+) +(?P<cpu>\S+) +(?P<mem>\S+) +(?P<elapsed>\S+)$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
         else:
             out = output
 
-        # dmiauthd          551 S 376940 49600  0.0  0.6    21:44:33
-        # ncsshd           1503 S 301344 17592  0.0  0.2    21:44:32
-        p1 = re.compile(r'^(?P<command>\S+) +(?P<pid>\d+) +(?P<s>\S+) +(?P<vsz>\d+) +'
-                        r'(?P<rss>\d+) +(?P<cpu>\S+) +(?P<mem>\S+) +(?P<elapsed>\S+)$')
+        p = ShowPlatformSoftwareYangManagementProcessMonitor.patterns
 
         ret_dict = dict()
 
@@ -7270,7 +7407,7 @@ class ShowPlatformSoftwareYangManagementProcessMonitor(ShowPlatformSoftwareYangM
 
             # dmiauthd          551 S 376940 49600  0.0  0.6    21:44:33
             # ncsshd           1503 S 301344 17592  0.0  0.2    21:44:32
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 commands = ret_dict.setdefault('pid', {})
@@ -7311,19 +7448,23 @@ class ShowPlatformSoftwareYangManagementProcessState(ShowPlatformSoftwareYangMan
 
     cli_command = "show platform software yang-management process state"
 
+    patterns = Patterns(
+        # Confd Status: Started
+        p1=r'^Confd +Status: +(?P<status>\S+)$',
+
+        # pubd                 Running             Active
+        # gnmib                Not Running         Not Applicable
+        p2=r'^(?P<process>\S+) +(?P<status>(Running|Not +Running)) +'
+           r'(?P<state>(Active|Not +Active|Not +Applicable))$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
         else:
             out = output
 
-        # Confd Status: Started
-        p1 = re.compile(r'^Confd +Status: +(?P<status>\S+)$')
-
-        # pubd                 Running             Active
-        # gnmib                Not Running         Not Applicable
-        p2 = re.compile(r'^(?P<process>\S+) +(?P<status>(Running|Not +Running)) +'
-                        r'(?P<state>(Active|Not +Active|Not +Applicable))$')
+        p = ShowPlatformSoftwareYangManagementProcessState.patterns
 
         ret_dict = dict()
 
@@ -7331,7 +7472,7 @@ class ShowPlatformSoftwareYangManagementProcessState(ShowPlatformSoftwareYangMan
             line = line.strip()
 
             # Confd Status: Started
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['confd-status'] = group['status']
@@ -7339,7 +7480,7 @@ class ShowPlatformSoftwareYangManagementProcessState(ShowPlatformSoftwareYangMan
 
             # pubd                 Running             Active
             # gnmib                Not Running         Not Applicable
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 commands = ret_dict.setdefault('processes', {})
@@ -7376,6 +7517,19 @@ class ShowPlatformSoftwareMemoryRpActive(ShowPlatformSoftwareMemoryRpActiveSchem
 
     cli_command = 'show platform software memory {process} RP active'
 
+    patterns = Patterns(
+        # Module: process
+        p1=r'Module: +(?P<module>[\S\s]+)$',
+
+        # allocated: 16695, requested: 16647, overhead: 48
+        p2=r'allocated: +(?P<allocated>\d+), +requested: +'
+           r'(?P<requested>\d+), +overhead: +(?P<overhead>\d+)$',
+
+        # Allocations: 3, failed: 0, frees: 0
+        p3=r'Allocations: +(?P<allocations>\d+), +failed: +'
+           r'(?P<failed>\d+), +frees: +(?P<frees>\d+)$',
+    )
+
     def cli(self, process, output=None):
 
         if output is None:
@@ -7385,22 +7539,13 @@ class ShowPlatformSoftwareMemoryRpActive(ShowPlatformSoftwareMemoryRpActiveSchem
 
         ret_dict = {}
 
-        # Module: process
-        p1 = re.compile(r'Module: +(?P<module>[\S\s]+)$')
-
-        # allocated: 16695, requested: 16647, overhead: 48
-        p2 = re.compile(r'allocated: +(?P<allocated>\d+), +requested: +'
-            r'(?P<requested>\d+), +overhead: +(?P<overhead>\d+)$')
-
-        # Allocations: 3, failed: 0, frees: 0
-        p3 = re.compile(r'Allocations: +(?P<allocations>\d+), +failed: +'
-            r'(?P<failed>\d+), +frees: +(?P<frees>\d+)$')
+        p = ShowPlatformSoftwareMemoryRpActive.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # Module: process
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 module = group.get('module')
@@ -7409,14 +7554,14 @@ class ShowPlatformSoftwareMemoryRpActive(ShowPlatformSoftwareMemoryRpActiveSchem
                 continue
 
             # allocated: 16695, requested: 16647, overhead: 48
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 module_dict.update({k:int(v) for k, v in group.items() if v is not None})
                 continue
 
             # Allocations: 3, failed: 0, frees: 0
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 module_dict.update({k:int(v) for k, v in group.items() if v is not None})
@@ -7482,6 +7627,12 @@ class ShowPlatformSoftwareMemoryRpActiveBrief(ShowPlatformSoftwareMemoryRpActive
 
     cli_command = 'show platform software memory {process} RP active brief'
 
+    patterns = Patterns(
+        # Summary                 420136        364136        3706          206
+        p1=r'^(?P<module>\S+) +(?P<allocated>\d+) +'
+           r'(?P<requested>\d+) +(?P<allocs>\d+) +(?P<frees>\d+)$',
+    )
+
     def cli(self, process, output=None):
 
         if output is None:
@@ -7491,15 +7642,13 @@ class ShowPlatformSoftwareMemoryRpActiveBrief(ShowPlatformSoftwareMemoryRpActive
 
         ret_dict = {}
 
-        # Summary                 420136        364136        3706          206
-        p1 = re.compile(r'^(?P<module>\S+) +(?P<allocated>\d+) +'
-            r'(?P<requested>\d+) +(?P<allocs>\d+) +(?P<frees>\d+)$')
+        p = ShowPlatformSoftwareMemoryRpActiveBrief.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # Summary                 420136        364136        3706          206
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 module = group.pop('module')
@@ -7571,6 +7720,16 @@ class ShowPlatformSoftwareMemoryRpActiveAllocCallsite(ShowPlatformSoftwareMemory
 
     cli_command = 'show platform software memory {process} RP active alloc callsite'
 
+    patterns = Patterns(
+        # callsite: 1355696130, thread_id: 24813
+        p1=r'^callsite: +(?P<callsite>\d+), +thread_id: +(?P<thread_id>\d+)$',
+
+        # allocs: 138151, frees: 138141, alloc_bytes: 15466123, free_bytes: 15464846, call_diff: 10, byte_diff: 1277
+        p2=r'^allocs: +(?P<allocs>\d+), +frees: +(?P<frees>\d+), +'
+           r'alloc_bytes: +(?P<alloc_bytes>\d+), +free_bytes: +(?P<free_bytes>\d+), +'
+           r'call_diff: +(?P<call_diff>\d+), +byte_diff: +(?P<byte_diff>\d+)$',
+    )
+
     def cli(self, process, output=None):
 
         if output is None:
@@ -7580,19 +7739,13 @@ class ShowPlatformSoftwareMemoryRpActiveAllocCallsite(ShowPlatformSoftwareMemory
 
         ret_dict = {}
 
-        # callsite: 1355696130, thread_id: 24813
-        p1 = re.compile(r'^callsite: +(?P<callsite>\d+), +thread_id: +(?P<thread_id>\d+)$')
-
-        # allocs: 138151, frees: 138141, alloc_bytes: 15466123, free_bytes: 15464846, call_diff: 10, byte_diff: 1277
-        p2 = re.compile(r'^allocs: +(?P<allocs>\d+), +frees: +(?P<frees>\d+), +'
-            r'alloc_bytes: +(?P<alloc_bytes>\d+), +free_bytes: +(?P<free_bytes>\d+), +'
-            r'call_diff: +(?P<call_diff>\d+), +byte_diff: +(?P<byte_diff>\d+)$')
+        p = ShowPlatformSoftwareMemoryRpActiveAllocCallsite.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # callsite: 1355696130, thread_id: 24813
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 callsite = group.get('callsite')
@@ -7603,7 +7756,7 @@ class ShowPlatformSoftwareMemoryRpActiveAllocCallsite(ShowPlatformSoftwareMemory
                 continue
 
             # allocs: 138151, frees: 138141, alloc_bytes: 15466123, free_bytes: 15464846, call_diff: 10, byte_diff: 1277
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 thread_dict.update({k:int(v) for k, v in group.items() if v is not None})
@@ -7651,6 +7804,14 @@ class ShowPlatformSoftwareMemoryRpActiveAllocCallsiteBrief(ShowPlatformSoftwareM
 
     cli_command = 'show platform software memory {process} RP active alloc callsite brief'
 
+    patterns = Patterns(
+        # callsite: 1355696130, thread_id: 24813
+        p1=r'^The +current +tracekey +is +: +(?P<tracekey>\S+)$',
+
+        # allocs: 138151, frees: 138141, alloc_bytes: 15466123, free_bytes: 15464846, call_diff: 10, byte_diff: 1277
+        p2=r'^(?P<callsite>\d+) +(?P<thread_id>\d+) +(?P<diff_byte>\d+) +(?P<diff_call>\d+)$',
+    )
+
     def cli(self, process, output=None):
 
         if output is None:
@@ -7660,23 +7821,19 @@ class ShowPlatformSoftwareMemoryRpActiveAllocCallsiteBrief(ShowPlatformSoftwareM
 
         ret_dict = {}
 
-        # callsite: 1355696130, thread_id: 24813
-        p1 = re.compile(r'^The +current +tracekey +is +: +(?P<tracekey>\S+)$')
-
-        # allocs: 138151, frees: 138141, alloc_bytes: 15466123, free_bytes: 15464846, call_diff: 10, byte_diff: 1277
-        p2 = re.compile(r'^(?P<callsite>\d+) +(?P<thread_id>\d+) +(?P<diff_byte>\d+) +(?P<diff_call>\d+)$')
+        p = ShowPlatformSoftwareMemoryRpActiveAllocCallsiteBrief.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict.update({'tracekey': group['tracekey']})
                 continue
 
             # callsite: 1355696130, thread_id: 24813
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 callsite = group.pop('callsite')
@@ -7724,6 +7881,22 @@ class ShowPlatformSoftwareMemoryRpActiveAllocType(ShowPlatformSoftwareMemoryRpAc
 
     cli_command = 'show platform software memory {process} RP active alloc type {alloc_type}'
 
+    patterns = Patterns(
+        # Module: process
+        p1=r'Module: +(?P<module>[\S\s]+)$',
+
+        # Type: process
+        p1_1=r'Type: +(?P<type>[\S\s]+)$',
+
+        # allocated: 16695, requested: 16647, overhead: 48
+        p2=r'Allocated: +(?P<allocated>\d+), +'
+           r'Requested: +(?P<requested>\d+), +Overhead: +(?P<overhead>\d+)$',
+
+        # Allocations: 3, failed: 0, frees: 0
+        p3=r'Allocations: +(?P<allocations>\d+), +Null +Allocations: +'
+           r'(?P<null_allocations>\d+), +Frees: +(?P<frees>\d+)$',
+    )
+
     def cli(self, process, alloc_type, output=None):
 
         if output is None:
@@ -7735,25 +7908,13 @@ class ShowPlatformSoftwareMemoryRpActiveAllocType(ShowPlatformSoftwareMemoryRpAc
 
         ret_dict = {}
 
-        # Module: process
-        p1 = re.compile(r'Module: +(?P<module>[\S\s]+)$')
-
-        # Type: process
-        p1_1 = re.compile(r'Type: +(?P<type>[\S\s]+)$')
-
-        # allocated: 16695, requested: 16647, overhead: 48
-        p2 = re.compile(r'Allocated: +(?P<allocated>\d+), +'
-            r'Requested: +(?P<requested>\d+), +Overhead: +(?P<overhead>\d+)$')
-
-        # Allocations: 3, failed: 0, frees: 0
-        p3 = re.compile(r'Allocations: +(?P<allocations>\d+), +Null +Allocations: +'
-            r'(?P<null_allocations>\d+), +Frees: +(?P<frees>\d+)$')
+        p = ShowPlatformSoftwareMemoryRpActiveAllocType.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # Module: process
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 module = group.get('module')
@@ -7762,7 +7923,7 @@ class ShowPlatformSoftwareMemoryRpActiveAllocType(ShowPlatformSoftwareMemoryRpAc
                 continue
 
             # type: process
-            m = p1_1.match(line)
+            m = p.p1_1.match(line)
             if m:
                 group = m.groupdict()
                 module = group.get('type')
@@ -7771,14 +7932,14 @@ class ShowPlatformSoftwareMemoryRpActiveAllocType(ShowPlatformSoftwareMemoryRpAc
                 continue
 
             # allocated: 16695, requested: 16647, overhead: 48
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 module_dict.update({k:int(v) for k, v in group.items() if v is not None})
                 continue
 
             # Allocations: 3, failed: 0, frees: 0
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 module_dict.update({k:int(v) for k, v in group.items() if v is not None})
@@ -7827,6 +7988,12 @@ class ShowPlatformSoftwareMemoryRpActiveAllocTypeBrief(ShowPlatformSoftwareMemor
 
     cli_command = 'show platform software memory {process} RP active alloc type {alloc_type} brief'
 
+    patterns = Patterns(
+        # Summary                 4989412       4501988       150851        142147
+        p1=r'(?P<type>\S+) +(?P<allocated>\d+) +'
+           r'(?P<requested>\d+) +(?P<allocations>\d+) +(?P<frees>\d+)$',
+    )
+
     def cli(self, process, alloc_type, output=None):
 
         if output is None:
@@ -7838,15 +8005,13 @@ class ShowPlatformSoftwareMemoryRpActiveAllocTypeBrief(ShowPlatformSoftwareMemor
 
         ret_dict = {}
 
-        # Summary                 4989412       4501988       150851        142147
-        p1 = re.compile(r'(?P<type>\S+) +(?P<allocated>\d+) +'
-            r'(?P<requested>\d+) +(?P<allocations>\d+) +(?P<frees>\d+)$')
+        p = ShowPlatformSoftwareMemoryRpActiveAllocTypeBrief.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # Summary                 4989412       4501988       150851        142147
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 module = group.pop('type')
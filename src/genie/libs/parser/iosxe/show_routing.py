@@ -7,6 +7,7 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional
+from genie.libs.parser.utils.stream import iter_lines
 
 
 # ====================================================
@@ -254,7 +255,7 @@ class ShowIpRoute(ShowIpRouteSchema):
         ret_dict = {}
         index = 0
 
-        for line in out.splitlines():
+        for line in iter_lines(out):
             if line:
                 line = line.strip()
             else:
@@ -750,7 +751,7 @@ class ShowIpv6RouteUpdated(ShowIpv6RouteUpdatedSchema):
         source_protocol_dict['redirect'] = ['NDr']
 
         result_dict = {}
-        for line in out.splitlines():
+        for line in iter_lines(out):
             if line:
                 line = line.rstrip()
             else:
@@ -55,6 +55,8 @@ from genie.libs.parser.base import *
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.stream import iter_lines
 
 # Parser
 from genie.libs.parser.yang.bgp_openconfig_yang import BgpOpenconfigYang
@@ -101,21 +103,14 @@ class ShowBgpEgressEngineering(ShowBgpEgressEngineeringSchema):
     cli_command = ['show bgp egress-engineering']
     
 
-    def cli (self, output=None):
-        if output is None:
-            out=self.device.execute(self.cli_command[0])
-        else:
-            out = output
-
-        ret_dict = {}
-
+    patterns = Patterns(
         #  Egress Engineering Peer Set: 192.168.1.2/32 (10b87210)
-        p1 = re.compile(r'Egress +Engineering +Peer +Set: +(?P<prefix>[\d\/\.]+) '
-        '+(?P<peer_set_id>\S+)')
+        p1=r'Egress +Engineering +Peer +Set: +(?P<prefix>[\d\/\.]+) '
+           '+(?P<peer_set_id>\S+)',
 
         #   Version: 2, rn_version: 2
-        p2 = re.compile(r'(?P<key_1>[\w\s]+): +(?P<value_1>[\S\s]+), +(?P<key_2>[\w\s]+): '
-        '+(?P<value_2>\d+)')
+        p2=r'(?P<key_1>[\w\s]+): +(?P<value_1>[\S\s]+), +(?P<key_2>[\w\s]+): '
+           '+(?P<value_2>\d+)',
 
         #    Local ASN: 1
         #     Remote ASN: 2
@@ -123,13 +118,24 @@ class ShowBgpEgressEngineering(ShowBgpEgressEngineeringSchema):
         #     Remote RID: 10.4.1.4
         #     First Hop: 192.168.1.2
         #         NHID: 3
-        p3 = re.compile(r'(?P<key>[\w\s]+): (?P<value>[\S\s]+)')
+        p3=r'(?P<key>[\w\s]+): (?P<value>[\S\s]+)',
+    )
+
+    def cli (self, output=None):
+        if output is None:
+            out=self.device.execute(self.cli_command[0])
+        else:
+            out = output
+
+        ret_dict = {}
+
+        p = ShowBgpEgressEngineering.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             #  Egress Engineering Peer Set: 192.168.1.2/32 (10b87210)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 peer_dict = ret_dict.setdefault( 'peer_set',{}).\
@@ -139,7 +145,7 @@ class ShowBgpEgressEngineering(ShowBgpEgressEngineeringSchema):
                 continue
 
             # Version: 2, rn_version: 2
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 values = list(group.values())
@@ -157,7 +163,7 @@ class ShowBgpEgressEngineering(ShowBgpEgressEngineeringSchema):
             #  First Hop: 10.121.88.1, 10.1.0.1, 10.204.0.1
             #   NHID: 9, 10, 11
             #   IFH: 0x110, 0x130, 0x150
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 if group['key'].strip().lower().replace(' ','_') == 'first_hop'\
@@ -206,20 +212,24 @@ class ShowBgpInstances(ShowBgpInstancesSchema):
 
     cli_command = 'show bgp instances'
 
+    patterns = Patterns(
+        p1=r'^(?P<instance_id>\d+) +(?P<placed_grp>[\w\_|\-]+) '
+           r'+(?P<instance>[\w\-]+) +(?P<bgp_id>[\d\.]+) '
+           r'+(?P<num_vrfs>\d+)? +(?P<address_family>[\w\s\,\-]+)$',
+
+        p1_1=r'(ID +Placed-Grp +Name +AS +VRFs +Address +Families)|(\-)+',
+        p2=r'^(?P<address_family>[(IPv|VPNv)\d Unicast\,]+)$',
+        p3=r'^Number +of +BGP +instances\: '
+           r'+(?P<number_of_bgp_instances>\d+)$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
         else:
             out = output
 
-        p1 = re.compile(r'^(?P<instance_id>\d+) +(?P<placed_grp>[\w\_|\-]+) '
-                        r'+(?P<instance>[\w\-]+) +(?P<bgp_id>[\d\.]+) '
-                        r'+(?P<num_vrfs>\d+)? +(?P<address_family>[\w\s\,\-]+)$')
-
-        p1_1 = re.compile(r'(ID +Placed-Grp +Name +AS +VRFs +Address +Families)|(\-)+')
-        p2 = re.compile(r'^(?P<address_family>[(IPv|VPNv)\d Unicast\,]+)$')
-        p3 = re.compile(r'^Number +of +BGP +instances\: '
-                        r'+(?P<number_of_bgp_instances>\d+)$')
+        p = ShowBgpInstances.patterns
 
         ret_dict = {}
 
@@ -233,7 +243,7 @@ class ShowBgpInstances(ShowBgpInstancesSchema):
             # 2   bgp3_1      test2             333       0       none
             # 3   bgp4_1      default           100       2       IPv4 Unicast, VPNv4 Unicast,
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 instance_id = m.groupdict()['instance_id']
                 placed_grp = m.groupdict()['placed_grp']
@@ -269,12 +279,12 @@ class ShowBgpInstances(ShowBgpInstancesSchema):
 
             # ID  Placed-Grp  Name              AS        VRFs    Address Families
             # --------------------------------------------------------------------------------
-            m = p1_1.match(line)
+            m = p.p1_1.match(line)
             if m:
                 continue
 
             #                                                     IPv6 Unicast, VPNv6 Unicast
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 address_family_extra_line = m.groupdict()['address_family'].lower()
                 if address_family_extra_line and address_family_extra_line != 'none':
@@ -284,7 +294,7 @@ class ShowBgpInstances(ShowBgpInstancesSchema):
                     ret_dict['instance'][instance]['address_families'] = address_family_lst
 
             # Number of BGP instances: 1
-            m3 = p3.match(line)
+            m3 = p.p3.match(line)
             if m3:
                 num = int(m3.groupdict()['number_of_bgp_instances'])
                 ret_dict['number_of_bgp_instances'] = num
@@ -324,6 +334,17 @@ class ShowPlacementProgramAll(ShowPlacementProgramAllSchema):
 
     cli_command = 'show placement program all'
 
+    patterns = Patterns(
+        p1=r'^\s*(?P<program>[a-zA_Z0-9\_\-]+)'
+           '(?:\((?P<instance>\S+)\))?'
+           ' +(?P<group>\S+)'
+           ' +(?P<jid>\S+)'
+           ' +(?P<active_rp>\S+)'
+           ' +(?P<active_state>\S+)'
+           ' +(?P<standby_rp>\S+)'
+           ' +(?P<standby_state>\S+)$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -331,14 +352,7 @@ class ShowPlacementProgramAll(ShowPlacementProgramAllSchema):
             out = output
 
         ret_dict = {}
-        p1 = re.compile(r'^\s*(?P<program>[a-zA_Z0-9\_\-]+)'
-                        '(?:\((?P<instance>\S+)\))?'
-                        ' +(?P<group>\S+)'
-                        ' +(?P<jid>\S+)'
-                        ' +(?P<active_rp>\S+)'
-                        ' +(?P<active_state>\S+)'
-                        ' +(?P<standby_rp>\S+)'
-                        ' +(?P<standby_state>\S+)$')
+        p = ShowPlacementProgramAll.patterns
 
         for line in out.splitlines():
             line = line.strip()
@@ -347,7 +361,7 @@ class ShowPlacementProgramAll(ShowPlacementProgramAllSchema):
             # rcp_fs                                  central-services    1168 0/0/CPU0       RUNNING                  NONE           NOT_SPAWNED
             # bgp(test)                               Group_10_bgp2       1052 0/RSP1/CPU0    RUNNING                  0/RSP0/CPU0    RUNNING
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 program = str(m.groupdict()['program'])
                 instance = m.groupdict()['instance'] or 'default'
@@ -434,6 +448,40 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
 
     cli_command = 'show run formal | i af-group'
 
+    patterns = Patterns(
+        pp1=r'\s*router +bgp +(?P<bgp_id>\d+)'
+            '(?: +instance +(?P<instance_name>[a-zA-Z0-9]+))?'
+            ' +af-group +(?P<pp_name>[a-zA-Z0-9\-\_]+)',
+        p1=r'^af\-group +(?P<pp>[\w\-\.\:]+) +'
+           'address\-family +(?P<af>[\w\s]+)$',
+        p2=r'^default\-originate *(policy)? *'
+           '(?P<policy>[\w\-\.\:\s]+)? +'
+           '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p3=r'^maximum\-prefix +'
+           '(?P<no>[\d]+)? +(?P<th>[\d]+)? +(?P<re>[\d]+)? +'
+           '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p4=r'^next\-hop\-self +'
+           '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p5=r'^policy +(?P<map>[\w]+) +in +'
+           '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p6=r'^policy +(?P<map>[\w]+) +out +'
+           '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p7=r'^route\-reflector\-client +'
+           '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p8=r'^send\-community\-ebgp +'
+           '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p9=r'^send\-extended\-community\-ebgp +'
+           '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p10=r'^site\-of\-origin +(?P<soo>[\w\:]+) +'
+            '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p11=r'^soft\-reconfiguration +(?P<soft>[\w\s]+) +'
+            '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p12=r'^allowas\-in +(?P<al>\d+)? *'
+            '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p13=r'^as\-override *'
+            '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -441,37 +489,7 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
             out = output
 
         ret_dict = {}
-        pp1 = re.compile(r'\s*router +bgp +(?P<bgp_id>\d+)'
-                         '(?: +instance +(?P<instance_name>[a-zA-Z0-9]+))?'
-                         ' +af-group +(?P<pp_name>[a-zA-Z0-9\-\_]+)')
-        p1 = re.compile(r'^af\-group +(?P<pp>[\w\-\.\:]+) +'
-                        'address\-family +(?P<af>[\w\s]+)$')
-        p2 = re.compile(r'^default\-originate *(policy)? *'
-                        '(?P<policy>[\w\-\.\:\s]+)? +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p3 = re.compile(r'^maximum\-prefix +'
-                        '(?P<no>[\d]+)? +(?P<th>[\d]+)? +(?P<re>[\d]+)? +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p4 = re.compile(r'^next\-hop\-self +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p5 = re.compile(r'^policy +(?P<map>[\w]+) +in +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p6 = re.compile(r'^policy +(?P<map>[\w]+) +out +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p7 = re.compile(r'^route\-reflector\-client +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p8 = re.compile(r'^send\-community\-ebgp +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p9 = re.compile(r'^send\-extended\-community\-ebgp +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p10 = re.compile(r'^site\-of\-origin +(?P<soo>[\w\:]+) +'
-                         '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p11 = re.compile(r'^soft\-reconfiguration +(?P<soft>[\w\s]+) +'
-                         '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p12 = re.compile(r'^allowas\-in +(?P<al>\d+)? *'
-                         '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p13 = re.compile(r'^as\-override *'
-                         '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p = ShowBgpInstanceAfGroupConfiguration.patterns
 
         cmd = ''
 
@@ -480,7 +498,7 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
 
             # router bgp 100 af-group af_group address-family ipv4 unicast
 
-            mm1 = pp1.match(line1)
+            mm1 = p.pp1.match(line1)
             if mm1:
                 pp_name = mm1.groupdict()['pp_name']
                 if mm1.groupdict()['instance_name'] is not None:
@@ -510,7 +528,7 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
                     line = line.strip()
                     # af_group address-family IPv4 Unicast
 
-                    m = p1.match(line)
+                    m = p.p1.match(line)
                     if m:
                         af = m.groupdict()['af'].lower()
                         if af:
@@ -520,7 +538,7 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
         
                     # default-originate policy allpass            []
 
-                    m = p2.match(line)
+                    m = p.p2.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['pp_name'][pp_name]\
                             ['default_originate'] = True
@@ -537,7 +555,7 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
         
                     # maximum-prefix 429 75 35                    []
 
-                    m = p3.match(line)
+                    m = p.p3.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['pp_name'][pp_name]\
                             ['maximum_prefix_max_prefix_no'] = int(m.groupdict()['no'])
@@ -557,7 +575,7 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
         
                     # next-hop-self                               []
 
-                    m = p4.match(line)
+                    m = p.p4.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['pp_name'][pp_name]\
                             ['next_hop_self'] = True
@@ -569,7 +587,7 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
         
                     # policy allpass in                           []
 
-                    m = p5.match(line)
+                    m = p.p5.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['pp_name'][pp_name]\
                             ['route_map_name_in'] = m.groupdict()['map']
@@ -581,7 +599,7 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
         
                     # policy allpass out                          []
 
-                    m = p6.match(line)
+                    m = p.p6.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['pp_name'][pp_name]\
                             ['route_map_name_out'] = m.groupdict()['map']
@@ -593,7 +611,7 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
         
                     # route-reflector-client                      []
 
-                    m = p7.match(line)
+                    m = p.p7.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['pp_name'][pp_name]\
                             ['route_reflector_client'] = True
@@ -605,7 +623,7 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
         
                     # send-community-ebgp                         []
 
-                    m = p8.match(line)
+                    m = p.p8.match(line)
                     if m:
                         send_community.append('standard')
                         ret_dict['instance'][instance_name]['pp_name'][pp_name]\
@@ -618,7 +636,7 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
         
                     # send-extended-community-ebgp                []
 
-                    m = p9.match(line)
+                    m = p.p9.match(line)
                     if m:
                         send_community.append('extended')
         
@@ -641,7 +659,7 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
         
                     # site-of-origin 100:1                        []
 
-                    m = p10.match(line)
+                    m = p.p10.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['pp_name'][pp_name]\
                             ['soo'] = m.groupdict()['soo']
@@ -653,7 +671,7 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
         
                     # soft-reconfiguration inbound always         []
 
-                    m = p11.match(line)
+                    m = p.p11.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['pp_name'][pp_name]\
                             ['soft_reconfiguration'] = m.groupdict()['soft'].strip()
@@ -666,7 +684,7 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
         
                     # allowas-in 10                               []
 
-                    m = p12.match(line)
+                    m = p.p12.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['pp_name'][pp_name]\
                             ['allowas_in'] = True
@@ -682,7 +700,7 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
         
                     # as-override                                 []
 
-                    m = p13.match(line)
+                    m = p.p13.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['pp_name'][pp_name]\
                             ['as_override'] = True
@@ -752,6 +770,39 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
 
     cli_command = 'show run formal | i session-group'
 
+    patterns = Patterns(
+        pp1=r'\s*router +bgp +(?P<bgp_id>\d+)'
+            '(?: +instance +(?P<instance_name>[a-zA-Z0-9]+))?'
+            '(?: +neighbor +(?P<neighbor_id>[0-9\.\:]+) +use)?'
+            ' +session-group +(?P<ps_name>[a-zA-Z0-9\-\_]+)',
+        p2=r'^remote\-as +(?P<as>\d+)? +'
+           '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p3=r'^description +(?P<descr>[\w\,\.\:\-\s]+) +'
+           '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p4=r'^ebgp\-multihop +(?P<num>\d+)? *'
+           '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p5=r'^local\-as +(?P<as>\d+) +(?P<v1>no\-prepend)? +'
+           '(?P<v2>replace\-as)? *(?P<v3>dual\-as)? *'
+           '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p6=r'^password +encrypted +(?P<psw>\w+) +'
+           '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p7=r'^shutdown +'
+           '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p8=r'^timers +(?P<keep>\d+) +'
+           '(?P<hold>\d+) +(?P<mim>\d+)? *'
+           '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p9=r'^update\-source +(?P<intf>[\w\.\/]+) +'
+           '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p10=r'^suppress\-4byteas +'
+            '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p11=r'^session\-open\-mode +(?P<mode>[\w\-]+) +'
+            '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p12=r'^bfd fast-detect +'
+            '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p13=r'^ignore\-connected *'
+            '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -761,36 +812,7 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
         ret_dict = {}
 
         cmd = ''
-        pp1 = re.compile(r'\s*router +bgp +(?P<bgp_id>\d+)'
-                         '(?: +instance +(?P<instance_name>[a-zA-Z0-9]+))?'
-                         '(?: +neighbor +(?P<neighbor_id>[0-9\.\:]+) +use)?'
-                         ' +session-group +(?P<ps_name>[a-zA-Z0-9\-\_]+)')
-        p2 = re.compile(r'^remote\-as +(?P<as>\d+)? +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p3 = re.compile(r'^description +(?P<descr>[\w\,\.\:\-\s]+) +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p4 = re.compile(r'^ebgp\-multihop +(?P<num>\d+)? *'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p5 = re.compile(r'^local\-as +(?P<as>\d+) +(?P<v1>no\-prepend)? +'
-                        '(?P<v2>replace\-as)? *(?P<v3>dual\-as)? *'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p6 = re.compile(r'^password +encrypted +(?P<psw>\w+) +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p7 = re.compile(r'^shutdown +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p8 = re.compile(r'^timers +(?P<keep>\d+) +'
-                        '(?P<hold>\d+) +(?P<mim>\d+)? *'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p9 = re.compile(r'^update\-source +(?P<intf>[\w\.\/]+) +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p10 = re.compile(r'^suppress\-4byteas +'
-                         '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p11 = re.compile(r'^session\-open\-mode +(?P<mode>[\w\-]+) +'
-                         '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p12 = re.compile(r'^bfd fast-detect +'
-                         '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p13 = re.compile(r'^ignore\-connected *'
-                         '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p = ShowBgpInstanceSessionGroupConfiguration.patterns
 
         for line1 in out.splitlines():
             line1 = line1.strip()
@@ -799,7 +821,7 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
             # router bgp 333 instance test session-group abcd
             # router bgp 333 instance test neighbor 10.4.1.1 use session-group LALALALLA
 
-            mm1 = pp1.match(line1)
+            mm1 = p.pp1.match(line1)
             if mm1:
                 ps_name = str(mm1.groupdict()['ps_name'])
                 if mm1.groupdict()['instance_name'] is not None:
@@ -831,7 +853,7 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
 
                     # remote-as 333                              []
 
-                    m = p2.match(line)
+                    m = p.p2.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['peer_session'][ps_name]\
                             ['remote_as'] = int(m.groupdict()['as'])
@@ -843,7 +865,7 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
 
                     # description SG_group                       []
 
-                    m = p3.match(line)
+                    m = p.p3.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['peer_session'][ps_name]\
                             ['description'] = m.groupdict()['descr'].strip()
@@ -855,7 +877,7 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
 
                     # ebgp-multihop 254                         []
 
-                    m = p4.match(line)
+                    m = p.p4.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['peer_session'][ps_name]\
                             ['ebgp_multihop_enable'] = True
@@ -871,7 +893,7 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
 
                     # local-as 200 no-prepend replace-as dual-as []
 
-                    m = p5.match(line)
+                    m = p.p5.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['peer_session'][ps_name]\
                             ['local_as_as_no'] = int(m.groupdict()['as'])
@@ -893,7 +915,7 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
 
                     # password encrypted 094F471A1A0A464058      []
 
-                    m = p6.match(line)
+                    m = p.p6.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['peer_session'][ps_name]\
                             ['password_text'] = m.groupdict()['psw']
@@ -905,7 +927,7 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
 
                     # shutdown                                   []
 
-                    m = p7.match(line)
+                    m = p.p7.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['peer_session'][ps_name]\
                             ['shutdown'] = True
@@ -917,7 +939,7 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
 
                     # timers 10 30 3                             []
 
-                    m = p8.match(line)
+                    m = p.p8.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['peer_session'][ps_name]\
                             ['keepalive_interval'] = int(m.groupdict()['keep'])
@@ -936,7 +958,7 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
 
                     # update-source Loopback0                    []
 
-                    m = p9.match(line)
+                    m = p.p9.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['peer_session'][ps_name]\
                             ['update_source'] = m.groupdict()['intf'].lower()
@@ -947,7 +969,7 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
 
                     # suppress-4byteas                        []
 
-                    m = p10.match(line)
+                    m = p.p10.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['peer_session'][ps_name]\
                             ['suppress_four_byte_as_capability'] = True
@@ -958,7 +980,7 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
 
                     # session-open-mode active-only              []
 
-                    m = p11.match(line)
+                    m = p.p11.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['peer_session'][ps_name]\
                             ['transport_connection_mode'] = m.groupdict()['mode']
@@ -969,7 +991,7 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
 
                     # bfd fast-detect                            []
 
-                    m = p12.match(line)
+                    m = p.p12.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['peer_session'][ps_name]\
                             ['fall_over_bfd'] = True
@@ -980,7 +1002,7 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
 
                     # ignore-connected                           []
 
-                    m = p13.match(line)
+                    m = p.p13.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['peer_session'][ps_name]\
                             ['disable_connected_check'] = True
@@ -1173,6 +1195,110 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
                'allocated', 'freed', 'received_updates', 'num_of_scan_segments', 'state',
                'restart_count', 'memory_used', 'number']
 
+    patterns = Patterns(
+        p1=r'^\s*BGP +instance +(?P<num>\S+): +\'(?P<instance>\S+)\'$',
+        p1_1=r'^\s*VRF: +(?P<vrf>[a-zA-Z0-9\_]+)$',
+        p1_1_1=r'^BGP +Process +Information: +VRF +(?P<vrf>[\S]+)$',
+        p1_2=r'^\s*BGP *Route *Distinguisher:'
+             ' *(?P<route_distinguisher>\S+)$',
+        p2=r'BGP *is *operating *in *'
+           '(?P<operation_mode>\w+) *mode$',
+        p3=r'^Autonomous *System *number *format: *'
+           '(?P<as_format>[a-zA-Z]+)$',
+        p4=r'^Autonomous *System: *(?P<as_number>[0-9]+)$',
+        p5=r'^Router *ID: *(?P<router_id>[\w\.\:]+) *'
+           '(\([\w\s]+\))?$',
+        p6_1=r'^Default *Cluster *ID: *'
+             '(?P<default_cluster_id>[\w\.\:]+) *'
+             '(\([\w\s\:\.\,]+\))?$',
+        p6_2=r'^Active *Cluster *IDs: *'
+             '(?P<active_cluster_id>[\w\.\:]+)$',
+        p7_1=r'^Always compare MED is enabled$',
+        p7_2=r'^Comparing router ID for eBGP paths$',
+        p7_4=r'^Treating missing MED as worst$',
+        p8=r'^Fast +external +fallover +enabled$',
+        p9=r'^Platform *RLIMIT *max: *'
+           '(?P<platform_rlimit_max>[0-9\,]+) *bytes$',
+        p10=r'^Maximum +limit +for +BMP +buffer +size: *'
+            '(?P<size>[a-zA-Z0-9]+) *MB$',
+        p11=r'^Default *value *for *BMP *buffer *size: *'
+            '(?P<size>[a-zA-Z0-9]+) *MB$',
+        p12=r'^Current *limit *for *BMP *buffer *size: *'
+            '(?P<size>[a-zA-Z0-9]+) *MB$',
+        p13=r'^Current *utilization *of *BMP *buffer *'
+            'limit: *(?P<limit>[a-zA-Z0-9]+) *B$',
+        p14=r'^Neighbor *logging *is *(?P<nbr_logging>\w+)$',
+        p15=r'^Enforce +first +AS +(?P<as_enabled>\w+)$',
+        p16=r'^Default *local *preference: *'
+            '(?P<preference>[0-9]+)$',
+        p17=r'^Default *keepalive: *(?P<keepalive>[0-9]+)$',
+        p18=r'^Non\-stop *routing *is +(?P<status>[a-zA-Z]+)$',
+        p19=r'^Update *delay: *(?P<update_delay>[0-9]+)$',
+        p20=r'^Generic *scan *interval: *'
+            '(?P<scan_interval>[0-9]+)$',
+        p21=r'^BGP *Speaker *process: *'
+            '(?P<speaker>\w+), +Node: +(?P<node>\w+)$',
+        p22=r'^Restart *count: *(?P<restart_count>[0-9]+)$',
+        p23=r'^(?P<vrf_info>[\w\-]+) +VRFs: +'
+            '(?P<total>[0-9]+) +'
+            '(?P<nbrs_estab>[0-9]+)/(?P<cfg>[0-9]+)$',
+        p24_1=r'^Updates:'
+              ' *(?P<sent>[0-9]+) *(?P<received>[0-9]+)$',
+        p24_2=r'^Notifications:'
+              ' *(?P<sent>[0-9]+) *(?P<received>[0-9]+)$',
+        p26=r'^Pool +(?P<pool>\w+): +(?P<alloc>\d+) +'
+            '(?P<free>\d+)$',
+        p25=r'^(?P<att>[\w\s]+): +(?P<number>[0-9]+) +'
+            '(?P<memory_used>[0-9]+)$',
+        p29=r'^Address *family: *(?P<af>[a-zA-Z0-9\s\-\_]+)$',
+        p29_1=r'^VRF +(?P<current_vrf>(\S+)) +Address +family:'
+              ' +(?P<af>[a-zA-Z0-9\s\-\_]+)'
+              '(?: +\(Table +(?P<table_state>[a-z]+)\))?$',
+        p30=r'^Dampening +is +(?P<dampening>[\w\s]+)$',
+        p31=r'^Client +reflection +is +enabled +in +global +config$',
+        p31_1=r'^Client +reflection +is +not +enabled +in +global +config$',
+        p32=r'^Dynamic *MED *is *(?P<dynamic_med>\w+)$',
+        p33=r'^Dynamic *MED *interval *: *'
+            '(?P<interval>[a-zA-Z0-9\s]+)$',
+        p34=r'^Dynamic *MED *Timer *: *'
+            '(?P<dynamic_med_timer>[a-zA-Z0-9\s]+)$',
+        p35=r'^Dynamic *MED *Periodic *Timer *: *'
+            '(?P<timer>[a-zA-Z0-9\s]+)$',
+        p36=r'^Scan *interval: *(?P<scan_interval>[\w\s]+)$',
+        p37=r'^Total *prefixes *scanned: *'
+            '(?P<scan>[a-zA-Z0-9\s]+)$',
+        p38=r'^Prefixes *scanned *per *segment: *'
+            '(?P<prefix_scan>[a-zA-Z0-9\s]+)$',
+        p39=r'^Number *of *scan *segments: *'
+            '(?P<num_of_scan_segments>[a-zA-Z0-9\s]+)$',
+        p40=r'^Nexthop *resolution *minimum *prefix\-length: *'
+            '(?P<length>[\w\s\(\)]+)$',
+        p41=r'^Main *Table *Version: *(?P<main_tab_ver>[\w\s]+)$',
+        p42=r'^Table *version *synced *to *RIB: *'
+            '(?P<rib>[a-zA-Z0-9\s]+)$',
+        p43=r'^Table *version *acked *by *RIB: *'
+            '(?P<rib>[a-zA-Z0-9\s]+)$',
+        p44=r'^RIB *has *not *converged: *'
+            '(?P<rib>[a-zA-Z0-9\s]+)$',
+        p54=r'^RIB *table *prefix\-limit *reached +\? *'
+            '\[(?P<rib>\w+)\], +version +(?P<ver>\d+)$',
+        p45=r'^Permanent +Network +(?P<status>\w+)$',
+        p46=r'^State: *(?P<state>[a-zA-Z\s]+).$',
+        p47=r'^BGP *Table *Version: *(?P<tab_ver>\w+)$',
+        p48=r'^Attribute *download: *(?P<attr>[\w\s]+)$',
+        p49=r'^Label *retention *timer *value *'
+            '(?P<timer>[a-zA-Z0-9\s]+)$',
+        p50=r'^Soft *Reconfig *Entries: *(?P<ent>\d+)$',
+        p51=r'^Table *bit\-field *size *: *'
+            '(?P<size>[0-9\s]+) *Chunk *element *size *: *'
+            '(?P<elememt_size>\d+)$',
+        p52=r'^(?P<thread>\w+\s\w+) *'
+            '(?P<trigger>\w+\s\d+\s[\d\:\.]+) +(?P<ver>[0-9]+) +'
+            '(?P<tbl_ver>[0-9]+) +(?P<trig_tid>[0-9]+)$',
+        p53=r'^(?P<remote>[\w\s\-]+): *(?P<v1>\d+) *'
+            '(?P<v2>[0-9]+)$',
+    )
+
     def cli(self, vrf_type='all', instance='all', vrf='all', address_family='', output=None):
         assert vrf_type in ['all', 'vrf']
         assert address_family in ['', 'ipv4 unicast', 'ipv6 unicast']
@@ -1194,107 +1320,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
                                                    vrf=vrf))
         else:
             out = output
-        p1 = re.compile(r'^\s*BGP +instance +(?P<num>\S+): +\'(?P<instance>\S+)\'$')
-        p1_1 = re.compile(r'^\s*VRF: +(?P<vrf>[a-zA-Z0-9\_]+)$')
-        p1_1_1 = re.compile(r'^BGP +Process +Information: +VRF +(?P<vrf>[\S]+)$')
-        p1_2 = re.compile(r'^\s*BGP *Route *Distinguisher:'
-                          ' *(?P<route_distinguisher>\S+)$')
-        p2 = re.compile(r'BGP *is *operating *in *'
-                        '(?P<operation_mode>\w+) *mode$')
-        p3 = re.compile(r'^Autonomous *System *number *format: *'
-                        '(?P<as_format>[a-zA-Z]+)$')
-        p4 = re.compile(r'^Autonomous *System: *(?P<as_number>[0-9]+)$')
-        p5 = re.compile(r'^Router *ID: *(?P<router_id>[\w\.\:]+) *'
-                        '(\([\w\s]+\))?$')
-        p6_1 = re.compile(r'^Default *Cluster *ID: *'
-                          '(?P<default_cluster_id>[\w\.\:]+) *'
-                          '(\([\w\s\:\.\,]+\))?$')
-        p6_2 = re.compile(r'^Active *Cluster *IDs: *'
-                          '(?P<active_cluster_id>[\w\.\:]+)$')
-        p7_1 = re.compile(r'^Always compare MED is enabled$')
-        p7_2 = re.compile(r'^Comparing router ID for eBGP paths$')
-        p7_4 = re.compile(r'^Treating missing MED as worst$')
-        p8 = re.compile(r'^Fast +external +fallover +enabled$')
-        p9 = re.compile(r'^Platform *RLIMIT *max: *'
-                        '(?P<platform_rlimit_max>[0-9\,]+) *bytes$')
-        p10 = re.compile(r'^Maximum +limit +for +BMP +buffer +size: *'
-                         '(?P<size>[a-zA-Z0-9]+) *MB$')
-        p11 = re.compile(r'^Default *value *for *BMP *buffer *size: *'
-                         '(?P<size>[a-zA-Z0-9]+) *MB$')
-        p12 = re.compile(r'^Current *limit *for *BMP *buffer *size: *'
-                         '(?P<size>[a-zA-Z0-9]+) *MB$')
-        p13 = re.compile(r'^Current *utilization *of *BMP *buffer *'
-                         'limit: *(?P<limit>[a-zA-Z0-9]+) *B$')
-        p14 = re.compile(r'^Neighbor *logging *is *(?P<nbr_logging>\w+)$')
-        p15 = re.compile(r'^Enforce +first +AS +(?P<as_enabled>\w+)$')
-        p16 = re.compile(r'^Default *local *preference: *'
-                         '(?P<preference>[0-9]+)$')
-        p17 = re.compile(r'^Default *keepalive: *(?P<keepalive>[0-9]+)$')
-        p18 = re.compile(r'^Non\-stop *routing *is +(?P<status>[a-zA-Z]+)$')
-        p19 = re.compile(r'^Update *delay: *(?P<update_delay>[0-9]+)$')
-        p20 = re.compile(r'^Generic *scan *interval: *'
-                         '(?P<scan_interval>[0-9]+)$')
-        p21 = re.compile(r'^BGP *Speaker *process: *'
-                         '(?P<speaker>\w+), +Node: +(?P<node>\w+)$')
-        p22 = re.compile(r'^Restart *count: *(?P<restart_count>[0-9]+)$')
-        p23 = re.compile(r'^(?P<vrf_info>[\w\-]+) +VRFs: +'
-                         '(?P<total>[0-9]+) +'
-                         '(?P<nbrs_estab>[0-9]+)/(?P<cfg>[0-9]+)$')
-        p24_1 = re.compile(r'^Updates:'
-                           ' *(?P<sent>[0-9]+) *(?P<received>[0-9]+)$')
-        p24_2 = re.compile(r'^Notifications:'
-                           ' *(?P<sent>[0-9]+) *(?P<received>[0-9]+)$')
-        p26 = re.compile(r'^Pool +(?P<pool>\w+): +(?P<alloc>\d+) +'
-                         '(?P<free>\d+)$')
-        p25 = re.compile(r'^(?P<att>[\w\s]+): +(?P<number>[0-9]+) +'
-                         '(?P<memory_used>[0-9]+)$')
-        p29 = re.compile(r'^Address *family: *(?P<af>[a-zA-Z0-9\s\-\_]+)$')
-        p29_1 = re.compile(r'^VRF +(?P<current_vrf>(\S+)) +Address +family:'
-                           ' +(?P<af>[a-zA-Z0-9\s\-\_]+)'
-                           '(?: +\(Table +(?P<table_state>[a-z]+)\))?$')
-        p30 = re.compile(r'^Dampening +is +(?P<dampening>[\w\s]+)$')
-        p31 = re.compile(r'^Client +reflection +is +enabled +in +global +config$')
-        p31_1 = re.compile(r'^Client +reflection +is +not +enabled +in +global +config$')
-        p32 = re.compile(r'^Dynamic *MED *is *(?P<dynamic_med>\w+)$')
-        p33 = re.compile(r'^Dynamic *MED *interval *: *'
-                         '(?P<interval>[a-zA-Z0-9\s]+)$')
-        p34 = re.compile(r'^Dynamic *MED *Timer *: *'
-                         '(?P<dynamic_med_timer>[a-zA-Z0-9\s]+)$')
-        p35 = re.compile(r'^Dynamic *MED *Periodic *Timer *: *'
-                         '(?P<timer>[a-zA-Z0-9\s]+)$')
-        p36 = re.compile(r'^Scan *interval: *(?P<scan_interval>[\w\s]+)$')
-        p37 = re.compile(r'^Total *prefixes *scanned: *'
-                         '(?P<scan>[a-zA-Z0-9\s]+)$')
-        p38 = re.compile(r'^Prefixes *scanned *per *segment: *'
-                         '(?P<prefix_scan>[a-zA-Z0-9\s]+)$')
-        p39 = re.compile(r'^Number *of *scan *segments: *'
-                         '(?P<num_of_scan_segments>[a-zA-Z0-9\s]+)$')
-        p40 = re.compile(r'^Nexthop *resolution *minimum *prefix\-length: *'
-                         '(?P<length>[\w\s\(\)]+)$')
-        p41 = re.compile(r'^Main *Table *Version: *(?P<main_tab_ver>[\w\s]+)$')
-        p42 = re.compile(r'^Table *version *synced *to *RIB: *'
-                         '(?P<rib>[a-zA-Z0-9\s]+)$')
-        p43 = re.compile(r'^Table *version *acked *by *RIB: *'
-                         '(?P<rib>[a-zA-Z0-9\s]+)$')
-        p44 = re.compile(r'^RIB *has *not *converged: *'
-                         '(?P<rib>[a-zA-Z0-9\s]+)$')
-        p54 = re.compile(r'^RIB *table *prefix\-limit *reached +\? *'
-                         '\[(?P<rib>\w+)\], +version +(?P<ver>\d+)$')
-        p45 = re.compile(r'^Permanent +Network +(?P<status>\w+)$')
-        p46 = re.compile(r'^State: *(?P<state>[a-zA-Z\s]+).$')
-        p47 = re.compile(r'^BGP *Table *Version: *(?P<tab_ver>\w+)$')
-        p48 = re.compile(r'^Attribute *download: *(?P<attr>[\w\s]+)$')
-        p49 = re.compile(r'^Label *retention *timer *value *'
-                         '(?P<timer>[a-zA-Z0-9\s]+)$')
-        p50 = re.compile(r'^Soft *Reconfig *Entries: *(?P<ent>\d+)$')
-        p51 = re.compile(r'^Table *bit\-field *size *: *'
-                         '(?P<size>[0-9\s]+) *Chunk *element *size *: *'
-                         '(?P<elememt_size>\d+)$')
-        p52 = re.compile(r'^(?P<thread>\w+\s\w+) *'
-                         '(?P<trigger>\w+\s\d+\s[\d\:\.]+) +(?P<ver>[0-9]+) +'
-                         '(?P<tbl_ver>[0-9]+) +(?P<trig_tid>[0-9]+)$')
-        p53 = re.compile(r'^(?P<remote>[\w\s\-]+): *(?P<v1>\d+) *'
-                         '(?P<v2>[0-9]+)$')
+        p = ShowBgpInstanceProcessDetail.patterns
         # Init dict
         ret_dict = {}
 
@@ -1309,7 +1335,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # BGP instance 0: 'default'
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 instance = m.groupdict()['instance']
 
@@ -1328,7 +1354,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # VRF: VRF1
 
-            m = p1_1.match(line)
+            m = p.p1_1.match(line)
             if m:
                 ret_dict.setdefault('instance', {}).setdefault(instance, {})
                 vrf = str(m.groupdict()['vrf'])
@@ -1355,7 +1381,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
                 continue
             # BGP Process Information: VRF VRF1
 
-            m = p1_1_1.match(line)
+            m = p.p1_1_1.match(line)
             if m:
                 vrf = str(m.groupdict()['vrf'])
                 ret_dict.setdefault('instance', {}).setdefault(instance, {}).setdefault(
@@ -1380,7 +1406,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # BGP Route Distinguisher: 100:1
 
-            m = p1_2.match(line)
+            m = p.p1_2.match(line)
             if m:
                 route_distinguisher = str(m.groupdict()['route_distinguisher'])
 
@@ -1390,7 +1416,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # BGP is operating in STANDALONE mode
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 operation_mode = m.groupdict()['operation_mode'].lower()
                 ret_dict.setdefault('instance', {}).setdefault(instance, {}).setdefault(
@@ -1401,7 +1427,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Autonomous System number format: ASPLAIN
 
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 as_format = m.groupdict()['as_format']
 
@@ -1411,7 +1437,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Autonomous System: 100
 
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 as_number = int(m.groupdict()['as_number'])
 
@@ -1421,7 +1447,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Router ID: 10.4.1.1 (manually configured)
 
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 router_id = m.groupdict()['router_id']
 
@@ -1432,7 +1458,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
             # Default Cluster ID: 10.4.1.1
             # Default Cluster ID: 10 (manually configured)
 
-            m = p6_1.match(line)
+            m = p.p6_1.match(line)
             if m:
                 default_cluster_id = m.groupdict()['default_cluster_id']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1441,7 +1467,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Active Cluster IDs:  10.4.1.1
 
-            m = p6_2.match(line)
+            m = p.p6_2.match(line)
             if m:
                 active_cluster_id = m.groupdict()['active_cluster_id']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1450,7 +1476,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Always compare MED is enabled
 
-            m = p7_1.match(line)
+            m = p.p7_1.match(line)
             if m:
                 ret_dict['instance'][instance]['vrf'][vrf] \
                     ['always_compare_med'] = True
@@ -1458,7 +1484,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Comparing router ID for eBGP paths
 
-            m = p7_2.match(line)
+            m = p.p7_2.match(line)
             if m:
                 ret_dict['instance'][instance]['vrf'][vrf] \
                     ['bestpath_compare_routerid'] = True
@@ -1466,7 +1492,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Treating missing MED as worst
 
-            m = p7_4.match(line)
+            m = p.p7_4.match(line)
             if m:
                 ret_dict['instance'][instance]['vrf'][vrf] \
                     ['bestpath_med_missing_at_worst'] = True
@@ -1474,7 +1500,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Fast external fallover enabled
 
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 ret_dict['instance'][instance]['vrf'][vrf] \
                     ['fast_external_fallover'] = True
@@ -1482,7 +1508,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Platform RLIMIT max: 2147483648 bytes
 
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 platform_rlimit_max = int(m.groupdict()['platform_rlimit_max'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1491,7 +1517,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Maximum limit for BMP buffer size: 409 MB
 
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 size = int(m.groupdict()['size'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1500,7 +1526,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Default value for BMP buffer size: 307 MB
 
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 size = int(m.groupdict()['size'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1509,7 +1535,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Current limit for BMP buffer size: 307 MB
 
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 size = int(m.groupdict()['size'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1518,7 +1544,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Current utilization of BMP buffer limit: 0 B
 
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 limit = int(m.groupdict()['limit'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1527,7 +1553,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Neighbor logging is enabled
 
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 nbr_logging = m.groupdict()['nbr_logging']
                 if nbr_logging == 'enabled':
@@ -1540,7 +1566,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Enforce first AS enabled
 
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 as_enabled = m.groupdict()['as_enabled']
                 if as_enabled == 'enabled':
@@ -1553,7 +1579,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Default local preference: 100
 
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 default_local_preference = int(m.groupdict()['preference'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1562,7 +1588,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Default keepalive: 60
 
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 default_keepalive = int(m.groupdict()['keepalive'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1571,7 +1597,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Non-stop routing is enabled
 
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 status = m.groupdict()['status']
                 if status == 'enabled':
@@ -1584,7 +1610,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Update delay: 120
 
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 update_delay = int(m.groupdict()['update_delay'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1593,7 +1619,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Generic scan interval: 60
 
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 scan_interval = int(m.groupdict()['scan_interval'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1602,7 +1628,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # BGP Speaker process: 0, Node: node0_0_CPU0
 
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 speaker = int(m.groupdict()['speaker'])
                 node = m.groupdict()['node']
@@ -1614,7 +1640,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Restart count: 1
 
-            m = p22.match(line)
+            m = p.p22.match(line)
             if m:
                 restart_count = int(m.groupdict()['restart_count'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1625,7 +1651,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
             # Default vrfs:              1               2/2
             # Non-Default vrfs:          2               4/4
 
-            m = p23.match(line)
+            m = p.p23.match(line)
             if m:
                 if 'vrf_info' not in ret_dict['instance'][instance]['vrf'][vrf] \
                         :
@@ -1663,7 +1689,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
             if re.compile(r'BMP +pool +summary:').match(line):
                 flag = 'bmp'
 
-            m = p26.match(line)
+            m = p.p26.match(line)
 
             if m and flag == 'message':
                 if 'message_logging_pool_summary' not in ret_dict['instance'] \
@@ -1730,7 +1756,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
             # Updates:                   14              24
             # Notifications:             1               0
 
-            m = p24_1.match(line)
+            m = p.p24_1.match(line)
             if m:
                 ret_dict['instance'][instance]['vrf'][vrf] \
                     ['sent_updates'] = int(m.groupdict()['sent'])
@@ -1742,7 +1768,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
             # Updates:                   14              24
             # Notifications:             1               0
 
-            m = p24_2.match(line)
+            m = p.p24_2.match(line)
             if m:
                 ret_dict['instance'][instance]['vrf'][vrf] \
                     ['sent_notifications'] = int(m.groupdict()['sent'])
@@ -1764,7 +1790,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
             # Nexthop Entries:           32              12800
 
 
-            m = p25.match(line)
+            m = p.p25.match(line)
             if m and not flag:
                 if 'att' not in ret_dict['instance'][instance]['vrf'][vrf] \
                         :
@@ -1789,7 +1815,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Address family: VPNv4 Unicast
 
-            m = p29.match(line)
+            m = p.p29.match(line)
             if m:
                 af = str(m.groupdict()['af']).lower()
                 af.strip()
@@ -1805,7 +1831,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
             # VRF VRF1 Address family: IPv6 Unicast
             # VRF a Address family: IPv4 Unicast (Table inactive)
 
-            m = p29_1.match(line)
+            m = p.p29_1.match(line)
             if m:
                 af = str(m.groupdict()['af']).lower()
                 af.strip()
@@ -1828,7 +1854,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Dampening is not enabled
 
-            m = p30.match(line)
+            m = p.p30.match(line)
             if m:
                 dampening = m.groupdict()['dampening'].lower()
                 if 'not enabled' in dampening:
@@ -1841,7 +1867,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Client reflection is enabled in global config
 
-            m = p31.match(line)
+            m = p.p31.match(line)
             if m:
                 ret_dict['instance'][instance]['vrf'][vrf] \
                     ['address_family'][af]['client_to_client_reflection'] = True
@@ -1849,7 +1875,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Client reflection is not enabled in global config
 
-            m = p31_1.match(line)
+            m = p.p31_1.match(line)
             if m:
                 ret_dict['instance'][instance]['vrf'][vrf] \
                     ['address_family'][af]['client_to_client_reflection'] = False
@@ -1857,7 +1883,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Dynamic MED is Disabled
 
-            m = p32.match(line)
+            m = p.p32.match(line)
             if m:
                 dynamic_med = m.groupdict()['dynamic_med'].lower()
                 if status == 'enabled':
@@ -1870,7 +1896,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Dynamic MED interval : 10 minutes
 
-            m = p33.match(line)
+            m = p.p33.match(line)
             if m:
                 interval = m.groupdict()['interval']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1879,7 +1905,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Dynamic MED Timer : Not Running
 
-            m = p34.match(line)
+            m = p.p34.match(line)
             if m:
                 timer = m.groupdict()['dynamic_med_timer']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1888,7 +1914,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Dynamic MED Periodic Timer : Not Running
 
-            m = p35.match(line)
+            m = p.p35.match(line)
             if m:
                 timer = m.groupdict()['timer']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1897,7 +1923,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Scan interval: 60
 
-            m = p36.match(line)
+            m = p.p36.match(line)
             if m:
                 scan_interval = m.groupdict()['scan_interval']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1906,7 +1932,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Total prefixes scanned: 40
 
-            m = p37.match(line)
+            m = p.p37.match(line)
             if m:
                 scan = m.groupdict()['scan']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1915,7 +1941,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Prefixes scanned per segment: 100000
 
-            m = p38.match(line)
+            m = p.p38.match(line)
             if m:
                 prefix_scan = m.groupdict()['prefix_scan']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1924,7 +1950,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Number of scan segments: 1
 
-            m = p39.match(line)
+            m = p.p39.match(line)
             if m:
                 ret = m.groupdict()['num_of_scan_segments']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1933,7 +1959,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Nexthop resolution minimum prefix-length: 0 (not configured)
 
-            m = p40.match(line)
+            m = p.p40.match(line)
             if m:
                 length = m.groupdict()['length']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1943,7 +1969,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Main Table Version: 43
 
-            m = p41.match(line)
+            m = p.p41.match(line)
             if m:
                 main_tab_ver = m.groupdict()['main_tab_ver']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1952,7 +1978,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Table version synced to RIB: 43
 
-            m = p42.match(line)
+            m = p.p42.match(line)
             if m:
                 rib = m.groupdict()['rib']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1961,7 +1987,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Table version acked by RIB: 0
 
-            m = p43.match(line)
+            m = p.p43.match(line)
             if m:
                 rib = m.groupdict()['rib']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1970,7 +1996,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # RIB has not converged: version 0
 
-            m = p44.match(line)
+            m = p.p44.match(line)
             if m:
                 rib = m.groupdict()['rib']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1979,7 +2005,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # RIB table prefix-limit reached ?  [No], version 0
 
-            m = p54.match(line)
+            m = p.p54.match(line)
             if m:
                 rib = m.groupdict()['rib'].lower()
                 ver = m.groupdict()['ver']
@@ -1991,7 +2017,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Permanent Network Unconfigured
 
-            m = p45.match(line)
+            m = p.p45.match(line)
             if m:
                 status = m.groupdict()['status'].lower()
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -2000,7 +2026,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # State: Normal mode.
 
-            m = p46.match(line)
+            m = p.p46.match(line)
             if m:
                 state = m.groupdict()['state'].lower()
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -2009,7 +2035,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # BGP Table Version: 43
 
-            m = p47.match(line)
+            m = p.p47.match(line)
             if m:
                 tab_ver = m.groupdict()['tab_ver']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -2018,7 +2044,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Attribute download: Disabled
 
-            m = p48.match(line)
+            m = p.p48.match(line)
             if m:
                 attr = str(m.groupdict()['attr'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -2027,7 +2053,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Label retention timer value 5 mins
 
-            m = p49.match(line)
+            m = p.p49.match(line)
             if m:
                 timer = m.groupdict()['timer']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -2036,7 +2062,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Soft Reconfig Entries: 0
 
-            m = p50.match(line)
+            m = p.p50.match(line)
             if m:
                 ent = m.groupdict()['ent']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -2045,7 +2071,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Table bit-field size : 1 Chunk element size : 3
 
-            m = p51.match(line)
+            m = p.p51.match(line)
             if m:
                 table_bit_field_size = m.groupdict()['size']
                 chunk_elememt_size = m.groupdict()['elememt_size']
@@ -2068,7 +2094,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
             #                    Total triggers: 17
 
 
-            m = p52.match(line)
+            m = p.p52.match(line)
             if m:
                 if 'thread' not in ret_dict['instance'][instance]['vrf'][vrf] \
                         ['address_family'][af]:
@@ -2120,7 +2146,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
                 flag = 'number'
 
 
-            m = p53.match(line)
+            m = p.p53.match(line)
             if m and flag == 'allocated':
                 try:
                     af
@@ -2468,6 +2494,106 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
         , 'cummulative_no_no_policy', 'route_refresh_request_sent']
 
         
+    patterns = Patterns(
+        p1=r'^BGP +instance +(?P<instance_number>[0-9]+): +'
+           '(?P<instance>[a-zA-Z0-9\-\_\']+)$',
+        p2=r'^\s*BGP +neighbor +is +(?P<neighbor>[a-zA-Z0-9\.\:]+)$',
+        p2_1=r'^\s*BGP +neighbor +is +(?P<neighbor>[a-zA-Z0-9\.\:]+), +vrf +(?P<vrf>\S+)$',
+        p3=r'^Remote +AS +(?P<remote_as>[0-9]+), +local +AS'
+           ' +(?P<local_as_as_no>[0-9]+)'
+           '(?:, +(?P<link_state>[a-zA-Z\s]+))?$',
+        p4=r'^Remote *router *ID *(?P<router_id>[a-zA-Z0-9\.\:]+)$',
+        p5=r'^\s*BGP +state += +(?P<session_state>[a-zA-Z0-9]+)'
+           '(?:, +up +for +(?P<up_time>[\w\:]+))?$',
+        p5_1=r'^\s*BGP +state += +(?P<session_state>[a-zA-Z0-9]+)(?:(?P<reason>.*))',
+        p6=r'^NSR *State: *(?P<nsr_state>[a-zA-Z]+)$',
+        p7=r'^Last *read *(?P<last_read>[0-9\:]+), *Last *read *before *reset *(?P<last_read_before_reset>[0-9\:]+)$',
+        p8=r'^Hold +time +is +(?P<holdtime>[0-9]+), +keepalive'
+           ' +interval +is +(?P<keepalive_interval>[0-9]+)'
+           ' +seconds$',
+        p9=r'^Configured +hold +time:'
+           ' +(?P<holdtime>[0-9]+), +keepalive:'
+           ' +(?P<keepalive_interval>[0-9]+), +min'
+           ' +acceptable +hold +time:'
+           ' +(?P<min_acceptable_hold_time>[0-9]+)$',
+        p10=r'^Last *write *(?P<last_write>[0-9\:]+), *attempted *(?P<attempted>[0-9]+), *written *(?P<written>[0-9]+)$',
+        p11=r'^Second *last *write *(?P<second_last_write>[0-9\:]+), *attempted *(?P<second_attempted>[0-9]+), *written *(?P<second_written>[0-9]+)$',
+        p12=r'^Last *write *before *reset *(?P<last_write_before_reset>[0-9\:]+), *attempted *(?P<last_write_attempted>[0-9]+), *written *(?P<last_write_written>[0-9]+)$',
+        p13=r'^Second *last *write *before *reset *(?P<second_last_write_before_reset>[0-9\:]+), *attempted *(?P<second_last_write_before_attempted>[0-9]+), written *(?P<second_last_write_before_written>[0-9]+)$',
+        p14=r'^Last *write *pulse *rcvd *(?P<last_write_pulse_rcvd>[a-zA-Z0-9\:\.\s]+) *last *full *not *set *pulse *count *(?P<last_full_not_set_pulse_count>[0-9]+)$',
+        p15=r'^Last +write +pulse +rcvd +before +reset +(?P<last_write_pulse_rcvd_before_reset>[0-9\:]+)$',
+        p15_1=r'^Socket *(?P<socket_status>[a-z\s\,])$',
+        p16=r'^Last *write *thread *event *before *reset *(?P<last_write_thread_event_before_reset>[0-9\:]+), *second *last *(?P<last_write_thread_event_second_last>[0-9\:]+)$',
+        p17=r'^Last *KA *expiry *before *reset *(?P<last_ka_expiry_before_reset>[0-9\:]+), *second *last *(?P<last_ka_expiry_before_second_last>[0-9\:]+)$',
+        p18=r'^Last *KA *error *before *reset *(?P<last_ka_error_before_reset>[0-9\:]+), *KA *not *sent *(?P<last_ka_error_ka_not_sent>[0-9\:]+)$',
+        p19=r'^Last *KA *start *before *reset *(?P<last_ka_start_before_reset>[0-9\:]+), *second *last *(?P<last_ka_start_before_second_last>[0-9\:]+)$',
+        p20=r'^Precedence: *(?P<precedence>[a-z]+)$',
+        p21=r'^Non-stop +routing +is +enabled$',
+        p22=r'^TCP *Initial *Sync :(?: *(?P<tcp_initial_sync>[a-zA-Z0-9\-\s]+))?$',
+        p23=r'^TCP *Initial *Sync *phase *Two :(?: *(?P<tcp_initial_sync_phase_two>[a-zA-Z0-9\-\s]+))?$',
+        p24=r'^TCP *Initial *Sync *Done :(?: *(?P<tcp_initial_sync_done>[a-zA-Z0-9\-\s]+))?$',
+        p25=r'^Enforcing *first *AS is *(?P<enforcing_first_as>[a-z]+)$',
+        p26=r'^Multi-protocol *capability *(?P<multiprotocol_capability>[a-zA-Z\s]+)$',
+        p27=r'^Neighbor +capabilities: +Adv +Rcvd$',
+        p27_1=r'^(Address +family +)?(?P<name>[a-zA-Z0-9\s\-]+): *(?P<adv>(Y|y)es|(N|n)o) *(?P<rcvd>(Y|y)es|(N|n)o+)$',
+        p28=r'^InQ *depth: *(?P<message_stats_input_queue>[0-9]+), *OutQ *depth: *(?P<message_stats_output_queue>[0-9]+)$',
+        p29=r'^(?P<name>[a-zA-Z\s]+) *: *'
+            '(?P<last_sent>\w+ *\d+ *[\d\:\.]+) *'
+            '(?P<sent>[0-9]+) *'
+            '(?P<last_received>\w+ *\d+ *[\d\:\.\-]+) *'
+            '(?P<received>[0-9]+)$',
+        p29_1=r'^(?P<name>[a-zA-Z\s]+) *: *'
+              '(?P<last_sent>[\-]+) *'
+              '(?P<sent>[0-9]+) *'
+              '(?P<last_received>[\-]+) *'
+              '(?P<received>[0-9]+)$',
+        p30=r'^Minimum *time *between *advertisement *runs *is *(?P<minimum_time_between_adv_runs>[0-9]+) *secs$',
+        p31=r'^Inbound *message *logging *enabled, *(?P<inbound_message>[0-9]+) *messages *buffered$',
+        p32=r'^Outbound *message *logging *enabled, *(?P<outbound_message>[0-9]+) *messages *buffered$',
+        p33=r'^For +Address +Family *: +(?P<address_family>[\S\s]+)$',
+        p34=r'^BGP +neighbor +version'
+            ' +(?P<neighbor_version>[0-9]+)$',
+        p35=r'^Update +group: +(?P<update_group>[0-9\.]+) +Filter-group: +(?P<filter_group>[0-9\.]+) +(?P<refresh_request_status>[a-zA-Z\s]+)$',
+        p36=r'^Route *refresh *request: *received *(?P<route_refresh_request_received>[0-9]+), *sent *(?P<route_refresh_request_sent>[0-9]+)$',
+        p37=r'^Policy *for *incoming *advertisements *is *(?P<route_map_name_in>[\w\-\_]+)$',
+        p38=r'^Policy *for *outgoing *advertisements *is *(?P<route_map_name_out>[\w\-\_]+)$',
+        p39=r'^(?P<accepted_prefixes>[0-9]+) *accepted *prefixes, *(?P<best_paths>[0-9]+) *are *bestpaths$',
+        p40=r'^Exact *no\. *of *prefixes *denied *: *(?P<exact_no_prefixes_denied>[0-9]+)\.$',
+        p41=r'^Cumulative *no\. *of *prefixes *denied: *(?P<cummulative_no_prefixes_denied>[0-9]+)\.$',
+        p42=r'^No *policy: *(?P<cummulative_no_no_policy>[0-9]+), *Failed *RT *match: *(?P<cummulative_no_failed_rt_match>[0-9]+)$',
+        p43=r'^By *ORF *policy: *(?P<cummulative_no_by_orf_policy>[0-9]+), *By *policy: *(?P<cummulative_no_by_policy>[0-9]+)$',
+        p44=r'^Prefix +advertised +(?P<prefix_advertised>[0-9]+), +suppressed +(?P<prefix_suppressed>[0-9]+), +withdrawn +(?P<prefix_withdrawn>[0-9]+)$',
+        p45=r'^Maximum +prefixes +allowed'
+            ' +(?P<maximum_prefix_max_prefix_no>[0-9]+)$',
+        p46=r'^Threshold +for +(?P<warn>warning)? *message +(?P<threshold_warning_message>[0-9\%]+), +restart +interval +(?P<threshold_restart_interval>[0-9]+) +min$',
+        p47=r'^An *EoR *(?P<eor_status>[a-z\-\s]+)$',
+        p48=r'^Last *ack *version *(?P<last_ack_version>[0-9]+), *Last *synced *ack *version *(?P<last_synced_ack_version>[0-9]+)$',
+        p49=r'^Outstanding +version +objects: +current +(?P<outstanding_version_objects_current>[0-9]+), +max +(?P<outstanding_version_objects_max>[0-9]+)$',
+        p50=r'^Additional-paths +operation: +(?P<additional_paths_operation>[a-zA-Z]+)$',
+        p50_1=r'^Advertise +routes +with +local-label +via +(?P<additional_routes_local_label>[a-zA-Z\s]+)$',
+        p50_2=r'^Send +Multicast +Attributes$',
+        p51=r'^Connections *(?P<bgp_state>\w+) *'
+            '(?P<num>[0-9]+)\; *dropped *(?P<connections_dropped>[0-9]+)$',
+        p52=r'^Local *host: *(?P<local_host>[\w\.\:]+), *Local *port: *(?P<local_port>[0-9]+), *IF *Handle: *(?P<if_handle>[a-z0-9]+)$',
+        p53=r'^Foreign *host: *(?P<foreign_host>[\w\.\:]+), *Foreign *port: *(?P<foreign_port>[0-9]+)$',
+        p54=r'^Last *reset *(?P<last_reset>[0-9\:]+)$',
+        p55=r'^Capability +4-byte-as +suppress +is +configured$',
+        p56=r'^Description: +(?P<description>[\w\s\,\.\:\-]+)$',
+        p57=r'^Private +AS +number +removed +from +updates +to +this +neighbor$',
+        p58=r'^Administratively +shut +down$',
+        p59=r'^External +BGP +neighbor +may +be +up +to +'
+            '(?P<hop>\d+) +hops +away$',
+        p60=r'^TCP +open +mode: +(?P<mode>[\w\s]+)$',
+        p61=r'^My +AS +number +is +allowed +(?P<num>\d+) +'
+            'times +in +received +updates$',
+        p62=r'^Route\-Reflector +Client$',
+        p63=r'^(?P<send_com>\w+) +community +attribute +sent +to +this +neighbor$',
+        p64=r'^Inbound +soft +reconfiguration +allowed$',
+        p65=r'^AS +override +is +set$',
+        p66=r'^Default +information +originate: +(?P<route_map>[\w\s\-]:)$',
+        p67=r'^site\-of\-origin +(?P<soo>[\w\:]+)$',
+    )
+
     def cli(self, vrf_type='all', vrf='all', instance='all', neighbor='', address_family='', output=None):
         assert vrf_type in ['all', 'vrf']
         assert address_family in ['', 'ipv4 unicast', 'ipv6 unicast']
@@ -2506,109 +2632,13 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             out = output
         # Init variables
         ret_dict = {}
-        p1 = re.compile(r'^BGP +instance +(?P<instance_number>[0-9]+): +'
-                            '(?P<instance>[a-zA-Z0-9\-\_\']+)$')
-        p2 =  re.compile(r'^\s*BGP +neighbor +is +(?P<neighbor>[a-zA-Z0-9\.\:]+)$')
-        p2_1 =  re.compile(r'^\s*BGP +neighbor +is +(?P<neighbor>[a-zA-Z0-9\.\:]+), +vrf +(?P<vrf>\S+)$')
-        p3 = re.compile(r'^Remote +AS +(?P<remote_as>[0-9]+), +local +AS'
-                            ' +(?P<local_as_as_no>[0-9]+)'
-                            '(?:, +(?P<link_state>[a-zA-Z\s]+))?$')
-        p4 = re.compile(r'^Remote *router *ID *(?P<router_id>[a-zA-Z0-9\.\:]+)$')
-        p5 = re.compile(r'^\s*BGP +state += +(?P<session_state>[a-zA-Z0-9]+)'
-                            '(?:, +up +for +(?P<up_time>[\w\:]+))?$')
-        p5_1 = re.compile(r'^\s*BGP +state += +(?P<session_state>[a-zA-Z0-9]+)(?:(?P<reason>.*))')
-        p6 = re.compile(r'^NSR *State: *(?P<nsr_state>[a-zA-Z]+)$')
-        p7 = re.compile(r'^Last *read *(?P<last_read>[0-9\:]+), *Last *read *before *reset *(?P<last_read_before_reset>[0-9\:]+)$')
-        p8 = re.compile(r'^Hold +time +is +(?P<holdtime>[0-9]+), +keepalive'
-                            ' +interval +is +(?P<keepalive_interval>[0-9]+)'
-                            ' +seconds$')
-        p9 = re.compile(r'^Configured +hold +time:'
-                            ' +(?P<holdtime>[0-9]+), +keepalive:'
-                            ' +(?P<keepalive_interval>[0-9]+), +min'
-                            ' +acceptable +hold +time:'
-                            ' +(?P<min_acceptable_hold_time>[0-9]+)$')
-        p10 = re.compile(r'^Last *write *(?P<last_write>[0-9\:]+), *attempted *(?P<attempted>[0-9]+), *written *(?P<written>[0-9]+)$')
-        p11 = re.compile(r'^Second *last *write *(?P<second_last_write>[0-9\:]+), *attempted *(?P<second_attempted>[0-9]+), *written *(?P<second_written>[0-9]+)$')
-        p12 = re.compile(r'^Last *write *before *reset *(?P<last_write_before_reset>[0-9\:]+), *attempted *(?P<last_write_attempted>[0-9]+), *written *(?P<last_write_written>[0-9]+)$')
-        p13 = re.compile(r'^Second *last *write *before *reset *(?P<second_last_write_before_reset>[0-9\:]+), *attempted *(?P<second_last_write_before_attempted>[0-9]+), written *(?P<second_last_write_before_written>[0-9]+)$')
-        p14 =  re.compile(r'^Last *write *pulse *rcvd *(?P<last_write_pulse_rcvd>[a-zA-Z0-9\:\.\s]+) *last *full *not *set *pulse *count *(?P<last_full_not_set_pulse_count>[0-9]+)$')
-        p15 = re.compile(r'^Last +write +pulse +rcvd +before +reset +(?P<last_write_pulse_rcvd_before_reset>[0-9\:]+)$')
-        p15_1 = re.compile(r'^Socket *(?P<socket_status>[a-z\s\,])$')
-        p16 =  re.compile(r'^Last *write *thread *event *before *reset *(?P<last_write_thread_event_before_reset>[0-9\:]+), *second *last *(?P<last_write_thread_event_second_last>[0-9\:]+)$')
-        p17 = re.compile(r'^Last *KA *expiry *before *reset *(?P<last_ka_expiry_before_reset>[0-9\:]+), *second *last *(?P<last_ka_expiry_before_second_last>[0-9\:]+)$')
-        p18 = re.compile(r'^Last *KA *error *before *reset *(?P<last_ka_error_before_reset>[0-9\:]+), *KA *not *sent *(?P<last_ka_error_ka_not_sent>[0-9\:]+)$')
-        p19 =  re.compile(r'^Last *KA *start *before *reset *(?P<last_ka_start_before_reset>[0-9\:]+), *second *last *(?P<last_ka_start_before_second_last>[0-9\:]+)$')
-        p20 =  re.compile(r'^Precedence: *(?P<precedence>[a-z]+)$')
-        p21 =  re.compile(r'^Non-stop +routing +is +enabled$')
-        p22 =  re.compile(r'^TCP *Initial *Sync :(?: *(?P<tcp_initial_sync>[a-zA-Z0-9\-\s]+))?$')
-        p23 = re.compile(r'^TCP *Initial *Sync *phase *Two :(?: *(?P<tcp_initial_sync_phase_two>[a-zA-Z0-9\-\s]+))?$')
-        p24 = re.compile(r'^TCP *Initial *Sync *Done :(?: *(?P<tcp_initial_sync_done>[a-zA-Z0-9\-\s]+))?$')
-        p25 = re.compile(r'^Enforcing *first *AS is *(?P<enforcing_first_as>[a-z]+)$')
-        p26 =  re.compile(r'^Multi-protocol *capability *(?P<multiprotocol_capability>[a-zA-Z\s]+)$')
-        p27 = re.compile(r'^Neighbor +capabilities: +Adv +Rcvd$')
-        p27_1= re.compile(r'^(Address +family +)?(?P<name>[a-zA-Z0-9\s\-]+): *(?P<adv>(Y|y)es|(N|n)o) *(?P<rcvd>(Y|y)es|(N|n)o+)$')
-        p28 = re.compile(r'^InQ *depth: *(?P<message_stats_input_queue>[0-9]+), *OutQ *depth: *(?P<message_stats_output_queue>[0-9]+)$')
-        p29 = re.compile(r'^(?P<name>[a-zA-Z\s]+) *: *'
-                            '(?P<last_sent>\w+ *\d+ *[\d\:\.]+) *'
-                            '(?P<sent>[0-9]+) *'
-                            '(?P<last_received>\w+ *\d+ *[\d\:\.\-]+) *'
-                            '(?P<received>[0-9]+)$')
-        p29_1 = re.compile(r'^(?P<name>[a-zA-Z\s]+) *: *'
-                            '(?P<last_sent>[\-]+) *'
-                            '(?P<sent>[0-9]+) *'
-                            '(?P<last_received>[\-]+) *'
-                            '(?P<received>[0-9]+)$')
-        p30 = re.compile(r'^Minimum *time *between *advertisement *runs *is *(?P<minimum_time_between_adv_runs>[0-9]+) *secs$')
-        p31 = re.compile(r'^Inbound *message *logging *enabled, *(?P<inbound_message>[0-9]+) *messages *buffered$')
-        p32 = re.compile(r'^Outbound *message *logging *enabled, *(?P<outbound_message>[0-9]+) *messages *buffered$')
-        p33 = re.compile(r'^For +Address +Family *: +(?P<address_family>[\S\s]+)$')
-        p34 = re.compile(r'^BGP +neighbor +version'
-                            ' +(?P<neighbor_version>[0-9]+)$')
-        p35 = re.compile(r'^Update +group: +(?P<update_group>[0-9\.]+) +Filter-group: +(?P<filter_group>[0-9\.]+) +(?P<refresh_request_status>[a-zA-Z\s]+)$')
-        p36 = re.compile(r'^Route *refresh *request: *received *(?P<route_refresh_request_received>[0-9]+), *sent *(?P<route_refresh_request_sent>[0-9]+)$')
-        p37 = re.compile(r'^Policy *for *incoming *advertisements *is *(?P<route_map_name_in>[\w\-\_]+)$')
-        p38 = re.compile(r'^Policy *for *outgoing *advertisements *is *(?P<route_map_name_out>[\w\-\_]+)$')
-        p39 = re.compile(r'^(?P<accepted_prefixes>[0-9]+) *accepted *prefixes, *(?P<best_paths>[0-9]+) *are *bestpaths$')
-        p40 = re.compile(r'^Exact *no\. *of *prefixes *denied *: *(?P<exact_no_prefixes_denied>[0-9]+)\.$')
-        p41 = re.compile(r'^Cumulative *no\. *of *prefixes *denied: *(?P<cummulative_no_prefixes_denied>[0-9]+)\.$')
-        p42 = re.compile(r'^No *policy: *(?P<cummulative_no_no_policy>[0-9]+), *Failed *RT *match: *(?P<cummulative_no_failed_rt_match>[0-9]+)$')
-        p43 = re.compile(r'^By *ORF *policy: *(?P<cummulative_no_by_orf_policy>[0-9]+), *By *policy: *(?P<cummulative_no_by_policy>[0-9]+)$')
-        p44 = re.compile(r'^Prefix +advertised +(?P<prefix_advertised>[0-9]+), +suppressed +(?P<prefix_suppressed>[0-9]+), +withdrawn +(?P<prefix_withdrawn>[0-9]+)$')
-        p45 = re.compile(r'^Maximum +prefixes +allowed'
-                        ' +(?P<maximum_prefix_max_prefix_no>[0-9]+)$')
-        p46 = re.compile(r'^Threshold +for +(?P<warn>warning)? *message +(?P<threshold_warning_message>[0-9\%]+), +restart +interval +(?P<threshold_restart_interval>[0-9]+) +min$')
-        p47 = re.compile(r'^An *EoR *(?P<eor_status>[a-z\-\s]+)$')
-        p48 = re.compile(r'^Last *ack *version *(?P<last_ack_version>[0-9]+), *Last *synced *ack *version *(?P<last_synced_ack_version>[0-9]+)$')
-        p49 = re.compile(r'^Outstanding +version +objects: +current +(?P<outstanding_version_objects_current>[0-9]+), +max +(?P<outstanding_version_objects_max>[0-9]+)$')
-        p50 = re.compile(r'^Additional-paths +operation: +(?P<additional_paths_operation>[a-zA-Z]+)$')
-        p50_1 = re.compile(r'^Advertise +routes +with +local-label +via +(?P<additional_routes_local_label>[a-zA-Z\s]+)$')
-        p50_2 = re.compile(r'^Send +Multicast +Attributes$')
-        p51 = re.compile(r'^Connections *(?P<bgp_state>\w+) *'
-                            '(?P<num>[0-9]+)\; *dropped *(?P<connections_dropped>[0-9]+)$')
-        p52 = re.compile(r'^Local *host: *(?P<local_host>[\w\.\:]+), *Local *port: *(?P<local_port>[0-9]+), *IF *Handle: *(?P<if_handle>[a-z0-9]+)$')
-        p53 = re.compile(r'^Foreign *host: *(?P<foreign_host>[\w\.\:]+), *Foreign *port: *(?P<foreign_port>[0-9]+)$')
-        p54 = re.compile(r'^Last *reset *(?P<last_reset>[0-9\:]+)$')
-        p55 = re.compile(r'^Capability +4-byte-as +suppress +is +configured$')
-        p56 = re.compile(r'^Description: +(?P<description>[\w\s\,\.\:\-]+)$')
-        p57 = re.compile(r'^Private +AS +number +removed +from +updates +to +this +neighbor$')
-        p58 = re.compile(r'^Administratively +shut +down$')
-        p59 = re.compile(r'^External +BGP +neighbor +may +be +up +to +'
-                            '(?P<hop>\d+) +hops +away$')
-        p60 = re.compile(r'^TCP +open +mode: +(?P<mode>[\w\s]+)$')
-        p61 = re.compile(r'^My +AS +number +is +allowed +(?P<num>\d+) +'
-                            'times +in +received +updates$')
-        p62 = re.compile(r'^Route\-Reflector +Client$')
-        p63 = re.compile(r'^(?P<send_com>\w+) +community +attribute +sent +to +this +neighbor$')
-        p64 = re.compile(r'^Inbound +soft +reconfiguration +allowed$')
-        p65 = re.compile(r'^AS +override +is +set$')
-        p66 = re.compile(r'^Default +information +originate: +(?P<route_map>[\w\s\-]:)$')
-        p67 = re.compile(r'^site\-of\-origin +(?P<soo>[\w\:]+)$')
+        p = ShowBgpInstanceNeighborsDetail.patterns
         for line in out.splitlines():
             line = line.strip()
 
             # BGP instance 0: 'default'
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 instance = str(m.groupdict()['instance'])
                 instance_number = int(m.groupdict()['instance_number'])
@@ -2619,7 +2649,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # BGP neighbor is 10.16.2.2
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 neighbor = str(m.groupdict()['neighbor'])
                 vrf = 'default'
@@ -2639,7 +2669,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # BGP neighbor is 10.1.5.5, vrf VRF1
 
-            m = p2_1.match(line)
+            m = p.p2_1.match(line)
             if m:
                 neighbor = str(m.groupdict()['neighbor'])
                 vrf = str(m.groupdict()['vrf'])
@@ -2663,7 +2693,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
                 continue
             
             # Remote AS 200, local AS 100, external link
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 sub_dict['remote_as'] = int(m.groupdict()['remote_as'])
                 if m.groupdict()['link_state']:
@@ -2678,7 +2708,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Remote router ID 10.1.5.5
 
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 router_id = str(m.groupdict()['router_id'])
 
@@ -2687,7 +2717,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # BGP state = Established, up for 00:53:54
 
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 session_state = str(m.groupdict()['session_state']).lower()
 
@@ -2698,7 +2728,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # BGP state = Idle (No route to multi-hop neighbor)
 
-            m = p5_1.match(line)
+            m = p.p5_1.match(line)
             if m:
                 session_state = str(m.groupdict()['session_state']).lower()
                 sub_dict['session_state'] = session_state
@@ -2708,7 +2738,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # NSR State: None
 
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 nsr_state = str(m.groupdict()['nsr_state'])
 
@@ -2717,7 +2747,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Last read 00:00:51, Last read before reset 00:00:00
 
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 last_read = str(m.groupdict()['last_read'])
                 last_read_before_reset = str(m.groupdict()['last_read_before_reset'])
@@ -2728,7 +2758,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Hold time is 180, keepalive interval is 60 seconds
 
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 sub_dict['holdtime'] = int(m.groupdict()['holdtime'])
                 sub_dict['keepalive_interval'] = \
@@ -2737,7 +2767,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Configured hold time: 180, keepalive: 60, min acceptable hold time: 3
 
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 sub_dict['holdtime'] = int(m.groupdict()['holdtime'])
                 sub_dict['keepalive_interval'] = \
@@ -2748,7 +2778,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Last write 00:00:38, attempted 19, written 19
 
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 last_write = str(m.groupdict()['last_write'])
                 attempted = int(m.groupdict()['attempted'])
@@ -2761,7 +2791,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Second last write 00:01:38, attempted 19, written 19
 
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 second_last_write = str(m.groupdict()['second_last_write'])
                 second_attempted = int(m.groupdict()['second_attempted'])
@@ -2774,7 +2804,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Last write before reset 00:00:00, attempted 0, written 0
 
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 last_write_before_reset = str(m.groupdict()['last_write_before_reset'])
                 last_write_attempted = int(m.groupdict()['last_write_attempted'])
@@ -2787,7 +2817,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Second last write before reset 00:00:00, attempted 0, written 0
 
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 second_last_write_before_reset =  str(m.groupdict()['second_last_write_before_reset'])
                 second_last_write_before_attempted = int(m.groupdict()['second_last_write_before_attempted'])
@@ -2800,7 +2830,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Last write pulse rcvd  Jun 28 19:17:44.716 last full not set pulse count 113
 
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 last_write_pulse_rcvd = str(m.groupdict()['last_write_pulse_rcvd'])
                 last_full_not_set_pulse_count = int(m.groupdict()['last_full_not_set_pulse_count'])
@@ -2811,7 +2841,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Last write pulse rcvd before reset 00:00:00
 
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 last_write_pulse_rcvd_before_reset = str(m.groupdict()['last_write_pulse_rcvd_before_reset'])
 
@@ -2820,7 +2850,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Socket not armed for io, armed for read, armed for write
 
-            m = p15_1.match(line)
+            m = p.p15_1.match(line)
             if m:
                 socket_status = str(m.groupdict()['socket_status'])
 
@@ -2829,7 +2859,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Last write thread event before reset 00:00:00, second last 00:00:00
 
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 last_write_thread_event_before_reset = str(m.groupdict()['last_write_thread_event_before_reset'])
                 last_write_thread_event_second_last = str(m.groupdict()['last_write_thread_event_second_last'])
@@ -2840,7 +2870,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Last KA expiry before reset 00:00:00, second last 00:00:00
 
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 last_ka_expiry_before_reset =  str(m.groupdict()['last_ka_expiry_before_reset'])
                 last_ka_expiry_before_second_last = str(m.groupdict()['last_ka_expiry_before_second_last'])
@@ -2851,7 +2881,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Last KA error before reset 00:00:00, KA not sent 00:00:00
 
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 last_ka_error_before_reset = str(m.groupdict()['last_ka_error_before_reset'])
                 last_ka_error_ka_not_sent = str(m.groupdict()['last_ka_error_ka_not_sent'])
@@ -2862,7 +2892,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             
             # Last KA start before reset 00:00:00, second last 00:00:00
 
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 last_ka_start_before_reset = str(m.groupdict()['last_ka_start_before_reset'])
                 last_ka_start_before_second_last = str(m.groupdict()['last_ka_start_before_second_last'])
@@ -2872,7 +2902,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
                 continue
 
             # Precedence: internet
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 precedence = str(m.groupdict()['precedence'])
 
@@ -2881,14 +2911,14 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Non-stop routing is enabled
 
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 sub_dict['non_stop_routing'] = True
                 continue
 
             # TCP Initial Sync :              ---                   
 
-            m = p22.match(line)
+            m = p.p22.match(line)
             if m:
                 tcp_initial_sync = str(m.groupdict()['tcp_initial_sync'])
 
@@ -2897,7 +2927,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # TCP Initial Sync Phase Two :    ---
 
-            m = p23.match(line)
+            m = p.p23.match(line)
             if m:
                 tcp_initial_sync_phase_two = str(m.groupdict()['tcp_initial_sync_phase_two'])
 
@@ -2905,7 +2935,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
                 continue
 
             # TCP Initial Sync Done :         ---
-            m = p24.match(line)
+            m = p.p24.match(line)
             if m:
                 tcp_initial_sync_done = str(m.groupdict()['tcp_initial_sync_done']) 
 
@@ -2914,7 +2944,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             
             # Enforcing first AS is enabled
 
-            m = p25.match(line)
+            m = p.p25.match(line)
             if m:
                 enforcing_first_as = str(m.groupdict()['enforcing_first_as'])
 
@@ -2923,7 +2953,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Multi-protocol capability not received
 
-            m = p26.match(line)
+            m = p.p26.match(line)
             if m:
                 multiprotocol_capability = str(m.groupdict()['multiprotocol_capability'])
 
@@ -2932,7 +2962,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Neighbor capabilities:            Adv         Rcvd
 
-            m = p27.match(line)
+            m = p.p27.match(line)
             if m:
                 if 'bgp_negotiated_capabilities' not in sub_dict:
                     sub_dict['bgp_negotiated_capabilities'] = {}
@@ -2941,7 +2971,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             #    4-byte AS:                      Yes         No
             #    Address family IPv4 Unicast:    Yes         Yes
 
-            m = p27_1.match(line)
+            m = p.p27_1.match(line)
             if m:
                 name = m.groupdict()['name'].lower()
                 adv = 'advertised' if m.groupdict()['adv'].lower() == 'yes' else ''
@@ -2966,7 +2996,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             #  Message stats:
             #    InQ depth: 0, OutQ depth: 0
 
-            m = p28.match(line)
+            m = p.p28.match(line)
             if m:
                 message_stats_output_queue = int(m.groupdict()['message_stats_output_queue'])
                 message_stats_input_queue = int(m.groupdict()['message_stats_input_queue'])
@@ -2984,10 +3014,10 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             #    Route_Refresh:  ---                        0  ---                        0
             #    Total:                                    58                            56
 
-            m = p29.match(line)
+            m = p.p29.match(line)
 
 
-            m1 = p29_1.match(line)
+            m1 = p.p29_1.match(line)
             if m or m1:
                 if 'bgp_neighbor_counters' not in sub_dict:
                     sub_dict['bgp_neighbor_counters'] = {}
@@ -3009,7 +3039,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Minimum time between advertisement runs is 0 secs
 
-            m = p30.match(line)
+            m = p.p30.match(line)
             if m:
                 minimum_time_between_adv_runs = int(m.groupdict()['minimum_time_between_adv_runs'])
 
@@ -3018,7 +3048,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Inbound message logging enabled, 3 messages buffered
 
-            m = p31.match(line)
+            m = p.p31.match(line)
             if m:
                 inbound_message = str(m.groupdict()['inbound_message'])
 
@@ -3027,7 +3057,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Outbound message logging enabled, 3 messages buffered
 
-            m =p32.match(line)
+            m =p.p32.match(line)
             if m:
                 outbound_message = str(m.groupdict()['outbound_message'])
 
@@ -3036,7 +3066,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # For Address Family: IPv4 Unicast
 
-            m = p33.match(line)            
+            m = p.p33.match(line)            
             if m:
                 address_family = str(m.groupdict()['address_family']).lower()
                 address_family.strip()
@@ -3049,7 +3079,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             
             # BGP neighbor version 43
 
-            m = p34.match(line)
+            m = p.p34.match(line)
             if m:
                 sub_dict['address_family'][address_family]['neighbor_version'] =\
                     int(m.groupdict()['neighbor_version'])
@@ -3057,7 +3087,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             
             # Update group: 0.2 Filter-group: 0.2  No Refresh request being processed
 
-            m = p35.match(line)
+            m = p.p35.match(line)
             if m:
                 update_group = str(m.groupdict()['update_group'])
                 filter_group = str(m.groupdict()['filter_group'])
@@ -3070,7 +3100,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Route refresh request: received 0, sent 0
 
-            m = p36.match(line)
+            m = p.p36.match(line)
             if m:
                 route_refresh_request_received = int(m.groupdict()['route_refresh_request_received'])
                 route_refresh_request_sent = int(m.groupdict()['route_refresh_request_sent'])
@@ -3081,7 +3111,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Policy for incoming advertisements is all-pass
 
-            m = p37.match(line)
+            m = p.p37.match(line)
             if m:
                 route_map_name_in = m.groupdict()['route_map_name_in']
 
@@ -3090,7 +3120,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Policy for outgoing advertisements is all-pass
 
-            m = p38.match(line)
+            m = p.p38.match(line)
             if m:
                 route_map_name_out = m.groupdict()['route_map_name_out']
 
@@ -3099,7 +3129,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # 0 accepted prefixes, 0 are bestpaths
 
-            m = p39.match(line)
+            m = p.p39.match(line)
             if m:
                 accepted_prefixes = int(m.groupdict()['accepted_prefixes'])
                 best_paths = int(m.groupdict()['best_paths'])
@@ -3110,7 +3140,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Exact no. of prefixes denied : 0.
 
-            m = p40.match(line)
+            m = p.p40.match(line)
             if m:
                 exact_no_prefixes_denied = int(m.groupdict()['exact_no_prefixes_denied'])
 
@@ -3119,7 +3149,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             
             # Cumulative no. of prefixes denied: 5.
 
-            m = p41.match(line)
+            m = p.p41.match(line)
             if m:
                 cummulative_no_prefixes_denied = int(m.groupdict()['cummulative_no_prefixes_denied'])
 
@@ -3128,7 +3158,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # No policy: 5, Failed RT match: 0
 
-            m = p42.match(line)
+            m = p.p42.match(line)
             if m:
                 cummulative_no_no_policy = int(m.groupdict()['cummulative_no_no_policy'])
                 cummulative_no_failed_rt_match = int(m.groupdict()['cummulative_no_failed_rt_match'])
@@ -3139,7 +3169,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # By ORF policy: 0, By policy: 0
 
-            m = p43.match(line)
+            m = p.p43.match(line)
             if m:
                 cummulative_no_by_orf_policy = int(m.groupdict()['cummulative_no_by_orf_policy'])
                 cummulative_no_by_policy = int(m.groupdict()['cummulative_no_by_policy'])
@@ -3150,7 +3180,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Prefix advertised 10, suppressed 0, withdrawn 0
 
-            m = p44.match(line)
+            m = p.p44.match(line)
             if m:
                 prefix_advertised = int(m.groupdict()['prefix_advertised'])
                 prefix_suppressed = int(m.groupdict()['prefix_suppressed'])
@@ -3163,7 +3193,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Maximum prefixes allowed 1048576
 
-            m = p45.match(line)
+            m = p.p45.match(line)
             if m:
                 sub_dict['address_family'][address_family]\
                     ['maximum_prefix_max_prefix_no'] = \
@@ -3172,7 +3202,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Threshold for warning message 75%, restart interval 0 min
 
-            m = p46.match(line)
+            m = p.p46.match(line)
             if m:
                 threshold_warning_message = m.groupdict()['threshold_warning_message']
                 threshold_restart_interval = int(m.groupdict()['threshold_restart_interval'])
@@ -3184,7 +3214,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # An EoR was not received during read-only mode
 
-            m = p47.match(line)
+            m = p.p47.match(line)
             if m:
                 eor_status = str(m.groupdict()['eor_status'])
 
@@ -3193,7 +3223,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Last ack version 43, Last synced ack version 0
 
-            m = p48.match(line)
+            m = p.p48.match(line)
             if m:
                 last_synced_ack_version = int(m.groupdict()['last_synced_ack_version'])
                 last_ack_version = int(m.groupdict()['last_ack_version'])
@@ -3204,7 +3234,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             
             # Outstanding version objects: current 0, max 1
 
-            m = p49.match(line)
+            m = p.p49.match(line)
             if m:
                 outstanding_version_objects_current = int(m.groupdict()['outstanding_version_objects_current'])
                 outstanding_version_objects_max = int(m.groupdict()['outstanding_version_objects_max'])
@@ -3215,7 +3245,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Additional-paths operation: None
 
-            m = p50.match(line)
+            m = p.p50.match(line)
             if m:
                 additional_paths_operation = str(m.groupdict()['additional_paths_operation'])
 
@@ -3224,7 +3254,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Advertise routes with local-label via Unicast SAFI
 
-            m = p50_1.match(line)
+            m = p.p50_1.match(line)
             if m:
                 additional_routes_local_label = str(m.groupdict()['additional_routes_local_label'])
 
@@ -3232,14 +3262,14 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
                 continue
 
             # Send Multicast Attributes
-            m = p50_2.match(line)
+            m = p.p50_2.match(line)
             if m:
                 sub_dict['address_family'][address_family]['send_multicast_attributes'] = True
                 continue
 
             # Connections established 1; dropped 0
 
-            m = p51.match(line)
+            m = p.p51.match(line)
             if m:
                 if 'bgp_session_transport' not in sub_dict:
                     sub_dict['bgp_session_transport'] = {}
@@ -3258,7 +3288,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Local host: 10.1.5.1, Local port: 179, IF Handle: 0x00000060
 
-            m = p52.match(line)
+            m = p.p52.match(line)
             if m:
                 if 'bgp_session_transport' not in sub_dict:
                     sub_dict['bgp_session_transport'] = {}
@@ -3276,7 +3306,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Foreign host: 10.1.5.5, Foreign port: 11052
 
-            m = p53.match(line)
+            m = p.p53.match(line)
             if m:
                 if 'bgp_session_transport' not in sub_dict:
                     sub_dict['bgp_session_transport'] = {}
@@ -3292,7 +3322,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Last reset 00:00:00
 
-            m = p54.match(line)
+            m = p.p54.match(line)
             if m:
                 if 'bgp_session_transport' not in sub_dict:
                     sub_dict['bgp_session_transport'] = {}
@@ -3312,34 +3342,34 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Capability 4-byte-as suppress is configured
 
-            m = p55.match(line)
+            m = p.p55.match(line)
             if m:
                 sub_dict['suppress_four_byte_as_capability'] = True
                 continue
 
             # Description: PEER
 
-            m = p56.match(line)
+            m = p.p56.match(line)
             if m:
                 sub_dict['description'] = m.groupdict()['description']
                 
             # Private AS number removed from updates to this neighbor
 
-            m = p57.match(line)
+            m = p.p57.match(line)
             if m:
                 sub_dict['remove_private_as'] = True
                 continue
                 
             # Administratively shut down
 
-            m = p58.match(line)
+            m = p.p58.match(line)
             if m:
                 sub_dict['shutdown'] = True
                 continue
                 
             # External BGP neighbor may be up to 222 hops away
 
-            m = p59.match(line)
+            m = p.p59.match(line)
             if m:
                 sub_dict['ebgp_multihop'] = True
                 sub_dict['ebgp_multihop_max_hop'] = int(m.groupdict()['hop'])
@@ -3347,7 +3377,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # TCP open mode: passive only
 
-            m = p60.match(line)
+            m = p.p60.match(line)
             if m:
                 if 'bgp_session_transport' not in sub_dict:
                     sub_dict['bgp_session_transport'] = {}
@@ -3363,7 +3393,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # My AS number is allowed 3 times in received updates
 
-            m = p61.match(line)
+            m = p.p61.match(line)
             if m:
                 sub_dict['address_family'][address_family]['allowas_in'] = True
                 sub_dict['address_family'][address_family]['allowas_in_as_number'] = \
@@ -3372,14 +3402,14 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Route-Reflector Client
 
-            m = p62.match(line)
+            m = p.p62.match(line)
             if m:
                 sub_dict['address_family'][address_family]['route_reflector_client'] = True
                 continue
 
             # Extended community attribute sent to this neighbor
 
-            m = p63.match(line)
+            m = p.p63.match(line)
             if m:
                 sub_dict['address_family'][address_family]['send_community'] = \
                     m.groupdict()['send_com'].lower()
@@ -3387,21 +3417,21 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Inbound soft reconfiguration allowed
 
-            m = p64.match(line)
+            m = p.p64.match(line)
             if m:
                 sub_dict['address_family'][address_family]['soft_configuration'] = True
                 continue
 
             # AS override is set
 
-            m = p65.match(line)
+            m = p.p65.match(line)
             if m:
                 sub_dict['address_family'][address_family]['as_override'] = True
                 continue
 
             # Default information originate: default sent
 
-            m = p66.match(line)
+            m = p.p66.match(line)
             if m:
                 sub_dict['address_family'][address_family]['default_originate'] = True
                 sub_dict['address_family'][address_family]['default_originate_route_map'] = \
@@ -3410,7 +3440,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # site-of-origin 100:100
 
-            m = p67.match(line)
+            m = p.p67.match(line)
             if m:
                 sub_dict['address_family'][address_family]['soo'] = m.groupdict()['soo']
                 continue
@@ -3540,6 +3570,41 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
                    'show bgp instance {instance} {vrf_type} {vrf} {address_family} neighbors {neighbor} {route_type}',
                    'show bgp instance {instance} {vrf_type} {vrf} neighbors {neighbor} {route_type}']
 
+    patterns = Patterns(
+        p1=r'^BGP *instance *(?P<instance_number>[0-9]+): *(?P<instance>[a-zA-Z0-9\-\_\']+)$',
+        p15=r'^BGP *VRF *(?P<vrf>[a-zA-Z0-9]+), *'
+            'state: *(?P<state>[a-zA-Z]+)$',
+        p15_1=r'^BGP Route Distinguisher: *(?P<route_distinguisher>\S+)',
+        p16=r'^\s*VRF *ID: *(?P<vrf_id>[a-z0-9]+)$',
+        p2=r'^Address *Family: *(?P<address_family>[a-zA-Z0-9\s]+)$',
+        p3=r'^BGP *router *identifier *(?P<router_identifier>[0-9\.]+), *local *AS *number *(?P<local_as>[0-9]+)$',
+        p4=r'^BGP *generic *scan *interval *(?P<generic_scan_interval>[0-9]+) +secs$',
+        p5=r'^(?P<non_stop_routing>(Non-stop routing is enabled))$',
+        p6=r'^BGP *table *state: *(?P<table_state>[a-zA-Z]+)$',
+        p7=r'^Table *ID: *(?P<table_id>[a-z0-9]+) *RD *version: *(?P<rd_version>[0-9]+)$',
+        p8=r'^BGP *main *routing *table *version *(?P<bgp_table_version>[0-9]+)$',
+        p9=r'^BGP *NSR *Initial *initsync *version *(?P<nsr_initial_initsync_version>[0-9]+) *\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$',
+        p10=r'^BGP *NSR/ISSU *Sync-Group *versions *(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$',
+        p11=r'^BGP *scan *interval *(?P<scan_interval>[0-9\S]+) *secs$',
+        p12=r'^Route +Distinguisher: *(?P<route_distinguisher>\S+) *'
+            '(\(default +for +vrf +(?P<default_vrf>[a-zA-Z0-9]+)\))?$',
+        p13=r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)? *'
+            '(?P<prefix>(?P<ip>[\w\.\:\/\[\]]+)\/(?P<mask>\d+))?( +'
+            '(?P<next_hop>[\w\.\:]+) *(?P<number>[\d\s\{\}]+)?'
+            '(?: *(?P<origin_codes>(i|e|\?)))?)?$',
+        p13_1=r'(?P<path>[\d\s]+)'
+              ' *(?P<origin_codes>(i|e|\?))?$',
+
+        p14=r'^Processed *(?P<processed_prefixes>[0-9]+) *'
+            'prefixes, *(?P<processed_paths>[0-9]+) *paths$',
+
+        #    Network            Next Hop            Metric LocPrf Weight Path
+        #                       10.4.1.1                    100      0    i
+        p17=r'^(?P<next_hop>[\w\.\:]+) +((?P<metric>[0-9]+))? +'
+            '(?P<locprf>[0-9]+) +(?P<weight>[0-9]+) '
+            '*(?P<path>[\S]+)$',
+    )
+
     def cli(self, vrf_type='all', neighbor='', vrf='all', instance='all', address_family='', route_type='received routes', output=None):
 
         assert vrf_type in ['all', 'vrf']
@@ -3586,38 +3651,7 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
         # handle route table name
         routes = 'received' if 'received' in route_type else 'routes'
-        p1 = re.compile(r'^BGP *instance *(?P<instance_number>[0-9]+): *(?P<instance>[a-zA-Z0-9\-\_\']+)$')
-        p15 = re.compile(r'^BGP *VRF *(?P<vrf>[a-zA-Z0-9]+), *'
-                            'state: *(?P<state>[a-zA-Z]+)$')
-        p15_1 = re.compile(r'^BGP Route Distinguisher: *(?P<route_distinguisher>\S+)')
-        p16 = re.compile(r'^\s*VRF *ID: *(?P<vrf_id>[a-z0-9]+)$')
-        p2 = re.compile(r'^Address *Family: *(?P<address_family>[a-zA-Z0-9\s]+)$')
-        p3 = re.compile(r'^BGP *router *identifier *(?P<router_identifier>[0-9\.]+), *local *AS *number *(?P<local_as>[0-9]+)$')
-        p4 = re.compile(r'^BGP *generic *scan *interval *(?P<generic_scan_interval>[0-9]+) +secs$')
-        p5 = re.compile(r'^(?P<non_stop_routing>(Non-stop routing is enabled))$')
-        p6 = re.compile(r'^BGP *table *state: *(?P<table_state>[a-zA-Z]+)$')
-        p7 = re.compile(r'^Table *ID: *(?P<table_id>[a-z0-9]+) *RD *version: *(?P<rd_version>[0-9]+)$')
-        p8 = re.compile(r'^BGP *main *routing *table *version *(?P<bgp_table_version>[0-9]+)$')
-        p9 = re.compile(r'^BGP *NSR *Initial *initsync *version *(?P<nsr_initial_initsync_version>[0-9]+) *\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
-        p10 = re.compile(r'^BGP *NSR/ISSU *Sync-Group *versions *(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
-        p11 = re.compile(r'^BGP *scan *interval *(?P<scan_interval>[0-9\S]+) *secs$')
-        p12 = re.compile(r'^Route +Distinguisher: *(?P<route_distinguisher>\S+) *'
-                            '(\(default +for +vrf +(?P<default_vrf>[a-zA-Z0-9]+)\))?$')
-        p13 = re.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)? *'
-                            '(?P<prefix>(?P<ip>[\w\.\:\/\[\]]+)\/(?P<mask>\d+))?( +'
-                            '(?P<next_hop>[\w\.\:]+) *(?P<number>[\d\s\{\}]+)?'
-                            '(?: *(?P<origin_codes>(i|e|\?)))?)?$')
-        p13_1 = re.compile(r'(?P<path>[\d\s]+)'
-                        ' *(?P<origin_codes>(i|e|\?))?$')
-
-        p14 = re.compile(r'^Processed *(?P<processed_prefixes>[0-9]+) *'
-                            'prefixes, *(?P<processed_paths>[0-9]+) *paths$')
-
-        #    Network            Next Hop            Metric LocPrf Weight Path
-        #                       10.4.1.1                    100      0    i
-        p17 = re.compile(r'^(?P<next_hop>[\w\.\:]+) +((?P<metric>[0-9]+))? +'
-                            '(?P<locprf>[0-9]+) +(?P<weight>[0-9]+) '
-                            '*(?P<path>[\S]+)$')
+        p = ShowBgpInstanceNeighborsReceivedRoutes.patterns
 
         for line in out.splitlines():
             line = line.strip()
@@ -3627,7 +3661,7 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
             # BGP instance 0: 'default'
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 instance = m.groupdict()['instance']
                 instance = instance.replace("'","")
@@ -3641,7 +3675,7 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
             #BGP VRF VRF2, state: Active
 
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
                 state = m.groupdict()['state'].lower()
@@ -3654,14 +3688,14 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
             # BGP Route Distinguisher: 200:2
 
-            m = p15_1.match(line)
+            m = p.p15_1.match(line)
             if m:
                 route_distinguisher = m.groupdict()['route_distinguisher']
                 continue
 
             # VRF ID: 0x60000002
 
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 vrf_id = m.groupdict()['vrf_id']
                 continue
@@ -3669,7 +3703,7 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
             # Network            Next Hop            Metric LocPrf Weight Path
             #                    10.4.1.1                    300      1    i
 
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 if m.groupdict()['metric']:
                     sub_dict[routes][prefix]['index'][index]['metric'] = \
@@ -3687,7 +3721,7 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
             # Address Family: VPNv4 Unicast
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 address_family = m.groupdict()['address_family'].lower()
                 if 'vrf' not in ret_dict['instance'][instance]:
@@ -3699,7 +3733,7 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
             # BGP router identifier 10.4.1.1, local AS number 100
 
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 router_identifier = m.groupdict()['router_identifier']
                 local_as = int(m.groupdict()['local_as'])
@@ -3707,7 +3741,7 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
             # BGP generic scan interval 60 secs
 
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 generic_scan_interval = int(m.groupdict()['generic_scan_interval'])
                 # sub_dict['generic_scan_interval'] = generic_scan_interval
@@ -3715,21 +3749,21 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
             # Non-stop routing is enabled
 
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 non_stop_routing = True
                 continue
 
             # BGP table state: Active
 
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 table_state = str(m.groupdict()['table_state']).lower()
                 continue
 
             # Table ID: 0x0   RD version: 0
 
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 table_id = m.groupdict()['table_id']
                 rd_version = int(m.groupdict()['rd_version'])
@@ -3737,14 +3771,14 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
             # BGP main routing table version 43
 
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 bgp_table_version = int(m.groupdict()['bgp_table_version'])
                 continue
 
             # BGP NSR Initial initsync version 11 (Reached)
 
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 nsr_initial_initsync_version = m.groupdict()['nsr_initial_initsync_version']
                 nsr_initial_init_ver_status = str(m.groupdict()['nsr_initial_init_ver_status']).lower()
@@ -3752,21 +3786,21 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
             # BGP NSR/ISSU Sync-Group versions 0/0
 
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 nsr_issu_sync_group_versions = m.groupdict()['nsr_issu_sync_group_versions']
                 continue
 
             # BGP scan interval 60 secs
 
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                scan_interval = int(m.groupdict()['scan_interval'])
                continue
 
             # Route Distinguisher: 200:1 (default for vrf VRF1)
 
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 rd = m.groupdict()['route_distinguisher']
                 addr = (address_family or af) + ' RD ' + rd
@@ -3855,7 +3889,7 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
             # *> 2001:db8:cdc9:121::/64     2001:db8:20:1:5::5
             # *>i[T][L15][L1x1][N[c12365][b10.4.1.1][s10.16.2.2]][P[p10.4.1.1/32]]/800
 
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 try:
                     sub_dict
@@ -4027,7 +4061,7 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
             # 4518 29612 22247 10519 16562 61158 60788 61783 20566 5674
 
-            m = p13_1.match(line)
+            m = p.p13_1.match(line)
             if m:
                 if 'path' in sub_dict[routes][prefix]['index'][index]:
                     sub_dict[routes][prefix]['index'][index]['path'] += \
@@ -4039,7 +4073,7 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
             # Processed 5 prefixes, 5 paths
 
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 processed_prefixes = int(m.groupdict()['processed_prefixes'])
                 processed_paths = int(m.groupdict()['processed_paths'])
@@ -4120,6 +4154,20 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
                    'show bgp instance {instance} {vrf_type} {vrf} {address_family} neighbors {neighbor} advertised-routes',
                    'show bgp instance {instance} {vrf_type} {vrf} neighbors {neighbor} advertised-routes']
 
+    patterns = Patterns(
+        p1=r'^BGP *instance *(?P<instance_number>[0-9]+): *(?P<instance>['
+           r'a-zA-Z0-9\-\_\']+)$',
+        p2=r'^VRF: *(?P<vrf>[a-zA-Z0-9\_]+)$',
+        p7=r'^Address *Family: *(?P<address_family>[a-zA-Z0-9\s]+)$',
+        p3=r'^Route *Distinguisher: *(?P<route_distinguisher>\S+) *'
+           '(\(default *for *vrf (?P<default_vrf>[0-9A-Z]+)\))?$',
+        p4=r'^(?P<prefix>(?P<ip>[\w\.\:]+)/(?P<mask>\d+)) *(?P<next_hop>[\w\.\:]+) *('
+           r'?P<froms>[\w\.\:]+) *'
+           '(?P<path>[\d\{\}\s]+)?(?P<origin_code>[e|i\?])?$',
+        p5_1=r'(?P<path>[\d\{\}\s]+)(?P<origin_code>e|i)?$',
+        p6=r'^Processed *(?P<processed_prefixes>[0-9]+) *prefixes, *(?P<processed_paths>[0-9]+) *paths$',
+    )
+
     def cli(self, vrf_type='all', neighbor='', vrf='all', instance='all', address_family='', output=None):
         assert vrf_type in ['all', 'vrf']
         assert address_family in ['', 'ipv4 unicast', 'ipv6 unicast']
@@ -4154,27 +4202,14 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
             else:
                 af = 'vpnv4 unicast'
         address_family = None
-        p1 = re.compile(
-            r'^BGP *instance *(?P<instance_number>[0-9]+): *(?P<instance>['
-            r'a-zA-Z0-9\-\_\']+)$')
-        p2 = re.compile(r'^VRF: *(?P<vrf>[a-zA-Z0-9\_]+)$')
-        p7 = re.compile(r'^Address *Family: *(?P<address_family>[a-zA-Z0-9\s]+)$')
-        p3 = re.compile(r'^Route *Distinguisher: *(?P<route_distinguisher>\S+) *'
-                        '(\(default *for *vrf (?P<default_vrf>[0-9A-Z]+)\))?$')
-        p4 = re.compile(
-            r'^(?P<prefix>(?P<ip>[\w\.\:]+)/(?P<mask>\d+)) *(?P<next_hop>[\w\.\:]+) *('
-            r'?P<froms>[\w\.\:]+) *'
-            '(?P<path>[\d\{\}\s]+)?(?P<origin_code>[e|i\?])?$')
-        p5_1 = re.compile(r'(?P<path>[\d\{\}\s]+)(?P<origin_code>e|i)?$')
-        p6 = re.compile(
-            r'^Processed *(?P<processed_prefixes>[0-9]+) *prefixes, *(?P<processed_paths>[0-9]+) *paths$')
+        p = ShowBgpInstanceNeighborsAdvertisedRoutes.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # BGP instance 0: 'default'
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 instance = m.groupdict()['instance']
                 instance = instance.replace("'","")
@@ -4187,7 +4222,7 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
 
             # VRF: VRF2
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 ret_dict.setdefault('instance', {}).setdefault(instance, {})
                 vrf = m.groupdict()['vrf']
@@ -4199,7 +4234,7 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
 
             # Address Family: VPNv4 Unicast
 
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m and vrf == 'default':
                 address_family = m.groupdict()['address_family'].lower()
                 if vrf_type == 'all' and vrf == 'default':
@@ -4211,7 +4246,7 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
 
             # Route Distinguisher: 200:2 (default for vrf VRF2)
 
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 rd = m.groupdict()['route_distinguisher']
                 addr = (address_family or af) + ' RD ' + rd
@@ -4232,7 +4267,7 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
             # 2001:db8:cdc9:121::/64     10.4.1.1         2001:db8:20:1:5::5
             # 10.4.1.1/32         10.4.1.1         Local           ?
 
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 try:
                     sub_dict
@@ -4276,7 +4311,7 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
 
             #                                                    200 33299 51178 47751 {27017}e
 
-            m = p5_1.match(line)
+            m = p.p5_1.match(line)
             if m:
                 path = m.groupdict()['path']
                 origin_code = m.groupdict()['origin_code']
@@ -4288,7 +4323,7 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
 
             # Processed 5 prefixes, l5 paths
 
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 processed_prefixes = str(m.groupdict()['processed_prefixes'])
                 processed_paths = str(m.groupdict()['processed_paths'])
@@ -4481,6 +4516,55 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
         'nsr_initial_initsync_version', 'nsr_initial_init_ver_status',
         'nsr_issu_sync_group_versions', 'standbyver']
 
+    patterns = Patterns(
+        p1=r'^\s*BGP *instance *(?P<instance_number>[0-9]+):'
+           ' *(?P<instance>[a-zA-Z0-9\-\_\']+)$',
+        p2=r'^\s*VRF: *(?P<vrf>[\S]+)$',
+        p3=r'^\s*Address *Family:'
+           ' *(?P<address_family>[\S\s]+)$',
+        p4=r'^\s*BGP *VRF *(?P<bgp_vrf>[a-zA-Z0-9]+), *state:'
+           ' *(?P<vrf_state>[a-zA-Z]+)$',
+        p5=r'^\s*BGP *Route *Distinguisher:'
+           ' *(?P<route_distinguisher>\S+)$',
+        p6=r'^\s*VRF *ID: *(?P<vrf_id>[a-z0-9]+)$',
+        p7=r'^\s*BGP *router *identifier'
+           ' *(?P<router_id>[0-9\.]+)\, *local *AS *number'
+           ' *(?P<local_as>[0-9\.]+)$',
+        p8=r'^\s*BGP *generic *scan *interval'
+           ' *(?P<generic_scan_interval>[0-9]+) *secs$',
+        p9=r'^\s*Non-stop *routing *is'
+           ' *(?P<non_stop_routing>[A-Za-z]+)$',
+        p10=r'^\s*BGP *table *state:'
+            ' *(?P<table_state>[a-zA-Z]+)$',
+        p11=r'^\s*Table *ID: *(?P<table_id>[a-z0-9]+)'
+            ' *RD *version: (?P<rd_version>[0-9]+)$',
+        p12=r'^\s*BGP *main *routing *table *version'
+            ' *(?P<bgp_table_version>[0-9]+)$',
+        p13=r'^\s*BGP *NSR *Initial *initsync *version'
+            ' *(?P<nsr_initial_initsync_version>[0-9]+)'
+            ' *\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$',
+        p14=r'^\s*BGP *NSR/ISSU *Sync-Group *versions'
+            ' *(?P<nsr_issu_sync_group_versions>[0-9\/]+)$',
+        p15=r'^\s*BGP *generic *scan *interval *(?P<scan_interval>[0-9]+) *secs$',
+        p16=r'^\s*BGP *is *operating *in *(?P<operation_mode>[a-zA-Z]+) *mode.$',
+        p17=r'^\s*(?P<process>[a-zA-Z]+) *(?P<rcvtblver>[0-9]+)'
+            ' *(?P<brib_rib>[0-9]+) *(?P<labelver>[0-9]+)'
+            ' *(?P<importver>[0-9]+) *(?P<sendtblver>[0-9]+)'
+            ' *(?P<standbyver>[0-9]+)$',
+        p17_1=r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+)$',
+        p17_2=r'^\s*(?P<spk>[0-9]+)\s+(?P<remote_as>[0-9\.]+)'
+              '\s+(?P<msg_rcvd>[0-9]+)\s+(?P<msg_sent>[0-9]+)'
+              '\s+(?P<tbl_ver>[0-9]+)\s+(?P<input_queue>[0-9]+)'
+              '\s+(?P<output_queue>[0-9]+)\s+(?P<up_down>[a-z0-9\:]+)'
+              '\s+(?P<state_pfxrcd>.+)$',
+        p17_3=r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<spk>[0-9]+)'
+              ' +(?P<remote_as>[0-9\.]+) +(?P<msg_rcvd>[0-9]+)'
+              ' +(?P<msg_sent>[0-9]+)'
+              ' +(?P<tbl_ver>[0-9]+) +(?P<input_queue>[0-9]+)'
+              ' +(?P<output_queue>[0-9]+) +(?P<up_down>[a-z0-9\:]+)'
+              ' +(?P<state_pfxrcd>.+)$',
+    )
+
     def cli(self, instance='all', vrf_type='all', vrf='all', address_family='', output=None):
 
         assert vrf_type in ['all', 'vrf']
@@ -4501,54 +4585,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
                                                                      vrf=vrf))
         else:
             out = output
-        p1 = re.compile(r'^\s*BGP *instance *(?P<instance_number>[0-9]+):'
-                        ' *(?P<instance>[a-zA-Z0-9\-\_\']+)$')
-        p2 = re.compile(r'^\s*VRF: *(?P<vrf>[\S]+)$')
-        p3 = re.compile(r'^\s*Address *Family:'
-                        ' *(?P<address_family>[\S\s]+)$')
-        p4 = re.compile(r'^\s*BGP *VRF *(?P<bgp_vrf>[a-zA-Z0-9]+), *state:'
-                        ' *(?P<vrf_state>[a-zA-Z]+)$')
-        p5 = re.compile(r'^\s*BGP *Route *Distinguisher:'
-                        ' *(?P<route_distinguisher>\S+)$')
-        p6 = re.compile(r'^\s*VRF *ID: *(?P<vrf_id>[a-z0-9]+)$')
-        p7 = re.compile(r'^\s*BGP *router *identifier'
-                        ' *(?P<router_id>[0-9\.]+)\, *local *AS *number'
-                        ' *(?P<local_as>[0-9\.]+)$')
-        p8 = re.compile(r'^\s*BGP *generic *scan *interval'
-                        ' *(?P<generic_scan_interval>[0-9]+) *secs$')
-        p9 = re.compile(r'^\s*Non-stop *routing *is'
-                        ' *(?P<non_stop_routing>[A-Za-z]+)$')
-        p10 = re.compile(r'^\s*BGP *table *state:'
-                         ' *(?P<table_state>[a-zA-Z]+)$')
-        p11 = re.compile(r'^\s*Table *ID: *(?P<table_id>[a-z0-9]+)'
-                         ' *RD *version: (?P<rd_version>[0-9]+)$')
-        p12 = re.compile(r'^\s*BGP *main *routing *table *version'
-                         ' *(?P<bgp_table_version>[0-9]+)$')
-        p13 = re.compile(r'^\s*BGP *NSR *Initial *initsync *version'
-                         ' *(?P<nsr_initial_initsync_version>[0-9]+)'
-                         ' *\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
-        p14 = re.compile(r'^\s*BGP *NSR/ISSU *Sync-Group *versions'
-                         ' *(?P<nsr_issu_sync_group_versions>[0-9\/]+)$')
-        p15 = re.compile(
-            r'^\s*BGP *generic *scan *interval *(?P<scan_interval>[0-9]+) *secs$')
-        p16 = re.compile(
-            r'^\s*BGP *is *operating *in *(?P<operation_mode>[a-zA-Z]+) *mode.$')
-        p17 = re.compile(r'^\s*(?P<process>[a-zA-Z]+) *(?P<rcvtblver>[0-9]+)'
-                         ' *(?P<brib_rib>[0-9]+) *(?P<labelver>[0-9]+)'
-                         ' *(?P<importver>[0-9]+) *(?P<sendtblver>[0-9]+)'
-                         ' *(?P<standbyver>[0-9]+)$')
-        p17_1 = re.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+)$')
-        p17_2 = re.compile(r'^\s*(?P<spk>[0-9]+)\s+(?P<remote_as>[0-9\.]+)'
-                           '\s+(?P<msg_rcvd>[0-9]+)\s+(?P<msg_sent>[0-9]+)'
-                           '\s+(?P<tbl_ver>[0-9]+)\s+(?P<input_queue>[0-9]+)'
-                           '\s+(?P<output_queue>[0-9]+)\s+(?P<up_down>[a-z0-9\:]+)'
-                           '\s+(?P<state_pfxrcd>.+)$')
-        p17_3 = re.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<spk>[0-9]+)'
-                           ' +(?P<remote_as>[0-9\.]+) +(?P<msg_rcvd>[0-9]+)'
-                           ' +(?P<msg_sent>[0-9]+)'
-                           ' +(?P<tbl_ver>[0-9]+) +(?P<input_queue>[0-9]+)'
-                           ' +(?P<output_queue>[0-9]+) +(?P<up_down>[a-z0-9\:]+)'
-                           ' +(?P<state_pfxrcd>.+)$')
+        p = ShowBgpInstanceSummary.patterns
 
         # Init vars
         bgp_instance_summary_dict = {}
@@ -4574,7 +4611,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
 
             # BGP instance 0: 'default' 
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 instance = m.groupdict()['instance']
                 instance = instance.replace("'","")
@@ -4593,7 +4630,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
 
             # VRF: VRF1
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
                 if 'vrf' not in bgp_instance_summary_dict['instance'][instance]:
@@ -4612,7 +4649,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
             
             # Address Family: VPNv4 Unicast
 
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 address_family = m.groupdict()['address_family'].lower()
                 if 'address_family' not in bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]:
@@ -4624,7 +4661,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
             # BGP VRF VRF1, state: Active
             # BGP VRF vrf1, state: Active
 
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 if not vrf:
                     vrf_dict = bgp_instance_summary_dict.setdefault('instance', {}).setdefault(instance, {}).setdefault('vrf', {}).setdefault(input_vrf,{})
@@ -4642,7 +4679,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
 
             # BGP Route Distinguisher: 200:1
 
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 route_distinguisher = str(m.groupdict()['route_distinguisher'])
                 bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['route_distinguisher'] = route_distinguisher
@@ -4650,7 +4687,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
             
             # VRF ID: 0x60000001
 
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 vrf_id = str(m.groupdict()['vrf_id'])
                 bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['vrf_id'] = vrf_id
@@ -4658,7 +4695,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
 
             # BGP router identifier 10.229.11.11, local AS number 100
 
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 router_id = str(m.groupdict()['router_id'])
                 try:
@@ -4674,7 +4711,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
 
             # BGP generic scan interval 60 secs
 
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 generic_scan_interval = int(m.groupdict()['generic_scan_interval'])
                 bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['generic_scan_interval'] = generic_scan_interval
@@ -4682,7 +4719,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
 
             # Non-stop routing is enabled
 
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 non_stop_routing = str(m.groupdict()['non_stop_routing'])
                 bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['non_stop_routing'] = non_stop_routing
@@ -4690,7 +4727,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
 
             # BGP table state: Active
 
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 table_state = str(m.groupdict()['table_state']).lower()
                 bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['table_state'] = table_state
@@ -4698,7 +4735,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
 
             # Table ID: 0x0   RD version: 0
 
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 table_id = str(m.groupdict()['table_id'])
                 rd_version = int(m.groupdict()['rd_version'])
@@ -4708,7 +4745,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
 
             # BGP main routing table version 63
 
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 bgp_table_version = int(m.groupdict()['bgp_table_version'])
                 bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['bgp_table_version'] =  bgp_table_version       
@@ -4716,7 +4753,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
 
             # BGP NSR Initial initsync version 11 (Reached)
 
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 nsr_initial_initsync_version = int(m.groupdict()['nsr_initial_initsync_version'])
                 nsr_initial_init_ver_status = str(m.groupdict()['nsr_initial_init_ver_status']).lower()
@@ -4726,7 +4763,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
 
             # BGP NSR/ISSU Sync-Group versions 0/0
 
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 nsr_issu_sync_group_versions = str(m.groupdict()['nsr_issu_sync_group_versions'])
                 bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['nsr_issu_sync_group_versions'] = nsr_issu_sync_group_versions
@@ -4734,7 +4771,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
 
             # BGP scan interval 60 secs
 
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 scan_interval = int(m.groupdict()['scan_interval'])
                 bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['scan_interval'] = scan_interval
@@ -4742,7 +4779,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
 
             # BGP is operating in STANDALONE mode.
 
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 operation_mode = str(m.groupdict()['operation_mode']).lower()
                 bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['operation_mode'] = operation_mode
@@ -4751,7 +4788,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
             # Process       RcvTblVer   bRIB/RIB   LabelVer  ImportVer  SendTblVer  StandbyVer
             # Speaker              63         63         63         63          63           0
 
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 process = str(m.groupdict()['process'])
                 if 'process' not in bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]:
@@ -4769,7 +4806,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
             # Neighbor        Spk    AS MsgRcvd MsgSent   TblVer  InQ OutQ  Up/Down  St/PfxRcd
             # 2001:db8:20:1:5::5
 
-            m = p17_1.match(line)
+            m = p.p17_1.match(line)
             if m:
                 neighbor = str(m.groupdict()['neighbor'])
                 data_on_nextline = True
@@ -4784,7 +4821,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
             #                   0   200             0       0        0    0    0 00:00:00 Idle (Admin)!
             #                   0   60000.60001     0       0        0    0    0 00:00:00 Idle (Admin)!
 
-            m = p17_2.match(line)
+            m = p.p17_2.match(line)
             if m and data_on_nextline:
                 data_on_nextline = False
                 if 'address_family' not in bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['neighbor'][neighbor]:
@@ -4810,7 +4847,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
             # 10.16.2.2           0   100       0       0        0    0    0 00:00:00 Idle
             # 10.0.0.35         0   200       0       0        0    0    0 00:00:00 Idle (Admin)!
 
-            m = p17_3.match(line)
+            m = p.p17_3.match(line)
             if m:
                 neighbor = str(m.groupdict()['neighbor'])
                 if 'neighbor' not in bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]:
@@ -4936,151 +4973,155 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
 
     exclude = ['bgp_table_version', 'rd_version', 'nsr_initial_init_ver_status', 'nsr_initial_initsync_version']
 
-    def cli(self, vrf_type='all', address_family='', instance='all', vrf='all', output=None):
-
-        # Verify vrf_type and address_family
-        assert vrf_type in ['all', 'vrf']
-        assert address_family in ['', 'ipv4 unicast', 'ipv6 unicast']
-
-        # Execute command
-        if output is None:
-            if vrf_type == 'all':
-                output = self.device.execute(self.cli_command[0].\
-                                             format(instance=instance))
-            else:
-                if address_family:
-                    output = self.device.execute(self.cli_command[2].\
-                                                 format(instance=instance,
-                                                 address_family=address_family,
-                                                 vrf_type=vrf_type,
-                                                 vrf=vrf))
-                else:
-                    output = self.device.execute(self.cli_command[1].\
-                                                 format(instance=instance,
-                                                        vrf_type=vrf_type,
-                                                        vrf=vrf))
-        # Init
-        parsed_dict = {}
-        last_prefix = None
-
-        # Determind VRF and AF
-        if vrf_type == 'all':
-            vrf = 'default'
-            af_default = None
-        elif vrf_type == 'vrf':
-            if vrf != 'all':
-                input_vrf = vrf
-            # Reset vrf
-            vrf = None
-            if address_family == 'ipv6 unicast':
-                af_default = 'vpnv6 unicast'
-            else:
-                af_default = 'vpnv4 unicast'
-
+    patterns = Patterns(
         # BGP instance 0: 'default'
-        p1 = re.compile(r'^\s*BGP +instance +(?P<instance_number>[0-9]+):'
-                        r' +(?P<instance>(\S+))$')
+        p1=r'^\s*BGP +instance +(?P<instance_number>[0-9]+):'
+           r' +(?P<instance>(\S+))$',
 
         # VRF: VRF1
-        p2 = re.compile(r'^\s*VRF: +(?P<vrf>(\S+))$')
+        p2=r'^\s*VRF: +(?P<vrf>(\S+))$',
 
         # Address Family: VPNv6 Unicast
-        p3 = re.compile(r'^\s*Address +Family: +(?P<address_family>[\S\s]+)$')
+        p3=r'^\s*Address +Family: +(?P<address_family>[\S\s]+)$',
 
         # BGP VRF VRF1, state: Active
-        p4 = re.compile(r'^\s*BGP +VRF +(?P<bgp_vrf>(\S+)), +state:'
-                        r' +(?P<vrf_state>(\S+))$')
-
-        # BGP Route Distinguisher: 200:1
-        # BGP Route Distinguisher: 172.16.2.90:1
+        p4=r'^\s*BGP +VRF +(?P<bgp_vrf>(\S+)), +state:'
+           r' +(?P<vrf_state>(\S+))$',
 
         # VRF ID: 0x60000001
-        p5 = re.compile(r'^\s*VRF +ID: +(?P<vrf_id>(\S+))$')
+        p5=r'^\s*VRF +ID: +(?P<vrf_id>(\S+))$',
 
         # BGP router identifier 10.4.1.1, local AS number 100
-        p6 = re.compile(r'^\s*BGP +router +identifier +(?P<router_identifier>(\S+)),'
-                        r' +local +AS +number +(?P<local_as>(\d+))$')
+        p6=r'^\s*BGP +router +identifier +(?P<router_identifier>(\S+)),'
+           r' +local +AS +number +(?P<local_as>(\d+))$',
 
         # BGP generic scan interval 60 secs
-        p7 =  re.compile(r'^\s*BGP +generic +scan +interval'
-                         r' +(?P<interval>(\d+)) +secs$')
+        p7=r'^\s*BGP +generic +scan +interval'
+           r' +(?P<interval>(\d+)) +secs$',
 
         # Non-stop routing is enabled
-        p8 = re.compile(r'^\s*Non-stop +routing is enabled$')
+        p8=r'^\s*Non-stop +routing is enabled$',
 
         # BGP table state: Active
-        p9 = re.compile(r'^\s*BGP +table +state: +(?P<table_state>[a-zA-Z]+)$')
+        p9=r'^\s*BGP +table +state: +(?P<table_state>[a-zA-Z]+)$',
 
         # Table ID: 0xe0000010   RD version: 43
-        p10 = re.compile(r'^\s*Table +ID: +(?P<table_id>[a-z0-9]+) +RD +version:'
-                         r' +(?P<rd_version>[0-9]+)$')
+        p10=r'^\s*Table +ID: +(?P<table_id>[a-z0-9]+) +RD +version:'
+            r' +(?P<rd_version>[0-9]+)$',
 
         # BGP main routing table version 43
-        p11 = re.compile(r'^\s*BGP +main +routing +table +version'
-                         r' +(?P<bgp_table_version>[0-9]+)$')
+        p11=r'^\s*BGP +main +routing +table +version'
+            r' +(?P<bgp_table_version>[0-9]+)$',
 
         # BGP NSR Initial initsync version 11 (Reached)
-        p12 = re.compile(r'^\s*BGP +NSR +Initial +initsync +version'
-                         r' +(?P<nsr_initial_initsync_version>[0-9]+)'
-                         r' +\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
+        p12=r'^\s*BGP +NSR +Initial +initsync +version'
+            r' +(?P<nsr_initial_initsync_version>[0-9]+)'
+            r' +\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$',
 
         # BGP NSR/ISSU Sync-Group versions 0/0
-        p13 = re.compile(r'^\s*BGP +NSR/ISSU +Sync-Group +versions'
-                         r' +(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
+        p13=r'^\s*BGP +NSR/ISSU +Sync-Group +versions'
+            r' +(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$',
 
-        # BGP scan interval 60 secs 
-        p14 = re.compile(r'^\s*BGP +scan +interval +(?P<scan_interval>[0-9]+)'
-                         r' +secs$')
+        # BGP scan interval 60 secs
+        p14=r'^\s*BGP +scan +interval +(?P<scan_interval>[0-9]+)'
+            r' +secs$',
 
         # Route Distinguisher: 200:1 (default for vrf VRF1)
         # Route Distinguisher: 172.16.2.90:1000 (default for vrf EVPN-Multicast-BTV)
         # Route Distinguisher: 172.16.2.88:1000
-        p15 = re.compile(r'^\s*Route +Distinguisher:'
-                         r' +(?P<route_distinguisher>\S+)'
-                         r'(?: +\(default +for +vrf +(?P<default_vrf>\S+)\))?$')
+        p15=r'^\s*Route +Distinguisher:'
+            r' +(?P<route_distinguisher>\S+)'
+            r'(?: +\(default +for +vrf +(?P<default_vrf>\S+)\))?$',
 
         # *> 2001:db8:cdc9:190::/64   2001:db8:20:1:5::5
         # *>i[2][0][48][0014.01ff.0001][32][10.249.249.10]/136
         # *> [1][10.4.1.1:1][1234.bcff.5d7f.3e11.0505][12564523]/111
-        p16_1 = re.compile(r'^\s*(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
-                           r' *(?P<prefix>(?P<ip>[a-z0-9\.\:\[\]]+)\/(?P<mask>\d+))'
-                           r'(?: +(?P<next_hop>\S+))?$')
+        p16_1=r'^\s*(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
+              r' *(?P<prefix>(?P<ip>[a-z0-9\.\:\[\]]+)\/(?P<mask>\d+))'
+              r'(?: +(?P<next_hop>\S+))?$',
 
         # 2219             0 200 33299 51178 47751 {27016} e
-        p16_2 = re.compile(r'^\s*(?P<metric>[0-9]+) +(?P<weight>[0-9]+)'
-                           r' +(?P<path>[0-9\{\}\s]+) '
-                           r'+(?P<origin_codes>(i|e|\?))$')
+        p16_2=r'^\s*(?P<metric>[0-9]+) +(?P<weight>[0-9]+)'
+              r' +(?P<path>[0-9\{\}\s]+) '
+              r'+(?P<origin_codes>(i|e|\?))$',
 
         # Network            Next Hop   Metric LocPrf Weight Path
         # 172.16.2.88                        0    100      0 ?
         # 172.16.2.88                             100      0 i
         # 0.0.0.0                                          0 i
-        p16_3 = re.compile(r'^\s*(?P<next_hop>(\S+))(?: +(?P<metric>(\d+)))?'
-                           r'(?: +(?P<locprf>(\d+)))? +(?P<weight>(\d+))'
-                           r' +(?P<origin_codes>(\?|i|e))$')
+        p16_3=r'^\s*(?P<next_hop>(\S+))(?: +(?P<metric>(\d+)))?'
+              r'(?: +(?P<locprf>(\d+)))? +(?P<weight>(\d+))'
+              r' +(?P<origin_codes>(\?|i|e))$',
 
         # *> 10.1.1.0/24        10.186.5.5              2219             0 200 33299 51178 47751 {27016} e
         # * i                   10.64.4.4               2219    100      0 400 33299 51178 47751 {27016} e
         # *>i10.9.2.0/24        10.64.4.4               2219    100      0 400 33299 51178 47751 {27016} e
         # *>i10.169.1.0/24      10.64.4.4               2219    100      0 300 33299 51178 47751 {27016} e
         # *>i192.168.111.0/24       10.189.99.98                                                    0       0 i
-        p16 = re.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
-                         r' *(?P<prefix>(?P<ip>[0-9\.\:\[\]]+)/(?P<mask>\d+))?'
-                         r' +(?P<next_hop>\S+) +(?P<number>[\d\s\{\}]+)'
-                         r'(?: *(?P<origin_codes>(i|e|\?)))?$')
+        p16=r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
+            r' *(?P<prefix>(?P<ip>[0-9\.\:\[\]]+)/(?P<mask>\d+))?'
+            r' +(?P<next_hop>\S+) +(?P<number>[\d\s\{\}]+)'
+            r'(?: *(?P<origin_codes>(i|e|\?)))?$',
 
-        p17 = re.compile(r'(?P<path>[\d\s]+)'
-                         r' *(?P<origin_codes>(i|e|\?))?$')
+        p17=r'(?P<path>[\d\s]+)'
+            r' *(?P<origin_codes>(i|e|\?))?$',
 
         # Processed 40 prefixes, 50 paths
-        p18 = re.compile(r'^\s*Processed +(?P<processed_prefix>[0-9]+)'
-                         r' +prefixes, +(?P<processed_paths>[0-9]+) +paths$')
+        p18=r'^\s*Processed +(?P<processed_prefix>[0-9]+)'
+            r' +prefixes, +(?P<processed_paths>[0-9]+) +paths$',
+    )
+
+    def cli(self, vrf_type='all', address_family='', instance='all', vrf='all', output=None):
+
+        # Verify vrf_type and address_family
+        assert vrf_type in ['all', 'vrf']
+        assert address_family in ['', 'ipv4 unicast', 'ipv6 unicast']
+
+        # Execute command
+        if output is None:
+            if vrf_type == 'all':
+                output = self.device.execute(self.cli_command[0].\
+                                             format(instance=instance))
+            else:
+                if address_family:
+                    output = self.device.execute(self.cli_command[2].\
+                                                 format(instance=instance,
+                                                 address_family=address_family,
+                                                 vrf_type=vrf_type,
+                                                 vrf=vrf))
+                else:
+                    output = self.device.execute(self.cli_command[1].\
+                                                 format(instance=instance,
+                                                        vrf_type=vrf_type,
+                                                        vrf=vrf))
+        # Init
+        parsed_dict = {}
+        last_prefix = None
 
-        for line in output.splitlines():
+        # Determind VRF and AF
+        if vrf_type == 'all':
+            vrf = 'default'
+            af_default = None
+        elif vrf_type == 'vrf':
+            if vrf != 'all':
+                input_vrf = vrf
+            # Reset vrf
+            vrf = None
+            if address_family == 'ipv6 unicast':
+                af_default = 'vpnv6 unicast'
+            else:
+                af_default = 'vpnv4 unicast'
+
+        p = ShowBgpInstanceAllAll.patterns
+
+        # BGP Route Distinguisher: 200:1
+        # BGP Route Distinguisher: 172.16.2.90:1
+
+        for line in iter_lines(output):
             line = line.rstrip()
 
             # BGP instance 0: 'default'
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 instance = group['instance'].replace("'","")
@@ -5094,7 +5135,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 continue
 
             # VRF: VRF1
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
                 vrf_dict = inst_dict.setdefault('vrf', {}).setdefault(vrf, {})
@@ -5108,7 +5149,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
 
             # Address Family: VPNv4 Unicast
             # Address family: IPv6 Labeled-unicast
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 address_family = m.groupdict()['address_family'].lower()
                 original_address_family = address_family
@@ -5118,7 +5159,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 continue
 
             # BGP VRF VRF1, state: Active
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 # if no vrf key, set it to be the user input
@@ -5136,14 +5177,14 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 continue
 
             # VRF ID: 0x60000001
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 vrf_id = m.groupdict()['vrf_id']
                 af_dict['vrf_id'] = vrf_id
                 continue
 
             # BGP router identifier 10.4.1.1, local AS number 100
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 af_dict['router_identifier'] = group['router_identifier']
@@ -5151,25 +5192,25 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 continue 
 
             # BGP generic scan interval 60 secs 
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 af_dict['generic_scan_interval'] = m.groupdict()['interval']
                 continue          
 
             # Non-stop routing is enabled
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 af_dict['non_stop_routing'] = True
                 continue
 
             # BGP table state: Active
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 af_dict['table_state'] = m.groupdict()['table_state'].lower()
                 continue
 
             # Table ID: 0x0   RD version: 0
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 group = m.groupdict()
                 af_dict['table_id'] = group['table_id']
@@ -5177,13 +5218,13 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 continue
 
             # BGP main routing table version 43
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 af_dict['bgp_table_version'] = int(m.groupdict()['bgp_table_version'])
                 continue
 
             # BGP NSR Initial initsync version 11 (Reached)
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 group = m.groupdict()
                 af_dict['nsr_initial_initsync_version'] = group['nsr_initial_initsync_version']
@@ -5191,20 +5232,20 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 continue
 
             # BGP NSR/ISSU Sync-Group versions 0/0
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 af_dict['nsr_issu_sync_group_versions'] = \
                                 m.groupdict()['nsr_issu_sync_group_versions']
                 continue
 
             # BGP scan interval 60 secs
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                af_dict['scan_interval'] = int(m.groupdict()['scan_interval'])
                continue
 
             # Route Distinguisher: 200:1 (default for vrf VRF1)
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 group = m.groupdict()
                 rd = group['route_distinguisher']
@@ -5221,7 +5262,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
 
             # *> 2001:db8:cdc9:190::/64   2001:db8:20:1:5::5
             # *>i[2][0][48][0014.01ff.0001][32][10.249.249.10]/136
-            m = p16_1.match(line)
+            m = p.p16_1.match(line)
             if m:
                 group = m.groupdict()
                 prefix = group['prefix']
@@ -5240,7 +5281,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 continue
 
             # 2219             0 200 33299 51178 47751 {27016} e
-            m = p16_2.match(line)
+            m = p.p16_2.match(line)
             if m:
                 group = m.groupdict()
                 pfx_dict['metric'] = group['metric']
@@ -5252,7 +5293,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
             # Network            Next Hop   Metric LocPrf Weight Path
             # 172.16.2.88                        0    100      0 ?
             # 172.16.2.88                             100      0 i
-            m = p16_3.match(line)
+            m = p.p16_3.match(line)
             if m:
                 group = m.groupdict()
                 pfx_dict['next_hop'] = group['next_hop']
@@ -5269,7 +5310,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
             # *>i10.9.2.0/24        10.64.4.4               2219    100      0 400 33299 51178 47751 {27016} e
             # *>i10.169.1.0/24      10.64.4.4               2219    100      0 300 33299 51178 47751 {27016} e
             # *>i192.168.111.0/24       10.189.99.98                                                    0       0 i
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 group = m.groupdict()
                 prefix = group['prefix']
@@ -5315,7 +5356,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 continue
 
             # 
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 group = m.groupdict()
                 if 'path' in pfx_dict:
@@ -5325,7 +5366,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 continue
 
             # Processed 40 prefixes, 50 paths
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 group = m.groupdict()
                 af_dict['processed_prefix'] = int(group['processed_prefix'])
@@ -5369,6 +5410,26 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
 
     # TODO schema
     cli_command = 'show bgp sessions'
+    patterns = Patterns(
+        # 10.36.3.3         default                 0 65000     0     0  Established  None
+        # 2001:1:1:1::1   default                 0 65000     0     0  Established  None
+        # 10.1.7.212     default                 0 10396     0     0  Established  NSR Ready
+        p1=r'^(?P<neighbor>\S+) +(?P<vrf>\S+) +(?P<spk>\d+) +'
+           '(?P<as_number>\d+) +(?P<in_q>\d+) +(?P<out_q>\d+) +'
+           '(?P<nbr_state>\w+) +(?P<nsr_state>[\w\s]+)$',
+
+        # 2001:db8:4401:4453::6f9
+        p1_1=r'^(?P<neighbor>[\w\d:]+)$',
+
+        # default 0 65000 0 0 Established NSR Ready
+        p1_2=r'^(?P<vrf>\S+) +(?P<spk>\d+) +'
+             r'(?P<as_number>\d+) +(?P<in_q>\d+) +(?P<out_q>\d+) +'
+             r'(?P<nbr_state>\w+) +(?P<nsr_state>[\w\s]+)$',
+
+        # BGP instance 0: 'default'
+        p2=r'^BGP +instance +\d+: +\'(?P<instance>\S+)\'$',
+    )
+
     def cli(self, output=None):
         
         if output is None:
@@ -5379,23 +5440,7 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
         ret_dict = {}
         instance = 'default'
 
-        # 10.36.3.3         default                 0 65000     0     0  Established  None
-        # 2001:1:1:1::1   default                 0 65000     0     0  Established  None
-        # 10.1.7.212     default                 0 10396     0     0  Established  NSR Ready
-        p1 = re.compile(r'^(?P<neighbor>\S+) +(?P<vrf>\S+) +(?P<spk>\d+) +'
-            '(?P<as_number>\d+) +(?P<in_q>\d+) +(?P<out_q>\d+) +'
-            '(?P<nbr_state>\w+) +(?P<nsr_state>[\w\s]+)$')
-
-        # 2001:db8:4401:4453::6f9
-        p1_1 = re.compile(r'^(?P<neighbor>[\w\d:]+)$')
-
-        # default 0 65000 0 0 Established NSR Ready
-        p1_2 = re.compile(r'^(?P<vrf>\S+) +(?P<spk>\d+) +'
-                          r'(?P<as_number>\d+) +(?P<in_q>\d+) +(?P<out_q>\d+) +'
-                          r'(?P<nbr_state>\w+) +(?P<nsr_state>[\w\s]+)$')
-
-        # BGP instance 0: 'default'
-        p2 = re.compile(r'^BGP +instance +\d+: +\'(?P<instance>\S+)\'$')
+        p = ShowBgpSessions.patterns
 
         for line in out.splitlines():
             line = line.strip()
@@ -5403,7 +5448,7 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
             # 10.36.3.3         default                 0 65000     0     0  Established  None
             # 2001:1:1:1::1   default                 0 65000     0     0  Established  None
             # 10.1.7.212     default                 0 10396     0     0  Established  NSR Ready
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 vrf = group['vrf']
@@ -5431,13 +5476,13 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
                 continue
 
             # 2001:db8:4401:4453::6f9
-            m = p1_1.match(line)
+            m = p.p1_1.match(line)
             if m:
                 neighbor = m.groupdict()['neighbor']
                 continue
 
             # default 0 65000 0 0 Established NSR Ready
-            m = p1_2.match(line)
+            m = p.p1_2.match(line)
             if m:
                 group = m.groupdict()
                 neighbor_dict = ret_dict.setdefault('instance', {}). \
@@ -5456,7 +5501,7 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
                 continue
 
             # BGP instance 0: 'default'
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 instance = group['instance']
@@ -5521,19 +5566,9 @@ class ShowBgpVrfDbVrfAll(ShowBgpVrfDbVrfAllSchema):
 
     cli_command = 'show bgp vrf-db vrf all'
 
-    def cli(self, output=None):
-
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-
-        # Init
-        parsed_dict = {}
-        vrf_dict = {}
-
+    patterns = Patterns(
         # VRF                              ID          RD                REF AFs
-        # default                          0x60000000  0:0:0             8   v4u, Vv4u, v6u, 
+        # default                          0x60000000  0:0:0             8   v4u, Vv4u, v6u,
         # NOVI-TST                         0x60000001  172.16.2.88:0     4   v4u
         # test_ipv6_overlay                0x0         0:0:0             2   v4u, v6u
         # BTV-nPVR-MULTICAST-IAAS          0x60000004  172.16.2.88:1     4   v4u
@@ -5542,11 +5577,25 @@ class ShowBgpVrfDbVrfAll(ShowBgpVrfDbVrfAllSchema):
         # VPWS:2078                        -           172.16.2.88:2078  2   L2evpn
         # VPWS:10293                       -           172.16.2.88:10293 2   L2evpn
         # EVPN-Multicast-BTV               -           172.16.2.88:1000  2   L2evpn
-        p1 = re.compile(r'^(?P<vrf>(\S+)) +(?P<id>([x0-9\-]+)) +(?P<rd>(\S+))'
-                         ' +(?P<ref>(\d+)) +(?P<afs>(.*))$')
+        p1=r'^(?P<vrf>(\S+)) +(?P<id>([x0-9\-]+)) +(?P<rd>(\S+))'
+           ' +(?P<ref>(\d+)) +(?P<afs>(.*))$',
 
         #                                                                  Vv6u, L2evpn
-        p2 = re.compile(r'^(?P<item>([a-zA-Z0-9\,\s]+))$')
+        p2=r'^(?P<item>([a-zA-Z0-9\,\s]+))$',
+    )
+
+    def cli(self, output=None):
+
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        # Init
+        parsed_dict = {}
+        vrf_dict = {}
+
+        p = ShowBgpVrfDbVrfAll.patterns
 
         for line in out.splitlines():
             line = line.strip()
@@ -5561,7 +5610,7 @@ class ShowBgpVrfDbVrfAll(ShowBgpVrfDbVrfAllSchema):
             # VPWS:2078                        -           172.16.2.88:2078  2   L2evpn
             # VPWS:10293                       -           172.16.2.88:10293 2   L2evpn
             # EVPN-Multicast-BTV               -           172.16.2.88:1000  2   L2evpn
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 vrf_dict = parsed_dict.setdefault('vrf', {}).\
@@ -5573,7 +5622,7 @@ class ShowBgpVrfDbVrfAll(ShowBgpVrfDbVrfAllSchema):
                 continue
 
             #                                                                  Vv6u, L2evpn
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 if vrf_dict:
                     afs = m.groupdict()['item'].strip().replace(",", "").split()
@@ -5662,6 +5711,82 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
       'path_type',
       'weight']
 
+    patterns = Patterns(
+        p=r'^\s*Network +Next Hop +Metric +LocPrf +Weight Path$',
+        p1=r'^\s*BGP +routing +table +information +for +VRF'
+           ' +(?P<vrf_name>\S+), +address +family'
+           ' +(?P<address_family>[\w\s\-\_]+)$',
+        p2=r'^\s*BGP +table +version +is'
+           ' +(?P<bgp_table_version>[0-9]+), +(L|l)ocal'
+           ' +(R|r)outer +ID +is +(?P<local_router_id>[0-9\.]+)$',
+        p3_1=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+             '(?P<path_type>(i|e|c|l|a|r|I))?'
+             '(?P<prefix>[\w\.\:\/\[\]\,]{3,})'
+             '(?: *(?P<next_hop>[\w\.\:\/\[\]\,]+))?$',
+        p3_1_1=r'^(?P<status_codes>(s|x|S|d|h|\*|\>)+)(?P<path_type>'
+               '(i|e|c|l|a|r|I))(?P<prefix>[\w\.\/]+) '
+               '+(?P<next_hop>[\w\.\/]+) +'
+               '(?P<metric>\d+) +(?P<localprf>\d+) '
+               '+(?P<weight>\d+) +(?P<path>[\d ]+) +'
+               '(?P<origin_codes>(i|e|\?|\||&))$',
+        p3_1_2=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
+               ' (?P<path_type>(i|e|c|l|a|r|I)) '
+               '(?: *(?P<next_hop>[\w\.\:\/\[\]\,]+))?$',
+        p3_2=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
+             '(?P<path_type>(i|e|c|l|a|r|I))'
+             '(?P<prefix>[\w\.\:\/\[\]\,]+)'
+             ' +(?P<next_hop>[\w\.\:]+)'
+             ' +(?P<numbers>[\w\s\(\)\{\}]+)'
+             ' +(?P<origin_codes>(i|e|\?|\&|\|))$',
+        p3_2_1=r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+               '(?P<path_type>(i|e|c|l|a|r|I))?'
+               '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+               '(?P<prefix>[\w\.\:\/\[\]\,]+)'
+               ' +(?P<next_hop>[\w\.\:]+)'
+               ' +(?P<numbers>[\w\s\(\)\{\}\?]+)$',
+        p3_3=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+             '(?P<path_type>(i|e|c|l|a|r|I))?'
+             ' *(?P<next_hop>[\w\.\:]{8,})'
+             '(?: +(?P<numbers>[\w\s\(\)\{\}]+))?'
+             ' +(?P<origin_codes>(i|e|\?|\|))$',
+        p3_3_1=r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+               '(?P<path_type>(i|e|c|l|a|r|I))?'
+               '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+               ' +(?P<next_hop>[\w\.\:]+)'
+               ' +(?P<numbers>[\w\s\(\)\{\}\?]+)$',
+        p3_3_2=r'^\s*(?P<numbers>[0-9\s\(\)\{\}]+)? +'
+               '(?P<origin_codes>(i|e|\?|\|))$',
+        p3_4=r'^\s*(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+)$',
+        p4=r'^\s*Route +Distinguisher *: +(?P<route_distinguisher>(\S+))'
+           '(?: +\(((VRF +(?P<default_vrf>\S+))|'
+           '((?P<default_vrf1>\S+)VNI +(?P<vni>\d+)'
+           '|(default +for +vrf +(?P<default_vrf2>\S+))))\))?$',
+
+        p5=r'^\s*BGP *router *identifier *(?P<router_identifier>[0-9\.]+)'
+           ', *local *AS *number *(?P<local_as>[0-9]+)$',
+        p6=r'^\s*BGP *generic *scan *interval *'
+           '(?P<generic_scan_interval>[0-9]+) *secs$',
+        p7=r'^\s*Non-stop *routing *is'
+           ' *(?P<non_stop_routing>[A-Za-z]+)$',
+        p8=r'^\s*BGP *table *state: *(?P<table_state>[a-zA-Z]+)$',
+        p9=r'^\s*Table *ID: *(?P<table_id>[a-z0-9]+)'
+           ' *RD *version: (?P<rd_version>[0-9]+)$',
+        p10=r'^\s*BGP *main *routing *table *version'
+            ' *(?P<bgp_table_version>[0-9]+)$',
+        p11=r'^\s*BGP *NSR *Initial *initsync *version *'
+            '(?P<nsr_initial_initsync_version>[0-9]+)'
+            ' *\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$',
+        p12=r'^\s*BGP *NSR/ISSU *Sync-Group *versions *'
+            '(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$',
+        p13=r'^\s*BGP *scan *interval *(?P<scan_interval>[0-9\s]+) *secs$',
+        p14=r'^(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
+            '(?P<path_type>(i|e|c|l|a|r|I))? *(?P<prefix>[\w\.\/\[\]\,]+)$',
+        p15=r'^(?P<next_hop>[\w\.\:]+) *(?P<number>[\d\s\{\}]+)?'
+            '(?: *(?P<origin_codes>(i|e|\?)))$',
+        p16=r'^\s*Processed +(?P<processed_prefix>[0-9]+) +prefixes, +'
+            '(?P<processed_paths>[0-9]+) +paths$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -5682,90 +5807,18 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
         bgp_table_version = local_router_id = ''
         prefix = ''
 
-        p = re.compile(r'^\s*Network +Next Hop +Metric +LocPrf +Weight Path$')
-        p1 = re.compile(r'^\s*BGP +routing +table +information +for +VRF'
-                            ' +(?P<vrf_name>\S+), +address +family'
-                            ' +(?P<address_family>[\w\s\-\_]+)$')
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                            ' +(?P<bgp_table_version>[0-9]+), +(L|l)ocal'
-                            ' +(R|r)outer +ID +is +(?P<local_router_id>[0-9\.]+)$')
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            '(?P<prefix>[\w\.\:\/\[\]\,]{3,})'
-                            '(?: *(?P<next_hop>[\w\.\:\/\[\]\,]+))?$')
-        p3_1_1 = re.compile(r'^(?P<status_codes>(s|x|S|d|h|\*|\>)+)(?P<path_type>'
-                            '(i|e|c|l|a|r|I))(?P<prefix>[\w\.\/]+) '
-                            '+(?P<next_hop>[\w\.\/]+) +'
-                            '(?P<metric>\d+) +(?P<localprf>\d+) '
-                            '+(?P<weight>\d+) +(?P<path>[\d ]+) +'
-                            '(?P<origin_codes>(i|e|\?|\||&))$')
-        p3_1_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
-                            ' (?P<path_type>(i|e|c|l|a|r|I)) '
-                            '(?: *(?P<next_hop>[\w\.\:\/\[\]\,]+))?$')
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
-                            '(?P<path_type>(i|e|c|l|a|r|I))'
-                            '(?P<prefix>[\w\.\:\/\[\]\,]+)'
-                            ' +(?P<next_hop>[\w\.\:]+)'
-                            ' +(?P<numbers>[\w\s\(\)\{\}]+)'
-                            ' +(?P<origin_codes>(i|e|\?|\&|\|))$')
-        p3_2_1 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                            '(?P<prefix>[\w\.\:\/\[\]\,]+)'
-                            ' +(?P<next_hop>[\w\.\:]+)'
-                            ' +(?P<numbers>[\w\s\(\)\{\}\?]+)$')
-        p3_3 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            ' *(?P<next_hop>[\w\.\:]{8,})'
-                            '(?: +(?P<numbers>[\w\s\(\)\{\}]+))?'
-                            ' +(?P<origin_codes>(i|e|\?|\|))$')
-        p3_3_1 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                            ' +(?P<next_hop>[\w\.\:]+)'
-                            ' +(?P<numbers>[\w\s\(\)\{\}\?]+)$')
-        p3_3_2 = re.compile(r'^\s*(?P<numbers>[0-9\s\(\)\{\}]+)? +'
-                            '(?P<origin_codes>(i|e|\?|\|))$')
-        p3_4 = re.compile(r'^\s*(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+)$')
-        p4 = re.compile(r'^\s*Route +Distinguisher *: +(?P<route_distinguisher>(\S+))'
-                            '(?: +\(((VRF +(?P<default_vrf>\S+))|'
-                            '((?P<default_vrf1>\S+)VNI +(?P<vni>\d+)'
-                            '|(default +for +vrf +(?P<default_vrf2>\S+))))\))?$')
+        regex = ShowBgpL2vpnEvpn.patterns
         
-        p5 = re.compile(r'^\s*BGP *router *identifier *(?P<router_identifier>[0-9\.]+)'
-                         ', *local *AS *number *(?P<local_as>[0-9]+)$')
-        p6 =  re.compile(r'^\s*BGP *generic *scan *interval *'
-                            '(?P<generic_scan_interval>[0-9]+) *secs$')
-        p7 = re.compile(r'^\s*Non-stop *routing *is'
-                        ' *(?P<non_stop_routing>[A-Za-z]+)$')
-        p8 = re.compile(r'^\s*BGP *table *state: *(?P<table_state>[a-zA-Z]+)$')
-        p9 = re.compile(r'^\s*Table *ID: *(?P<table_id>[a-z0-9]+)'
-                         ' *RD *version: (?P<rd_version>[0-9]+)$')
-        p10 = re.compile(r'^\s*BGP *main *routing *table *version'
-                         ' *(?P<bgp_table_version>[0-9]+)$')
-        p11 = re.compile(r'^\s*BGP *NSR *Initial *initsync *version *'
-                            '(?P<nsr_initial_initsync_version>[0-9]+)'
-                          ' *\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
-        p12 = re.compile(r'^\s*BGP *NSR/ISSU *Sync-Group *versions *'
-                            '(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
-        p13 = re.compile(r'^\s*BGP *scan *interval *(?P<scan_interval>[0-9\s]+) *secs$')
-        p14 = re.compile(r'^(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
-                            '(?P<path_type>(i|e|c|l|a|r|I))? *(?P<prefix>[\w\.\/\[\]\,]+)$')
-        p15 = re.compile(r'^(?P<next_hop>[\w\.\:]+) *(?P<number>[\d\s\{\}]+)?'
-                            '(?: *(?P<origin_codes>(i|e|\?)))$')
-        p16 = re.compile(r'^\s*Processed +(?P<processed_prefix>[0-9]+) +prefixes, +'
-                            '(?P<processed_paths>[0-9]+) +paths$')
-
         for line in out.splitlines():
             line = line.strip()
 
             # Network            Next Hop            Metric     LocPrf     Weight Path
-            m = p.match(line)
+            m = regex.p.match(line)
             if m:
                 continue
 
             # BGP routing table information for VRF VRF1, address family IPv4 Unicast
-            m = p1.match(line)
+            m = regex.p1.match(line)
             if m:
                 # Get values
                 vrf_name = m.groupdict()['vrf_name']
@@ -5779,7 +5832,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
 
             # BGP table version is 35, local router ID is 10.229.11.11
             # BGP table version is 381, Local Router ID is 10.4.1.2
-            m = p2.match(line)
+            m = regex.p2.match(line)
             if m:
                 bgp_table_version = int(m.groupdict()['bgp_table_version'])
                 local_router_id = m.groupdict()['local_router_id']
@@ -5788,7 +5841,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
                 continue
 
             #                     2001:db8:400:13b1:21a:1ff:feff:161/128
-            m = p3_4.match(line)
+            m = regex.p3_4.match(line)
             if m:
                 # Get keys
                 if 'njected' not in line and 'next_hop' in m.groupdict():
@@ -5808,7 +5861,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
                 continue
 
             # * i                   2001:db8:400:a2bb:0:abcd:5678:3
-            m = p3_1_2.match(line)
+            m = regex.p3_1_2.match(line)
             if m:
                 # Get keys
                 if 'njected' not in line and 'next_hop' in m.groupdict():
@@ -5829,7 +5882,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
                 continue
             
             # *> [3][0][32][192.168.19.35]/70
-            m = p14.match(line)
+            m = regex.p14.match(line)
             if m:
                 group = m.groupdict()
                 status_codes = group['status_codes'].strip()
@@ -5855,10 +5908,10 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
             
             # *>i[2]:[77][7,0][10.69.9.9,1,151587081][10.135.1.1,22][10.106.101.1,10.76.1.30]/616
             # *>i2001:db8:aaaa:1::/113       ::ffff:10.106.101.1
-            m = p3_1.match(line)
+            m = regex.p3_1.match(line)
             # *>i10.111.8.3/32     10.84.66.66           2000        100          0 200 i
             # *>i10.111.8.4/32     10.84.66.66           2000        100          0 200 i
-            m1 = p3_1_1.match(line)
+            m1 = regex.p3_1_1.match(line)
 
             m = m if m else m1
             if m:
@@ -5909,11 +5962,11 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
             #                     0.0.0.0               100      32768 i
             #                     10.106.101.1            4444       100 0 3 10 20 30 40 50 60 70 80 90 i
             # *>i                 10.106.102.4                        100          0 {62112 33492 4872 41787 13166 50081 21461 58376 29755 1135} i
-            m = p3_3.match(line)
+            m = regex.p3_3.match(line)
 
             # * e                   10.70.2.2                                      0 100 300 ?
             # *>e                   10.70.1.2                                      0 100 300 ?
-            m1 = p3_3_1.match(line)
+            m1 = regex.p3_3_1.match(line)
             m = m if m else m1
             if m and not prefix_dict:
                 # Get keys
@@ -5991,7 +6044,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
                 continue
 
             # 100      33445 i
-            m = p3_3_2.match(line)
+            m = regex.p3_3_2.match(line)
             if m:
                 # Parse numbers
                 numbers = m.groupdict()['numbers']
@@ -6045,7 +6098,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
             # Route Distinguisher: 2:100    (VRF vpn2)
             # Route Distinguisher: 10.49.1.0:3    (L3VNI 9100)
             # Route Distinguisher: 172.16.2.88:1000 (default for vrf EVPN-Multicast-BTV)
-            m = p4.match(line)
+            m = regex.p4.match(line)
             if m:
                 route_distinguisher = m.groupdict()['route_distinguisher']
                 new_address_family = original_address_family + ' RD ' + route_distinguisher
@@ -6081,10 +6134,10 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
             # *>r10.16.2.0/24        0.0.0.0                4444        100      32768 ?
             # *>i10.49.0.0/16     10.106.101.1                            100          0 10 20 30 40 50 60 70 80 90 i
             # *>i10.4.2.0/24     10.106.102.4                            100          0 {62112 33492 4872 41787 13166 50081 21461 58376 29755 1135} i
-            m = p3_2.match(line)
+            m = regex.p3_2.match(line)
 
             # *&i10.145.1.0/24        192.168.151.2                0        100          0 ?
-            m1 = p3_2_1.match(line)
+            m1 = regex.p3_2_1.match(line)
             m = m if m else m1
             if m:
                 # New prefix, reset index count
@@ -6166,7 +6219,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
                 continue
                 # BGP router identifier 10.4.1.1, local AS number 100
 
-            m = p5.match(line)
+            m = regex.p5.match(line)
             if m:
                 router_identifier = m.groupdict()['router_identifier']
                 local_as = int(m.groupdict()['local_as'])
@@ -6179,7 +6232,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
             
             # BGP generic scan interval 60 secs 
 
-            m = p6.match(line)
+            m = regex.p6.match(line)
             if m:
                 generic_scan_interval = m.groupdict()['generic_scan_interval']
                 # Set af_dict
@@ -6190,7 +6243,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
             
             # Non-stop routing is enabled
 
-            m = p7.match(line)
+            m = regex.p7.match(line)
             if m:
                 non_stop_routing = str(m.groupdict()['non_stop_routing'])
                 # Set af_dict
@@ -6201,7 +6254,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
             
             # BGP table state: Active
 
-            m = p8.match(line)
+            m = regex.p8.match(line)
             if m:
                 table_state = m.groupdict()['table_state'].lower()
                 # Set af_dict
@@ -6212,7 +6265,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
             
             # Table ID: 0x0   RD version: 0
 
-            m = p9.match(line)
+            m = regex.p9.match(line)
             if m:
                 table_id = str(m.groupdict()['table_id'])
                 rd_version = int(m.groupdict()['rd_version'])
@@ -6225,7 +6278,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
             
             # BGP main routing table version 43
 
-            m = p10.match(line)
+            m = regex.p10.match(line)
             if m:
                 bgp_table_version = int(m.groupdict()['bgp_table_version'])
                 # Set af_dict
@@ -6236,7 +6289,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
             
             # BGP NSR Initial initsync version 11 (Reached)
 
-            m = p11.match(line)
+            m = regex.p11.match(line)
             if m:
                 nsr_initial_initsync_version = m.groupdict()['nsr_initial_initsync_version']
                 nsr_initial_init_ver_status = str(m.groupdict()['nsr_initial_init_ver_status']).lower()
@@ -6249,7 +6302,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
             
             # BGP NSR/ISSU Sync-Group versions 0/0
 
-            m = p12.match(line)
+            m = regex.p12.match(line)
             if m:
                 nsr_issu_sync_group_versions = m.groupdict()['nsr_issu_sync_group_versions']
                 # Set af_dict
@@ -6260,7 +6313,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
             
             # BGP scan interval 60 secs
 
-            m = p13.match(line)
+            m = regex.p13.match(line)
             if m:
                scan_interval = int(m.groupdict()['scan_interval'])
                # Set af_dict
@@ -6270,7 +6323,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
                continue
             
             # 0.0.0.0                                0 i
-            m = p15.match(line)
+            m = regex.p15.match(line)
             if m:
                 group = m.groupdict()
                 
@@ -6335,7 +6388,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
                 continue
             
             # Processed 40 prefixes, 50 paths
-            m = p16.match(line)
+            m = regex.p16.match(line)
             if m:
                 processed_prefix = int(m.groupdict()['processed_prefix'])
                 processed_paths = int(m.groupdict()['processed_paths'])
@@ -6404,76 +6457,80 @@ class ShowBgpL2vpnEvpnAdvertised(ShowBgpL2vpnEvpnAdvertisedSchema):
 
     cli_command = 'show bgp l2vpn evpn advertised'
 
-    def cli(self, output=None):
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-
-        # Init
-        parsed_dict = {}
-        index = 1
-
+    patterns = Patterns(
         # Route Distinguisher: 10.196.7.7:3
-        p1 = re.compile(r'^Route +Distinguisher: +(?P<rd>(\S+))$')
+        p1=r'^Route +Distinguisher: +(?P<rd>(\S+))$',
 
         # [2][0][48][7777.77ff.7779][0]/104 is advertised to 10.55.0.10
         # [1][0009.08ff.0d0c.0403.0201][0]/120 is advertised to 10.100.5.5
-        p2 = re.compile(r'^(?P<prefix>\[[^/]+\])/(?P<prefix_length>(\d+)) +is'
-                         ' +advertised +to +(?P<neighbor>(\S+))$')
+        p2=r'^(?P<prefix>\[[^/]+\])/(?P<prefix_length>(\d+)) +is'
+           ' +advertised +to +(?P<neighbor>(\S+))$',
 
         #  Path info:
-        p3 = re.compile(r'^Path info:$')
+        p3=r'^Path info:$',
 
         #    neighbor: Local           neighbor router id: 10.1.8.8
         #    neighbor: Local           neighbor router id: 10.196.7.7
-        p4 = re.compile(r'^neighbor: +(?P<neighbor>(\S+)) +neighbor +router'
-                         ' +id: +(?P<neighbor_router_id>(\S+))$')
+        p4=r'^neighbor: +(?P<neighbor>(\S+)) +neighbor +router'
+           ' +id: +(?P<neighbor_router_id>(\S+))$',
 
         #    valid  redistributed  best  import-candidate
-        p5 = re.compile(r'^(?P<flags>(valid.*))$')
+        p5=r'^(?P<flags>(valid.*))$',
 
         #    Received Path ID 0, Local Path ID 0, version 12
-        p6 = re.compile(r'^Received +Path +ID +(?P<rx_path_id>(\d+)), +Local'
-                         ' +Path +ID +(?P<local_path_id>(\d+)), +version'
-                         ' (?P<version>(\d+))$')
+        p6=r'^Received +Path +ID +(?P<rx_path_id>(\d+)), +Local'
+           ' +Path +ID +(?P<local_path_id>(\d+)), +version'
+           ' (?P<version>(\d+))$',
 
         #  Attributes after inbound policy was applied:
         #  Attributes after outbound policy was applied:
-        p7 = re.compile(r'^Attributes +after +(?P<type>(outbound|inbound))'
-                         ' +policy +was +applied:$')
+        p7=r'^Attributes +after +(?P<type>(outbound|inbound))'
+           ' +policy +was +applied:$',
 
         #    next hop: 10.1.8.8
-        p8 = re.compile(r'^next +hop:(?: +(?P<nexthop>(\S+)))?$')
+        p8=r'^next +hop:(?: +(?P<nexthop>(\S+)))?$',
 
         #    EXTCOMM
         #    ORG AS EXTCOMM
-        p9 = re.compile(r'^(?P<community_attributes>(EXTCOMM|ORG AS EXTCOMM))$')
+        p9=r'^(?P<community_attributes>(EXTCOMM|ORG AS EXTCOMM))$',
 
-        #    origin: IGP  
-        p10 = re.compile(r'^origin:(?: +(?P<origin>.*))?$')
+        #    origin: IGP
+        p10=r'^origin:(?: +(?P<origin>.*))?$',
 
-        #    aspath: 
-        p11 = re.compile(r'^aspath:(?: +(?P<aspath>.*))?$')
+        #    aspath:
+        p11=r'^aspath:(?: +(?P<aspath>.*))?$',
 
         #    community: no-export
-        p12 = re.compile(r'^community:(?: +(?P<community>.*))?$')
+        p12=r'^community:(?: +(?P<community>.*))?$',
 
         #    extended community: SoO:0.0.0.0:0 RT:100:7
-        p13 = re.compile(r'^extended +community:(?: +(?P<extended_community>.*))?$')
+        p13=r'^extended +community:(?: +(?P<extended_community>.*))?$',
+    )
+
+    def cli(self, output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        # Init
+        parsed_dict = {}
+        index = 1
+
+        p = ShowBgpL2vpnEvpnAdvertised.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # Route Distinguisher: 10.196.7.7:3
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 af = 'l2vpn evpn RD ' + m.groupdict()['rd']
                 continue
 
             # [2][0][48][7777.77ff.7779][0]/104 is advertised to 10.55.0.10
             # [1][0009.08ff.0d0c.0403.0201][0]/120 is advertised to 10.100.5.5
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 adv = group['prefix'] + "/" + group['prefix_length']
@@ -6489,13 +6546,13 @@ class ShowBgpL2vpnEvpnAdvertised(ShowBgpL2vpnEvpnAdvertisedSchema):
                 continue
 
             #  Path info:
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 continue
 
             #    neighbor: Local           neighbor router id: 10.1.8.8
             #    neighbor: Local           neighbor router id: 10.196.7.7
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 adv_dict['neighbor'] = group['neighbor']
@@ -6503,13 +6560,13 @@ class ShowBgpL2vpnEvpnAdvertised(ShowBgpL2vpnEvpnAdvertisedSchema):
                 continue
 
             #    valid  redistributed  best  import-candidate
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 adv_dict['flags'] = m.groupdict()['flags'].split()
                 continue
 
             # Received Path ID 0, Local Path ID 0, version 193217
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 for key, value in group.items():
@@ -6518,7 +6575,7 @@ class ShowBgpL2vpnEvpnAdvertised(ShowBgpL2vpnEvpnAdvertisedSchema):
 
             #  Attributes after inbound policy was applied:
             #  Attributes after outbound policy was applied:
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 attr_dict = adv_dict.\
                             setdefault(m.groupdict()['type']+"_attributes", {})
@@ -6526,7 +6583,7 @@ class ShowBgpL2vpnEvpnAdvertised(ShowBgpL2vpnEvpnAdvertisedSchema):
                 continue
 
             #    next hop: 10.1.8.8
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 value = m.groupdict()['nexthop']
                 attr_dict['nexthop'] = value if value != None else ""
@@ -6534,34 +6591,34 @@ class ShowBgpL2vpnEvpnAdvertised(ShowBgpL2vpnEvpnAdvertisedSchema):
 
             #    EXTCOMM
             #    ORG AS EXTCOMM
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 attr_dict['community_attributes'] = m.groupdict()['community_attributes']
                 continue
 
             #    origin: IGP
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 value = m.groupdict()['origin']
                 attr_dict['origin'] = value if value != None else ""
                 continue
 
             #    aspath:
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 value = m.groupdict()['aspath']
                 attr_dict['aspath'] = value if value != None else ""
                 continue
 
             #    community: no-export
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 value = m.groupdict()['community']
                 attr_dict['community'] = value.split() if value != None else []
                 continue
 
             #    extended community: SoO:0.0.0.0:0 RT:100:7
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 value = m.groupdict()['extended_community']
                 attr_dict['extended_community'] = value.split() if value != None else []
@@ -22,6 +22,78 @@ from netaddr import IPAddress, IPNetwork
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
+# Parser
+from genie.libs.parser.utils.session import cached_execute, cached_parse
+
+
+def get_virtual_link_transit_areas(device):
+    """Map the name of the virtual links to their transit area id, from
+    a single 'show ospf vrf all-inclusive virtual-links'"""
+    vl_out = cached_parse(ShowOspfVrfAllInclusiveVirtualLinks, device)
+
+    transit_areas = {}
+    for vl_vrf in vl_out["vrf"].values():
+        for vl_af in vl_vrf["address_family"].values():
+            for vl_inst in vl_af["instance"].values():
+                for vl_area in vl_inst["areas"].values():
+                    for vl in vl_area["virtual_links"].values():
+                        transit_areas[vl["name"]] = vl["transit_area_id"]
+    return transit_areas
+
+
+def get_sham_link_remote_ids(device):
+    """Map the sham link interfaces to their remote_id, from a single
+    'show ospf vrf all-inclusive sham-links'"""
+    out = cached_execute(device, "show ospf vrf all-inclusive sham-links")
+
+    remote_ids = {}
+    for line in out.splitlines():
+        line = line.rstrip()
+        # Sham Link OSPF_SL0 to address 10.151.22.22 is up
+        p = re.search(
+            "Sham +Link +(?P<intf>(\S+)) +to +address"
+            " +(?P<remote>(\S+)) +is +up",
+            line,
+        )
+        if p:
+            remote_ids.setdefault(
+                str(p.groupdict()["intf"]), str(p.groupdict()["remote"])
+            )
+    return remote_ids
+
+
+def get_sham_link_local_ids(device):
+    """Map the (instance, vrf, area, remote_id) of the sham links to their
+    local_id, from a single 'show run formal router ospf | i sham'"""
+    out = cached_execute(device, "show run formal router ospf | i sham")
+
+    local_ids = {}
+    for line in out.splitlines():
+        line = line.rstrip()
+        # router ospf 1 vrf VRF1 area 1 sham-link 10.21.33.33 10.151.22.22
+        q = re.search(
+            "router +ospf +(?P<q_inst>(\d+))(?: +vrf"
+            " +(?P<q_vrf>(\S+)))? +area"
+            " +(?P<q_area>(\S+)) +sham-link"
+            " +(?P<local_id>(\S+))"
+            " +(?P<remote_id>(\S+))",
+            line,
+        )
+        if q:
+            if q.groupdict()["q_vrf"]:
+                q_vrf = str(q.groupdict()["q_vrf"])
+            else:
+                q_vrf = "default"
+            q_inst = str(q.groupdict()["q_inst"])
+            q_area = str(q.groupdict()["q_area"])
+            if q_area.isdigit():
+                q_area = str(IPAddress(q_area))
+            remote_id = str(q.groupdict()["remote_id"])
+            local_ids.setdefault(
+                (q_inst, q_vrf, q_area, remote_id), str(q.groupdict()["local_id"])
+            )
+    return local_ids
+
 
 # ==================================================
 # Schema for 'show ospf vrf all-inclusive interface'
@@ -270,6 +342,9 @@ class ShowOspfVrfAllInclusiveInterface(ShowOspfVrfAllInclusiveInterfaceSchema):
         "high_water_mark",
     ]
 
+    # Virtual and sham link lookups run on the device
+    device_lookups = True
+
     def cli(self, vrf="", interface="", output=None):
         if output is None:
             if interface:
@@ -295,6 +370,10 @@ class ShowOspfVrfAllInclusiveInterface(ShowOspfVrfAllInclusiveInterfaceSchema):
         instance = ""
         # Mapping dict
         bool_dict = {"up": True, "down": False, "unknown": False}
+        # Link lookups, resolved on the first link
+        vl_transit_areas = None
+        sl_remote_ids = None
+        sl_local_ids = None
 
         p1 = re.compile(
             r"^Interfaces +for +OSPF +(?P<instance>(\S+))"
@@ -498,45 +577,13 @@ class ShowOspfVrfAllInclusiveInterface(ShowOspfVrfAllInclusiveInterfaceSchema):
                     # Init
                     vl_transit_area_id = None
 
-                    # Execute 'show ospf vrf all-inclusive virtual-links' to get the vl_transit_area_id
-                    obj = ShowOspfVrfAllInclusiveVirtualLinks(device=self.device)
-                    vl_out = obj.parse()
-
-                    for vl_vrf in vl_out["vrf"]:
-                        for vl_af in vl_out["vrf"][vl_vrf]["address_family"]:
-                            for vl_inst in vl_out["vrf"][vl_vrf]["address_family"][
-                                vl_af
-                            ]["instance"]:
-                                for vl_area in vl_out["vrf"][vl_vrf]["address_family"][
-                                    vl_af
-                                ]["instance"][vl_inst]["areas"]:
-                                    for vl in vl_out["vrf"][vl_vrf]["address_family"][
-                                        vl_af
-                                    ]["instance"][vl_inst]["areas"][vl_area][
-                                        "virtual_links"
-                                    ]:
-                                        vl_name = vl_out["vrf"][vl_vrf][
-                                            "address_family"
-                                        ][vl_af]["instance"][vl_inst]["areas"][vl_area][
-                                            "virtual_links"
-                                        ][
-                                            vl
-                                        ][
-                                            "name"
-                                        ]
-                                        if vl_name == name:
-                                            vl_transit_area_id = vl_out["vrf"][vl_vrf][
-                                                "address_family"
-                                            ][vl_af]["instance"][vl_inst]["areas"][
-                                                vl_area
-                                            ][
-                                                "virtual_links"
-                                            ][
-                                                vl
-                                            ][
-                                                "transit_area_id"
-                                            ]
-                                            break
+                    # Execute 'show ospf vrf all-inclusive virtual-links' once
+                    # to get the vl_transit_area_id of all the virtual links
+                    if vl_transit_areas is None:
+                        vl_transit_areas = get_virtual_link_transit_areas(
+                            self.device
+                        )
+                    vl_transit_area_id = vl_transit_areas.get(name)
 
                     if vl_transit_area_id is not None:
                         intf_name = vl_transit_area_id + " " + router_id
@@ -546,63 +593,18 @@ class ShowOspfVrfAllInclusiveInterface(ShowOspfVrfAllInclusiveInterfaceSchema):
                     sl_local_id = None
                     sl_remote_id = None
 
-                    # Execute command to get sham-link remote_id
-                    cmd = "show ospf vrf all-inclusive sham-links | i {interface}".format(
-                        interface=interface
-                    )
-                    out = self.device.execute(cmd)
-
-                    for line in out.splitlines():
-                        line = line.rstrip()
-                        # Sham Link OSPF_SL0 to address 10.151.22.22 is up
-                        p = re.search(
-                            "Sham +Link +(?P<intf>(\S+)) +to +address"
-                            " +(?P<remote>(\S+)) +is +up",
-                            line,
-                        )
-                        if p:
-                            if interface == str(p.groupdict()["intf"]):
-                                sl_remote_id = str(p.groupdict()["remote"])
-                                break
+                    # Execute the sham-link commands once to get the
+                    # remote_id and local_id of all the sham links
+                    if sl_remote_ids is None:
+                        sl_remote_ids = get_sham_link_remote_ids(self.device)
+                    sl_remote_id = sl_remote_ids.get(interface)
 
-                    # Execute command to get sham-link local_id
                     if sl_remote_id is not None:
-                        cmd = "show run formal router ospf | i sham | i {remote}".format(
-                            remote=sl_remote_id
+                        if sl_local_ids is None:
+                            sl_local_ids = get_sham_link_local_ids(self.device)
+                        sl_local_id = sl_local_ids.get(
+                            (instance, vrf, area, sl_remote_id)
                         )
-                        out = self.device.execute(cmd)
-
-                        for line in out.splitlines():
-                            line = line.rstrip()
-                            # router ospf 1 vrf VRF1 area 1 sham-link 10.21.33.33 10.151.22.22
-                            q = re.search(
-                                "router +ospf +(?P<q_inst>(\d+))(?: +vrf"
-                                " +(?P<q_vrf>(\S+)))? +area"
-                                " +(?P<q_area>(\S+)) +sham-link"
-                                " +(?P<local_id>(\S+))"
-                                " +(?P<remote_id>(\S+))",
-                                line,
-                            )
-                            if q:
-                                if q.groupdict()["q_vrf"]:
-                                    q_vrf = str(q.groupdict()["q_vrf"])
-                                else:
-                                    q_vrf = "default"
-                                q_inst = str(q.groupdict()["q_inst"])
-                                q_area = str(q.groupdict()["q_area"])
-                                if q_area.isdigit():
-                                    q_area = str(IPAddress(q_area))
-                                remote_id = str(q.groupdict()["remote_id"])
-
-                                # Check parameters match
-                                if (
-                                    q_inst == instance
-                                    and q_vrf == vrf
-                                    and q_area == area
-                                    and remote_id == sl_remote_id
-                                ):
-                                    sl_local_id = str(q.groupdict()["local_id"])
-                                    break
 
                     if sl_local_id is not None:
                         intf_name = sl_local_id + " " + sl_remote_id
@@ -1011,6 +1013,9 @@ class ShowOspfVrfAllInclusiveNeighborDetail(
 
     exclude = ["dead_timer", "neighbor_uptime", "hello_timer", "total_dbd_retrans"]
 
+    # Virtual link lookups run on the device
+    device_lookups = True
+
     def cli(self, vrf="", neighbor="", interface="", output=None):
         if output is None:
             if vrf:
@@ -1047,6 +1052,8 @@ class ShowOspfVrfAllInclusiveNeighborDetail(
         # Init vars
         ret_dict = {}
         af = "ipv4"  # this is ospf - always ipv4
+        # Virtual link lookup, resolved on the first virtual link
+        vl_transit_areas = None
 
         p1 = re.compile(
             r"^Neighbors +for +OSPF +(?P<instance>(\S+))" "(?:, +VRF +(?P<vrf>(\S+)))?$"
@@ -1158,45 +1165,13 @@ class ShowOspfVrfAllInclusiveNeighborDetail(
                         intf_type = "virtual_links"
                         name = "VL" + str(n.groupdict()["num"])
 
-                    # Execute 'show ospf vrf all-inclusive virtual-links' to get the vl_transit_area_id
-                    obj = ShowOspfVrfAllInclusiveVirtualLinks(device=self.device)
-                    vl_out = obj.parse()
-
-                    for vl_vrf in vl_out["vrf"]:
-                        for vl_af in vl_out["vrf"][vl_vrf]["address_family"]:
-                            for vl_inst in vl_out["vrf"][vl_vrf]["address_family"][
-                                vl_af
-                            ]["instance"]:
-                                for vl_area in vl_out["vrf"][vl_vrf]["address_family"][
-                                    vl_af
-                                ]["instance"][vl_inst]["areas"]:
-                                    for vl in vl_out["vrf"][vl_vrf]["address_family"][
-                                        vl_af
-                                    ]["instance"][vl_inst]["areas"][vl_area][
-                                        "virtual_links"
-                                    ]:
-                                        vl_name = vl_out["vrf"][vl_vrf][
-                                            "address_family"
-                                        ][vl_af]["instance"][vl_inst]["areas"][vl_area][
-                                            "virtual_links"
-                                        ][
-                                            vl
-                                        ][
-                                            "name"
-                                        ]
-                                        if vl_name == name:
-                                            vl_transit_area_id = vl_out["vrf"][vl_vrf][
-                                                "address_family"
-                                            ][vl_af]["instance"][vl_inst]["areas"][
-                                                vl_area
-                                            ][
-                                                "virtual_links"
-                                            ][
-                                                vl
-                                            ][
-                                                "transit_area_id"
-                                            ]
-                                            break
+                    # Execute 'show ospf vrf all-inclusive virtual-links' once
+                    # to get the vl_transit_area_id of all the virtual links
+                    if vl_transit_areas is None:
+                        vl_transit_areas = get_virtual_link_transit_areas(
+                            self.device
+                        )
+                    vl_transit_area_id = vl_transit_areas.get(name)
 
                     # Change the area to transit_area_id
                     if vl_transit_area_id is not None:
@@ -7,6 +7,8 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
     Any, \
     Optional
+from genie.libs.parser.utils.stream import iter_lines
+from genie.libs.parser.utils.records import RecordParser, merge_record
 
 
 # ====================================================
@@ -82,7 +84,7 @@ class ShowRouteIpv4Schema(MetaParser):
 # ====================================================
 #  parser for show route ipv4
 # ====================================================
-class ShowRouteIpv4(ShowRouteIpv4Schema):
+class ShowRouteIpv4(ShowRouteIpv4Schema, RecordParser):
     cli_command = [
         'show route ipv4',
         'show route vrf {vrf} ipv4',
@@ -127,8 +129,26 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
     protocol_set = {'ospf', 'odr', 'isis', 'eigrp', 'static', 'mobile',
                     'rip', 'lisp', 'nhrp', 'local', 'connected', 'bgp'}
 
+    record_keys = ('vrf', 'address_family')
+
     def cli(self, vrf=None, route=None, protocol=None, output=None):
-        
+        return self.aggregate(self.cli_iter(vrf=vrf, route=route,
+                                            protocol=protocol, output=output))
+
+    def add_record(self, parsed, record):
+        vrf_dict = parsed.setdefault('vrf', {}).setdefault(record['vrf'], {})
+        if 'last_resort' in record:
+            vrf_dict.setdefault('last_resort', {}).update(record['last_resort'])
+        else:
+            route_dict = vrf_dict.setdefault('address_family', {}). \
+                setdefault(record['address_family'], {}). \
+                setdefault('routes', {}). \
+                setdefault(record['route'], {})
+            merge_record(route_dict, self.record_data(record))
+
+    def cli_iter(self, vrf=None, route=None, protocol=None, output=None):
+        """Yield one record per route and one per gateway of last resort"""
+
         # Check if argument from device.parse is protocol or route
         if protocol and protocol not in self.protocol_set:
             route = protocol
@@ -255,13 +275,13 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
                          r'+(?P<to_network>\S+))?$')
 
         # initial variables
-        ret_dict = {}
+        route_dict = None
         index = 0
         address_family = 'ipv4'
         if not vrf:
             vrf = 'default'
 
-        for line in out.splitlines():
+        for line in iter_lines(out):
             line = line.strip()
             
             # R2_xrv#show route ipv4
@@ -303,12 +323,9 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
                 updated = group['date']
                 interface = group['interface']
 
-                route_dict = ret_dict.setdefault('vrf', {}). \
-                    setdefault(vrf, {}). \
-                    setdefault('address_family', {}). \
-                    setdefault(address_family, {}). \
-                    setdefault('routes', {}). \
-                    setdefault(network, {})
+                if route_dict is not None:
+                    yield route_dict
+                route_dict = {'vrf': vrf, 'address_family': address_family}
 
                 route_dict.update({'route': network})
                 route_dict.update({'active': True})
@@ -370,12 +387,9 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
                     interface = group.get('interface', None)
 
                     if network:
-                        route_dict = ret_dict.setdefault('vrf', {}). \
-                            setdefault(vrf, {}). \
-                            setdefault('address_family', {}). \
-                            setdefault(address_family, {}). \
-                            setdefault('routes', {}). \
-                            setdefault(network, {})
+                        if route_dict is not None:
+                            yield route_dict
+                        route_dict = {'vrf': vrf, 'address_family': address_family}
 
                         route_dict.update({'route': network})
                         route_dict.update({'active': True})
@@ -416,12 +430,9 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
                 network = group['network']
                 ip = group['ip']
                 mask = group['mask']
-                route_dict = ret_dict.setdefault('vrf', {}). \
-                    setdefault(vrf, {}). \
-                    setdefault('address_family', {}). \
-                    setdefault(address_family, {}). \
-                    setdefault('routes', {}). \
-                    setdefault(network, {})
+                if route_dict is not None:
+                    yield route_dict
+                route_dict = {'vrf': vrf, 'address_family': address_family}
                 route_dict.update({'route': network})
                 route_dict.update({'ip': ip})
                 route_dict.update({'mask': mask})
@@ -460,12 +471,9 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
                 interface = group.get('interface', None)
 
                 if network:
-                    route_dict = ret_dict.setdefault('vrf', {}). \
-                        setdefault(vrf, {}). \
-                        setdefault('address_family', {}). \
-                        setdefault(address_family, {}). \
-                        setdefault('routes', {}). \
-                        setdefault(network, {})
+                    if route_dict is not None:
+                        yield route_dict
+                    route_dict = {'vrf': vrf, 'address_family': address_family}
 
                     route_dict.update({'route': network})
                     route_dict.update({'active': True})
@@ -584,15 +592,14 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
             m15 = p15.match(line)
             if m15:
                 group = m15.groupdict()
-                gw_dict = ret_dict.setdefault('vrf', {}).\
-                    setdefault(vrf, {}).\
-                    setdefault('last_resort', {})
-                gw_dict.update({'gateway': group['gateway']})
+                gw_dict = {'gateway': group['gateway']}
 
                 if group['to_network']:
                     gw_dict.update({'to_network': group['to_network']})
-        
-        return ret_dict
+                yield {'vrf': vrf, 'last_resort': gw_dict}
+
+        if route_dict is not None:
+            yield route_dict
 
 
 # ====================================================
@@ -758,7 +765,7 @@ class ShowRouteIpv6(ShowRouteIpv4Schema):
         if not vrf:
             vrf = 'default'
 
-        for line in out.splitlines():
+        for line in iter_lines(out):
             line = line.strip()
 
             # R2_xrv#show route ipv6
@@ -691,19 +691,19 @@ class test_show_ospf_vrf_all_inclusive_interface(unittest.TestCase):
             """
 
         raw2 = """\
-            RP/0/0/CPU0:R3_ospf_xr#show ospf vrf all-inclusive sham-links | i OSPF_SL0
+            RP/0/0/CPU0:R3_ospf_xr#show ospf vrf all-inclusive sham-links
             Sham Link OSPF_SL0 to address 10.151.22.22 is up
             """
 
         raw3 = """\
-            RP/0/0/CPU0:R3_ospf_xr#show run formal router ospf | i sham | i 10.151.22.22
+            RP/0/0/CPU0:R3_ospf_xr#show run formal router ospf | i sham
             router ospf 1 vrf VRF1 area 1 sham-link 10.21.33.33 10.151.22.22
             """
 
         self.outputs = {}
         self.outputs["show ospf vrf all-inclusive interface"] = raw1
-        self.outputs["show ospf vrf all-inclusive sham-links | i OSPF_SL0"] = raw2
-        self.outputs["show run formal router ospf | i sham | i 10.151.22.22"] = raw3
+        self.outputs["show ospf vrf all-inclusive sham-links"] = raw2
+        self.outputs["show run formal router ospf | i sham"] = raw3
 
         self.device.execute = Mock()
         self.device.execute.side_effect = mapper
@@ -847,6 +847,76 @@ class test_show_ospf_vrf_all_inclusive_interface(unittest.TestCase):
         parsed_output = obj.parse()
         self.assertEqual(parsed_output, self.golden_parsed_output2)
 
+    def test_show_ospf_vrf_all_inclusive_interface_link_count(self):
+
+        # The virtual-link and sham-link commands are executed once per
+        # parse, whatever the number of links
+        vl_intf = """\
+            OSPF_VL{num} is unknown, line protocol is up
+              Internet Address 0.0.0.0/0, Area 0
+              Process ID 1, Router ID 10.16.2.2, Network Type VIRTUAL_LINK, Cost: 1
+              Transmit Delay is 1 sec, State POINT_TO_POINT, MTU 0, MaxPktSz 1500
+              Timer intervals configured, Hello 10, Dead 40, Wait 40, Retransmit 5
+            """
+        sl_intf = """\
+            OSPF_SL{num} is unknown, line protocol is up
+              Internet Address 0.0.0.0/0, Area 1
+              Process ID 1, VRF VRF1, Router ID 10.36.3.3, Network Type SHAM_LINK, Cost: 111
+              Transmit Delay is 7 sec, State POINT_TO_POINT, MTU 0, MaxPktSz 1500
+              Timer intervals configured, Hello 3, Dead 13, Wait 13, Retransmit 5
+            """
+        vl_link = """\
+            Virtual Link OSPF_VL{num} to router 10.64.4.{num} is up
+              Transit area {num}, via interface GigabitEthernet0/0/0/3, Cost of using 65535
+              Transmit Delay is 5 sec, State POINT_TO_POINT,
+              Timer intervals configured, Hello 4, Dead 16, Wait 16, Retransmit 44
+            """
+
+        def parse(count):
+            links = range(1, count + 1)
+            outputs = {
+                "show ospf vrf all-inclusive interface": "Interfaces for OSPF 1\n"
+                + "".join(vl_intf.format(num=num) for num in links)
+                + "Interfaces for OSPF 1, VRF VRF1\n"
+                + "".join(sl_intf.format(num=num) for num in links),
+                "show ospf vrf all-inclusive virtual-links": "Virtual Links for OSPF 1\n"
+                + "".join(vl_link.format(num=num) for num in links),
+                "show ospf vrf all-inclusive sham-links": "".join(
+                    "Sham Link OSPF_SL{num} to address 10.151.22.{num} is up\n".format(
+                        num=num
+                    )
+                    for num in links
+                ),
+                "show run formal router ospf | i sham": "".join(
+                    "router ospf 1 vrf VRF1 area 1 sham-link 10.21.33.33 "
+                    "10.151.22.{num}\n".format(num=num)
+                    for num in links
+                ),
+            }
+            device = Mock(**{"execute.side_effect": outputs.__getitem__})
+            parsed = ShowOspfVrfAllInclusiveInterface(device=device).parse()
+            return parsed, device.execute.call_count
+
+        for count in (1, 32):
+            parsed, call_count = parse(count)
+            self.assertEqual(call_count, 4)
+            instance = parsed["vrf"]["default"]["address_family"]["ipv4"][
+                "instance"
+            ]["1"]
+            self.assertIn(
+                "0.0.0.{count} 10.16.2.2".format(count=count),
+                instance["areas"]["0.0.0.{count}".format(count=count)][
+                    "virtual_links"
+                ],
+            )
+            sham_links = parsed["vrf"]["VRF1"]["address_family"]["ipv4"][
+                "instance"
+            ]["1"]["areas"]["0.0.0.1"]["sham_links"]
+            self.assertEqual(len(sham_links), count)
+            self.assertIn(
+                "10.21.33.33 10.151.22.{count}".format(count=count), sham_links
+            )
+
     def test_show_ospf_vrf_all_inclusive_interface_empty(self):
         self.maxDiff = None
         self.device = Mock(**self.empty_output)
@@ -29,6 +29,10 @@ import re
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Any, Optional, Use, Schema, ListOf, Or
+from genie.libs.parser.utils.stream import iter_lines
+from genie.libs.parser.utils.compact import CompactParser
+from genie.libs.parser.utils.interning import intern_parsed
+
 '''
 Schema for:
     * show route table {table}
@@ -803,7 +807,8 @@ class ShowRouteProtocolExtensiveSchema(MetaParser):
     }
 
 
-class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
+class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema,
+                                 CompactParser):
     """ Parser for:
             * show route protocol {protocol} extensive
             * show route protocol {protocol} table {table} extensive
@@ -820,6 +825,18 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                     'show route extensive',
                     'show route extensive {destination}',
                     'show route protocol {protocol} {destination} extensive']
+
+    # Low cardinality values, see intern_parsed()
+    intern_fields = ['@junos:style', '@junos:indent', '@junos:format',
+                     'rt-announced-count', 'rt-prefix-length', 'rt-state',
+                     'accepted', 'active-tag', 'announce-bits', 'announce-tasks',
+                     'current-active', 'gateway', 'inactive-reason',
+                     'local-as', 'local-preference', 'peer-as', 'peer-id',
+                     'nh-type', 'nh-string', 'preference', 'preference2',
+                     'protocol-name', 'rt-entry-state', 'task-name',
+                     'validation-state', 'selected-next-hop', 'indirect-nh',
+                     'to', 'via', 'weight']
+
     def cli(self, protocol=None, table=None, 
             destination=None, route=None, 
             output=None):
@@ -1017,7 +1034,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
         # Router ID: 10.16.2.2
         p37 = re.compile(r'^Router +ID: +(?P<peer_id>\S+)$')
 
-        for line in out.splitlines():
+        for line in iter_lines(out):
             line = line.strip()
             # inet.0: 929 destinations, 1615 routes (929 active, 0 holddown, 0 hidden)
             m = p1.match(line)
@@ -1476,7 +1493,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 rt_entry_dict.update({'peer-id': group['peer_id']})
                 continue
 
-        return ret_dict
+        return intern_parsed(self, ret_dict)
     
 class ShowRouteForwardingTableSummarySchema(MetaParser):
     """ Schema for:
@@ -63,6 +63,11 @@ from genie.libs.parser.yang.bgp_openconfig_yang import BgpOpenconfigYang
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.stream import iter_lines
+from genie.libs.parser.utils.compact import CompactParser
+from genie.libs.parser.utils.interning import intern_parsed
+from genie.libs.parser.utils.xml_stream import XmlRow, iter_xml_rows
 
 
 # =====================================
@@ -190,6 +195,185 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
       'paths',
       'routes']
 
+    patterns = Patterns(
+        p1=r'^\s*BGP +Process +ID *: +(?P<bgp_pid>[0-9]+)$',
+        p2=r'^\s*BGP Protocol Started, +reason: *:'
+           ' +(?P<reason>[a-zA-Z\s]+)$',
+        p2_1=r'^\s*BGP +Performance +Mode: *:'
+             ' +(?P<performance_mode>[a-zA-Z\s]+)$',
+        p3=r'^\s*BGP +Protocol +Tag *:'
+           ' +(?P<bgp_tag>[a-zA-Z0-9]+)$',
+        p4=r'^\s*BGP +Protocol +State *:'
+           ' +(?P<protocol_state>[a-zA-Z\(\)\s]+)$',
+        p4_1=r'^\s*BGP +Isolate +Mode *:'
+             ' +(?P<isolate_mode>[a-zA-Z\s]+)$',
+        p4_3=r'^\s*BGP +MMODE *:'
+             ' +(?P<mmode>[a-zA-Z\s]+)$',
+        p5=r'^\s*BGP +Memory +State *:'
+           ' +(?P<memory_state>[\w\s]+)$',
+        p5_1=r'^\s*BGP +asformat *:'
+             ' +(?P<asformat>[a-zA-Z\s]+)$',
+        p5_2=r'^\s*Segment +Routing +Global +Block *:'
+             ' +(?P<segment>[0-9\-]+)$',
+        p6=r'^\s*Number +of +attribute +entries *:'
+           ' +(?P<num_attr_entries>[0-9]+)$',
+        p7=r'^\s*HWM +of +attribute +entries *:'
+           ' +(?P<hwm_attr_entries>[0-9]+)$',
+        p8=r'^\s*Bytes +used +by +entries *:'
+           ' +(?P<bytes_used>[0-9]+)$',
+        p9=r'^\s*Entries +pending +delete *:'
+           ' +(?P<entries_pending_delete>[0-9]+)$',
+        p10=r'^\s*HWM +of +entries +pending +delete *:'
+            ' +(?P<hwm_entries_pending_delete>[0-9]+)$',
+        p11=r'^\s*BGP +paths +per +attribute +HWM *:'
+            ' +(?P<bgp_paths_per_hwm_attr>[0-9]+)$',
+        p12=r'^\s*BGP +AS +path +entries *:'
+            ' +(?P<bgp_as_path_entries>[0-9]+)$',
+        p13=r'^\s*Bytes +used +by +AS +path +entries *:'
+            ' +(?P<bytes_used_as_path_entries>[0-9]+)$',
+        p14=r'^\s*BGP +Information +for +VRF'
+            ' +(?P<vrf_name>(\S+))$',
+        p15=r'^\s*VRF +Id *:'
+            ' +(?P<vrf_id>[a-zA-Z0-9]+)$',
+        p16=r'^\s*VRF +state *:'
+            ' +(?P<vrf_state>[a-zA-Z]+)$',
+        p16_1=r'^\s*VNID *:'
+              ' +(?P<vnid>[a-zA-Z0-9]+)(?: +\((\S+)\))?$',
+        p16_2=r'^\s*Topo +Id *: +(?P<topo_id>(\d+))$',
+        p16_3=r'^\s*Encap +type *: +(?P<etype>(\S+))$',
+        p16_4=r'^\s*VTEP +IP *: +(?P<vtep_ip>(\S+))$',
+        p16_5=r'^\s*VTEP +Virtual +IP *: +(?P<vtep_vip>(\S+))$',
+        p16_6=r'^\s*VTEP +VIP-R *: +(?P<vipr>(\S+))$',
+        p16_7=r'^\s*Router-MAC *: +(?P<router_mac>(\S+))$',
+        p16_8=r'^\s*VIP +Derived +MAC *: +(?P<vipd_mac>(\S+))$',
+        p17=r'^\s*Router-ID *:'
+            ' +(?P<router_id>[0-9\.]+)$',
+        p18=r'^\s*Configured +Router-ID *:'
+            ' +(?P<conf_router_id>[0-9\.]+)$',
+        p19=r'^\s*Confed-ID *:'
+            ' +(?P<confed_id>[0-9]+)$',
+        p20=r'^\s*Cluster-ID *:'
+            ' +(?P<cluster_id>[0-9\.]+)$',
+        p21=r'^\s*No. +of +configured +peers *:'
+            ' +(?P<num_conf_peers>[0-9]+)$',
+        p22=r'^\s*No. +of +pending +config +peers *:'
+            ' +(?P<num_pending_conf_peers>[0-9]+)$',
+        p23=r'^\s*No. +of +established +peers *:'
+            ' +(?P<num_established_peers>[0-9]+)$',
+        p24=r'^\s*VRF +RD *:'
+            ' +(?P<vrf_rd>[a-zA-Z0-9\:\.\s]+)$',
+        p24_1=r'^\s*VRF +EVPN +RD *:'
+              ' +(?P<vrf_evpn_rd>[a-zA-Z0-9\:\.\s]+)$',
+        p25=r'^\s*Information +for +address +family'
+            ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)'
+            ' +in +VRF +(?P<vrf>(\S+))$',
+        p26=r'^\s*Table +Id *: +(?P<table_id>(\S+))$',
+        p27=r'^\s*Table +state *: +(?P<table_state>[a-zA-Z]+)$',
+        p28=r'^\s*(?P<peers>[0-9]+) +(?P<active_peers>[0-9]+)'
+            ' +(?P<routes>[0-9]+) +(?P<paths>[0-9]+)'
+            ' +(?P<networks>[0-9]+) +(?P<aggregates>[0-9]+)$',
+        p29=r'^\s*(?P<name>[a-zA-Z]+),'
+            ' +route-map +(?P<route_map>[a-zA-Z0-9\-\_]+)$',
+        p30=r'^\s*(?P<type>(Export|Import|EVPN Export|'
+            'EVPN Import|MVPN Export|MVPN Import)) +RT +list'
+            ' *:(?: +(?P<rt_list>[0-9\:]+))?$',
+        p31=r'^\s*(?P<rt_list>(\d+)\:(\d+))$',
+        p32=r'^\s*Label +mode *: +(?P<label_mode>[a-zA-Z\-]+)$',
+        p32_1=r'^\s*Is +a +Route\-reflector$',
+        p33=r'^\s*Aggregate +label *:'
+            ' +(?P<aggregate_label>[a-zA-Z0-9\-]+)$',
+        p33_1=r'^\s*Allocate-index *:'
+              ' +(?P<allocate_index>[a-zA-Z0-9\-]+)$',
+        p34=r'^\s*Import +default +limit *:'
+            ' +(?P<import_default_prefix_limit>[0-9]+)$',
+        p35=r'^\s*Import +default +prefix +count *:'
+            ' +(?P<import_default_prefix_count>[0-9]+)$',
+        p36=r'^\s*Import +default +map *:'
+            ' +(?P<import_default_map>[a-zA-Z0-9\_\-]+)$',
+        p37=r'^\s*Export +default +limit *:'
+            ' +(?P<export_default_prefix_limit>[0-9]+)$',
+        p38=r'^\s*Export +default +prefix +count *:'
+            ' +(?P<export_default_prefix_count>[0-9]+)$',
+        p39=r'^\s*Export +default +map *:'
+            ' +(?P<export_default_map>[a-zA-Z0-9\_\-]+)$',
+        p40=r'^\s*Nexthop +trigger-delay$',
+        p41=r'^\s*critical +(?P<critical>[0-9]+) +ms$',
+        p42=r'^\s*non-critical +(?P<non_critical>[0-9]+) +ms$',
+    )
+
+    # Rows of the xml output, see utils.xml_stream
+    xml_rows = XmlRow('process', '**/__readonly__', {
+        'processid': ('bgp_pid', int),
+        'protocolstartedreason': 'bgp_protocol_started_reason',
+        'protocoltag': 'bgp_tag',
+        'protocolstate': ('bgp_protocol_state', str.lower),
+        'isolatemode': 'bgp_isolate_mode',
+        'mmode': 'bgp_mmode',
+        'memorystate': ('bgp_memory_state', str.lower),
+        'forwardingstatesaved': ('bgp_performance_mode',
+                                 lambda text: 'No' if text == 'false' else 'Yes'),
+        'asformat': 'bgp_asformat',
+        'srgbmin': 'srgb_min',
+        'srgbmax': 'srgb_max',
+        'attributeentries': ('num_attr_entries', int),
+        'hwmattributeentries': ('hwm_attr_entries', int),
+        'bytesused': ('bytes_used', int),
+        'entriespendingdelete': ('entries_pending_delete', int),
+        'hwmentriespendingdelete': ('hwm_entries_pending_delete', int),
+        'pathsperattribute': ('bgp_paths_per_hwm_attr', int),
+        'aspathentries': ('bgp_as_path_entries', int),
+        'aspathbytes': ('bytes_used_as_path_entries', int),
+    }, rows=[
+        XmlRow('vrf', 'TABLE_vrf/ROW_vrf', {
+            'vrf-name-out': 'vrf',
+            'vrf-id': 'vrf_id',
+            'vrf-state': ('vrf_state', str.lower),
+            'vrf-router-id': 'router_id',
+            'vrf-cfgd-id': 'conf_router_id',
+            'vrf-confed-id': ('confed_id', int),
+            'vrf-cluster-id': 'cluster_id',
+            'vrf-peers': ('num_conf_peers', int),
+            'vrf-pending-peers': ('num_pending_conf_peers', int),
+            'vrf-est-peers': ('num_established_peers', int),
+            'vrf-rd': 'vrf_rd',
+        }, rows=[
+            XmlRow('address_family', 'TABLE_af/ROW_af', {
+                'af-name': ('address_family', str.lower),
+                'af-table-id': ('table_id',
+                                lambda text: text if '0x' in text else '0x' + text),
+                'af-state': ('table_state', str.lower),
+                'af-num-peers': ('peers', int),
+                'af-num-active-peers': ('active_peers', int),
+                'af-peer-routes': ('routes', int),
+                'af-peer-paths': ('paths', int),
+                'af-peer-networks': ('networks', int),
+                'af-peer-aggregates': ('aggregates', int),
+                'af-rr': 'route_reflector',
+                'nexthop-trigger-delay-critical': ('critical', int),
+                'nexthop-trigger-delay-non-critical': ('non_critical', int),
+                'af-aggregate-label': 'aggregate_label',
+                'af-label-mode': 'label_mode',
+                'importdefault_map': 'import_default_map',
+                'importdefault_prefixlimit': ('import_default_prefix_limit', int),
+                'importdefault_prefixcount': ('import_default_prefix_count', int),
+                'exportdefault_map': 'export_default_map',
+                'exportdefault_prefixlimit': ('export_default_prefix_limit', int),
+                'exportdefault_prefixcount': ('export_default_prefix_count', int),
+            }, rows=[
+                XmlRow('redistribution', 'TABLE_redist/ROW_redist', {
+                    'protocol': 'protocol',
+                    'route-map': 'route_map',
+                }),
+                XmlRow('export_rt_list',
+                       'TABLE_evpn_export_rt/ROW_evpn_export_rt',
+                       {'evpn-export-rt': 'rt'}),
+                XmlRow('import_rt_list',
+                       'TABLE_evpn_import_rt/ROW_evpn_import_rt',
+                       {'evpn-import-rt': 'rt'}),
+            ]),
+        ]),
+    ])
+
     def cli(self, vrf='', output=None):
         if vrf:
             cmd = self.cli_command[1].format(vrf=vrf)
@@ -203,177 +387,74 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
         # Init vars
         parsed_dict = {}
 
-        p1 = re.compile(r'^\s*BGP +Process +ID *: +(?P<bgp_pid>[0-9]+)$')
-        p2 = re.compile(r'^\s*BGP Protocol Started, +reason: *:'
-                            ' +(?P<reason>[a-zA-Z\s]+)$')
-        p2_1 = re.compile(r'^\s*BGP +Performance +Mode: *:'
-                            ' +(?P<performance_mode>[a-zA-Z\s]+)$')
-        p3 = re.compile(r'^\s*BGP +Protocol +Tag *:'
-                            ' +(?P<bgp_tag>[a-zA-Z0-9]+)$')
-        p4 = re.compile(r'^\s*BGP +Protocol +State *:'
-                            ' +(?P<protocol_state>[a-zA-Z\(\)\s]+)$')
-        p4_1 = re.compile(r'^\s*BGP +Isolate +Mode *:'
-                            ' +(?P<isolate_mode>[a-zA-Z\s]+)$')
-        p4_3 = re.compile(r'^\s*BGP +MMODE *:'
-                            ' +(?P<mmode>[a-zA-Z\s]+)$')
-        p5 = re.compile(r'^\s*BGP +Memory +State *:'
-                            ' +(?P<memory_state>[\w\s]+)$')
-        p5_1 = re.compile(r'^\s*BGP +asformat *:'
-                            ' +(?P<asformat>[a-zA-Z\s]+)$')
-        p5_2 = re.compile(r'^\s*Segment +Routing +Global +Block *:'
-                            ' +(?P<segment>[0-9\-]+)$')
-        p6 = re.compile(r'^\s*Number +of +attribute +entries *:'
-                            ' +(?P<num_attr_entries>[0-9]+)$')
-        p7 = re.compile(r'^\s*HWM +of +attribute +entries *:'
-                            ' +(?P<hwm_attr_entries>[0-9]+)$')
-        p8 = re.compile(r'^\s*Bytes +used +by +entries *:'
-                            ' +(?P<bytes_used>[0-9]+)$')
-        p9 = re.compile(r'^\s*Entries +pending +delete *:'
-                            ' +(?P<entries_pending_delete>[0-9]+)$')
-        p10 = re.compile(r'^\s*HWM +of +entries +pending +delete *:'
-                            ' +(?P<hwm_entries_pending_delete>[0-9]+)$')
-        p11 = re.compile(r'^\s*BGP +paths +per +attribute +HWM *:'
-                            ' +(?P<bgp_paths_per_hwm_attr>[0-9]+)$')
-        p12 = re.compile(r'^\s*BGP +AS +path +entries *:'
-                            ' +(?P<bgp_as_path_entries>[0-9]+)$')
-        p13 = re.compile(r'^\s*Bytes +used +by +AS +path +entries *:'
-                            ' +(?P<bytes_used_as_path_entries>[0-9]+)$')
-        p14 = re.compile(r'^\s*BGP +Information +for +VRF'
-                            ' +(?P<vrf_name>(\S+))$')
-        p15 = re.compile(r'^\s*VRF +Id *:'
-                            ' +(?P<vrf_id>[a-zA-Z0-9]+)$')
-        p16 = re.compile(r'^\s*VRF +state *:'
-                            ' +(?P<vrf_state>[a-zA-Z]+)$')
-        p16_1 = re.compile(r'^\s*VNID *:'
-                            ' +(?P<vnid>[a-zA-Z0-9]+)(?: +\((\S+)\))?$')
-        p16_2 = re.compile(r'^\s*Topo +Id *: +(?P<topo_id>(\d+))$')
-        p16_3 = re.compile(r'^\s*Encap +type *: +(?P<etype>(\S+))$')
-        p16_4 = re.compile(r'^\s*VTEP +IP *: +(?P<vtep_ip>(\S+))$')
-        p16_5 = re.compile(r'^\s*VTEP +Virtual +IP *: +(?P<vtep_vip>(\S+))$')
-        p16_6 = re.compile(r'^\s*VTEP +VIP-R *: +(?P<vipr>(\S+))$')
-        p16_7 = re.compile(r'^\s*Router-MAC *: +(?P<router_mac>(\S+))$')
-        p16_8 = re.compile(r'^\s*VIP +Derived +MAC *: +(?P<vipd_mac>(\S+))$')
-        p17 = re.compile(r'^\s*Router-ID *:'
-                            ' +(?P<router_id>[0-9\.]+)$')
-        p18 = re.compile(r'^\s*Configured +Router-ID *:'
-                            ' +(?P<conf_router_id>[0-9\.]+)$')
-        p19 = re.compile(r'^\s*Confed-ID *:'
-                            ' +(?P<confed_id>[0-9]+)$')
-        p20 = re.compile(r'^\s*Cluster-ID *:'
-                            ' +(?P<cluster_id>[0-9\.]+)$')
-        p21 = re.compile(r'^\s*No. +of +configured +peers *:'
-                            ' +(?P<num_conf_peers>[0-9]+)$')
-        p22 = re.compile(r'^\s*No. +of +pending +config +peers *:'
-                            ' +(?P<num_pending_conf_peers>[0-9]+)$')
-        p23 = re.compile(r'^\s*No. +of +established +peers *:'
-                            ' +(?P<num_established_peers>[0-9]+)$')
-        p24 = re.compile(r'^\s*VRF +RD *:'
-                            ' +(?P<vrf_rd>[a-zA-Z0-9\:\.\s]+)$')
-        p24_1 = re.compile(r'^\s*VRF +EVPN +RD *:'
-                            ' +(?P<vrf_evpn_rd>[a-zA-Z0-9\:\.\s]+)$')
-        p25 = re.compile(r'^\s*Information +for +address +family'
-                            ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)'
-                            ' +in +VRF +(?P<vrf>(\S+))$')
-        p26 = re.compile(r'^\s*Table +Id *: +(?P<table_id>(\S+))$')
-        p27 = re.compile(r'^\s*Table +state *: +(?P<table_state>[a-zA-Z]+)$')
-        p28 = re.compile(r'^\s*(?P<peers>[0-9]+) +(?P<active_peers>[0-9]+)'
-                            ' +(?P<routes>[0-9]+) +(?P<paths>[0-9]+)'
-                            ' +(?P<networks>[0-9]+) +(?P<aggregates>[0-9]+)$')
-        p29 = re.compile(r'^\s*(?P<name>[a-zA-Z]+),'
-                            ' +route-map +(?P<route_map>[a-zA-Z0-9\-\_]+)$')
-        p30 = re.compile(r'^\s*(?P<type>(Export|Import|EVPN Export|'
-                            'EVPN Import|MVPN Export|MVPN Import)) +RT +list'
-                            ' *:(?: +(?P<rt_list>[0-9\:]+))?$')
-        p31 = re.compile(r'^\s*(?P<rt_list>(\d+)\:(\d+))$')
-        p32 = re.compile(r'^\s*Label +mode *: +(?P<label_mode>[a-zA-Z\-]+)$')
-        p32_1 = re.compile(r'^\s*Is +a +Route\-reflector$')
-        p33 = re.compile(r'^\s*Aggregate +label *:'
-                            ' +(?P<aggregate_label>[a-zA-Z0-9\-]+)$')
-        p33_1 = re.compile(r'^\s*Allocate-index *:'
-                           ' +(?P<allocate_index>[a-zA-Z0-9\-]+)$')
-        p34 = re.compile(r'^\s*Import +default +limit *:'
-                            ' +(?P<import_default_prefix_limit>[0-9]+)$')
-        p35 = re.compile(r'^\s*Import +default +prefix +count *:'
-                            ' +(?P<import_default_prefix_count>[0-9]+)$')
-        p36 = re.compile(r'^\s*Import +default +map *:'
-                            ' +(?P<import_default_map>[a-zA-Z0-9\_\-]+)$')
-        p37 = re.compile(r'^\s*Export +default +limit *:'
-                            ' +(?P<export_default_prefix_limit>[0-9]+)$')
-        p38 = re.compile(r'^\s*Export +default +prefix +count *:'
-                            ' +(?P<export_default_prefix_count>[0-9]+)$')
-        p39 = re.compile(r'^\s*Export +default +map *:'
-                            ' +(?P<export_default_map>[a-zA-Z0-9\_\-]+)$')
-        p40 = re.compile(r'^\s*Nexthop +trigger-delay$')
-        p41 = re.compile(r'^\s*critical +(?P<critical>[0-9]+) +ms$')
-        p42 = re.compile(r'^\s*non-critical +(?P<non_critical>[0-9]+) +ms$')
-
+        p = ShowBgpProcessVrfAll.patterns
 
         for line in out.splitlines():
             line = line.replace('\t', '    ')
             line = line.rstrip()
 
             # BGP Process ID                 : 29474
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 parsed_dict['bgp_pid'] = int(m.groupdict()['bgp_pid'])
                 continue
 
             # BGP Protocol Started, reason:  : configuration
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 parsed_dict['bgp_protocol_started_reason'] = \
                     str(m.groupdict()['reason']).lower()
                 continue
 
             # BGP Performance Mode:          : No
-            m = p2_1.match(line)
+            m = p.p2_1.match(line)
             if m:
                 parsed_dict['bgp_performance_mode'] = \
                     str(m.groupdict()['performance_mode'])
                 continue
 
             # BGP Protocol Tag               : 100
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 parsed_dict['bgp_tag'] = str(m.groupdict()['bgp_tag']).lower()
                 continue
 
             # BGP Protocol State             : Running
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 parsed_dict['bgp_protocol_state'] = \
                     str(m.groupdict()['protocol_state']).lower()
                 continue
 
             # BGP Isolate Mode               : No
-            m = p4_1.match(line)
+            m = p.p4_1.match(line)
             if m:
                 parsed_dict['bgp_isolate_mode'] = \
                     str(m.groupdict()['isolate_mode'])
                 continue
 
             # BGP MMODE                      : Initialized
-            m = p4_3.match(line)
+            m = p.p4_3.match(line)
             if m:
                 parsed_dict['bgp_mmode'] = str(m.groupdict()['mmode'])
                 continue
 
             # BGP Memory State               : OK
             # BGP Memory State               : Severe Alert
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 parsed_dict['bgp_memory_state'] = \
                     str(m.groupdict()['memory_state']).lower()
                 continue
 
             # BGP asformat                   : asplain
-            m = p5_1.match(line)
+            m = p.p5_1.match(line)
             if m:
                 parsed_dict['bgp_asformat'] = str(m.groupdict()['asformat'])
                 continue
 
             # Segment Routing Global Block   : 10000-25000
-            m = p5_2.match(line)
+            m = p.p5_2.match(line)
             if m:
                 parsed_dict['segment_routing_global_block'] = \
                     str(m.groupdict()['segment'])
@@ -381,62 +462,62 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
 
             # BGP attributes information
             # Number of attribute entries    : 4
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 parsed_dict['num_attr_entries'] = \
                     int(m.groupdict()['num_attr_entries'])
                 continue
 
             # HWM of attribute entries       : 5
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 parsed_dict['hwm_attr_entries'] = \
                     int(m.groupdict()['hwm_attr_entries'])
                 continue
 
             # Bytes used by entries          : 368
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 parsed_dict['bytes_used'] = int(m.groupdict()['bytes_used'])
                 continue
 
             # Entries pending delete         : 0
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 parsed_dict['entries_pending_delete'] = \
                     int(m.groupdict()['entries_pending_delete'])
                 continue
 
             # HWM of entries pending delete  : 0
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 parsed_dict['hwm_entries_pending_delete'] = \
                     int(m.groupdict()['hwm_entries_pending_delete'])
                 continue
 
             # BGP paths per attribute HWM    : 1
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 parsed_dict['bgp_paths_per_hwm_attr'] = \
                     int(m.groupdict()['bgp_paths_per_hwm_attr'])
                 continue
 
             # BGP AS path entries            : 0
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 parsed_dict['bgp_as_path_entries'] = \
                     int(m.groupdict()['bgp_as_path_entries'])
                 continue
 
             # Bytes used by AS path entries  : 0
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 parsed_dict['bytes_used_as_path_entries'] = \
                     int(m.groupdict()['bytes_used_as_path_entries'])
                 continue
 
             # BGP Information for VRF VRF1
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 if 'vrf' not in parsed_dict:
                     parsed_dict['vrf'] = {}
@@ -446,118 +527,118 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
                     continue
 
             # VRF Id                         : 3
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['vrf_id'] = \
                     str(m.groupdict()['vrf_id'])
                 continue
 
             # VRF state                      : UP
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['vrf_state'] = \
                     str(m.groupdict()['vrf_state']).lower()
                 continue
 
             # VNID                           : 9105 (valid)
-            m = p16_1.match(line)
+            m = p.p16_1.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['vnid'] = m.groupdict()['vnid']
                 continue
 
             # Topo Id                        : 1005
-            m = p16_2.match(line)
+            m = p.p16_2.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['topo_id'] = \
                     m.groupdict()['topo_id']
                 continue
 
             # Encap type                     : VXLAN
-            m = p16_3.match(line)
+            m = p.p16_3.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['encap_type'] = \
                     m.groupdict()['etype']
                 continue
 
             # VTEP IP                        : 10.49.1.1
-            m = p16_4.match(line)
+            m = p.p16_4.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['vtep_ip'] = \
                     m.groupdict()['vtep_ip']
                 continue
 
             # VTEP Virtual IP                : 10.49.2.1
-            m = p16_5.match(line)
+            m = p.p16_5.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['vtep_virtual_ip'] = \
                     m.groupdict()['vtep_vip']
                 continue
 
             # VTEP VIP-R                     : 10.49.2.1
-            m = p16_6.match(line)
+            m = p.p16_6.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['vtep_vip_r'] = \
                     m.groupdict()['vipr']
                 continue
 
             # Router-MAC                     : 000c.29ff.a329
-            m = p16_7.match(line)
+            m = p.p16_7.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['router_mac'] = \
                     m.groupdict()['router_mac']
                 continue
 
             # VIP Derived MAC                : 000c.29ff.a329
-            m = p16_8.match(line)
+            m = p.p16_8.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['vip_derived_mac'] = \
                     m.groupdict()['vipd_mac']
                 continue
 
             # Router-ID                      : 10.229.11.11
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['router_id'] = \
                     str(m.groupdict()['router_id'])
                 continue
 
             # Configured Router-ID           : 0.0.0.0
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['conf_router_id'] = \
                     str(m.groupdict()['conf_router_id'])
                 continue
 
             # Confed-ID                      : 0
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['confed_id'] = \
                     int(m.groupdict()['confed_id'])
                 continue
 
             # Cluster-ID                     : 0.0.0.0
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['cluster_id'] = \
                     str(m.groupdict()['cluster_id'])
                 continue
 
             # No. of configured peers        : 1
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['num_conf_peers'] = \
                     int(m.groupdict()['num_conf_peers'])
                 continue
             
             # No. of pending config peers    : 0
-            m = p22.match(line)
+            m = p.p22.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['num_pending_conf_peers'] = \
                     int(m.groupdict()['num_pending_conf_peers'])
                 continue
             
             # No. of established peers       : 0
-            m = p23.match(line)
+            m = p.p23.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['num_established_peers'] = \
                     int(m.groupdict()['num_established_peers'])
@@ -565,7 +646,7 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
             
             # VRF RD                         : 100:100
             # VRF RD                         : 10.49.1.0:4
-            m = p24.match(line)
+            m = p.p24.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['vrf_rd'] = \
                     str(m.groupdict()['vrf_rd']).lower()
@@ -573,14 +654,14 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
 
             # VRF EVPN RD                    : 100:100
             # VRF EVPN RD                    : 10.49.1.0:4
-            m = p24_1.match(line)
+            m = p.p24_1.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['vrf_evpn_rd'] = \
                     str(m.groupdict()['vrf_evpn_rd']).lower()
                 continue
 
             #     Information for address family IPv4 Unicast in VRF VRF1
-            m = p25.match(line)
+            m = p.p25.match(line)
             if m:
                 if 'address_family' not in parsed_dict['vrf'][vrf_name]:
                     parsed_dict['vrf'][vrf_name]['address_family'] = {}
@@ -600,7 +681,7 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
 
             #     Table Id                   : 10
             #     Table Id                   : 0x80000001
-            m = p26.match(line)
+            m = p.p26.match(line)
             if m:
                 table_id = str(m.groupdict()['table_id'])
                 if '0x' in table_id:
@@ -612,7 +693,7 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
                 continue
             
             #     Table state                : UP
-            m = p27.match(line)
+            m = p.p27.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
                     ['table_state'] = str(m.groupdict()['table_state']).lower()
@@ -620,7 +701,7 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
 
             #     Peers      Active-peers    Routes     Paths      Networks   Aggregates
             #     1          0               5          5          1          2      
-            m = p28.match(line)
+            m = p.p28.match(line)
             if m:
                 if 'peers' not in parsed_dict['vrf'][vrf_name]\
                     ['address_family'][address_family]:
@@ -654,7 +735,7 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
             #         direct, route-map genie_redistribution
             #         static, route-map genie_redistribution
             #         eigrp, route-map test-map
-            m = p29.match(line)
+            m = p.p29.match(line)
             if m:
                 if 'redistribution' not in parsed_dict['vrf'][vrf_name]\
                     ['address_family'][address_family]:
@@ -680,7 +761,7 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
             # MVPN Import RT list:
             # Export RT list: 100:1
             # Import RT list: 100:1
-            m = p30.match(line)
+            m = p.p30.match(line)
             if m:
                 rt_list_type = str(m.groupdict()['type']).lower()
                 rt_list_type = rt_list_type.replace(' ', '_')
@@ -694,7 +775,7 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
 
             # 100:1
             # 400:400
-            m = p31.match(line)
+            m = p.p31.match(line)
             if m:
                 values = values + ' ' + m.groupdict()['rt_list']
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
@@ -702,35 +783,35 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
                 continue
 
             #     Label mode: per-prefix
-            m = p32.match(line)
+            m = p.p32.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
                     ['label_mode'] = str(m.groupdict()['label_mode'])
                 continue
 
             #     Is a Route-reflector
-            m = p32_1.match(line)
+            m = p.p32_1.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
                     ['route_reflector'] = True
                 continue
 
             #     Aggregate label: 492287
-            m = p33.match(line)
+            m = p.p33.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
                     ['aggregate_label'] = str(m.groupdict()['aggregate_label'])
                 continue
 
             #     Allocate-index:
-            m = p33_1.match(line)
+            m = p.p33_1.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family] \
                     ['allocate_index'] = str(m.groupdict()['allocate_index'])
                 continue
 
             # Import default limit       : 1000
-            m = p34.match(line)
+            m = p.p34.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
                     ['import_default_prefix_limit'] = \
@@ -738,42 +819,42 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
                 continue
 
             # Import default prefix count : 3
-            m = p35.match(line)
+            m = p.p35.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
                     ['import_default_prefix_count'] = \
                         int(m.groupdict()['import_default_prefix_count'])
 
             # Import default map         : PERMIT_ALL_RM
-            m = p36.match(line)
+            m = p.p36.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
                     ['import_default_map'] = \
                         str(m.groupdict()['import_default_map'])
 
             # Export default limit       : 1000
-            m = p37.match(line)
+            m = p.p37.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
                     ['export_default_prefix_limit'] = \
                         int(m.groupdict()['export_default_prefix_limit'])
 
             # Export default prefix count : 2
-            m = p38.match(line)
+            m = p.p38.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
                     ['export_default_prefix_count'] = \
                         int(m.groupdict()['export_default_prefix_count'])
 
             # Export default map         : PERMIT_ALL_RM
-            m = p39.match(line)
+            m = p.p39.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
                     ['export_default_map'] = \
                         str(m.groupdict()['export_default_map'])
 
             # Nexthop trigger-delay
-            m = p40.match(line)
+            m = p.p40.match(line)
             if m:
                 if 'next_hop_trigger_delay' not in parsed_dict['vrf'][vrf_name]\
                     ['address_family'][address_family]:
@@ -781,14 +862,14 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
                         [address_family]['next_hop_trigger_delay'] = {}
 
             # critical 3000 ms
-            m = p41.match(line)
+            m = p.p41.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family']\
                     [address_family]['next_hop_trigger_delay']['critical'] = \
                     int(m.groupdict()['critical'])
 
             # non-critical 3000 ms
-            m = p42.match(line)
+            m = p.p42.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family']\
                     [address_family]['next_hop_trigger_delay']['non_critical'] = \
@@ -806,259 +887,77 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
             out = output
 
         etree_dict = {}
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        xml_output = ET.fromstring(out)
-
-        for item in xml_output:
-            for data in item:
-                for show in data:
-                    for bgp in show:
-                        for __XML__OPT_Cmd_show_ip_bgp_session_cmd_vrf in bgp:
-                            for process in __XML__OPT_Cmd_show_ip_bgp_session_cmd_vrf:
-                                for __XML__OPT_Cmd_show_bgp_process_cmd_vrf in process:
-                                    for __XML__OPT_Cmd_show_bgp_process_cmd___readonly__ in __XML__OPT_Cmd_show_bgp_process_cmd_vrf:
-                                        for key in __XML__OPT_Cmd_show_bgp_process_cmd___readonly__:
-                                            # Get key text
-                                            text = key.tag[key.tag.find('}')+1:]
-                                            # bgp_pid
-                                            if text == 'processid':
-                                                etree_dict['bgp_pid'] = int(key.text)
-                                            # bgp_protocol_started_reason
-                                            if text == 'protocolstartedreason':
-                                                etree_dict['bgp_protocol_started_reason'] = key.text
-                                            # bgp_tag
-                                            if text == 'protocoltag':
-                                                etree_dict['bgp_tag'] = key.text
-                                            # bgp_protocol_state
-                                            if text == 'protocolstate':
-                                                etree_dict['bgp_protocol_state'] = str(key.text).lower()
-                                            # bgp_isolate_mode
-                                            if text == 'isolatemode':
-                                                etree_dict['bgp_isolate_mode'] = key.text
-                                            # bgp_mmode
-                                            if text == 'mmode':
-                                                etree_dict['bgp_mmode'] = key.text
-                                            # bgp_memory_state
-                                            if text == 'memorystate':
-                                                etree_dict['bgp_memory_state'] = str(key.text).lower()
-                                            # bgp_performance_mode
-                                            if text == 'forwardingstatesaved':
-                                                if key.text == 'false':
-                                                    etree_dict['bgp_performance_mode'] = 'No'
-                                                else:
-                                                    etree_dict['bgp_performance_mode'] = 'Yes'
-                                            # bgp_asformat
-                                            if text == 'asformat':
-                                                etree_dict['bgp_asformat'] = key.text
-                                            if text == 'srgbmin':
-                                                srgbin = key.text
-                                            if text == 'srgbmax':
-                                                srgmax = key.text
-                                                try:
-                                                    etree_dict['segment_routing_global_block'] = srgbin + '-' + srgmax
-                                                except Exception:
-                                                    pass
-                                            # num_attr_entries
-                                            if text == 'attributeentries':
-                                                etree_dict['num_attr_entries'] = int(key.text)
-                                            # hwm_attr_entries
-                                            if text == 'hwmattributeentries':
-                                                etree_dict['hwm_attr_entries'] = int(key.text)
-                                            # bytes_used
-                                            if text == 'bytesused':
-                                                etree_dict['bytes_used'] = int(key.text)
-                                            # entries_pending_delete
-                                            if text == 'entriespendingdelete':
-                                                etree_dict['entries_pending_delete'] = int(key.text)
-                                            # hwm_entries_pending_delete
-                                            if text == 'hwmentriespendingdelete':
-                                                etree_dict['hwm_entries_pending_delete'] = int(key.text)
-                                            # bgp_paths_per_hwm_attr
-                                            if text == 'pathsperattribute':
-                                                etree_dict['bgp_paths_per_hwm_attr'] = int(key.text)
-                                            # bgp_as_path_entries
-                                            if text == 'aspathentries':
-                                                etree_dict['bgp_as_path_entries'] = int(key.text)
-                                            # bytes_used_as_path_entries
-                                            if text == 'aspathbytes':
-                                                etree_dict['bytes_used_as_path_entries'] = int(key.text)
-                                            
-                                            if text == 'TABLE_vrf':
-                                                for table_vrf in key:
-                                                    for row_vrf in table_vrf:
-                                                        vrf_tag = row_vrf.tag[row_vrf.tag.find('}')+1:]
-
-                                                        # vrf
-                                                        #   vrf_name
-                                                        if vrf_tag == 'vrf-name-out':
-                                                            vrf_name = row_vrf.text
-                                                            if 'vrf' not in etree_dict:
-                                                                etree_dict['vrf'] = {}
-                                                            if vrf_name not in etree_dict['vrf']:
-                                                                etree_dict['vrf'][vrf_name] = {}
-                                                                vrf_dict = etree_dict['vrf'][vrf_name]
-                                                        # vrf_id
-                                                        if vrf_tag == 'vrf-id':
-                                                            vrf_dict['vrf_id'] = row_vrf.text
-                                                        # vrf_state
-                                                        if vrf_tag == 'vrf-state':
-                                                            vrf_dict['vrf_state'] = str(row_vrf.text).lower()
-                                                        # router_id
-                                                        if vrf_tag == 'vrf-router-id':
-                                                            vrf_dict['router_id'] = row_vrf.text
-                                                        # conf_router_id
-                                                        if vrf_tag == 'vrf-cfgd-id':
-                                                            vrf_dict['conf_router_id'] = row_vrf.text
-                                                        # confed_id
-                                                        if vrf_tag == 'vrf-confed-id':
-                                                            vrf_dict['confed_id'] = int(row_vrf.text)
-                                                        # cluster_id
-                                                        if vrf_tag == 'vrf-cluster-id':
-                                                           vrf_dict['cluster_id'] = row_vrf.text
-                                                        # num_conf_peers
-                                                        if vrf_tag == 'vrf-peers':
-                                                            vrf_dict['num_conf_peers'] = int(row_vrf.text)
-                                                        # num_pending_conf_peers
-                                                        if vrf_tag == 'vrf-pending-peers':
-                                                            vrf_dict['num_pending_conf_peers'] = int(row_vrf.text)
-                                                        # num_established_peers
-                                                        if vrf_tag == 'vrf-est-peers':
-                                                            vrf_dict['num_established_peers'] = int(row_vrf.text)
-                                                            vrf_dict['vrf_rd'] = 'not configured'
-                                                        # vrf_rd
-                                                        if vrf_tag == 'vrf-rd':
-                                                            vrf_dict['vrf_rd'] = row_vrf.text
-
-                                                        if vrf_tag == 'TABLE_af':
-                                                            for table_af in row_vrf:
-                                                                for row_af in table_af:
-                                                                    af_tag = row_af.tag[row_af.tag.find('}')+1:]
-
-                                                                    # address_family
-                                                                    #   address_family_name
-                                                                    if af_tag == 'af-name':
-                                                                        address_family_name = str(row_af.text).lower()
-                                                                        if 'address_family' not in etree_dict['vrf'][vrf_name]:
-                                                                            etree_dict['vrf'][vrf_name]['address_family'] = {}
-                                                                        if address_family_name not in etree_dict['vrf'][vrf_name]['address_family']:
-                                                                            etree_dict['vrf'][vrf_name]['address_family'][address_family_name] = {}
-                                                                            af_dict = etree_dict['vrf'][vrf_name]['address_family'][address_family_name]
-                                                                        # Initialize empty lists
-                                                                        export_rt_list = ''
-                                                                        import_rt_list = ''
-                                                                    # table_id
-                                                                    if af_tag == 'af-table-id':
-                                                                        table_id = str(row_af.text)
-                                                                        if '0x' in table_id:
-                                                                            af_dict['table_id'] = table_id
-                                                                        else:
-                                                                            af_dict['table_id'] = '0x' + table_id
-                                                                    # table_state
-                                                                    if af_tag == 'af-state':
-                                                                        af_dict['table_state'] = str(row_af.text).lower()
-                                                                    # peers
-                                                                    if af_tag == 'af-num-peers':
-                                                                        peers = int(row_af.text)
-                                                                        if 'peers' not in af_dict:
-                                                                            af_dict['peers'] = {}
-                                                                        if peers not in af_dict['peers']:
-                                                                            af_dict['peers'][peers] = {}
-                                                                    # active_peers
-                                                                    if af_tag == 'af-num-active-peers':
-                                                                        af_dict['peers'][peers]['active_peers'] = int(row_af.text)
-                                                                    # routes
-                                                                    if af_tag == 'af-peer-routes':
-                                                                        af_dict['peers'][peers]['routes'] = int(row_af.text)
-                                                                    # paths
-                                                                    if af_tag == 'af-peer-paths':
-                                                                        af_dict['peers'][peers]['paths'] = int(row_af.text)
-                                                                    # networks
-                                                                    if af_tag == 'af-peer-networks':
-                                                                        af_dict['peers'][peers]['networks'] = int(row_af.text)
-                                                                    # aggregates
-                                                                    if af_tag == 'af-peer-aggregates':
-                                                                        af_dict['peers'][peers]['aggregates'] = int(row_af.text)
-                                                                    # route_reflector
-                                                                    if af_tag == 'af-rr':
-                                                                        if row_af.text == 'true':
-                                                                            af_dict['route_reflector'] = True
-                                                                    # next_hop_trigger_delay
-                                                                    #   critical
-                                                                    if af_tag == 'nexthop-trigger-delay-critical':
-                                                                        if 'next_hop_trigger_delay' not in af_dict:
-                                                                            af_dict['next_hop_trigger_delay'] = {}
-                                                                        af_dict['next_hop_trigger_delay']['critical'] = int(row_af.text)
-                                                                    # next_hop_trigger_delay
-                                                                    #   non_critical
-                                                                    if af_tag == 'nexthop-trigger-delay-non-critical':
-                                                                        af_dict['next_hop_trigger_delay']['non_critical'] = int(row_af.text)
-                                                                    # aggregate_label
-                                                                    if af_tag == 'af-aggregate-label':
-                                                                        af_dict['aggregate_label'] = row_af.text
-                                                                    # label_mode
-                                                                    if af_tag == 'af-label-mode':
-                                                                        af_dict['label_mode'] = row_af.text
-                                                                    # import_default_map
-                                                                    if af_tag == 'importdefault_map':
-                                                                        af_dict['import_default_map'] = row_af.text
-                                                                    # import_default_prefix_limit
-                                                                    if af_tag == 'importdefault_prefixlimit':
-                                                                        af_dict['import_default_prefix_limit'] = int(row_af.text)
-                                                                    # import_default_prefix_count
-                                                                    if af_tag == 'importdefault_prefixcount':
-                                                                        af_dict['import_default_prefix_count'] = int(row_af.text)
-                                                                    # export_default_map
-                                                                    if af_tag == 'exportdefault_map':
-                                                                        af_dict['export_default_map'] = row_af.text
-                                                                    # export_default_prefix_limit
-                                                                    if af_tag == 'exportdefault_prefixlimit':
-                                                                        af_dict['export_default_prefix_limit'] = int(row_af.text)
-                                                                    # export_default_prefix_count
-                                                                    if af_tag == 'exportdefault_prefixcount':
-                                                                        af_dict['export_default_prefix_count'] = int(row_af.text)
-
-                                                                    # TABLE_redist
-                                                                    #   ROW_redist
-                                                                    if af_tag == 'TABLE_redist':
-                                                                        for table_redist in row_af:
-                                                                            for row_redist in table_redist:
-                                                                                row_redist_tag = row_redist.tag[row_redist.tag.find('}')+1:]
-                                                                                # protocol
-                                                                                if row_redist_tag == 'protocol':
-                                                                                    protocol = row_redist.text
-                                                                                    if 'redistribution' not in af_dict:
-                                                                                        af_dict['redistribution'] = {}
-                                                                                    if protocol not in af_dict['redistribution']:
-                                                                                        af_dict['redistribution'][protocol] = {}
-                                                                                # route_map
-                                                                                if row_redist_tag == 'route-map':
-                                                                                    af_dict['redistribution'][protocol]['route_map'] = row_redist.text
-
-                                                                    # TABLE_evpn_export_rt
-                                                                    #   ROW_evpn_export_rt
-                                                                    if af_tag == 'TABLE_evpn_export_rt':
-                                                                        for table_evpn_export in row_af:
-                                                                            for row_export in table_evpn_export:
-                                                                                row_export_tag = row_export.tag[row_export.tag.find('}')+1:]
-                                                                                # export_rt_list
-                                                                                if row_export_tag == 'evpn-export-rt':
-                                                                                    export_rt_list = str(export_rt_list + ' ' + row_export.text).strip()
-                                                                                    af_dict['export_rt_list'] = export_rt_list
-                                                                    # TABLE_evpn_import_rt
-                                                                    #   ROW_evpn_import_rt
-                                                                    if af_tag == 'TABLE_evpn_import_rt':
-                                                                        for table_evpn_import in row_af:
-                                                                            for row_import in table_evpn_import:
-                                                                                row_import_tag = row_import.tag[row_import.tag.find('}')+1:]
-                                                                                # export_rt_list
-                                                                                if row_import_tag == 'evpn-import-rt':
-                                                                                    import_rt_list = str(import_rt_list + ' ' + row_import.text).strip()
-                                                                                    af_dict['import_rt_list'] = import_rt_list
-
-                                                                    # parsed all tags
-                                                                    continue
-                                                                                    
+
+        def get_af_dict(vrf_record, af_record):
+            return etree_dict.setdefault('vrf', {})\
+                             .setdefault(vrf_record['vrf'], {})\
+                             .setdefault('address_family', {})\
+                             .setdefault(af_record['address_family'], {})
+
+        for name, record, parents in iter_xml_rows(out, self.xml_rows):
+            # bgp_pid
+            if name == 'process':
+                srgb_min = record.pop('srgb_min', None)
+                srgb_max = record.pop('srgb_max', None)
+                if srgb_min is not None and srgb_max is not None:
+                    etree_dict['segment_routing_global_block'] = \
+                        srgb_min + '-' + srgb_max
+                etree_dict.update(record)
+
+            # vrf
+            #   vrf_name
+            elif name == 'vrf':
+                vrf_dict = etree_dict.setdefault('vrf', {})\
+                                     .setdefault(record.pop('vrf'), {})
+                if 'num_established_peers' in record:
+                    record.setdefault('vrf_rd', 'not configured')
+                vrf_dict.update(record)
+
+            # address_family
+            #   address_family_name
+            elif name == 'address_family':
+                af_dict = get_af_dict(parents[-1], record)
+                del record['address_family']
+
+                # peers
+                if 'peers' in record:
+                    peers_dict = af_dict.setdefault('peers', {})\
+                                        .setdefault(record.pop('peers'), {})
+                    for key in ('active_peers', 'routes', 'paths',
+                                'networks', 'aggregates'):
+                        if key in record:
+                            peers_dict[key] = record.pop(key)
+
+                # route_reflector
+                if record.pop('route_reflector', None) == 'true':
+                    af_dict['route_reflector'] = True
+
+                # next_hop_trigger_delay
+                for key in ('critical', 'non_critical'):
+                    if key in record:
+                        af_dict.setdefault('next_hop_trigger_delay', {})\
+                            [key] = record.pop(key)
+
+                af_dict.update(record)
+
+            # TABLE_redist
+            #   ROW_redist
+            elif name == 'redistribution':
+                af_dict = get_af_dict(*parents[1:])
+                redist_dict = af_dict.setdefault('redistribution', {})\
+                                     .setdefault(record['protocol'], {})
+                if 'route_map' in record:
+                    redist_dict['route_map'] = record['route_map']
+
+            # TABLE_evpn_export_rt
+            #   ROW_evpn_export_rt
+            # TABLE_evpn_import_rt
+            #   ROW_evpn_import_rt
+            elif record.get('rt') is not None:
+                af_dict = get_af_dict(*parents[1:])
+                af_dict[name] = \
+                    (af_dict.get(name, '') + ' ' + record['rt']).strip()
+
         return etree_dict
 
     def yang(self, vrf=''):
@@ -1140,6 +1039,30 @@ class ShowBgpPeerSession(ShowBgpPeerSessionSchema):
     """
     cli_command = 'show running-config | inc peer-session'
 
+    patterns = Patterns(
+        p1=r'^\s*template +peer-session '
+           '+(?P<session_name>[a-zA-Z\-\_0-9]+)$',
+        r1=r'^\s*Shutdown$',
+        r2=r'^\s*Update +Source +-'
+           ' +(?P<update_source>[a-zA-Z0-9\:\s]+)$',
+        r3=r'^\s*Description +- +description *:'
+           ' +(?P<desc>[a-zA-Z\-]+)$',
+        r4=r'^\s*Password$',
+        r5=r'^\s*EBGP +Multihop +- +hop +limit *:'
+           ' +(?P<ebgp_multihop_limit>[0-9]+)$',
+        r6=r'^\s*Disable +Connectivity +Check$',
+        r7=r'^\s*Suppress +Capabilities$',
+        r8=r'^\s*Passive Only$',
+        r9=r'^\s*Timers +- +hold +time *:'
+           ' +(?P<holdtime>[0-9]+), keepalive *:'
+           ' +(?P<keepalive>[0-9]+)$',
+        r10=r'^\s*Remote AS$',
+        r11=r'^\s*Local AS$',
+        r12=r'^\s*Enable Bfd$',
+        r13=r'^\s*VRF +default *:'
+            ' +(?P<vrf_default>[0-9\.]+)$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -1150,34 +1073,14 @@ class ShowBgpPeerSession(ShowBgpPeerSessionSchema):
         peer_sessions = []
         parsed_dict = {}
 
-        p1 = re.compile(r'^\s*template +peer-session '
-                    '+(?P<session_name>[a-zA-Z\-\_0-9]+)$')
-        r1 = re.compile(r'^\s*Shutdown$')
-        r2 = re.compile(r'^\s*Update +Source +-'
-                    ' +(?P<update_source>[a-zA-Z0-9\:\s]+)$')
-        r3 = re.compile(r'^\s*Description +- +description *:'
-                    ' +(?P<desc>[a-zA-Z\-]+)$')
-        r4 = re.compile(r'^\s*Password$')
-        r5 = re.compile(r'^\s*EBGP +Multihop +- +hop +limit *:'
-                    ' +(?P<ebgp_multihop_limit>[0-9]+)$')
-        r6 = re.compile(r'^\s*Disable +Connectivity +Check$')
-        r7 = re.compile(r'^\s*Suppress +Capabilities$')
-        r8 = re.compile(r'^\s*Passive Only$')
-        r9 = re.compile(r'^\s*Timers +- +hold +time *:'
-                    ' +(?P<holdtime>[0-9]+), keepalive *:'
-                    ' +(?P<keepalive>[0-9]+)$')
-        r10 = re.compile(r'^\s*Remote AS$')
-        r11 = re.compile(r'^\s*Local AS$')
-        r12 = re.compile(r'^\s*Enable Bfd$')
-        r13 = re.compile(r'^\s*VRF +default *:'
-                    ' +(?P<vrf_default>[0-9\.]+)$')
+        p = ShowBgpPeerSession.patterns
 
         for line in out.splitlines():
             line = line.rstrip()
 
             # template peer-session PEER-SESSION
             # template peer-session PS-1
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 # Create top level key
                 if 'peer_session' not in parsed_dict:
@@ -1204,33 +1107,33 @@ class ShowBgpPeerSession(ShowBgpPeerSessionSchema):
 
                     # Commands configured in this template:
                     # Shutdown
-                    m = r1.match(line)
+                    m = p.r1.match(line)
                     if m:
                         sub_dict['shutdown'] = True
                         continue
                   
                     # Update Source - interface: loopback0
-                    m = r2.match(line)
+                    m = p.r2.match(line)
                     if m:
                         sub_dict['update_source'] = \
                             str(m.groupdict()['update_source']).lower()
                         continue
                   
                     # Description - description: PEER-SESSION
-                    m = r3.match(line)
+                    m = p.r3.match(line)
                     if m:
                         sub_dict['description'] = \
                             str(m.groupdict()['desc'])
                         continue
                   
                     # Password
-                    m = r4.match(line)
+                    m = p.r4.match(line)
                     if m:
                         sub_dict['password'] = True
                         continue
                   
                     # EBGP Multihop - hop limit: 255
-                    m = r5.match(line)
+                    m = p.r5.match(line)
                     if m:
                         sub_dict['ebgp_multihop_enable'] = True
                         sub_dict['ebgp_multihop_limit'] = \
@@ -1238,44 +1141,44 @@ class ShowBgpPeerSession(ShowBgpPeerSessionSchema):
                         continue
                   
                     # Disable Connectivity Check
-                    m = r6.match(line)
+                    m = p.r6.match(line)
                     if m:
                         sub_dict['disable_connectivity_check'] = True
                         continue
                     
                     # Suppress Capabilities
-                    m = r7.match(line)
+                    m = p.r7.match(line)
                     if m:
                         sub_dict['suppress_capabilities'] = True
                         continue
                   
                     # Passive Only
-                    m = r8.match(line)
+                    m = p.r8.match(line)
                     if m:
                         sub_dict['transport_connection_mode'] = 'Passive'
                         continue
                   
                     # Timers - hold time: 111, keepalive: 222
-                    m = r9.match(line)
+                    m = p.r9.match(line)
                     if m:
                         sub_dict['holdtime'] = int(m.groupdict()['holdtime'])
                         sub_dict['keepalive'] = int(m.groupdict()['keepalive'])
                         continue
                     
                     # Remote AS
-                    m = r10.match(line)
+                    m = p.r10.match(line)
                     if m:
                         sub_dict['remote_as'] = True
                         continue
                   
                     # Local AS
-                    m = r11.match(line)
+                    m = p.r11.match(line)
                     if m:
                         sub_dict['local_as'] = True
                         continue
                   
                     # Enable Bfd
-                    m = r12.match(line)
+                    m = p.r12.match(line)
                     if m:
                         sub_dict['bfd'] = True
                         continue
@@ -1283,7 +1186,7 @@ class ShowBgpPeerSession(ShowBgpPeerSessionSchema):
                     # Inherited commands:
                     # Inherited by the following peers:
                     # VRF default: 10.16.2.5
-                    m = r13.match(line)
+                    m = p.r13.match(line)
                     if m:
                         sub_dict['inherited_vrf_default'] = \
                             str(m.groupdict()['vrf_default'])
@@ -1331,6 +1234,29 @@ class ShowBgpPeerPolicy(ShowBgpPeerPolicySchema):
     """
     cli_command = 'show running-config | inc peer-policy'
 
+    patterns = Patterns(
+        p1=r'^\s*template +peer-policy'
+           ' +(?P<policy_name>[a-zA-Z0-9\-\_]+)$',
+        r1=r'^\s*Send +Community$',
+        r2=r'^\s*Send +Ext-community$',
+        r3=r'^\s*Route +Reflector +Client$',
+        r4=r'^\s*Route-map +Inbound +- +policy-name *:'
+           ' +(?P<inbound_name>[a-zA-Z\-]+)$',
+        r5=r'^\s*Route-map +Outbound +- +policy-name *:'
+           ' +(?P<outbound_name>[a-zA-Z\-]+)$',
+        r6=r'^\s*Maximum +Prefixes +- +prefix +limit *:'
+           ' +(?P<max_prefix_no>[0-9]+)$',
+        r7=r'^\s*Default +Originate(?: +- +route-map *:'
+           ' +(?P<route_map>[a-zA-Z]+))?$',
+        r8=r'^\s*Soft-Reconfig$',
+        r9=r'^\s*Site-of-origin$',
+        r10=r'^\s*Allowas-in$',
+        r11=r'^\s*AS-override$',
+        r12=r'^\s*VRF +default *:'
+            ' +(?P<vrf_default>[0-9\.]+)$',
+        r13=r'^\s*Nexthop +Self$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -1341,32 +1267,13 @@ class ShowBgpPeerPolicy(ShowBgpPeerPolicySchema):
         policy_names = []
         parsed_dict = {}
 
-        p1 = re.compile(r'^\s*template +peer-policy'
-                    ' +(?P<policy_name>[a-zA-Z0-9\-\_]+)$')
-        r1 = re.compile(r'^\s*Send +Community$')
-        r2 = re.compile(r'^\s*Send +Ext-community$')
-        r3 = re.compile(r'^\s*Route +Reflector +Client$')
-        r4 = re.compile(r'^\s*Route-map +Inbound +- +policy-name *:'
-                            ' +(?P<inbound_name>[a-zA-Z\-]+)$')
-        r5 = re.compile(r'^\s*Route-map +Outbound +- +policy-name *:'
-                            ' +(?P<outbound_name>[a-zA-Z\-]+)$')
-        r6 = re.compile(r'^\s*Maximum +Prefixes +- +prefix +limit *:'
-                            ' +(?P<max_prefix_no>[0-9]+)$')
-        r7 = re.compile(r'^\s*Default +Originate(?: +- +route-map *:'
-                            ' +(?P<route_map>[a-zA-Z]+))?$')
-        r8 = re.compile(r'^\s*Soft-Reconfig$')
-        r9 = re.compile(r'^\s*Site-of-origin$')
-        r10 = re.compile(r'^\s*Allowas-in$')
-        r11 = re.compile(r'^\s*AS-override$')
-        r12 = re.compile(r'^\s*VRF +default *:'
-                            ' +(?P<vrf_default>[0-9\.]+)$')
-        r13 = re.compile(r'^\s*Nexthop +Self$')
+        p = ShowBgpPeerPolicy.patterns
 
         for line in out.splitlines():
             line = line.rstrip()
 
             # template peer-policy PEER-POLICY
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 # Get session name and save it for later
                 policy_names.append(str(m.groupdict()['policy_name']))
@@ -1396,45 +1303,45 @@ class ShowBgpPeerPolicy(ShowBgpPeerPolicySchema):
 
                     # Commands configured in this template:
                     # Send Community
-                    m = r1.match(line)
+                    m = p.r1.match(line)
                     if m:
                         sub_dict['send_community'] = True
                         continue
                   
                     # Send Ext-community
-                    m = r2.match(line)
+                    m = p.r2.match(line)
                     if m:
                         sub_dict['send_ext_community'] = True
                         continue
                   
                     # Route Reflector Client
-                    m = r3.match(line)
+                    m = p.r3.match(line)
                     if m:
                         sub_dict['route_reflector_client'] = True
                         continue
                   
                     # Route-map Inbound - policy-name: test-map
-                    m = r4.match(line)
+                    m = p.r4.match(line)
                     if m:
                         sub_dict['route_map_name_in'] = \
                             str(m.groupdict()['inbound_name'])
                         continue
                   
                     # Route-map Outbound - policy-name: test-map
-                    m = r5.match(line)
+                    m = p.r5.match(line)
                     if m:
                         sub_dict['route_map_name_out'] = \
                             str(m.groupdict()['outbound_name'])
                   
                     # Maximum Prefixes - prefix limit: 300
-                    m = r6.match(line)
+                    m = p.r6.match(line)
                     if m:
                         sub_dict['maximum_prefix_max_prefix_no'] = \
                             int(m.groupdict()['max_prefix_no'])
                         continue
                     
                     # Default Originate - route-map: test
-                    m = r7.match(line)
+                    m = p.r7.match(line)
                     if m:
                         sub_dict['default_originate'] =  True
                         sub_dict['default_originate_route_map'] = \
@@ -1442,25 +1349,25 @@ class ShowBgpPeerPolicy(ShowBgpPeerPolicySchema):
                         continue
                   
                     # Soft-Reconfig
-                    m = r8.match(line)
+                    m = p.r8.match(line)
                     if m:
                         sub_dict['soft_reconfiguration'] = True
                         continue
                   
                     # Site-of-origin
-                    m = r9.match(line)
+                    m = p.r9.match(line)
                     if m:
                         sub_dict['site_of_origin'] = True
                         continue
                     
                     # Allowas-in
-                    m = r10.match(line)
+                    m = p.r10.match(line)
                     if m:
                         sub_dict['allowas_in'] = True
                         continue
                   
                     # AS-override
-                    m = r11.match(line)
+                    m = p.r11.match(line)
                     if m:
                         sub_dict['as_override'] = True
                         continue
@@ -1468,14 +1375,14 @@ class ShowBgpPeerPolicy(ShowBgpPeerPolicySchema):
                     # Inherited commands:
                     # Inherited by the following peers:
                     # VRF default: 10.16.2.5
-                    m = r12.match(line)
+                    m = p.r12.match(line)
                     if m:
                         sub_dict['inherited_vrf_default'] = \
                             str(m.groupdict()['vrf_default'])
                         continue
 
                     # Nexthop Self
-                    m = r13.match(line)
+                    m = p.r13.match(line)
                     if m:
                         sub_dict['next_hop_self'] = True
                         continue
@@ -1521,38 +1428,42 @@ class ShowBgpPeerTemplate(ShowBgpPeerTemplateSchema):
     '''
     cli_command = 'show running-config | inc peer'
 
+    patterns = Patterns(
+        p0=r'^\s*template +peer'
+           ' +(?P<peer_template>[a-zA-Z0-9\-\_]+)$',
+        p1=r'^\s*Remote +AS +(?P<remote_as>[0-9]+)$',
+        p2=r'^\s*Inherits +session +configuration'
+           ' +from session-template'
+           ' +(?P<inherit_template>(\S+))$',
+        p3=r'^\s*Description *: +(?P<desc>(\S+))$',
+        p4=r'^\s*Using +(?P<update_source>(\S+)) +as'
+           ' +update +source +for +this +peer$',
+        p5=r'^\s*Connected check is disabled$',
+        p6=r'^\s*BFD live-detection +is +configured$',
+        p7=r'^\s*External +BGP +peer +might +be +upto'
+           ' +(?P<num_hops_bgp_peer>[0-9]+) +hops'
+           ' +away$',
+        p8=r'^\s*TCP +MD5 +authentication +is'
+           ' +(?P<tcp_md5_auth>(\S+))$',
+        p9=r'^\s*Only +passive +connection +setup'
+           ' +allowed$',
+        p10=r'^\s*Neighbor +local-as +command'
+            ' +(?P<nbr_local_as_cmd>(\S+))$',
+        p11=r'^\s*Private +AS +numbers +removed +from'
+            ' +updates +sent +to +this +neighbor$',
+        p12=r'^\s*Hold +time += +(?P<holdtime>[0-9]+),'
+            ' +keepalive +interval +is'
+            ' +(?P<keepalive_interval>[0-9]+)'
+            ' +seconds$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
         else:
             out = output
 
-        p0 = re.compile(r'^\s*template +peer'
-                        ' +(?P<peer_template>[a-zA-Z0-9\-\_]+)$')
-        p1 = re.compile(r'^\s*Remote +AS +(?P<remote_as>[0-9]+)$')
-        p2 = re.compile(r'^\s*Inherits +session +configuration'
-                            ' +from session-template'
-                            ' +(?P<inherit_template>(\S+))$')
-        p3 = re.compile(r'^\s*Description *: +(?P<desc>(\S+))$')
-        p4 = re.compile(r'^\s*Using +(?P<update_source>(\S+)) +as'
-                            ' +update +source +for +this +peer$')
-        p5 = re.compile(r'^\s*Connected check is disabled$')
-        p6 = re.compile(r'^\s*BFD live-detection +is +configured$')
-        p7 = re.compile(r'^\s*External +BGP +peer +might +be +upto'
-                            ' +(?P<num_hops_bgp_peer>[0-9]+) +hops'
-                            ' +away$')
-        p8 = re.compile(r'^\s*TCP +MD5 +authentication +is'
-                            ' +(?P<tcp_md5_auth>(\S+))$')
-        p9 = re.compile(r'^\s*Only +passive +connection +setup'
-                            ' +allowed$')
-        p10 = re.compile(r'^\s*Neighbor +local-as +command'
-                            ' +(?P<nbr_local_as_cmd>(\S+))$')
-        p11 = re.compile(r'^\s*Private +AS +numbers +removed +from'
-                            ' +updates +sent +to +this +neighbor$')
-        p12 = re.compile(r'^\s*Hold +time += +(?P<holdtime>[0-9]+),'
-                            ' +keepalive +interval +is'
-                            ' +(?P<keepalive_interval>[0-9]+)'
-                            ' +seconds$')
+        p = ShowBgpPeerTemplate.patterns
                                     
         # Init vars
         peer_templates = []
@@ -1562,7 +1473,7 @@ class ShowBgpPeerTemplate(ShowBgpPeerTemplateSchema):
             line = line.rstrip()
 
             # template peer PEER
-            m = p0.match(line)
+            m = p.p0.match(line)
             if m:
                 # Get session name and save it for later
                 peer_templates.append(str(m.groupdict()['peer_template']))
@@ -1591,78 +1502,78 @@ class ShowBgpPeerTemplate(ShowBgpPeerTemplateSchema):
 
                     # BGP peer-template is PEER
                     # Remote AS 500
-                    m = p1.match(line)
+                    m = p.p1.match(line)
                     if m:
                         sub_dict['remote_as'] = int(m.groupdict()['remote_as'])
                         continue
 
                     # Inherits session configuration from session-template PEER-SESSION
-                    m = p2.match(line)
+                    m = p.p2.match(line)
                     if m:
                         sub_dict['inherit_template'] = \
                             str(m.groupdict()['inherit_template'])
                         continue
 
                     # Description: DESC
-                    m = p3.match(line)
+                    m = p.p3.match(line)
                     if m:
                         sub_dict['description'] = str(m.groupdict()['desc'])
                         continue
 
                     # Using loopback1 as update source for this peer
-                    m = p4.match(line)
+                    m = p.p4.match(line)
                     if m:
                         sub_dict['update_source'] = \
                             str(m.groupdict()['update_source'])
                         continue
 
                     # Connected check is disabled
-                    m = p5.match(line)
+                    m = p.p5.match(line)
                     if m:
                         sub_dict['disable_connected_check'] = True
                         continue
 
                     # BFD live-detection is configured
-                    m = p6.match(line)
+                    m = p.p6.match(line)
                     if m:
                         sub_dict['bfd_live_detection'] = True
                         continue
 
                     # External BGP peer might be upto 255 hops away
-                    m = p7.match(line)
+                    m = p.p7.match(line)
                     if m:
                         sub_dict['num_hops_bgp_peer'] = \
                             int(m.groupdict()['num_hops_bgp_peer'])
                         continue
 
                     # TCP MD5 authentication is enabled
-                    m = p8.match(line)
+                    m = p.p8.match(line)
                     if m:
                         sub_dict['tcp_md5_auth'] = \
                             str(m.groupdict()['tcp_md5_auth'])
                         continue
 
                     # Only passive connection setup allowed
-                    m = p9.match(line)
+                    m = p.p9.match(line)
                     if m:
                         sub_dict['nbr_transport_connection_mode'] = 'Passive'
                         continue
 
                     # Neighbor local-as command not active
-                    m = p10.match(line)
+                    m = p.p10.match(line)
                     if m:
                         sub_dict['nbr_local_as_cmd'] = \
                             str(m.groupdict()['nbr_local_as_cmd'])
                         continue
 
                     # Private AS numbers removed from updates sent to this neighbor
-                    m = p11.match(line)
+                    m = p.p11.match(line)
                     if m:
                         sub_dict['private_as_updates'] = False
                         continue
 
                     # Hold time = 26, keepalive interval is 13 seconds
-                    m = p12.match(line)
+                    m = p.p12.match(line)
                     if m:
                         sub_dict['holdtime'] = \
                             int(m.groupdict()['holdtime'])
@@ -1722,7 +1633,7 @@ class ShowBgpVrfAllAllSchema(MetaParser):
 # =================================
 # Parser for 'show bgp vrf all all'
 # =================================
-class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
+class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema, CompactParser):
     """Parser for show bgp vrf <vrf>> <address_family>"""
 
     cli_command = 'show bgp vrf {vrf} {address_family}'
@@ -1733,6 +1644,56 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
       'path_type',
       'weight']
 
+    # Low cardinality values, see intern_parsed()
+    intern_fields = ['vrf', 'address_family', 'route_distinguisher',
+                     'default_vrf', 'next_hop', 'status_codes', 'path_type',
+                     'path', 'origin_codes']
+
+    patterns = Patterns(
+        p=r'^\s*Network +Next Hop +Metric +LocPrf +Weight Path$',
+        p1=r'^\s*BGP +routing +table +information +for +VRF'
+           ' +(?P<vrf_name>\S+), +address +family'
+           ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$',
+        p2=r'^\s*BGP +table +version +is'
+           ' +(?P<bgp_table_version>[0-9]+), +(L|l)ocal'
+           ' +(R|r)outer +ID +is +(?P<local_router_id>[0-9\.]+)$',
+        p3_4=r'^\s*(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+)$',
+        p3_1=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+             '(?P<path_type>(i|e|c|l|a|r|I))?'
+             '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+             '(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$',
+        p3_1_2=r'^(?P<status_codes>(s|x|S|d|h|\*|\>)+)(?P<path_type>'
+               '(i|e|c|l|a|r|I))(?P<prefix>[\w\.\/]+) +(?P<next_hop>[\w\.\/]+) +'
+               '(?P<metric>\d+) +(?P<localprf>\d+) +(?P<weight>\d+) +(?P<path>[\d ]+) +'
+               '(?P<origin_codes>(i|e|\?|\||&))$',
+        p3_3=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+             '(?P<path_type>(i|e|c|l|a|r|I))?'
+             ' *(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+             '(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
+             ' +(?P<origin_codes>(i|e|\?|\|))$',
+        p3_3_1=r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+               '(?P<path_type>(i|e|c|l|a|r|I))?'
+               '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+               ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+               ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$',
+        p4=r'^\s*Route +Distinguisher *:'
+           ' +(?P<route_distinguisher>(\S+))'
+           '(?: +\(((VRF +(?P<default_vrf>\S+))|'
+           '((?P<default_vrf1>\S+)VNI +(?P<vni>\d+)))\))?$',
+        p3_2=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
+             '(?P<path_type>(i|e|c|l|a|r|I))'
+             '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+             ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+             ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
+             ' +(?P<origin_codes>(i|e|\?|\&|\|))$',
+        p3_2_1=r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+               '(?P<path_type>(i|e|c|l|a|r|I))?'
+               '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+               '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+               ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+               ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$',
+    )
+
     def cli(self, vrf='all', address_family='all', output=None):
         if output is None:
             out = self.device.execute(self.cli_command.format(vrf=vrf,
@@ -1750,58 +1711,17 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
         data_on_nextline = False
         bgp_table_version = local_router_id = ''
 
-        p = re.compile(r'^\s*Network +Next Hop +Metric +LocPrf +Weight Path$')
-        p1 = re.compile(r'^\s*BGP +routing +table +information +for +VRF'
-                            ' +(?P<vrf_name>\S+), +address +family'
-                            ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                            ' +(?P<bgp_table_version>[0-9]+), +(L|l)ocal'
-                            ' +(R|r)outer +ID +is +(?P<local_router_id>[0-9\.]+)$')
-        p3_4 = re.compile(r'^\s*(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+)$')
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            '(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
-        p3_1_2 = re.compile(r'^(?P<status_codes>(s|x|S|d|h|\*|\>)+)(?P<path_type>'
-            '(i|e|c|l|a|r|I))(?P<prefix>[\w\.\/]+) +(?P<next_hop>[\w\.\/]+) +'
-            '(?P<metric>\d+) +(?P<localprf>\d+) +(?P<weight>\d+) +(?P<path>[\d ]+) +'
-            '(?P<origin_codes>(i|e|\?|\||&))$')
-        p3_3 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            ' *(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            '(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
-                            ' +(?P<origin_codes>(i|e|\?|\|))$')
-        p3_3_1 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                                '(?P<path_type>(i|e|c|l|a|r|I))?'
-                                '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                                ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                                ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
-        p4 = re.compile(r'^\s*Route +Distinguisher *:'
-                            ' +(?P<route_distinguisher>(\S+))'
-                            '(?: +\(((VRF +(?P<default_vrf>\S+))|'
-                            '((?P<default_vrf1>\S+)VNI +(?P<vni>\d+)))\))?$')
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
-                            '(?P<path_type>(i|e|c|l|a|r|I))'
-                            '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
-                            ' +(?P<origin_codes>(i|e|\?|\&|\|))$')
-        p3_2_1 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                                '(?P<path_type>(i|e|c|l|a|r|I))?'
-                                '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                                '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                                ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                                ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
+        regex = ShowBgpVrfAllAll.patterns
 
-        for line in out.splitlines():
+        for line in iter_lines(out):
             line = line.rstrip()
             # Network            Next Hop            Metric     LocPrf     Weight Path
-            m = p.match(line)
+            m = regex.p.match(line)
             if m:
                 continue
 
             # BGP routing table information for VRF VRF1, address family IPv4 Unicast
-            m = p1.match(line)
+            m = regex.p1.match(line)
             if m:
                 # Get values
                 vrf_name = str(m.groupdict()['vrf_name'])
@@ -1823,7 +1743,7 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
 
             # BGP table version is 35, local router ID is 10.229.11.11
             # BGP table version is 381, Local Router ID is 10.4.1.2
-            m = p2.match(line)
+            m = regex.p2.match(line)
             if m:
                 bgp_table_version = int(m.groupdict()['bgp_table_version'])
                 local_router_id = str(m.groupdict()['local_router_id'])
@@ -1832,7 +1752,7 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
                 continue
 
             #                     2001:db8:400:13b1:21a:1ff:fe00:161/128
-            m = p3_4.match(line)
+            m = regex.p3_4.match(line)
             if m:
                 # Get keys
                 if 'njected' not in line and 'next_hop' in m.groupdict():
@@ -1858,10 +1778,10 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
             
             # *>i[2]:[77][7,0][10.69.9.9,1,151587081][10.135.1.1,22][10.106.101.1,10.76.1.30]/616
             # *>i2001:db8:aaaa:1::/113       ::ffff:10.106.101.1
-            m = p3_1.match(line)
+            m = regex.p3_1.match(line)
             # *>i10.111.8.3/32     10.84.66.66           2000        100          0 200 i
             # *>i10.111.8.4/32     10.84.66.66           2000        100          0 200 i
-            m1 = p3_1_2.match(line)
+            m1 = regex.p3_1_2.match(line)
 
             m = m if m else m1
             if m:
@@ -1921,11 +1841,11 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
             #                     0.0.0.0               100      32768 i
             #                     10.106.101.1            4444       100 0 3 10 20 30 40 50 60 70 80 90 i
             # *>i                 10.106.102.4                        100          0 {62112 33492 4872 41787 13166 50081 21461 58376 29755 1135} i
-            m = p3_3.match(line)
+            m = regex.p3_3.match(line)
 
             # * e                   10.70.2.2                                      0 100 300 ?
             # *>e                   10.70.1.2                                      0 100 300 ?
-            m1 = p3_3_1.match(line)
+            m1 = regex.p3_3_1.match(line)
             m = m if m else m1
             if m:
                 # Get keys
@@ -2016,7 +1936,7 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
             # Route Distinguisher: 100:100     (VRF VRF1)
             # Route Distinguisher: 2:100    (VRF vpn2)
             # Route Distinguisher: 10.49.1.0:3    (L3VNI 9100)
-            m = p4.match(line)
+            m = regex.p4.match(line)
             if m:
                 route_distinguisher = str(m.groupdict()['route_distinguisher'])
                 new_address_family = original_address_family + ' RD ' + route_distinguisher
@@ -2059,10 +1979,10 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
             # *>r10.16.2.0/24        0.0.0.0                4444        100      32768 ?
             # *>i10.49.0.0/16     10.106.101.1                            100          0 10 20 30 40 50 60 70 80 90 i
             # *>i10.4.2.0/24     10.106.102.4                            100          0 {62112 33492 4872 41787 13166 50081 21461 58376 29755 1135} i
-            m = p3_2.match(line)
+            m = regex.p3_2.match(line)
 
             # *&i10.145.1.0/24        192.168.151.2                0        100          0 ?
-            m1 = p3_2_1.match(line)
+            m1 = regex.p3_2_1.match(line)
             m = m if m else m1
             if m:
                 # New prefix, reset index count
@@ -2178,7 +2098,7 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
                             del(af_dict['prefixes'][prefixes]['index'])
                             af_dict['prefixes'][prefixes]['index'] = nexthop_dict
 
-        return parsed_dict
+        return intern_parsed(self, parsed_dict)
 
 
 # ==============================================
@@ -2365,6 +2285,133 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
       'tbl_ver',
       'msg_rcvd']
 
+    patterns = Patterns(
+        p1=r'^\s*BGP +neighbor +is +(?P<neighbor_id>[a-zA-Z0-9\.\:]+),'
+           ' +remote +AS +(?P<remote_as>[0-9]+),'
+           '(?: +local +AS +(?P<local_as>[0-9]+),)?'
+           ' +(?P<link>[a-zA-Z]+) +link,'
+           '( +(?P<peer_fab_type>[fabric\-\S]+),)?'
+           ' +Peer +index +(?P<peer_index>[0-9]+)$',
+        p2=r'^\s*Description *: +(?P<description>(\S+))$',
+        p3=r'^\s*BGP +version +(?P<bgp_version>[0-9]+),'
+           ' +remote +router +ID +(?P<router_id>[0-9\.]+)$',
+        p4=r'^\s*\s*BGP +state += +(?P<session_state>(\S+))'
+           '(?: +\((?P<reason>([a-zA-Z\s]+))\))?,'
+           ' +(up|down) +for +(?P<up_time>[a-zA-Z0-9\:\.]+)'
+           '(?: *, +retry +in +(?P<retry_time>[0-9\.\:]+))?$',
+        p5=r'^\s*Using +(?P<update_source>[a-zA-Z0-9]+)'
+           ' +as +update +source +for +this +peer$',
+        p6=r'^\s*BFD live-detection is configured'
+           '(?: +and +(?P<bfd_enabled>(\S+)), +state +is'
+           ' +(?P<bfd_state>(\S+)))?$',
+        p7=r'^\s*Neighbor +local-as +command'
+           ' +(?P<nbr_local_as_cmd>[a-zA-Z\s]+)$',
+        p8=r'^\s*Last +read +(?P<last_read>[a-zA-Z0-9\:]+),'
+           ' +hold +time += +(?P<holdtime>[0-9]+), +keepalive'
+           ' +interval +is +(?P<keepalive_interval>[0-9]+)'
+           ' +seconds$',
+        p9=r'^\s*Last +written'
+           ' +(?P<last_written>[a-zA-Z0-9\:]+), +keepalive'
+           ' +timer +(?P<keepalive_timer>[a-zA-Z0-9\:\s]+)$',
+        p10=r'^\s*Inherits +session +configuration +from'
+            ' +session-template +(?P<template>[a-zA-Z\-\_]+)$',
+        p11=r'^\s*Connected check is disabled$',
+        p11_2=r'^\s*Private +AS +numbers +removed +from +updates +sent +to +this +neighbor$',
+        p12_1=r'^\s*External +BGP +peer +might +be +upto'
+              ' +(?P<ebgp_multihop_max_hop>[0-9]+) +hops +away$',
+        p12_2=r'^\s*External +BGP +peer +might +be +up to'
+              ' +(?P<ebgp_multihop_max_hop>[0-9]+) +hops +away$',
+        p13=r'^\s*TCP +MD5 +authentication +is'
+            ' +(?P<tcp_md5_auth>[a-zA-Z\(\)\s]+)$',
+        p14=r'^\s*Only +passive +connection +setup +allowed$',
+        p15=r'^\s*Received +(?P<received_messages>[0-9]+)'
+            ' +messages, +(?P<received_notifications>[0-9]+)'
+            ' +notifications, +(?P<received_bytes>[0-9]+)'
+            ' +bytes +in +queue$',
+        p16=r'^\s*Sent +(?P<sent_messages>[0-9]+)'
+            ' +messages, +(?P<sent_notifications>[0-9]+)'
+            ' +notifications, +(?P<sent_bytes_queue>[0-9]+)'
+            ' +bytes +in +queue$',
+        p17=r'^\s*Connections +established'
+            ' +(?P<esablished>[0-9]+), +dropped'
+            ' +(?P<dropped>[0-9]+)$',
+        p17_1=r'^\s*Connections +attempts'
+              ' +(?P<attemps>[0-9]+)$',
+        p18=r'^\s*Last +reset +by (?P<reset_by>[a-zA-Z]+)'
+            ' +(?P<last_reset>[a-zA-Z0-9\:\s]+), +due +to'
+            ' +(?P<reset_reason>[a-zA-Z\-\s]+)$',
+        p19=r'^\s*Neighbor +capabilities *:$',
+        p20_1=r'^\s*Dynamic +capability *:'
+              ' +(?P<dynamic_capability>[a-zA-Z\,\(\)\s]+)$',
+        p20_2=r'^\s*Dynamic +capability +\(old\) *:'
+              ' +(?P<dynamic_capability_old>[a-zA-Z\s]+)$',
+        p21=r'^\s*Route +refresh +capability +\(new\) *:'
+            ' +(?P<route_refresh>[a-zA-Z\s]+)$',
+        p21_1=r'^\s*Route +refresh +capability +\(old\) *:'
+              ' +(?P<route_refresh_old>[a-zA-Z\s]+)$',
+        p22=r'^\s*4-Byte AS capability: +(?P<capability>[\w\s]+)$',
+        p23=r'^\s*Address +family +VPNv4 +Unicast *:'
+            ' +(?P<vpnv4_unicast>[a-zA-Z\s]+)$',
+        p24=r'^\s*Address +family +VPNv6 +Unicast *:'
+            ' +(?P<vpnv6_unicast>[a-zA-Z\s]+)$',
+        p24_1=r'^\s*Address +family +IPv4 +MVPN:'
+              ' +(?P<ipv4_mvpn>[\w\s]+)$',
+        p25=r'^\s*Graceful +Restart +capability *:'
+            ' +(?P<graceful_restart>[a-zA-Z\s]+)$',
+        p26=r'^\s*Graceful +Restart +Parameters *:$',
+        p27_1=r'^\s*$',
+        p27_2=r'^\s*$',
+        p28_1=r'^\s*Restart +time +advertised +to +peer *:'
+              ' +(?P<time>[0-9]+) +seconds$',
+        p28_2=r'^\s*Restart +time +advertised +by +peer *:'
+              ' +(?P<time>[0-9]+) +seconds$',
+        p28=r'^\s*Stale +time +for +routes +advertised +by'
+            ' +peer *: +(?P<time>[0-9]+) +seconds$',
+        p30=r'^\s*(?P<message_stat>[a-zA-Z\s]+) *:'
+            ' +(?P<sent>[0-9]+) +(?P<received>[0-9]+)$',
+        p31=r'^\s*For +address +family *:'
+            ' +(?P<af>[a-zA-Z0-9\s]+)$',
+        p32=r'^\s*BGP +table +version'
+            ' +(?P<af_bgp_table_version>[0-9]+), +neighbor'
+            ' +version +(?P<nbr_version>[0-9]+)$',
+        p33=r'^\s*(?P<accepted_paths>[0-9]+) +accepted'
+            ' +paths +consume +(?P<bytes_consumed>[0-9]+)'
+            ' +bytes +of +memory$',
+        p34=r'^\s*(?P<num_sent_paths>[0-9]+) +sent +paths$',
+        p35=r'^\s*Community +attribute +sent +to +this'
+            ' +neighbor$',
+        p36=r'^\s*Extended +community +attribute +sent +to'
+            ' +this +neighbor$',
+        p37=r'^\s*Maximum +prefixes +allowed +(?P<num>[0-9]+)$',
+        p38=r'^\s*Inbound +route-map +configured +is'
+            ' +(?P<route_map_name_in>(\S+)), +handle'
+            ' +obtained$',
+        p39=r'^\s*Outbound +route-map +configured +is'
+            ' +(?P<route_map_name_out>(\S+)), +handle'
+            ' +obtained$',
+        p40=r'^\s*Third-party +Nexthop +will +not +be'
+            ' +computed.$',
+        p41=r'^\s*SOO +Extcommunity *:'
+            ' +(?P<soo>[a-zA-Z0-9\:]+)$',
+        p42=r'^\s*Inbound +soft +reconfiguration +allowed$',
+        p43=r'\s*Nexthop(?: +always)? +set +to +local +peering'
+            ' +address, +(?P<ip>[\w\.\:]+)$',
+        p44=r'^\s*Allow +my +ASN +(?P<num>[0-9]+) +times$',
+        p45=r'^\s*ASN override is enabled$',
+        p46=r'^\s*Default +information +originate,'
+            '(?: +route-map +(?P<route_map>(\S+)),)?'
+            ' +default(?: +not)? +sent$',
+        p48=r'^\s*(?P<inherit_peer_seq>[0-9]+)'
+            ' +(?P<policy_name>[a-zA-Z0-9\-\_]+)$',
+        p49=r'^\s*Local +host *: +(?P<local_host>[0-9\.\:]+),'
+            ' +Local +port *: +(?P<local_port>[0-9]+)$',
+        p50=r'^\s*Foreign +host *:'
+            ' +(?P<foreign_host>[0-9\.\:]+), +Foreign'
+            ' +port *: +(?P<foreign_port>[0-9]+)$',
+        p51=r'^\s*fd += +(?P<fd>[0-9]+)$',
+        p52=r'^\s*Route reflector client$',
+    )
+
     def cli(self, vrf='all', address_family='all', neighbor='', output=None):
         if output is None:
             if neighbor:
@@ -2384,130 +2431,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
         parsed_dict = {}
         standard_send_community = False
 
-        p1 = re.compile(r'^\s*BGP +neighbor +is +(?P<neighbor_id>[a-zA-Z0-9\.\:]+),'
-                            ' +remote +AS +(?P<remote_as>[0-9]+),'
-                            '(?: +local +AS +(?P<local_as>[0-9]+),)?'
-                            ' +(?P<link>[a-zA-Z]+) +link,'
-                            '( +(?P<peer_fab_type>[fabric\-\S]+),)?'
-                            ' +Peer +index +(?P<peer_index>[0-9]+)$')
-        p2 = re.compile(r'^\s*Description *: +(?P<description>(\S+))$')
-        p3 = re.compile(r'^\s*BGP +version +(?P<bgp_version>[0-9]+),'
-                            ' +remote +router +ID +(?P<router_id>[0-9\.]+)$')
-        p4 = re.compile(r'^\s*\s*BGP +state += +(?P<session_state>(\S+))'
-                            '(?: +\((?P<reason>([a-zA-Z\s]+))\))?,'
-                            ' +(up|down) +for +(?P<up_time>[a-zA-Z0-9\:\.]+)'
-                            '(?: *, +retry +in +(?P<retry_time>[0-9\.\:]+))?$')
-        p5 = re.compile(r'^\s*Using +(?P<update_source>[a-zA-Z0-9]+)'
-                            ' +as +update +source +for +this +peer$')
-        p6 = re.compile(r'^\s*BFD live-detection is configured'
-                            '(?: +and +(?P<bfd_enabled>(\S+)), +state +is'
-                            ' +(?P<bfd_state>(\S+)))?$')
-        p7 = re.compile(r'^\s*Neighbor +local-as +command'
-                            ' +(?P<nbr_local_as_cmd>[a-zA-Z\s]+)$')
-        p8 = re.compile(r'^\s*Last +read +(?P<last_read>[a-zA-Z0-9\:]+),'
-                            ' +hold +time += +(?P<holdtime>[0-9]+), +keepalive'
-                            ' +interval +is +(?P<keepalive_interval>[0-9]+)'
-                            ' +seconds$')
-        p9 = re.compile(r'^\s*Last +written'
-                            ' +(?P<last_written>[a-zA-Z0-9\:]+), +keepalive'
-                            ' +timer +(?P<keepalive_timer>[a-zA-Z0-9\:\s]+)$')
-        p10 = re.compile(r'^\s*Inherits +session +configuration +from'
-                        ' +session-template +(?P<template>[a-zA-Z\-\_]+)$')
-        p11 = re.compile(r'^\s*Connected check is disabled$')
-        p11_2 = re.compile(r'^\s*Private +AS +numbers +removed +from +updates +sent +to +this +neighbor$')
-        p12_1 = re.compile(r'^\s*External +BGP +peer +might +be +upto'
-                            ' +(?P<ebgp_multihop_max_hop>[0-9]+) +hops +away$')
-        p12_2 = re.compile(r'^\s*External +BGP +peer +might +be +up to'
-                            ' +(?P<ebgp_multihop_max_hop>[0-9]+) +hops +away$')
-        p13 = re.compile(r'^\s*TCP +MD5 +authentication +is'
-                            ' +(?P<tcp_md5_auth>[a-zA-Z\(\)\s]+)$')
-        p14 = re.compile(r'^\s*Only +passive +connection +setup +allowed$')
-        p15 = re.compile(r'^\s*Received +(?P<received_messages>[0-9]+)'
-                            ' +messages, +(?P<received_notifications>[0-9]+)'
-                            ' +notifications, +(?P<received_bytes>[0-9]+)'
-                            ' +bytes +in +queue$')
-        p16 = re.compile(r'^\s*Sent +(?P<sent_messages>[0-9]+)'
-                            ' +messages, +(?P<sent_notifications>[0-9]+)'
-                            ' +notifications, +(?P<sent_bytes_queue>[0-9]+)'
-                            ' +bytes +in +queue$')
-        p17 = re.compile(r'^\s*Connections +established'
-                            ' +(?P<esablished>[0-9]+), +dropped'
-                            ' +(?P<dropped>[0-9]+)$')
-        p17_1 = re.compile(r'^\s*Connections +attempts'
-                            ' +(?P<attemps>[0-9]+)$')
-        p18 = re.compile(r'^\s*Last +reset +by (?P<reset_by>[a-zA-Z]+)'
-                            ' +(?P<last_reset>[a-zA-Z0-9\:\s]+), +due +to'
-                            ' +(?P<reset_reason>[a-zA-Z\-\s]+)$')
-        p19 = re.compile(r'^\s*Neighbor +capabilities *:$')
-        p20_1 = re.compile(r'^\s*Dynamic +capability *:'
-                            ' +(?P<dynamic_capability>[a-zA-Z\,\(\)\s]+)$')
-        p20_2 = re.compile(r'^\s*Dynamic +capability +\(old\) *:'
-                            ' +(?P<dynamic_capability_old>[a-zA-Z\s]+)$')
-        p21 = re.compile(r'^\s*Route +refresh +capability +\(new\) *:'
-                            ' +(?P<route_refresh>[a-zA-Z\s]+)$')
-        p21_1 = re.compile(r'^\s*Route +refresh +capability +\(old\) *:'
-                            ' +(?P<route_refresh_old>[a-zA-Z\s]+)$')
-        p22 = re.compile(r'^\s*4-Byte AS capability: +(?P<capability>[\w\s]+)$')
-        p23 = re.compile(r'^\s*Address +family +VPNv4 +Unicast *:'
-                            ' +(?P<vpnv4_unicast>[a-zA-Z\s]+)$')
-        p24 = re.compile(r'^\s*Address +family +VPNv6 +Unicast *:'
-                            ' +(?P<vpnv6_unicast>[a-zA-Z\s]+)$')
-        p24_1 = re.compile(r'^\s*Address +family +IPv4 +MVPN:'
-                            ' +(?P<ipv4_mvpn>[\w\s]+)$')
-        p25 = re.compile(r'^\s*Graceful +Restart +capability *:'
-                            ' +(?P<graceful_restart>[a-zA-Z\s]+)$')
-        p26 = re.compile(r'^\s*Graceful +Restart +Parameters *:$')
-        p27_1 = re.compile(r'^\s*$')
-        p27_2 = re.compile(r'^\s*$')
-        p28_1 = re.compile(r'^\s*Restart +time +advertised +to +peer *:'
-                            ' +(?P<time>[0-9]+) +seconds$')
-        p28_2 = re.compile(r'^\s*Restart +time +advertised +by +peer *:'
-                            ' +(?P<time>[0-9]+) +seconds$')
-        p28 = re.compile(r'^\s*Stale +time +for +routes +advertised +by'
-                            ' +peer *: +(?P<time>[0-9]+) +seconds$')
-        p30 = re.compile(r'^\s*(?P<message_stat>[a-zA-Z\s]+) *:'
-                            ' +(?P<sent>[0-9]+) +(?P<received>[0-9]+)$')
-        p31 = re.compile(r'^\s*For +address +family *:'
-                            ' +(?P<af>[a-zA-Z0-9\s]+)$')
-        p32 = re.compile(r'^\s*BGP +table +version'
-                            ' +(?P<af_bgp_table_version>[0-9]+), +neighbor'
-                            ' +version +(?P<nbr_version>[0-9]+)$')
-        p33 = re.compile(r'^\s*(?P<accepted_paths>[0-9]+) +accepted'
-                            ' +paths +consume +(?P<bytes_consumed>[0-9]+)'
-                            ' +bytes +of +memory$')
-        p34 = re.compile(r'^\s*(?P<num_sent_paths>[0-9]+) +sent +paths$')
-        p35 = re.compile(r'^\s*Community +attribute +sent +to +this'
-                            ' +neighbor$')
-        p36 = re.compile(r'^\s*Extended +community +attribute +sent +to'
-                            ' +this +neighbor$')
-        p37 = re.compile(r'^\s*Maximum +prefixes +allowed +(?P<num>[0-9]+)$')
-        p38 = re.compile(r'^\s*Inbound +route-map +configured +is'
-                            ' +(?P<route_map_name_in>(\S+)), +handle'
-                            ' +obtained$')
-        p39 = re.compile(r'^\s*Outbound +route-map +configured +is'
-                            ' +(?P<route_map_name_out>(\S+)), +handle'
-                            ' +obtained$')
-        p40 = re.compile(r'^\s*Third-party +Nexthop +will +not +be'
-                            ' +computed.$')
-        p41 = re.compile(r'^\s*SOO +Extcommunity *:'
-                            ' +(?P<soo>[a-zA-Z0-9\:]+)$')
-        p42 = re.compile(r'^\s*Inbound +soft +reconfiguration +allowed$')
-        p43 = re.compile(r'\s*Nexthop(?: +always)? +set +to +local +peering'
-                            ' +address, +(?P<ip>[\w\.\:]+)$')
-        p44 = re.compile(r'^\s*Allow +my +ASN +(?P<num>[0-9]+) +times$')
-        p45 = re.compile(r'^\s*ASN override is enabled$')
-        p46 = re.compile(r'^\s*Default +information +originate,'
-                            '(?: +route-map +(?P<route_map>(\S+)),)?'
-                            ' +default(?: +not)? +sent$')
-        p48 = re.compile(r'^\s*(?P<inherit_peer_seq>[0-9]+)'
-                            ' +(?P<policy_name>[a-zA-Z0-9\-\_]+)$')
-        p49 = re.compile(r'^\s*Local +host *: +(?P<local_host>[0-9\.\:]+),'
-                            ' +Local +port *: +(?P<local_port>[0-9]+)$')
-        p50 = re.compile(r'^\s*Foreign +host *:'
-                            ' +(?P<foreign_host>[0-9\.\:]+), +Foreign'
-                            ' +port *: +(?P<foreign_port>[0-9]+)$')
-        p51 = re.compile(r'^\s*fd += +(?P<fd>[0-9]+)$')
-        p52 = re.compile(r'^\s*Route reflector client$')
+        p = ShowBgpVrfAllNeighbors.patterns
             
         for line in out.splitlines():
             line = line.rstrip()
@@ -2515,7 +2439,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
             # BGP neighbor is 10.16.2.2,  remote AS 100, ibgp link,  Peer index 1
             # BGP neighbor is 10.16.2.5,  remote AS 200, local AS 333, ebgp link,  Peer index 2
             # BGP neighbor is 10.186.0.4, remote AS 1, ibgp link, fabric-internal, Peer index 2
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 standard_send_community = False
                 if 'neighbor' not in parsed_dict:
@@ -2540,14 +2464,14 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                     continue
 
             # Description: nei_desc
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['description'] = \
                         str(m.groupdict()['description'])
                 continue
 
             # BGP version 4, remote router ID 10.16.2.2
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['bgp_version'] = \
                         int(m.groupdict()['bgp_version'])
@@ -2558,7 +2482,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
             # BGP state = Established, up for 5w0d
             # BGP state = Idle, down for 4w6d, retry in 0.000000
             # BGP state = Shut (Admin), down for 5w0d
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['session_state'] = \
                         str(m.groupdict()['session_state']).lower()
@@ -2577,7 +2501,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                     continue
 
             # Using loopback0 as update source for this peer
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['update_source'] = \
                         str(m.groupdict()['update_source'])
@@ -2585,7 +2509,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
 
             # BFD live-detection is configured
             # BFD live-detection is configured and enabled, state is Up
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['bfd_live_detection'] = \
                     True
@@ -2598,7 +2522,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Neighbor local-as command not active
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['nbr_local_as_cmd'] = \
                         str(m.groupdict()['nbr_local_as_cmd'])
@@ -2607,7 +2531,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
             # Last read 00:00:24, hold time = 99, keepalive interval is 33 seconds
             # Last read never, hold time = 180, keepalive interval is 60 seconds
             # Last read never, hold time = 45, keepalive interval is 15 seconds
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 if 'bgp_negotiated_keepalive_timers' not in \
                     parsed_dict['neighbor'][neighbor_id]:
@@ -2626,7 +2550,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
 
             # Last written 00:00:02, keepalive timer expiry due 00:00:30
             # Last written never, keepalive timer not running
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 if 'bgp_negotiated_keepalive_timers' not in \
                     parsed_dict['neighbor'][neighbor_id]:
@@ -2641,27 +2565,27 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Inherits session configuration from session-template PEER-SESSION
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['inherit_peer_session'] = \
                     str(m.groupdict()['template'])
                 continue
 
             # Connected check is disabled
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]\
                     ['disable_connected_check'] = True
                 continue
 
             # Private AS numbers removed from updates sent to this neighbor
-            m = p11_2.match(line)
+            m = p.p11_2.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['remove_private_as'] = True
                 continue
 
             # External BGP peer might be upto 255 hops away
-            m = p12_1.match(line)
+            m = p.p12_1.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['ebgp_multihop'] = True
                 parsed_dict['neighbor'][neighbor_id]['ebgp_multihop_max_hop'] =\
@@ -2669,7 +2593,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # External BGP peer might be up to 5 hops away
-            m = p12_2.match(line)
+            m = p.p12_2.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['ebgp_multihop'] = True
                 parsed_dict['neighbor'][neighbor_id]['ebgp_multihop_max_hop'] =\
@@ -2678,7 +2602,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
 
             # TCP MD5 authentication is enabled
             # TCP MD5 authentication is set (disabled)
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['tcp_md5_auth'] = \
                     str(m.groupdict()['tcp_md5_auth'])
@@ -2687,7 +2611,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
             
             # Only passive connection setup allowed
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 if 'bgp_session_transport' not in parsed_dict['neighbor']\
                     [neighbor_id]:
@@ -2702,7 +2626,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Received 92717 messages, 3 notifications, 0 bytes in queue
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['received_messages'] = \
                     int(m.groupdict()['received_messages'])
@@ -2713,7 +2637,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Sent 92730 messages, 5 notifications, 0 bytes in queue
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['sent_messages'] = \
                     int(m.groupdict()['sent_messages'])
@@ -2724,7 +2648,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Connections established 9, dropped 8
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 if 'bgp_session_transport' not in parsed_dict['neighbor']\
                     [neighbor_id]:
@@ -2742,7 +2666,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Connections attempts 0
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 if 'bgp_session_transport' not in parsed_dict['neighbor']\
                     [neighbor_id]:
@@ -2759,7 +2683,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
             # Last reset by us 5w0d, due to session cleared
             # Last reset by peer 5w0d, due to session cleared
             # Last reset by us never, due to No error
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 if 'bgp_session_transport' not in parsed_dict['neighbor']\
                     [neighbor_id]:
@@ -2781,7 +2705,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Neighbor capabilities:
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 if 'bgp_negotiated_capabilities' not in parsed_dict['neighbor']\
                     [neighbor_id]:
@@ -2790,7 +2714,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Dynamic capability: advertised (mp, refresh, gr) received (mp, refresh, gr)
-            m = p20_1.match(line)
+            m = p.p20_1.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]\
                     ['bgp_negotiated_capabilities']['dynamic_capability'] = \
@@ -2798,7 +2722,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Dynamic capability (old): advertised received
-            m = p20_2.match(line)
+            m = p.p20_2.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]\
                     ['bgp_negotiated_capabilities']['dynamic_capability_old'] = \
@@ -2806,7 +2730,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Route refresh capability (new): advertised received
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]\
                     ['bgp_negotiated_capabilities']['route_refresh'] = \
@@ -2814,7 +2738,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Route refresh capability (old): advertised received 
-            m = p21_1.match(line)
+            m = p.p21_1.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]\
                     ['bgp_negotiated_capabilities']['route_refresh_old'] = \
@@ -2823,14 +2747,14 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
 
             # 4-Byte AS capability: disabled
             # 4-Byte AS capability: disabled received
-            m = p22.match(line)
+            m = p.p22.match(line)
             if m:
                 if 'disabled' in m.groupdict()['capability']:
                     parsed_dict['neighbor'][neighbor_id]['suppress_four_byte_as_capability'] = True
                 continue
 
             # Address family VPNv4 Unicast: advertised received
-            m = p23.match(line)
+            m = p.p23.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]\
                     ['bgp_negotiated_capabilities']['vpnv4_unicast'] = \
@@ -2838,7 +2762,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Address family VPNv6 Unicast: advertised received 
-            m = p24.match(line)
+            m = p.p24.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]\
                     ['bgp_negotiated_capabilities']['vpnv6_unicast'] = \
@@ -2846,7 +2770,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Address family IPv4 MVPN: advertised received
-            m = p24_1.match(line)
+            m = p.p24_1.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id] \
                     ['bgp_negotiated_capabilities']['ipv4_mvpn'] = \
@@ -2854,7 +2778,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Graceful Restart capability: advertised received
-            m = p25.match(line)
+            m = p.p25.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]\
                     ['bgp_negotiated_capabilities']['graceful_restart'] = \
@@ -2862,7 +2786,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Graceful Restart Parameters:
-            m = p26.match(line)
+            m = p.p26.match(line)
             if m:
                 if 'graceful_restart_paramters' not in \
                     parsed_dict['neighbor'][neighbor_id]:
@@ -2872,19 +2796,19 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
 
             # Address families advertised to peer:
             # VPNv4 Unicast  VPNv6 Unicast 
-            m = p27_1.match(line)
+            m = p.p27_1.match(line)
             if m:
                 continue
 
             # Address families received from peer:
             # VPNv4 Unicast  VPNv6 Unicast  
-            m = p27_2.match(line)
+            m = p.p27_2.match(line)
             if m:
                 continue
 
             # Forwarding state preserved by peer for:
             # Restart time advertised to peer: 240 seconds
-            m = p28_1.match(line)
+            m = p.p28_1.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]\
                     ['graceful_restart_paramters']\
@@ -2893,7 +2817,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Restart time advertised by peer: 120 seconds
-            m = p28_2.match(line)
+            m = p.p28_2.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]\
                     ['graceful_restart_paramters']\
@@ -2902,7 +2826,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Stale time for routes advertised by peer: 600 seconds
-            m = p28.match(line)
+            m = p.p28.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]\
                     ['graceful_restart_paramters']\
@@ -2921,7 +2845,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
             # Total:                     92730              92717  
             # Total bytes:             1763812            1763099  
             # Bytes in queue:                0                  0
-            m = p30.match(line)
+            m = p.p30.match(line)
             if m:
                 if 'bgp_neighbor_counters' not in parsed_dict['neighbor']\
                     [neighbor_id]:
@@ -2956,7 +2880,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # For address family: VPNv4 Unicast
-            m = p31.match(line)
+            m = p.p31.match(line)
             if m:
                 if 'address_family' not in  parsed_dict['neighbor'][neighbor_id]:
                     parsed_dict['neighbor'][neighbor_id]['address_family'] = {}
@@ -2975,7 +2899,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # BGP table version 48, neighbor version 48
-            m = p32.match(line)
+            m = p.p32.match(line)
             if m:
                 standard_send_community = False
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
@@ -2987,7 +2911,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # 1 accepted paths consume 48 bytes of memory
-            m = p33.match(line)
+            m = p.p33.match(line)
             if m:
                 if 'path' not in parsed_dict['neighbor'][neighbor_id]\
                     ['address_family'][address_family]:
@@ -3002,7 +2926,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # 2 sent paths
-            m = p34.match(line)
+            m = p.p34.match(line)
             if m:
                 if 'path' not in parsed_dict['neighbor'][neighbor_id]\
                     ['address_family'][address_family]:
@@ -3014,7 +2938,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
             
             # Community attribute sent to this neighbor
-            m = p35.match(line)
+            m = p.p35.match(line)
             if m:
                 standard_send_community = True
                 parsed_dict['neighbor'][neighbor_id]['address_family'] \
@@ -3022,7 +2946,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Extended community attribute sent to this neighbor
-            m = p36.match(line)
+            m = p.p36.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['address_family'] \
                     [address_family]['send_community'] = 'extended'
@@ -3033,7 +2957,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Maximum prefixes allowed 300000
-            m = p37.match(line)
+            m = p.p37.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
                     [address_family]['maximum_prefix_max_prefix_no'] = \
@@ -3041,7 +2965,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Inbound route-map configured is genie_redistribution, handle obtained
-            m = p38.match(line)
+            m = p.p38.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
                     [address_family]['route_map_name_in'] = \
@@ -3049,7 +2973,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Outbound route-map configured is genie_redistribution, handle obtained
-            m = p39.match(line)
+            m = p.p39.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
                     [address_family]['route_map_name_out'] = \
@@ -3057,21 +2981,21 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Third-party Nexthop will not be computed.
-            m = p40.match(line)
+            m = p.p40.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
                     [address_family]['third_party_nexthop'] = True
                 continue
             
             # SOO Extcommunity: SOO:100:100
-            m = p41.match(line)
+            m = p.p41.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
                     [address_family]['soo'] = str(m.groupdict()['soo'])
                 continue
 
             # Inbound soft reconfiguration allowed
-            m = p42.match(line)
+            m = p.p42.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
                     [address_family]['soft_configuration'] = True
@@ -3079,14 +3003,14 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
 
             # Nexthop always set to local peering address, 0.0.0.0
             # Nexthop set to local peering address, 0.0.0.0
-            m = p43.match(line)
+            m = p.p43.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
                     [address_family]['next_hop_self'] = True
                 continue
 
             # Allow my ASN 9 times
-            m = p44.match(line)
+            m = p.p44.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
                     [address_family]['as_override_count'] = \
@@ -3094,7 +3018,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # ASN override is enabled
-            m = p45.match(line)
+            m = p.p45.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
                     [address_family]['as_override'] = True
@@ -3103,7 +3027,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
             # Default information originate, default not sent
             # Default information originate, default sent
             # Default information originate, route-map SOMENAME, default not sent
-            m = p46.match(line)
+            m = p.p46.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
                     [address_family]['default_originate'] = True
@@ -3117,7 +3041,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
             # Preference    Name
             #         10    PEER-POLICY                                                 
             #         20    PEER-POLICY2
-            m = p48.match(line)
+            m = p.p48.match(line)
             if m:
                 policy_name = str(m.groupdict()['policy_name'])
                 inherit_peer_seq = int(m.groupdict()['inherit_peer_seq'])
@@ -3137,7 +3061,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                     continue
 
             # Local host: 10.4.1.1, Local port: 179
-            m = p49.match(line)
+            m = p.p49.match(line)
             if m:
                 if 'bgp_session_transport' not in parsed_dict['neighbor']\
                     [neighbor_id]:
@@ -3156,7 +3080,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Foreign host: 10.16.2.2, Foreign port: 4466
-            m = p50.match(line)
+            m = p.p50.match(line)
             if m:
                 if 'bgp_session_transport' not in parsed_dict['neighbor']\
                     [neighbor_id]:
@@ -3175,7 +3099,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
             
             # fd = 44
-            m = p51.match(line)
+            m = p.p51.match(line)
             if m:
                 if 'bgp_session_transport' not in parsed_dict['neighbor']\
                     [neighbor_id]:
@@ -3190,7 +3114,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Route reflector client
-            m = p52.match(line)
+            m = p.p52.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
                     [address_family]['route_reflector_client'] = True
@@ -3204,7 +3128,8 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
 
         # Execute YANG 'get' operational state RPC and parse the XML
         bgpOC = BgpOpenconfigYang(self.device)
-        yang_dict = bgpOC.yang()
+        yang_dict = bgpOC.yang(vrf=vrf, neighbor=neighbor,
+                               neighbors_only=True)
 
         if 'vrf' in yang_dict:
             for vrf_name in yang_dict['vrf']:
@@ -3287,6 +3212,36 @@ class ShowBgpVrfAllAllNextHopDatabase(ShowBgpVrfAllAllNextHopDatabaseSchema):
       'rib_route',
       'refcount']
 
+    patterns = Patterns(
+        p1=r'^\s*Next +Hop +table +for +VRF'
+           ' +(?P<vrf_name>\S+), +address +family'
+           ' +(?P<af>[a-zA-Z0-9\s\-]+) *:$',
+        p2=r'^\s*Critical *:'
+           ' +(?P<nexthop_trigger_delay_critical>[0-9]+)'
+           ' +Non-critical *:'
+           ' +(?P<nexthop_trigger_delay_non_critical>[0-9]+)$',
+        p3=r'^\s*Nexthop *: +(?P<nh>[a-zA-Z0-9\.\:]+),'
+           '( +Flags *: +(?P<flags>\w+),)?'
+           ' +Refcount *: +(?P<refcount>[0-9]+), +IGP'
+           ' +cost *: +(?P<igp_cost>[0-9\-]+)'
+           '(?:, +Multipath: +(?P<multipath>(\S+)))?$',
+        p4=r'^\s*IGP +Route +type *:'
+           ' +(?P<igp_route_type>[0-9]+), +IGP +preference *:'
+           ' +(?P<igp_preference>[0-9]+)$',
+        p5=r'^\s*Nexthop +is +(?P<attached>[\w\-]+) +'
+           '(?P<local>[\w\-]+) +(?P<reachable>[\w\-]+) +'
+           '(?P<labeled>[\w\-]+)$',
+        p6=r'^\s*Nexthop +last +resolved *:'
+           ' +(?P<nexthop_last_resolved>[a-zA-Z0-9\:\.\s]+),'
+           ' +using +(?P<nexthop_resolved_using>[\w\:\-\.\/]+)$',
+        p7=r'^\s*Metric +next +advertise *:'
+           ' +(?P<metric_next_advertise>[a-zA-Z0-9\:]+)$',
+        p8=r'^\s*RNH +epoch *: +(?P<rnh_epoch>[0-9]+)$',
+        p9=r'^\s*Attached +nexthop *:'
+           ' +(?P<attached_nexthop>[\w\.\:]+), +Interface *:'
+           ' +(?P<attached_nexthop_interface>[\w\-\.\/]+)$',
+    )
+
     def cli(self, vrf='all', address_family='all', cmd = "", output=None):
         if output is None:
             if not cmd:
@@ -3301,39 +3256,13 @@ class ShowBgpVrfAllAllNextHopDatabase(ShowBgpVrfAllAllNextHopDatabaseSchema):
         # Init vars
         nh_dict = {}
 
-        p1 = re.compile(r'^\s*Next +Hop +table +for +VRF'
-                            ' +(?P<vrf_name>\S+), +address +family'
-                            ' +(?P<af>[a-zA-Z0-9\s\-]+) *:$')
-        p2 = re.compile(r'^\s*Critical *:'
-                            ' +(?P<nexthop_trigger_delay_critical>[0-9]+)'
-                            ' +Non-critical *:'
-                            ' +(?P<nexthop_trigger_delay_non_critical>[0-9]+)$')
-        p3 = re.compile(r'^\s*Nexthop *: +(?P<nh>[a-zA-Z0-9\.\:]+),'
-                            '( +Flags *: +(?P<flags>\w+),)?'
-                            ' +Refcount *: +(?P<refcount>[0-9]+), +IGP'
-                            ' +cost *: +(?P<igp_cost>[0-9\-]+)'
-                            '(?:, +Multipath: +(?P<multipath>(\S+)))?$')
-        p4 = re.compile(r'^\s*IGP +Route +type *:'
-                            ' +(?P<igp_route_type>[0-9]+), +IGP +preference *:'
-                            ' +(?P<igp_preference>[0-9]+)$')
-        p5 = re.compile(r'^\s*Nexthop +is +(?P<attached>[\w\-]+) +'
-                            '(?P<local>[\w\-]+) +(?P<reachable>[\w\-]+) +'
-                            '(?P<labeled>[\w\-]+)$')
-        p6 = re.compile(r'^\s*Nexthop +last +resolved *:'
-                            ' +(?P<nexthop_last_resolved>[a-zA-Z0-9\:\.\s]+),'
-                            ' +using +(?P<nexthop_resolved_using>[\w\:\-\.\/]+)$')
-        p7 = re.compile(r'^\s*Metric +next +advertise *:'
-                            ' +(?P<metric_next_advertise>[a-zA-Z0-9\:]+)$')
-        p8 = re.compile(r'^\s*RNH +epoch *: +(?P<rnh_epoch>[0-9]+)$')
-        p9 = re.compile(r'^\s*Attached +nexthop *:'
-                            ' +(?P<attached_nexthop>[\w\.\:]+), +Interface *:'
-                            ' +(?P<attached_nexthop_interface>[\w\-\.\/]+)$')
+        p = ShowBgpVrfAllAllNextHopDatabase.patterns
         for line in out.splitlines():
             line = line.rstrip()
 
             # Next Hop table for VRF VRF1, address family IPv4 Unicast:
             # Next Hop table for VRF Tenant-1, address family IPv6 Unicast:
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 if 'vrf' not in nh_dict:
                     nh_dict['vrf'] = {}
@@ -3352,7 +3281,7 @@ class ShowBgpVrfAllAllNextHopDatabase(ShowBgpVrfAllAllNextHopDatabaseSchema):
 
             # Next-hop trigger-delay(miliseconds)
             # Critical: 2222 Non-critical: 3333
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 af_dict['nexthop_trigger_delay_critical'] = \
                     int(m.groupdict()['nexthop_trigger_delay_critical'])
@@ -3363,7 +3292,7 @@ class ShowBgpVrfAllAllNextHopDatabase(ShowBgpVrfAllAllNextHopDatabaseSchema):
             # Nexthop: 0.0.0.0, Refcount: 4, IGP cost: 0
             # Nexthop: 192.168.154.1, Flags: 0x41, Refcount: 1, IGP cost: 3
             # Nexthop: 2001:db8:1900:1::1:101, Flags: 0x5, Refcount: 3, IGP cost: 0, Multipath: No
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 nexthop = m.groupdict()['nh']
                 if 'next_hop' not in af_dict:
@@ -3380,7 +3309,7 @@ class ShowBgpVrfAllAllNextHopDatabase(ShowBgpVrfAllAllNextHopDatabaseSchema):
                 continue
 
             # IGP Route type: 0, IGP preference: 0
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 af_dict['next_hop'][nexthop]['igp_route_type'] = int(m.groupdict()['igp_route_type'])
                 af_dict['next_hop'][nexthop]['igp_preference'] = int(m.groupdict()['igp_preference'])
@@ -3388,7 +3317,7 @@ class ShowBgpVrfAllAllNextHopDatabase(ShowBgpVrfAllAllNextHopDatabaseSchema):
 
             # Nexthop is not-attached local unreachable not-labeled
             # Nexthop is not-attached not-local reachable labeled
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 if m.groupdict()['attached'] == 'not-attached':
                     af_dict['next_hop'][nexthop]['attached'] = False
@@ -3418,7 +3347,7 @@ class ShowBgpVrfAllAllNextHopDatabase(ShowBgpVrfAllAllNextHopDatabaseSchema):
             # Nexthop last resolved: never, using 0.0.0.0/0
             # Nexthop last resolved: 00:00:39, using 10.36.1.0/32
             # Nexthop last resolved: 0.596958, using 10.36.1.0/32
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 af_dict['next_hop'][nexthop]['resolve_time'] = \
                     str(m.groupdict()['nexthop_last_resolved'])
@@ -3428,20 +3357,20 @@ class ShowBgpVrfAllAllNextHopDatabase(ShowBgpVrfAllAllNextHopDatabaseSchema):
 
             # Metric next advertise: Never
             # Metric next advertise: 00:06:11
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 af_dict['next_hop'][nexthop]['metric_next_advertise'] = \
                     str(m.groupdict()['metric_next_advertise']).lower()
                 continue
 
             # RNH epoch: 0
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 af_dict['next_hop'][nexthop]['rnh_epoch'] = int(m.groupdict()['rnh_epoch'])
                 continue
 
             # Attached nexthop: 10.1.3.3, Interface: Ethernet4/2
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 if 'attached_nexthop' not in af_dict['next_hop'][nexthop]:
                     af_dict['next_hop'][nexthop]['attached_nexthop'] = {}
@@ -3541,6 +3470,97 @@ class ShowBgpVrfAllAllSummary(ShowBgpVrfAllAllSummarySchema):
       'total_entries',
       'as_path_entries']
 
+    patterns = Patterns(
+        p1=r'^\s*BGP +summary +information +for +VRF'
+           ' +(?P<vrf_name>\S+), +address +family'
+           ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$',
+        p2=r'^\s*BGP +router +identifier'
+           ' +(?P<route_identifier>[0-9\.\:]+), +local +AS'
+           ' +number +(?P<local_as>[0-9]+)$',
+        p3=r'^\s*BGP +table +version +is'
+           ' +(?P<bgp_table_version>[0-9]+),'
+           ' +(?P<address_family>[a-zA-Z0-9\-\s]+) +config'
+           ' +peers +(?P<config_peers>[0-9]+), +capable'
+           ' +peers +(?P<capable_peers>[0-9]+)$',
+        p4=r'^\s*(?P<networks>[0-9]+) +network +entries +and'
+           ' +(?P<paths>[0-9]+) +paths +using'
+           ' +(?P<bytes>[0-9]+) +bytes +of +memory$',
+        p5=r'^\s*BGP +attribute +entries'
+           ' +(?P<attribute_entries>(\S+)), +BGP +AS +path'
+           ' +entries +(?P<as_path_entries>(\S+))$',
+        p6=r'^\s*BGP +community +entries'
+           ' +(?P<community_entries>(\S+)), +BGP +clusterlist'
+           ' +entries +(?P<clusterlist_entries>(\S+))$',
+        p7=r'^\s*Dampening +configured,'
+           ' +(?P<history_paths>[0-9]+) +history +paths,'
+           ' +(?P<dampened_paths>[0-9]+) +dampened +paths$',
+        p9=r'^\s*(?P<val>[0-9]+) +received +paths +for +inbound +soft +reconfiguration$',
+        p10=r'^\s*(?P<val1>[0-9]+) +identical, +'
+            '(?P<val2>[0-9]+) +modified, +'
+            '(?P<val3>[0-9]+) +filtered +received +paths +'
+            'using +(?P<val4>[0-9]+) +bytes$',
+        p8=r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<v>[0-9]+)'
+           ' +(?P<as>[0-9]+) +(?P<msg_rcvd>[0-9]+)'
+           ' +(?P<msg_sent>[0-9]+) +(?P<tbl_ver>[0-9]+)'
+           ' +(?P<inq>[0-9]+) +(?P<outq>[0-9]+)'
+           ' +(?P<up_down>[a-zA-Z0-9\:]+)'
+           ' +(?P<state_pfxrcd>(?P<state>[a-zA-Z\s\(\)]+)?'
+           '(?P<prx_rcd>\d+)?([\w\(\)\s]+)?)$',
+        p8_1=r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+)$',
+        p8_2=r'^\s*(?P<v>[0-9]+) +(?P<as>[0-9]+)'
+             ' +(?P<msg_rcvd>[0-9]+) +(?P<msg_sent>[0-9]+)'
+             ' +(?P<tbl_ver>[0-9]+) +(?P<inq>[0-9]+)'
+             ' +(?P<outq>[0-9]+) +(?P<up_down>[a-zA-Z0-9\:]+)'
+             ' +(?P<state_pfxrcd>(?P<state>[a-zA-Z\s\(\)]+)?(?P<prx_rcd>\d+)?([\w\(\)\s]+)?)$',
+    )
+
+    # Rows of the xml output, see utils.xml_stream
+    xml_rows = XmlRow('vrf', '**/TABLE_vrf/ROW_vrf', {
+        'vrf-name-out': 'vrf',
+        'vrf-router-id': 'route_identifier',
+        'vrf-local-as': ('local_as', int),
+    }, rows=[
+        XmlRow('address_family', 'TABLE_af/ROW_af/TABLE_saf/ROW_saf', {
+            'af-name': ('address_family', str.lower),
+            'tableversion': ('bgp_table_version', int),
+            'configuredpeers': ('config_peers', int),
+            'capablepeers': ('capable_peers', int),
+            'totalnetworks': ('total_prefix_entries', int),
+            'totalpaths': ('total_path_entries', int),
+            'memoryused': ('memory_usage', int),
+            'numberattrs': 'numberattrs',
+            'bytesattrs': 'bytesattrs',
+            'numberpaths': 'numberpaths',
+            'bytespaths': 'bytespaths',
+            'numbercommunities': 'numbercommunities',
+            'bytescommunities': 'bytescommunities',
+            'numberclusterlist': 'numberclusterlist',
+            'bytesclusterlist': 'bytesclusterlist',
+            'dampening': ('dampening', str.lower),
+            'historypaths': ('history_paths', int),
+            'dampenedpaths': ('dampened_paths', int),
+            'softreconfigrecvdpaths': ('soft_reconfig_recvd_paths', int),
+            'softreconfigidenticalpaths': ('soft_reconfig_identical_paths', int),
+            'softreconfigcombopaths': ('soft_reconfig_combo_paths', int),
+            'softreconfigfilteredrecvd': ('soft_reconfig_filtered_recvd', int),
+            'softreconfigbytes': ('soft_reconfig_bytes', int),
+        }, rows=[
+            XmlRow('neighbor', 'TABLE_neighbor/ROW_neighbor', {
+                'neighborid': 'neighbor',
+                'neighborversion': ('neighbor_table_version', int),
+                'msgrecvd': ('msg_rcvd', int),
+                'msgsent': ('msg_sent', int),
+                'neighbortableversion': ('tbl_ver', int),
+                'inq': ('inq', int),
+                'outq': ('outq', int),
+                'neighboras': ('as', int),
+                'time': 'up_down',
+                'state': ('state', str.lower),
+                'prefixreceived': 'prefix_received',
+            }),
+        ]),
+    ])
+
     def cli(self, vrf='all', address_family='all', output=None):
         if output is None:
             if address_family == 'all':
@@ -3558,47 +3578,7 @@ class ShowBgpVrfAllAllSummary(ShowBgpVrfAllAllSummarySchema):
         # Init vars
         sum_dict = {}
         data_on_nextline = False
-        p1 = re.compile(r'^\s*BGP +summary +information +for +VRF'
-                            ' +(?P<vrf_name>\S+), +address +family'
-                            ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
-        p2 = re.compile(r'^\s*BGP +router +identifier'
-                            ' +(?P<route_identifier>[0-9\.\:]+), +local +AS'
-                            ' +number +(?P<local_as>[0-9]+)$')
-        p3 = re.compile(r'^\s*BGP +table +version +is'
-                            ' +(?P<bgp_table_version>[0-9]+),'
-                            ' +(?P<address_family>[a-zA-Z0-9\-\s]+) +config'
-                            ' +peers +(?P<config_peers>[0-9]+), +capable'
-                            ' +peers +(?P<capable_peers>[0-9]+)$')
-        p4 = re.compile(r'^\s*(?P<networks>[0-9]+) +network +entries +and'
-                            ' +(?P<paths>[0-9]+) +paths +using'
-                            ' +(?P<bytes>[0-9]+) +bytes +of +memory$')
-        p5 = re.compile(r'^\s*BGP +attribute +entries'
-                            ' +(?P<attribute_entries>(\S+)), +BGP +AS +path'
-                            ' +entries +(?P<as_path_entries>(\S+))$')
-        p6 = re.compile(r'^\s*BGP +community +entries'
-                            ' +(?P<community_entries>(\S+)), +BGP +clusterlist'
-                            ' +entries +(?P<clusterlist_entries>(\S+))$')
-        p7 = re.compile(r'^\s*Dampening +configured,'
-                            ' +(?P<history_paths>[0-9]+) +history +paths,'
-                            ' +(?P<dampened_paths>[0-9]+) +dampened +paths$')
-        p9 = re.compile(r'^\s*(?P<val>[0-9]+) +received +paths +for +inbound +soft +reconfiguration$')
-        p10 = re.compile(r'^\s*(?P<val1>[0-9]+) +identical, +'
-                            '(?P<val2>[0-9]+) +modified, +'
-                            '(?P<val3>[0-9]+) +filtered +received +paths +'
-                            'using +(?P<val4>[0-9]+) +bytes$')
-        p8 = re.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<v>[0-9]+)'
-                            ' +(?P<as>[0-9]+) +(?P<msg_rcvd>[0-9]+)'
-                            ' +(?P<msg_sent>[0-9]+) +(?P<tbl_ver>[0-9]+)'
-                            ' +(?P<inq>[0-9]+) +(?P<outq>[0-9]+)'
-                            ' +(?P<up_down>[a-zA-Z0-9\:]+)'
-                            ' +(?P<state_pfxrcd>(?P<state>[a-zA-Z\s\(\)]+)?'
-                            '(?P<prx_rcd>\d+)?([\w\(\)\s]+)?)$')
-        p8_1 = re.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+)$')
-        p8_2 = re.compile(r'^\s*(?P<v>[0-9]+) +(?P<as>[0-9]+)'
-                            ' +(?P<msg_rcvd>[0-9]+) +(?P<msg_sent>[0-9]+)'
-                            ' +(?P<tbl_ver>[0-9]+) +(?P<inq>[0-9]+)'
-                            ' +(?P<outq>[0-9]+) +(?P<up_down>[a-zA-Z0-9\:]+)'
-                            ' +(?P<state_pfxrcd>(?P<state>[a-zA-Z\s\(\)]+)?(?P<prx_rcd>\d+)?([\w\(\)\s]+)?)$')
+        p = ShowBgpVrfAllAllSummary.patterns
 
         for line in out.splitlines():
             line = line.rstrip()
@@ -3606,7 +3586,7 @@ class ShowBgpVrfAllAllSummary(ShowBgpVrfAllAllSummarySchema):
             # BGP summary information for VRF VRF1, address family IPv4 Unicast
             # BGP summary information for VRF core_vrf, address family IPv4 Unicast
             # BGP summary information for VRF vrf-9100, address family IPv4 Unicast
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 # Save variables for use later
                 address_family = str(m.groupdict()['address_family']).lower()
@@ -3626,7 +3606,7 @@ class ShowBgpVrfAllAllSummary(ShowBgpVrfAllAllSummarySchema):
                 continue
 
             # BGP router identifier 10.64.4.4, local AS number 100
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 route_identifier = str(m.groupdict()['route_identifier'])
                 local_as = int(m.groupdict()['local_as'])
@@ -3637,7 +3617,7 @@ class ShowBgpVrfAllAllSummary(ShowBgpVrfAllAllSummarySchema):
                 continue
 
             # BGP table version is 40, IPv4 Unicast config peers 1, capable peers 0
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 bgp_table_version = int(m.groupdict()['bgp_table_version'])
                 config_peers = int(m.groupdict()['config_peers'])
@@ -3645,7 +3625,7 @@ class ShowBgpVrfAllAllSummary(ShowBgpVrfAllAllSummarySchema):
                 continue
 
             # 5 network entries and 5 paths using 620 bytes of memory
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 num_prefix_entries = int(m.groupdict()['networks'])
                 memory_usage = int(m.groupdict()['bytes'])
@@ -3653,21 +3633,21 @@ class ShowBgpVrfAllAllSummary(ShowBgpVrfAllAllSummarySchema):
                 continue
 
             # BGP attribute entries [3/384], BGP AS path entries [0/0]
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 attribute_entries = str(m.groupdict()['attribute_entries'])
                 as_path_entries = str(m.groupdict()['as_path_entries'])
                 continue
 
             # BGP community entries [0/0], BGP clusterlist entries [1/4]
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 community_entries = str(m.groupdict()['community_entries'])
                 clusterlist_entries = str(m.groupdict()['clusterlist_entries'])
                 continue
 
             # Dampening configured, 0 history paths, 0 dampened paths
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 dampening = True
                 history_paths = int(m.groupdict()['history_paths'])
@@ -3675,13 +3655,13 @@ class ShowBgpVrfAllAllSummary(ShowBgpVrfAllAllSummarySchema):
                 continue
 
             # 10 received paths for inbound soft reconfiguration
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 soft_reconfig_recvd_paths = int(m.groupdict()['val'])
                 continue
 
             # 10 identical, 0 modified, 0 filtered received paths using 0 bytes
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 soft_reconfig_identical_paths = int(m.groupdict()['val1'])
                 soft_reconfig_combo_paths = int(m.groupdict()['val2'])
@@ -3691,7 +3671,7 @@ class ShowBgpVrfAllAllSummary(ShowBgpVrfAllAllSummarySchema):
 
             # Neighbor        V    AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
             # 10.16.2.10        4     0       0       0        0    0    0     5w6d Idle 
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 # Add neighbor to dictionary
                 neighbor = str(m.groupdict()['neighbor'])
@@ -3760,7 +3740,7 @@ class ShowBgpVrfAllAllSummary(ShowBgpVrfAllAllSummarySchema):
 
             # Neighbor        V    AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
             # 10.16.2.10
-            m = p8_1.match(line)
+            m = p.p8_1.match(line)
             if m:
                 data_on_nextline = True
                 # Add neighbor to dictionary
@@ -3774,7 +3754,7 @@ class ShowBgpVrfAllAllSummary(ShowBgpVrfAllAllSummarySchema):
 
             # Neighbor        V    AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
             #                 4     0       0       0        0    0    0     5w6d Idle 
-            m = p8_2.match(line)
+            m = p.p8_2.match(line)
             if m and data_on_nextline:
                 data_on_nextline = False
                 # Add address family to this neighbor
@@ -3843,308 +3823,112 @@ class ShowBgpVrfAllAllSummary(ShowBgpVrfAllAllSummarySchema):
 
         etree_dict = {}
 
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
         # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                       expect_command=self.cli_command[2].format(vrf=vrf,
-                                                                              address_family=address_family))
-
-        # find Vrf root
-        root = Common.retrieve_xml_child(root=root, key='TABLE_vrf')
-
-        if not root:
-            return etree_dict
+        command = self.cli_command[2].format(vrf=vrf,
+                                             address_family=address_family)
 
-        # -----   loop vrf  -----
-        for vrf_tree in root.findall('{}ROW_vrf'.format(namespace)):
-            # vrf
-            try:
-                vrf = vrf_tree.find('{}vrf-name-out'.format(namespace)).text
-            except Exception:
-                break
-
-            # <vrf-router-id>10.106.0.6</vrf-router-id>
-            try:
-                route_identifier = vrf_tree.find('{}vrf-router-id'.format(namespace)).text
-            except Exception:
-                route_identifier = None
-
-            # <vrf-local-as>333</vrf-local-as>
-            try:
-                local_as = vrf_tree.find('{}vrf-local-as'.format(namespace)).text
-            except Exception:
-                local_as = None
-
-            # Address family table
-            af_tree = vrf_tree.find('{}TABLE_af'.format(namespace))
-            if not af_tree:
+        # -----   loop neighbors  -----
+        for name, record, parents in iter_xml_rows(out, self.xml_rows,
+                                                   command=command):
+            if name != 'neighbor':
                 continue
-            for af_root in af_tree.findall('{}ROW_af'.format(namespace)):
-                # Address family table
-                saf_tree = af_root.find('{}TABLE_saf'.format(namespace))
-                if not saf_tree:
-                    continue
-                # -----   loop address_family  -----
-                for saf_root in saf_tree.findall('{}ROW_saf'.format(namespace)):
-                    # neighbor
-                    try:
-                        af = saf_root.find('{}af-name'.format(namespace)).text
-                        af = af.lower()
-                        # initial af dictionary
-                        af_dict = {}
-                        if route_identifier:
-                            af_dict['route_identifier'] = route_identifier
-                        if local_as:
-                            af_dict['local_as'] = int(local_as)
-                    except Exception:
-                        continue
-
-                    # <tableversion>7</tableversion>
-                    try:
-                        af_dict['bgp_table_version'] = int(
-                            saf_root.find('{}tableversion'.format(namespace)).text)
-                    except Exception:
-                        # for valide entry, table version should be there
-                        continue
-
-                    # <configuredpeers>3</configuredpeers>
-                    af_dict['config_peers'] = \
-                        int(saf_root.find('{}configuredpeers'.format(namespace)).text)
-                        
-                    # <capablepeers>2</capablepeers>
-                    af_dict['capable_peers'] = \
-                        int(saf_root.find('{}capablepeers'.format(namespace)).text)
-
-                    # <totalnetworks>5</totalnetworks>
-                    try:
-                        total_prefix_entries = \
-                            int(saf_root.find('{}totalnetworks'.format(namespace)).text)
-                        if 'prefixes' not in af_dict:
-                            af_dict['prefixes'] = {}
-                        af_dict['prefixes']['total_entries'] = total_prefix_entries
-                    except Exception:
-                        pass
-                        
-                    # <totalpaths>10</totalpaths>
-                    try:
-                        total_path_entries = \
-                            int(saf_root.find('{}totalpaths'.format(namespace)).text)
-                        if 'path' not in af_dict:
-                            af_dict['path'] = {}
-                        af_dict['path']['total_entries'] = total_path_entries
-                    except Exception:
-                        pass
-                        
-                    # <memoryused>1820</memoryused>
-                    try:
-                        memory_usage = \
-                            int(saf_root.find('{}memoryused'.format(namespace)).text)
-                        af_dict['path']['memory_usage'] = memory_usage
-                        af_dict['prefixes']['memory_usage'] = memory_usage
-                    except Exception:
-                        pass
-
-                    try:
-                        # <numberattrs>1</numberattrs>
-                        entries_1 = \
-                            saf_root.find('{}numberattrs'.format(namespace)).text
-                            
-                        # <bytesattrs>160</bytesattrs>
-                        entries_2 = \
-                            saf_root.find('{}bytesattrs'.format(namespace)).text
-
-                        af_dict['attribute_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
-                    except Exception:
-                        pass
-                        
-                    try:
-                        # <numberpaths>1</numberpaths>
-                        entries_1 = \
-                            saf_root.find('{}numberpaths'.format(namespace)).text
-
-                        # <bytespaths>34</bytespaths>
-                        entries_2 = \
-                            saf_root.find('{}bytespaths'.format(namespace)).text
-
-                        af_dict['as_path_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
-                    except Exception:
-                        pass
-                        
-                    try:
-                        # <numbercommunities>0</numbercommunities>
-                        entries_1 = \
-                            saf_root.find('{}numbercommunities'.format(namespace)).text
-
-                        # <bytescommunities>0</bytescommunities>
-                        entries_2 = \
-                            saf_root.find('{}bytescommunities'.format(namespace)).text
-
-                        af_dict['community_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
-                    except Exception:
-                        pass
-                        
-                    try:
-                        # <numberclusterlist>0</numberclusterlist>
-                        entries_1 = \
-                            saf_root.find('{}numberclusterlist'.format(namespace)).text
-
-                        # <bytesclusterlist>0</bytesclusterlist>
-                        entries_2 = \
-                            saf_root.find('{}bytesclusterlist'.format(namespace)).text
-
-                        af_dict['clusterlist_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
-                    except Exception:
-                        pass
-
-                    # <dampening>Enabled</dampening>
-                    dampening = saf_root.find('{}dampening'.format(namespace)).text.lower()
-                    if 'enabled' in dampening or 'true' in dampening:
-                        af_dict['dampening'] = True
-
-                    # <historypaths>0</historypaths>
-                    try:
-                        af_dict['history_paths'] = int(saf_root.find('{}historypaths'.format(namespace)).text)
-                    except Exception:
-                        pass
-
-                    # <dampenedpaths>0</dampenedpaths>
-                    try:
-                        af_dict['dampened_paths'] = int(saf_root.find('{}dampenedpaths'.format(namespace)).text)
-                    except Exception:
-                        pass
-
-                    # <softreconfigrecvdpaths>10</softreconfigrecvdpaths>
-                    try:
-                        af_dict['soft_reconfig_recvd_paths'] = int(
-                                saf_root.find('{}softreconfigrecvdpaths'.format(namespace)).text)
-                    except Exception:
-                        pass
-                        
-                    # <softreconfigidenticalpaths>10</softreconfigidenticalpaths>
-                    try:
-                        af_dict['soft_reconfig_identical_paths'] = int(
-                                saf_root.find('{}softreconfigidenticalpaths'.format(namespace)).text)
-                    except Exception:
-                        pass
+            vrf_record, saf_record = parents
 
-                    # <softreconfigcombopaths>0</softreconfigcombopaths>
-                    try:
-                        af_dict['soft_reconfig_combo_paths'] = int(
-                                saf_root.find('{}softreconfigcombopaths'.format(namespace)).text)
-                    except Exception:
-                        pass
-
-                    # <softreconfigfilteredrecvd>0</softreconfigfilteredrecvd>
-                    try:
-                        af_dict['soft_reconfig_filtered_recvd'] = int(
-                                saf_root.find('{}softreconfigfilteredrecvd'.format(namespace)).text)
-                    except Exception:
-                        pass
-                        
-                    # <softreconfigbytes>0</softreconfigbytes>
-                    try:
-                        af_dict['soft_reconfig_bytes'] = int(
-                                saf_root.find('{}softreconfigbytes'.format(namespace)).text)
-                    except Exception:
-                        pass
-                        
-                     # Neighbor table
-                    nei_tree = saf_root.find('{}TABLE_neighbor'.format(namespace))
-                    if not nei_tree:
-                        continue
-
-                    # -----   loop neighbors  -----
-                    for nei_root in nei_tree.findall('{}ROW_neighbor'.format(namespace)):
-                        # neighbor
-                        try:
-                            nei = nei_root.find('{}neighborid'.format(namespace)).text
-                        except Exception:
-                            continue
-
-                        if 'vrf' not in etree_dict:
-                            etree_dict['vrf'] = {}
-                        if vrf not in etree_dict['vrf']:
-                            etree_dict['vrf'][vrf] = {}
+            # for valide entry, table version should be there
+            if vrf_record.get('vrf') is None or \
+               saf_record.get('address_family') is None or \
+               saf_record.get('bgp_table_version') is None:
+                continue
 
-                        if 'neighbor' not in etree_dict['vrf'][vrf]:
-                            etree_dict['vrf'][vrf]['neighbor'] = {}
-                        if nei not in etree_dict['vrf'][vrf]['neighbor']:
-                            etree_dict['vrf'][vrf]['neighbor'][nei] = {}
+            # neighbor
+            nei = record.pop('neighbor', None)
+            if nei is None:
+                continue
 
-                        if 'address_family' not in etree_dict['vrf'][vrf]['neighbor'][nei]:
-                            etree_dict['vrf'][vrf]['neighbor'][nei]['address_family'] = {}
+            sub_dict = etree_dict.setdefault('vrf', {})\
+                                 .setdefault(vrf_record['vrf'], {})\
+                                 .setdefault('neighbor', {})\
+                                 .setdefault(nei, {})\
+                                 .setdefault('address_family', {})\
+                                 .setdefault(saf_record['address_family'], {})
 
-                        if af not in etree_dict['vrf'][vrf]['neighbor'][nei]['address_family']:
-                            etree_dict['vrf'][vrf]['neighbor'][nei]['address_family'][af] = {}
-                    
-                        sub_dict = etree_dict['vrf'][vrf]['neighbor'][nei]['address_family'][af]
+            #  ---   AF attributes -------
+            sub_dict.update(self._xml_af_attributes(vrf_record, saf_record))
 
-                        #  ---   AF attributes -------
-                        update_dict = deepcopy(af_dict)
-                        sub_dict.update(update_dict)
+            #  ---   Neighbors attributes -------
+            prefix_received = record.pop('prefix_received')
+            sub_dict.update(record)
+            if 'established' in record['state']:
+                sub_dict['prefix_received'] = prefix_received
+                sub_dict['state_pfxrcd'] = prefix_received
+            else:
+                sub_dict['state_pfxrcd'] = record['state']
 
-                        #  ---   Neighbors attributes -------
-                        # <neighborversion>4</neighborversion>
-                        sub_dict['neighbor_table_version'] = int(
-                            nei_root.find('{}neighborversion'.format(namespace)).text)
+        return etree_dict
 
-                        # <msgrecvd>5471</msgrecvd>
-                        sub_dict['msg_rcvd'] = int(
-                            nei_root.find('{}msgrecvd'.format(namespace)).text)
-                        
-                        # <msgsent>5459</msgsent>
-                        sub_dict['msg_sent'] = int(
-                            nei_root.find('{}msgsent'.format(namespace)).text)
-                        
-                        # <neighbortableversion>7</neighbortableversion>
-                        sub_dict['tbl_ver'] = int(
-                            nei_root.find('{}neighbortableversion'.format(namespace)).text)
-                        
-                        # <inq>0</inq>
-                        sub_dict['inq'] = int(
-                            nei_root.find('{}inq'.format(namespace)).text)
-                        
-                        # <outq>0</outq>
-                        sub_dict['outq'] = int(
-                            nei_root.find('{}outq'.format(namespace)).text)
-                        
-                        # <neighboras>333</neighboras>
-                        sub_dict['as'] = int(
-                            nei_root.find('{}neighboras'.format(namespace)).text)
-                        
-                        # <time>3d18h</time>
-                        sub_dict['up_down'] = \
-                            nei_root.find('{}time'.format(namespace)).text
-                        
-                        # <state>Established</state>
-                        state = nei_root.find('{}state'.format(namespace)).text.lower()
+    @staticmethod
+    def _xml_af_attributes(vrf_record, saf_record):
+        af_dict = {}
 
-                        # <prefixreceived>5</prefixreceived>
-                        prefix_received = \
-                            nei_root.find('{}prefixreceived'.format(namespace)).text
-
-                        if 'established' in state:
-                            sub_dict['state'] = state
-                            sub_dict['prefix_received'] = prefix_received
-                            sub_dict['state_pfxrcd'] = prefix_received
-                        else:
-                            sub_dict['state'] = state
-                            sub_dict['state_pfxrcd'] = state
-                
-        return etree_dict
+        # <vrf-router-id>10.106.0.6</vrf-router-id>
+        # <vrf-local-as>333</vrf-local-as>
+        for key in ('route_identifier', 'local_as'):
+            if vrf_record.get(key) is not None:
+                af_dict[key] = vrf_record[key]
+
+        # <tableversion>7</tableversion>
+        # <configuredpeers>3</configuredpeers>
+        # <capablepeers>2</capablepeers>
+        for key in ('bgp_table_version', 'config_peers', 'capable_peers'):
+            af_dict[key] = saf_record[key]
+
+        # <totalnetworks>5</totalnetworks>
+        if saf_record.get('total_prefix_entries') is not None:
+            af_dict['prefixes'] = {
+                'total_entries': saf_record['total_prefix_entries']}
+
+        # <totalpaths>10</totalpaths>
+        if saf_record.get('total_path_entries') is not None:
+            af_dict['path'] = {
+                'total_entries': saf_record['total_path_entries']}
+
+        # <memoryused>1820</memoryused>
+        if saf_record.get('memory_usage') is not None and \
+           'prefixes' in af_dict and 'path' in af_dict:
+            af_dict['path']['memory_usage'] = saf_record['memory_usage']
+            af_dict['prefixes']['memory_usage'] = saf_record['memory_usage']
+
+        # <numberattrs>1</numberattrs>
+        # <bytesattrs>160</bytesattrs>
+        for key, entries, size in (
+                ('attribute_entries', 'numberattrs', 'bytesattrs'),
+                ('as_path_entries', 'numberpaths', 'bytespaths'),
+                ('community_entries', 'numbercommunities',
+                 'bytescommunities'),
+                ('clusterlist_entries', 'numberclusterlist',
+                 'bytesclusterlist')):
+            if saf_record.get(entries) is not None and \
+               saf_record.get(size) is not None:
+                af_dict[key] = '[{0}/{1}]'.format(saf_record[entries],
+                                                  saf_record[size])
+
+        # <dampening>Enabled</dampening>
+        dampening = saf_record['dampening']
+        if 'enabled' in dampening or 'true' in dampening:
+            af_dict['dampening'] = True
+
+        # <historypaths>0</historypaths>
+        # <softreconfigrecvdpaths>10</softreconfigrecvdpaths>
+        for key in ('history_paths', 'dampened_paths',
+                    'soft_reconfig_recvd_paths',
+                    'soft_reconfig_identical_paths',
+                    'soft_reconfig_combo_paths',
+                    'soft_reconfig_filtered_recvd',
+                    'soft_reconfig_bytes'):
+            if saf_record.get(key) is not None:
+                af_dict[key] = saf_record[key]
+
+        return af_dict
 
 
 # ==================================================
@@ -4193,6 +3977,57 @@ class ShowBgpVrfAllAllDampeningParameters(ShowBgpVrfAllAllDampeningParametersSch
                    'show bgp vrf {vrf} {address_family} dampening parameters']
     xml_command = 'show bgp vrf {vrf} all dampening parameters | xml'
 
+    patterns = Patterns(
+        p1=r'^Route +(?P<route>\w+) +Dampening +Parameters '
+           '+for +VRF +(?P<vrf>\w+) +Address +family '
+           '+(?P<af_name>[a-zA-Z0-9 ]+):$',
+        p9=r'^Route +Distinguisher: +(?P<rd>[0-9\.:]+) +'
+           '\(VRF +(?P<rd_vrf>\w+)\)$',
+        p10=r'^Route +Distinguisher: +(?P<rd>[0-9\.:]+) +'
+            '\((?P<rd_vrf>\w+)( *VNI +(?P<vni>\w+))\)',
+        p2=r'^Dampening +policy +configured: '
+           '+(?P<route_map>\w+)$',
+        p3=r'^Half-life +time +: +'
+           '(?P<half_time>\d+)( *(?P<unit>\w+))?$',
+        p4=r'^Suppress +penalty +: +'
+           '(?P<suppress_pen>\d+)( *(?P<unit>\w+))?$',
+        p5=r'^Reuse +penalty +: +'
+           '(?P<reuse_pen>\d+)( *(?P<unit>\w+))?$',
+        p6=r'^Max +suppress +time +: +'
+           '(?P<max_sup_time>\d+)( *(?P<unit>\w+))?$',
+        p7=r'^Max +suppress +penalty +: '
+           '+(?P<max_sup_pen>\d+)( *(?P<unit>\w+))?$',
+    )
+
+    # Rows of the xml output, see utils.xml_stream
+    xml_rows = XmlRow('vrf', '**/TABLE_vrf/ROW_vrf', {
+        'vrf-name-out': 'vrf',
+    }, rows=[
+        XmlRow('address_family', 'TABLE_afi/ROW_afi/TABLE_safi/ROW_safi', {
+            'af-name': ('address_family', str.lower),
+        }, rows=[
+            XmlRow('rd', 'TABLE_rd/ROW_rd', {
+                'rd_val': 'rd',
+                'rpmname': 'dampening_route_map',
+                'rd_vrf': 'rd_vrf',
+                'rd_vniid': 'rd_vni_id',
+                'damphalflife': 'dampening_half_life_time',
+                'dampsuppress': 'dampening_suppress_time',
+                'dampreuse': 'dampening_reuse_time',
+                'dampsuppresstime': 'dampening_max_suppress_time',
+                'dampmaxpenalty': 'dampening_max_suppress_penalty',
+            }, rows=[
+                XmlRow('rpm', 'TABLE_rpm/ROW_rpm', {
+                    'rpmdamphalflife': 'dampening_half_life_time',
+                    'rpmdampsuppress': 'dampening_suppress_time',
+                    'rpmdampreuse': 'dampening_reuse_time',
+                    'rpmdampsuppresstime': 'dampening_max_suppress_time',
+                    'rpmdampmaxpenalty': 'dampening_max_suppress_penalty',
+                }),
+            ]),
+        ]),
+    ])
+
     def cli(self, vrf='all', address_family='all', output=None):
         if output is None:
             if address_family == 'all':
@@ -4204,29 +4039,11 @@ class ShowBgpVrfAllAllDampeningParameters(ShowBgpVrfAllAllDampeningParametersSch
 
         bgp_dict = {}
         sub_dict = {}
-        p1 = re.compile(r'^Route +(?P<route>\w+) +Dampening +Parameters '
-                            '+for +VRF +(?P<vrf>\w+) +Address +family '
-                            '+(?P<af_name>[a-zA-Z0-9 ]+):$')
-        p9 = re.compile(r'^Route +Distinguisher: +(?P<rd>[0-9\.:]+) +'
-                        '\(VRF +(?P<rd_vrf>\w+)\)$')
-        p10 = re.compile(r'^Route +Distinguisher: +(?P<rd>[0-9\.:]+) +'
-                            '\((?P<rd_vrf>\w+)( *VNI +(?P<vni>\w+))\)')
-        p2 = re.compile(r'^Dampening +policy +configured: '
-                            '+(?P<route_map>\w+)$')
-        p3 = re.compile(r'^Half-life +time +: +'
-                            '(?P<half_time>\d+)( *(?P<unit>\w+))?$')
-        p4 = re.compile(r'^Suppress +penalty +: +'
-                            '(?P<suppress_pen>\d+)( *(?P<unit>\w+))?$')
-        p5 = re.compile(r'^Reuse +penalty +: +'
-                            '(?P<reuse_pen>\d+)( *(?P<unit>\w+))?$')
-        p6 = re.compile(r'^Max +suppress +time +: +'
-                            '(?P<max_sup_time>\d+)( *(?P<unit>\w+))?$')
-        p7 = re.compile(r'^Max +suppress +penalty +: '
-                            '+(?P<max_sup_pen>\d+)( *(?P<unit>\w+))?$')
+        p = ShowBgpVrfAllAllDampeningParameters.patterns
 
         for line in out.splitlines():
             line = line.strip()
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 if 'vrf' not in bgp_dict:
                     bgp_dict['vrf'] = {}
@@ -4244,7 +4061,7 @@ class ShowBgpVrfAllAllDampeningParameters(ShowBgpVrfAllAllDampeningParametersSch
                     sub_dict['dampening'] = 'True'
                 continue
 
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 if 'route_distinguisher' not in \
                   bgp_dict['vrf'][vrf]['address_family'][af_name]:
@@ -4263,7 +4080,7 @@ class ShowBgpVrfAllAllDampeningParameters(ShowBgpVrfAllAllDampeningParametersSch
 
             # Route Distinguisher: 500:1    (L3VNI 2)
             # rd_vrf = L3, vni = 2
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 if 'route_distinguisher' not in \
                   bgp_dict['vrf'][vrf]['address_family'][af_name]:
@@ -4284,36 +4101,36 @@ class ShowBgpVrfAllAllDampeningParameters(ShowBgpVrfAllAllDampeningParametersSch
                 continue
 
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 sub_dict['dampening_route_map'] = m.groupdict()['route_map']
                 continue
 
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 sub_dict['dampening_half_life_time'] =\
                    m.groupdict()['half_time']
                 continue
 
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 sub_dict['dampening_suppress_time'] =\
                   m.groupdict()['suppress_pen']
                 continue
 
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 sub_dict['dampening_reuse_time'] =\
                   m.groupdict()['reuse_pen']
                 continue
 
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 sub_dict['dampening_max_suppress_time'] =\
                   m.groupdict()['max_sup_time']
                 continue
 
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 sub_dict['dampening_max_suppress_penalty'] =\
                   m.groupdict()['max_sup_pen']
@@ -4324,201 +4141,42 @@ class ShowBgpVrfAllAllDampeningParameters(ShowBgpVrfAllAllDampeningParametersSch
         out = self.device.execute(self.xml_command.format(vrf=vrf))
         etree_dict = {}
 
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
         # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                       expect_command=self.cli_command[1].format(vrf=vrf,
-                                                                              address_family=address_family))
-
-        root = Common.retrieve_xml_child(
-                root=root,
-                key='TABLE_vrf')
-
-        if not root:
-            return etree_dict
-
-        # -----   loop vrf  -----
-        for vrf_tree in root.findall('{}ROW_vrf'.format(namespace)):
-            # vrf
-            try:
-                vrf = vrf_tree.find('{}vrf-name-out'.format(namespace)).text
-            except Exception:
-                break
+        command = self.cli_command[1].format(vrf=vrf,
+                                             address_family=address_family)
 
-            # Address family table
-            af_tree = vrf_tree.find('{}TABLE_afi'.format(namespace))
-            if not af_tree:
+        for name, record, parents in iter_xml_rows(out, self.xml_rows,
+                                                   command=command):
+            # ROW_rpm, its values replace the ones of the rd
+            if name == 'rpm':
+                parents[-1].update(record)
+                continue
+            if name != 'rd':
                 continue
-            for af_root in af_tree.findall('{}ROW_afi'.format(namespace)):
-                # Address family table
-                saf_tree = af_root.find('{}TABLE_safi'.format(namespace))
-                if not saf_tree:
-                    continue
-                # -----   loop address_family  -----
-                for saf_root in saf_tree.findall('{}ROW_safi'.format(namespace)):
-                    # neighbor
-                    try:
-                        af = saf_root.find('{}af-name'.format(namespace)).text
-                        af = af.lower()
-                    except Exception:
-                        continue
-
-                     # RD table
-                    rd_tree = saf_root.find('{}TABLE_rd'.format(namespace))
-                    if not rd_tree:
-                        continue
-
-                    # -----   loop rd  -----
-                    for rd_root in rd_tree.findall('{}ROW_rd'.format(namespace)):
-
-                        # neighbor
-                        try:
-                            rd = rd_root.find('{}rd_val'.format(namespace)).text
-                        except Exception:
-                            rd = None
-
-                        if 'vrf' not in etree_dict:
-                            etree_dict['vrf'] = {}
-                        if vrf not in etree_dict['vrf']:
-                            etree_dict['vrf'][vrf] = {}
-
-                        if 'address_family' not in etree_dict['vrf'][vrf]:
-                            etree_dict['vrf'][vrf]['address_family'] = {}
-
-                        if af not in etree_dict['vrf'][vrf]['address_family']:
-                            etree_dict['vrf'][vrf]['address_family'][af] = {}
-
-                        # dampening
-                        etree_dict['vrf'][vrf]['address_family'][af]['dampening'] = 'True'
-
-                        if rd:
-                            if 'route_distinguisher' not in etree_dict['vrf'][vrf]:
-                                etree_dict['vrf'][vrf]['address_family'][af]\
-                                    ['route_distinguisher'] = {}
-
-                            if rd not in etree_dict['vrf'][vrf]['address_family']:
-                                etree_dict['vrf'][vrf]['address_family'][af]\
-                                    ['route_distinguisher'][rd] = {}
-                            sub_dict = etree_dict['vrf'][vrf]['address_family'][af]\
-                                    ['route_distinguisher'][rd]
-                        else:
-                            sub_dict = etree_dict['vrf'][vrf]['address_family'][af]
-                                    
-
-                        # <dampconfigured>Configured</dampconfigured>
-                        # cli does not have this key
-
-                        # <rpmname>test</rpmname>
-                        try:
-                            sub_dict['dampening_route_map'] = \
-                                rd_root.find('{}rpmname'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # <rd_vrf>vpn2</rd_vrf>
-                        try:
-                            sub_dict['rd_vrf'] = \
-                                rd_root.find('{}rd_vrf'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # <rd_vniid>2</rd_vniid>
-                        try:
-                            sub_dict['rd_vni_id'] = \
-                                rd_root.find('{}rd_vniid'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # <damphalflife>1</damphalflife>
-                        try:
-                            sub_dict['dampening_half_life_time'] = \
-                                rd_root.find('{}damphalflife'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # <dampsuppress>30</dampsuppress>
-                        try:
-                            sub_dict['dampening_suppress_time'] = \
-                                rd_root.find('{}dampsuppress'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # <dampreuse>10</dampreuse>
-                        try:
-                            sub_dict['dampening_reuse_time'] = \
-                                rd_root.find('{}dampreuse'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # <dampsuppresstime>2</dampsuppresstime>
-                        try:
-                            sub_dict['dampening_max_suppress_time'] = \
-                                rd_root.find('{}dampsuppresstime'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # <dampmaxpenalty>40</dampmaxpenalty>
-                        try:
-                            sub_dict['dampening_max_suppress_penalty'] = \
-                                rd_root.find('{}dampmaxpenalty'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # TABLE_rpm
-                        rpm_tree = rd_root.find('{}TABLE_rpm'.format(namespace))
-                        if not rpm_tree:
-                            continue
-
-                        # ROW_rpm
-                        for rpm_root in rpm_tree.findall('{}ROW_rpm'.format(namespace)):
-
-                            # <rpmdamphalflife>1</rpmdamphalflife>
-                            try:
-                                sub_dict['dampening_half_life_time'] = \
-                                    rpm_root.find('{}rpmdamphalflife'.format(namespace)).text
-                            except Exception:
-                                pass
 
-                            # <rpmdampsuppress>30</rpmdampsuppress>
-                            try:
-                                sub_dict['dampening_suppress_time'] = \
-                                    rpm_root.find('{}rpmdampsuppress'.format(namespace)).text
-                            except Exception:
-                                pass
+            # -----   loop rd  -----
+            vrf_record, saf_record = parents
+            if vrf_record.get('vrf') is None or \
+               saf_record.get('address_family') is None:
+                continue
 
-                            # <rpmdampreuse>10</rpmdampreuse>
-                            try:
-                                sub_dict['dampening_reuse_time'] = \
-                                    rpm_root.find('{}rpmdampreuse'.format(namespace)).text
-                            except Exception:
-                                pass
+            af_dict = etree_dict.setdefault('vrf', {})\
+                                .setdefault(vrf_record['vrf'], {})\
+                                .setdefault('address_family', {})\
+                                .setdefault(saf_record['address_family'], {})
 
-                            # <rpmdampsuppresstime>2</rpmdampsuppresstime>
-                            try:
-                                sub_dict['dampening_max_suppress_time'] = \
-                                    rpm_root.find('{}rpmdampsuppresstime'.format(namespace)).text
-                            except Exception:
-                                pass
+            # dampening
+            af_dict['dampening'] = 'True'
 
-                            # <rpmdampmaxpenalty>40</rpmdampmaxpenalty>
-                            try:
-                                sub_dict['dampening_max_suppress_penalty'] = \
-                                    rpm_root.find('{}rpmdampmaxpenalty'.format(namespace)).text
-                            except Exception:
-                                pass
+            # <dampconfigured>Configured</dampconfigured>
+            # cli does not have this key
+            rd = record.pop('rd', None)
+            if rd:
+                sub_dict = af_dict.setdefault('route_distinguisher', {})\
+                                  .setdefault(rd, {})
+            else:
+                sub_dict = af_dict
+            sub_dict.update(record)
 
         return etree_dict
 
@@ -4575,6 +4233,68 @@ class ShowBgpVrfAllNeighborsAdvertisedRoutes(ShowBgpVrfAllNeighborsAdvertisedRou
     cli_command = ['show bgp vrf {vrf} all neighbors {neighbor} advertised-routes',
                    'show bgp vrf {vrf} {address_family} neighbors {neighbor} advertised-routes']
 
+    patterns = Patterns(
+        p1=r'^\s*Peer +(?P<neighbor_id>(\S+)) +routes +for'
+           r' +address +family'
+           r' +(?P<address_family>[a-zA-Z0-9\s\-\_]+) *:$',
+        p2=r'^\s*BGP +table +version +is'
+           r' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
+           r' +ID +is +(?P<local_router_id>(\S+))$',
+        p3=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+           r'(?P<path_type>(i|e|c|l|a|r|I))?'
+           r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+           r'(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$',
+        p4=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+           r'(?P<path_type>(i|e|c|l|a|r|I))?'
+           r' *(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+           r'(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
+           r' +(?P<origin_codes>(i|e|\?|\|))$',
+        p5=r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+           r'(?P<path_type>(i|e|c|l|a|r|I))?'
+           r'( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+           r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+           r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$',
+        p6=r'^(?P<metric>[0-9]+)'
+           r'(?P<space1>\s{5,10})'
+           r'(?P<localprf>[0-9]+)'
+           r'(?P<space2>\s{5,10})'
+           r'(?P<weight>[0-9]+)'
+           r'(?: *(?P<path>[0-9\{\}\s]+))?$',
+        p7=r'^(?P<value>[0-9]+)'
+           r'(?P<space>\s{2,21})'
+           r'(?P<weight>[0-9]+)'
+           r'(?: *(?P<path>[0-9\{\}\s]+))?$',
+        p8=r'^(?P<weight>[0-9]+)'
+           r' +(?P<path>[0-9\{\}\s]+)$',
+        p9=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
+           r'(?P<path_type>(i|e|c|l|a|r|I))'
+           r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+           r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+           r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
+           r' +(?P<origin_codes>(i|e|\?|\&|\|))$',
+        p10=r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+            r'(?P<path_type>(i|e|c|l|a|r|I))?'
+            r'( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+            r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+            r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+            r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$',
+        p11=r'^(?P<metric>[0-9]+)'
+            r'(?P<space1>\s{5,10})'
+            r'(?P<localprf>[0-9]+)'
+            r'(?P<space2>\s{5,10})'
+            r'(?P<weight>[0-9]+)'
+            r'(?: *(?P<path>[0-9\{\}\s]+))?$',
+        p12=r'^(?P<value>[0-9]+)'
+            r'(?P<space>\s{2,21})'
+            r'(?P<weight>[0-9]+)'
+            r'(?: *(?P<path>[0-9\{\}\s]+))?$',
+        p13=r'^(?P<weight>[0-9]+)'
+            r' +(?P<path>[0-9\{\}\s]+)$',
+        p14=r'^\s*Route +Distinguisher *: +(?P<route_distinguisher>'
+            r'(\S+))(?: +\((?:VRF +(?P<default_vrf>\w+)|L2VNI +'
+            r'(?P<rd_l2vni>\d+)|L3VNI +(?P<rd_l3vni>\d+))\))?$',
+    )
+
     def cli(self, neighbor, vrf='all', address_family='all', output=None):
         if vrf == 'all':
             vrf = 'default'
@@ -4594,65 +4314,7 @@ class ShowBgpVrfAllNeighborsAdvertisedRoutes(ShowBgpVrfAllNeighborsAdvertisedRou
         # Init dictionary
         route_dict = {}
 
-        p1 = re.compile(r'^\s*Peer +(?P<neighbor_id>(\S+)) +routes +for'
-                        r' +address +family'
-                        r' +(?P<address_family>[a-zA-Z0-9\s\-\_]+) *:$')
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                        r' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
-                        r' +ID +is +(?P<local_router_id>(\S+))$')
-        p3 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                            r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            r'(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
-        p4 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                            r' *(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            r'(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
-                            r' +(?P<origin_codes>(i|e|\?|\|))$')
-        p5 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                            r'( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                            r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
-        p6 = re.compile(r'^(?P<metric>[0-9]+)'
-                        r'(?P<space1>\s{5,10})'
-                        r'(?P<localprf>[0-9]+)'
-                        r'(?P<space2>\s{5,10})'
-                        r'(?P<weight>[0-9]+)'
-                        r'(?: *(?P<path>[0-9\{\}\s]+))?$')
-        p7 = re.compile(r'^(?P<value>[0-9]+)'
-                        r'(?P<space>\s{2,21})'
-                        r'(?P<weight>[0-9]+)'
-                        r'(?: *(?P<path>[0-9\{\}\s]+))?$')
-        p8 = re.compile(r'^(?P<weight>[0-9]+)'
-                            r' +(?P<path>[0-9\{\}\s]+)$')
-        p9 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))'
-                            r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
-                            r' +(?P<origin_codes>(i|e|\?|\&|\|))$')
-        p10 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                            r'( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                            r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
-        p11 = re.compile(r'^(?P<metric>[0-9]+)'
-                        r'(?P<space1>\s{5,10})'
-                        r'(?P<localprf>[0-9]+)'
-                        r'(?P<space2>\s{5,10})'
-                        r'(?P<weight>[0-9]+)'
-                        r'(?: *(?P<path>[0-9\{\}\s]+))?$')
-        p12 = re.compile(r'^(?P<value>[0-9]+)'
-                        r'(?P<space>\s{2,21})'
-                        r'(?P<weight>[0-9]+)'
-                        r'(?: *(?P<path>[0-9\{\}\s]+))?$')
-        p13 = re.compile(r'^(?P<weight>[0-9]+)'
-                        r' +(?P<path>[0-9\{\}\s]+)$')
-        p14 = re.compile(r'^\s*Route +Distinguisher *: +(?P<route_distinguisher>'
-                        r'(\S+))(?: +\((?:VRF +(?P<default_vrf>\w+)|L2VNI +'
-                        r'(?P<rd_l2vni>\d+)|L3VNI +(?P<rd_l3vni>\d+))\))?$')
+        p = ShowBgpVrfAllNeighborsAdvertisedRoutes.patterns
         # Init vars
         data_on_nextline =  False
         index = 1
@@ -4714,7 +4376,7 @@ class ShowBgpVrfAllNeighborsAdvertisedRoutes(ShowBgpVrfAllNeighborsAdvertisedRou
             line = line.rstrip()
 
             # Peer 10.186.0.2 routes for address family IPv4 Unicast:
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 neighbor_id = m.groupdict()['neighbor_id']
                 address_family = m.groupdict()['address_family'].lower()
@@ -4722,7 +4384,7 @@ class ShowBgpVrfAllNeighborsAdvertisedRoutes(ShowBgpVrfAllNeighborsAdvertisedRou
                 continue
 
             # BGP table version is 25, Local Router ID is 10.186.101.1
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 bgp_table_version = int(m.groupdict()['bgp_table_version'])
                 local_router_id = str(m.groupdict()['local_router_id'])
@@ -4744,7 +4406,7 @@ class ShowBgpVrfAllNeighborsAdvertisedRoutes(ShowBgpVrfAllNeighborsAdvertisedRou
 
             # *>i[2]:[77][7,0][10.69.9.9,1,151587081][10.135.1.1,22][10.106.101.1,10.76.1.30]/616
             # *>i2001:db8:aaaa:1::/113       ::ffff:10.106.101.1
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 # New prefix, reset index count
                 index = 1
@@ -4771,10 +4433,10 @@ class ShowBgpVrfAllNeighborsAdvertisedRoutes(ShowBgpVrfAllNeighborsAdvertisedRou
 
             #                     0.0.0.0               100      32768 i
             #                     10.106.101.1            4444       100 0 3 10 20 30 40 50 60 70 80 90 i
-            m = p4.match(line)
+            m = p.p4.match(line)
             # * e                   10.70.2.2                                      0 100 300 ?
             # *>e                   10.70.1.2                                      0 100 300 ?
-            m1 = p5.match(line)
+            m1 = p.p5.match(line)
 
             m = m if m else m1
             if m:
@@ -4804,7 +4466,7 @@ class ShowBgpVrfAllNeighborsAdvertisedRoutes(ShowBgpVrfAllNeighborsAdvertisedRou
 
                 # Metric     LocPrf     Weight Path
                 #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m = p6.match(numbers)
+                m = p.p6.match(numbers)
                 if m:
                     index_dict.update({'metric': int(m.groupdict()['metric'])})
                     index_dict.update({'locprf': int(m.groupdict()['localprf'])})
@@ -4820,7 +4482,7 @@ class ShowBgpVrfAllNeighborsAdvertisedRoutes(ShowBgpVrfAllNeighborsAdvertisedRou
                 #    ---        100          0 10 20 30 40 50 60 70 80 90
                 #    100        ---      32788 ---
                 #    ---        100      32788 --- 
-                m = p7.match(numbers)
+                m = p.p7.match(numbers)
                 if m:
                     index_dict.update({'weight': int(m.groupdict()['weight'])})
 
@@ -4837,7 +4499,7 @@ class ShowBgpVrfAllNeighborsAdvertisedRoutes(ShowBgpVrfAllNeighborsAdvertisedRou
                     continue
 
                 #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m = p8.match(numbers)
+                m = p.p8.match(numbers)
                 if m:
                     index_dict.update({'weight': int(m.groupdict()['weight'])})
                     index_dict.update({'path': m.groupdict()['path'].strip()})
@@ -4849,9 +4511,9 @@ class ShowBgpVrfAllNeighborsAdvertisedRoutes(ShowBgpVrfAllNeighborsAdvertisedRou
             # *>r10.16.2.0/24         0.0.0.0               4444        100      32768 ?
             # *>i10.49.0.0/16         10.106.101.1                        100          0 10 20 30 40 50 60 70 80 90 i
             # *>i10.4.2.0/24         10.106.102.4                        100          0 {62112 33492 4872 41787 13166 50081 21461 58376 29755 1135} i
-            m = p9.match(line)
+            m = p.p9.match(line)
             # *&i10.145.1.0/24        192.168.151.2                0        100          0 ?
-            m1 = p10.match(line)
+            m1 = p.p10.match(line)
             
             m = m if m else m1
             if m:
@@ -4881,7 +4543,7 @@ class ShowBgpVrfAllNeighborsAdvertisedRoutes(ShowBgpVrfAllNeighborsAdvertisedRou
 
                 # Metric     LocPrf     Weight Path
                 #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m = p11.match(numbers)
+                m = p.p11.match(numbers)
                 if m:
                     index_dict.update({'metric': int(m.groupdict()['metric'])})
                     index_dict.update({'locprf': int(m.groupdict()['localprf'])})
@@ -4897,7 +4559,7 @@ class ShowBgpVrfAllNeighborsAdvertisedRoutes(ShowBgpVrfAllNeighborsAdvertisedRou
                 #    ---        100          0 10 20 30 40 50 60 70 80 90
                 #    100        ---      32788 ---
                 #    ---        100      32788 --- 
-                m = p12.match(numbers)
+                m = p.p12.match(numbers)
                 if m:
                     index_dict.update({'weight': int(m.groupdict()['weight'])})
 
@@ -4914,7 +4576,7 @@ class ShowBgpVrfAllNeighborsAdvertisedRoutes(ShowBgpVrfAllNeighborsAdvertisedRou
                     continue
 
                 #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m = p13.match(numbers)
+                m = p.p13.match(numbers)
                 if m:
                     index_dict.update({'weight': int(m.groupdict()['weight'])})
                     index_dict.update({'path': m.groupdict()['path'].strip()})
@@ -4923,7 +4585,7 @@ class ShowBgpVrfAllNeighborsAdvertisedRoutes(ShowBgpVrfAllNeighborsAdvertisedRou
             # Network            Next Hop            Metric     LocPrf     Weight Path
             # Route Distinguisher: 100:100     (VRF VRF1)
             # Route Distinguisher: 2:100    (VRF vpn2)
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 route_distinguisher = str(m.groupdict()['route_distinguisher'])
                 new_address_family = original_address_family + ' RD ' + route_distinguisher
@@ -5047,6 +4709,46 @@ class ShowBgpVrfAllNeighborsRoutes(ShowBgpVrfAllNeighborsRoutesSchema):
     cli_command = ['show bgp vrf {vrf} all neighbors {neighbor} routes',
                    'show bgp vrf {vrf} {address_family} neighbors {neighbor} routes']
 
+    patterns = Patterns(
+        p=r'^\s*Network +Next Hop +Metric +LocPrf +Weight Path$',
+        p1=r'^\s*Peer +(?P<neighbor_id>(\S+)) +routes +for'
+           ' +address +family'
+           ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+) *:$',
+        p2=r'^\s*BGP +table +version +is'
+           ' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
+           ' +ID +is +(?P<local_router_id>(\S+))$',
+        p3_1=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+             '(?P<path_type>(i|e|c|l|a|r|I))?'
+             '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+             '(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$',
+        p3_3=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+             '(?P<path_type>(i|e|c|l|a|r|I))?'
+             ' *(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+             '(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
+             ' +(?P<origin_codes>(i|e|\?|\|))$',
+        p3_3_1=r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+               '(?P<path_type>(i|e|c|l|a|r|I))?'
+               '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+               ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+               ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$',
+        p3_2=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
+             '(?P<path_type>(i|e|c|l|a|r|I))'
+             '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+             ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+             ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
+             ' +(?P<origin_codes>(i|e|\?|\&|\|))$',
+        p3_2_1=r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+               '(?P<path_type>(i|e|c|l|a|r|I))?'
+               '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+               '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+               ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+               ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$',
+        p4=r'^\s*Route +Distinguisher *:'
+           ' +(?P<route_distinguisher>(\S+))'
+           '(?: +\(((VRF +(?P<default_vrf>\S+))|'
+           '((?P<default_vrf1>\S+)VNI +(?P<vni>\d+)))\))?$',
+    )
+
     def cli(self, neighbor, vrf='all', address_family='all', output=None):
         if vrf == 'all':
             vrf = 'default'
@@ -5068,43 +4770,7 @@ class ShowBgpVrfAllNeighborsRoutes(ShowBgpVrfAllNeighborsRoutesSchema):
         route_dict = {}
         af_dict = {}
 
-        p = re.compile(r'^\s*Network +Next Hop +Metric +LocPrf +Weight Path$')
-        p1 = re.compile(r'^\s*Peer +(?P<neighbor_id>(\S+)) +routes +for'
-                            ' +address +family'
-                            ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+) *:$')
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                            ' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
-                            ' +ID +is +(?P<local_router_id>(\S+))$')
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            '(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
-        p3_3 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            ' *(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            '(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
-                            ' +(?P<origin_codes>(i|e|\?|\|))$')
-        p3_3_1 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                                '(?P<path_type>(i|e|c|l|a|r|I))?'
-                                '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                                ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                                ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
-                            '(?P<path_type>(i|e|c|l|a|r|I))'
-                            '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
-                            ' +(?P<origin_codes>(i|e|\?|\&|\|))$')
-        p3_2_1 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                                '(?P<path_type>(i|e|c|l|a|r|I))?'
-                                '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                                '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                                ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                                ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
-        p4 = re.compile(r'^\s*Route +Distinguisher *:'
-                            ' +(?P<route_distinguisher>(\S+))'
-                            '(?: +\(((VRF +(?P<default_vrf>\S+))|'
-                            '((?P<default_vrf1>\S+)VNI +(?P<vni>\d+)))\))?$')
+        regex = ShowBgpVrfAllNeighborsRoutes.patterns
         # Init vars
         data_on_nextline = False
         index = 1
@@ -5114,12 +4780,12 @@ class ShowBgpVrfAllNeighborsRoutes(ShowBgpVrfAllNeighborsRoutesSchema):
             line = line.rstrip()
 
             # Network            Next Hop            Metric     LocPrf     Weight Path
-            m = p.match(line)
+            m = regex.p.match(line)
             if m:
                 continue
 
             # Peer 10.186.0.2 routes for address family IPv4 Unicast:
-            m = p1.match(line)
+            m = regex.p1.match(line)
             if m:
                 neighbor_id = str(m.groupdict()['neighbor_id'])
                 address_family = str(m.groupdict()['address_family']).lower()
@@ -5128,7 +4794,7 @@ class ShowBgpVrfAllNeighborsRoutes(ShowBgpVrfAllNeighborsRoutesSchema):
 
             # BGP table version is 25, Local Router ID is 10.186.101.1
             # BGP table version is 381, Local Router ID is 10.4.1.2
-            m = p2.match(line)
+            m = regex.p2.match(line)
             if m:
                 bgp_table_version = int(m.groupdict()['bgp_table_version'])
                 local_router_id = str(m.groupdict()['local_router_id'])
@@ -5173,7 +4839,7 @@ class ShowBgpVrfAllNeighborsRoutes(ShowBgpVrfAllNeighborsRoutesSchema):
 
             # *>i[2]:[77][7,0][10.69.9.9,1,151587081][10.135.1.1,22][10.106.101.1,10.76.1.30]/616
             # *>i2001:db8:aaaa:1::/113       ::ffff:10.106.101.1
-            m = p3_1.match(line)
+            m = regex.p3_1.match(line)
             if m:
                 # New prefix, reset index count
                 index = 1
@@ -5204,11 +4870,11 @@ class ShowBgpVrfAllNeighborsRoutes(ShowBgpVrfAllNeighborsRoutesSchema):
             #                     0.0.0.0               100      32768 i
             #                     10.106.101.1            4444       100 0 3 10 20 30 40 50 60 70 80 90 i
             # *>i                 10.106.102.4                        100          0 {62112 33492 4872 41787 13166 50081 21461 58376 29755 1135} i
-            m = p3_3.match(line)
+            m = regex.p3_3.match(line)
 
             # * e                   10.70.2.2                                      0 100 300 ?
             # *>e                   10.70.1.2                                      0 100 300 ?
-            m1 = p3_3_1.match(line)
+            m1 = regex.p3_3_1.match(line)
             m = m if m else m1
             if m:
                 # Get keys
@@ -5295,10 +4961,10 @@ class ShowBgpVrfAllNeighborsRoutes(ShowBgpVrfAllNeighborsRoutesSchema):
             # *>r10.16.2.0/24         0.0.0.0               4444        100      32768 ?
             # *>i10.49.0.0/16         10.106.101.1                        100          0 10 20 30 40 50 60 70 80 90 i
             # *>i10.4.2.0/24         10.106.102.4                        100          0 {62112 33492 4872 41787 13166 50081 21461 58376 29755 1135} i
-            m = p3_2.match(line)
+            m = regex.p3_2.match(line)
 
             # *&i10.145.1.0/24        192.168.151.2                0        100          0 ?
-            m1 = p3_2_1.match(line)
+            m1 = regex.p3_2_1.match(line)
             m = m if m else m1
             if m:
                 # New prefix, reset index count
@@ -5383,7 +5049,7 @@ class ShowBgpVrfAllNeighborsRoutes(ShowBgpVrfAllNeighborsRoutesSchema):
             # Route Distinguisher: 100:100     (VRF VRF1)
             # Route Distinguisher: 2:100    (VRF vpn2)
             # Route Distinguisher: 10.49.1.0:3    (L3VNI 9100)
-            m = p4.match(line)
+            m = regex.p4.match(line)
             if m:
                 route_distinguisher = str(m.groupdict()['route_distinguisher'])
                 new_address_family = original_address_family + ' RD ' + route_distinguisher
@@ -5497,6 +5163,46 @@ class ShowBgpVrfAllNeighborsReceivedRoutes(ShowBgpVrfAllNeighborsReceivedRoutesS
     cli_command =['show bgp vrf {vrf} all neighbors {neighbor} received-routes',
                   'show bgp vrf {vrf} {address_family} neighbors {neighbor} received-routes']
 
+    patterns = Patterns(
+        p=r'^\s*Network +Next Hop +Metric +LocPrf +Weight Path$',
+        p1=r'^\s*Peer +(?P<neighbor_id>(\S+)) +routes +for'
+           ' +address +family'
+           ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+) *:$',
+        p2=r'^\s*BGP +table +version +is'
+           ' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
+           ' +ID +is +(?P<local_router_id>(\S+))$',
+        p3_1=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+             '(?P<path_type>(i|e|c|l|a|r|I))?'
+             '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+             '(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$',
+        p3_3=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+             '(?P<path_type>(i|e|c|l|a|r|I))?'
+             ' *(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+             '(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
+             ' +(?P<origin_codes>(i|e|\?|\|))$',
+        p3_3_1=r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+               '(?P<path_type>(i|e|c|l|a|r|I))?'
+               '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+               ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+               ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$',
+        p3_2=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
+             '(?P<path_type>(i|e|c|l|a|r|I))'
+             '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+             ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+             ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
+             ' +(?P<origin_codes>(i|e|\?|\&|\|))$',
+        p3_2_1=r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+               '(?P<path_type>(i|e|c|l|a|r|I))?'
+               '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+               '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+               ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+               ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$',
+        p4=r'^\s*Route +Distinguisher *:'
+           ' +(?P<route_distinguisher>(\S+))'
+           '(?: +\(((VRF +(?P<default_vrf>\S+))|'
+           '((?P<default_vrf1>\S+)VNI +(?P<vni>\d+)))\))?$',
+    )
+
     def cli(self, neighbor, vrf='all', address_family='all', output=None):
         if vrf == 'all':
             vrf = 'default'
@@ -5515,43 +5221,7 @@ class ShowBgpVrfAllNeighborsReceivedRoutes(ShowBgpVrfAllNeighborsReceivedRoutesS
         route_dict = {}
         af_dict = {}
 
-        p = re.compile(r'^\s*Network +Next Hop +Metric +LocPrf +Weight Path$')
-        p1 = re.compile(r'^\s*Peer +(?P<neighbor_id>(\S+)) +routes +for'
-                            ' +address +family'
-                            ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+) *:$')
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                            ' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
-                            ' +ID +is +(?P<local_router_id>(\S+))$')
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            '(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
-        p3_3 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            ' *(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            '(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
-                            ' +(?P<origin_codes>(i|e|\?|\|))$')
-        p3_3_1 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                                '(?P<path_type>(i|e|c|l|a|r|I))?'
-                                '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                                ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                                ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
-                            '(?P<path_type>(i|e|c|l|a|r|I))'
-                            '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
-                            ' +(?P<origin_codes>(i|e|\?|\&|\|))$')
-        p3_2_1 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                                '(?P<path_type>(i|e|c|l|a|r|I))?'
-                                '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                                '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                                ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                                ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
-        p4 = re.compile(r'^\s*Route +Distinguisher *:'
-                            ' +(?P<route_distinguisher>(\S+))'
-                            '(?: +\(((VRF +(?P<default_vrf>\S+))|'
-                            '((?P<default_vrf1>\S+)VNI +(?P<vni>\d+)))\))?$')
+        regex = ShowBgpVrfAllNeighborsReceivedRoutes.patterns
         # Init vars
         data_on_nextline =  False
         index = 1
@@ -5561,12 +5231,12 @@ class ShowBgpVrfAllNeighborsReceivedRoutes(ShowBgpVrfAllNeighborsReceivedRoutesS
             line = line.rstrip()
 
             # Network            Next Hop            Metric     LocPrf     Weight Path
-            m = p.match(line)
+            m = regex.p.match(line)
             if m:
                 continue
 
             # Peer 10.186.0.2 routes for address family IPv4 Unicast:
-            m = p1.match(line)
+            m = regex.p1.match(line)
             if m:
                 neighbor_id = str(m.groupdict()['neighbor_id'])
                 address_family = str(m.groupdict()['address_family']).lower()
@@ -5574,7 +5244,7 @@ class ShowBgpVrfAllNeighborsReceivedRoutes(ShowBgpVrfAllNeighborsReceivedRoutesS
                 continue
 
             # BGP table version is 25, Local Router ID is 10.186.101.1
-            m = p2.match(line)
+            m = regex.p2.match(line)
             if m:
                 bgp_table_version = int(m.groupdict()['bgp_table_version'])
                 local_router_id = str(m.groupdict()['local_router_id'])
@@ -5619,7 +5289,7 @@ class ShowBgpVrfAllNeighborsReceivedRoutes(ShowBgpVrfAllNeighborsReceivedRoutesS
 
             # *>i[2]:[77][7,0][10.69.9.9,1,151587081][10.135.1.1,22][10.106.101.1,10.76.1.30]/616
             # *>i2001:db8:aaaa:1::/113       ::ffff:10.106.101.1
-            m = p3_1.match(line)
+            m = regex.p3_1.match(line)
             if m:
                 # New prefix, reset index count
                 index = 1
@@ -5650,11 +5320,11 @@ class ShowBgpVrfAllNeighborsReceivedRoutes(ShowBgpVrfAllNeighborsReceivedRoutesS
             #                     0.0.0.0               100      32768 i
             #                     10.106.101.1            4444       100 0 3 10 20 30 40 50 60 70 80 90 i
             # *>i                 10.106.102.4                        100          0 {62112 33492 4872 41787 13166 50081 21461 58376 29755 1135} i
-            m = p3_3.match(line)
+            m = regex.p3_3.match(line)
 
             # * e                   10.70.2.2                                      0 100 300 ?
             # *>e                   10.70.1.2                                      0 100 300 ?
-            m1 = p3_3_1.match(line)
+            m1 = regex.p3_3_1.match(line)
             m = m if m else m1
             if m:
                 # Get keys
@@ -5741,10 +5411,10 @@ class ShowBgpVrfAllNeighborsReceivedRoutes(ShowBgpVrfAllNeighborsReceivedRoutesS
             # *>r10.16.2.0/24         0.0.0.0               4444        100      32768 ?
             # *>i10.49.0.0/16         10.106.101.1                        100          0 10 20 30 40 50 60 70 80 90 i
             # *>i10.4.2.0/24         10.106.102.4                        100          0 {62112 33492 4872 41787 13166 50081 21461 58376 29755 1135} i
-            m = p3_2.match(line)
+            m = regex.p3_2.match(line)
 
             # *&i10.145.1.0/24        192.168.151.2                0        100          0 ?
-            m1 = p3_2_1.match(line)
+            m1 = regex.p3_2_1.match(line)
             m = m if m else m1
             if m:
                 # New prefix, reset index count
@@ -5828,7 +5498,7 @@ class ShowBgpVrfAllNeighborsReceivedRoutes(ShowBgpVrfAllNeighborsReceivedRoutesS
             # Route Distinguisher: 100:100     (VRF VRF1)
             # Route Distinguisher: 2:100    (VRF vpn2)
             # Route Distinguisher: 10.49.1.0:3    (L3VNI 9100)
-            m = p4.match(line)
+            m = regex.p4.match(line)
             if m:
                 route_distinguisher = str(m.groupdict()['route_distinguisher'])
                 new_address_family = original_address_family + ' RD ' + route_distinguisher
@@ -6123,131 +5793,135 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
     cli_command = 'show running-config bgp'
 
+    patterns = Patterns(
+        p1=r'^\s*router +bgp +(?P<bgp_id>[0-9]+)$',
+        p2=r'^\s*shutdown$',
+        p2_1=r'^\s*evpn$',
+        p2_2=r'^\s*vni +(?P<evpn_vni>\d+) +l2$',
+        p2_3=r'^\s*rd +(?P<rd>[\w]+)$',
+        p2_4=r'^\s*route-target +(?P<evpn_vni_rt_type>[\w]+) +(?P<evpn_vni_rt>[\w\s]+)$',
+        p3=r'^\s*vrf +(?P<vrf>[\w\-]+)$',
+        p3_1=r'^\s*rd +(?P<rd>[\w]+)$',
+        p4=r'^\s*bestpath +(?P<best_path>[a-z\-\s]+)$',
+        p5=r'^\s*cluster-id +(?P<cluster_id>[0-9\.]+)$',
+        p6=r'^\s*confederation +identifier +(?P<confederation_identifier>[0-9]+)$',
+        p7=r'^\s*confederation +peers +(?P<confederation_peers_as>[0-9]+)$',
+        p8=r'^\s*no graceful-restart$',
+        p9=r'^\s*graceful-restart'
+           ' +(?P<graceful_restart_type>[a-z\-]+)'
+           ' +(?P<time>[0-9]+)$',
+        p10=r'^\s*log-neighbor-changes$',
+        p11=r'^\s*router-id +(?P<router_id>[0-9\.]+)$',
+        p12=r'^\s*timers +bgp +(?P<keepalive_interval>[0-9]+)'
+            ' +(?P<holdtime>[0-9]+)$',
+        p13=r'^\s*no enforce-first-as$',
+        p14=r'^\s*no fast-external-fallover$',
+        p15=r'^\s*dynamic-med-interval +(?P<dynamic_med_interval>[0-9]+)$',
+        p16=r'^\s*flush-routes$',
+        p17=r'^\s*isolate$',
+        p18=r'^\s*disable-policy-batching ipv4 prefix-list +(?P<disable_policy_batching_ipv4>[a-zA-Z0-9]+)$',
+        p19=r'^\s*disable-policy-batching ipv6 prefix-list +(?P<disable_policy_batching_ipv6>[a-zA-Z0-9]+)$',
+        p20=r'^\s*address-family +(?P<af_name>[a-z0-9\-\s]+)$',
+        p21_1=r'^\s*route-target +(?P<af_evpn_vni_rt_type>[\w]+) +(?P<af_evpn_vni_rt>[\w\s]+)$',
+        p21=r'^\s*dampening '
+            '+(?P<af_dampening_half_life_time>[0-9]+) '
+            '+(?P<af_dampening_reuse_time>[0-9]+) '
+            '+(?P<af_dampening_suppress_time>[0-9]+) '
+            '+(?P<af_dampening_max_suppress_time>[0-9]+)$',
+        p22=r'^\s*dampening +route-map +(?P<af_dampening_route_map>[A-Z0-9\-\_]+)$',
+        p23=r'^\s*nexthop +route-map +(?P<af_nexthop_route_map>[A-Za-z0-9\-\_]+)$',
+        p24=r'^\s*nexthop +trigger-delay +critical +(?P<af_nexthop_trigger_delay_critical>[0-9]+) +non-critical +(?P<af_nexthop_trigger_delay_non_critical>[0-9]+)$',
+        p25=r'^\s*no nexthop trigger-delay$',
+        p26=r'^\s*no client-to-client reflection$',
+        p27=r'^\s*distance +(?P<af_distance_extern_as>[0-9]+) +(?P<af_distance_internal_as>[0-9]+) +(?P<af_distance_local>[0-9]+)$',
+        p28=r'^\s*maximum-paths( +(?P<af_maximum_paths_type>[a-z]+))? +(?P<af_maximum_paths_value>[0-9]+)$',
+        p28_1=r'additional-paths send',
+        p28_2=r'additional-paths receive',
+        p28_3=r'default-information originate',
+        p29=r'^\s*maximum-paths +eibgp +(?P<af_maximum_paths_eibgp>[0-9]+)$',
+        p30=r'^\s*aggregate-address +(?P<af_aggregate_address_address>[a-z0-9\.\:]+)(\/(?P<af_aggregate_address_ipv4_mask>[0-9]+))?( +(?P<extra_line>[a-z\-\s]+))?$',
+        p31=r'^\s*network +(?P<af_network_number>[0-9\.\:]+)( +mask +(?P<af_network_mask>[0-9\.]+))?( +route-map +(?P<af_network_route_map>[A-Za-z0-9\-\_]+))?$',
+        p32=r'^\s*network +(?P<af_network_number>[0-9\.]+)\/(?P<af_network_mask>[0-9]+)( +route-map +(?P<af_network_route_map>[A-Za-z0-9\-\_]+))?$',
+        p33=r'^\s*redistribute +isis +(?P<af_redist_isis>[0-9]+) +route-map +(?P<af_redist_isis_route_policy>[A-Za-z0-9\-\_]+)$',
+        p34=r'^\s*redistribute +isis +(?P<af_redist_isis>[0-9]+) +route-map +(?P<af_redist_isis_route_policy>[A-Za-z0-9\-\_]+)$',
+        p35=r'^\s*redistribute +(ospf|ospfv3) +(?P<af_redist_ospf>[0-9]+) +route-map +(?P<af_redist_ospf_route_policy>[A-Za-z0-9\-\_]+)$',
+        p36=r'^\s*redistribute +rip +(?P<af_redist_rip>[0-9]+) +route-map +(?P<af_redist_rip_route_policy>[A-Za-z0-9\-\_]+)$',
+        p37=r'^\s*redistribute +static +route-map +(?P<af_redist_static_route_policy>[A-Za-z0-9\-\_]+)$',
+        p38=r'^\s*redistribute +direct +route-map +(?P<af_redist_connected_route_policy>[A-Za-z0-9\-\_]+)$',
+        p39=r'^\s*allocate-label all$',
+        p40=r'^\s*retain route-target all$',
+        p41=r'^\s*label-allocation-mode +(?P<per_vrf>[A-Za-z0-9]+)$',
+        p103=r'^\s*advertise-pip$',
+        p42=r'^\s*neighbor +(?P<neighbor_id>[a-z0-9\.\:]+)$',
+        p43=r'^\s*bfd$',
+        p44=r'^\s*capability suppress 4-byte-as$',
+        p45=r'^\s*description +(?P<nbr_description>[A-Za-z0-9]+)$',
+        p46=r'^\s*disable-connected-check$',
+        p47=r'^\s*ebgp-multihop +(?P<nbr_ebgp_multihop_max_hop>[0-9]+)$',
+        p48=r'^\s*inherit peer-session +(?P<nbr_inherit_peer_session>[A-Za-z0-9\-]+)$',
+        p49=r'^\s*local-as +(?P<nbr_local_as_as_no>[0-9\.]+)( +(?P<no_prepend>no-prepend)( +(?P<replace_as>replace-as)( +(?P<dual_as>dual-as))?)?)?$',
+        p50=r'^\s*remote-as +(?P<nbr_remote_as>[0-9]+)$',
+        p51=r'^\s*remove-private-as$',
+        p52=r'^\s*shutdown$',
+        p53=r'^\s*timers +(?P<nbr_keepalive_interval>[0-9]+) +(?P<nbr_holdtime>[0-9]+)$',
+        p54=r'^\s*update-source +(?P<nbr_update_source>[A-Za-z0-9\/\.]+)$',
+        p55=r'^\s*password +(?P<nbr_password_text>.*)$',
+        p56=r'^\s*transport connection-mode +(?P<nbr_transport_connection_mode>[a-z]+)$',
+        p101=r'^\s*peer-type +(?P<nbr_peer_type>[\w\-]+)$',
+        p104=r'^\s*inherit peer +(?P<nbr_inherit_peer>\S+)$',
+        p57=r'^\s*address-family +(?P<nbr_af_name>[A-Za-z0-9\s\-]+)$',
+        p58=r'^\s*allowas-in( +(?P<nbr_af_allowas_in_as_number>[0-9]+))?$',
+        p59=r'^\s*inherit peer-policy +(?P<nbr_af_inherit_peer_policy>[A-Za-z0-9\-]+) +(?P<nbr_af_inherit_peer_seq>[0-9]+)$',
+        p60=r'^\s*maximum-prefix +(?P<nbr_af_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<nbr_af_maximum_prefix_threshold>[0-9]+))?( +restart +(?P<nbr_af_maximum_prefix_restart>[0-9]+))?$',
+        p61=r'^\s*maximum-prefix +(?P<nbr_af_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<nbr_af_maximum_prefix_threshold>[0-9]+))?( +(?P<nbr_af_maximum_prefix_warning_only>warning-only))?$',
+        p62=r'^\s*(?:no )?route-map +(?P<nbr_af_route_map_name_in>.*) in$',
+        p63=r'^\s*(?:no )?route-map +(?P<nbr_af_route_map_name_out>.*) out$',
+        p64=r'^\s*route-reflector-client$',
+        p65=r'^\s*send-community$',
+        p66=r'^\s*send-community +extended$',
+        p100=r'^\s*rewrite-evpn-rt-asn$',
+        p67=r'^\s*soft-reconfiguration inbound( +(?P<nbr_af_soft_reconfiguration_extra>.*))?$',
+        p68=r'^\s*next-hop-self$',
+        p69=r'^\s*as-override$',
+        p70=r'^\s*default-originate( +route-map +(?P<nbr_af_default_originate_route_map>.*))?$',
+        p71=r'^\s*soo +(?P<nbr_af_soo>.*)$',
+        p72=r'^\s*template peer-session +(?P<ps_name>.*)$',
+        p73=r'^\s*bfd$',
+        p74=r'^\s*bfd$',
+        p75=r'^\s*description +(?P<ps_description>.*)$',
+        p76=r'^\s*disable-connected-check$',
+        p77=r'^\s*ebgp-multihop +(?P<ps_ebgp_multihop_max_hop>[0-9]+)$$',
+        p78=r'^\s*local-as +(?P<ps_local_as_as_no>[0-9\.]+)( +no-prepend( +replace-as( +dual-as)?)?)?$',
+        p79=r'^\s*password +(?P<ps_password_text>.*)$',
+        p80=r'^\s*remote-as +(?P<ps_remote_as>[0-9]+)$',
+        p81=r'^\s*shutdown$',
+        p82=r'^\s*timers +(?P<ps_keepalive_interval>[0-9]+) +(?P<ps_hodltime>[0-9]+)$',
+        p83=r'^\s*transport connection-mode +(?P<ps_transport_connection_mode>[a-z]+)$',
+        p84=r'^\s*update-source +(?P<ps_update_source>[A-Za-z0-9\/\.]+)$',
+        p85=r'^\s*template peer-policy +(?P<pp_name>.*)$',
+        p86=r'^\s*allowas-in( +(?P<pp_allowas_in_as_number>[0-9]+))?$',
+        p87=r'^\s*as-override$',
+        p88=r'^\s*default-originate( +route-map +(?P<pp_default_originate_route_map>.*))?$',
+        p89=r'^\s*route-map +(?P<pp_route_map_name_in>.*) in$',
+        p90=r'^\s*route-map +(?P<pp_route_map_name_out>.*) out$',
+        p91=r'^\s*maximum-prefix +(?P<pp_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<nbr_af_maximum_prefix_threshold>[0-9]+))?(restart +(?P<nbr_af_maximum_prefix_restart>[0-9]+))?$',
+        p92=r'^\s*maximum-prefix +(?P<pp_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<pp_maximum_prefix_threshold>[0-9]+))?( +(?P<pp_maximum_prefix_warning_only>warning-only))?$',
+        p93=r'^\s*next-hop-self$',
+        p94=r'^\s*route-reflector-client$',
+        p95=r'^\s*send-community$',
+        p96=r'^\s*send-community +extended$',
+        p97=r'^\s*soft-reconfiguration inbound( +(?P<nbr_af_soft_reconfiguration_extra>.*))?$',
+        p98=r'^\s*soo +(?P<pp_soo>.*)$',
+        peer_1=r'template peer +(?P<peer_name>\S+)',
+    )
+
     def cli(self,output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
         else:
             out = output
 
-        p1 = re.compile(r'^\s*router +bgp +(?P<bgp_id>[0-9]+)$')
-        p2 = re.compile(r'^\s*shutdown$')
-        p2_1 = re.compile(r'^\s*evpn$')
-        p2_2 = re.compile(r'^\s*vni +(?P<evpn_vni>\d+) +l2$')
-        p2_3 = re.compile(r'^\s*rd +(?P<rd>[\w]+)$')
-        p2_4 = re.compile(r'^\s*route-target +(?P<evpn_vni_rt_type>[\w]+) +(?P<evpn_vni_rt>[\w\s]+)$')
-        p3 = re.compile(r'^\s*vrf +(?P<vrf>[\w\-]+)$')
-        p3_1 = re.compile(r'^\s*rd +(?P<rd>[\w]+)$')
-        p4 = re.compile(r'^\s*bestpath +(?P<best_path>[a-z\-\s]+)$')
-        p5 = re.compile(r'^\s*cluster-id +(?P<cluster_id>[0-9\.]+)$')
-        p6 = re.compile(r'^\s*confederation +identifier +(?P<confederation_identifier>[0-9]+)$')
-        p7 = re.compile(r'^\s*confederation +peers +(?P<confederation_peers_as>[0-9]+)$')
-        p8 = re.compile(r'^\s*no graceful-restart$')
-        p9 = re.compile(r'^\s*graceful-restart'
-                    ' +(?P<graceful_restart_type>[a-z\-]+)'
-                    ' +(?P<time>[0-9]+)$')
-        p10 = re.compile(r'^\s*log-neighbor-changes$')
-        p11 = re.compile(r'^\s*router-id +(?P<router_id>[0-9\.]+)$')
-        p12 = re.compile(r'^\s*timers +bgp +(?P<keepalive_interval>[0-9]+)'
-                    ' +(?P<holdtime>[0-9]+)$')
-        p13 = re.compile(r'^\s*no enforce-first-as$')
-        p14 = re.compile(r'^\s*no fast-external-fallover$')
-        p15 = re.compile(r'^\s*dynamic-med-interval +(?P<dynamic_med_interval>[0-9]+)$')
-        p16 = re.compile(r'^\s*flush-routes$')
-        p17 = re.compile(r'^\s*isolate$')
-        p18 = re.compile(r'^\s*disable-policy-batching ipv4 prefix-list +(?P<disable_policy_batching_ipv4>[a-zA-Z0-9]+)$')
-        p19 = re.compile(r'^\s*disable-policy-batching ipv6 prefix-list +(?P<disable_policy_batching_ipv6>[a-zA-Z0-9]+)$')
-        p20 = re.compile(r'^\s*address-family +(?P<af_name>[a-z0-9\-\s]+)$')
-        p21_1 = re.compile(r'^\s*route-target +(?P<af_evpn_vni_rt_type>[\w]+) +(?P<af_evpn_vni_rt>[\w\s]+)$')
-        p21 = re.compile(r'^\s*dampening '
-                        '+(?P<af_dampening_half_life_time>[0-9]+) '
-                        '+(?P<af_dampening_reuse_time>[0-9]+) '
-                        '+(?P<af_dampening_suppress_time>[0-9]+) '
-                        '+(?P<af_dampening_max_suppress_time>[0-9]+)$')
-        p22 = re.compile(r'^\s*dampening +route-map +(?P<af_dampening_route_map>[A-Z0-9\-\_]+)$')
-        p23 = re.compile(r'^\s*nexthop +route-map +(?P<af_nexthop_route_map>[A-Za-z0-9\-\_]+)$')
-        p24 = re.compile(r'^\s*nexthop +trigger-delay +critical +(?P<af_nexthop_trigger_delay_critical>[0-9]+) +non-critical +(?P<af_nexthop_trigger_delay_non_critical>[0-9]+)$')
-        p25 = re.compile(r'^\s*no nexthop trigger-delay$')
-        p26 = re.compile(r'^\s*no client-to-client reflection$')
-        p27 = re.compile(r'^\s*distance +(?P<af_distance_extern_as>[0-9]+) +(?P<af_distance_internal_as>[0-9]+) +(?P<af_distance_local>[0-9]+)$')
-        p28 = re.compile(r'^\s*maximum-paths( +(?P<af_maximum_paths_type>[a-z]+))? +(?P<af_maximum_paths_value>[0-9]+)$')
-        p28_1 = re.compile(r'additional-paths send')
-        p28_2 = re.compile(r'additional-paths receive')
-        p28_3 = re.compile(r'default-information originate')
-        p29 = re.compile(r'^\s*maximum-paths +eibgp +(?P<af_maximum_paths_eibgp>[0-9]+)$')
-        p30 = re.compile(r'^\s*aggregate-address +(?P<af_aggregate_address_address>[a-z0-9\.\:]+)(\/(?P<af_aggregate_address_ipv4_mask>[0-9]+))?( +(?P<extra_line>[a-z\-\s]+))?$')
-        p31 = re.compile(r'^\s*network +(?P<af_network_number>[0-9\.\:]+)( +mask +(?P<af_network_mask>[0-9\.]+))?( +route-map +(?P<af_network_route_map>[A-Za-z0-9\-\_]+))?$')
-        p32 = re.compile(r'^\s*network +(?P<af_network_number>[0-9\.]+)\/(?P<af_network_mask>[0-9]+)( +route-map +(?P<af_network_route_map>[A-Za-z0-9\-\_]+))?$')
-        p33 = re.compile(r'^\s*redistribute +isis +(?P<af_redist_isis>[0-9]+) +route-map +(?P<af_redist_isis_route_policy>[A-Za-z0-9\-\_]+)$')
-        p34 = re.compile(r'^\s*redistribute +isis +(?P<af_redist_isis>[0-9]+) +route-map +(?P<af_redist_isis_route_policy>[A-Za-z0-9\-\_]+)$')
-        p35 = re.compile(r'^\s*redistribute +(ospf|ospfv3) +(?P<af_redist_ospf>[0-9]+) +route-map +(?P<af_redist_ospf_route_policy>[A-Za-z0-9\-\_]+)$')
-        p36 = re.compile(r'^\s*redistribute +rip +(?P<af_redist_rip>[0-9]+) +route-map +(?P<af_redist_rip_route_policy>[A-Za-z0-9\-\_]+)$')
-        p37 = re.compile(r'^\s*redistribute +static +route-map +(?P<af_redist_static_route_policy>[A-Za-z0-9\-\_]+)$')
-        p38 = re.compile(r'^\s*redistribute +direct +route-map +(?P<af_redist_connected_route_policy>[A-Za-z0-9\-\_]+)$')
-        p39 = re.compile(r'^\s*allocate-label all$')
-        p40 = re.compile(r'^\s*retain route-target all$')
-        p41 = re.compile(r'^\s*label-allocation-mode +(?P<per_vrf>[A-Za-z0-9]+)$')
-        p103 = re.compile(r'^\s*advertise-pip$')
-        p42 = re.compile(r'^\s*neighbor +(?P<neighbor_id>[a-z0-9\.\:]+)$')
-        p43 = re.compile(r'^\s*bfd$')
-        p44 = re.compile(r'^\s*capability suppress 4-byte-as$')
-        p45 = re.compile(r'^\s*description +(?P<nbr_description>[A-Za-z0-9]+)$')
-        p46 = re.compile(r'^\s*disable-connected-check$')
-        p47 = re.compile(r'^\s*ebgp-multihop +(?P<nbr_ebgp_multihop_max_hop>[0-9]+)$')
-        p48 = re.compile(r'^\s*inherit peer-session +(?P<nbr_inherit_peer_session>[A-Za-z0-9\-]+)$')
-        p49 = re.compile(r'^\s*local-as +(?P<nbr_local_as_as_no>[0-9\.]+)( +(?P<no_prepend>no-prepend)( +(?P<replace_as>replace-as)( +(?P<dual_as>dual-as))?)?)?$')
-        p50 = re.compile(r'^\s*remote-as +(?P<nbr_remote_as>[0-9]+)$')
-        p51 = re.compile(r'^\s*remove-private-as$')
-        p52 = re.compile(r'^\s*shutdown$')
-        p53 = re.compile(r'^\s*timers +(?P<nbr_keepalive_interval>[0-9]+) +(?P<nbr_holdtime>[0-9]+)$')
-        p54 = re.compile(r'^\s*update-source +(?P<nbr_update_source>[A-Za-z0-9\/\.]+)$')
-        p55 = re.compile(r'^\s*password +(?P<nbr_password_text>.*)$')
-        p56 = re.compile(r'^\s*transport connection-mode +(?P<nbr_transport_connection_mode>[a-z]+)$')
-        p101 = re.compile(r'^\s*peer-type +(?P<nbr_peer_type>[\w\-]+)$')
-        p104 = re.compile(r'^\s*inherit peer +(?P<nbr_inherit_peer>\S+)$')
-        p57 = re.compile(r'^\s*address-family +(?P<nbr_af_name>[A-Za-z0-9\s\-]+)$')
-        p58 = re.compile(r'^\s*allowas-in( +(?P<nbr_af_allowas_in_as_number>[0-9]+))?$')
-        p59 = re.compile(r'^\s*inherit peer-policy +(?P<nbr_af_inherit_peer_policy>[A-Za-z0-9\-]+) +(?P<nbr_af_inherit_peer_seq>[0-9]+)$')
-        p60 = re.compile(r'^\s*maximum-prefix +(?P<nbr_af_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<nbr_af_maximum_prefix_threshold>[0-9]+))?( +restart +(?P<nbr_af_maximum_prefix_restart>[0-9]+))?$')
-        p61 = re.compile(r'^\s*maximum-prefix +(?P<nbr_af_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<nbr_af_maximum_prefix_threshold>[0-9]+))?( +(?P<nbr_af_maximum_prefix_warning_only>warning-only))?$')
-        p62 = re.compile(r'^\s*(?:no )?route-map +(?P<nbr_af_route_map_name_in>.*) in$')
-        p63 = re.compile(r'^\s*(?:no )?route-map +(?P<nbr_af_route_map_name_out>.*) out$')
-        p64 = re.compile(r'^\s*route-reflector-client$')
-        p65 = re.compile(r'^\s*send-community$')
-        p66 = re.compile(r'^\s*send-community +extended$')
-        p100 = re.compile(r'^\s*rewrite-evpn-rt-asn$')
-        p67 = re.compile(r'^\s*soft-reconfiguration inbound( +(?P<nbr_af_soft_reconfiguration_extra>.*))?$')
-        p68 = re.compile(r'^\s*next-hop-self$')
-        p69 = re.compile(r'^\s*as-override$')
-        p70 = re.compile(r'^\s*default-originate( +route-map +(?P<nbr_af_default_originate_route_map>.*))?$')
-        p71 = re.compile(r'^\s*soo +(?P<nbr_af_soo>.*)$')
-        p72 = re.compile(r'^\s*template peer-session +(?P<ps_name>.*)$')
-        p73 = re.compile(r'^\s*bfd$')
-        p74 = re.compile(r'^\s*bfd$')
-        p75 = re.compile(r'^\s*description +(?P<ps_description>.*)$')
-        p76 = re.compile(r'^\s*disable-connected-check$')
-        p77 = re.compile(r'^\s*ebgp-multihop +(?P<ps_ebgp_multihop_max_hop>[0-9]+)$$')
-        p78 = re.compile(r'^\s*local-as +(?P<ps_local_as_as_no>[0-9\.]+)( +no-prepend( +replace-as( +dual-as)?)?)?$')
-        p79 = re.compile(r'^\s*password +(?P<ps_password_text>.*)$')
-        p80 = re.compile(r'^\s*remote-as +(?P<ps_remote_as>[0-9]+)$')
-        p81 = re.compile(r'^\s*shutdown$')
-        p82 = re.compile(r'^\s*timers +(?P<ps_keepalive_interval>[0-9]+) +(?P<ps_hodltime>[0-9]+)$')
-        p83 = re.compile(r'^\s*transport connection-mode +(?P<ps_transport_connection_mode>[a-z]+)$')
-        p84 = re.compile(r'^\s*update-source +(?P<ps_update_source>[A-Za-z0-9\/\.]+)$')
-        p85 = re.compile(r'^\s*template peer-policy +(?P<pp_name>.*)$')
-        p86 = re.compile(r'^\s*allowas-in( +(?P<pp_allowas_in_as_number>[0-9]+))?$')
-        p87 = re.compile(r'^\s*as-override$')
-        p88 = re.compile(r'^\s*default-originate( +route-map +(?P<pp_default_originate_route_map>.*))?$')
-        p89 = re.compile(r'^\s*route-map +(?P<pp_route_map_name_in>.*) in$')
-        p90 = re.compile(r'^\s*route-map +(?P<pp_route_map_name_out>.*) out$')
-        p91 = re.compile(r'^\s*maximum-prefix +(?P<pp_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<nbr_af_maximum_prefix_threshold>[0-9]+))?(restart +(?P<nbr_af_maximum_prefix_restart>[0-9]+))?$')
-        p92 = re.compile(r'^\s*maximum-prefix +(?P<pp_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<pp_maximum_prefix_threshold>[0-9]+))?( +(?P<pp_maximum_prefix_warning_only>warning-only))?$')
-        p93 = re.compile(r'^\s*next-hop-self$')
-        p94 = re.compile(r'^\s*route-reflector-client$')
-        p95 = re.compile(r'^\s*send-community$')
-        p96 = re.compile(r'^\s*send-community +extended$')
-        p97 = re.compile(r'^\s*soft-reconfiguration inbound( +(?P<nbr_af_soft_reconfiguration_extra>.*))?$')
-        p98 = re.compile(r'^\s*soo +(?P<pp_soo>.*)$')
-        peer_1 = re.compile(r'template peer +(?P<peer_name>\S+)')
+        p = ShowRunningConfigBgp.patterns
         # Init vars
         bgp_dict = {}
         bgp_id = ''
@@ -6265,7 +5939,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
         for line in out.splitlines():
             line = line.strip()
             # router bgp 333
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 # Coversion to BGP ASN 4260036636(AS-PLAIN) from 65003.28(AS-COLON)
                 bgp_id = m.groupdict()['bgp_id']
@@ -6294,13 +5968,13 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
             if bgp_id:
                 #   shutdown
-                m = p2.match(line)
+                m = p.p2.match(line)
                 if m:
                     bgp_dict['bgp']['instance']['default']['protocol_shutdown'] = True
                     continue
 
                 # evpn
-                m = p2_1.match(line)
+                m = p.p2_1.match(line)
                 if m:
                     if 'vxlan' not in bgp_dict:
                         bgp_dict['vxlan'] = {}
@@ -6309,7 +5983,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                     continue
 
                 # vni 5001 l2
-                m = p2_2.match(line)
+                m = p.p2_2.match(line)
                 if m:
                     vni_flag = True
                     if 'evpn_vni' not in bgp_dict['vxlan']['evpn']:
@@ -6322,14 +5996,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
                 if vni_flag:
                     # rd auto
-                    m = p2_3.match(line)
+                    m = p.p2_3.match(line)
                     if m:
                         bgp_dict['vxlan']['evpn']['evpn_vni'][evpn_vni]['evpn_vni_rd'] = m.groupdict()['rd']
                         continue
 
                     # route-target import auto
                     # route-target export auto
-                    m = p2_4.match(line)
+                    m = p.p2_4.match(line)
                     if m:
                         evpn_vni_rt = m.groupdict()['evpn_vni_rt']
                         if 'evpn_vni_rt' not in bgp_dict['vxlan']['evpn']['evpn_vni'][evpn_vni]:
@@ -6344,7 +6018,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         continue
 
                 # vrf VRF1
-                m = p3.match(line)
+                m = p.p3.match(line)
                 if m:
                     # Get keys
                     vrf = str(m.groupdict()['vrf'])
@@ -6366,7 +6040,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_vrf_dict = bgp_vrf_nondefault_dict
 
                     # rd auto
-                    m = p3_1.match(line)
+                    m = p.p3_1.match(line)
                     if m:
                         bgp_vrf_dict['rd'] = m.groupdict()['rd']
                         continue
@@ -6375,7 +6049,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                     #   bestpath compare-routerid
                     #   bestpath med missing-as-worst
                     #   bestpath always-compare-med
-                    m = p4.match(line)
+                    m = p.p4.match(line)
                     if m:
                         # Get keys
                         best_path = str(m.groupdict()['best_path'])
@@ -6395,27 +6069,27 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         continue
 
                     #   cluster-id <cluster_id>
-                    m = p5.match(line)
+                    m = p.p5.match(line)
                     if m:
                         bgp_vrf_dict['cluster_id'] = str(m.groupdict()['cluster_id'])
                         continue
 
                     #   confederation identifier <confederation_identifier>
-                    m = p6.match(line)
+                    m = p.p6.match(line)
                     if m:
                         bgp_vrf_dict['confederation_identifier'] = \
                             int(m.groupdict()['confederation_identifier'])
                         continue
 
                     #   confederation peers <confederation_peers_as>
-                    m = p7.match(line)
+                    m = p.p7.match(line)
                     if m:
                         bgp_vrf_dict['confederation_peers_as'] = \
                             str(m.groupdict()['confederation_peers_as'])
                         continue
 
                     #   no graceful-restart
-                    m = p8.match(line)
+                    m = p.p8.match(line)
                     if m:
                         bgp_vrf_dict['graceful_restart'] = False
                         continue
@@ -6424,7 +6098,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
                     #   graceful-restart restart-time 121
                     #   graceful-restart stalepath-time 301
-                    m = p9.match(line)
+                    m = p.p9.match(line)
                     if m:
                         graceful_restart_type = str(m.groupdict()['graceful_restart_type'])
                         if graceful_restart_type == 'restart-time':
@@ -6436,7 +6110,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         continue
 
                     #   log-neighbor-changes
-                    m = p10.match(line)
+                    m = p.p10.match(line)
                     if m:
                         bgp_vrf_dict['log_neighbor_changes'] = True
                         continue
@@ -6444,20 +6118,20 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_vrf_dict['log_neighbor_changes'] = False
 
                     #   router-id <router-id>
-                    m = p11.match(line)
+                    m = p.p11.match(line)
                     if m:
                         bgp_vrf_dict['router_id'] = str(m.groupdict()['router_id'])
                         continue
 
                     #   timers bgp <keepalive-interval> <holdtime>
-                    m = p12.match(line)
+                    m = p.p12.match(line)
                     if m:
                         bgp_vrf_dict['keepalive_interval'] = int(m.groupdict()['keepalive_interval'])
                         bgp_vrf_dict['holdtime'] = int(m.groupdict()['holdtime'])
                         continue
 
                     #   no enforce-first-as
-                    m = p13.match(line)
+                    m = p.p13.match(line)
                     if m:
                         bgp_vrf_dict['enforce_first_as'] = False
                         continue
@@ -6465,7 +6139,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_vrf_dict['enforce_first_as'] = True
 
                     #   no fast-external-fallover
-                    m = p14.match(line)
+                    m = p.p14.match(line)
                     if m:
                         bgp_vrf_dict['fast_external_fallover'] = False
                         continue
@@ -6473,14 +6147,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_vrf_dict['fast_external_fallover'] = True
 
                     #   dynamic-med-interval 70
-                    m = p15.match(line)
+                    m = p.p15.match(line)
                     if m:
                         bgp_vrf_dict['dynamic_med_interval'] = \
                             int(m.groupdict()['dynamic_med_interval'])
                         continue
 
                     #   flush-routes
-                    m = p16.match(line)
+                    m = p.p16.match(line)
                     if m:
                         bgp_vrf_dict['flush_routes'] = True
                         continue
@@ -6488,7 +6162,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_vrf_dict['flush_routes'] = False
 
                     #   isolate
-                    m = p17.match(line)
+                    m = p.p17.match(line)
                     if m:
                         bgp_vrf_dict['isolate'] = True
                         continue
@@ -6496,14 +6170,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_vrf_dict['isolate'] = False
 
                     #   disable-policy-batching ipv4 prefix-list <WORD>
-                    m = p18.match(line)
+                    m = p.p18.match(line)
                     if m:
                         bgp_vrf_dict['disable_policy_batching_ipv4'] = \
                             str(m.groupdict()['disable_policy_batching_ipv4'])
                         continue
 
                     #   disable-policy-batching ipv4 prefix-list <WORD>
-                    m = p19.match(line)
+                    m = p.p19.match(line)
                     if m:
                         bgp_vrf_dict['disable_policy_batching_ipv6'] = \
                             str(m.groupdict()['disable_policy_batching_ipv6'])
@@ -6512,7 +6186,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                     if neighbor_id == '' and peer_name == '' or \
                             'af_name' not in bgp_dict['bgp']['instance']['default']['vrf'][vrf]:
                         #   address-family ipv4 multicast
-                        m = p20.match(line)
+                        m = p.p20.match(line)
                         if m:
                             # Get keys
                             af_name = str(m.groupdict()['af_name'])
@@ -6526,7 +6200,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                     if af_name:
                         # route-target both auto
                         # route-target both auto evpn
-                        m = p21_1.match(line)
+                        m = p.p21_1.match(line)
                         if m:
                             bgp_af_dict['af_evpn_vni_rt_type'] = m.groupdict()['af_evpn_vni_rt_type']
                             bgp_af_dict['af_evpn_vni_rt'] = m.groupdict()['af_evpn_vni_rt']
@@ -6535,7 +6209,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         #    <af_dampening_resuse_time> <af_dampening_suppress_time>
                         #    <af_dampening_max_suppress_time> } |
                         #    { route-map <af_dampening_route_map> } ]
-                        m = p21.match(line)
+                        m = p.p21.match(line)
                         if m:
                             bgp_af_dict['af_dampening'] = True
                             bgp_af_dict['af_dampening_half_life_time'] = \
@@ -6549,14 +6223,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #    dampening [ { route-map <af_dampening_route_map> } ]
-                        m = p22.match(line)
+                        m = p.p22.match(line)
                         if m:
                             bgp_af_dict['af_dampening'] = True
                             bgp_af_dict['af_dampening_route_map'] = str(m.groupdict()['af_dampening_route_map'])
                             continue
 
                         #    nexthop route-map <af_nexthop_route_map>
-                        m = p23.match(line)
+                        m = p.p23.match(line)
                         if m:
                             bgp_af_dict['af_nexthop_route_map'] = str(m.groupdict()['af_nexthop_route_map'])
                             continue
@@ -6565,7 +6239,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         #     <af_nexthop_trigger_delay_critical> non-critical
                         #     <af_nexthop_trigger_delay_non_critical> } |
                         #     { no nexthop trigger-delay }
-                        m = p24.match(line)
+                        m = p.p24.match(line)
                         if m:
                             bgp_af_dict['af_nexthop_trigger_enable'] = True
                             bgp_af_dict['af_nexthop_trigger_delay_critical'] = \
@@ -6575,13 +6249,13 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #     {no nexthop trigger-delay }
-                        m = p25.match(line)
+                        m = p.p25.match(line)
                         if m:
                             bgp_af_dict['af_nexthop_trigger_enable'] = False
                             continue
 
                         #     {no client-to-client reflection }
-                        m = p26.match(line)
+                        m = p.p26.match(line)
                         if m:
                             bgp_af_dict['af_client_to_client_reflection'] = False
                             continue
@@ -6589,7 +6263,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             bgp_af_dict['af_client_to_client_reflection'] = True
 
                         #    distance <af_distance_extern_as> <af_distance_internal_as> <af_distance_local> | no distance [ <af_distance_extern_as> <af_distance_internal_as> <af_distance_local> ]
-                        m = p27.match(line)
+                        m = p.p27.match(line)
                         if m:
                             bgp_af_dict['af_distance_extern_as'] = int(m.groupdict()['af_distance_extern_as'])
                             bgp_af_dict['af_distance_internal_as'] = int(m.groupdict()['af_distance_internal_as'])
@@ -6598,7 +6272,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
                         #    maximum-paths <af_maximum_paths_ebgp>
                         #    maximum-paths ibgp <af_maximum_paths_ibgp>
-                        m = p28.match(line)
+                        m = p.p28.match(line)
                         if m:
                             if m.groupdict()['af_maximum_paths_type']:
                                 bgp_af_dict['af_maximum_paths_ibgp'] = int(m.groupdict()['af_maximum_paths_value'])
@@ -6607,32 +6281,32 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #   additional-paths send
-                        m = p28_1.match(line)
+                        m = p.p28_1.match(line)
                         if m:
                             bgp_af_dict['af_additional_paths_send'] = True
                             continue
 
                         #   additional-paths receive
-                        m = p28_2.match(line)
+                        m = p.p28_2.match(line)
                         if m:
                             bgp_af_dict['af_additional_paths_receive'] = True
                             continue
 
                         # default-information originate
-                        m = p28_3.match(line)
+                        m = p.p28_3.match(line)
                         if m:
                             bgp_af_dict['af_default_originate'] = True
                             continue
 
                         #    maximum-paths eibgp <af_maximum_paths_eibgp>
-                        m = p29.match(line)
+                        m = p.p29.match(line)
                         if m:
                             bgp_af_dict['af_maximum_paths_eibgp'] = int(m.groupdict()['af_maximum_paths_eibgp'])
                             continue
 
                         #    aggregate-address <af_aggregate_address_ipv4_address>/<af_aggregate_address_ipv4_mask> [ as-set | summary-only ] +
                         #    aggregate-address <af_v6_aggregate_address_ipv6_address> [ as-set | summary-only ] +
-                        m = p30.match(line)
+                        m = p.p30.match(line)
                         if m:
                             ip_address = str(m.groupdict()['af_aggregate_address_address'])
                             if '::' not in ip_address:
@@ -6661,7 +6335,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
                         #    network { <af_network_number> mask <af_network_mask> } [ route-map <rmap-name> ] +
                         #    network <af_v6_network_number> [ route-map <af_v6_network_route_map> ] +
-                        m = p31.match(line)
+                        m = p.p31.match(line)
                         if m:
                             if m.groupdict()['af_network_mask']:
                                 bgp_af_dict['af_network_number'] = str(m.groupdict()['af_network_number'])
@@ -6675,7 +6349,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #    network { <af_network_number>/<ip-prefix> } [ route-map <rmap-name> ] +
-                        m = p32.match(line)
+                        m = p.p32.match(line)
                         if m:
                             bgp_af_dict['af_network_number'] = str(m.groupdict()['af_network_number'])
                             bgp_af_dict['af_network_mask'] = int(m.groupdict()['af_network_mask'])
@@ -6684,7 +6358,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #    redistribute isis <Isis.pid> route-map <route_policy>
-                        m = p33.match(line)
+                        m = p.p33.match(line)
                         if m:
                             bgp_af_dict['af_redist_isis'] = str(m.groupdict()['af_redist_isis'])
                             bgp_af_dict['af_redist_isis_route_policy'] = \
@@ -6692,7 +6366,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #    redistribute isis <Isis.pid> route-map <route_policy>
-                        m = p34.match(line)
+                        m = p.p34.match(line)
                         if m:
                             bgp_af_dict['af_redist_isis'] = str(m.groupdict()['af_redist_isis'])
                             bgp_af_dict['af_redist_isis_route_policy'] = \
@@ -6701,7 +6375,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
                         #    redistribute ospf <Ospf.pid> route-map <route_policy>
                         #    redistribute ospfv3 <Ospf.pid> route-map <route_policy>
-                        m = p35.match(line)
+                        m = p.p35.match(line)
                         if m:
                             bgp_af_dict['af_redist_ospf'] = str(m.groupdict()['af_redist_ospf'])
                             bgp_af_dict['af_redist_ospf_route_policy'] = \
@@ -6709,7 +6383,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #    Redistribute rip <Rip.pid> route-map <route_policy>
-                        m = p36.match(line)
+                        m = p.p36.match(line)
                         if m:
                             bgp_af_dict['af_redist_rip'] = str(m.groupdict()['af_redist_rip'])
                             bgp_af_dict['af_redist_rip_route_policy'] = \
@@ -6717,7 +6391,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #    redistribute static route-map <route_policy>
-                        m = p37.match(line)
+                        m = p.p37.match(line)
                         if m:
                             bgp_af_dict['af_redist_static'] = True
                             bgp_af_dict['af_redist_static_route_policy'] = \
@@ -6725,7 +6399,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #    redistribute direct route-map <route_policy>
-                        m = p38.match(line)
+                        m = p.p38.match(line)
                         if m:
                             bgp_af_dict['af_redist_connected'] = True
                             bgp_af_dict['af_redist_connected_route_policy'] = \
@@ -6733,30 +6407,30 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #    allocate-label all
-                        m = p39.match(line)
+                        m = p.p39.match(line)
                         if m:
                             bgp_af_dict['af_v6_allocate_label_all'] = True
                             continue
 
                         #    retain route-target all
-                        m = p40.match(line)
+                        m = p.p40.match(line)
                         if m:
                             bgp_af_dict['af_retain_rt_all'] = True
                             continue
 
                         #    label-allocation-mode per-vrf
-                        m = p41.match(line)
+                        m = p.p41.match(line)
                         if m:
                             bgp_af_dict['af_label_allocation_mode'] = str(m.groupdict()['per_vrf'])
                             continue
 
                         #    advertise-pip
-                        m = p103.match(line)
+                        m = p.p103.match(line)
                         if m:
                             bgp_af_dict['af_advertise_pip'] = True
                             continue
                     #   neighbor <neighbor_id>
-                    m = p42.match(line)
+                    m = p.p42.match(line)
                     if m:
                         # Get keys
                         neighbor_id = str(m.groupdict()['neighbor_id'])
@@ -6771,7 +6445,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                     #   Same line of configuration can be configured under the peer session section
                     if neighbor_id:
                         #   bfd
-                        m = p43.match(line)
+                        m = p.p43.match(line)
                         if m:
                             bgp_vrf_neighbor_dict['nbr_fall_over_bfd'] = True
                             continue
@@ -6779,7 +6453,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             bgp_vrf_neighbor_dict['nbr_fall_over_bfd'] = False
 
                         #   capability suppress 4-byte-as
-                        m = p44.match(line)
+                        m = p.p44.match(line)
                         if m:
                             bgp_vrf_neighbor_dict['nbr_suppress_four_byte_as_capability'] = True
                             continue
@@ -6787,14 +6461,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             bgp_vrf_neighbor_dict['nbr_suppress_four_byte_as_capability'] = False
 
                         #   description <nbr_description>
-                        m = p45.match(line)
+                        m = p.p45.match(line)
                         if m:
                             bgp_vrf_neighbor_dict['nbr_description'] = \
                                 str(m.groupdict()['nbr_description'])
                             continue
 
                         #   disable-connected-check
-                        m = p46.match(line)
+                        m = p.p46.match(line)
                         if m:
                             bgp_vrf_neighbor_dict['nbr_disable_connected_check'] = True
                             continue
@@ -6802,7 +6476,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             bgp_vrf_neighbor_dict['nbr_disable_connected_check'] = False
 
                         #   ebgp-multihop <nbr_ebgp_multihop_max_hop>
-                        m = p47.match(line)
+                        m = p.p47.match(line)
                         if m:
                             bgp_vrf_neighbor_dict['nbr_ebgp_multihop'] = True
                             bgp_vrf_neighbor_dict['nbr_ebgp_multihop_max_hop'] = \
@@ -6812,14 +6486,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             bgp_vrf_neighbor_dict['nbr_ebgp_multihop'] = False
 
                         #   inherit peer-session <nbr_inherit_peer_session>
-                        m = p48.match(line)
+                        m = p.p48.match(line)
                         if m:
                             bgp_vrf_neighbor_dict['nbr_inherit_peer_session'] = \
                                 str(m.groupdict()['nbr_inherit_peer_session'])
                             continue
 
                         #    { local-as <nbr_local_as_as_no> [ no-prepend [ replace-as [ dual-as ] ] ] }
-                        m = p49.match(line)
+                        m = p.p49.match(line)
                         if m:
                             bgp_vrf_neighbor_dict['nbr_local_as_as_no'] = \
                                 int(m.groupdict()['nbr_local_as_as_no'])
@@ -6834,14 +6508,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             bgp_vrf_neighbor_dict['nbr_local_as_dual_as'] = False
 
                         #   { remote-as <nbr_remote_as> }
-                        m = p50.match(line)
+                        m = p.p50.match(line)
                         if m:
                             bgp_vrf_neighbor_dict['nbr_remote_as'] = \
                                 int(m.groupdict()['nbr_remote_as'])
                             continue
 
                         #   remove-private-as
-                        m = p51.match(line)
+                        m = p.p51.match(line)
                         if m:
                             bgp_vrf_neighbor_dict['nbr_remove_private_as'] = True
                             continue
@@ -6849,7 +6523,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             bgp_vrf_neighbor_dict['nbr_remove_private_as'] = False
 
                         #   shutdown
-                        m = p52.match(line)
+                        m = p.p52.match(line)
                         if m:
                             bgp_vrf_neighbor_dict['nbr_shutdown'] = True
                             continue
@@ -6857,7 +6531,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             bgp_vrf_neighbor_dict['nbr_shutdown'] = False
 
                         #   timers <nbr_keepalive_interval> <nbr_holdtime>
-                        m = p53.match(line)
+                        m = p.p53.match(line)
                         if m:
                             bgp_vrf_neighbor_dict['nbr_keepalive_interval'] = \
                                 int(m.groupdict()['nbr_keepalive_interval'])
@@ -6866,42 +6540,42 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #   update-source <nbr_update_source>
-                        m = p54.match(line)
+                        m = p.p54.match(line)
                         if m:
                             bgp_vrf_neighbor_dict['nbr_update_source'] = \
                                 str(m.groupdict()['nbr_update_source'])
                             continue
 
                         #   password <nbr_password_text>
-                        m = p55.match(line)
+                        m = p.p55.match(line)
                         if m:
                             bgp_vrf_neighbor_dict['nbr_password_text'] = \
                                 str(m.groupdict()['nbr_password_text'])
                             continue
 
                         #   transport connection-mode <nbr_transport_connection_mode>
-                        m = p56.match(line)
+                        m = p.p56.match(line)
                         if m:
                             bgp_vrf_neighbor_dict['nbr_transport_connection_mode'] = \
                                 str(m.groupdict()['nbr_transport_connection_mode'])
                             continue
 
                         # peer-type fabric-external
-                        m = p101.match(line)
+                        m = p.p101.match(line)
                         if m:
                             bgp_vrf_neighbor_dict\
                                 ['nbr_peer_type'] = m.groupdict()['nbr_peer_type']
                             continue
 
                         # inherit peer GENIE-NEXUS-EBGP
-                        m = p104.match(line)
+                        m = p.p104.match(line)
                         if m:
                             bgp_vrf_neighbor_dict\
                                 ['nbr_inherit_peer'] = m.groupdict()['nbr_inherit_peer']
                             continue
 
                         #   address-family <nbr_af_name>
-                        m = p57.match(line)
+                        m = p.p57.match(line)
                         if m:
                             nbr_af_name = str(m.groupdict()['nbr_af_name'])
                             if 'nbr_af_name' not in bgp_vrf_neighbor_dict:
@@ -6913,7 +6587,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
                         if 'nbr_af_name' in bgp_vrf_neighbor_dict:
                             #   allowas-in [ <allowas-in-cnt> ]
-                            m = p58.match(line)
+                            m = p.p58.match(line)
                             if m:
                                 bgp_vrf_af_dict['nbr_af_allowas_in'] = True
                                 if m.groupdict()['nbr_af_allowas_in_as_number']:
@@ -6924,7 +6598,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 bgp_vrf_af_dict['nbr_af_allowas_in'] = False
 
                             #   inherit peer-policy <nbr_af_inherit_peer_policy> <nbr_af_inherit_peer_seq>
-                            m = p59.match(line)
+                            m = p.p59.match(line)
                             if m:
                                 bgp_vrf_af_dict['nbr_af_inherit_peer_policy'] = \
                                     str(m.groupdict()['nbr_af_inherit_peer_policy'])
@@ -6933,7 +6607,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 continue
 
                             #   maximum-prefix <nbr_af_maximum_prefix_max_prefix_no> [ <nbr_af_maximum_prefix_threshold> ] [ restart <nbr_af_maximum_prefix_restart> ]
-                            m = p60.match(line)
+                            m = p.p60.match(line)
                             if m:
                                 bgp_vrf_af_dict['nbr_af_maximum_prefix_max_prefix_no'] = \
                                     int(m.groupdict()['nbr_af_maximum_prefix_max_prefix_no'])
@@ -6946,7 +6620,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 continue
 
                             #   maximum-prefix <nbr_af_maximum_prefix_max_prefix_no> [ <nbr_af_maximum_prefix_threshold> ] [ warning-only ]
-                            m = p61.match(line)
+                            m = p.p61.match(line)
                             if m:
                                 bgp_vrf_af_dict['nbr_af_maximum_prefix_max_prefix_no'] = \
                                     int(m.groupdict()['nbr_af_maximum_prefix_max_prefix_no'])
@@ -6959,7 +6633,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 continue
 
                             #   route-map <nbr_af_route_map_name_in> in
-                            m = p62.match(line)
+                            m = p.p62.match(line)
                             if m:
                                 if 'no' in line:
                                     bgp_vrf_af_dict['no_nbr_af_route_map_name_in'] = \
@@ -6970,7 +6644,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 continue
 
                             #   route-map <nbr_af_route_map_name_out> out
-                            m = p63.match(line)
+                            m = p.p63.match(line)
                             if m:
                                 if 'no' in line:
                                     bgp_vrf_af_dict['no_nbr_af_route_map_name_out'] = \
@@ -6981,7 +6655,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 continue
 
                             #   route-reflector-client
-                            m = p64.match(line)
+                            m = p.p64.match(line)
                             if m:
                                 bgp_vrf_af_dict['nbr_af_route_reflector_client'] = True
                                 continue
@@ -6989,14 +6663,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 bgp_vrf_af_dict['nbr_af_route_reflector_client'] = False
 
                             #   send-community
-                            m = p65.match(line)
+                            m = p.p65.match(line)
                             if m:
                                 bgp_vrf_af_dict['nbr_af_send_community'] = 'standard'
                                 send_community_standard_match = 'True'
                                 continue
 
                             #   send-community extended
-                            m = p66.match(line)
+                            m = p.p66.match(line)
                             if m:
                                 if send_community_standard_match:
                                     bgp_vrf_af_dict['nbr_af_send_community'] = 'both'
@@ -7005,13 +6679,13 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 continue
 
                             # rewrite-evpn-rt-asn
-                            m = p100.match(line)
+                            m = p.p100.match(line)
                             if m:
                                 bgp_vrf_af_dict['nbr_af_rewrite_evpn_rt_asn'] = True
                                 continue
 
                             #   route-reflector-client
-                            m = p67.match(line)
+                            m = p.p67.match(line)
                             if m:
                                 bgp_vrf_af_dict['nbr_af_soft_reconfiguration'] = True
                                 continue
@@ -7019,7 +6693,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 bgp_vrf_af_dict['nbr_af_soft_reconfiguration'] = False
 
                             #   next-hop-self
-                            m = p68.match(line)
+                            m = p.p68.match(line)
                             if m:
                                 bgp_vrf_af_dict['nbr_af_next_hop_self'] = True
                                 continue
@@ -7027,7 +6701,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 bgp_vrf_af_dict['nbr_af_next_hop_self'] = False
 
                             #   as-override
-                            m = p69.match(line)
+                            m = p.p69.match(line)
                             if m:
                                 bgp_vrf_af_dict['nbr_af_as_override'] = True
                                 continue
@@ -7035,7 +6709,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 bgp_vrf_af_dict['nbr_af_as_override'] = False
 
                             #   default-originate [ route-map <nbr_af_default_originate_route_map> ]
-                            m = p70.match(line)
+                            m = p.p70.match(line)
                             if m:
                                 bgp_vrf_af_dict['nbr_af_default_originate'] = True
                                 if m.groupdict()['nbr_af_default_originate_route_map']:
@@ -7046,13 +6720,13 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 bgp_vrf_af_dict['nbr_af_default_originate'] = False
 
                             #   soo <nbr_af_soo>
-                            m = p71.match(line)
+                            m = p.p71.match(line)
                             if m:
                                 bgp_vrf_af_dict['nbr_af_soo'] = str(m.groupdict()['nbr_af_soo'])
                                 continue
 
                 #   template peer-session PEER-SESSION
-                m = p72.match(line)
+                m = p.p72.match(line)
                 if m:
                     # Get keys
                     ps_name = str(m.groupdict()['ps_name'])
@@ -7065,7 +6739,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
                 if ps_name:
                     #   bfd
-                    m = p73.match(line)
+                    m = p.p73.match(line)
                     if m:
                         # Get keys
                         bgp_ps_dict['ps_fall_over_bfd'] = True
@@ -7074,7 +6748,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_ps_dict['ps_fall_over_bfd'] = False
 
                     #   capability suppress 4-byte-as
-                    m = p74.match(line)
+                    m = p.p74.match(line)
                     if m:
                         bgp_ps_dict['ps_suppress_four_byte_as_capability'] = True
                         continue
@@ -7082,14 +6756,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_ps_dict['ps_suppress_four_byte_as_capability'] = False
 
                     #   description <ps_description>
-                    m = p75.match(line)
+                    m = p.p75.match(line)
                     if m:
                         # Get keys
                         bgp_ps_dict['ps_description'] = str(m.groupdict()['ps_description'])
                         continue
 
                     #   disable-connected-check
-                    m = p76.match(line)
+                    m = p.p76.match(line)
                     if m:
                         bgp_ps_dict['ps_disable_connected_check'] = True
                         continue
@@ -7097,7 +6771,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_ps_dict['ps_disable_connected_check'] = False
 
                     #   ebgp-multihop <ps_ebgp_multihop_max_hop>
-                    m = p77.match(line)
+                    m = p.p77.match(line)
                     if m:
                         bgp_ps_dict['ps_ebgp_multihop'] = True
                         bgp_ps_dict['ps_ebgp_multihop_max_hop'] = int(m.groupdict()['ps_ebgp_multihop_max_hop'])
@@ -7106,7 +6780,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_ps_dict['ps_ebgp_multihop'] = False
 
                     #    { local-as <ps_local_as_as_no> [ no-prepend [ replace-as [ dual-as ] ] ] }
-                    m = p78.match(line)
+                    m = p.p78.match(line)
                     if m:
                         bgp_ps_dict['ps_local_as_as_no'] = str(m.groupdict()['ps_local_as_as_no'])
                         bgp_ps_dict['ps_local_as_no_prepend'] = True
@@ -7119,19 +6793,19 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_ps_dict['ps_local_as_dual_as'] = False
 
                     #   password <ps_password_text>
-                    m = p79.match(line)
+                    m = p.p79.match(line)
                     if m:
                         bgp_ps_dict['ps_password_text'] = str(m.groupdict()['ps_password_text'])
                         continue
 
                     #   { remote-as <ps_remote_as> }
-                    m = p80.match(line)
+                    m = p.p80.match(line)
                     if m:
                         bgp_ps_dict['ps_remote_as'] = int(m.groupdict()['ps_remote_as'])
                         continue
 
                     #   shutdown
-                    m = p81.match(line)
+                    m = p.p81.match(line)
                     if m:
                         bgp_ps_dict['ps_shutdown'] = True
                         continue
@@ -7139,14 +6813,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_ps_dict['ps_shutdown'] = False
 
                     #   timers <ps_keepalive_interval> <ps_hodltime>
-                    m = p82.match(line)
+                    m = p.p82.match(line)
                     if m:
                         bgp_ps_dict['ps_keepalive_interval'] = int(m.groupdict()['ps_keepalive_interval'])
                         bgp_ps_dict['ps_hodltime'] = int(m.groupdict()['ps_hodltime'])
                         continue
 
                     #   transport connection-mode <ps_transport_connection_mode>
-                    m = p83.match(line)
+                    m = p.p83.match(line)
                     if m:
                         bgp_ps_dict['ps_transport_connection_mode'] = \
                             str(m.groupdict()['ps_transport_connection_mode'])
@@ -7158,7 +6832,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         continue
 
                 #   template peer-policy <pp_name>
-                m = p85.match(line)
+                m = p.p85.match(line)
                 if m:
                     # Get keys
                     pp_name = str(m.groupdict()['pp_name'])
@@ -7171,7 +6845,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
                 if pp_name:
                     #   allowas-in [ <allowas-in-cnt> ]
-                    m = p86.match(line)
+                    m = p.p86.match(line)
                     if m:
                         bgp_pp_dict['pp_allowas_in'] = True
                         if m.groupdict()['pp_allowas_in_as_number']:
@@ -7182,7 +6856,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_pp_dict['pp_allowas_in'] = False
 
                     #   as-override
-                    m = p87.match(line)
+                    m = p.p87.match(line)
                     if m:
                         bgp_pp_dict['pp_as_override'] = True
                         continue
@@ -7190,7 +6864,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_pp_dict['pp_as_override'] = False
 
                     #   default-originate [ route-map <pp_default_originate_route_map> ]
-                    m = p88.match(line)
+                    m = p.p88.match(line)
                     if m:
                         bgp_pp_dict['pp_default_originate'] = True
                         if m.groupdict()['pp_default_originate_route_map']:
@@ -7201,21 +6875,21 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_pp_dict['pp_default_originate'] = False
 
                     #   route-map <pp_route_map_name_in> in
-                    m = p89.match(line)
+                    m = p.p89.match(line)
                     if m:
                         bgp_pp_dict['pp_route_map_name_in'] = \
                             str(m.groupdict()['pp_route_map_name_in'])
                         continue
 
                     #   route-map <nbr_af_route_map_name_out> out
-                    m = p90.match(line)
+                    m = p.p90.match(line)
                     if m:
                         bgp_pp_dict['pp_route_map_name_out'] = \
                             str(m.groupdict()['pp_route_map_name_out'])
                         continue
 
                     #    maximum-prefix <pp_maximum_prefix_max_prefix_no> [ <pp_maximum_prefix_threshold> ] [ restart <pp_maximum_prefix_restart> ]
-                    m = p91.match(line)
+                    m = p.p91.match(line)
                     if m:
                         bgp_pp_dict['pp_maximum_prefix_max_prefix_no'] = \
                             int(m.groupdict()['pp_maximum_prefix_max_prefix_no'])
@@ -7226,7 +6900,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         continue
 
                     #   maximum-prefix <pp_maximum_prefix_max_prefix_no> [ <pp_maximum_prefix_threshold> ] [ warning-only ]
-                    m = p92.match(line)
+                    m = p.p92.match(line)
                     if m:
                         bgp_pp_dict['pp_maximum_prefix_max_prefix_no'] = \
                             int(m.groupdict()['pp_maximum_prefix_max_prefix_no'])
@@ -7242,7 +6916,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         continue
 
                     #   next-hop-self
-                    m = p93.match(line)
+                    m = p.p93.match(line)
                     if m:
                         bgp_pp_dict['pp_next_hop_self'] = True
                         continue
@@ -7250,7 +6924,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_pp_dict['pp_next_hop_self'] = False
 
                     #   route-reflector-client
-                    m = p94.match(line)
+                    m = p.p94.match(line)
                     if m:
                         bgp_pp_dict['pp_route_reflector_client'] = True
                         continue
@@ -7258,14 +6932,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_pp_dict['pp_route_reflector_client'] = False
 
                     #   send-community
-                    m = p95.match(line)
+                    m = p.p95.match(line)
                     if m:
                         bgp_pp_dict['pp_send_community'] = 'standard'
                         peer_policy_send_community_standard_match = 'True'
                         continue
 
                     #   send-community extended
-                    m = p96.match(line)
+                    m = p.p96.match(line)
                     if m:
                         if peer_policy_send_community_standard_match:
                             bgp_pp_dict['pp_send_community'] = 'both'
@@ -7274,7 +6948,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         continue
 
                     #   route-reflector-client
-                    m = p97.match(line)
+                    m = p.p97.match(line)
                     if m:
                         bgp_pp_dict['pp_soft_reconfiguration'] = True
                         continue
@@ -7282,13 +6956,13 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_pp_dict['pp_soft_reconfiguration'] = False
 
                     #   soo <pp_soo>
-                    m = p98.match(line)
+                    m = p.p98.match(line)
                     if m:
                         bgp_pp_dict['pp_soo'] = str(m.groupdict()['pp_soo'])
                         continue
 
                 # template peer PEER
-                m = peer_1.match(line)
+                m = p.peer_1.match(line)
                 if m:
                     peer_name = m.groupdict()['peer_name']
                     if 'peer_name' not in bgp_dict['bgp']['instance']['default']:
@@ -7300,7 +6974,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
                 if peer_name != '':
                     #   bfd
-                    m = p73.match(line)
+                    m = p.p73.match(line)
                     if m:
                         # Get keys
                         bgp_peer_dict['peer_fall_over_bfd'] = True
@@ -7310,19 +6984,19 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         continue
 
                     #   { remote-as <remote_as> }
-                    m = p80.match(line)
+                    m = p.p80.match(line)
                     if m:
                         bgp_peer_dict['peer_remote_as'] = int(m.groupdict()['ps_remote_as'])
                         continue
 
                     #   password <password_text>
-                    m = p79.match(line)
+                    m = p.p79.match(line)
                     if m:
                         bgp_peer_dict['peer_password_text'] = str(m.groupdict()['ps_password_text'])
                         continue
 
                     #   address-family <af_name>
-                    m = p57.match(line)
+                    m = p.p57.match(line)
                     if m:
                         peer_af_name = str(m.groupdict()['nbr_af_name'])
                         if 'peer_af_name' not in bgp_peer_dict:
@@ -7335,14 +7009,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                     if 'peer_af_name' in bgp_peer_dict:
 
                         #   send-community
-                        m = p65.match(line)
+                        m = p.p65.match(line)
                         if m:
                             bgp_peer_af_dict['peer_af_send_community'] = 'standard'
                             send_community_standard_match = 'True'
                             continue
 
                         #   maximum-prefix <pp_maximum_prefix_max_prefix_no> [ <pp_maximum_prefix_threshold> ] [ warning-only ]
-                        m = p92.match(line)
+                        m = p.p92.match(line)
                         if m:
                             bgp_peer_af_dict['peer_maximum_prefix_max_prefix_no'] = \
                                 int(m.groupdict()['pp_maximum_prefix_max_prefix_no'])
@@ -7358,7 +7032,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #   next-hop-self
-                        m = p68.match(line)
+                        m = p.p68.match(line)
                         if m:
                             bgp_peer_af_dict['peer_next_hop_self'] = True
                             continue
@@ -7436,6 +7110,40 @@ class ShowBgpAllDampeningFlapStatistics(ShowBgpAllDampeningFlapStatisticsSchema)
     xml_command = 'show bgp all dampening flap-statistics | xml'
     exclude = ['duration']
 
+    patterns = Patterns(
+        p1=r'^Flap +Statistics +for +VRF +'
+           '(?P<vrf_name>[\w\-]+), +address +family +'
+           '(?P<address_family>[\w\s\-]+):$',
+        p2=r'^Dampening +configured, +'
+           '(?P<history_paths>\d+) +history +paths, +'
+           '(?P<dampened_paths>\d+) +dampened +paths$',
+        p2_1=r'^Dampening +not +configured, +'
+             '(?P<history_paths>\d+) +history +paths, +'
+             '(?P<dampened_paths>\d+) +dampened +paths$',
+        p3=r'^Route +Distinguisher: +'
+           '(?P<route_identifier>[\w\.\:]+)$',
+        p4=r'^(?P<status>[\*|d|s|h|\s])?'
+           '(?P<best>[\>|\s])?'
+           '(?P<pathtype>[e|i])?'
+           ' +(?P<network>\S+)'
+           ' +(?P<peer>[\w\/\.\:]+)'
+           ' +(?P<flaps>\d+)'
+           ' +(?P<duration>[\w\:\.]+)'
+           '(?: +(?P<reuse_time>[\w\:\.]+))?'
+           ' +(?P<current_penalty>\d+)\/'
+           '(?P<suppress_limit>\d+)\/(?P<reuse_limit>\d+)$',
+        p4_1=r'^(?P<status>[\*|d|s|h|\s])?'
+             '(?P<best>[\>|\s])?'
+             '(?P<pathtype>[e|i|\s])?'
+             ' +(?P<network>\S+\/\d{1,3})'
+             '(?P<peer>[1|2][\d\.\:]+)'
+             ' +(?P<flaps>\d+)'
+             ' +(?P<duration>[\w\:\.]+)'
+             '(?: +(?P<reuse_time>[\w\:\.]+))?'
+             ' +(?P<current_penalty>\d+)\/'
+             '(?P<suppress_limit>\d+)\/(?P<reuse_limit>\d+)$',
+    )
+
     def cli(self,output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -7447,37 +7155,7 @@ class ShowBgpAllDampeningFlapStatistics(ShowBgpAllDampeningFlapStatisticsSchema)
         sub_dict = {}
         history_paths = None
         dampened_paths = None
-        p1 = re.compile(r'^Flap +Statistics +for +VRF +'
-                            '(?P<vrf_name>[\w\-]+), +address +family +'
-                            '(?P<address_family>[\w\s\-]+):$')
-        p2 = re.compile(r'^Dampening +configured, +'
-                            '(?P<history_paths>\d+) +history +paths, +'
-                            '(?P<dampened_paths>\d+) +dampened +paths$')
-        p2_1 = re.compile(r'^Dampening +not +configured, +'
-                            '(?P<history_paths>\d+) +history +paths, +'
-                            '(?P<dampened_paths>\d+) +dampened +paths$')
-        p3 = re.compile(r'^Route +Distinguisher: +'
-                            '(?P<route_identifier>[\w\.\:]+)$')
-        p4 = re.compile(r'^(?P<status>[\*|d|s|h|\s])?'
-                            '(?P<best>[\>|\s])?'
-                            '(?P<pathtype>[e|i])?'
-                            ' +(?P<network>\S+)'
-                            ' +(?P<peer>[\w\/\.\:]+)'
-                            ' +(?P<flaps>\d+)'
-                            ' +(?P<duration>[\w\:\.]+)'
-                            '(?: +(?P<reuse_time>[\w\:\.]+))?'
-                            ' +(?P<current_penalty>\d+)\/'
-                            '(?P<suppress_limit>\d+)\/(?P<reuse_limit>\d+)$')
-        p4_1 = re.compile(r'^(?P<status>[\*|d|s|h|\s])?'
-                            '(?P<best>[\>|\s])?'
-                            '(?P<pathtype>[e|i|\s])?'
-                            ' +(?P<network>\S+\/\d{1,3})'
-                            '(?P<peer>[1|2][\d\.\:]+)'
-                            ' +(?P<flaps>\d+)'
-                            ' +(?P<duration>[\w\:\.]+)'
-                            '(?: +(?P<reuse_time>[\w\:\.]+))?'
-                            ' +(?P<current_penalty>\d+)\/'
-                            '(?P<suppress_limit>\d+)\/(?P<reuse_limit>\d+)$')
+        p = ShowBgpAllDampeningFlapStatistics.patterns
 
         for line in out.splitlines():
             line = line.strip()
@@ -7492,7 +7170,7 @@ class ShowBgpAllDampeningFlapStatistics(ShowBgpAllDampeningFlapStatisticsSchema)
                 sub_dict['history_paths'] = history_paths
 
             # Flap Statistics for VRF default, address family IPv4 Unicast:
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 address_family = m.groupdict()['address_family'].lower()
                 vrf = m.groupdict()['vrf_name']
@@ -7516,7 +7194,7 @@ class ShowBgpAllDampeningFlapStatistics(ShowBgpAllDampeningFlapStatisticsSchema)
                 continue
 
             # Dampening configured, 0 history paths, 2 dampened paths
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 history_paths = int(m.groupdict()['history_paths'])
                 dampened_paths = int(m.groupdict()['dampened_paths'])
@@ -7524,7 +7202,7 @@ class ShowBgpAllDampeningFlapStatistics(ShowBgpAllDampeningFlapStatisticsSchema)
                 continue
 
             # Dampening not configured, 0 history paths, 0 dampened paths
-            m = p2_1.match(line)
+            m = p.p2_1.match(line)
             if m:
                 history_paths = int(m.groupdict()['history_paths'])
                 dampened_paths = int(m.groupdict()['dampened_paths'])
@@ -7532,7 +7210,7 @@ class ShowBgpAllDampeningFlapStatistics(ShowBgpAllDampeningFlapStatisticsSchema)
                 continue
 
             # Route Distinguisher: 0:0
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 route_identifier = m.groupdict()['route_identifier']
                 if 'route_identifier' not in ret_dict['vrf'][vrf]\
@@ -7551,10 +7229,10 @@ class ShowBgpAllDampeningFlapStatistics(ShowBgpAllDampeningFlapStatisticsSchema)
 
             # d e 10.25.1.0/24       10.106.102.3                38   00:09:36 00:01:40  35/30/10
             # *>e 10.4.0.0/24       192.168.64.1                 1   00:20:56          570/1500/1000
-            m = p4.match(line)
+            m = p.p4.match(line)
 
             # d e [2]:[77][7,0][10.219.39.39,2,656877351][10.70.1.1,22][10.106.102.3,10.246.1.31]/61610.106.102.3                38   00:09:36 00:01:40 34/30/10
-            m1 = p4_1.match(line)
+            m1 = p.p4_1.match(line)
             m = m if m else m1
             if m:
                 network = m.groupdict()['network']
@@ -8127,6 +7805,45 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
     cli_command = 'show bgp peer-template'
     xml_command = 'show bgp peer-template | xml'
 
+    patterns = Patterns(
+        p1=r'^BGP +peer\-template +is +'
+           '(?P<template>[\w\-]+)$',
+        p2=r'^Using +(?P<intf>[\w\-\/\.]+) +as'
+           ' +update +source +for +this +peer$',
+        p3=r'^Peer +is +low\-memory +exempt$',
+        p4=r'^Disable +logging +neighbor +events$',
+        p5=r'^External +BGP +peer +might +be +up +to'
+           ' +(?P<hops>\d+) +hops +away$',
+        p6=r'^Only +passive +connection +setup +allowed$',
+        p23=r'^Neighbor +local\-as +command +not +active$',
+        p7=r'^For +address +family: +(?P<af>[\w\s\-]+)$',
+        p8=r'^Condition\-map +(?P<con_map>[\w\-]+), +'
+           'Advertise\-map +(?P<adv_map>[\w\-]+), +'
+           'Status +(?P<status>[\w\-]+)$',
+        p25=r'^Inbound +soft +reconfiguration +allowed(?: *\(always\))?$',
+        p9=r'^Community +attribute +sent +to +this +neighbor$',
+        p10=r'^Extended +community +attribute +sent +'
+            'to +this +neighbor$',
+        p11=r'^Nexthop(?: +always)? +set +to +local +'
+            'peering +address, +(?P<local_nexthop>[\w\.\:]+)$',
+        p12=r'^Third\-party +Nexthop +will +not +be +computed.$',
+        p13=r'^Maximum +prefixes +allowed +(?P<max_pfx>\d+)$',
+        p14=r'^SOO +Extcommunity: +(?P<soo>[\w\:\.]+)$',
+        p15=r'^Weight: +(?P<weight>\d+)$',
+        p16=r'^Allow +my +ASN +(?P<asn>\d+) +times$',
+        p17=r'^ASN +override +is +(?P<status>\w+)$',
+        p24=r'^Peer +ASN +check +is +disabled$',
+        p18=r'^Inbound +(?P<type>[\w\-\s]+) +configured'
+            ' +is +(?P<name>[\w\-]+)$',
+        p19=r'^Outbound +(?P<type>[\w\-\s]+) +configured'
+            ' +is +(?P<name>[\w\-]+)$',
+        p20=r'^Default +information +originate(, +'
+            'route-map +(?P<map>[\w\-]+))? +(?P<dummy>.*)$',
+        p21=r'^Unsuppress\-map +(?P<map>[\w\-]+) +configured$',
+        p22=r'^Members +of +peer\-template +(?P<peer>[\w\-]+):$',
+        p22_1=r'^(?P<vrf>[\w\-]+): +(?P<neighbor>[\w\:\.]+)$',
+    )
+
     def cli(self,output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -8138,48 +7855,13 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
         sub_dict = {}
         tem_peer = None
 
-        p1 = re.compile(r'^BGP +peer\-template +is +'
-                            '(?P<template>[\w\-]+)$')
-        p2 = re.compile(r'^Using +(?P<intf>[\w\-\/\.]+) +as'
-                            ' +update +source +for +this +peer$')
-        p3 = re.compile(r'^Peer +is +low\-memory +exempt$')
-        p4 = re.compile(r'^Disable +logging +neighbor +events$')
-        p5 = re.compile(r'^External +BGP +peer +might +be +up +to'
-                            ' +(?P<hops>\d+) +hops +away$')
-        p6 = re.compile(r'^Only +passive +connection +setup +allowed$')
-        p23 = re.compile(r'^Neighbor +local\-as +command +not +active$')
-        p7 = re.compile(r'^For +address +family: +(?P<af>[\w\s\-]+)$')
-        p8 = re.compile(r'^Condition\-map +(?P<con_map>[\w\-]+), +'
-                            'Advertise\-map +(?P<adv_map>[\w\-]+), +'
-                            'Status +(?P<status>[\w\-]+)$')
-        p25 = re.compile(r'^Inbound +soft +reconfiguration +allowed(?: *\(always\))?$')
-        p9 = re.compile(r'^Community +attribute +sent +to +this +neighbor$')
-        p10 = re.compile(r'^Extended +community +attribute +sent +'
-                            'to +this +neighbor$')
-        p11 = re.compile(r'^Nexthop(?: +always)? +set +to +local +'
-                            'peering +address, +(?P<local_nexthop>[\w\.\:]+)$')
-        p12 = re.compile(r'^Third\-party +Nexthop +will +not +be +computed.$')
-        p13 = re.compile(r'^Maximum +prefixes +allowed +(?P<max_pfx>\d+)$')
-        p14 = re.compile(r'^SOO +Extcommunity: +(?P<soo>[\w\:\.]+)$')
-        p15 = re.compile(r'^Weight: +(?P<weight>\d+)$')
-        p16 = re.compile(r'^Allow +my +ASN +(?P<asn>\d+) +times$')
-        p17 = re.compile(r'^ASN +override +is +(?P<status>\w+)$')
-        p24 = re.compile(r'^Peer +ASN +check +is +disabled$')
-        p18 = re.compile(r'^Inbound +(?P<type>[\w\-\s]+) +configured'
-                            ' +is +(?P<name>[\w\-]+)$')
-        p19 = re.compile(r'^Outbound +(?P<type>[\w\-\s]+) +configured'
-                            ' +is +(?P<name>[\w\-]+)$')
-        p20 = re.compile(r'^Default +information +originate(, +'
-                            'route-map +(?P<map>[\w\-]+))? +(?P<dummy>.*)$')
-        p21 = re.compile(r'^Unsuppress\-map +(?P<map>[\w\-]+) +configured$')
-        p22 = re.compile(r'^Members +of +peer\-template +(?P<peer>[\w\-]+):$')
-        p22_1 = re.compile(r'^(?P<vrf>[\w\-]+): +(?P<neighbor>[\w\:\.]+)$')
+        p = ShowBgpPeerTemplateCmd.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # BGP peer-template is PEER2
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 template = m.groupdict()['template']
 
@@ -8198,45 +7880,45 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
                 continue
 
             # Using loopback1 as update source for this peer
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 ret_dict['template'][template]['source_interface'] = \
                     m.groupdict()['intf']
                 continue
 
             # Peer is low-memory exempt
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 ret_dict['template'][template]['low_mem_exempt'] = True
                 continue
 
             # Disable logging neighbor events
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 ret_dict['template'][template]['logging_neighbor_events'] = False
                 continue
 
             # External BGP peer might be up to 100 hops away
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 ret_dict['template'][template]['external_bgp_peer_hops_limit'] = \
                     int(m.groupdict()['hops'])
                 continue
 
             # Only passive connection setup allowed
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 ret_dict['template'][template]['passive_only'] = True
                 continue
 
             # Neighbor local-as command not active
-            m = p23.match(line)
+            m = p.p23.match(line)
             if m:
                 ret_dict['template'][template]['local_as_inactive'] = True
                 continue
 
             # For address family: IPv4 Unicast
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 af = m.groupdict()['af'].lower()
 
@@ -8258,7 +7940,7 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
                 continue
 
             # Condition-map DENY_ALL_RM, Advertise-map BLOCK-ALL, Status Advertise
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 sub_dict['condition_map'] = m.groupdict()['con_map']
                 sub_dict['advertise_map'] = m.groupdict()['adv_map']
@@ -8266,63 +7948,63 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
                 continue
 
             # Inbound soft reconfiguration allowed(always)
-            m = p25.match(line)
+            m = p.p25.match(line)
             if m:
                 sub_dict['in_soft_reconfig_allowed'] = True
                 continue
 
             # Community attribute sent to this neighbor
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 sub_dict['send_community'] = True
                 continue
 
             # Extended community attribute sent to this neighbor
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 sub_dict['send_ext_community'] = True
                 continue
 
             # Nexthop always set to local peering address, 0.0.0.0
             # Nexthop set to local peering address, 0.0.0.0
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 sub_dict['local_nexthop'] = m.groupdict()['local_nexthop']
                 continue
 
             # Third-party Nexthop will not be computed.
             # will enhance this when output for third_party_nexthop is enabled
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 sub_dict['third_party_nexthop'] = False
                 continue
 
             # Maximum prefixes allowed 888888888
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 sub_dict['max_pfx'] = int(m.groupdict()['max_pfx'])
                 continue
 
             # SOO Extcommunity: SOO:10.4.1.1:100
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 sub_dict['soo'] = m.groupdict()['soo']
                 continue
 
             # Weight: 9999
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 sub_dict['weight'] = int(m.groupdict()['weight'])
                 continue
 
             # Allow my ASN 10 times
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 sub_dict['allow_as_in'] = int(m.groupdict()['asn'])
                 continue
 
             # ASN override is enabled
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 if m.groupdict()['status'] == 'enabled':
                     sub_dict['as_override'] = True
@@ -8331,14 +8013,14 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
                 continue
 
             # Peer ASN check is disabled
-            m = p24.match(line)
+            m = p.p24.match(line)
             if m:
                 sub_dict['peer_as_check_disabled'] = True
                 continue
 
             # Inbound ip prefix-list configured is LIST123
             # Inbound route-map configured is PERMIT_ROUTE_IPV4_RM
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 name = m.groupdict()['name']
                 policy_type = m.groupdict()['type']
@@ -8355,7 +8037,7 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
 
             # Outbound ip prefix-list configured is LIST456
             # Outbound route-map configured is PERMIT_IPV6_RM
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 name = m.groupdict()['name']
                 policy_type = m.groupdict()['type']
@@ -8372,7 +8054,7 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
 
             # Default information originate, route-map PASS-ALL  Last End-of-RIB sent 0.000000 after session start
             # Default information originate  Last End-of-RIB sent 0.000000 after session start
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 sub_dict['default_originate'] = True
                 if m.groupdict()['map']:
@@ -8382,19 +8064,19 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
             # First convergence 0.000000 after session start with 0 routes sent
 
             # Unsuppress-map ORIGINATE_IPV6 configured
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 sub_dict['unsuppress_map'] = m.groupdict()['map']
                 continue
 
             # Members of peer-template PEER1:
             # default: 10.186.201.1
-            m = p22.match(line)
+            m = p.p22.match(line)
             if m:
                 tem_peer = m.groupdict()['peer']
                 continue
 
-            m = p22_1.match(line)
+            m = p.p22_1.match(line)
             if m and tem_peer:
                 if 'vrf' not in ret_dict['template'][tem_peer]:
                     ret_dict['template'][tem_peer]['vrf'] = {}
@@ -8816,6 +8498,23 @@ class ShowBgpPolicyStatisticsParser(ShowBgpPolicyStatisticsSchema):
         show bgp [vrf <vrf>] <address_family>  policy statistics neighbor <neighbor>
         parser class implements detail parsing mechanisms for cli,xml output"""
     
+    patterns = Patterns(
+        p1=r'^Details +for +VRF +'
+           '(?P<vrf>[\w\-]+)$',
+        p2=r'^Total +count +for +(?P<type>\w+) +rpm +handles: +'
+           '(?P<handles>\d+)$',
+        p3=r'^BGP +policy +statistics +not +available$',
+        p4=r'^route\-map +(?P<name>\S+) +'
+           '(?P<action>\w+) +(?P<seqnum>\d+)$',
+        p5=r'^(?P<command>[\w\s\-\>]+) +'
+           'C: +(?P<compare_count>\d+) +'
+           'M: +(?P<match_count>\d+)$',
+        p6=r'^Total +accept +count +for +policy: +'
+           '(?P<total_accept_count>\d+)$',
+        p7=r'^Total +reject +count +for +policy: +'
+           '(?P<total_reject_count>\d+)$',
+    )
+
     def cli(self, cmd,output=None):
         if output is None:
             out = self.device.execute(cmd)
@@ -8835,26 +8534,13 @@ class ShowBgpPolicyStatisticsParser(ShowBgpPolicyStatisticsSchema):
                 vrf = ''
         else:
             vrf = 'default'
-        p1 = re.compile(r'^Details +for +VRF +'
-                            '(?P<vrf>[\w\-]+)$')
-        p2 = re.compile(r'^Total +count +for +(?P<type>\w+) +rpm +handles: +'
-                            '(?P<handles>\d+)$')
-        p3 = re.compile(r'^BGP +policy +statistics +not +available$')
-        p4 = re.compile(r'^route\-map +(?P<name>\S+) +'
-                            '(?P<action>\w+) +(?P<seqnum>\d+)$')
-        p5 = re.compile(r'^(?P<command>[\w\s\-\>]+) +'
-                            'C: +(?P<compare_count>\d+) +'
-                            'M: +(?P<match_count>\d+)$')
-        p6 = re.compile(r'^Total +accept +count +for +policy: +'
-                            '(?P<total_accept_count>\d+)$')
-        p7 = re.compile(r'^Total +reject +count +for +policy: +'
-                            '(?P<total_reject_count>\d+)$')
+        p = ShowBgpPolicyStatisticsParser.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # Details for VRF default
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
                 nei_flag = True
@@ -8867,10 +8553,10 @@ class ShowBgpPolicyStatisticsParser(ShowBgpPolicyStatisticsSchema):
             # Total count for redistribute rpm handles: 1
             # Total count for neighbor rpm handles: 1
             # Total count for dampening rpm handles: 1
-            m = p2.match(line)
+            m = p.p2.match(line)
 
             # BGP policy statistics not available
-            m1 = p3.match(line)
+            m1 = p.p3.match(line)
 
             if m or m1:
                 if 'vrf' not in ret_dict:
@@ -8888,7 +8574,7 @@ class ShowBgpPolicyStatisticsParser(ShowBgpPolicyStatisticsSchema):
             # route-map Filter-pip deny 10
             # route-map ADD_RT_400_400 permit 10
             # route-map RMAP_DIRECT->BGP_IPV4 permit 10
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 name = m.groupdict()['name']
 
@@ -8919,7 +8605,7 @@ class ShowBgpPolicyStatisticsParser(ShowBgpPolicyStatisticsSchema):
 
             #   match ip address prefix-list pip-prefix                    C: 0      M: 0 
             #   match ip address prefix-list DIRECT->BGP_IPV4              C: 16     M: 0 
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 command = m.groupdict()['command'].strip()
 
@@ -8937,14 +8623,14 @@ class ShowBgpPolicyStatisticsParser(ShowBgpPolicyStatisticsSchema):
                 continue
 
             # Total accept count for policy: 0
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 ret_dict['vrf'][vrf]['route_map'][name][index]['total_accept_count'] = \
                     int(m.groupdict()['total_accept_count'])
                 continue
 
             # Total reject count for policy: 0
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 ret_dict['vrf'][vrf]['route_map'][name][index]['total_reject_count'] = \
                     int(m.groupdict()['total_reject_count'])
@@ -9258,6 +8944,28 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
     xml_command = ['show bgp sessions vrf {vrf} | xml','show bgp sessions | xml']
     exclude = ['last_read', 'last_write']
 
+    patterns = Patterns(
+        p1=r'^Total +peers +(?P<total>\d+), +'
+           'established +peers +(?P<established>\d+)$',
+        p2=r'^ASN +(?P<asn>\d+)$',
+        p3=r'^VRF +(?P<vrf>\S+), +'
+           'local +ASN +(?P<asn>\d+)$',
+        p4=r'^peers +(?P<peer>\d+), +'
+           'established +peers +(?P<established>\d+), +'
+           'local +router\-id +(?P<id>[\w\.\:]+)$',
+        p5=r'^(?P<nei>[\w\.\:]+) +'
+           '(?P<asn>\d+) +'
+           '(?P<dropped>\d+) +'
+           '(?P<last_flap>[\w\.\:]+) *\|'
+           '(?P<last_read>[\w\.\:]+) *\|'
+           '(?P<last_write>[\w\.\:]+) +'
+           '(?P<state>[a-zA-Z]) +'
+           '(?P<local_port>\d+)\/'
+           '(?P<remote_port>\d+) +'
+           '(?P<notifications_sent>\d+)\/'
+           '(?P<notifications_received>\d+)$',
+    )
+
     def cli(self, vrf='',output=None):
         if output is None:
             if vrf:
@@ -9276,31 +8984,13 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
                       'E': 'established',
                       'C': 'closing',
                       'S': 'shutdown'}
-        p1 = re.compile(r'^Total +peers +(?P<total>\d+), +'
-                            'established +peers +(?P<established>\d+)$')
-        p2 = re.compile(r'^ASN +(?P<asn>\d+)$')
-        p3 = re.compile(r'^VRF +(?P<vrf>\S+), +'
-                            'local +ASN +(?P<asn>\d+)$')
-        p4 = re.compile(r'^peers +(?P<peer>\d+), +'
-                            'established +peers +(?P<established>\d+), +'
-                            'local +router\-id +(?P<id>[\w\.\:]+)$')
-        p5 = re.compile(r'^(?P<nei>[\w\.\:]+) +'
-                            '(?P<asn>\d+) +'
-                            '(?P<dropped>\d+) +'
-                            '(?P<last_flap>[\w\.\:]+) *\|'
-                            '(?P<last_read>[\w\.\:]+) *\|'
-                            '(?P<last_write>[\w\.\:]+) +'
-                            '(?P<state>[a-zA-Z]) +'
-                            '(?P<local_port>\d+)\/'
-                            '(?P<remote_port>\d+) +'
-                            '(?P<notifications_sent>\d+)\/'
-                            '(?P<notifications_received>\d+)$')
+        p = ShowBgpSessions.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # Total peers 4, established peers 3
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 ret_dict['total_peers'] = int(m.groupdict()['total'])
                 ret_dict['total_established_peers'] = \
@@ -9308,14 +8998,14 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
                 continue
 
             # ASN 100
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 ret_dict['local_as'] = int(m.groupdict()['asn'])
                 continue
 
 
             # VRF default, local ASN 100
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
                 if 'vrf' not in ret_dict:
@@ -9327,7 +9017,7 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
                 continue
 
             # peers 4, established peers 3, local router-id 10.1.1.1
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 ret_dict['vrf'][vrf]['vrf_peers'] = \
                     int(m.groupdict()['peer'])
@@ -9340,7 +9030,7 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
                 continue
 
             # 10.51.1.101        300 2     00:30:01|never   |never    I   0/0          2/0
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 nei = m.groupdict()['nei']
                 if 'neighbor' not in ret_dict['vrf'][vrf]:
@@ -9652,6 +9342,24 @@ class ShowBgpLabels(ShowBgpLabelsSchema):
     exclude = [
       'table_version']
 
+    patterns = Patterns(
+        p1=r'^BGP +routing +table +information +for +VRF +(?P<vrf>\S+), +'
+           'address +family +(?P<af>[\w\s]+)$',
+        p2=r'^BGP +table +version +is +(?P<ver>\d+), +'
+           '(L|l)ocal +(R|r)outer +ID +is +(?P<router_id>[\w\.\:]+)$',
+        p4=r'^Route +Distinguisher: +(?P<rd>[\w\.\:]+) +'
+           '\(VRF +(?P<vrf>\S+)\)$',
+        p3=r'^(?P<status>s|S|x|d|h|\*)?'
+           '(?P<best>\>)?'
+           ' *(?P<type_code>i|e|c|l|a|r|I)'
+           '(?P<prefix>[\w\/\.\:]+)?'
+           ' +(?P<next_hop>[\w\/\.\:]+)'
+           '(?: +(?P<in_label>\w+)\/(?P<out_label>\w+))?'
+           '(?: +\((?P<vpn>(\S+))\))?$',
+        p3_1=r'^(?P<in_label>\w+)\/(?P<out_label>\w+)'
+             '(?: +\((?P<vpn>(\S+))\))?$',
+    )
+
     def cli(self, address_family, vrf='',output=None):
         assert address_family in ['ipv4 unicast', 'ipv4 multicast',
                                   'ipv6 unicast', 'ipv6 multicast',
@@ -9683,27 +9391,13 @@ class ShowBgpLabels(ShowBgpLabelsSchema):
                          'r': 'redist',
                          'a': 'aggregate',
                          'I': 'injected'}
-        p1 = re.compile(r'^BGP +routing +table +information +for +VRF +(?P<vrf>\S+), +'
-                            'address +family +(?P<af>[\w\s]+)$')
-        p2 = re.compile(r'^BGP +table +version +is +(?P<ver>\d+), +'
-                            '(L|l)ocal +(R|r)outer +ID +is +(?P<router_id>[\w\.\:]+)$')
-        p4 = re.compile(r'^Route +Distinguisher: +(?P<rd>[\w\.\:]+) +'
-                            '\(VRF +(?P<vrf>\S+)\)$')
-        p3 = re.compile(r'^(?P<status>s|S|x|d|h|\*)?'
-                            '(?P<best>\>)?'
-                            ' *(?P<type_code>i|e|c|l|a|r|I)'
-                            '(?P<prefix>[\w\/\.\:]+)?'
-                            ' +(?P<next_hop>[\w\/\.\:]+)'
-                            '(?: +(?P<in_label>\w+)\/(?P<out_label>\w+))?'
-                            '(?: +\((?P<vpn>(\S+))\))?$')
-        p3_1 = re.compile(r'^(?P<in_label>\w+)\/(?P<out_label>\w+)'
-                            '(?: +\((?P<vpn>(\S+))\))?$')
+        p = ShowBgpLabels.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # BGP routing table information for VRF default, address family IPv4 Unicast
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
                 address_family = m.groupdict()['af'].lower()
@@ -9711,7 +9405,7 @@ class ShowBgpLabels(ShowBgpLabelsSchema):
 
             # BGP table version is 7, Local Router ID is 10.106.0.6
             # BGP table version is 3, local router ID is 10.234.1.0
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 if 'vrf' not in ret_dict:
                     ret_dict['vrf'] = {}
@@ -9729,7 +9423,7 @@ class ShowBgpLabels(ShowBgpLabelsSchema):
                 continue
 
             # Route Distinguisher: 10.234.1.0:3    (VRF vrf-9100)
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 rd = m.groupdict()['rd']
                 if 'vrf' not in ret_dict:
@@ -9762,7 +9456,7 @@ class ShowBgpLabels(ShowBgpLabelsSchema):
             # a10.4.0.0/16        0.0.0.0             nolabel/nolabel
             # *>e10.85.0.0/24        10.76.1.101          492288/nolabel (VRF1)
             # *>2001:db8:2913::/112           ::ffff:10.51.1.101
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 prefix_cur = m.groupdict()['prefix']
                 if prefix_cur:
@@ -9817,7 +9511,7 @@ class ShowBgpLabels(ShowBgpLabelsSchema):
 
             #                                           nolabel/16
             #                                           22/17 (VRF1)
-            m = p3_1.match(line)
+            m = p.p3_1.match(line)
             if m:
                 in_label = m.groupdict()['in_label']
                 out_label = m.groupdict()['out_label']
@@ -10146,6 +9840,26 @@ class ShowBgpL2vpnEvpnSummary(ShowBgpL2vpnEvpnSummarySchema):
       'prefixreceived',
       'capablepeers']
 
+    patterns = Patterns(
+        p1=r'^\s*BGP +summary +information +for +VRF +(?P<vrf_name_out>[\w]+),'
+           ' +address +family +(?P<af_name>[\w\s]+)$',
+        p2=r'^\s*BGP +router +identifier +(?P<vrf_router_id>[\d\.]+), +local +AS +number +(?P<vrf_local_as>[\d]+)$',
+        p3=r'^\s*BGP +table +version +is +(?P<tableversion>[\d]+), +(?P<af_name>[\w\s]+)'
+           ' +config +peers +(?P<configuredpeers>[\d]+),'
+           ' +capable +peers +(?P<capablepeers>[\d]+)$',
+        p4=r'^\s*(?P<totalnetworks>[\d]+) +network +entries +and +(?P<totalpaths>[\d]+) +paths +using'
+           ' +(?P<memoryused>[\d]+) +bytes +of +memory$',
+        p5=r'^\s*BGP +attribute +entries +\[(?P<numberattrs>[\d]+)\/(?P<bytesattrs>[\d]+)\],'
+           ' +BGP +AS +path +entries +\[(?P<numberpaths>[\d]+)\/(?P<bytespaths>[\d]+)\]$',
+
+        p6=r'^\s*BGP +community +entries +\[(?P<numbercommunities>[\d]+)\/(?P<bytescommunities>[\d]+)\],'
+           ' +BGP +clusterlist +entries +\[(?P<numberclusterlist>[\d]+)\/(?P<bytesclusterlist>[\d]+)\]$',
+
+        p7=r'^\s*(?P<neighborid>[\d\.]+) +(?P<neighborversion>[\d]+) +(?P<neighboras>[\d]+) +(?P<msgrecvd>[\d]+)'
+           ' +(?P<msgsent>[\d]+) +(?P<neighbortableversion>[\d]+) +(?P<inq>[\d]+) +(?P<outq>[\d]+)'
+           ' +(?P<time>[\w\:]+) +(?P<prefixreceived>[\w\s\)\(]+)$',
+    )
+
     def cli(self,output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -10163,26 +9877,7 @@ class ShowBgpL2vpnEvpnSummary(ShowBgpL2vpnEvpnSummarySchema):
         # Neighbor        V    AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
         # 172.16.205.8      4   200     130     139      155    0    0 02:05:01 0L2ROUTE Summary
 
-        p1 = re.compile(r'^\s*BGP +summary +information +for +VRF +(?P<vrf_name_out>[\w]+),'
-                        ' +address +family +(?P<af_name>[\w\s]+)$')
-        p2 = re.compile(
-            r'^\s*BGP +router +identifier +(?P<vrf_router_id>[\d\.]+), +local +AS +number +(?P<vrf_local_as>[\d]+)$')
-        p3 = re.compile(r'^\s*BGP +table +version +is +(?P<tableversion>[\d]+), +(?P<af_name>[\w\s]+)'
-                        ' +config +peers +(?P<configuredpeers>[\d]+),'
-                        ' +capable +peers +(?P<capablepeers>[\d]+)$')
-        p4 = re.compile(
-            r'^\s*(?P<totalnetworks>[\d]+) +network +entries +and +(?P<totalpaths>[\d]+) +paths +using'
-            ' +(?P<memoryused>[\d]+) +bytes +of +memory$')
-        p5 = re.compile(r'^\s*BGP +attribute +entries +\[(?P<numberattrs>[\d]+)\/(?P<bytesattrs>[\d]+)\],'
-                        ' +BGP +AS +path +entries +\[(?P<numberpaths>[\d]+)\/(?P<bytespaths>[\d]+)\]$')
-
-        p6 = re.compile(r'^\s*BGP +community +entries +\[(?P<numbercommunities>[\d]+)\/(?P<bytescommunities>[\d]+)\],'
-                        ' +BGP +clusterlist +entries +\[(?P<numberclusterlist>[\d]+)\/(?P<bytesclusterlist>[\d]+)\]$')
-
-        p7 = re.compile(
-            r'^\s*(?P<neighborid>[\d\.]+) +(?P<neighborversion>[\d]+) +(?P<neighboras>[\d]+) +(?P<msgrecvd>[\d]+)'
-            ' +(?P<msgsent>[\d]+) +(?P<neighbortableversion>[\d]+) +(?P<inq>[\d]+) +(?P<outq>[\d]+)'
-            ' +(?P<time>[\w\:]+) +(?P<prefixreceived>[\w\s\)\(]+)$')
+        p = ShowBgpL2vpnEvpnSummary.patterns
 
         for line in out.splitlines():
             if line:
@@ -10190,7 +9885,7 @@ class ShowBgpL2vpnEvpnSummary(ShowBgpL2vpnEvpnSummarySchema):
             else:
                 continue
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 instance = 'default'
@@ -10202,14 +9897,14 @@ class ShowBgpL2vpnEvpnSummary(ShowBgpL2vpnEvpnSummarySchema):
                 af_dict = bgp_dict.setdefault('address_family',{}).setdefault(af_name,{})
                 continue
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 bgp_dict.update({'vrf_router_id': group.pop('vrf_router_id')})
                 bgp_dict.update({'vrf_local_as': int(group.pop('vrf_local_as'))})
                 continue
 
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 af_dict.update({'tableversion':int(group.pop('tableversion'))})
@@ -10218,12 +9913,12 @@ class ShowBgpL2vpnEvpnSummary(ShowBgpL2vpnEvpnSummarySchema):
                 continue
 
             m1 = ""
-            if p4.match(line):
-                m1 = p4.match(line)
-            if p5.match(line):
-                m1 = p5.match(line)
-            if p6.match(line):
-                m1 = p6.match(line)
+            if p.p4.match(line):
+                m1 = p.p4.match(line)
+            if p.p5.match(line):
+                m1 = p.p5.match(line)
+            if p.p6.match(line):
+                m1 = p.p6.match(line)
             if m1:
                 group = m1.groupdict()
                 try:
@@ -10233,7 +9928,7 @@ class ShowBgpL2vpnEvpnSummary(ShowBgpL2vpnEvpnSummarySchema):
                 af_dict.update({'dampening':'disabled'})
                 continue
 
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 group = m.groupdict()
                 neighborid = group.pop('neighborid')
@@ -10351,6 +10046,35 @@ class ShowBgpL2vpnEvpnRouteType(ShowBgpL2vpnEvpnRouteTypeSchema):
       'Extcommunity',
       'prefixversion']
 
+    patterns = Patterns(
+        p1=r'^\s*BGP +routing +table +information +for +VRF +(?P<vrf_name_out>[\w]+),'
+           ' +address +family +(?P<af_name>[\w\s]+)$',
+        p2=r'^\s*Route Distinguisher: +(?P<rd>[\w\.\:]+)( +\(ES +(?P<es>[\w\s\[\]\.]+)\))?( +\((?P<rd_vrf>[\w]+)VNI +(?P<rd_vniid>[\d]+)\))?$',
+        p3=r'^\s*BGP routing table entry for +(?P<nonipprefix>[\w\[\]\:\.\/]+), +version +(?P<prefixversion>[\d]+)$',
+        p4=r'^\s*Paths: +\((?P<totalpaths>[\d]+) +available, +best +#(?P<bestpathnr>[\d]+)\)$',
+        p5=r'^\s*Flags: (?P<flag_xmit>[\S\s]+) +on +xmit-list(, +(?P<flags_attr>[\w\s\/\,]+))?$',
+        p6=r'^\s*Multipath: +(?P<multipath>[\w]+)$',
+        p7=r'^\s*Advertised path-id +(?P<path_id>[\d]+)$',
+        p8=r'^\s*Path type: +(?P<path_type>[\w\s\(\)]+), +(?P<pathtypes>[\S\s\,\:\/]+)?$',
+        p9=r'^\s*AS-Path: +(?P<as_path>[\w]+)(, +path locally originated)?(, +path sourced +(?P<internal_external>[\w]+) to AS)?$',
+        p10=r'^\s*(?P<ipnexthop>[\d\.]+) +\((?:(?P<inaccessible>(inaccessible)), +)?metric +(?P<nexthopmetric>[\d]+)\) +from +(?P<neighbor>[\d\.]+)'
+            ' +\((?P<neighborid>[\d\.]+)\)$',
+        p11=r'^\s*Origin +(?P<origin>[\w]+), +(MED +(?P<med>[\w\s]+),)? +localpref +(?P<localpref>[\d]+),'
+            ' +weight +(?P<weight>[\d]+)$',
+        p12=r'^\s*Extcommunity: +(?P<extcommunity>[\w\s\:\.]+)$',
+        p13=r'^\s*Originator: +(?P<originatorid>[\d\.]+) +Cluster +list: +(?P<clusterlist>[\d\.]+)$',
+        p14=r'^\s*Path-id +(?P<path_id>[\d]+) +advertised to peers:$',
+        p15=r'^\s*(?P<advertisedto>[\d\s\.]+)$',
+        p16=r'^\s*Received +label +(?P<inlabel>[\d]+)$',
+
+        # PMSI Tunnel Attribute:
+        p17=r'^\s*(?P<attribute>[\w]+) +Tunnel +Attribute:$',
+        #         flags: 0x00, Tunnel type: Ingress Replication
+        p18=r'^\s*flags: +(?P<flags>[\w]+), +Tunnel type: +(?P<tunnel_type>[\w\s]+)$',
+        #         Label: 10101, Tunnel Id: 10.196.7.7
+        p19=r'^\s*Label: +(?P<label>[\d]+), +Tunnel +Id: +(?P<tunnel_id>[\d\.]+)$',
+    )
+
     def cli(self,route_type,output=None):
         if not route_type:
             out = ""
@@ -10380,32 +10104,7 @@ class ShowBgpL2vpnEvpnRouteType(ShowBgpL2vpnEvpnRouteTypeSchema):
         #     10.121.0.11          10.121.0.22          10.121.0.33          10.121.0.44
         #     10.196.0.11
 
-        p1 = re.compile(r'^\s*BGP +routing +table +information +for +VRF +(?P<vrf_name_out>[\w]+),'
-                        ' +address +family +(?P<af_name>[\w\s]+)$')
-        p2 = re.compile(r'^\s*Route Distinguisher: +(?P<rd>[\w\.\:]+)( +\(ES +(?P<es>[\w\s\[\]\.]+)\))?( +\((?P<rd_vrf>[\w]+)VNI +(?P<rd_vniid>[\d]+)\))?$')
-        p3 = re.compile(r'^\s*BGP routing table entry for +(?P<nonipprefix>[\w\[\]\:\.\/]+), +version +(?P<prefixversion>[\d]+)$')
-        p4 = re.compile(r'^\s*Paths: +\((?P<totalpaths>[\d]+) +available, +best +#(?P<bestpathnr>[\d]+)\)$')
-        p5 = re.compile(r'^\s*Flags: (?P<flag_xmit>[\S\s]+) +on +xmit-list(, +(?P<flags_attr>[\w\s\/\,]+))?$')
-        p6 = re.compile(r'^\s*Multipath: +(?P<multipath>[\w]+)$')
-        p7 = re.compile(r'^\s*Advertised path-id +(?P<path_id>[\d]+)$')
-        p8 = re.compile(r'^\s*Path type: +(?P<path_type>[\w\s\(\)]+), +(?P<pathtypes>[\S\s\,\:\/]+)?$')
-        p9 = re.compile(r'^\s*AS-Path: +(?P<as_path>[\w]+)(, +path locally originated)?(, +path sourced +(?P<internal_external>[\w]+) to AS)?$')
-        p10 = re.compile(r'^\s*(?P<ipnexthop>[\d\.]+) +\((?:(?P<inaccessible>(inaccessible)), +)?metric +(?P<nexthopmetric>[\d]+)\) +from +(?P<neighbor>[\d\.]+)'
-                         ' +\((?P<neighborid>[\d\.]+)\)$')
-        p11 = re.compile(r'^\s*Origin +(?P<origin>[\w]+), +(MED +(?P<med>[\w\s]+),)? +localpref +(?P<localpref>[\d]+),'
-                         ' +weight +(?P<weight>[\d]+)$')
-        p12 = re.compile(r'^\s*Extcommunity: +(?P<extcommunity>[\w\s\:\.]+)$')
-        p13 = re.compile(r'^\s*Originator: +(?P<originatorid>[\d\.]+) +Cluster +list: +(?P<clusterlist>[\d\.]+)$')
-        p14 = re.compile(r'^\s*Path-id +(?P<path_id>[\d]+) +advertised to peers:$')
-        p15 = re.compile(r'^\s*(?P<advertisedto>[\d\s\.]+)$')
-        p16 = re.compile(r'^\s*Received +label +(?P<inlabel>[\d]+)$')
-
-        # PMSI Tunnel Attribute:
-        p17 = re.compile(r'^\s*(?P<attribute>[\w]+) +Tunnel +Attribute:$')
-        #         flags: 0x00, Tunnel type: Ingress Replication
-        p18 = re.compile(r'^\s*flags: +(?P<flags>[\w]+), +Tunnel type: +(?P<tunnel_type>[\w\s]+)$')
-        #         Label: 10101, Tunnel Id: 10.196.7.7
-        p19 = re.compile(r'^\s*Label: +(?P<label>[\d]+), +Tunnel +Id: +(?P<tunnel_id>[\d\.]+)$')
+        p = ShowBgpL2vpnEvpnRouteType.patterns
 
         for line in out.splitlines():
             if line:
@@ -10413,7 +10112,7 @@ class ShowBgpL2vpnEvpnRouteType(ShowBgpL2vpnEvpnRouteTypeSchema):
             else:
                 continue
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 instance = 'default'
@@ -10421,7 +10120,7 @@ class ShowBgpL2vpnEvpnRouteType(ShowBgpL2vpnEvpnRouteTypeSchema):
                 af_name = group.get('af_name').lower()
                 continue
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 bgp_dict = result_dict.setdefault('instance', {}).setdefault(instance, {}).\
@@ -10435,7 +10134,7 @@ class ShowBgpL2vpnEvpnRouteType(ShowBgpL2vpnEvpnRouteTypeSchema):
                     rd_dict.update({'rd_vniid': int(group.pop('rd_vniid'))})
                 continue
 
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 nonipprefix = group.pop('nonipprefix').strip()
@@ -10445,18 +10144,18 @@ class ShowBgpL2vpnEvpnRouteType(ShowBgpL2vpnEvpnRouteTypeSchema):
                 index = 0
                 continue
 
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 prefix_dict.update({k:int(v) for k,v in group.items()})
                 continue
 
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 prefix_dict.update({'on_xmitlist':True})
                 continue
 
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 mpath  = group.pop('multipath').lower()
@@ -10464,13 +10163,13 @@ class ShowBgpL2vpnEvpnRouteType(ShowBgpL2vpnEvpnRouteTypeSchema):
                 continue
 
 
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 group = m.groupdict()
                 path_temp_dict = prefix_dict.setdefault('path',{})
                 continue
 
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 index += 1
                 path_temp_dict = prefix_dict.setdefault('path', {})
@@ -10493,7 +10192,7 @@ class ShowBgpL2vpnEvpnRouteType(ShowBgpL2vpnEvpnRouteTypeSchema):
                     path_dict.update({'pathnolabeledrnh': False})
                 continue
 
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 group = m.groupdict()
                 path_dict['ipnexthop'] = group['ipnexthop']
@@ -10504,7 +10203,7 @@ class ShowBgpL2vpnEvpnRouteType(ShowBgpL2vpnEvpnRouteTypeSchema):
                     path_dict['inaccessible'] = True
                 continue
 
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 group = m.groupdict()
                 path_dict.update({'origin': group.pop('origin').lower()})
@@ -10512,13 +10211,13 @@ class ShowBgpL2vpnEvpnRouteType(ShowBgpL2vpnEvpnRouteTypeSchema):
                 path_dict.update({'weight': int(group.pop('weight'))})
                 continue
 
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 group = m.groupdict()
                 path_dict.update({k: v.split( ) for k, v in group.items()})
                 continue
 
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 group = m.groupdict()
                 path_dict.update({'originatorid': group.pop('originatorid')})
@@ -10526,7 +10225,7 @@ class ShowBgpL2vpnEvpnRouteType(ShowBgpL2vpnEvpnRouteTypeSchema):
                 continue
 
 
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 group = m.groupdict()
                 for k, v in group.items():
@@ -10536,25 +10235,25 @@ class ShowBgpL2vpnEvpnRouteType(ShowBgpL2vpnEvpnRouteTypeSchema):
                         path_dict.update({k:v.split()})
                 continue
 
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 group = m.groupdict()
                 path_dict.update({'inlabel': int(group.pop('inlabel'))})
                 continue
 
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 group = m.groupdict()
                 tunnel_dict = path_dict.setdefault('pmsi_tunnel_attribute',{})
                 continue
 
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 group = m.groupdict()
                 tunnel_dict.update({k:v for k, v in group.items()})
                 continue
 
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 group = m.groupdict()
                 tunnel_dict.update({k: v for k, v in group.items()})
@@ -10797,6 +10496,124 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
       'rtrefreshrecvd',
       'retry']
 
+    patterns = Patterns(
+        p1=r'^\s*BGP +neighbor +is +(?P<neighbor>[\d\.]+), remote AS +(?P<remoteas>[\d]+), +(?P<link>[\w]+) +link,'
+           ' +Peer index +(?P<index>[\d]+)$',
+        p2=r'^\s*BGP version +(?P<version>[\d]+), remote router ID +(?P<remote_id>[\d\.]+)$',
+        p3=r'^\s*BGP +state += +(?P<state>[\w\s\(\)]+), +(?P<up>[\w]+) +for'
+           ' +(?P<elapsedtime>[\w\:]+)(, +retry in +(?P<retry>[\w\:]+))?$',
+        p4=r'^\s*Peer is directly attached, interface +(?P<connectedif>[\w\/]+)$',
+        p5=r'^\s*BFD live-detection is configured and enabled, state is +(?P<bfd_state>[\w]+)?$',
+        p6=r'^\s*TCP MD5 authentication is set \(enabled\)$',
+        p7=r'^\s*Last read +(?P<lastread>[\w\:\.]+), hold time = +(?P<holdtime>[\d]+),'
+           ' +keepalive interval is +(?P<keepalivetime>[\d]+) +seconds$',
+        p8=r'^\s*Last written +(?P<lastwrite>[\w\:\.]+), keepalive timer expiry due +(?P<keepalive>[\w\:]+)$',
+        p9=r'^\s*Received +(?P<msgrecvd>[\d]+) +messages, +(?P<notificationsrcvd>[\d]+) +notifications,'
+           ' +(?P<recvbufbytes>[\d]+)+ bytes in queue$',
+        p10=r'^\s*Sent +(?P<msgsent>[\d]+) messages,'
+            ' +(?P<notificationssent>[\d]+)'
+            ' +notifications, +(?P<sentbytesoutstanding>[\d]+)'
+            '(?:\((?P<totalbytessent>[\d]+)\))? +bytes in queue$',
+        p11=r'^\s*Connections established +(?P<connsestablished>[\d]+), +dropped +(?P<connsdropped>[\d]+)$',
+        p12=r'^\s*Last reset by us +(?P<resettime>[\w]+), +due to +(?P<resetreason>[\w\s]+)$',
+        p13=r'^\s*Last reset by peer +(?P<peerresettime>[\w]+), due to +(?P<peerresetreason>[\w\s]+)$',
+        p14=r'^\s*Dynamic capability: advertised +\(+(?P<cap_advertised>[\w\,\s]+)\) +received +\(+(?P<cap_received>[\w\,\s]+)\)$',
+        p15=r'^\s*Dynamic capability \(old\): +(?P<capolddynamicadvertised>[\w]+)( +(?P<capolddynamicrecvd>[\w\s]+))?$',
+        p16=r'^\s*Route refresh capability \(new\): +(?P<caprradvertised>[\w]+)( +(?P<caprrrecvd>[\w]+))?$',
+        p17=r'^\s*Route refresh capability \(old\): +(?P<capoldrradvertised>[\w]+)( +(?P<capoldrrrecvd>[\w]+))?$',
+        p18=r'^\s*4-Byte AS capability: +(?P<capas4advertised>[\w]+)( +(?P<capas4recvd>[\w]+))?$',
+        p19=r'^\s*Address family +(?P<af_name>[\w\s]+): +(?P<af_advertised>[a][\w]+)( +(?P<af_recvd>[r][\w]+))?$',
+        p20=r'^\s*Graceful Restart capability: +(?P<capgradvertised>[\w]+)( +(?P<capgrrecvd>[\w]+))?$',
+        p20_1=r'^\s*Graceful Restart Parameters:$',
+        p21=r'^\s*Address families advertised to peer:$',
+        p22=r'^(?P<space>\s{4})((?P<gr_af_name>(?!Sent)[\w].*)+)$',
+        p23=r'^\s*Address families received from peer:$',
+        p24_1=r'^\s*Forwarding state preserved by peer for:$',
+        p25=r'^\s*Restart time advertised to peer: +(?P<grrestarttime>[\d]+) +seconds$',
+        p26=r'^\s*Stale time for routes advertised by peer: +(?P<grstaletiem>[\d]+) +seconds$',
+        p27=r'^\s*Restart time advertised by peer: +(?P<grrecvdrestarttime>[\d]+) +seconds$',
+        p28=r'^\s*Extended Next Hop Encoding Capability: +(?P<capextendednhadvertised>[\w]+)( +(?P<capextendednhrecvd>[\w]+))?$',
+        p29=r'^\s*Receive IPv6 next hop encoding Capability for AF:$',
+        p30=r'^\s*(?P<space>\s{4})(?P<capextendednh_af_name>[\w\s]+)$',
+        p31=r'^\s*Opens: +(?P<openssent>[\d]+) +(?P<opensrecvd>[\d]+)$',
+        p32=r'^\s*Notifications: +(?P<notificationssent>[\d]+) +(?P<notificationsrcvd>[\d]+)$',
+        p33=r'^\s*Updates: +(?P<updatessent>[\d]+) +(?P<updatesrecvd>[\d]+)$',
+        p34=r'^\s*Keepalives: +(?P<keepalivesent>[\d]+) +(?P<keepaliverecvd>[\d]+)$',
+        p35=r'^\s*Route Refresh: +(?P<rtrefreshsent>[\d]+) +(?P<rtrefreshrecvd>[\d]+)$',
+        p36=r'^\s*Capability: +(?P<capabilitiessent>[\d]+) +(?P<capabilitiesrecvd>[\d]+)$',
+        p38=r'^\s*Total bytes: +(?P<bytessent>[\d]+) +(?P<bytesrecvd>[\d]+)$',
+        p39=r'^\s*Bytes in queue: +(?P<bytesinqueuesent>[\d]+) +(?P<bytesinqueuerecvd>[\d]+)$',
+        p40=r'^\s*For address family: +(?P<per_af_name>[\w\ ]+)$',
+        p41=r'^\s*BGP table version +(?P<tableversion>[\d]+), neighbor version +(?P<neighbortableversion>[\d]+)$',
+        p42=r'^\s*(?P<pfxrecvd>[\d]+) +accepted paths consume +(?P<pfxbytes>[\d]+) +bytes of memory$',
+        p43=r'^\s*Community attribute sent to this neighbor$',
+        p44=r'^\s*Extended community attribute sent to this neighbor$',
+        p46=r'^\s*Last End-of-RIB received +(?P<lastendribreceived>[\w\:]+) +after session start$',
+        p47=r'^\s*Last End-of-RIB sent +(?P<lastendribsent>[\w\:]+) +after session start$',
+        p48=r'^\s*First convergence +(?P<rrconfigured>[\w\:]+)'
+            ' +after session start with +(?P<pfxbytes>[\d]+) +routes sent$',
+        p49=r'^\s*Local host: +(?P<localaddr>[\d\.]+), Local port: +(?P<localport>[\d\.]+)$',
+        p50=r'^\s*Foreign host: +(?P<remoteaddr>[\d\.]+), Foreign port: +(?P<remoteport>[\d]+)$',
+        p51=r'^\s*fd = +(?P<fd>[\d]+)$',
+
+        # Enhanced error processing: On
+        p52=r'\s*Enhanced error processing\: +(?P<error_processing>\w+)$',
+
+        # 0 discarded attributes
+        p53=r'\s*(?P<discarded_attr>\d) +discarded +attributes$',
+
+        # Last error length received: 0
+        p54=r'\s*Last +error +length +received\: +(?P<last_error_length_sent>\d+)$',
+
+        # Reset error value sent: 0
+        p55=r'\s*Reset +error +value +received(\:)? +(?P<reset_error_value_sent>\d+)$',
+
+        # Reset error sent major: 0 minor: 0
+        p56=r'\s*Reset +error +sent +major\: '
+            r'+(?P<reset_error_sent_major>\d+) +minor\: '
+            r'+(?P<reset_error_sent_minor>\d+)$',
+
+        # Last error length received: 0
+        p57=r'\s*Last +error +length +received\: +(?P<last_error_length_received>\d+)$',
+
+        # Reset error value received 0
+        p58=r'\s*Reset error value received(\:)? +(?P<reset_error_value_received>\d+)$',
+
+        # Reset error received major: 0 minor: 0
+        p59=r'\s*Reset error received major\: '
+            r'+(?P<reset_error_received_major>\d+) +minor\:'
+            r' +(?P<reset_error_received_minor>\d+)$',
+
+        # 10 accepted prefixes (10 paths), consuming 2360 bytes of memory
+        p60=r'\s*(?P<accepted_prefixes>\d+) +accepted prefixes'
+            r' +\(\d+ +paths\)\, +consuming '
+            r'+(?P<memory_consumed_in_bytes>\d+) +bytes +of +memory$',
+
+        # 0 received prefixes treated as withdrawn
+        p61=r'\s*(?P<received_prefixes>\d+) +received '
+            r'+prefixes +treated +as +withdrawn$',
+
+        # 40541 sent prefixes (40541 paths)
+        p62=r'\s*(?P<sent_prefixes>\d+) +sent prefixes +\(\d+ paths\)$',
+
+        # Advertise GW IP is enabled
+        p63=r'\s*Advertise +GW +IP +is +(?P<advertise_gw_ip>\w+)$',
+
+        # Outbound route-map configured is GENIE_TEST, handle obtained
+        p64=r'\s*Outbound +route\-map +configured +is '
+            r'+(?P<outbound_route_map>\w+)\, +handle +obtained$',
+
+        # Last End-of-RIB received 00:00:11 after session start
+        # Last End-of-RIB sent 00:00:06 after session start
+        p65=r'\s*Last +End\-of\-RIB +(?P<action>received|sent) '
+            r'+(?P<time>[\w:]+) +after +session +start$',
+
+        # First convergence 00:00:06 after session start with 18810 routes sent
+        p66=r'\s*First +convergence +(?P<first_convergence>[\w:]+) '
+            r'+after +session +start +with '
+            r'+(?P<convergence_routes_sent>\d+) +routes +sent$',
+    )
+
     def cli(self,output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -10868,121 +10685,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
         # Foreign host: 172.16.205.8, Foreign port: 52715
         # fd = 84
 
-        p1 = re.compile(r'^\s*BGP +neighbor +is +(?P<neighbor>[\d\.]+), remote AS +(?P<remoteas>[\d]+), +(?P<link>[\w]+) +link,'
-                        ' +Peer index +(?P<index>[\d]+)$')
-        p2 = re.compile(r'^\s*BGP version +(?P<version>[\d]+), remote router ID +(?P<remote_id>[\d\.]+)$')
-        p3 = re.compile(r'^\s*BGP +state += +(?P<state>[\w\s\(\)]+), +(?P<up>[\w]+) +for'
-                        ' +(?P<elapsedtime>[\w\:]+)(, +retry in +(?P<retry>[\w\:]+))?$')
-        p4 = re.compile(r'^\s*Peer is directly attached, interface +(?P<connectedif>[\w\/]+)$')
-        p5 = re.compile(r'^\s*BFD live-detection is configured and enabled, state is +(?P<bfd_state>[\w]+)?$')
-        p6 = re.compile(r'^\s*TCP MD5 authentication is set \(enabled\)$')
-        p7 = re.compile(r'^\s*Last read +(?P<lastread>[\w\:\.]+), hold time = +(?P<holdtime>[\d]+),'
-                            ' +keepalive interval is +(?P<keepalivetime>[\d]+) +seconds$')
-        p8 = re.compile(r'^\s*Last written +(?P<lastwrite>[\w\:\.]+), keepalive timer expiry due +(?P<keepalive>[\w\:]+)$')
-        p9 = re.compile(r'^\s*Received +(?P<msgrecvd>[\d]+) +messages, +(?P<notificationsrcvd>[\d]+) +notifications,'
-                        ' +(?P<recvbufbytes>[\d]+)+ bytes in queue$')
-        p10 = re.compile(r'^\s*Sent +(?P<msgsent>[\d]+) messages,'
-                          ' +(?P<notificationssent>[\d]+)'
-                          ' +notifications, +(?P<sentbytesoutstanding>[\d]+)'
-                          '(?:\((?P<totalbytessent>[\d]+)\))? +bytes in queue$')
-        p11 = re.compile(r'^\s*Connections established +(?P<connsestablished>[\d]+), +dropped +(?P<connsdropped>[\d]+)$')
-        p12 = re.compile(r'^\s*Last reset by us +(?P<resettime>[\w]+), +due to +(?P<resetreason>[\w\s]+)$')
-        p13 = re.compile(r'^\s*Last reset by peer +(?P<peerresettime>[\w]+), due to +(?P<peerresetreason>[\w\s]+)$')
-        p14 = re.compile(r'^\s*Dynamic capability: advertised +\(+(?P<cap_advertised>[\w\,\s]+)\) +received +\(+(?P<cap_received>[\w\,\s]+)\)$')
-        p15 = re.compile(r'^\s*Dynamic capability \(old\): +(?P<capolddynamicadvertised>[\w]+)( +(?P<capolddynamicrecvd>[\w\s]+))?$')
-        p16 = re.compile(r'^\s*Route refresh capability \(new\): +(?P<caprradvertised>[\w]+)( +(?P<caprrrecvd>[\w]+))?$')
-        p17 = re.compile(r'^\s*Route refresh capability \(old\): +(?P<capoldrradvertised>[\w]+)( +(?P<capoldrrrecvd>[\w]+))?$')
-        p18 = re.compile(r'^\s*4-Byte AS capability: +(?P<capas4advertised>[\w]+)( +(?P<capas4recvd>[\w]+))?$')
-        p19 = re.compile(r'^\s*Address family +(?P<af_name>[\w\s]+): +(?P<af_advertised>[a][\w]+)( +(?P<af_recvd>[r][\w]+))?$')
-        p20 = re.compile(r'^\s*Graceful Restart capability: +(?P<capgradvertised>[\w]+)( +(?P<capgrrecvd>[\w]+))?$')
-        p20_1 = re.compile(r'^\s*Graceful Restart Parameters:$')
-        p21 = re.compile(r'^\s*Address families advertised to peer:$')
-        p22 = re.compile(r'^(?P<space>\s{4})((?P<gr_af_name>(?!Sent)[\w].*)+)$')
-        p23 = re.compile(r'^\s*Address families received from peer:$')
-        p24_1 = re.compile(r'^\s*Forwarding state preserved by peer for:$')
-        p25 = re.compile(r'^\s*Restart time advertised to peer: +(?P<grrestarttime>[\d]+) +seconds$')
-        p26 = re.compile(r'^\s*Stale time for routes advertised by peer: +(?P<grstaletiem>[\d]+) +seconds$')
-        p27 = re.compile(r'^\s*Restart time advertised by peer: +(?P<grrecvdrestarttime>[\d]+) +seconds$')
-        p28 = re.compile(r'^\s*Extended Next Hop Encoding Capability: +(?P<capextendednhadvertised>[\w]+)( +(?P<capextendednhrecvd>[\w]+))?$')
-        p29 = re.compile(r'^\s*Receive IPv6 next hop encoding Capability for AF:$')
-        p30 = re.compile(r'^\s*(?P<space>\s{4})(?P<capextendednh_af_name>[\w\s]+)$')
-        p31 = re.compile(r'^\s*Opens: +(?P<openssent>[\d]+) +(?P<opensrecvd>[\d]+)$')
-        p32 = re.compile(r'^\s*Notifications: +(?P<notificationssent>[\d]+) +(?P<notificationsrcvd>[\d]+)$')
-        p33 = re.compile(r'^\s*Updates: +(?P<updatessent>[\d]+) +(?P<updatesrecvd>[\d]+)$')
-        p34 = re.compile(r'^\s*Keepalives: +(?P<keepalivesent>[\d]+) +(?P<keepaliverecvd>[\d]+)$')
-        p35 = re.compile(r'^\s*Route Refresh: +(?P<rtrefreshsent>[\d]+) +(?P<rtrefreshrecvd>[\d]+)$')
-        p36 = re.compile(r'^\s*Capability: +(?P<capabilitiessent>[\d]+) +(?P<capabilitiesrecvd>[\d]+)$')
-        p38 = re.compile(r'^\s*Total bytes: +(?P<bytessent>[\d]+) +(?P<bytesrecvd>[\d]+)$')
-        p39 = re.compile(r'^\s*Bytes in queue: +(?P<bytesinqueuesent>[\d]+) +(?P<bytesinqueuerecvd>[\d]+)$')
-        p40 = re.compile(r'^\s*For address family: +(?P<per_af_name>[\w\ ]+)$')
-        p41 = re.compile(r'^\s*BGP table version +(?P<tableversion>[\d]+), neighbor version +(?P<neighbortableversion>[\d]+)$')
-        p42 = re.compile(r'^\s*(?P<pfxrecvd>[\d]+) +accepted paths consume +(?P<pfxbytes>[\d]+) +bytes of memory$')
-        p43 = re.compile(r'^\s*Community attribute sent to this neighbor$')
-        p44 = re.compile(r'^\s*Extended community attribute sent to this neighbor$')
-        p46 = re.compile(r'^\s*Last End-of-RIB received +(?P<lastendribreceived>[\w\:]+) +after session start$')
-        p47 = re.compile(r'^\s*Last End-of-RIB sent +(?P<lastendribsent>[\w\:]+) +after session start$')
-        p48 = re.compile(r'^\s*First convergence +(?P<rrconfigured>[\w\:]+)'
-                         ' +after session start with +(?P<pfxbytes>[\d]+) +routes sent$')
-        p49 = re.compile(r'^\s*Local host: +(?P<localaddr>[\d\.]+), Local port: +(?P<localport>[\d\.]+)$')
-        p50 = re.compile(r'^\s*Foreign host: +(?P<remoteaddr>[\d\.]+), Foreign port: +(?P<remoteport>[\d]+)$')
-        p51 = re.compile(r'^\s*fd = +(?P<fd>[\d]+)$')
-
-        # Enhanced error processing: On
-        p52 = re.compile(r'\s*Enhanced error processing\: +(?P<error_processing>\w+)$')
-
-        # 0 discarded attributes
-        p53 = re.compile(r'\s*(?P<discarded_attr>\d) +discarded +attributes$')
-        
-        # Last error length received: 0 
-        p54 = re.compile(r'\s*Last +error +length +received\: +(?P<last_error_length_sent>\d+)$')
-        
-        # Reset error value sent: 0
-        p55 = re.compile(r'\s*Reset +error +value +received(\:)? +(?P<reset_error_value_sent>\d+)$')
-
-        # Reset error sent major: 0 minor: 0
-        p56 = re.compile(r'\s*Reset +error +sent +major\: '
-                        r'+(?P<reset_error_sent_major>\d+) +minor\: '
-                        r'+(?P<reset_error_sent_minor>\d+)$')
-        
-        # Last error length received: 0
-        p57 = re.compile(r'\s*Last +error +length +received\: +(?P<last_error_length_received>\d+)$')
-
-        # Reset error value received 0
-        p58 = re.compile(r'\s*Reset error value received(\:)? +(?P<reset_error_value_received>\d+)$')
-
-        # Reset error received major: 0 minor: 0
-        p59 = re.compile(r'\s*Reset error received major\: '
-                        r'+(?P<reset_error_received_major>\d+) +minor\:'
-                        r' +(?P<reset_error_received_minor>\d+)$')
-
-        # 10 accepted prefixes (10 paths), consuming 2360 bytes of memory
-        p60 = re.compile(r'\s*(?P<accepted_prefixes>\d+) +accepted prefixes'
-                        r' +\(\d+ +paths\)\, +consuming '
-                        r'+(?P<memory_consumed_in_bytes>\d+) +bytes +of +memory$')
-
-        # 0 received prefixes treated as withdrawn
-        p61 = re.compile(r'\s*(?P<received_prefixes>\d+) +received '
-                        r'+prefixes +treated +as +withdrawn$')
-        
-        # 40541 sent prefixes (40541 paths)
-        p62 = re.compile(r'\s*(?P<sent_prefixes>\d+) +sent prefixes +\(\d+ paths\)$')
-
-        # Advertise GW IP is enabled
-        p63 = re.compile(r'\s*Advertise +GW +IP +is +(?P<advertise_gw_ip>\w+)$')
-
-        # Outbound route-map configured is GENIE_TEST, handle obtained
-        p64 = re.compile(r'\s*Outbound +route\-map +configured +is '
-                        r'+(?P<outbound_route_map>\w+)\, +handle +obtained$')
-
-        # Last End-of-RIB received 00:00:11 after session start
-        # Last End-of-RIB sent 00:00:06 after session start
-        p65 = re.compile(r'\s*Last +End\-of\-RIB +(?P<action>received|sent) '
-                        r'+(?P<time>[\w:]+) +after +session +start$')
-
-        # First convergence 00:00:06 after session start with 18810 routes sent
-        p66 = re.compile(r'\s*First +convergence +(?P<first_convergence>[\w:]+) '
-                        r'+after +session +start +with '
-                        r'+(?P<convergence_routes_sent>\d+) +routes +sent$')
+        p = ShowBgpL2vpnEvpnNeighbors.patterns
 
         for line in out.splitlines():
             if line:
@@ -10990,7 +10693,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
             else:
                 continue
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 instance = 'default'
@@ -11010,27 +10713,27 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
 
             m2 = ""
 
-            if p2.match(line):
-                m2 = p2.match(line)
-            if p4.match(line):
-                m2 = p4.match(line)
-
-            if p6.match(line):
-                m2 = p6.match(line)
-            if p7.match(line):
-                m2 = p7.match(line)
-            if p8.match(line):
-                m2 = p8.match(line)
-            if p9.match(line):
-                m2 = p9.match(line)
-            if p10.match(line):
-                m2 = p10.match(line)
-            if p11.match(line):
-                m2 = p11.match(line)
-            if p12.match(line):
-                m2 = p12.match(line)
-            if p13.match(line):
-                m2 = p13.match(line)
+            if p.p2.match(line):
+                m2 = p.p2.match(line)
+            if p.p4.match(line):
+                m2 = p.p4.match(line)
+
+            if p.p6.match(line):
+                m2 = p.p6.match(line)
+            if p.p7.match(line):
+                m2 = p.p7.match(line)
+            if p.p8.match(line):
+                m2 = p.p8.match(line)
+            if p.p9.match(line):
+                m2 = p.p9.match(line)
+            if p.p10.match(line):
+                m2 = p.p10.match(line)
+            if p.p11.match(line):
+                m2 = p.p11.match(line)
+            if p.p12.match(line):
+                m2 = p.p12.match(line)
+            if p.p13.match(line):
+                m2 = p.p13.match(line)
             if m2:
                 group = m2.groupdict()
                 for k, v in group.items():
@@ -11040,7 +10743,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                         else:
                             neighbor_dict.update({k:v.lower()})
                 continue
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 if group.pop('up') == 'up':
@@ -11056,12 +10759,12 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                             neighbor_dict.update({k:v.lower()})
                 continue
 
-            m= p5.match(line)
+            m= p.p5.match(line)
             if m:
                 neighbor_dict.update({'bfd':True})
                 continue
 
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 group = m.groupdict()
                 mp_ref_gr = group.pop('cap_advertised')
@@ -11081,34 +10784,34 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                     neighbor_dict.update({'capgrdynamicrecvd': True})
                 continue
 
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 neighbor_dict.update({'capolddynamicadvertised': True})
                 neighbor_dict.update({'capolddynamicrecvd':True})
                 continue
 
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
 
                 neighbor_dict.update({'caprradvertised': True})
                 neighbor_dict.update({'caprrrecvd': True})
                 continue
 
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 group = m.groupdict()
                 neighbor_dict.update({'capoldrradvertised': True})
                 neighbor_dict.update({'capoldrrrecvd': True})
                 continue
 
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 group = m.groupdict()
                 neighbor_dict.update({'capas4advertised': True})
                 neighbor_dict.update({'capas4recvd': True})
                 continue
 
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 group = m.groupdict()
                 af = group.pop('af_name').lower()
@@ -11126,23 +10829,23 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 continue
 
 
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 neighbor_dict.update({'capgradvertised':True})
                 neighbor_dict.update({'capgrrecvd':True})
                 continue
 
-            m = p20_1.match(line)
+            m = p.p20_1.match(line)
             if m:
                 gr_flag = True
                 continue
 
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 gr_adv_flag = True
                 continue
 
-            m = p22.match(line)
+            m = p.p22.match(line)
             if m:
                 if gr_flag:
                     group = m.groupdict()
@@ -11167,36 +10870,36 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 recieve_flag = gr_recv_flag = gr_adv_flag = gr_fwd_flag = False
                 continue
 
-            m = p23.match(line)
+            m = p.p23.match(line)
             if m:
 
                 gr_recv_flag = True
                 continue
 
-            m = p24_1.match(line)
+            m = p.p24_1.match(line)
             if m:
                 gr_fwd_flag = True
                 continue
 
-            m = p25.match(line)
+            m = p.p25.match(line)
             if m:
                 group = m.groupdict()
                 neighbor_dict.update({'grrestarttime': int(group.pop('grrestarttime'))})
                 continue
 
-            m = p26.match(line)
+            m = p.p26.match(line)
             if m:
                 group = m.groupdict()
                 neighbor_dict.update({'grstaletiem': int(group.pop('grstaletiem'))})
                 continue
 
-            m = p27.match(line)
+            m = p.p27.match(line)
             if m:
                 group = m.groupdict()
                 neighbor_dict.update({'grrecvdrestarttime': int(group.pop('grrecvdrestarttime'))})
                 continue
 
-            m = p28.match(line)
+            m = p.p28.match(line)
             if m:
                 group = m.groupdict()
                 capextendednhadvertised = group.pop('capextendednhadvertised')
@@ -11207,21 +10910,21 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                     neighbor_dict.update({'capextendednhrecvd': True})
                 continue
 
-            m = p29.match(line)
+            m = p.p29.match(line)
             if m:
                 gr_recv_flag = gr_adv_flag = gr_fwd_flag = False
                 recieve_flag = True
                 continue
 
             m3 = ""
-            if p31.match(line):  m3 =  p31.match(line)
-            if p32.match(line):  m3 =  p32.match(line)
-            if p33.match(line):  m3 =  p33.match(line)
-            if p34.match(line):  m3 =  p34.match(line)
-            if p35.match(line) : m3 =  p35.match(line)
-            if p36.match(line) : m3 =  p36.match(line)
+            if p.p31.match(line):  m3 =  p.p31.match(line)
+            if p.p32.match(line):  m3 =  p.p32.match(line)
+            if p.p33.match(line):  m3 =  p.p33.match(line)
+            if p.p34.match(line):  m3 =  p.p34.match(line)
+            if p.p35.match(line) : m3 =  p.p35.match(line)
+            if p.p36.match(line) : m3 =  p.p36.match(line)
 
-            if p38.match(line) : m3 =  p38.match(line)
+            if p.p38.match(line) : m3 =  p.p38.match(line)
 
 
             if m3:
@@ -11229,7 +10932,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 neighbor_dict.update({k:int(v) for k,v in group.items()})
                 continue
 
-            m = p40.match(line)
+            m = p.p40.match(line)
             if m:
                 group = m.groupdict()
                 per_af_name = group.pop('per_af_name').lower()
@@ -11237,50 +10940,50 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 peraf_dict.update({'per_af_name': per_af_name})
                 continue
 
-            m = p41.match(line)
+            m = p.p41.match(line)
             if m:
                 group = m.groupdict()
                 peraf_dict.update({k:int(v) for k,v in group.items()})
                 continue
 
-            m = p42.match(line)
+            m = p.p42.match(line)
             if m:
                 group = m.groupdict()
                 peraf_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
-            m = p43.match(line)
+            m = p.p43.match(line)
             if m:
                 peraf_dict.update({'sendcommunity': True})
                 continue
 
-            m = p44.match(line)
+            m = p.p44.match(line)
             if m:
                 peraf_dict.update({'sendextcommunity': True})
                 continue
 
 
-            m = p49.match(line)
+            m = p.p49.match(line)
             if m:
                 group = m.groupdict()
                 neighbor_dict.update({'localaddr': group.pop('localaddr')})
                 neighbor_dict.update({'localport': int(group.pop('localport'))})
                 continue
-            m = p50.match(line)
+            m = p.p50.match(line)
             if m:
                 group = m.groupdict()
                 neighbor_dict.update({'remoteaddr':group.pop('remoteaddr')})
                 neighbor_dict.update({'remoteport':int(group.pop('remoteport'))})
                 continue
 
-            m = p51.match(line)
+            m = p.p51.match(line)
             if m:
                 group = m.groupdict()
                 neighbor_dict.update({'fd':int(group.pop('fd'))})
                 continue
 
             # Enhanced error processing: On                
-            m = p52.match(line)
+            m = p.p52.match(line)
             if m:
                 group = m.groupdict()['error_processing']
 
@@ -11294,7 +10997,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 continue
                     
             # 0 discarded attributes
-            m = p53.match(line)
+            m = p.p53.match(line)
             if m:
                 group = m.groupdict()
                 processing_dict = neighbor_dict.setdefault\
@@ -11306,7 +11009,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 continue
 
             # Last error length received: 0 
-            m = p54.match(line)
+            m = p.p54.match(line)
             if m:
                 neighbor_dict.update({'last_error_length_sent': \
                         int(m.groupdict().pop('last_error_length_sent'))})
@@ -11314,7 +11017,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 continue
 
             # Reset error value sent: 0
-            m = p55.match(line)
+            m = p.p55.match(line)
             if m:
                 neighbor_dict.update({'reset_error_value_sent': \
                         int(m.groupdict().pop('reset_error_value_sent'))})
@@ -11322,7 +11025,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 continue
 
             # Reset error sent major: 0 minor: 0
-            m = p56.match(line)
+            m = p.p56.match(line)
             if m:
                 neighbor_dict.update({'reset_error_sent_major': \
                     int(m.groupdict().pop('reset_error_sent_major'))})
@@ -11333,14 +11036,14 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 continue
 
             # Last error length received: 0
-            m = p57.match(line)
+            m = p.p57.match(line)
             if m:
                 neighbor_dict.update({'last_error_length_received': \
                     int(m.groupdict().pop('last_error_length_received'))})
                 continue
 
             # Reset error value received 0
-            m = p58.match(line)
+            m = p.p58.match(line)
             if m:
                 neighbor_dict.update({'reset_error_value_received': \
                     int(m.groupdict().pop('reset_error_value_received'))})
@@ -11348,7 +11051,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 continue
 
             # Reset error received major: 0 minor: 0
-            m = p59.match(line)
+            m = p.p59.match(line)
             if m:
                 neighbor_dict.update({'reset_error_received_major': \
                     int(m.groupdict().pop('reset_error_received_major'))})
@@ -11359,7 +11062,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 continue
 
             # 10 accepted prefixes (10 paths), consuming 2360 bytes of memory
-            m = p60.match(line)
+            m = p.p60.match(line)
             if m:
                 neighbor_dict.update({'accepted_prefixes': \
                     int(m.groupdict().pop('accepted_prefixes'))})
@@ -11370,7 +11073,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 continue
 
             # 0 received prefixes treated as withdrawn
-            m = p61.match(line)
+            m = p.p61.match(line)
             if m:
                 neighbor_dict.update({'received_prefixes': \
                     int(m.groupdict().pop('received_prefixes'))})
@@ -11378,7 +11081,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 continue
 
             # 40541 sent prefixes (40541 paths)
-            m = p62.match(line)
+            m = p.p62.match(line)
             if m:
                 neighbor_dict.update({'sent_prefixes': \
                     int(m.groupdict().pop('sent_prefixes'))})
@@ -11386,7 +11089,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 continue
 
             # Advertise GW IP is enabled
-            m = p63.match(line)
+            m = p.p63.match(line)
             if m:
                 if 'enabled' in m.groupdict('advertise_gw_ip'):
                     neighbor_dict.update({'advertise_gw_ip': \
@@ -11395,7 +11098,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 continue
 
             # Outbound route-map configured is GENIE_TEST, handle obtained
-            m = p64.match(line)
+            m = p.p64.match(line)
             if m:
                 neighbor_dict.update({'outbound_route_map': \
                     m.groupdict().pop('outbound_route_map')})
@@ -11404,7 +11107,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
 
             # Last End-of-RIB received 00:00:11 after session start
             # Last End-of-RIB sent 00:00:06 after session start
-            m = p65.match(line)
+            m = p.p65.match(line)
             if m:
                 group = m.groupdict()
                 if 'received' in group['action']:
@@ -11418,7 +11121,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 continue
 
             # First convergence 00:00:06 after session start with 18810 routes sent
-            m = p66.match(line)
+            m = p.p66.match(line)
             if m:
                 neighbor_dict.update({'first_convergence': \
                     m.groupdict().pop('first_convergence')})
@@ -11451,6 +11154,11 @@ class ShowBgpL2vpnEvpnWord(ShowBgpL2vpnEvpnWordSchema):
 
     cli_command = ['show bgp l2vpn evpn {mac} | grep -b {count1} -a {count2} "best path"','show bgp l2vpn evpn {mac} | be "best path, in rib" n {count2}']
 
+    patterns = Patterns(
+        p1=r'^(?P<next_hop>[0-9\.]+) +\(metric +(?P<metric>[0-9]+)\).*$',
+        p2=r'^Received label +(?P<received_label>[0-9]+).*$',
+    )
+
     def cli(self, mac, count1, count2=None,output=None):
         if output is None:
             if mac and count1:
@@ -11466,13 +11174,12 @@ class ShowBgpL2vpnEvpnWord(ShowBgpL2vpnEvpnWordSchema):
 
         ret_dict = {}
 
-        p1 = re.compile(r'^(?P<next_hop>[0-9\.]+) +\(metric +(?P<metric>[0-9]+)\).*$')
-        p2 = re.compile(r'^Received label +(?P<received_label>[0-9]+).*$')
+        p = ShowBgpL2vpnEvpnWord.patterns
         for line in out.splitlines():
             line = line.strip()
 
             # 10.9.0.101 (metric 9) from 10.4.0.66 (10.4.0.66)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 if 'mac_address' not in ret_dict:
                     ret_dict['mac_address'] = {}
@@ -11484,7 +11191,7 @@ class ShowBgpL2vpnEvpnWord(ShowBgpL2vpnEvpnWordSchema):
                 continue
 
             # Received label 2001001
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
 
                 if 'mac_address' not in ret_dict:
@@ -11569,37 +11276,24 @@ class ShowBgpIpMvpnRouteType(ShowBgpIpMvpnRouteTypeSchema):
       'path'
       'table_version']
 
-    def cli(self, route_type="",vrf="",cmd="",output=None):
-        if output is None:
-            if not cmd:
-                if vrf and route_type:
-                    cmd = self.cli_command[0].format(route_type=route_type,vrf=vrf)
-                if route_type and not vrf:
-                    vrf = 'default'
-                    cmd = self.cli_command[1].format(route_type=route_type)
-                if not route_type and not vrf:
-                    cmd = self.cli_command[2]
-            out = self.device.execute(cmd)
-        else:
-            out = output
-        result_dict = {}
+    patterns = Patterns(
         # BGP routing table information for VRF default, address family IPv4 MVPN
-        p1 = re.compile(r'^\s*BGP +routing +table +information +for +VRF +(?P<vrf>\S+),'
-                ' +address +family +(?P<af>[\w\s]+)$')
+        p1=r'^\s*BGP +routing +table +information +for +VRF +(?P<vrf>\S+),'
+           ' +address +family +(?P<af>[\w\s]+)$',
 
         # BGP table version is 390, Local Router ID is 10.16.2.2
-        p2 = re.compile(r'^\s*BGP +table +version +is +(?P<table_version>[\d]+),'
-                        ' +Local +Router +ID +is +(?P<router_id>[\d\.]+)$')
+        p2=r'^\s*BGP +table +version +is +(?P<table_version>[\d]+),'
+           ' +Local +Router +ID +is +(?P<router_id>[\d\.]+)$',
 
         #    Network            Next Hop            Metric     LocPrf     Weight Path
         # Route Distinguisher: 10.16.2.2:3    (L3VNI 10100)
-        p3 = re.compile(r'^\s*Route +Distinguisher: +(?P<rd>[\d\.\:]+)'
-                        '( +\((L[2|3]VNI|Local VNI:) +(?P<rd_vrf>[\d]+)\))?$')
+        p3=r'^\s*Route +Distinguisher: +(?P<rd>[\d\.\:]+)'
+           '( +\((L[2|3]VNI|Local VNI:) +(?P<rd_vrf>[\d]+)\))?$',
 
         # *>l[5][10.111.1.3][238.8.4.101]/64
-        p4 = re.compile(r'^\s*(?P<statuscode>[s|S|x|d|h|>|s|*\s]+)?'
-                            '(?P<typecode>(i|e|c|l|a|r|I)+)?'
-                            '(?P<prefix>[\w\]\/\:\.\]\[]+)$')
+        p4=r'^\s*(?P<statuscode>[s|S|x|d|h|>|s|*\s]+)?'
+           '(?P<typecode>(i|e|c|l|a|r|I)+)?'
+           '(?P<prefix>[\w\]\/\:\.\]\[]+)$',
 
         #                       Next Hop            Metric     LocPrf     Weight Path
         #                       10.196.7.7                           100          0 i
@@ -11607,10 +11301,26 @@ class ShowBgpIpMvpnRouteType(ShowBgpIpMvpnRouteTypeSchema):
         #                       10.64.4.4                                        0 200 100 i
         #                       0.0.0.0                  0        100      32768 ?
         #                       10.64.4.4              219        0 10 3277 32768 36640 {27016} e
-        p6 = re.compile(
-            r'^\s*(?P<statuscode>[s|S|x|d|h|>|s|*\s]+)?(?P<typecode>('
-            r'i|e|c|l|a|r|I)+)?\s+(?P<ipnexthop>[\d\.]+)?(?P<space1>\s+)?(?P<metric>['
-            r'\d]+)?\s+(?P<localpref>[\d]+)\s+?(?P<weight>[\d]+)( +(?P<path>[0-9\{\}\s]+))? +(?P<origin>[i|e|c|l|a|I|?]+)$')
+        p6=r'^\s*(?P<statuscode>[s|S|x|d|h|>|s|*\s]+)?(?P<typecode>('
+           r'i|e|c|l|a|r|I)+)?\s+(?P<ipnexthop>[\d\.]+)?(?P<space1>\s+)?(?P<metric>['
+           r'\d]+)?\s+(?P<localpref>[\d]+)\s+?(?P<weight>[\d]+)( +(?P<path>[0-9\{\}\s]+))? +(?P<origin>[i|e|c|l|a|I|?]+)$',
+    )
+
+    def cli(self, route_type="",vrf="",cmd="",output=None):
+        if output is None:
+            if not cmd:
+                if vrf and route_type:
+                    cmd = self.cli_command[0].format(route_type=route_type,vrf=vrf)
+                if route_type and not vrf:
+                    vrf = 'default'
+                    cmd = self.cli_command[1].format(route_type=route_type)
+                if not route_type and not vrf:
+                    cmd = self.cli_command[2]
+            out = self.device.execute(cmd)
+        else:
+            out = output
+        result_dict = {}
+        p = ShowBgpIpMvpnRouteType.patterns
 
         for line in out.splitlines():
             if line:
@@ -11618,7 +11328,7 @@ class ShowBgpIpMvpnRouteType(ShowBgpIpMvpnRouteTypeSchema):
             else:
                 continue
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 vrf = group['vrf']
@@ -11633,14 +11343,14 @@ class ShowBgpIpMvpnRouteType(ShowBgpIpMvpnRouteTypeSchema):
                 af_dict.update({'af_name': af})
                 continue
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 af_dict.update({'table_version': group['table_version']})
                 af_dict.update({'router_id': group['router_id']})
                 continue
 
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 rd = group['rd']
@@ -11650,7 +11360,7 @@ class ShowBgpIpMvpnRouteType(ShowBgpIpMvpnRouteTypeSchema):
                     rd_dict.update({'rd_vrf': group['rd_vrf']})
                 continue
 
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 index = 0
                 group = m.groupdict()
@@ -11676,7 +11386,7 @@ class ShowBgpIpMvpnRouteType(ShowBgpIpMvpnRouteTypeSchema):
                     typecode = group['typecode']
                 continue
 
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 index +=1
                 group = m.groupdict()
@@ -11808,78 +11518,78 @@ class ShowBgpIpMvpnSaadDetail(ShowBgpIpMvpnSaadDetailSchema):
       'prefixversion', 
       'bestpathnr']
 
-    def cli(self,vrf="",output=None):
-        if output is None:
-            if vrf:
-                cmd = self.cli_command[0].format(vrf=vrf)
-            else:
-                cmd = self.cli_command[1]
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
-        result_dict = {}
-
+    patterns = Patterns(
         # BGP routing table information for VRF default, address family IPv4 MVPN
-        p1 = re.compile(r'^\s*BGP +routing +table +information +for +VRF +(?P<vrf_name_out>\S+),'
-                        ' +address +family +(?P<af_name>[\w\s]+)$')
+        p1=r'^\s*BGP +routing +table +information +for +VRF +(?P<vrf_name_out>\S+),'
+           ' +address +family +(?P<af_name>[\w\s]+)$',
 
         # Route Distinguisher: 10.16.2.2:3    (L3VNI 10100)
-        p2 = re.compile(r'^\s*Route Distinguisher: +(?P<rd>[\w\.\:]+)'
-                        '( +\((L[2|3]VNI|Local VNI:) +(?P<rd_vrf>[\d]+)\))?$')
+        p2=r'^\s*Route Distinguisher: +(?P<rd>[\w\.\:]+)'
+           '( +\((L[2|3]VNI|Local VNI:) +(?P<rd_vrf>[\d]+)\))?$',
 
         # BGP routing table entry for [5][10.111.1.3][238.8.4.s101]/64, version 388
-        p3 = re.compile(
-            r'^\s*BGP +routing +table +entry +for +(?P<nonipprefix>[\d\[\]\:\.\/]+),'
-            ' +version +(?P<prefixversion>[\d]+)$')
+        p3=r'^\s*BGP +routing +table +entry +for +(?P<nonipprefix>[\d\[\]\:\.\/]+),'
+           ' +version +(?P<prefixversion>[\d]+)$',
 
         # Paths: (1 available, best #1)
-        p4 = re.compile(r'^\s*Paths: +\((?P<totalpaths>[\d]+) +available,'
-                        ' +best +#(?P<bestpathnr>[\d]+)\)$')
+        p4=r'^\s*Paths: +\((?P<totalpaths>[\d]+) +available,'
+           ' +best +#(?P<bestpathnr>[\d]+)\)$',
 
         # Flags: (0x000002)(high32 00000000) on xmit-list, is not in mvpn
         # Flags: (0x000002)(high32 00000000) on xmit-list, is not in mvpn, is not in HW
-        p5 = re.compile(r'^\s*Flags: (?P<flag_xmit>[\S\s]+) +on +xmit-list'
-            '(, +(?P<flags_attr>[\w\s\/\,]+))?$')
+        p5=r'^\s*Flags: (?P<flag_xmit>[\S\s]+) +on +xmit-list'
+           '(, +(?P<flags_attr>[\w\s\/\,]+))?$',
 
         #   Advertised path-id 1
-        p7 = re.compile(r'^\s*Advertised path-id +(?P<path_id>[\d]+)$')
+        p7=r'^\s*Advertised path-id +(?P<path_id>[\d]+)$',
 
         # Path type: local, path is valid, is best path, no labeled nexthop
         # Path type: internal, path is invalid(rnh not resolved),
         #        not best reason: Neighbor Address, no labeled nexthop
-        p8 = re.compile(r'^\s*Path type: +(?P<path_type>[\w\s\(\)]+),'
-                        ' +(?P<pathtypes>[\S\s\,\:\/\(\)]+)?$')
+        p8=r'^\s*Path type: +(?P<path_type>[\w\s\(\)]+),'
+           ' +(?P<pathtypes>[\S\s\,\:\/\(\)]+)?$',
 
         #   AS-Path: NONE, path locally originated
-        p9 = re.compile(
-            r'^\s*AS-Path: +(?P<as_path>[\w]+)(, +path locally originated)?'
-                '(, +path sourced +(?P<internal_external>[\w]+) to AS)?$')
+        p9=r'^\s*AS-Path: +(?P<as_path>[\w]+)(, +path locally originated)?'
+           '(, +path sourced +(?P<internal_external>[\w]+) to AS)?$',
 
         #     0.0.0.0 (metric 0) from 0.0.0.0 (10.16.2.2)
         #     10.144.6.6 (inaccessible, metric 4294967295) from 10.64.4.4 (10.64.4.4)
-        p10 = re.compile(
-            r'^\s*(?P<ipnexthop>[\d\.]+) +\(((?P<nexthop_status>[\w]+), )?metric +(?P<nexthopmetric>[\d]+)\)'
+        p10=r'^\s*(?P<ipnexthop>[\d\.]+) +\(((?P<nexthop_status>[\w]+), )?metric +(?P<nexthopmetric>[\d]+)\)'
             ' +from +(?P<neighbor>[\d\.]+)'
-            ' +\((?P<neighborid>[\d\.]+)\)$')
+            ' +\((?P<neighborid>[\d\.]+)\)$',
 
         #       Origin IGP, MED not set, localpref 100, weight 32768
-        p11 = re.compile(r'^\s*Origin +(?P<origin>[\w]+), +(MED +(?P<med>[\w\s]+),)?'
-                         ' +localpref +(?P<localpref>[\d]+),'
-                         ' +weight +(?P<weight>[\d]+)$')
+        p11=r'^\s*Origin +(?P<origin>[\w]+), +(MED +(?P<med>[\w\s]+),)?'
+            ' +localpref +(?P<localpref>[\d]+),'
+            ' +weight +(?P<weight>[\d]+)$',
 
         #       Extcommunity: RT:100:10100
-        p12 = re.compile(r'^\s*Extcommunity: +(?P<extcommunity>[\w\s\:\.]+)$')
+        p12=r'^\s*Extcommunity: +(?P<extcommunity>[\w\s\:\.]+)$',
 
-        # Originator: 10.144.6.6 Cluster list: 10.100.5.5 
-        p13 = re.compile(r'^\s*Originator: +(?P<originatorid>[\d\.]+)'
-                         ' +Cluster +list: +(?P<clusterlist>[\d\.]+)$')
+        # Originator: 10.144.6.6 Cluster list: 10.100.5.5
+        p13=r'^\s*Originator: +(?P<originatorid>[\d\.]+)'
+            ' +Cluster +list: +(?P<clusterlist>[\d\.]+)$',
 
         #   Path-id 1 advertised to peers:
-        #     10.64.4.4            10.100.5.5        
-        p14 = re.compile(r'^\s*Path-id +(?P<path_id>[\d]+) +advertised to peers:$')
-        p15 = re.compile(r'^\s*(?P<advertisedto>[\d\s\.]+)$')
+        #     10.64.4.4            10.100.5.5
+        p14=r'^\s*Path-id +(?P<path_id>[\d]+) +advertised to peers:$',
+        p15=r'^\s*(?P<advertisedto>[\d\s\.]+)$',
+    )
+
+    def cli(self,vrf="",output=None):
+        if output is None:
+            if vrf:
+                cmd = self.cli_command[0].format(vrf=vrf)
+            else:
+                cmd = self.cli_command[1]
+            out = self.device.execute(cmd)
+        else:
+            out = output
+
+        result_dict = {}
 
+        p = ShowBgpIpMvpnSaadDetail.patterns
 
         for line in out.splitlines():
             if line:
@@ -11887,7 +11597,7 @@ class ShowBgpIpMvpnSaadDetail(ShowBgpIpMvpnSaadDetailSchema):
             else:
                 continue
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 instance = 'default'
@@ -11895,7 +11605,7 @@ class ShowBgpIpMvpnSaadDetail(ShowBgpIpMvpnSaadDetailSchema):
                 af_name = group['af_name'].lower()
                 continue
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 bgp_dict = result_dict.setdefault('instance', {}).setdefault(instance, {}).\
@@ -11910,7 +11620,7 @@ class ShowBgpIpMvpnSaadDetail(ShowBgpIpMvpnSaadDetailSchema):
                     rd_dict.update({'rd_vrf': group['rd_vrf'].lower()})
                 continue
 
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 nonipprefix = group['nonipprefix'].strip()
@@ -11920,24 +11630,24 @@ class ShowBgpIpMvpnSaadDetail(ShowBgpIpMvpnSaadDetailSchema):
                 index = 0
                 continue
 
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 prefix_dict.update({k:int(v) for k,v in group.items()})
                 continue
 
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 prefix_dict.update({'on_xmitlist':True})
                 continue
 
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 group = m.groupdict()
                 path_temp_dict = prefix_dict.setdefault('path',{})
                 continue
 
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 index += 1
                 path_temp_dict = prefix_dict.setdefault('path', {})
@@ -11963,7 +11673,7 @@ class ShowBgpIpMvpnSaadDetail(ShowBgpIpMvpnSaadDetailSchema):
                     path_dict.update({'pathnolabeledrnh': False})
                 continue
 
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 group = m.groupdict()
                 path_dict.update({k:v for k,v in group.items()})
@@ -11972,7 +11682,7 @@ class ShowBgpIpMvpnSaadDetail(ShowBgpIpMvpnSaadDetailSchema):
                     path_dict.pop('nexthop_status')
                 continue
 
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 group = m.groupdict()
                 path_dict.update({'origin': group['origin'].lower()})
@@ -11980,13 +11690,13 @@ class ShowBgpIpMvpnSaadDetail(ShowBgpIpMvpnSaadDetailSchema):
                 path_dict.update({'weight': int(group['weight'])})
                 continue
 
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 group = m.groupdict()
                 path_dict.update({k: sorted(v.split( )) for k, v in group.items()})
                 continue
 
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 group = m.groupdict()
                 path_dict.update({'originatorid': group['originatorid']})
@@ -11994,7 +11704,7 @@ class ShowBgpIpMvpnSaadDetail(ShowBgpIpMvpnSaadDetailSchema):
                 continue
 
 
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 group = m.groupdict()
                 for k, v in group.items():
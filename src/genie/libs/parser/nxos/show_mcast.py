@@ -16,6 +16,7 @@ import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 from genie.libs.parser.nxos.show_vrf import  ShowVrf
+from genie.libs.parser.utils.session import cached_parse
 
 # ===================================
 # Parser for 'show ip mroute vrf all'
@@ -838,14 +839,16 @@ class ShowForwardingDistributionMulticastRoute(ShowForwardingDistributionMultica
         'num_of_oifs',
         'oifs']
 
+    # 'show vrf' runs on the device
+    device_lookups = True
+
     def cli(self, vrf="", output=None):
         # finding vrf names
         vrf_dict = {}
 
         if vrf:
             if vrf == 'all':
-                showparser = ShowVrf(device=self.device)
-                vrfs_list = showparser.parse()
+                vrfs_list = cached_parse(ShowVrf, self.device)
                 for vrf_name in vrfs_list['vrfs'].keys():
                     vrf_id = vrfs_list['vrfs'][vrf_name]['vrf_id']
                     vrf_dict.update({vrf_id: vrf_name})
@@ -51,6 +51,9 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.stream import iter_lines
+from genie.libs.parser.utils.records import RecordParser, merge_record
+from genie.libs.parser.utils.interning import intern_parsed
 
 # =================================
 # Parser for 'show routing vrf all'
@@ -547,7 +550,7 @@ class ShowIpRouteSchema(MetaParser):
 # show ip route vrf all
 # show ip route
 # ====================================================
-class ShowIpRoute(ShowIpRouteSchema):
+class ShowIpRoute(ShowIpRouteSchema, RecordParser):
     """Parser for :
         'show ip route {route} {protocol} interface {interface} vrf {vrf}',
         'show ip route {route} {protocol} interface {interface}',
@@ -588,7 +591,29 @@ class ShowIpRoute(ShowIpRouteSchema):
     exclude = [
         'updated']
 
+    record_keys = ('vrf', 'address_family')
+
+    # Low cardinality values, see intern_parsed()
+    intern_fields = ['vrf', 'address_family', 'process_id', 'source_protocol',
+                     'source_protocol_status', 'next_hop', 'next_hop_vrf',
+                     'next_hop_af', 'outgoing_interface', 'encap', 'tunnelid']
+
     def cli(self, route=None, protocol=None, vrf=None, interface=None, output=None, cmd=None):
+        return intern_parsed(self, self.aggregate(self.cli_iter(
+            route=route, protocol=protocol, vrf=vrf, interface=interface,
+            output=output, cmd=cmd)))
+
+    def add_record(self, parsed, record):
+        routes_dict = parsed.setdefault('vrf', {}).setdefault(record['vrf'], {}). \
+                             setdefault('address_family', {}). \
+                             setdefault(record['address_family'], {}). \
+                             setdefault('routes', {})
+        if 'route' in record:
+            merge_record(routes_dict.setdefault(record['route'], {}),
+                         self.record_data(record))
+
+    def cli_iter(self, route=None, protocol=None, vrf=None, interface=None, output=None, cmd=None):
+        """Yield one record per route table header and one per route"""
 
         # execute command to get output
         if output is None:
@@ -679,7 +704,9 @@ class ShowIpRoute(ShowIpRouteSchema):
         if not cmd:
             cmd = 'ipv4'
         af = 'ipv6' if 'v6' in cmd else 'ipv4'
-        result_dict = {}
+        # Routes listed before any table header are in the default vrf
+        table_vrf = 'default'
+        route_dict = None
 
         # IP Route Table for VRF "default"
         # IP Route Table for Context "default"
@@ -723,7 +750,7 @@ class ShowIpRoute(ShowIpRouteSchema):
         #    tag 100
         p4 = re.compile(r'^tag +(?P<tag>\d+)$')
 
-        for line in out.splitlines():
+        for line in iter_lines(out):
             line = line.strip()
 
             # IP Route Table for VRF "default"
@@ -731,15 +758,15 @@ class ShowIpRoute(ShowIpRouteSchema):
             # IPv6 Routing Table for VRF "default"
             m = p1.match(line)
             if m:
-                if 'vrf' not in result_dict:
-                    vrfs_dict = result_dict.setdefault('vrf', {})
+                if route_dict is not None:
+                    yield route_dict
+                    route_dict = None
 
                 group = m.groupdict()
-                vrf = group['vrf']
+                table_vrf = group['vrf']
                 af = 'ipv6' if 'v6' in group['af'] else 'ipv4'
 
-                routes_dict = vrfs_dict.setdefault(vrf, {}).setdefault('address_family', {}). \
-                                        setdefault(af, {}).setdefault('routes', {})
+                yield {'vrf': table_vrf, 'address_family': af}
                 continue
 
             # 10.4.1.1/32, ubest/mbest: 2/0
@@ -771,12 +798,9 @@ class ShowIpRoute(ShowIpRouteSchema):
                 if groups['attached']:
                     attached = True if 'attached' in groups['attached'] else False
 
-                # if vrf:
-                if 'vrf' not in result_dict:
-                    routes_dict = result_dict.setdefault('vrf', {}).setdefault('default', {}). \
-                        setdefault('address_family', {}).setdefault(af, {}). \
-                        setdefault('routes', {})
-                route_dict = routes_dict.setdefault(route, {})
+                if route_dict is not None:
+                    yield route_dict
+                route_dict = {'vrf': table_vrf, 'address_family': af}
                 route_dict.update({'route': route})
                 route_dict.update({'active': active})
 
@@ -952,7 +976,8 @@ class ShowIpRoute(ShowIpRouteSchema):
                 if groups['tag']:
                     route_dict.update({'tag': int(groups['tag'])})
 
-        return result_dict
+        if route_dict is not None:
+            yield route_dict
 
 
 # ====================================================
@@ -1117,6 +1142,10 @@ class ShowRouting(ShowIpRoute):
     cli_command = ['show routing', 'show routing {protocol}']
 
     def cli(self, protocol=None, route=None, vrf=None, interface=None, output=None, cmd=None):
+        return self.aggregate(self.cli_iter(protocol=protocol, route=route, vrf=vrf,
+                                            interface=interface, output=output, cmd=cmd))
+
+    def cli_iter(self, protocol=None, route=None, vrf=None, interface=None, output=None, cmd=None):
 
         if output is None:
             if protocol:
@@ -1129,7 +1158,8 @@ class ShowRouting(ShowIpRoute):
         else:
             out = output
 
-        return super().cli(protocol=protocol, route=route, vrf=vrf, interface=interface, output=out, cmd=cmd)
+        yield from super().cli_iter(protocol=protocol, route=route, vrf=vrf, interface=interface,
+                                    output=out, cmd=cmd)
 
 
 
@@ -15,6 +15,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.session import cached_execute_many, cached_parse
 
 # =====================
 # Parser for 'show vrf'
@@ -299,14 +300,17 @@ class ShowRunningConfigVrf(ShowRunningConfigVrfSchema):
             vrf_list.append(vrf)
 
         else:
-            showVrf = ShowVrf(device=self.device)
-            vrfs = showVrf.parse()
+            vrfs = cached_parse(ShowVrf, self.device)
             for vrf in vrfs['vrfs'].keys():
                 vrf_list.append(vrf)
 
 
-        for vrf in vrf_list:
-            out = self.device.execute(self.cli_command.format(vrf=vrf))
+        # fetch the running config of all the vrfs, then parse them
+        commands = [self.cli_command.format(vrf=vrf) for vrf in vrf_list]
+        outputs = cached_execute_many(self.device, commands)
+
+        for command in commands:
+            out = outputs[command]
 
             for line in out.splitlines():
                 line = line.strip()
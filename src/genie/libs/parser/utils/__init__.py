@@ -1,3 +1,15 @@
-from .common import get_parser, get_parser_exclude, get_parser_commands
+from .common import get_parser, get_parser_exclude, get_parser_commands,\
+                    clear_parser_cache, get_parser_cache_info
+from .batch import ParseJob, ParseResult, BatchParser, parse_batch
+from .session import ParseSession
+from .validation import validated_parse, set_validation_mode
+from .intf_name import convert_intf_names, shorten_intf_name,\
+                       shorten_intf_names, clear_intf_name_cache,\
+                       get_intf_name_cache_info
+from .result_cache import ResultCache, cached_result_parse,\
+                          clear_result_cache, get_result_cache_info
+from .columnar import Columnar, to_columns
+from .interning import intern_parsed, clear_intern_table,\
+                       get_intern_table_info
 from . import entry_points
 
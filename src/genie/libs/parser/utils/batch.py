@@ -0,0 +1,219 @@
+'''Parse the outputs of many devices across a pool of processes
+
+The parse of a large output is CPU bound, so parsing the outputs collected
+from many devices in the calling thread uses a single core. BatchParser
+sends each (os, platform, command, output) job to a ProcessPoolExecutor
+whose workers have loaded the parser index and imported the parser modules
+before the first job arrives, and hands the results back as they complete.
+
+    example:
+
+        >>> jobs = [ParseJob('iosxe', 'cat9k', 'show version', output)
+        ...         for output in outputs]
+        >>> for result in parse_batch(jobs):
+        ...     if result.error:
+        ...         log.error('%s failed: %s', result.job.command,
+        ...                   result.error)
+        ...     else:
+        ...         store(result.index, result.parsed)
+'''
+
+# python
+import os
+import logging
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from .common import get_parser, parser_data, command_index
+from .validation import get_validation_mode, set_validation_mode,\
+                        validated_parse
+from .result_cache import result_key
+
+log = logging.getLogger(__name__)
+
+# Number of jobs submitted per worker ahead of the completed ones
+PENDING_PER_WORKER = 4
+
+# One output to parse
+ParseJob = namedtuple('ParseJob', ['os', 'platform', 'command', 'output'])
+
+# Outcome of a job, `index` is the position of the job in the submitted jobs
+ParseResult = namedtuple('ParseResult', ['index', 'job', 'parsed', 'error'])
+
+
+class OutputDevice(object):
+    '''Stand-in device of a job, which only carries the abstraction
+    attributes. Parsers are given the output, nothing is executed.'''
+
+    def __init__(self, os, platform=None):
+        self.os = os
+        self.platform = platform
+        self.name = os
+        order = ['os', 'platform'] if platform else ['os']
+        self.custom = {'abstraction': {'order': order}}
+
+    def execute(self, command, *args, **kwargs):
+        raise Exception("'{}' cannot be executed, the batch jobs only "
+                        "parse collected output".format(command))
+
+
+def warm_up(commands=(), validation=None):
+    '''Load the parser index and import the parser modules of the commands
+
+        Args:
+            commands (`iterable`): (os, platform, command) to resolve
+            validation (`dict`): validation mode and sample of the worker
+    '''
+    if validation:
+        set_validation_mode(validation['mode'], sample=validation['sample'])
+
+    parser_data.load()
+    command_index.build()
+
+    for os_name, platform, command in commands:
+        try:
+            get_parser(command, OutputDevice(os_name, platform))
+        except Exception as e:
+            # Reported by the job itself
+            log.debug("Could not resolve '{}' for {}: {}".format(
+                command, os_name, e))
+
+
+def parse_job(index, job):
+    '''Parse the output of one job, errors are returned, not raised'''
+    try:
+        device = OutputDevice(job.os, job.platform)
+        parser_cls, kwargs = get_parser(job.command, device)
+        parsed = validated_parse(parser_cls(device=device),
+                                 output=job.output, **kwargs)
+    except Exception as e:
+        return ParseResult(index, job, None, e)
+    return ParseResult(index, job, parsed, None)
+
+
+class BatchParser(object):
+    '''Pool of parser processes, reusable across batches
+
+    The outputs are validated with the compiled schema validators, in the
+    validation mode set when the batch is created.
+
+    With a ResultCache, the result of an output parsed before is taken from
+    the cache without being sent to a worker, and the parsed outputs are
+    added to the cache.
+
+        Args:
+            max_workers (`int`): number of processes, the number of cores
+                                 by default
+            warm (`iterable`): (os, platform, command) resolved by each
+                               worker when it starts
+            executor (`Executor`): use this executor instead of a process
+                                   pool, it is not shut down by the batch
+            cache (`ResultCache`): cache of the parsed results
+    '''
+
+    def __init__(self, max_workers=None, warm=(), executor=None, cache=None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.cache = cache
+        self._owned = executor is None
+        if executor is None:
+            executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                           initializer=warm_up,
+                                           initargs=(tuple(warm),
+                                                     get_validation_mode()))
+        self.executor = executor
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    def shutdown(self, wait=True):
+        if self._owned:
+            self.executor.shutdown(wait=wait)
+
+    def _cache_key(self, job):
+        '''Return the result cache key of a job, None if it is not cached'''
+        if self.cache is None:
+            return None
+        device = OutputDevice(job.os, job.platform)
+        try:
+            parser_cls, kwargs = get_parser(job.command, device)
+        except Exception:
+            # Reported by the job itself
+            return None
+        return result_key(parser_cls, job.output, kwargs, device=device)
+
+    def parse(self, jobs):
+        '''Parse the jobs, yielding a ParseResult as each one completes
+
+        The jobs are consumed lazily, only a few per worker are in flight
+        at a time. A job which fails, including by crashing its worker,
+        gives a result with the exception as `error`.
+
+            Args:
+                jobs (`iterable`): ParseJob or (os, platform, command,
+                                   output) tuples
+
+            Returns:
+                generator of ParseResult, in completion order
+        '''
+        jobs = enumerate(jobs)
+        limit = self.max_workers * PENDING_PER_WORKER
+        pending = {}
+
+        while True:
+            for index, job in jobs:
+                job = ParseJob(*job)
+                key = self._cache_key(job)
+                if key is not None:
+                    parsed = self.cache.get(key)
+                    if parsed is not None:
+                        yield ParseResult(index, job, parsed, None)
+                        continue
+                try:
+                    future = self.executor.submit(parse_job, index, job)
+                except Exception as e:
+                    # The pool is broken or shut down
+                    yield ParseResult(index, job, None, e)
+                    continue
+                pending[future] = (index, job, key)
+                if len(pending) >= limit:
+                    break
+
+            if not pending:
+                return
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, job, key = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # Result could not be sent back, or the worker died
+                    yield ParseResult(index, job, None, e)
+                    continue
+                if key is not None and result.error is None:
+                    self.cache.set(key, result.parsed)
+                yield result
+
+
+def parse_batch(jobs, max_workers=None, cache=None):
+    '''Parse the outputs of many devices across a pool of processes
+
+        Args:
+            jobs (`iterable`): ParseJob or (os, platform, command, output)
+                               tuples
+            max_workers (`int`): number of processes, the number of cores
+                                 by default
+            cache (`ResultCache`): cache of the parsed results
+
+        Returns:
+            generator of ParseResult, in completion order
+    '''
+    jobs = [ParseJob(*job) for job in jobs]
+    warm = {(job.os, job.platform, job.command) for job in jobs}
+
+    with BatchParser(max_workers=max_workers, warm=warm,
+                     cache=cache) as batch:
+        yield from batch.parse(jobs)
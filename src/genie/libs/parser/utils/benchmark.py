@@ -0,0 +1,407 @@
+"""Performance benchmarks for the parsers.
+
+Usage:
+
+    python -m genie.libs.parser.utils.benchmark patterns \\
+        genie.libs.parser.iosxe.show_interface.ShowInterfaces
+
+    python -m genie.libs.parser.utils.benchmark dispatch \\
+        genie.libs.parser.iosxe.show_interface.ShowInterfaces output.txt
+
+    python -m genie.libs.parser.utils.benchmark golden -o iosxe \\
+        --number 5 --output baseline.json
+
+    python -m genie.libs.parser.utils.benchmark compare baseline.json \\
+        current.json --threshold 0.25
+"""
+
+# Python
+import os
+import re
+import sys
+import json
+import time
+import timeit
+import argparse
+import platform
+import importlib
+import tracemalloc
+from unittest.mock import Mock
+
+# Parser
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.unittests import get_operating_systems,\
+    get_parse_files, load_parse_module, get_test_classes, get_golden_files,\
+    read_from_file, read_json_file
+
+# Timings under this many seconds per pass are too noisy to compare
+MIN_COMPARED_TIME = 1e-4
+
+
+def load_class(path):
+    """Import a parser class from its dotted path."""
+    module, name = path.rsplit('.', 1)
+    return getattr(importlib.import_module(module), name)
+
+
+def bench_patterns(parser_cls, number=1000):
+    """Compare the per call cost of compiling the patterns of a parser
+    inside cli() against looking them up from its class level Patterns.
+
+        Args:
+            parser_cls (`class`): parser class with a `patterns` attribute
+            number (`int`): number of simulated cli() calls
+
+        Returns:
+            dict: seconds per call for each mode
+    """
+    patterns = parser_cls.__dict__.get('patterns')
+    if not isinstance(patterns, Patterns):
+        raise ValueError('{} does not declare class level patterns'
+                         .format(parser_cls.__name__))
+
+    sources = [patterns._patterns[name] for name in patterns]
+    sources = [p if isinstance(p, tuple) else (p,) for p in sources]
+    names = list(patterns)
+
+    def compile_cold():
+        # The re cache has been evicted by other parsers in rotation
+        re.purge()
+        for source in sources:
+            re.compile(*source)
+
+    def compile_warm():
+        for source in sources:
+            re.compile(*source)
+
+    def lookup():
+        for name in names:
+            getattr(patterns, name)
+
+    patterns.compile_all()
+    return {
+        'patterns': len(names),
+        'compile_cold': timeit.timeit(compile_cold, number=number) / number,
+        'compile_warm': timeit.timeit(compile_warm, number=number) / number,
+        'class_patterns': timeit.timeit(lookup, number=number) / number,
+    }
+
+
+def bench_dispatch(parser_cls, lines, number=100):
+    """Compare trying every pattern of a parser on each line, one after
+    the other, against routing the lines with its LineDispatcher.
+
+        Args:
+            parser_cls (`class`): parser class with a `patterns` attribute
+            lines (`list`): stripped lines of device output
+            number (`int`): number of passes over the lines
+
+        Returns:
+            dict: seconds per pass for each mode
+    """
+    patterns = parser_cls.__dict__.get('patterns')
+    if not isinstance(patterns, Patterns):
+        raise ValueError('{} does not declare class level patterns'
+                         .format(parser_cls.__name__))
+
+    compiled = [getattr(patterns, name) for name in patterns]
+    dispatcher = patterns.dispatcher()
+    dispatcher.build()
+
+    def sequential():
+        for line in lines:
+            for regex in compiled:
+                if regex.match(line):
+                    break
+
+    def dispatched():
+        for line in lines:
+            dispatcher.match(line)
+
+    return {
+        'lines': len(lines),
+        'sequential': timeit.timeit(sequential, number=number) / number,
+        'dispatched': timeit.timeit(dispatched, number=number) / number,
+    }
+
+
+def iter_golden_parsers(_os=None, _class=None, _token=None, errors=None):
+    """Find the parser classes with golden outputs and load the outputs.
+
+        Args:
+            _os (`str`): only this OS
+            _class (`str`): only this parser class
+            _token (`str`): only this token
+            errors (`dict`): updated with the error of each parser file
+                             which could not be imported, by os.token.file
+
+        Returns:
+            generator of (name, class, cases), with cases a list of
+            (output, arguments)
+    """
+    seen = set()
+    for operating_system in get_operating_systems(_os):
+        for details in get_parse_files(operating_system):
+            token = details["token"]
+            if _token and _token != token:
+                continue
+            try:
+                module = load_parse_module(operating_system, details)
+            except Exception as e:
+                if errors is not None:
+                    name = os.path.basename(details["parse_file"])[:-3]
+                    errors['.'.join(filter(None, (operating_system, token,
+                                                  name)))] = \
+                        '{}: {}'.format(type(e).__name__, e)
+                continue
+
+            folder = os.path.join(os.path.dirname(details["parse_file"]),
+                                  'tests')
+            for name, parser_cls in get_test_classes(
+                    module, operating_system, token, _class, _token):
+                # Classes imported by other parser files too
+                key = (operating_system, token, name)
+                if key in seen:
+                    continue
+                seen.add(key)
+
+                equal = os.path.join(folder, name, 'cli', 'equal')
+                cases = []
+                for output in get_golden_files(equal):
+                    arguments = {}
+                    path = output[:-len('_output.txt')] + '_arguments.json'
+                    if os.path.exists(path):
+                        arguments = read_json_file(path)
+                    cases.append((read_from_file(output), arguments))
+
+                if cases:
+                    yield '.'.join(filter(None, (operating_system, token,
+                                                 name))), parser_cls, cases
+
+
+def bench_golden(parser_cls, cases, number=5):
+    """Replay the golden outputs of a parser class.
+
+        Args:
+            parser_cls (`class`): parser class
+            cases (`list`): (output, arguments) of the golden outputs
+            number (`int`): number of passes over the outputs
+
+        Returns:
+            dict: seconds per pass, lines per second and peak memory in
+                  bytes of one pass
+    """
+    devices = [(Mock(**{'execute.return_value': output}), arguments)
+               for output, arguments in cases]
+
+    def replay():
+        for device, arguments in devices:
+            parser_cls(device=device).parse(**arguments)
+
+    # Warm up, first use of the class level patterns and imports
+    replay()
+
+    tracemalloc.start()
+    try:
+        replay()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    seconds = timeit.timeit(replay, number=number) / number
+    lines = sum(len(output.splitlines()) for output, _ in cases)
+    return {
+        'outputs': len(cases),
+        'lines': lines,
+        'seconds': seconds,
+        'lines_per_sec': lines / seconds if seconds else 0.0,
+        'peak_memory': peak,
+    }
+
+
+def run_golden(_os=None, _class=None, _token=None, number=5, out=None):
+    """Benchmark every parser of the golden output corpus.
+
+        Returns:
+            dict: baseline, with the results of each parser
+    """
+    parsers = {}
+    errors = {}
+    for name, parser_cls, cases in iter_golden_parsers(_os, _class, _token,
+                                                       errors=errors):
+        try:
+            parsers[name] = bench_golden(parser_cls, cases, number=number)
+        except Exception as e:
+            parsers[name] = {'error': '{}: {}'.format(type(e).__name__, e)}
+        if out:
+            result = parsers[name]
+            if 'error' in result:
+                out.write('{:<70} error\n'.format(name))
+            else:
+                out.write('{:<70}{:>10.2f} ms{:>12.0f} lines/s{:>10.1f} KiB\n'
+                          .format(name, result['seconds'] * 1e3,
+                                  result['lines_per_sec'],
+                                  result['peak_memory'] / 1024))
+
+    # Parser files which could not be imported
+    for name, error in sorted(errors.items()):
+        parsers[name] = {'error': error}
+        if out:
+            out.write('{:<70} error\n'.format(name))
+
+    return {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'number': number,
+        'parsers': parsers,
+    }
+
+
+def compare(baseline, current, threshold=0.2,
+            min_time=MIN_COMPARED_TIME):
+    """Find the parsers which got slower or use more memory.
+
+        Args:
+            baseline (`dict`): result of run_golden
+            current (`dict`): result of run_golden
+            threshold (`float`): allowed relative increase
+            min_time (`float`): parsers faster than this are not timed
+
+        Returns:
+            list: (parser, metric, baseline value, current value), the
+                  new errors of the current run and the parsers of the
+                  baseline missing from it are reported as regressions
+    """
+    regressions = []
+    for name, base in sorted(baseline['parsers'].items()):
+        if name not in current['parsers'] and 'error' not in base:
+            regressions.append((name, 'missing', None, None))
+
+    for name, result in sorted(current['parsers'].items()):
+        base = baseline['parsers'].get(name)
+        if base and 'error' in base:
+            continue
+        if 'error' in result:
+            regressions.append((name, 'error', None, result['error']))
+            continue
+        if not base:
+            continue
+
+        if max(base['seconds'], result['seconds']) >= min_time and \
+                result['seconds'] > base['seconds'] * (1 + threshold):
+            regressions.append((name, 'seconds', base['seconds'],
+                                result['seconds']))
+        if result['peak_memory'] > base['peak_memory'] * (1 + threshold):
+            regressions.append((name, 'peak_memory', base['peak_memory'],
+                                result['peak_memory']))
+    return regressions
+
+
+def report_regressions(regressions, threshold):
+    for name, metric, base, new in regressions:
+        if metric == 'error':
+            print('{}: {}'.format(name, new))
+        elif metric == 'missing':
+            print('{}: missing from the current run'.format(name))
+        elif not base:
+            print('{}: {} {:.6g} -> {:.6g}'.format(name, metric, base, new))
+        else:
+            print('{}: {} {:.6g} -> {:.6g} (+{:.0%})'.format(
+                name, metric, base, new, new / base - 1))
+    print('{} regressions over {:.0%}'.format(len(regressions), threshold))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest='command')
+
+    patterns = sub.add_parser('patterns',
+                              help='per call cost of the parser patterns')
+    patterns.add_argument('classes', nargs='+',
+                          help='dotted path of the parser classes')
+    patterns.add_argument('--number', type=int, default=1000,
+                          help='number of simulated calls')
+
+    dispatch = sub.add_parser('dispatch',
+                              help='cost of matching lines of output')
+    dispatch.add_argument('cls', help='dotted path of the parser class')
+    dispatch.add_argument('outputs', nargs='+',
+                          help='files with the device output')
+    dispatch.add_argument('--number', type=int, default=100,
+                          help='number of passes over the output')
+
+    golden = sub.add_parser('golden',
+                            help='replay the golden outputs of the parsers')
+    golden.add_argument('-o', '--operating_system',
+                        help='only the parsers of this OS')
+    golden.add_argument('-c', '--class_name',
+                        help='only this parser class')
+    golden.add_argument('-t', '--token',
+                        help='only the parsers of this token')
+    golden.add_argument('--number', type=int, default=5,
+                        help='number of passes over the outputs')
+    golden.add_argument('--output',
+                        help='save the results as a json baseline')
+    golden.add_argument('--baseline',
+                        help='compare the results to this baseline')
+    golden.add_argument('--threshold', type=float, default=0.2,
+                        help='allowed relative increase, 0.2 for 20%%')
+
+    comp = sub.add_parser('compare',
+                          help='compare two golden benchmark results')
+    comp.add_argument('baseline', help='json baseline')
+    comp.add_argument('current', help='json results to check')
+    comp.add_argument('--threshold', type=float, default=0.2,
+                      help='allowed relative increase, 0.2 for 20%%')
+
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.print_help()
+        return 1
+
+    if args.command == 'golden':
+        result = run_golden(args.operating_system, args.class_name,
+                            args.token, number=args.number, out=sys.stdout)
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump(result, f, indent=2, sort_keys=True)
+        if args.baseline:
+            with open(args.baseline) as f:
+                regressions = compare(json.load(f), result, args.threshold)
+            report_regressions(regressions, args.threshold)
+            return int(bool(regressions))
+        return 0
+
+    if args.command == 'compare':
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        with open(args.current) as f:
+            current = json.load(f)
+        regressions = compare(baseline, current, args.threshold)
+        report_regressions(regressions, args.threshold)
+        return int(bool(regressions))
+
+    if args.command == 'dispatch':
+        lines = []
+        for output in args.outputs:
+            with open(output) as f:
+                lines.extend(line.strip() for line in f.read().splitlines())
+        result = bench_dispatch(load_class(args.cls), lines,
+                                number=args.number)
+        print('{} ({} lines)'.format(args.cls, result['lines']))
+        for mode in ('sequential', 'dispatched'):
+            print('    {:<16}{:>12.2f} ms/pass'.format(
+                mode, result[mode] * 1e3))
+        return 0
+
+    for path in args.classes:
+        result = bench_patterns(load_class(path), number=args.number)
+        print('{} ({} patterns)'.format(path, result['patterns']))
+        for mode in ('compile_cold', 'compile_warm', 'class_patterns'):
+            print('    {:<16}{:>12.2f} us/call'.format(
+                mode, result[mode] * 1e6))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,418 @@
+'''Column oriented export of the parsed tables
+
+Analytics over the outputs of many devices, like the counter deltas of
+every interface between two polls, walk the nested dictionaries of each
+parsed output in Python. The columnar export flattens the parsed outputs of
+a parser into one table, driven by the schema of the parser:
+
+    * the rows are the entries of an Any() or list level of the schema,
+      like the interfaces or the routes, with one key column per level
+    * the columns are the leaves under the row, through the fixed key
+      levels, named by their path, like `counters.in_pkts`
+    * int, float and bool leaves are typed arrays, with a mask of the rows
+      which have a value
+    * str leaves are dictionary encoded, an array of codes into the list of
+      the distinct values, -1 for the rows without a value
+
+The arrays are numpy arrays when numpy is installed, else `array.array`.
+
+    example:
+
+        >>> columnar = Columnar(ShowInterfaces)
+        >>> for name, parsed in polled.items():
+        ...     columnar.add(parsed, device=name)
+        >>> table = columnar.table()
+        >>> in_pkts = table['counters.in_pkts']
+        >>> in_pkts.values[in_pkts.mask].sum()
+
+The outputs whose counters are strings, like the junos ones, give int
+columns with `parse_numbers=True`.
+'''
+
+# python
+import re
+import array
+from collections import OrderedDict
+
+from genie.metaparser.util.schemaengine import Schema, Or, ListOf
+
+from .projection import WILDCARD, _split
+from .schema_keys import split_key
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Column kinds of the schema leaf types
+LEAF_KINDS = {int: 'int', float: 'float', bool: 'bool', str: 'str'}
+
+_number = re.compile(r'^-?(0|[1-9]\d*)$')
+
+
+def _unwrap(schema):
+    while type(schema) is Schema:
+        schema = schema.schema
+    return schema
+
+
+def _split_dict(schema):
+    '''Return the fixed keys and the wildcard value of a dict schema'''
+    fields = OrderedDict()
+    wildcard = None
+    for key, value in schema.items():
+        key, _, any_key = split_key(key)
+        if any_key:
+            wildcard = value
+        else:
+            fields[key] = value
+    return fields, wildcard
+
+
+def _entries(schema):
+    '''Return the schema of the entries of an Any() or list level, None if
+    the schema is not one'''
+    schema = _unwrap(schema)
+    if type(schema) is dict:
+        return _split_dict(schema)[1]
+    if type(schema) is ListOf:
+        return schema.schema
+    if type(schema) is list and len(schema) == 1:
+        return schema[0]
+    return None
+
+
+def _kind(schema):
+    '''Return the column kind of a leaf schema, None for a container'''
+    schema = _unwrap(schema)
+    if type(schema) in (dict, list, ListOf):
+        return None
+    if type(schema) is Or:
+        kinds = {_kind(alternative) for alternative in schema.args}
+        if len(kinds) == 1 and None not in kinds:
+            return kinds.pop()
+        return 'object' if None not in kinds else None
+    try:
+        return LEAF_KINDS.get(schema, 'object')
+    except TypeError:
+        return 'object'
+
+
+def _columns(schema, prefix=()):
+    '''Yield (path, kind) of the leaves of a row, through the fixed key
+    levels'''
+    schema = _unwrap(schema)
+    if type(schema) is not dict:
+        return
+    for key, value in _split_dict(schema)[0].items():
+        kind = _kind(value)
+        if kind is not None:
+            yield prefix + (key,), kind
+        elif type(_unwrap(value)) is dict:
+            yield from _columns(value, prefix + (key,))
+
+
+def _row_levels(schema, prefix=()):
+    '''Yield (path, columns) of the Any() and list levels of a schema'''
+    schema = _unwrap(schema)
+    entries = _entries(schema)
+    if entries is not None:
+        path = prefix + (WILDCARD,)
+        yield path, sum(1 for _ in _columns(entries))
+        yield from _row_levels(entries, path)
+    elif type(schema) is dict:
+        for key, value in _split_dict(schema)[0].items():
+            yield from _row_levels(value, prefix + (key,))
+
+
+def default_rows(schema):
+    '''Return the path of the Any() or list level of the schema with the
+    most leaves, like the interfaces or the routes, None if there is none'''
+    best, most = None, 0
+    for path, columns in _row_levels(schema):
+        if columns > most:
+            best, most = path, columns
+    return best
+
+
+def _rows_schema(schema, rows):
+    '''Return the schema of the rows, and the names of their key columns'''
+    keys = []
+    previous = None
+    for segment in rows:
+        if segment == WILDCARD:
+            schema = _entries(schema)
+            keys.append(previous or 'key')
+        else:
+            schema = _split_dict(_unwrap(schema))[0][segment]
+        previous = segment if segment != WILDCARD else None
+
+    # Unique names
+    names = []
+    for key in keys:
+        name, index = key, 1
+        while name in names:
+            index += 1
+            name = '{}_{}'.format(key, index)
+        names.append(name)
+    return schema, names
+
+
+def _iter_rows(data, rows, keys=()):
+    '''Yield (keys, row) of the rows of a parsed output'''
+    if not rows:
+        if isinstance(data, dict):
+            yield keys, data
+        return
+
+    segment, rest = rows[0], rows[1:]
+    if segment != WILDCARD:
+        if isinstance(data, dict) and segment in data:
+            yield from _iter_rows(data[segment], rest, keys)
+        return
+
+    if isinstance(data, dict):
+        items = data.items()
+    elif isinstance(data, list):
+        items = enumerate(data)
+    else:
+        return
+    for key, value in items:
+        yield from _iter_rows(value, rest, keys + (key,))
+
+
+def _value_kind(values):
+    '''Return the column kind of the values of the label and key columns'''
+    types = {type(value) for value in values if value is not None}
+    if len(types) == 1:
+        return LEAF_KINDS.get(types.pop(), 'object')
+    return 'object' if types else 'str'
+
+
+def _typed_array(kind, values):
+    '''Return the values as an array of the kind, None if they do not fit'''
+    try:
+        if np is not None:
+            dtype = {'int': np.int64, 'float': np.float64,
+                     'bool': np.bool_, 'code': np.int32}[kind]
+            return np.array(values, dtype=dtype)
+        typecode = {'int': 'q', 'float': 'd', 'bool': 'b', 'code': 'l'}[kind]
+        return array.array(typecode, values)
+    except (OverflowError, TypeError, ValueError):
+        return None
+
+
+class Column(object):
+    '''Column of a columnar table
+
+        Attributes:
+            name (`str`): path of the leaf
+            kind (`str`): int, float, bool, str or object
+            values: values of the rows, the codes of a str column
+            mask: True for the rows which have a value
+            categories (`list`): distinct values of a str column
+    '''
+
+    def __init__(self, name, kind, values, mask, categories=None):
+        self.name = name
+        self.kind = kind
+        self.values = values
+        self.mask = mask
+        self.categories = categories
+
+    def __len__(self):
+        return len(self.values)
+
+    def __repr__(self):
+        return '<Column {} {} rows={}>'.format(self.name, self.kind,
+                                               len(self))
+
+    @classmethod
+    def from_values(cls, name, kind, values, parse_numbers=False):
+        '''Build the column of the values of the rows, None for the rows
+        without a value'''
+        present = [value is not None for value in values]
+
+        if kind == 'str' and parse_numbers and all(
+                _number.match(value) for value in values
+                if type(value) is str) and any(present):
+            values = [int(value) if type(value) is str else value
+                      for value in values]
+            kind = 'int'
+
+        expected = {'int': int, 'float': float, 'bool': bool,
+                    'str': str}.get(kind)
+        if expected is None or not all(type(value) is expected
+                                       for value in values
+                                       if value is not None):
+            return cls(name, 'object', values, _typed_array('bool', present))
+
+        if kind == 'str':
+            categories = {}
+            codes = [-1 if value is None else
+                     categories.setdefault(value, len(categories))
+                     for value in values]
+            return cls(name, kind, _typed_array('code', codes),
+                       _typed_array('bool', present), list(categories))
+
+        default = {'int': 0, 'float': float('nan'), 'bool': False}[kind]
+        typed = _typed_array(kind, [default if value is None else value
+                                    for value in values])
+        if typed is None:
+            # Out of the range of the type
+            return cls(name, 'object', values, _typed_array('bool', present))
+        return cls(name, kind, typed, _typed_array('bool', present))
+
+    def to_list(self):
+        '''Return the values of the rows, None for the rows without one'''
+        if self.kind == 'object':
+            return list(self.values)
+        if self.kind == 'str':
+            return [self.categories[code] if code >= 0 else None
+                    for code in self.values]
+        return [(value.item() if hasattr(value, 'item') else value)
+                if present else None
+                for value, present in zip(self.values, self.mask)]
+
+
+class ColumnarTable(object):
+    '''Table of columns of the same number of rows
+
+        Attributes:
+            columns (`OrderedDict`): Column by name, the label and key
+                                     columns first
+            keys (`tuple`): names of the label and key columns
+    '''
+
+    def __init__(self, columns, keys=()):
+        self.columns = columns
+        self.keys = tuple(keys)
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __contains__(self, name):
+        return name in self.columns
+
+    def __iter__(self):
+        return iter(self.columns)
+
+    def __len__(self):
+        for column in self.columns.values():
+            return len(column)
+        return 0
+
+    def to_dict(self):
+        '''Return the values of each column as a list'''
+        return OrderedDict((name, column.to_list())
+                           for name, column in self.columns.items())
+
+
+class Columnar(object):
+    '''Flattens the parsed outputs of a parser class into a columnar table
+
+        Args:
+            parser_cls (`class`): parser class of the outputs
+            rows (`str`): schema path of the rows, like
+                          'vrf.*.address_family.*.routes.*', default to the
+                          Any() or list level with the most leaves
+            keys (`list`): names of the key columns, one per Any() or
+                           list level of the rows, default to the key
+                           above the level
+            parse_numbers (`bool`): str columns whose values are all
+                                    integers are int columns
+    '''
+
+    def __init__(self, parser_cls, rows=None, keys=None,
+                 parse_numbers=False):
+        schema = getattr(parser_cls, 'schema', None)
+        self.rows = _split(rows) if rows else default_rows(schema)
+        if self.rows is None:
+            raise ValueError('{} has no Any() or list level to take the rows '
+                             'from'.format(parser_cls.__name__))
+        row_schema, self.key_names = _rows_schema(schema, self.rows)
+        if keys is not None:
+            if len(keys) != len(self.key_names):
+                raise ValueError('{} key names are needed for the rows '
+                                 '{}'.format(len(self.key_names),
+                                             '.'.join(self.rows)))
+            self.key_names = list(keys)
+        self.fields = list(_columns(row_schema))
+        self.parse_numbers = parse_numbers
+        self._tree = self._field_tree()
+        self._labels = OrderedDict()
+        self._keys = [[] for _ in self.key_names]
+        self._values = [[] for _ in self.fields]
+        self._count = 0
+
+    def _field_tree(self):
+        # Column index of each leaf, nested like the rows
+        tree = {}
+        for index, (path, _) in enumerate(self.fields):
+            node = tree
+            for key in path[:-1]:
+                node = node.setdefault(key, {})
+            node[path[-1]] = index
+        return tree
+
+    def _fill(self, tree, data, values):
+        for key, value in data.items():
+            target = tree.get(key)
+            if target is None:
+                continue
+            if type(target) is int:
+                values[target] = value
+            elif isinstance(value, dict):
+                self._fill(target, value, values)
+
+    def add(self, parsed, **labels):
+        '''Add the rows of a parsed output
+
+            Args:
+                parsed (`dict`): parsed output
+                labels: values of the label columns of its rows, like the
+                        device name
+        '''
+        for name in labels:
+            if name not in self._labels:
+                self._labels[name] = [None] * self._count
+
+        added = 0
+        for keys, row in _iter_rows(parsed, self.rows):
+            values = [None] * len(self.fields)
+            self._fill(self._tree, row, values)
+            for column, value in zip(self._values, values):
+                column.append(value)
+            for column, key in zip(self._keys, keys):
+                column.append(key)
+            added += 1
+
+        for name, column in self._labels.items():
+            column.extend([labels.get(name)] * added)
+        self._count += added
+        return added
+
+    def table(self):
+        '''Return the columnar table of the added outputs'''
+        columns = OrderedDict()
+        for name, values in list(self._labels.items()) + list(
+                zip(self.key_names, self._keys)):
+            columns[name] = Column.from_values(name, _value_kind(values),
+                                               values)
+        keys = tuple(columns)
+        for (path, kind), values in zip(self.fields, self._values):
+            name = '.'.join(str(key) for key in path)
+            columns[name] = Column.from_values(
+                name, kind, values, parse_numbers=self.parse_numbers)
+        return ColumnarTable(columns, keys=keys)
+
+
+def to_columns(parser_cls, parsed, rows=None, keys=None,
+               parse_numbers=False):
+    '''Return the columnar table of a parsed output, or of a list of
+    parsed outputs of the same parser class, see `Columnar`'''
+    columnar = Columnar(parser_cls, rows=rows, keys=keys,
+                        parse_numbers=parse_numbers)
+    for output in parsed if isinstance(parsed, list) else [parsed]:
+        columnar.add(output)
+    return columnar.table()
@@ -9,6 +9,7 @@ import math
 import logging
 import warnings
 import importlib
+from collections import OrderedDict
 
 from genie.libs import parser
 from genie.abstract import Lookup
@@ -16,27 +17,38 @@ from genie.metaparser.util import merge_dict
 
 from pyats import configuration as cfg
 from .extension import ExtendParsers
+from .index import CommandIndex, LazyParserData, load_parser_index,\
+                   load_parser_meta
+from .intf_name import convert_intf_name, shorten_intf_name
 
 PYATS_EXT_PARSER = 'pyats.libs.external.parser'
+PARSER_CACHE_SIZE = 'genie.libs.parser.resolution_cache_size'
+
+# Device attributes which can take part in the abstraction lookup
+ABSTRACTION_ATTRIBUTES = ('os', 'platform', 'model', 'pid', 'version')
 
 log = logging.getLogger(__name__)
 
-def _load_parser_json():
-    '''get all parser data in json file'''
+def _parser_json_path():
+    '''get the path of parsers.json'''
     try:
         mod = importlib.import_module('genie.libs.parser')
-        parsers = os.path.join(mod.__path__[0], 'parsers.json')
+        return os.path.join(mod.__path__[0], 'parsers.json')
     except Exception:
-        parsers = ''
+        return ''
+
+def _load_parser_json():
+    '''get all parser data in json file'''
+    parsers = _parser_json_path()
     if not os.path.isfile(parsers):
         log.warning('parsers.json does not exist, make sure you '
                     'are running with latest version of '
                     'genie.libs.parsers')
         parser_data = {}
     else:
-        # Open all the parsers in json file
-        with open(parsers) as f:
-            parser_data = json.load(f)
+        # Only the dispatch part of parsers.json, from the compiled
+        # index when available
+        parser_data = load_parser_index(parsers)
 
         # check if provided external parser packages
         ext_parser_package = cfg.get(PYATS_EXT_PARSER, None) or \
@@ -54,8 +66,31 @@ def _load_parser_json():
 
     return parser_data
 
-# Parser within Genie
-parser_data = _load_parser_json()
+# Parser within Genie, loaded on first use
+parser_data = LazyParserData(_load_parser_json)
+
+# Compiled token index over the parser commands
+command_index = CommandIndex(parser_data)
+
+# Docs, schema and url of the parsers, loaded on demand
+_parser_meta = None
+
+def get_parser_meta(command):
+    '''Return the doc, schema and url of the parsers of a command
+
+        Args:
+            command (`str`): command as found in the parser data
+
+        Returns:
+            dict: per os (and tokens) meta data, empty if unknown
+    '''
+    global _parser_meta
+    if _parser_meta is None:
+        parsers = _parser_json_path()
+        _parser_meta = load_parser_meta(parsers) \
+            if os.path.isfile(parsers) else {}
+
+    return _parser_meta.get(command, {})
 
 def get_parser_commands(device, data=parser_data):
     '''Remove all commands which contain { as this requires
@@ -90,6 +125,69 @@ def get_parser_exclude(command, device):
     except AttributeError:
         return []
 
+class ParserCache(object):
+    '''Bounded LRU cache of get_parser resolutions.
+
+    The parser class found for a command only depends on the command,
+    the search mode and the device abstraction tokens, so the result of
+    the lookup is kept and served as a dictionary lookup on the next call.
+    It must be cleared whenever parsers are added to the parser data.
+    '''
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key):
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key, value):
+        if not self.maxsize:
+            return
+
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        '''Remove every cached resolution and reset the counters'''
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        '''Return the cache statistics'''
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'maxsize': self.maxsize,
+                'currsize': len(self._data)}
+
+# Resolved parsers, shared by all devices
+parser_cache = ParserCache(int(cfg.get(PARSER_CACHE_SIZE, 4096)))
+
+def _resolution_key(command, device, fuzzy, order_list):
+    '''Build the parser cache key of a command for the given device'''
+    attributes = set(ABSTRACTION_ATTRIBUTES)
+    attributes.update(order_list or [])
+
+    return (command, fuzzy, tuple(order_list or []),
+            tuple((name, str(getattr(device, name, None)))
+                  for name in sorted(attributes)))
+
 def get_parser(command, device, fuzzy=False):
     '''From a show command and device, return parser class and kwargs if any'''
 
@@ -98,6 +196,33 @@ def get_parser(command, device, fuzzy=False):
     except AttributeError:
         order_list = None
 
+    key = _resolution_key(command, device, fuzzy, order_list)
+    cached = parser_cache.get(key)
+    if cached is not None:
+        if not fuzzy:
+            return cached[0], dict(cached[1])
+        return [(found, cls, dict(kwargs)) for found, cls, kwargs in cached]
+
+    if not fuzzy:
+        parser_cls, kwargs = _get_parser(command, device, fuzzy, order_list)
+        parser_cache.set(key, (parser_cls, kwargs))
+        return parser_cls, dict(kwargs)
+
+    valid_results = _get_parser(command, device, fuzzy, order_list)
+    parser_cache.set(key, valid_results)
+    return [(found, cls, dict(kwargs)) for found, cls, kwargs in valid_results]
+
+def clear_parser_cache():
+    '''Clear the get_parser resolution cache'''
+    parser_cache.clear()
+
+def get_parser_cache_info():
+    '''Return the hits, misses and size of the get_parser resolution cache'''
+    return parser_cache.info()
+
+def _get_parser(command, device, fuzzy, order_list):
+    '''Resolve the parser class and kwargs of a command for the device'''
+
     lookup = Lookup.from_device(device, packages={'parser': parser})
     results = _fuzzy_search_command(command, fuzzy, device.os, order_list)
     valid_results = []
@@ -161,7 +286,18 @@ def _fuzzy_search_command(search, fuzzy, os=None, order_list=None,
     best_score = -math.inf
     result = []
 
-    for command, source in parser_data.items():
+    # Only walk the commands the index finds for this search, unless
+    # it contains a regex which can match any command
+    if not fuzzy:
+        commands = command_index.candidates(tokens)
+    elif all(token == '*' or _is_regular_token(token) for token in tokens):
+        commands = command_index.candidates([token.replace(r'\|', '|')
+            .replace(r'\.', '.') for token in tokens])
+    else:
+        commands = parser_data
+
+    for command in commands:
+        source = parser_data[command]
         # Tokens and kwargs parameter must be non reference
         match_result = _matches_fuzzy(0, 0, tokens.copy(),
                                                         command, {}, fuzzy)
@@ -524,60 +660,27 @@ class Common():
                 >>> convert_intf_name(intf='Eth2/1')
         '''
 
-        # Please add more when face other type of interface
-        convert = {'Eth': 'Ethernet',
-                   'Lo': 'Loopback',
-                   'lo': 'Loopback',
-                   'Fa': 'FastEthernet',
-                   'Fas': 'FastEthernet',
-                   'Po': 'Port-channel',
-                   'PO': 'Port-channel',
-                   'Null': 'Null',
-                   'Gi': 'GigabitEthernet',
-                   'Gig': 'GigabitEthernet',
-                   'GE': 'GigabitEthernet',
-                   'Te': 'TenGigabitEthernet',
-                   'Ten': 'TenGigabitEthernet',
-                   'Tw': 'TwoGigabitEthernet',
-                   'Two': 'TwoGigabitEthernet',
-                   'Twe': 'TwentyFiveGigE',
-                   'mgmt': 'mgmt',
-                   'Vl': 'Vlan',
-                   'Tu': 'Tunnel',
-                   'Fe': '',
-                   'Hs': 'HSSI',
-                   'AT': 'ATM',
-                   'Et': 'Ethernet',
-                   'BD': 'BDI',
-                   'Se': 'Serial',
-                   'Fo': 'FortyGigabitEthernet',
-                   'For': 'FortyGigabitEthernet',
-                   'Hu': 'HundredGigE',
-                   'Hun': 'HundredGigE',
-                   'vl': 'vasileft',
-                   'vr': 'vasiright',
-                   'BE': 'Bundle-Ether',
-                   'M-E': 'M-Ethernet',             # comware
-                   'BAGG' : 'Bridge-Aggregation'    # comware
-                   }
-        m = re.search(r'([a-zA-Z]+)', intf) 
-        m1 = re.search(r'([\d\/\.]+)', intf)
-        m2 = re.search(r'(M-E)', intf)
-        if hasattr(m, 'group') and hasattr(m1, 'group'):
-            if hasattr(m2, 'group'):
-                int_type = m2.group(0)
-            else:
-                int_type = m.group(0)
-            int_port = m1.group(0)
-            if int_type in convert.keys():
-                return(convert[int_type] + int_port)
-            else:
-                # Unifying interface names
-                converted_intf = intf[0].capitalize()+intf[1:].replace(
-                    ' ','').replace('ethernet', 'Ethernet')
-                return(converted_intf)
-        else:
-            return(intf)
+        return convert_intf_name(intf)
+
+    @classmethod
+    def shorten_intf_name(self, intf):
+        '''return the short interface name
+
+            Args:
+                intf (`str`): Full interface name
+
+            Returns:
+                Short interface name, the reverse of convert_intf_name
+
+            Raises:
+                None
+
+            example:
+
+                >>> shorten_intf_name(intf='Ethernet2/1')
+        '''
+
+        return shorten_intf_name(intf)
 
 
     @classmethod
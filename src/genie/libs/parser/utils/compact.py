@@ -0,0 +1,263 @@
+'''Compact representation of the parsed output of the large tables
+
+The parsed output of a full routing or bgp table is millions of small
+dictionaries, one per route or path, which all carry the same few keys.
+Most of their memory goes to the dictionary overhead and the per entry key
+tables. The compact representation turns the dictionaries of the fixed key
+levels of the schema into slotted records, which only hold their values,
+the keys are held once by the record class of each key set. The levels
+keyed by the data, the Any() levels of the schema, stay dictionaries.
+
+The records are read-only mappings, `record['next_hop']`, `.get()`,
+`.items()` and the comparison with a dict work as for the parsed dict, and
+`to_dict()` gives back the parsed dict.
+
+    example:
+
+        >>> table = ShowIpBgpAllDetail(device=device).parse_compact()
+        >>> path = table['instance']['default']['vrf']['default'][
+        ...     'address_family']['ipv4 unicast']['prefixes'][
+        ...     '10.4.1.0/24']['index'][1]
+        >>> path['next_hop']
+        '0.0.0.0'
+        >>> parsed = to_dict(table)
+'''
+
+# python
+import threading
+from collections.abc import Mapping
+
+from genie.metaparser.util.schemaengine import Schema, Or, ListOf
+
+from .schema_keys import split_key
+
+# Record class, by key set
+_record_classes = {}
+# Compiled converter, by parser class
+_compactors = {}
+_lock = threading.Lock()
+
+
+class Record(Mapping):
+    '''Read-only mapping of a fixed key set, the values are held in slots'''
+
+    __slots__ = ()
+    _fields = ()
+    _descriptors = ()
+    _slots = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._slots[key].__get__(self)
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __contains__(self, key):
+        return key in self._slots
+
+    def __repr__(self):
+        return '{}({!r})'.format(type(self).__name__, self.to_dict())
+
+    def __reduce__(self):
+        return (make_record, (self._fields, self.values_tuple()))
+
+    def values_tuple(self):
+        '''Return the values of the record, in the order of its keys'''
+        return tuple(descriptor.__get__(self)
+                     for descriptor in self._descriptors)
+
+    def to_dict(self):
+        '''Return the parsed dict of the record'''
+        return {key: to_dict(value) for key, value in
+                zip(self._fields, self.values_tuple())}
+
+
+def record_class(fields):
+    '''Return the record class of a key set, created on the first call
+
+        Args:
+            fields (`tuple`): keys of the records, in their parsed order
+    '''
+    try:
+        return _record_classes[fields]
+    except KeyError:
+        pass
+
+    with _lock:
+        if fields not in _record_classes:
+            names = tuple('_{}'.format(index) for index in range(len(fields)))
+            cls = type('Record', (Record,), {'__slots__': names,
+                                             '_fields': fields})
+            cls._descriptors = tuple(getattr(cls, name) for name in names)
+            cls._slots = dict(zip(fields, cls._descriptors))
+            _record_classes[fields] = cls
+        return _record_classes[fields]
+
+
+def make_record(fields, values):
+    '''Return the record of the keys and values'''
+    cls = record_class(fields)
+    record = cls.__new__(cls)
+    for descriptor, value in zip(cls._descriptors, values):
+        descriptor.__set__(record, value)
+    return record
+
+
+def to_dict(data):
+    '''Return the parsed dict of a compact output'''
+    if isinstance(data, Record):
+        return data.to_dict()
+    if isinstance(data, dict):
+        return {key: to_dict(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [to_dict(item) for item in data]
+    return data
+
+
+def _keep(data):
+    return data
+
+
+def _compile_dict(schema):
+    fields = {}
+    wildcard = None
+
+    for key, value in schema.items():
+        key, _, any_key = split_key(key)
+        if any_key:
+            wildcard = _compile(value)
+        else:
+            fields[key] = _compile(value)
+
+    def convert_dict(data):
+        # Converted in place, the records replace the values
+        for key, value in data.items():
+            convert = fields.get(key, wildcard)
+            if convert is not None and convert is not _keep:
+                data[key] = convert(value)
+        return data
+
+    if wildcard is not None:
+        def convert(data):
+            if type(data) is not dict:
+                return data
+            return convert_dict(data)
+        return convert
+
+    def convert(data):
+        if type(data) is not dict:
+            return data
+        try:
+            converts = [fields[key] for key in data]
+        except KeyError:
+            # Not in the schema, kept as a dict
+            return convert_dict(data)
+        record_cls = record_class(tuple(data))
+        record = record_cls.__new__(record_cls)
+        for descriptor, convert_value, value in zip(
+                record_cls._descriptors, converts, data.values()):
+            descriptor.__set__(record, convert_value(value))
+        return record
+    return convert
+
+
+def _compile_list(item_convert):
+    if item_convert is _keep:
+        return _keep
+
+    def convert(data):
+        if type(data) is not list:
+            return data
+        for index, item in enumerate(data):
+            data[index] = item_convert(item)
+        return data
+    return convert
+
+
+def _compile_or(schemas):
+    # Chosen by the type of the data
+    converts = {}
+    for schema in schemas:
+        if type(schema) is Schema:
+            schema = schema.schema
+        if type(schema) is dict:
+            converts.setdefault(dict, _compile(schema))
+        elif type(schema) in (list, ListOf):
+            converts.setdefault(list, _compile(schema))
+
+    if not converts:
+        return _keep
+
+    def convert(data):
+        return converts.get(type(data), _keep)(data)
+    return convert
+
+
+def _compile(schema):
+    '''Compile a schema into a function converting its data in place'''
+    schema_type = type(schema)
+
+    if schema_type is dict:
+        return _compile_dict(schema)
+    if schema_type is list:
+        if len(schema) == 1:
+            return _compile_list(_compile(schema[0]))
+        return _compile_list(_compile_or(schema))
+    if schema_type is ListOf:
+        return _compile_list(_compile(schema.schema))
+    if schema_type is Or:
+        return _compile_or(schema.args)
+    if schema_type is Schema:
+        return _compile(schema.schema)
+    return _keep
+
+
+def get_compactor(parser_cls):
+    '''Return the converter of the outputs of a parser class, compiled on
+    the first call'''
+    try:
+        return _compactors[parser_cls]
+    except KeyError:
+        pass
+
+    with _lock:
+        if parser_cls not in _compactors:
+            _compactors[parser_cls] = _compile(
+                getattr(parser_cls, 'schema', None))
+        return _compactors[parser_cls]
+
+
+def compact(parser_cls, parsed):
+    '''Convert a parsed output to its compact representation
+
+    The dictionaries of the parsed output are converted in place, the
+    parsed output must not be used afterwards.
+
+        Args:
+            parser_cls (`class`): parser class of the output
+            parsed (`dict`): parsed output
+
+        Returns:
+            the compact output
+    '''
+    return get_compactor(parser_cls)(parsed)
+
+
+class CompactParser(object):
+    '''Mixin for the parsers of large tables, which can return their output
+    in the compact representation, see `compact()`.
+
+        example:
+
+            >>> table = ShowBgpVrfAllAll(device=dev).parse_compact()
+    '''
+
+    def parse_compact(self, **kwargs):
+        '''Parse, then return the output as records'''
+        return compact(type(self), self.parse(**kwargs))
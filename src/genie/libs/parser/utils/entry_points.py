@@ -37,7 +37,7 @@ import sys
 import pkg_resources
 import logging
 
-from .common import parser_data
+from .common import parser_data, command_index, parser_cache
 
 log = logging.getLogger(__name__)
 
@@ -79,6 +79,9 @@ def add_parser(parser, os_name):
             'class': parser.__name__
         }
 
+    command_index.invalidate()
+    parser_cache.clear()
+
 
 def load_entry_points():
     for ep in pkg_resources.iter_entry_points(ENTRY_POINT_NAME):
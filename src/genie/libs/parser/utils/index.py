@@ -0,0 +1,306 @@
+'''Precompiled command lookup index used by the parser dispatcher'''
+
+# python
+import re
+import os
+import json
+import bisect
+import hashlib
+import marshal
+import logging
+
+log = logging.getLogger(__name__)
+
+# Generated next to parsers.json by make_parser_index
+INDEX_FILE = 'parsers.index'
+META_FILE = 'parsers_meta.json'
+INDEX_VERSION = 2
+
+# Keys of a parser entry which are not needed to dispatch a command
+META_KEYS = ('doc', 'schema', 'url', 'uid')
+
+
+class _Node(object):
+    '''One command token level of the trie'''
+
+    __slots__ = ('keywords', 'keys', 'arguments', 'embedded', 'commands')
+
+    def __init__(self):
+        # literal keyword -> child node
+        self.keywords = {}
+        # sorted keyword list used for prefix lookups
+        self.keys = []
+        # '{argument}' token -> child node
+        self.arguments = {}
+        # tokens with an argument inside them,
+        # ex: /dna/intent/api/v1/interface/{interface}
+        self.embedded = {}
+        # (position, command) of the commands ending at this node
+        self.commands = []
+
+    def child(self, token):
+        if '{' in token:
+            if token.startswith('{'):
+                return self.arguments.setdefault(token, _Node())
+
+            if token not in self.embedded:
+                start, end = re.match('(.*){.*?}(.*)', token).groups()
+                self.embedded[token] = (start, end, _Node())
+            return self.embedded[token][2]
+
+        if token not in self.keywords:
+            self.keywords[token] = _Node()
+            bisect.insort(self.keys, token)
+        return self.keywords[token]
+
+
+class CommandIndex(object):
+    '''Token trie built over the commands of the parser data.
+
+    The index narrows a search down to the commands which could possibly
+    match the given tokens, so the cost of a lookup depends on the number
+    of tokens in the search rather than on the number of known commands.
+    The candidates are a superset of what `_matches_fuzzy` accepts and are
+    returned in the parser data order, so callers still decide the final
+    match and scoring exactly as before.
+
+    The index is rebuilt lazily whenever the commands of the data it was
+    built from change size, or when `invalidate` is called.
+    '''
+
+    def __init__(self, data):
+        self.data = data
+        self._root = None
+        self._size = None
+
+    def invalidate(self):
+        '''Drop the compiled trie, it will be rebuilt on next lookup'''
+        self._root = None
+        self._size = None
+
+    def build(self):
+        root = _Node()
+        for position, command in enumerate(self.data):
+            node = root
+            for token in command.split():
+                node = node.child(token)
+            node.commands.append((position, command))
+
+        self._root = root
+        self._size = len(self.data)
+
+    def candidates(self, tokens):
+        '''Return the commands that may match the regular search tokens
+
+            Args:
+                tokens (`list`): search tokens, without any regex
+
+            Returns:
+                list: commands, in the same order as the parser data
+        '''
+        if self._root is None or self._size != len(self.data):
+            self.build()
+
+        found = {}
+        self._walk(self._root, tokens, 0, found)
+        return [command for _, command in sorted(found.values())]
+
+    def _walk(self, node, tokens, i, found):
+        if i == len(tokens):
+            for position, command in node.commands:
+                found[position] = (position, command)
+            return
+
+        token = tokens[i]
+
+        # Keywords match when equal or when the search token is a prefix
+        keys = node.keys
+        index = bisect.bisect_left(keys, token)
+        while index < len(keys) and keys[index].startswith(token):
+            self._walk(node.keywords[keys[index]], tokens, i + 1, found)
+            index += 1
+
+        # Arguments consume one or two search tokens
+        for child in node.arguments.values():
+            self._walk(child, tokens, i + 1, found)
+            if i + 2 <= len(tokens):
+                self._walk(child, tokens, i + 2, found)
+
+        for start, end, child in node.embedded.values():
+            if token.startswith(start) and token.endswith(end):
+                self._walk(child, tokens, i + 1, found)
+
+
+def _split_entry(entry):
+    '''Split a parsers.json command entry into dispatch and meta data'''
+    if not isinstance(entry, dict):
+        return entry, None
+
+    if 'class' in entry:
+        meta = {key: entry[key] for key in META_KEYS if key in entry}
+        return {key: value for key, value in entry.items()
+                if key not in META_KEYS}, meta
+
+    dispatch = {}
+    meta = {}
+    for key, value in entry.items():
+        dispatch[key], meta[key] = _split_entry(value)
+    return dispatch, meta
+
+
+def split_parser_data(data):
+    '''Split the parsers.json content into dispatch data and meta data
+
+        Args:
+            data (`dict`): content of parsers.json
+
+        Returns:
+            tuple: (dispatch data, meta data), the dispatch data only keeps
+                   the os/token levels with module_name, package and class
+    '''
+    dispatch = {}
+    meta = {}
+    for command, entry in data.items():
+        dispatch[command], meta[command] = _split_entry(entry)
+        if meta[command] is None:
+            del meta[command]
+    return dispatch, meta
+
+
+def _source_signature(parsers):
+    '''Return the (size, sha1) of parsers.json, which the generated files
+    are built from
+
+    The modification times are not compared, as an installed wheel gives
+    the files the time they were extracted at, in name order.
+    '''
+    digest = hashlib.sha1()
+    with open(parsers, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return [os.path.getsize(parsers), digest.hexdigest()]
+
+
+def make_parser_index(parsers=None, output_dir=None):
+    '''Build the runtime parser index from parsers.json
+
+    Writes the dispatch only data as a marshal file and the docs, schema
+    and urls into a separate json file which is only loaded on demand.
+
+        Args:
+            parsers (`str`): path to parsers.json, default to the one
+                             shipped with genie.libs.parser
+            output_dir (`str`): where to write the files, default to the
+                                directory of parsers.json
+    '''
+    if parsers is None:
+        parsers = os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                               'parsers.json')
+    if output_dir is None:
+        output_dir = os.path.dirname(os.path.abspath(parsers))
+
+    with open(parsers) as f:
+        dispatch, meta = split_parser_data(json.load(f))
+    source = _source_signature(parsers)
+
+    with open(os.path.join(output_dir, INDEX_FILE), 'wb') as f:
+        marshal.dump((INDEX_VERSION, source, dispatch), f)
+
+    with open(os.path.join(output_dir, META_FILE), 'w') as f:
+        json.dump({'version': INDEX_VERSION, 'source': source,
+                   'meta': meta}, f)
+
+    return dispatch
+
+
+def load_parser_index(parsers):
+    '''Load the dispatch data of the parsers.json file
+
+    The marshal index generated by make_parser_index is used when it is
+    present and was built from the same parsers.json, by size and sha1,
+    else parsers.json is read and stripped of its meta data.
+
+        Args:
+            parsers (`str`): path to parsers.json
+
+        Returns:
+            dict: dispatch data
+    '''
+    index = os.path.join(os.path.dirname(parsers), INDEX_FILE)
+    try:
+        with open(index, 'rb') as f:
+            version, source, dispatch = marshal.load(f)
+        if version == INDEX_VERSION and \
+                source == _source_signature(parsers):
+            return dispatch
+    except (OSError, ValueError, EOFError, TypeError):
+        pass
+
+    log.debug('Parser index {} is missing or outdated, loading {}'
+              .format(index, parsers))
+    with open(parsers) as f:
+        return split_parser_data(json.load(f))[0]
+
+
+def load_parser_meta(parsers):
+    '''Load the docs, schema and urls of the parsers
+
+        Args:
+            parsers (`str`): path to parsers.json
+
+        Returns:
+            dict: meta data with the same structure as parsers.json
+    '''
+    meta = os.path.join(os.path.dirname(parsers), META_FILE)
+    try:
+        with open(meta) as f:
+            data = json.load(f)
+        if data.get('version') == INDEX_VERSION and \
+                data.get('source') == _source_signature(parsers):
+            return data['meta']
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+
+    with open(parsers) as f:
+        return split_parser_data(json.load(f))[1]
+
+
+class LazyParserData(dict):
+    '''Parser data dictionary which is only loaded on first use.
+
+    Importing the parser utilities does not read any file, the loader is
+    called the first time the content of the dictionary is accessed.
+    '''
+
+    def __init__(self, loader):
+        super().__init__()
+        self._loader = loader
+
+    @property
+    def loaded(self):
+        return self._loader is None
+
+    def load(self):
+        if self._loader is not None:
+            loader, self._loader = self._loader, None
+            dict.update(self, loader())
+
+
+def _lazy(name):
+    method = getattr(dict, name)
+
+    def wrapper(self, *args, **kwargs):
+        self.load()
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+for _name in ('__contains__', '__getitem__', '__setitem__', '__delitem__',
+              '__iter__', '__len__', '__eq__', '__ne__', '__repr__',
+              'get', 'keys', 'values', 'items', 'copy', 'pop', 'popitem',
+              'setdefault', 'update', 'clear'):
+    setattr(LazyParserData, _name, _lazy(_name))
+del _name
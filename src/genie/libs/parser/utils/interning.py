@@ -0,0 +1,235 @@
+'''Interning of the repeated values of the parsed outputs
+
+Every match of a parser gives new strings, so the values which repeat
+over a large table, like the states, the protocols, the vrf and address
+family names or the next hops, are held once per entry. A parser declares
+the keys of its low cardinality values, next to its schema:
+
+    example:
+
+        >>> class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
+        ...     intern_fields = ['vrf', 'address_family', 'next_hop',
+        ...                      'status_codes', 'origin_codes']
+
+and interns its output with `intern_parsed()` before returning it. The
+values of the declared keys, where the schema has a str, are replaced by
+the first equal value seen by the process, so the output and the results
+cached from it hold each distinct value once. The keys of the Any() level
+under a declared key, like the vrf names under `vrf`, are interned too.
+
+The distinct values are kept in a bounded table, which starts over when it
+is full, so a high cardinality field does not grow it without limit.
+'''
+
+# python
+import threading
+
+from genie.metaparser.util.schemaengine import Schema, Or, ListOf
+
+from pyats import configuration as cfg
+
+from .schema_keys import split_key
+
+INTERN_TABLE_SIZE = 'genie.libs.parser.intern_table_size'
+
+# Compiled interning, by parser class
+_interners = {}
+_lock = threading.Lock()
+
+
+class InternTable(object):
+    '''Bounded table of the distinct values of the interned fields
+
+        Args:
+            maxsize (`int`): number of distinct values kept
+    '''
+
+    def __init__(self, maxsize=65536):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._values = {}
+
+    def __len__(self):
+        return len(self._values)
+
+    def intern(self, value):
+        '''Return the first equal value of the table'''
+        try:
+            interned = self._values[value]
+        except KeyError:
+            self.misses += 1
+            if len(self._values) >= self.maxsize:
+                # Start over, not to keep a high cardinality field
+                self._values.clear()
+            return self._values.setdefault(value, value)
+        self.hits += 1
+        return interned
+
+    def clear(self):
+        '''Forget the values and reset the counters'''
+        self._values.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        '''Return the table statistics'''
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'maxsize': self.maxsize,
+                'currsize': len(self._values)}
+
+
+# Values shared by the parsers of the process
+intern_table = InternTable(int(cfg.get(INTERN_TABLE_SIZE, 65536)))
+
+
+def _is_str(schema):
+    '''Tell if a leaf schema accepts a str'''
+    if type(schema) is Or:
+        return any(_is_str(alternative) for alternative in schema.args)
+    return schema is str
+
+
+def _compile_dict(schema, names, intern_keys):
+    fields = {}
+    wildcard = None
+
+    for key, value in schema.items():
+        key, _, any_key = split_key(key)
+        if any_key:
+            wildcard = _compile(value, names)
+        else:
+            convert = _compile(value, names, intern=key in names)
+            if convert is not None:
+                fields[key] = convert
+
+    # Only the keys of an Any() level are data
+    intern_keys = intern_keys and wildcard is not None
+    if not fields and wildcard is None and not intern_keys:
+        return None
+
+    intern = intern_table.intern
+
+    def convert(data):
+        if type(data) is not dict:
+            return data
+        for key, value in data.items():
+            convert_value = fields.get(key, wildcard)
+            if convert_value is not None:
+                converted = convert_value(value)
+                if converted is not value:
+                    data[key] = converted
+        if intern_keys:
+            # A dict keeps its key objects, it is rebuilt
+            return {intern(key) if type(key) is str else key: value
+                    for key, value in data.items()}
+        return data
+    return convert
+
+
+def _compile_list(item_convert):
+    if item_convert is None:
+        return None
+
+    def convert(data):
+        if type(data) is not list:
+            return data
+        for index, item in enumerate(data):
+            data[index] = item_convert(item)
+        return data
+    return convert
+
+
+def _compile_or(schemas, names, intern):
+    # Chosen by the type of the data
+    converts = {}
+    for schema in schemas:
+        convert = _compile(schema, names, intern)
+        if convert is None:
+            continue
+        schema = schema.schema if type(schema) is Schema else schema
+        if type(schema) is dict:
+            converts.setdefault(dict, convert)
+        elif type(schema) in (list, ListOf):
+            converts.setdefault(list, convert)
+        else:
+            converts.setdefault(str, convert)
+
+    if not converts:
+        return None
+
+    def convert(data):
+        convert_data = converts.get(type(data))
+        return data if convert_data is None else convert_data(data)
+    return convert
+
+
+def _compile(schema, names, intern=False):
+    '''Compile the interning of the declared fields of a schema, None when
+    there is nothing to intern'''
+    schema_type = type(schema)
+
+    if schema_type is Schema:
+        return _compile(schema.schema, names, intern)
+    if schema_type is dict:
+        return _compile_dict(schema, names, intern)
+    if schema_type is ListOf:
+        return _compile_list(_compile(schema.schema, names, intern))
+    if schema_type is list:
+        if len(schema) == 1:
+            return _compile_list(_compile(schema[0], names, intern))
+        return _compile_list(_compile_or(schema, names, intern))
+    if schema_type is Or:
+        return _compile_or(schema.args, names, intern)
+    if intern and _is_str(schema):
+        intern_value = intern_table.intern
+
+        def convert(data):
+            return intern_value(data) if type(data) is str else data
+        return convert
+    return None
+
+
+def get_interner(parser_cls):
+    '''Return the interning of the outputs of a parser class, compiled on
+    the first call, None when the parser declares no intern_fields'''
+    try:
+        return _interners[parser_cls]
+    except KeyError:
+        pass
+
+    with _lock:
+        if parser_cls not in _interners:
+            names = frozenset(getattr(parser_cls, 'intern_fields', ()))
+            _interners[parser_cls] = _compile(
+                getattr(parser_cls, 'schema', None), names) \
+                if names else None
+        return _interners[parser_cls]
+
+
+def intern_parsed(parser, parsed):
+    '''Intern the values of the intern_fields of a parsed output, in place
+
+        Args:
+            parser (`MetaParser`): parser class or instance
+            parsed (`dict`): parsed output
+
+        Returns:
+            the parsed output
+    '''
+    parser_cls = parser if isinstance(parser, type) else type(parser)
+    interner = get_interner(parser_cls)
+    if interner is None or not parsed:
+        return parsed
+    return interner(parsed)
+
+
+def clear_intern_table():
+    '''Clear the interned values of the process'''
+    intern_table.clear()
+
+
+def get_intern_table_info():
+    '''Return the hits, misses and size of the interned values table'''
+    return intern_table.info()
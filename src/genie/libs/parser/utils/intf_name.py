@@ -0,0 +1,161 @@
+'''Interface name normalization
+
+The parsers convert the short interface names of the show commands, such as
+`Gi1/0/1`, to their full name with `Common.convert_intf_name()`, usually
+once per line of output. A device reports the same few names over and over,
+so the conversions are driven by a precomputed table of the interface types
+and memoized in a bounded cache shared by all the parsers.
+
+    example:
+
+        >>> convert_intf_name('Gi1/0/1')
+        'GigabitEthernet1/0/1'
+        >>> convert_intf_names(['Po10', 'Te1/1/1'])
+        ['Port-channel10', 'TenGigabitEthernet1/1/1']
+        >>> shorten_intf_name('GigabitEthernet1/0/1')
+        'Gi1/0/1'
+'''
+
+# python
+import re
+from functools import lru_cache
+
+from pyats import configuration as cfg
+
+INTF_NAME_CACHE_SIZE = 'genie.libs.parser.intf_name_cache_size'
+
+# Full name of the interface types, by short name.
+# Please add more when face other type of interface
+INTF_TYPES = {'Eth': 'Ethernet',
+              'Lo': 'Loopback',
+              'lo': 'Loopback',
+              'Fa': 'FastEthernet',
+              'Fas': 'FastEthernet',
+              'Po': 'Port-channel',
+              'PO': 'Port-channel',
+              'Null': 'Null',
+              'Gi': 'GigabitEthernet',
+              'Gig': 'GigabitEthernet',
+              'GE': 'GigabitEthernet',
+              'Te': 'TenGigabitEthernet',
+              'Ten': 'TenGigabitEthernet',
+              'Tw': 'TwoGigabitEthernet',
+              'Two': 'TwoGigabitEthernet',
+              'Twe': 'TwentyFiveGigE',
+              'mgmt': 'mgmt',
+              'Vl': 'Vlan',
+              'Tu': 'Tunnel',
+              'Fe': '',
+              'Hs': 'HSSI',
+              'AT': 'ATM',
+              'Et': 'Ethernet',
+              'BD': 'BDI',
+              'Se': 'Serial',
+              'Fo': 'FortyGigabitEthernet',
+              'For': 'FortyGigabitEthernet',
+              'Hu': 'HundredGigE',
+              'Hun': 'HundredGigE',
+              'vl': 'vasileft',
+              'vr': 'vasiright',
+              'BE': 'Bundle-Ether',
+              'M-E': 'M-Ethernet',             # comware
+              'BAGG': 'Bridge-Aggregation'     # comware
+              }
+
+# Short name of the interface types, by full name. The first short name
+# of a type in INTF_TYPES is the one used.
+SHORT_INTF_TYPES = {}
+for _short, _full in INTF_TYPES.items():
+    if _full and _full != _short:
+        SHORT_INTF_TYPES.setdefault(_full, _short)
+
+_intf_type = re.compile(r'([a-zA-Z]+)')
+_intf_port = re.compile(r'([\d\/\.]+)')
+_full_intf_type = re.compile(r'^(?P<type>[a-zA-Z][a-zA-Z\-]*?) *'
+                             r'(?P<port>\d.*)$')
+
+_cache_size = int(cfg.get(INTF_NAME_CACHE_SIZE, 4096))
+
+
+@lru_cache(maxsize=_cache_size)
+def convert_intf_name(intf):
+    '''return the full interface name
+
+        Args:
+            intf (`str`): Short version of the interface name
+
+        Returns:
+            Full interface name fit the standard
+
+        example:
+
+            >>> convert_intf_name('Eth2/1')
+            'Ethernet2/1'
+    '''
+    m = _intf_type.search(intf)
+    m1 = _intf_port.search(intf)
+    if m and m1:
+        if 'M-E' in intf:
+            int_type = 'M-E'
+        else:
+            int_type = m.group(0)
+        int_port = m1.group(0)
+        if int_type in INTF_TYPES:
+            return INTF_TYPES[int_type] + int_port
+        else:
+            # Unifying interface names
+            return intf[0].capitalize() + intf[1:].replace(
+                ' ', '').replace('ethernet', 'Ethernet')
+    else:
+        return intf
+
+
+@lru_cache(maxsize=_cache_size)
+def shorten_intf_name(intf):
+    '''return the short interface name, the reverse of convert_intf_name
+
+        Args:
+            intf (`str`): Full interface name
+
+        Returns:
+            Short interface name, or the name as is when its type has
+            no short name
+
+        example:
+
+            >>> shorten_intf_name('TenGigabitEthernet1/0/1')
+            'Te1/0/1'
+    '''
+    m = _full_intf_type.match(intf)
+    if m and m.group('type') in SHORT_INTF_TYPES:
+        return SHORT_INTF_TYPES[m.group('type')] + m.group('port')
+    return intf
+
+
+def convert_intf_names(intfs):
+    '''return the full name of a list of interfaces'''
+    return [convert_intf_name(intf) for intf in intfs]
+
+
+def shorten_intf_names(intfs):
+    '''return the short name of a list of interfaces'''
+    return [shorten_intf_name(intf) for intf in intfs]
+
+
+def clear_intf_name_cache():
+    '''Clear the interface name conversion caches'''
+    convert_intf_name.cache_clear()
+    shorten_intf_name.cache_clear()
+
+
+def get_intf_name_cache_info():
+    '''Return the hits, misses and size of the interface name caches'''
+    info = {}
+    for name, func in (('convert', convert_intf_name),
+                       ('shorten', shorten_intf_name)):
+        cache = func.cache_info()
+        info[name] = {'hits': cache.hits,
+                      'misses': cache.misses,
+                      'maxsize': cache.maxsize,
+                      'currsize': cache.currsize}
+    return info
@@ -0,0 +1,215 @@
+'''Incremental decoding of the items of the JSON collections
+
+A REST collection, like an iControl REST `/mgmt/tm/ltm/pool`, is an object
+whose `items` member holds one value per resource. json.loads() needs the
+whole body, and gives the whole collection at once. `iter_json_items()`
+decodes the body one block at a time and yields each item as soon as it is
+complete, so the memory used does not grow with the number of items:
+
+    example:
+
+        >>> members = {}
+        >>> for item in iter_json_items(response.iter_content(65536),
+        ...                             members=members):
+        ...     pools[item['name']] = item
+        >>> next_link = members.get('nextLink')
+
+The other members of the object are decoded whole, in `members`, where
+the member of the items is an empty list.
+'''
+
+# python
+import re
+import json
+import codecs
+
+from .stream import CHUNK_SIZE
+
+# States of the decoder
+START, KEY, COLON, VALUE, NEXT, ITEMS, ITEM, ITEMS_NEXT, END = range(9)
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# Characters which start a number, and which may follow a value
+NUMBER_START = frozenset('-0123456789')
+DELIMITERS = frozenset(',]} \t\n\r')
+
+
+class JsonItems(object):
+    '''Incremental decoder of a JSON object and the items of one member
+
+    A value which is not complete at the end of a block is decoded again
+    once the buffer has doubled, so a large member is not decoded once per
+    block.
+
+        Args:
+            key (`str`): member holding the items
+    '''
+
+    def __init__(self, key='items'):
+        self.key = key
+        self.members = {}
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._state = START
+        self._member = None
+        # Size of the buffer from which an incomplete value is tried again
+        self._retry = 0
+
+    def feed(self, text):
+        '''Decode a block of the body
+
+            Returns:
+                `list` of the items completed by the block
+        '''
+        self._buffer = self._buffer[self._pos:] + text
+        self._retry -= self._pos
+        self._pos = 0
+        if len(self._buffer) < self._retry:
+            return []
+        return self._decode(final=False)
+
+    def close(self):
+        '''Decode the end of the body
+
+            Returns:
+                `list` of the last items
+
+            Raises:
+                ValueError: body is not a complete JSON object
+        '''
+        items = self._decode(final=True)
+        if self._state != END:
+            raise ValueError('Incomplete JSON object')
+        return items
+
+    def _value(self, final):
+        '''Decode the value at the position, None when it is incomplete'''
+        buffer = self._buffer
+        try:
+            value, end = self._decoder.raw_decode(buffer, self._pos)
+        except ValueError:
+            if final:
+                raise
+            value = end = None
+        # A number which is not followed by a delimiter may go on in the
+        # next block, like 1. then 5
+        if end is not None and not final and \
+                buffer[self._pos] in NUMBER_START and \
+                (end == len(buffer) or buffer[end] not in DELIMITERS):
+            end = None
+        if end is None or (end == len(buffer) and not final):
+            self._retry = self._pos + 2 * (len(buffer) - self._pos)
+            return None
+        self._retry = 0
+        self._pos = end
+        return (value,)
+
+    def _decode(self, final):
+        items = []
+        buffer = self._buffer
+
+        while True:
+            self._pos = WHITESPACE.match(buffer, self._pos).end()
+            if self._pos == len(buffer):
+                return items
+            char = buffer[self._pos]
+            state = self._state
+
+            if state in (KEY, VALUE, ITEM):
+                if state == KEY and char == '}':
+                    self._pos += 1
+                    self._state = END
+                    continue
+                if state == VALUE and char == '[' and \
+                        self._member == self.key:
+                    self.members[self.key] = []
+                    self._pos += 1
+                    self._state = ITEMS
+                    continue
+                if state == KEY and char != '"':
+                    raise ValueError('Expecting a member name at '
+                                     '{!r}'.format(buffer[self._pos:][:20]))
+                value = self._value(final)
+                if value is None:
+                    return items
+                value = value[0]
+                if state == KEY:
+                    self._member = value
+                    self._state = COLON
+                elif state == VALUE:
+                    self.members[self._member] = value
+                    self._state = NEXT
+                else:
+                    items.append(value)
+                    self._state = ITEMS_NEXT
+                continue
+
+            if state == ITEMS and char == ']':
+                self._state = NEXT
+            elif state == ITEMS:
+                # First item, not consumed
+                self._state = ITEM
+                continue
+            elif state == END:
+                raise ValueError('Extra data at {!r}'.format(
+                    buffer[self._pos:][:20]))
+            else:
+                expected = {START: '{', COLON: ':', NEXT: ',}',
+                            ITEMS_NEXT: ',]'}[state]
+                if char not in expected:
+                    raise ValueError('Expecting {!r} at {!r}'.format(
+                        expected, buffer[self._pos:][:20]))
+                if state == START:
+                    self._state = KEY
+                elif state == COLON:
+                    self._state = VALUE
+                elif char == ',':
+                    self._state = KEY if state == NEXT else ITEM
+                elif state == NEXT:
+                    self._state = END
+                else:
+                    self._state = NEXT
+            self._pos += 1
+
+
+def iter_json_items(body, key='items', members=None, encoding='utf-8'):
+    '''Yield the items of a JSON collection as they are decoded
+
+        Args:
+            body (`str`, `bytes`, file-like or iterable): body, or its blocks
+            key (`str`): member holding the items
+            members (`dict`): updated with the members of the object, the
+                              member of the items as an empty list
+            encoding (`str`): encoding of bytes blocks
+
+        Returns:
+            generator of the items
+
+        Raises:
+            ValueError: body is not a JSON object
+    '''
+    if isinstance(body, (str, bytes, bytearray)):
+        chunks = (body[i:i + CHUNK_SIZE]
+                  for i in range(0, len(body), CHUNK_SIZE))
+    elif hasattr(body, 'read'):
+        chunks = iter(lambda: body.read(CHUNK_SIZE), body.read(0))
+    else:
+        chunks = body
+
+    decoder = JsonItems(key)
+    text_decoder = None
+    for chunk in chunks:
+        if not isinstance(chunk, str):
+            if text_decoder is None:
+                text_decoder = codecs.getincrementaldecoder(encoding)()
+            chunk = text_decoder.decode(chunk)
+        yield from decoder.feed(chunk)
+        if members is not None:
+            members.update(decoder.members)
+    if text_decoder is not None:
+        yield from decoder.feed(text_decoder.decode(b'', final=True))
+    yield from decoder.close()
+    if members is not None:
+        members.update(decoder.members)
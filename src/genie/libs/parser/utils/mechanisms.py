@@ -0,0 +1,117 @@
+'''Concurrent parsing mechanisms of the merge contexts
+
+A context like `yang_cli` parses the same feature through several
+mechanisms and merges their outputs. Each mechanism goes through its own
+transport, the cli session or the NETCONF session, so they are independent
+and the collection does not need to wait for one before starting the
+other. `run_mechanisms()` runs them in threads and merges their outputs
+once they are all done:
+
+    example:
+
+        >>> def yang_cli(self, timeouts=None):
+        ...     return run_mechanisms(self, ['yang', 'cli'],
+        ...                           timeouts=timeouts)
+
+Each mechanism has its own timeout, in seconds from the start of the
+collection, `genie.libs.parser.mechanism_timeout` by default (no timeout
+when it is not set). A mechanism which fails or times out is left out of
+the merged output, which holds the outputs of the others, and its error
+is kept in the `mechanism_errors` of the parser. The merge raises only
+when no mechanism gives an output, or when partial outputs are refused.
+'''
+
+# python
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+from genie.metaparser.util import merge_dict
+
+from pyats import configuration as cfg
+
+log = logging.getLogger(__name__)
+
+MECHANISM_TIMEOUT = 'genie.libs.parser.mechanism_timeout'
+
+
+def get_timeout(name, timeouts=None):
+    '''Return the timeout of a mechanism, None for no timeout
+
+        Args:
+            name (`str`): mechanism, like 'cli'
+            timeouts (`dict` or `float`): timeout of each mechanism, or of
+                                          all of them
+    '''
+    if isinstance(timeouts, dict):
+        timeout = timeouts.get(name)
+    else:
+        timeout = timeouts
+    if timeout is None:
+        timeout = cfg.get(MECHANISM_TIMEOUT, None)
+    return None if timeout is None else float(timeout)
+
+
+def run_mechanisms(parser, mechanisms, timeouts=None, partial=True,
+                   **kwargs):
+    '''Run the mechanisms of a parser concurrently and merge their outputs
+
+    The outputs are merged in the order of the mechanisms, the values of
+    the later ones are added to the earlier ones. The thread of a
+    mechanism which times out is not waited for.
+
+        Args:
+            parser (`MetaParser`): parser of the mechanisms
+            mechanisms (`list`): methods of the parser, like ['yang', 'cli']
+            timeouts (`dict` or `float`): timeout of each mechanism, or of
+                                          all of them
+            partial (`bool`): merge the outputs of the other mechanisms
+                              when one fails or times out
+            kwargs: arguments of each mechanism
+
+        Returns:
+            merged `dict`
+
+        Raises:
+            the error of the first mechanism which failed, when no
+            mechanism gives an output or partial is False
+    '''
+    parser.mechanism_errors = errors = {}
+    start = time.monotonic()
+    executor = ThreadPoolExecutor(max_workers=len(mechanisms))
+    try:
+        futures = [(name, executor.submit(getattr(parser, name), **kwargs))
+                   for name in mechanisms]
+
+        outputs = []
+        for name, future in futures:
+            timeout = get_timeout(name, timeouts)
+            if timeout is not None:
+                timeout = max(0, start + timeout - time.monotonic())
+            try:
+                outputs.append(future.result(timeout=timeout))
+            except TimeoutError:
+                future.cancel()
+                errors[name] = TimeoutError(
+                    "Mechanism '{}' of {} did not complete within {} "
+                    "seconds".format(name, type(parser).__name__,
+                                     get_timeout(name, timeouts)))
+            except Exception as e:
+                errors[name] = e
+    finally:
+        # Not waiting for the mechanisms which timed out
+        executor.shutdown(wait=False)
+
+    for name, error in errors.items():
+        log.warning("Mechanism '{}' of {} failed: {}".format(
+            name, type(parser).__name__, error))
+
+    # Mechanisms which have nothing to parse, like a yang() not implemented
+    outputs = [output for output in outputs if output]
+    if errors and (not partial or not outputs):
+        raise errors[next(name for name in mechanisms if name in errors)]
+
+    merged = {}
+    for output in outputs:
+        merged = merge_dict(merged, output)
+    return merged
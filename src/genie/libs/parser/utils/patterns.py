@@ -0,0 +1,300 @@
+'''Class level regular expressions for parsers'''
+
+# python
+import re
+
+try:
+    # python 3.11+
+    from re import _parser as sre_parse
+except ImportError:
+    import sre_parse
+
+# First characters are tracked over ascii, lines starting with any other
+# character are tried against every pattern
+_ASCII = frozenset(chr(i) for i in range(128))
+
+_CATEGORIES = {
+    getattr(sre_parse, 'CATEGORY_' + name): frozenset(
+        c for c in _ASCII
+        if re.match(regex, c) or re.match(regex, c, re.ASCII))
+    for name, regex in (('DIGIT', r'\d'), ('NOT_DIGIT', r'\D'),
+                        ('SPACE', r'\s'), ('NOT_SPACE', r'\S'),
+                        ('WORD', r'\w'), ('NOT_WORD', r'\W'))}
+
+_REPEATS = tuple(getattr(sre_parse, name) for name in
+                 ('MAX_REPEAT', 'MIN_REPEAT', 'POSSESSIVE_REPEAT')
+                 if hasattr(sre_parse, name))
+
+
+class Patterns(object):
+    '''Regular expressions of a parser, declared once at class level.
+
+    Each pattern is compiled the first time it is used and then kept on
+    the instance, so it is neither compiled again on the next call nor
+    evicted from the `re` module cache when many parsers are in rotation.
+    A pattern is either a string or a (string, flags) tuple.
+
+    The patterns are looked up through the class which declares them, so
+    a subclass declaring its own patterns does not change the ones used by
+    the methods it inherits.
+
+        example:
+
+            >>> class ShowClock(ShowClockSchema):
+            ...     patterns = Patterns(
+            ...         # *17:31:27.587 UTC Thu Aug 20 2020
+            ...         p1=r'^\\*?(?P<time>[\\d\\:\\.]+) +(?P<timezone>\\w+) '
+            ...            r'+(?P<day_of_week>\\w+) +(?P<month>\\w+) '
+            ...            r'+(?P<day>\\d+) +(?P<year>\\d+)$',
+            ...     )
+            ...
+            ...     def cli(self, output=None):
+            ...         p = ShowClock.patterns
+            ...         for line in out.splitlines():
+            ...             m = p.p1.match(line.strip())
+    '''
+
+    def __init__(self, **patterns):
+        self._patterns = patterns
+
+    def __getattr__(self, name):
+        try:
+            pattern = self.__dict__['_patterns'][name]
+        except KeyError:
+            raise AttributeError("No pattern named '{}'".format(name)) \
+                from None
+
+        if isinstance(pattern, tuple):
+            compiled = re.compile(*pattern)
+        else:
+            compiled = re.compile(pattern)
+
+        # Pin it, next lookups are a plain attribute access
+        setattr(self, name, compiled)
+        return compiled
+
+    def __iter__(self):
+        return iter(self._patterns)
+
+    def __len__(self):
+        return len(self._patterns)
+
+    def __contains__(self, name):
+        return name in self._patterns
+
+    def compile_all(self):
+        '''Compile every pattern now instead of on first use'''
+        for name in self._patterns:
+            getattr(self, name)
+        return self
+
+    def match(self, line):
+        '''Return (name, match) of the first pattern, in declaration order,
+        which matches the line, else (None, None). See `LineDispatcher`.'''
+        match = self.__dict__.get('match')
+        if match is None:
+            # Pin it, next calls go straight to the dispatcher. A caller
+            # holding this bound method reuses it too.
+            match = self.__dict__['match'] = self.dispatcher().match
+        return match(line)
+
+    def dispatcher(self, *names):
+        '''Return a `LineDispatcher` over the given patterns, default to
+        every pattern, in declaration order'''
+        return LineDispatcher(self, names or list(self._patterns))
+
+    def selected_dispatcher(self, names):
+        '''Return a `LineDispatcher` which matches the lines of the given
+        patterns like the dispatcher over every pattern does.
+
+        A line is matched by the first pattern which matches it, so the
+        patterns declared before a selected one, which can match the same
+        lines, are kept. The caller skips the lines they match.'''
+        names = frozenset(names)
+        cache = self.__dict__.setdefault('_selected', {})
+        try:
+            return cache[names]
+        except KeyError:
+            pass
+
+        order = list(self._patterns)
+        starts = {name: _pattern_start(getattr(self, name))[:2]
+                  for name in order}
+        kept = []
+        for index, name in enumerate(order):
+            if name in names or any(
+                    _overlap(starts[name], starts[other])
+                    for other in order[index + 1:] if other in names):
+                kept.append(name)
+
+        dispatcher = cache[names] = LineDispatcher(self, kept)
+        return dispatcher
+
+
+def _in_chars(items):
+    '''Ascii characters matched by a [...] character set'''
+    chars = set()
+    negate = False
+    for op, av in items:
+        if op == sre_parse.NEGATE:
+            negate = True
+        elif op == sre_parse.LITERAL:
+            chars.add(chr(av))
+        elif op == sre_parse.RANGE:
+            chars.update(chr(i) for i in range(av[0], min(av[1], 127) + 1))
+        elif op == sre_parse.CATEGORY and av in _CATEGORIES:
+            chars |= _CATEGORIES[av]
+        else:
+            return None
+    chars &= _ASCII
+    return _ASCII - chars if negate else chars
+
+
+def _first_chars(items):
+    '''Return (chars, nullable) for a parsed regular expression.
+
+    chars is the set of ascii characters a matching string can start with,
+    or None when it cannot be worked out. nullable tells if the items can
+    match without consuming any character.
+    '''
+    chars = set()
+    for op, av in items:
+        nullable = False
+        if op == sre_parse.LITERAL:
+            first = {chr(av)}
+        elif op == sre_parse.NOT_LITERAL:
+            first = _ASCII - {chr(av)}
+        elif op == sre_parse.ANY:
+            first = _ASCII
+        elif op == sre_parse.IN:
+            first = _in_chars(av)
+        elif op in (sre_parse.AT, sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+            # Zero width
+            first, nullable = set(), True
+        elif op == sre_parse.SUBPATTERN:
+            # (group, add_flags, del_flags, pattern) or (group, pattern)
+            if len(av) == 4 and av[1] & re.IGNORECASE:
+                return None, True
+            first, nullable = _first_chars(av[-1])
+        elif op == sre_parse.BRANCH:
+            first = set()
+            for branch in av[1]:
+                branch_first, branch_nullable = _first_chars(branch)
+                if branch_first is None:
+                    return None, True
+                first |= branch_first
+                nullable = nullable or branch_nullable
+        elif op in _REPEATS:
+            first, nullable = _first_chars(av[2])
+            nullable = nullable or av[0] == 0
+        elif op == getattr(sre_parse, 'ATOMIC_GROUP', None):
+            first, nullable = _first_chars(av)
+        else:
+            return None, True
+
+        if first is None:
+            return None, True
+        chars |= first
+        if not nullable:
+            return chars, False
+    return chars, True
+
+
+def _required_literal(items):
+    '''Longest literal text every matching string contains'''
+    runs = [[]]
+    for op, av in items:
+        if op == sre_parse.LITERAL:
+            runs[-1].append(chr(av))
+            continue
+        if op in _REPEATS and av[0] >= 1 and len(av[2]) == 1 \
+                and av[2][0][0] == sre_parse.LITERAL:
+            # ' +' contains at least one space
+            runs[-1].append(chr(av[2][0][1]))
+        runs.append([])
+    return max((''.join(run) for run in runs), key=len)
+
+
+def _pattern_start(regex):
+    '''Return (chars, nullable, literal) of a compiled pattern, chars is
+    None when the first characters cannot be worked out'''
+    if isinstance(regex.pattern, str) and not regex.flags & re.IGNORECASE:
+        parsed = list(sre_parse.parse(regex.pattern, regex.flags))
+        chars, nullable = _first_chars(parsed)
+        return chars, nullable, _required_literal(parsed)
+    return None, True, ''
+
+
+def _overlap(start, other):
+    '''Tell if two patterns, by their (chars, nullable), may match the
+    same line'''
+    if start[0] is None or other[0] is None or start[1] or other[1]:
+        return True
+    return bool(start[0] & other[0])
+
+
+class LineDispatcher(object):
+    '''Route each line to the few patterns which can match it.
+
+    Parsers usually try every pattern, one after the other, on every line
+    of the output until one matches. The dispatcher works out from each
+    pattern the characters a line must start with and the literal text it
+    must contain, so a line is only tried against the patterns which can
+    match it.
+    Patterns are still tried in declaration order and the first match is
+    returned, so it is a drop-in replacement for a chain of
+    `m = p.pN.match(line)` which `continue` on match.
+
+        example:
+
+            >>> name, m = p.match(line)
+            >>> if name == 'p1':
+            ...     interface = m.groupdict()['interface']
+    '''
+
+    def __init__(self, patterns, names):
+        self.patterns = patterns
+        self.names = tuple(names)
+        self._entries = None
+        self._buckets = None
+
+    def build(self):
+        entries = []
+        starts = []
+        for name in self.names:
+            regex = getattr(self.patterns, name)
+            chars, nullable, literal = _pattern_start(regex)
+            entries.append((name, literal, regex))
+            starts.append(None if chars is None else (chars, nullable))
+
+        buckets = {}
+        for char in _ASCII:
+            buckets[char] = tuple(
+                entry for entry, start in zip(entries, starts)
+                if start is None or char in start[0])
+        buckets[''] = tuple(entry for entry, start in zip(entries, starts)
+                            if start is None or start[1])
+
+        self._entries = tuple(entries)
+        self._buckets = buckets
+
+    def candidates(self, line):
+        '''Names of the patterns which may match the line'''
+        if self._buckets is None:
+            self.build()
+        return [name for name, literal, _ in
+                self._buckets.get(line[:1], self._entries)
+                if literal in line]
+
+    def match(self, line):
+        '''Return (name, match) of the first matching pattern, in
+        declaration order, else (None, None)'''
+        if self._buckets is None:
+            self.build()
+        for name, literal, regex in self._buckets.get(line[:1],
+                                                      self._entries):
+            if literal in line:
+                m = regex.match(line)
+                if m:
+                    return name, m
+        return None, None
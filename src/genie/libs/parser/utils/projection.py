@@ -0,0 +1,146 @@
+'''Projection of a parsed output on the keys requested by the caller
+
+A caller which only needs a few leaves of a large output gives them to
+parse() as schema paths, with `*` for the Any() levels of the schema. The
+parsers which support it skip the patterns and the dict construction of
+the keys which are not requested, and the output is pruned to the
+requested keys.
+
+    example:
+
+        >>> ShowInterfaces(device=device).parse(
+        ...     fields=['*.oper_status', '*.line_protocol', '*.bandwidth'])
+
+The `exclude` list of a parser names its volatile keys, like the counters
+and timers. `volatile=False` drops them from the output, at any level.
+
+    example:
+
+        >>> ShowInterfaces(device=device).parse(volatile=False)
+
+A parser supports the projection by declaring which keys the lines of
+each of its patterns fill, see `Projection.match()`.
+'''
+
+# python
+import re
+
+# Any() level of a schema path
+WILDCARD = '*'
+
+
+def _split(path):
+    if isinstance(path, str):
+        return tuple(path.split('.'))
+    return tuple(path)
+
+
+def _key_match(field_key, key):
+    return field_key == WILDCARD or key == WILDCARD or field_key == key
+
+
+class Projection(object):
+    '''Keys of a parsed output requested by the caller
+
+        Args:
+            fields (`list`): schema paths to keep, as 'a.*.b' strings or
+                             tuples, default to every key
+            exclude (`list`): regular expressions of the keys to drop at
+                              any level, like the exclude of the parser
+    '''
+
+    def __init__(self, fields=None, exclude=None):
+        self.fields = [_split(field) for field in fields] if fields else None
+        self.exclude = [re.compile(key) for key in exclude or ()]
+
+    @classmethod
+    def from_parser(cls, parser, fields=None, volatile=True):
+        '''Return the projection of a parse, None when the whole output is
+        requested
+
+            Args:
+                parser (`MetaParser`): parser class or instance
+                fields (`list`): schema paths to keep
+                volatile (`bool`): keep the keys of the parser exclude list
+        '''
+        exclude = None if volatile else getattr(parser, 'exclude', None)
+        if not fields and not exclude:
+            return None
+        return cls(fields=fields, exclude=exclude)
+
+    def wants(self, *path):
+        '''Tell if the schema path, or a key under it, is requested'''
+        if self.fields is None:
+            return True
+        for field in self.fields:
+            if all(_key_match(field_key, key)
+                   for field_key, key in zip(field, path)):
+                return True
+        return False
+
+    def match(self, patterns, pattern_fields, prefix=()):
+        '''Return a match(line) function over the patterns of the requested
+        keys, which returns (name, match) like `Patterns.match()`
+
+            Args:
+                patterns (`Patterns`): patterns of the parser
+                pattern_fields (`dict`): schema paths, relative to `prefix`,
+                                         filled by the lines of a pattern.
+                                         Patterns which are not in it, like
+                                         the ones giving the current entry,
+                                         are always used
+                prefix (`tuple`): schema path of the entries
+        '''
+        if self.fields is None:
+            return patterns.match
+
+        selected = [
+            name for name in patterns
+            if name not in pattern_fields or any(
+                self.wants(*(prefix + _split(path)))
+                for path in pattern_fields[name])]
+        match = patterns.selected_dispatcher(selected).match
+        selected = frozenset(selected)
+
+        def selected_match(line):
+            name, m = match(line)
+            if name in selected:
+                return name, m
+            return None, None
+        return selected_match
+
+    def project(self, data):
+        '''Return the requested keys of a parsed output'''
+        return self._project(data, self.fields)
+
+    def _project(self, data, fields):
+        result = {}
+        for key, value in data.items():
+            if any(regex.match(str(key)) for regex in self.exclude):
+                continue
+
+            if fields is None:
+                sub_fields = None
+            else:
+                matched = [field for field in fields
+                           if _key_match(field[0], key)]
+                if not matched:
+                    continue
+                # The whole value when a field ends at this key
+                sub_fields = None if any(len(field) == 1
+                                         for field in matched) \
+                    else [field[1:] for field in matched]
+
+            if isinstance(value, dict) and value:
+                if sub_fields is None and not self.exclude:
+                    result[key] = value
+                    continue
+                value = self._project(value, sub_fields)
+                if not value:
+                    # Nothing requested under it
+                    continue
+            elif sub_fields is not None:
+                # A leaf where the requested field goes deeper
+                continue
+            result[key] = value
+        return result
@@ -0,0 +1,78 @@
+'''Record by record output of the table parsers'''
+
+
+class RecordParser(object):
+    '''Mixin for table parsers which can emit their output one record at
+    a time.
+
+    The parser implements `cli_iter()`, a generator of flat records, one
+    per row or prefix of the output, and `add_record()`, which merges one
+    record into the parsed dictionary. `cli()` aggregates the records, so
+    parse() returns the same structure as before, while parse_iter() hands
+    the records out as they are parsed and a large table never has to be
+    held in memory as a whole.
+
+        example:
+
+            >>> for record in ShowIpArp(device=dev).parse_iter():
+            ...     db.insert(record)
+    '''
+
+    # Keys of the records which only locate them in the parsed structure
+    record_keys = ()
+
+    def parse_iter(self, **kwargs):
+        '''Yield the records of the output one at a time
+
+        The records are not validated against the schema.
+        '''
+        context = getattr(self, 'context', 'cli')
+        try:
+            method = getattr(self, '{}_iter'.format(context))
+        except AttributeError:
+            raise NotImplementedError(
+                "{} does not support parse_iter for context '{}'".format(
+                    self.__class__.__name__, context)) from None
+        return method(**kwargs)
+
+    def aggregate(self, records):
+        '''Build the parsed structure from the records'''
+        parsed = {}
+        for record in records:
+            self.add_record(parsed, record)
+        return parsed
+
+    def add_record(self, parsed, record):
+        '''Merge one record of cli_iter() into the parsed dictionary
+
+        Implemented by each parser, as the records are flat and only the
+        parser knows where its record_keys nest in the schema, e.g. the
+        `vrf` and `address_family` of a route record under
+        parsed['vrf'][vrf]['address_family'][address_family]. The record
+        without its record_keys is given by record_data(), and merged with
+        merge_record() where a level is filled by several records.
+
+            Args:
+                parsed (`dict`): parsed structure, updated in place
+                record (`dict`): record yielded by cli_iter()
+        '''
+        raise NotImplementedError(
+            '{} does not implement add_record'.format(
+                self.__class__.__name__))
+
+    def record_data(self, record):
+        '''Return the record without its record_keys'''
+        return {key: value for key, value in record.items()
+                if key not in self.record_keys}
+
+
+def merge_record(target, source):
+    '''Merge source into target, recursively for the dictionaries both
+    have. Values only in source are set as they are, not copied.'''
+    for key, value in source.items():
+        current = target.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            merge_record(current, value)
+        else:
+            target[key] = value
+    return target
@@ -0,0 +1,293 @@
+'''Cache of the parsed results of unchanged outputs
+
+Many of the outputs polled from the devices, like `show version` or
+`show inventory`, are identical from one cycle to the next, and are parsed
+again every time. The ResultCache keeps the parsed result of an output by
+(parser class, parse arguments, hash of the output), so an unchanged output
+is served from the cache without being parsed. The context of the parser,
+like 'cli' or 'xml', is part of the key.
+
+A parser which still runs commands on the device when it is given the
+output, like a lookup of the vrfs, gives results which depend on the
+device. It declares it with `device_lookups = True`, and the name of its
+device is added to the key of its results:
+
+    example:
+
+        >>> class ShowOspfVrfAllInclusiveInterface(
+        ...         ShowOspfVrfAllInclusiveInterfaceSchema):
+        ...     device_lookups = True
+
+    example:
+
+        >>> cache = ResultCache(maxsize=1024)
+        >>> parsed = cache.parse(ShowVersion(device=device), output=output)
+
+The cache is bounded, the least recently used results are evicted first.
+With a `path`, the results are also written to that directory and read
+back by the caches of the other processes, or of the next run. The files
+are pickles, the directory must only be writable by trusted users.
+
+The results are returned as copies, which the caller can modify. With
+`readonly=True`, the cached result itself is returned, as dicts and lists
+which refuse to be modified, which saves the copy of a large result.
+'''
+
+# python
+import os
+import copy
+import pickle
+import hashlib
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+
+from genie.libs import parser
+
+from pyats import configuration as cfg
+
+RESULT_CACHE_SIZE = 'genie.libs.parser.result_cache_size'
+RESULT_CACHE_PATH = 'genie.libs.parser.result_cache_path'
+
+log = logging.getLogger(__name__)
+
+
+class ReadOnlyDict(dict):
+    '''Dict of a cached result, which cannot be modified. It is copied or
+    pickled as a dict.'''
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError('The cached parsed result is read-only, '
+                        'copy.deepcopy() it to modify it')
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+class ReadOnlyList(list):
+    '''List of a cached result, which cannot be modified. It is copied or
+    pickled as a list.'''
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError('The cached parsed result is read-only, '
+                        'copy.deepcopy() it to modify it')
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = remove = pop = clear = sort = reverse = \
+        _readonly
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+def freeze(data):
+    '''Return a read-only copy of a parsed result'''
+    if type(data) in (ReadOnlyDict, ReadOnlyList):
+        return data
+    if isinstance(data, dict):
+        return ReadOnlyDict((key, freeze(value))
+                            for key, value in data.items())
+    if isinstance(data, list):
+        return ReadOnlyList(freeze(item) for item in data)
+    return data
+
+
+def output_digest(output):
+    '''Return the hash of a raw output'''
+    if isinstance(output, str):
+        output = output.encode('utf-8', 'surrogateescape')
+    elif not isinstance(output, bytes):
+        # Structured outputs, like the yang or rest ones
+        output = repr(output).encode('utf-8')
+    return hashlib.blake2b(output, digest_size=20).hexdigest()
+
+
+def result_key(parser_cls, output, kwargs=None, context='cli', device=None):
+    '''Return the cache key of the result of an output
+
+        Args:
+            parser_cls (`class`): parser class
+            output (`str`): raw output
+            kwargs (`dict`): parse arguments, except the output
+            context (`str` or `list`): context of the parser
+            device (`Device`): device of the parser, in the key of the
+                               parsers with device_lookups
+    '''
+    device_name = None
+    if getattr(parser_cls, 'device_lookups', False):
+        device_name = str(getattr(device, 'name', None))
+    return ('{}.{}'.format(parser_cls.__module__, parser_cls.__qualname__),
+            repr(context),
+            tuple(sorted((name, repr(value))
+                         for name, value in (kwargs or {}).items())),
+            device_name,
+            output_digest(output))
+
+
+class ResultCache(object):
+    '''Bounded LRU cache of the parsed results, by output
+
+        Args:
+            maxsize (`int`): number of results kept in memory
+            path (`str`): directory the results are persisted in
+            readonly (`bool`): return the cached results as read-only dicts,
+                               instead of copies
+    '''
+
+    def __init__(self, maxsize=1024, path=None, readonly=False):
+        self.maxsize = maxsize
+        self.path = path
+        self.readonly = readonly
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def _file(self, key):
+        # The results of another parser version are not read
+        name = hashlib.blake2b(repr((parser.__version__, key)).encode(),
+                               digest_size=20).hexdigest()
+        return os.path.join(self.path, name + '.pickle')
+
+    def _load(self, key):
+        try:
+            with open(self._file(key), 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            log.debug('Could not read the cached result of {}: {}'.format(
+                key[0], e))
+            return None
+
+    def _dump(self, key, parsed):
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(parsed, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._file(key))
+        except Exception as e:
+            log.debug('Could not write the cached result of {}: {}'.format(
+                key[0], e))
+
+    def _store(self, key, parsed):
+        with self._lock:
+            self._data[key] = parsed
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def _result(self, parsed):
+        return parsed if self.readonly else copy.deepcopy(parsed)
+
+    def get(self, key):
+        '''Return the cached result of a key, None if it is not cached'''
+        with self._lock:
+            parsed = self._data.get(key)
+            if parsed is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._result(parsed)
+
+        if self.path:
+            parsed = self._load(key)
+            if parsed is not None:
+                self.disk_hits += 1
+                parsed = freeze(parsed) if self.readonly else parsed
+                if self.maxsize:
+                    self._store(key, parsed)
+                return self._result(parsed)
+
+        self.misses += 1
+        return None
+
+    def set(self, key, parsed):
+        '''Cache the result of a key, the caller keeps its own result'''
+        if self.path:
+            self._dump(key, parsed)
+        if self.maxsize:
+            self._store(key, freeze(parsed) if self.readonly
+                        else copy.deepcopy(parsed))
+
+    def parse(self, parser, output=None, **kwargs):
+        '''Parse an output with a parser, unless its result is cached
+
+        A parse which executes its commands on the device, without
+        `output`, is not cached. The results of the parsers with
+        device_lookups are cached by device.
+
+            Args:
+                parser (`MetaParser`): parser instance
+                output (`str`): raw output
+                kwargs: other arguments of the parser context
+
+            Returns:
+                the parsed result
+        '''
+        if output is None:
+            return parser.parse(**kwargs)
+
+        key = result_key(type(parser), output, kwargs,
+                         context=getattr(parser, 'context', 'cli'),
+                         device=getattr(parser, 'device', None))
+        parsed = self.get(key)
+        if parsed is None:
+            parsed = parser.parse(output=output, **kwargs)
+            if self.readonly:
+                parsed = freeze(parsed)
+            self.set(key, parsed)
+        return parsed
+
+    def clear(self, disk=False):
+        '''Forget the cached results and reset the counters
+
+            Args:
+                disk (`bool`): also remove the persisted results
+        '''
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+            self.disk_hits = 0
+
+        if disk and self.path and os.path.isdir(self.path):
+            for name in os.listdir(self.path):
+                if name.endswith('.pickle'):
+                    os.remove(os.path.join(self.path, name))
+
+    def info(self):
+        '''Return the cache statistics'''
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'disk_hits': self.disk_hits,
+                'maxsize': self.maxsize,
+                'currsize': len(self._data)}
+
+
+# Results shared by the parsers of the process
+result_cache = ResultCache(maxsize=int(cfg.get(RESULT_CACHE_SIZE, 1024)),
+                           path=cfg.get(RESULT_CACHE_PATH, None))
+
+
+def cached_result_parse(parser, output=None, **kwargs):
+    '''Parse an output with the result cache of the process'''
+    return result_cache.parse(parser, output=output, **kwargs)
+
+
+def clear_result_cache(disk=False):
+    '''Clear the result cache of the process'''
+    result_cache.clear(disk=disk)
+
+
+def get_result_cache_info():
+    '''Return the hits, misses and size of the result cache of the process'''
+    return result_cache.info()
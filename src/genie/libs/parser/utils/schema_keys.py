@@ -0,0 +1,34 @@
+'''Classification of the keys of the parser schemas
+
+The modules which compile a schema once per parser class, like the
+validation, the compact records, the columns or the interning, each walk
+the keys of the dict levels of the schema. A key is either a fixed key, or
+a key which matches the keys of the data, like Any() or str, and either
+one may be wrapped in Optional().
+
+    example:
+
+        >>> for key, value in schema.items():
+        ...     key, optional, any_key = split_key(key)
+'''
+
+from genie.metaparser.util.schemaengine import Any, Optional
+
+# Types of the schema keys which match any key of the type, like Any()
+KEY_TYPES = (str, int)
+
+
+def split_key(key):
+    '''Return (key, optional, any_key) of a schema key
+
+        Args:
+            key: key of a dict level of the schema
+
+        Returns:
+            the key without its Optional(), whether it was optional, and
+            whether it matches the keys of the data
+    '''
+    optional = type(key) is Optional
+    if optional:
+        key = key.schema
+    return key, optional, type(key) is Any or key in KEY_TYPES
@@ -0,0 +1,196 @@
+'''Scoped cache of the commands and sub-parsers run by the parsers
+
+Some parsers run other parsers or commands on the device as a side effect,
+such as `show vrf` to list the vrfs or a `show run` section. When a whole
+feature snapshot is collected, the same dependent commands are executed
+and parsed again by every parser that needs them. Within a ParseSession
+bound to the device, each of them is executed or parsed once and served
+from the session afterwards.
+
+    example:
+
+        >>> with ParseSession(device):
+        ...     summary = device.parse('show bgp all summary')
+        ...     vpnv4 = device.parse('show bgp vpnv4 unicast all summary')
+        ...     mroutes = device.parse('show forwarding distribution '
+        ...                            'multicast route vrf all')
+
+Parsers opt in by running their dependent commands and sub-parsers with
+`cached_execute()` and `cached_parse()`, which fall back to the device when
+no session is active.
+
+A parser which runs one command per vrf or instance declares them all at
+once with `cached_execute_many()`. The session then fetches the missing
+outputs together, either through a `fanout` callable given by the
+connection layer, for example one which pipelines the commands, or with
+`max_workers` concurrent device.execute() calls, for a device connected
+through a connection pool.
+
+    example:
+
+        >>> with ParseSession(device, max_workers=8):
+        ...     vrfs = ShowRunningConfigVrf(device=device).parse()
+'''
+
+# python
+import copy
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Active sessions, by id of their device
+_sessions = {}
+_lock = threading.Lock()
+
+
+def get_session(device):
+    '''Return the innermost active ParseSession of a device, if any'''
+    with _lock:
+        stack = _sessions.get(id(device))
+        return stack[-1] if stack else None
+
+
+def cached_execute(device, command):
+    '''Execute a dependent command, once per session'''
+    session = get_session(device)
+    if session is None:
+        return device.execute(command)
+    return session.execute(command)
+
+
+def cached_execute_many(device, commands):
+    '''Execute dependent commands together, once per session
+
+        Args:
+            device (`Device`): device
+            commands (`list`): commands, in the order their outputs are parsed
+
+        Returns:
+            dict: output of each command, in the order of the commands
+    '''
+    session = get_session(device)
+    if session is None:
+        # One command at a time
+        return {command: device.execute(command) for command in commands}
+    return session.execute_many(commands)
+
+
+def cached_parse(parser_cls, device, **kwargs):
+    '''Run a sub-parser, once per session and arguments'''
+    session = get_session(device)
+    if session is None:
+        return parser_cls(device=device).parse(**kwargs)
+    return session.parse(parser_cls, **kwargs)
+
+
+class ParseSession(object):
+    '''Cache of the dependent command outputs and sub-parser results of a
+    device, for the lifetime of the session.
+
+    Each caller gets its own copy of a cached result. Exceptions raised by
+    a sub-parser are cached too, so an empty output is not parsed again,
+    and a new exception is raised from the cached one on each hit.
+
+        Args:
+            device (`Device`): device the session is bound to
+            max_workers (`int`): concurrent executions of the commands of
+                                 cached_execute_many(), the device must
+                                 support concurrent execute() calls
+            fanout (`callable`): executes a list of commands and returns
+                                 their outputs as a dict or a list, used
+                                 instead of the workers
+    '''
+
+    def __init__(self, device, max_workers=1, fanout=None):
+        self.device = device
+        self.max_workers = max_workers
+        self.fanout = fanout
+        self._outputs = {}
+        self._parsed = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __enter__(self):
+        with _lock:
+            _sessions.setdefault(id(self.device), []).append(self)
+        return self
+
+    def __exit__(self, *exc):
+        with _lock:
+            stack = _sessions[id(self.device)]
+            stack.remove(self)
+            if not stack:
+                del _sessions[id(self.device)]
+        self.clear()
+
+    def execute(self, command):
+        '''Execute a command on the device, or return its session output'''
+        try:
+            output = self._outputs[command]
+        except KeyError:
+            self.misses += 1
+            output = self._outputs[command] = self.device.execute(command)
+        else:
+            self.hits += 1
+        return output
+
+    def execute_many(self, commands):
+        '''Execute the commands which are not in the session together'''
+        missing = [command for command in dict.fromkeys(commands)
+                   if command not in self._outputs]
+        self.hits += len(commands) - len(missing)
+        self.misses += len(missing)
+
+        if missing and self.fanout is not None:
+            outputs = self.fanout(missing)
+            if not isinstance(outputs, dict):
+                outputs = dict(zip(missing, outputs))
+            self._outputs.update(outputs)
+            # The commands not given back by the fanout, one by one
+            for command in missing:
+                if command not in self._outputs:
+                    self._outputs[command] = self.device.execute(command)
+        elif self.max_workers > 1 and len(missing) > 1:
+            workers = min(self.max_workers, len(missing))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                self._outputs.update(zip(
+                    missing, executor.map(self.device.execute, missing)))
+        else:
+            for command in missing:
+                self._outputs[command] = self.device.execute(command)
+
+        return {command: self._outputs[command] for command in commands}
+
+    def parse(self, parser_cls, **kwargs):
+        '''Parse with a parser class, or return its session result'''
+        # repr() of the values, as lists and dicts are not hashable
+        key = (parser_cls, tuple(sorted((name, repr(value))
+                                        for name, value in kwargs.items())))
+        try:
+            parsed, error = self._parsed[key]
+        except KeyError:
+            self.misses += 1
+            try:
+                parsed = parser_cls(device=self.device).parse(**kwargs)
+            except Exception as e:
+                self._parsed[key] = (None, e)
+                raise
+            self._parsed[key] = (parsed, None)
+        else:
+            self.hits += 1
+            if error is not None:
+                # The cached exception is not raised again, its traceback
+                # would grow on every hit
+                raise copy.copy(error) from error
+        return copy.deepcopy(parsed)
+
+    def clear(self):
+        '''Forget the cached outputs and results'''
+        self._outputs.clear()
+        self._parsed.clear()
+
+    def info(self):
+        '''Return the hits, misses and size of the session'''
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'outputs': len(self._outputs),
+                'parsed': len(self._parsed)}
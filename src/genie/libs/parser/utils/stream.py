@@ -0,0 +1,92 @@
+'''Incremental reading of device output for the parsers
+
+A parser which loops with `for line in iter_lines(out)` instead of
+`for line in out.splitlines()` accepts, as its `output` argument, either
+the usual string or a source which is read as the lines are parsed:
+
+    * an open file, socket file or any object with a read() method
+    * an mmap of a saved capture
+    * any iterable of lines, str or bytes, with or without line endings
+
+    example:
+
+        >>> with open('show_route_extensive.txt', 'rb') as f:
+        ...     parsed = device.parse('show route protocol static extensive',
+        ...                           output=f)
+'''
+
+# python
+import codecs
+
+# Size of the blocks read from file-like objects and sliced from strings
+CHUNK_SIZE = 65536
+
+# Line boundaries of str.splitlines()
+LINE_BREAKS = frozenset('\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029')
+
+
+def iter_lines(output, encoding='utf-8', errors='replace'):
+    '''Yield the lines of a device output one at a time
+
+    The lines are split exactly as str.splitlines() does, so the loop over
+    a string gives the same lines, but only one block of the output is
+    split at a time.
+
+        Args:
+            output (`str`, `bytes`, file-like, mmap or iterable): output
+            encoding (`str`): encoding of bytes output
+            errors (`str`): how bytes which cannot be decoded are handled
+
+        Returns:
+            generator of `str`, without the line endings
+    '''
+    if isinstance(output, (str, bytes, bytearray)):
+        chunks = (output[i:i + CHUNK_SIZE]
+                  for i in range(0, len(output), CHUNK_SIZE))
+    elif hasattr(output, 'read'):
+        chunks = iter(lambda: output.read(CHUNK_SIZE), output.read(0))
+    else:
+        return _iter_items(output, encoding, errors)
+
+    return _split_chunks(_decode(chunks, encoding, errors))
+
+
+def _decode(chunks, encoding, errors):
+    decoder = None
+    for chunk in chunks:
+        if not isinstance(chunk, str):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder(encoding)(errors)
+            chunk = decoder.decode(chunk)
+        yield chunk
+
+    if decoder is not None:
+        yield decoder.decode(b'', True)
+
+
+def _split_chunks(chunks):
+    '''Split text which arrives in arbitrary blocks into lines'''
+    pending = ''
+    for chunk in chunks:
+        if not chunk:
+            continue
+        text = pending + chunk
+        lines = text.splitlines()
+        if text[-1] == '\r':
+            # Might be the first half of a '\r\n'
+            pending = lines.pop() + '\r'
+        elif text[-1] not in LINE_BREAKS:
+            pending = lines.pop()
+        else:
+            pending = ''
+        yield from lines
+
+    yield from pending.splitlines()
+
+
+def _iter_items(items, encoding, errors):
+    '''Each item is one line, possibly with its line ending'''
+    for item in items:
+        if not isinstance(item, str):
+            item = item.decode(encoding, errors)
+        yield from item.splitlines() or ['']
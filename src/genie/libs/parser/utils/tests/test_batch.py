@@ -0,0 +1,147 @@
+
+import unittest
+from unittest.mock import Mock, patch
+from concurrent.futures import ThreadPoolExecutor
+
+from genie.libs.parser.utils import batch
+from genie.libs.parser.utils.result_cache import ResultCache
+from genie.libs.parser.utils.batch import (
+    ParseJob,
+    BatchParser,
+    OutputDevice,
+    parse_job,
+    warm_up
+)
+from genie.libs.parser.iosxe.show_arp import ShowIpArp
+
+
+arp_output = '''
+Protocol  Address          Age (min)  Hardware Addr   Type   Interface
+Internet  10.1.7.1                -   0050.56ff.ba6b  ARPA   GigabitEthernet1
+'''
+
+
+def fake_get_parser(command, device):
+    if command != 'show ip arp':
+        raise Exception("Could not find parser for '{}'".format(command))
+    return ShowIpArp, {}
+
+
+@patch.object(batch, 'get_parser', fake_get_parser)
+class TestParseJob(unittest.TestCase):
+
+    def test_parsed(self):
+        job = ParseJob('iosxe', 'cat9k', 'show ip arp', arp_output)
+        result = parse_job(3, job)
+        self.assertEqual(result.index, 3)
+        self.assertIs(result.job, job)
+        self.assertIsNone(result.error)
+        self.assertIn('GigabitEthernet1', result.parsed['interfaces'])
+
+    def test_error(self):
+        result = parse_job(0, ParseJob('iosxe', None, 'show nothing', ''))
+        self.assertIsNone(result.parsed)
+        self.assertIn('show nothing', str(result.error))
+
+
+class TestOutputDevice(unittest.TestCase):
+
+    def test_abstraction(self):
+        device = OutputDevice('iosxe', 'cat9k')
+        self.assertEqual(device.custom['abstraction']['order'],
+                         ['os', 'platform'])
+        self.assertEqual(OutputDevice('nxos').custom['abstraction']['order'],
+                         ['os'])
+
+    def test_execute(self):
+        with self.assertRaises(Exception):
+            OutputDevice('iosxe').execute('show version')
+
+
+class TestWarmUp(unittest.TestCase):
+
+    @patch.object(batch, 'command_index')
+    @patch.object(batch, 'parser_data')
+    @patch.object(batch, 'get_parser', side_effect=Exception('unknown'))
+    def test_warm_up(self, mock_get_parser, mock_data, mock_index):
+        warm_up([('iosxe', 'cat9k', 'show ip arp'),
+                 ('nxos', None, 'show nothing')])
+        mock_data.load.assert_called_once_with()
+        mock_index.build.assert_called_once_with()
+        self.assertEqual(mock_get_parser.call_count, 2)
+        device = mock_get_parser.call_args_list[0][0][1]
+        self.assertEqual((device.os, device.platform), ('iosxe', 'cat9k'))
+
+
+@patch.object(batch, 'get_parser', fake_get_parser)
+class TestBatchParser(unittest.TestCase):
+
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=2)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_results(self):
+        jobs = [('iosxe', None, 'show ip arp', arp_output)] * 10
+        jobs.insert(4, ('iosxe', None, 'show nothing', ''))
+
+        with BatchParser(max_workers=2, executor=self.executor) as parser:
+            results = list(parser.parse(iter(jobs)))
+
+        self.assertEqual(sorted(result.index for result in results),
+                         list(range(11)))
+        failed = [result for result in results if result.error]
+        self.assertEqual([result.index for result in failed], [4])
+        self.assertEqual(failed[0].job.command, 'show nothing')
+        # Not shut down, the executor belongs to the caller
+        self.executor.submit(int).result()
+
+    def test_lazy_jobs(self):
+        consumed = []
+
+        def jobs():
+            for index in range(20):
+                consumed.append(index)
+                yield ('iosxe', None, 'show ip arp', arp_output)
+
+        parser = BatchParser(max_workers=1, executor=self.executor)
+        results = parser.parse(jobs())
+        next(results)
+        self.assertLessEqual(len(consumed), batch.PENDING_PER_WORKER + 1)
+        self.assertEqual(len(list(results)), 19)
+
+    def test_worker_failure(self):
+        executor = Mock()
+        future = Mock(**{'result.side_effect': RuntimeError('worker died')})
+        executor.submit.side_effect = [future, RuntimeError('shut down')]
+
+        with patch.object(batch, 'wait', return_value=({future}, set())):
+            parser = BatchParser(max_workers=1, executor=executor)
+            results = list(parser.parse([('iosxe', None, 'show ip arp', ''),
+                                         ('iosxe', None, 'show ip arp', '')]))
+
+        self.assertEqual([(result.index, str(result.error))
+                          for result in results],
+                         [(1, 'shut down'), (0, 'worker died')])
+
+    def test_cache(self):
+        jobs = [('iosxe', None, 'show ip arp', arp_output),
+                ('iosxe', None, 'show nothing', '')]
+        cache = ResultCache()
+        with BatchParser(max_workers=2, executor=self.executor,
+                         cache=cache) as parser:
+            first = sorted(parser.parse(jobs))
+            with patch.object(batch, 'parse_job',
+                              side_effect=parse_job) as mock_job:
+                second = sorted(parser.parse(jobs))
+
+        # Only the failed job is parsed again
+        self.assertEqual(mock_job.call_count, 1)
+        self.assertEqual(first[0].parsed, second[0].parsed)
+        self.assertIsNotNone(second[1].error)
+        self.assertEqual(cache.info()['hits'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+
+import io
+import unittest
+from unittest.mock import patch
+from contextlib import redirect_stdout
+
+from genie.libs.parser.utils.benchmark import (
+    bench_golden,
+    compare,
+    iter_golden_parsers,
+    report_regressions
+)
+from genie.libs.parser.iosxe.show_arp import ShowIpArp
+
+
+arp_output = '''
+Protocol  Address          Age (min)  Hardware Addr   Type   Interface
+Internet  10.1.7.1                -   0050.56ff.ba6b  ARPA   GigabitEthernet1
+Internet  10.1.7.250             30   0050.56ff.ba6c  ARPA   GigabitEthernet1
+'''
+
+
+class TestGoldenBenchmark(unittest.TestCase):
+
+    def test_bench_golden(self):
+        result = bench_golden(ShowIpArp, [(arp_output, {}),
+                                          (arp_output, {'vrf': 'VRF1'})],
+                              number=2)
+        self.assertEqual(result['outputs'], 2)
+        self.assertEqual(result['lines'], 8)
+        self.assertGreater(result['seconds'], 0)
+        self.assertGreater(result['lines_per_sec'], 0)
+        self.assertGreater(result['peak_memory'], 0)
+
+    def test_compare(self):
+        baseline = {'parsers': {
+            'iosxe.ShowIpArp': {'seconds': 0.01, 'peak_memory': 1000},
+            'iosxe.ShowArp': {'seconds': 0.01, 'peak_memory': 1000},
+            'iosxe.ShowVersion': {'seconds': 0.00001, 'peak_memory': 1000},
+            'iosxe.ShowBroken': {'error': 'KeyError: 1'},
+        }}
+        current = {'parsers': {
+            'iosxe.ShowIpArp': {'seconds': 0.0119, 'peak_memory': 1300},
+            'iosxe.ShowArp': {'error': 'KeyError: 2'},
+            'iosxe.ShowVersion': {'seconds': 0.00003, 'peak_memory': 1000},
+            'iosxe.ShowBroken': {'seconds': 1, 'peak_memory': 1},
+            'iosxe.ShowNew': {'seconds': 1, 'peak_memory': 1},
+        }}
+        self.assertEqual(compare(baseline, current, threshold=0.2), [
+            ('iosxe.ShowArp', 'error', None, 'KeyError: 2'),
+            ('iosxe.ShowIpArp', 'peak_memory', 1000, 1300),
+        ])
+        self.assertEqual(
+            compare(baseline, current, threshold=0.1, min_time=0)[1:], [
+                ('iosxe.ShowIpArp', 'seconds', 0.01, 0.0119),
+                ('iosxe.ShowIpArp', 'peak_memory', 1000, 1300),
+                ('iosxe.ShowVersion', 'seconds', 0.00001, 0.00003),
+            ])
+
+    def test_compare_missing(self):
+        baseline = {'parsers': {
+            'iosxe.ShowIpArp': {'seconds': 0.01, 'peak_memory': 1000},
+            'iosxe.ShowBroken': {'error': 'KeyError: 1'},
+        }}
+        # The module of ShowIpArp could not be imported
+        current = {'parsers': {
+            'iosxe.show_arp': {'error': 'SyntaxError: invalid syntax'},
+        }}
+        self.assertEqual(compare(baseline, current), [
+            ('iosxe.ShowIpArp', 'missing', None, None),
+            ('iosxe.show_arp', 'error', None, 'SyntaxError: invalid syntax'),
+        ])
+
+    def test_import_errors(self):
+        errors = {}
+        with patch('genie.libs.parser.utils.benchmark.load_parse_module',
+                   side_effect=SyntaxError('invalid syntax')):
+            self.assertEqual(list(iter_golden_parsers(
+                'iosxe', _class='ShowIpArp', errors=errors)), [])
+        self.assertEqual(errors['iosxe.show_arp'],
+                         'SyntaxError: invalid syntax')
+
+    def test_report(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            report_regressions([
+                ('iosxe.ShowIpArp', 'seconds', 0, 0.01),
+                ('iosxe.ShowArp', 'peak_memory', 1000, 1500),
+                ('iosxe.ShowVersion', 'missing', None, None)], 0.2)
+        self.assertEqual(out.getvalue().splitlines(), [
+            'iosxe.ShowIpArp: seconds 0 -> 0.01',
+            'iosxe.ShowArp: peak_memory 1000 -> 1500 (+50%)',
+            'iosxe.ShowVersion: missing from the current run',
+            '3 regressions over 20%'])
+
+
+if __name__ == '__main__':
+    unittest.main()
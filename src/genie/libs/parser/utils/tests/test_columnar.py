@@ -0,0 +1,213 @@
+
+import unittest
+from unittest.mock import Mock
+
+from genie.metaparser import MetaParser
+from genie.metaparser.util.schemaengine import Any, Optional, Or, ListOf
+from genie.libs.parser.utils import columnar
+from genie.libs.parser.utils.columnar import (
+    Columnar,
+    to_columns,
+    default_rows
+)
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+
+
+class RouteTableSchema(MetaParser):
+
+    schema = {
+        'vrf': {
+            Any(): {
+                Optional('router_id'): str,
+                'routes': {
+                    Any(): {
+                        'active': bool,
+                        Optional('metric'): int,
+                        Optional('age'): float,
+                        Optional('tag'): Or(int, str),
+                        'next_hop': {
+                            Optional('address'): str,
+                            Optional('outgoing'): {
+                                Any(): {'interface': str},
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    }
+
+
+class JunosTableSchema(MetaParser):
+
+    schema = {
+        'information': {
+            'interface': ListOf({
+                'name': str,
+                Optional('input-bytes'): str,
+                Optional('queue'): ListOf({'number': str}),
+            }),
+        },
+    }
+
+
+route_table = {
+    'vrf': {
+        'default': {
+            'router_id': '10.1.1.1',
+            'routes': {
+                '10.0.0.0/8': {'active': True, 'metric': 10, 'age': 1.5,
+                               'tag': 'external',
+                               'next_hop': {'address': '10.2.2.2',
+                                            'outgoing': {
+                                                'Gi1': {'interface': 'Gi1'}}}},
+                '10.1.0.0/16': {'active': False,
+                                'next_hop': {'address': '10.2.2.2'}},
+            },
+        },
+        'VRF1': {
+            'routes': {
+                '10.2.0.0/16': {'active': True, 'metric': 20, 'tag': 7,
+                                'next_hop': {}},
+            },
+        },
+    },
+}
+
+interfaces_output = '''
+GigabitEthernet1 is up, line protocol is up
+  Hardware is CSR vNIC, address is 5254.00ff.0e7e (bia 5254.00ff.0e7e)
+  Internet address is 10.1.1.1/24
+  MTU 1500 bytes, BW 1000000 Kbit/sec, DLY 10 usec,
+     reliability 255/255, txload 1/255, rxload 1/255
+  Encapsulation ARPA, loopback not set
+  Keepalive set (10 sec)
+     5 minute input rate 0 bits/sec, 0 packets/sec
+     5 minute output rate 0 bits/sec, 0 packets/sec
+     100 packets input, 2000 bytes, 0 no buffer
+     200 packets output, 4000 bytes, 0 underruns
+Loopback0 is up, line protocol is up
+  Hardware is Loopback
+  MTU 1514 bytes, BW 8000000 Kbit/sec, DLY 5000 usec,
+     reliability 255/255, txload 1/255, rxload 1/255
+  Encapsulation LOOPBACK, loopback not set
+     5 minute input rate 0 bits/sec, 0 packets/sec
+     5 minute output rate 0 bits/sec, 0 packets/sec
+     0 packets input, 0 bytes, 0 no buffer
+     300 packets output, 6000 bytes, 0 underruns
+'''
+
+
+class TestColumnar(unittest.TestCase):
+
+    def test_default_rows(self):
+        self.assertEqual(default_rows(RouteTableSchema.schema),
+                         ('vrf', '*', 'routes', '*'))
+        self.assertEqual(default_rows(JunosTableSchema.schema),
+                         ('information', 'interface', '*'))
+        self.assertIsNone(default_rows({'version': str}))
+
+    def test_columns(self):
+        table = to_columns(RouteTableSchema, route_table)
+        self.assertEqual(len(table), 3)
+        self.assertEqual(table.keys, ('vrf', 'routes'))
+        self.assertEqual(list(table), [
+            'vrf', 'routes', 'active', 'metric', 'age', 'tag',
+            'next_hop.address'])
+        self.assertEqual(table.to_dict()['routes'],
+                         ['10.0.0.0/8', '10.1.0.0/16', '10.2.0.0/16'])
+
+        metric = table['metric']
+        self.assertEqual(metric.kind, 'int')
+        self.assertEqual(list(metric.values), [10, 0, 20])
+        self.assertEqual([bool(present) for present in metric.mask],
+                         [True, False, True])
+        self.assertEqual(metric.to_list(), [10, None, 20])
+        self.assertEqual(table['active'].kind, 'bool')
+        self.assertEqual(table['age'].kind, 'float')
+        self.assertEqual(table['age'].to_list(), [1.5, None, None])
+        self.assertEqual(table['tag'].kind, 'object')
+        self.assertEqual(table['tag'].to_list(), ['external', None, 7])
+
+    def test_dictionary_encoded(self):
+        table = to_columns(RouteTableSchema, route_table)
+        address = table['next_hop.address']
+        self.assertEqual(address.kind, 'str')
+        self.assertEqual(address.categories, ['10.2.2.2'])
+        self.assertEqual(list(address.values), [0, 0, -1])
+        self.assertEqual(table['vrf'].categories, ['default', 'VRF1'])
+
+    def test_labels(self):
+        builder = Columnar(RouteTableSchema, rows='vrf.*', keys=['name'])
+        self.assertEqual(builder.add(route_table), 2)
+        self.assertEqual(builder.add(route_table, device='R2', poll=1), 2)
+        table = builder.table()
+        self.assertEqual(table.keys, ('device', 'poll', 'name'))
+        self.assertEqual(table['device'].to_list(), [None, None, 'R2', 'R2'])
+        self.assertEqual(table['poll'].kind, 'int')
+        self.assertEqual(table['router_id'].to_list(),
+                         ['10.1.1.1', None, '10.1.1.1', None])
+
+    def test_keys_error(self):
+        with self.assertRaises(ValueError):
+            Columnar(RouteTableSchema, keys=['vrf'])
+        with self.assertRaises(ValueError):
+            Columnar(MetaParser)
+
+    def test_parse_numbers(self):
+        parsed = {'information': {'interface': [
+            {'name': 'ge-0/0/0', 'input-bytes': '1200',
+             'queue': [{'number': '0'}]},
+            {'name': 'ge-0/0/1'}]}}
+        table = to_columns(JunosTableSchema, parsed)
+        self.assertEqual(table['input-bytes'].kind, 'str')
+        self.assertNotIn('queue', table)
+
+        table = to_columns(JunosTableSchema, parsed, parse_numbers=True)
+        self.assertEqual(table['interface'].to_list(), [0, 1])
+        self.assertEqual(table['input-bytes'].kind, 'int')
+        self.assertEqual(table['input-bytes'].to_list(), [1200, None])
+        # Not a number, even if the others are
+        self.assertEqual(table['name'].kind, 'str')
+
+    def test_overflow(self):
+        table = to_columns(RouteTableSchema, {'vrf': {'default': {'routes': {
+            '10.0.0.0/8': {'active': True, 'metric': 2 ** 64,
+                           'next_hop': {}}}}}})
+        self.assertEqual(table['metric'].kind, 'object')
+        self.assertEqual(table['metric'].to_list(), [2 ** 64])
+
+    @unittest.skipIf(columnar.np is None, 'numpy is not installed')
+    def test_numpy(self):
+        table = to_columns(RouteTableSchema, route_table)
+        metric = table['metric']
+        self.assertEqual(metric.values.dtype, columnar.np.int64)
+        self.assertEqual(metric.values[metric.mask].sum(), 30)
+
+
+class TestShowInterfacesColumnar(unittest.TestCase):
+
+    def test_counter_delta(self):
+        first = ShowInterfaces(device=Mock()).parse(output=interfaces_output)
+        second = ShowInterfaces(device=Mock()).parse(
+            output=interfaces_output.replace('300 packets output',
+                                             '350 packets output'))
+
+        builder = Columnar(ShowInterfaces, keys=['interface'])
+        builder.add(first, poll=1)
+        builder.add(second, poll=2)
+        table = builder.table()
+
+        self.assertEqual(table.keys, ('poll', 'interface'))
+        self.assertEqual(table['interface'].categories,
+                         ['GigabitEthernet1', 'Loopback0'])
+        out_pkts = table['counters.out_pkts']
+        self.assertEqual(out_pkts.kind, 'int')
+        values = list(out_pkts.values)
+        self.assertEqual([after - before for before, after in
+                          zip(values[:2], values[2:])], [0, 50])
+        self.assertEqual(table['oper_status'].to_list(), ['up'] * 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
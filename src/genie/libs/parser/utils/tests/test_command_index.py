@@ -0,0 +1,71 @@
+
+import unittest
+
+from genie.libs.parser.utils.index import CommandIndex
+from genie.libs.parser.utils.common import (
+    _matches_fuzzy,
+    _fuzzy_search_command
+)
+
+
+class TestCommandIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = CommandIndex({
+            'show version': {},
+            'show vrf': {},
+            'show vrf {vrf} detail': {},
+            'show ip route': {},
+            'show ip route vrf {vrf}': {},
+            'show ipv6 route': {},
+            'show interfaces {interface} counters': {},
+            '/dna/intent/api/v1/interface/{interface}': {},
+        })
+
+    def test_keyword_prefix(self):
+        self.assertEqual(self.index.candidates('sh ver'.split()),
+                         ['show version'])
+        self.assertEqual(self.index.candidates('sh v'.split()),
+                         ['show version', 'show vrf'])
+        self.assertEqual(self.index.candidates('show ip route'.split()),
+                         ['show ip route', 'show ipv6 route'])
+
+    def test_arguments(self):
+        self.assertEqual(self.index.candidates(
+                         'show ip route vrf RED'.split()),
+                         ['show ip route vrf {vrf}'])
+        self.assertEqual(self.index.candidates(
+                         'show int Gi 1/0/1 counters'.split()),
+                         ['show interfaces {interface} counters'])
+        self.assertEqual(self.index.candidates(
+                         '/dna/intent/api/v1/interface/argument'.split()),
+                         ['/dna/intent/api/v1/interface/{interface}'])
+
+    def test_no_candidates(self):
+        self.assertEqual(self.index.candidates('show xyz'.split()), [])
+        self.assertEqual(self.index.candidates('ping'.split()), [])
+
+    def test_rebuild_on_new_command(self):
+        self.assertEqual(self.index.candidates('show clock'.split()), [])
+        self.index.data['show clock'] = {}
+        self.assertEqual(self.index.candidates('show clock'.split()),
+                         ['show clock'])
+
+    def test_candidates_cover_matches(self):
+        # Every command matched by a full scan must be found by the index
+        for search in ['sh ver', 'sh vrf RED det', 'show ip ro',
+                       'show ip route vrf RED', 'sh int Gi1 co']:
+            tokens = search.split()
+            candidates = self.index.candidates(tokens)
+            for command in self.index.data:
+                if _matches_fuzzy(0, 0, tokens.copy(), command, {}, False):
+                    self.assertIn(command, candidates, search)
+
+    def test_fuzzy_search_uses_index(self):
+        results = _fuzzy_search_command('sh ver', False)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0][0], 'show version')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+
+import copy
+import json
+import pickle
+import unittest
+from unittest.mock import Mock
+
+from genie.metaparser import MetaParser
+from genie.metaparser.util.schemaengine import Any, Optional, Or, ListOf
+from genie.libs.parser.utils.compact import (
+    Record,
+    CompactParser,
+    compact,
+    to_dict
+)
+from genie.libs.parser.nxos.show_bgp import ShowBgpVrfAllAll
+
+
+class RouteTable(MetaParser, CompactParser):
+
+    entry_schema = {
+        'protocol': str,
+        Optional('metric'): int,
+        Optional('nh'): ListOf({'to': str, Optional('via'): str}),
+    }
+
+    schema = {
+        'table': {
+            Any(): {
+                'route-count': int,
+                Optional('rt'): ListOf({
+                    'destination': str,
+                    'entry': Or(entry_schema, ListOf(entry_schema)),
+                }),
+            },
+        },
+        Optional('attributes'): Any(),
+    }
+
+    def cli(self, output=None):
+        return copy.deepcopy(route_table)
+
+
+route_table = {
+    'table': {
+        'inet.0': {
+            'route-count': 2,
+            'rt': [
+                {'destination': '10.0.0.0/8',
+                 'entry': {'protocol': 'BGP', 'metric': 10,
+                           'nh': [{'to': '10.1.1.1', 'via': 'ge-0/0/1.0'},
+                                  {'to': '10.1.1.2'}]}},
+                {'destination': '10.1.0.0/16',
+                 'entry': [{'protocol': 'OSPF'},
+                           {'metric': 20, 'protocol': 'BGP'}]},
+            ],
+        },
+    },
+    'attributes': {'free': 'form'},
+}
+
+bgp_output = '''
+    BGP routing table information for VRF VRF1, address family IPv4 Unicast
+    BGP table version is 35, local router ID is 10.229.11.11
+    Status: s-suppressed, x-deleted, S-stale, d-dampened, h-history, *-valid, >-best
+    Path type: i-internal, e-external, c-confed, l-local, a-aggregate, r-redist
+    Origin codes: i - IGP, e - EGP, ? - incomplete, | - multipath
+
+       Network            Next Hop            Metric     LocPrf     Weight Path
+    *>a10.121.0.0/8         0.0.0.0                           100      32768 i
+                          10.64.4.4                  0        100      32768 e
+    *>r10.229.11.11/32     0.0.0.0                  0        100      32768 ?
+    *>i10.21.33.33/32     10.36.3.3                  0        100          0 ?
+'''
+
+
+class TestCompact(unittest.TestCase):
+
+    def setUp(self):
+        self.table = compact(RouteTable, copy.deepcopy(route_table))
+
+    def test_records(self):
+        inet = self.table['table']['inet.0']
+        # Keyed by the data, kept as dicts
+        self.assertIs(type(self.table['table']), dict)
+        self.assertIsInstance(inet, Record)
+        rt = inet['rt'][0]
+        self.assertIsInstance(rt['entry'], Record)
+        self.assertEqual(rt['entry']['nh'][1]['to'], '10.1.1.2')
+        self.assertIsInstance(inet['rt'][1]['entry'][1], Record)
+        self.assertEqual(list(inet['rt'][1]['entry'][1]),
+                         ['metric', 'protocol'])
+        self.assertEqual(self.table['attributes'], {'free': 'form'})
+        self.assertIs(type(self.table['attributes']), dict)
+
+    def test_shared_class(self):
+        first = self.table['table']['inet.0']['rt'][0]
+        second = self.table['table']['inet.0']['rt'][1]
+        self.assertIs(type(first), type(second))
+        self.assertFalse(hasattr(first, '__dict__'))
+
+    def test_mapping(self):
+        entry = self.table['table']['inet.0']['rt'][0]['entry']
+        self.assertEqual(entry.get('metric'), 10)
+        self.assertIsNone(entry.get('preference'))
+        self.assertIn('protocol', entry)
+        self.assertNotIn('preference', entry)
+        self.assertEqual(len(entry), 3)
+        with self.assertRaises(KeyError):
+            entry['preference']
+        with self.assertRaises(TypeError):
+            entry['metric'] = 20
+
+    def test_to_dict(self):
+        parsed = to_dict(self.table)
+        self.assertEqual(parsed, route_table)
+        self.assertEqual(self.table, route_table)
+        self.assertEqual(json.dumps(parsed), json.dumps(route_table))
+
+    def test_pickle(self):
+        self.assertEqual(to_dict(pickle.loads(pickle.dumps(self.table))),
+                         route_table)
+
+    def test_not_in_schema(self):
+        data = copy.deepcopy(route_table)
+        data['table']['inet.0']['rt'][0]['extra'] = 1
+        table = compact(RouteTable, data)
+        self.assertIs(type(table['table']['inet.0']['rt'][0]), dict)
+        self.assertIsInstance(table['table']['inet.0']['rt'][0]['entry'],
+                              Record)
+        self.assertEqual(table['table']['inet.0']['rt'][0]['extra'], 1)
+
+    def test_parse_compact(self):
+        self.assertEqual(RouteTable(device=Mock()).parse_compact(),
+                         route_table)
+
+
+class TestShowBgpVrfAllAllCompact(unittest.TestCase):
+
+    def test_parse_compact(self):
+        device = Mock(**{'execute.return_value': bgp_output})
+        expected = ShowBgpVrfAllAll(device=device).parse()
+        table = ShowBgpVrfAllAll(device=device).parse_compact()
+
+        self.assertEqual(to_dict(table), expected)
+        af = table['vrf']['VRF1']['address_family']['ipv4 unicast']
+        self.assertIsInstance(af, Record)
+        path = af['prefixes']['10.121.0.0/8']['index'][2]
+        self.assertIsInstance(path, Record)
+        self.assertEqual(path['next_hop'], '10.64.4.4')
+
+
+if __name__ == '__main__':
+    unittest.main()
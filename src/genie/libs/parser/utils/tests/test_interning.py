@@ -0,0 +1,141 @@
+
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.metaparser import MetaParser
+from genie.metaparser.util.schemaengine import Any, Optional, Or, ListOf
+from genie.libs.parser.utils import interning
+from genie.libs.parser.utils.interning import (
+    InternTable,
+    intern_parsed,
+    get_interner
+)
+from genie.libs.parser.nxos.show_bgp import ShowBgpVrfAllAll
+
+
+def fresh(value):
+    # An equal str which is not the same object
+    return ''.join(list(value))
+
+
+class RouteTable(MetaParser):
+
+    intern_fields = ['vrf', 'protocol', 'to', 'state']
+
+    schema = {
+        'vrf': {
+            Any(): {
+                'routes': {
+                    Any(): {
+                        'protocol': str,
+                        Optional('metric'): int,
+                        Optional('state'): Or(str, ListOf(str)),
+                        Optional('nh'): ListOf({'to': str}),
+                        Optional('description'): str,
+                    },
+                },
+            },
+        },
+    }
+
+
+def route_table():
+    return {'vrf': {fresh('default'): {'routes': {
+        fresh('10.0.0.0/8'): {'protocol': fresh('bgp'), 'metric': 10,
+                              'state': fresh('active'),
+                              'nh': [{'to': fresh('10.1.1.1')}],
+                              'description': fresh('uplink')},
+        fresh('10.1.0.0/16'): {'protocol': fresh('bgp'),
+                               'state': [fresh('active'), fresh('int')],
+                               'nh': [{'to': fresh('10.1.1.1')}],
+                               'description': fresh('uplink')},
+    }}}}
+
+
+class TestInternTable(unittest.TestCase):
+
+    def test_intern(self):
+        table = InternTable()
+        first = fresh('up')
+        self.assertIs(table.intern(first), first)
+        self.assertIs(table.intern(fresh('up')), first)
+        self.assertEqual(table.info(), {'hits': 1, 'misses': 1,
+                                        'maxsize': 65536, 'currsize': 1})
+
+    def test_bounded(self):
+        table = InternTable(maxsize=2)
+        for value in ('a', 'b', 'c'):
+            table.intern(value)
+        self.assertEqual(len(table), 1)
+        table.clear()
+        self.assertEqual(table.info()['misses'], 0)
+
+
+@patch.object(interning, 'intern_table', InternTable())
+class TestInternParsed(unittest.TestCase):
+
+    def setUp(self):
+        interning._interners.clear()
+
+    def tearDown(self):
+        interning._interners.clear()
+
+    def test_values(self):
+        expected = route_table()
+        parsed = intern_parsed(RouteTable, route_table())
+        self.assertEqual(parsed, expected)
+
+        routes = parsed['vrf']['default']['routes']
+        first, second = routes['10.0.0.0/8'], routes['10.1.0.0/16']
+        self.assertIs(first['protocol'], second['protocol'])
+        self.assertIs(first['nh'][0]['to'], second['nh'][0]['to'])
+        self.assertIs(first['state'], second['state'][0])
+        # Not declared
+        self.assertIsNot(first['description'], second['description'])
+
+    def test_keys(self):
+        first = intern_parsed(RouteTable, route_table())
+        second = intern_parsed(RouteTable(device=Mock()), route_table())
+        self.assertIs(list(first['vrf'])[0], list(second['vrf'])[0])
+        # The keys of routes are not declared
+        self.assertIsNot(list(first['vrf']['default']['routes'])[0],
+                         list(second['vrf']['default']['routes'])[0])
+
+    def test_not_declared(self):
+        class Parser(MetaParser):
+            schema = RouteTable.schema
+
+        self.assertIsNone(get_interner(Parser))
+        parsed = route_table()
+        self.assertIs(intern_parsed(Parser, parsed), parsed)
+        self.assertEqual(intern_parsed(RouteTable, {}), {})
+
+
+class TestShowBgpVrfAllAllInterning(unittest.TestCase):
+
+    output = '''
+    BGP routing table information for VRF VRF1, address family IPv4 Unicast
+    BGP table version is 35, local router ID is 10.229.11.11
+    Status: s-suppressed, x-deleted, S-stale, d-dampened, h-history, *-valid, >-best
+    Path type: i-internal, e-external, c-confed, l-local, a-aggregate, r-redist
+    Origin codes: i - IGP, e - EGP, ? - incomplete, | - multipath
+
+       Network            Next Hop            Metric     LocPrf     Weight Path
+    *>i10.21.33.33/32     10.36.3.3                  0        100          0 ?
+    *>i10.21.33.34/32     10.36.3.3                  0        100          0 ?
+    '''
+
+    def test_parse(self):
+        device = Mock(**{'execute.return_value': self.output})
+        parsed = ShowBgpVrfAllAll(device=device).parse()
+        prefixes = parsed['vrf']['VRF1']['address_family'][
+            'ipv4 unicast']['prefixes']
+        first = prefixes['10.21.33.33/32']['index'][1]
+        second = prefixes['10.21.33.34/32']['index'][1]
+        self.assertEqual(first['next_hop'], '10.36.3.3')
+        self.assertIs(first['next_hop'], second['next_hop'])
+        self.assertIs(first['status_codes'], second['status_codes'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+
+import unittest
+
+from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.intf_name import (
+    convert_intf_name,
+    convert_intf_names,
+    shorten_intf_name,
+    shorten_intf_names,
+    clear_intf_name_cache,
+    get_intf_name_cache_info
+)
+
+
+class TestIntfName(unittest.TestCase):
+
+    def setUp(self):
+        clear_intf_name_cache()
+
+    def test_convert(self):
+        self.assertEqual(Common.convert_intf_name('Gi1/0/1'),
+                         'GigabitEthernet1/0/1')
+        self.assertEqual(convert_intf_name('Eth2/1'), 'Ethernet2/1')
+        self.assertEqual(convert_intf_name('M-E0/0/0'), 'M-Ethernet0/0/0')
+        self.assertEqual(convert_intf_name('Fe0/1'), '0/1')
+        # Unknown types are unified
+        self.assertEqual(convert_intf_name('port channel 1'), 'Portchannel1')
+        self.assertEqual(convert_intf_name('ethernet1/1'), 'Ethernet1/1')
+        # Names without a type or a port are kept
+        self.assertEqual(convert_intf_name('mgmt'), 'mgmt')
+        self.assertEqual(convert_intf_name('1/1'), '1/1')
+
+    def test_convert_bulk(self):
+        self.assertEqual(convert_intf_names(['Po10', 'Te1/1/1', 'Po10']),
+                         ['Port-channel10', 'TenGigabitEthernet1/1/1',
+                          'Port-channel10'])
+        info = get_intf_name_cache_info()['convert']
+        self.assertEqual((info['hits'], info['misses'], info['currsize']),
+                         (1, 2, 2))
+
+    def test_shorten(self):
+        self.assertEqual(Common.shorten_intf_name('GigabitEthernet1/0/1'),
+                         'Gi1/0/1')
+        self.assertEqual(shorten_intf_names(['Port-channel10',
+                                             'Ethernet1/1',
+                                             'Bundle-Ether1.100',
+                                             'Null0',
+                                             'Gi1/0/1',
+                                             'FortyGigE0/0/0/1']),
+                         ['Po10', 'Eth1/1', 'BE1.100', 'Null0', 'Gi1/0/1',
+                          'FortyGigE0/0/0/1'])
+
+    def test_round_trip(self):
+        for intf in ['Gi1/0/1', 'Te1/1/1', 'Lo0', 'Vl100', 'Hu0/0/0/1',
+                     'Twe1/0/1', 'BDI10', 'Se0/0']:
+            full = convert_intf_name(intf)
+            self.assertEqual(convert_intf_name(shorten_intf_name(full)), full)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+
+import io
+import json
+import unittest
+
+from genie.libs.parser.utils.json_stream import JsonItems, iter_json_items
+
+
+collection = {
+    'kind': 'tm:ltm:pool:poolcollectionstate',
+    'selfLink': 'https://localhost/mgmt/tm/ltm/pool?ver=13.1.0',
+    'items': [{'name': 'pool{}'.format(index), 'minActiveMembers': index,
+               'slowRampTime': 1.5, 'members': [True, None, 'café "a"']}
+              for index in range(50)],
+    'nextLink': 'https://localhost/mgmt/tm/ltm/pool?$top=50&$skip=50',
+    'totalItems': 120,
+}
+
+body = json.dumps(collection, indent=1)
+
+
+class TestIterJsonItems(unittest.TestCase):
+
+    def test_blocks(self):
+        data = body.encode()
+        for size in (1, 3, 64, len(data)):
+            members = {}
+            items = list(iter_json_items(
+                (data[i:i + size] for i in range(0, len(data), size)),
+                members=members))
+            self.assertEqual(items, collection['items'])
+            self.assertEqual(members, dict(collection, items=[]))
+
+    def test_sources(self):
+        expected = collection['items']
+        self.assertEqual(list(iter_json_items(body)), expected)
+        self.assertEqual(list(iter_json_items(io.StringIO(body))), expected)
+        self.assertEqual(list(iter_json_items(io.BytesIO(body.encode()))),
+                         expected)
+
+    def test_key(self):
+        members = {}
+        self.assertEqual(list(iter_json_items('{"items": [1], "entries": '
+                                              '[2, 3]}', key='entries',
+                                              members=members)), [2, 3])
+        self.assertEqual(members, {'items': [1], 'entries': []})
+        self.assertEqual(list(iter_json_items('{}', members=members)), [])
+
+    def test_incremental(self):
+        decoder = JsonItems()
+        self.assertEqual(decoder.feed('{"items": [{"name": "a"}, 1'), [
+            {'name': 'a'}])
+        # The number may go on
+        self.assertEqual(decoder.feed('2'), [])
+        self.assertEqual(decoder.feed(']}'), [12])
+        self.assertEqual(decoder.close(), [])
+
+    def test_split_numbers(self):
+        for blocks, items, members in (
+                (['{"items": [1.', '5]}'], [1.5], {'items': []}),
+                (['{"items": [1', 'e3, -', '2]}'], [1e3, -2], {'items': []}),
+                (['{"x": 2.', '5}'], [], {'x': 2.5}),
+                (['{"x": 2', 'E-1 }'], [], {'x': 0.2})):
+            decoded = {}
+            self.assertEqual(list(iter_json_items(blocks, members=decoded)),
+                             items)
+            self.assertEqual(decoded, members)
+
+    def test_invalid(self):
+        for invalid in ('', '[1]', '{"items": [1, 2', '{"a" 1}',
+                        '{"items": [1 2]}', '{} {}', '{1: 2}'):
+            with self.assertRaises(ValueError):
+                list(iter_json_items(invalid))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+
+import threading
+import unittest
+from unittest.mock import Mock, patch
+from concurrent.futures import TimeoutError
+
+from genie.metaparser import MetaParser
+from genie.libs.parser.utils.mechanisms import run_mechanisms, get_timeout
+from genie.libs.parser.iosxe.show_interface import (
+    ShowIpInterfaceBrief,
+    ShowIpInterfaceBriefPipeVlan
+)
+
+
+class Parser(MetaParser):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.yang_done = threading.Event()
+        self.cli_done = threading.Event()
+        self.release = threading.Event()
+
+    def yang(self, interface=''):
+        self.yang_done.set()
+        # Only completes if cli runs at the same time
+        self.cli_done.wait(5)
+        return {'interface': {'Gi1': {'status': 'up'}}} \
+            if self.cli_done.is_set() else {}
+
+    def cli(self, interface=''):
+        self.cli_done.set()
+        self.yang_done.wait(5)
+        return {'interface': {'Gi1': {'protocol': 'up'}, interface: {}}}
+
+    def slow(self, interface=''):
+        self.release.wait(5)
+        return {'slow': True}
+
+    def broken(self, interface=''):
+        raise ValueError('no session')
+
+
+class TestRunMechanisms(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = Parser(device=Mock())
+
+    def tearDown(self):
+        self.parser.release.set()
+
+    def test_concurrent(self):
+        merged = run_mechanisms(self.parser, ['yang', 'cli'], interface='Gi2')
+        self.assertEqual(merged, {'interface': {
+            'Gi1': {'status': 'up', 'protocol': 'up'}, 'Gi2': {}}})
+        self.assertEqual(self.parser.mechanism_errors, {})
+
+    def test_timeout(self):
+        with self.assertLogs('genie.libs.parser.utils.mechanisms'):
+            merged = run_mechanisms(self.parser, ['slow', 'yang', 'cli'],
+                                    timeouts={'slow': 0.05})
+        self.assertNotIn('slow', merged)
+        self.assertIn('interface', merged)
+        self.assertIsInstance(self.parser.mechanism_errors['slow'],
+                              TimeoutError)
+
+    def test_error(self):
+        with self.assertLogs('genie.libs.parser.utils.mechanisms'):
+            merged = run_mechanisms(self.parser, ['broken', 'yang', 'cli'])
+        self.assertIn('interface', merged)
+        self.assertIsInstance(self.parser.mechanism_errors['broken'],
+                              ValueError)
+
+        with self.assertLogs('genie.libs.parser.utils.mechanisms'):
+            with self.assertRaises(ValueError):
+                run_mechanisms(self.parser, ['broken', 'yang', 'cli'],
+                               partial=False)
+
+        # Nothing to merge
+        with self.assertLogs('genie.libs.parser.utils.mechanisms'):
+            with self.assertRaises(TimeoutError):
+                run_mechanisms(self.parser, ['slow', 'broken'], timeouts=0)
+
+    def test_get_timeout(self):
+        self.assertEqual(get_timeout('cli', {'cli': 3}), 3.0)
+        self.assertEqual(get_timeout('cli', 2), 2.0)
+        with patch('genie.libs.parser.utils.mechanisms.cfg',
+                   {'genie.libs.parser.mechanism_timeout': '30'}):
+            self.assertEqual(get_timeout('yang', {'cli': 3}), 30.0)
+
+
+class TestShowIpInterfaceBriefYangCli(unittest.TestCase):
+
+    parsed_output = {'interface': {'GigabitEthernet1': {
+        'ip_address': '10.1.1.1', 'interface_is_ok': 'YES',
+        'method': 'manual', 'status': 'up', 'protocol': 'up'}}}
+
+    def test_yang_cli(self):
+        obj = ShowIpInterfaceBrief(device=Mock())
+        with patch.object(obj, 'cli', return_value=self.parsed_output):
+            # yang() has nothing to parse
+            self.assertEqual(obj.yang_cli(), self.parsed_output)
+            obj.cli.assert_called_once_with()
+
+    def test_yang_cli_pipe_vlan(self):
+        obj = ShowIpInterfaceBriefPipeVlan(device=Mock())
+        with patch('genie.libs.parser.iosxe.show_interface.run_mechanisms',
+                   return_value=self.parsed_output) as mock_run:
+            self.assertEqual(obj.yang_cli(timeouts={'yang': 5}),
+                             self.parsed_output)
+        mock_run.assert_called_once_with(obj, ['yang', 'cli'],
+                                         timeouts={'yang': 5})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+
+import os
+import tempfile
+import unittest
+
+from genie.metaparser import MetaParser
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+from genie.libs.parser.utils import unittests
+from genie.libs.parser.utils.unittests import (
+    get_golden_files,
+    run_golden,
+    run_empty,
+    run_shard,
+    summarize
+)
+
+
+class ShowDummy(MetaParser):
+    schema = {'words': list}
+    cli_command = 'show dummy'
+
+    def cli(self, output=None):
+        out = output or self.device.execute(self.cli_command)
+        if not out.strip():
+            raise SchemaEmptyParserError(out)
+        return {'words': out.split()}
+
+
+PARSER_FILE = '''
+from genie.libs.parser.utils.tests.test_parallel_unittests import ShowDummy
+
+
+class ShowSkipped_iosxe(ShowDummy):
+    pass
+'''
+
+
+class TestParallelRunner(unittest.TestCase):
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+
+        equal = os.path.join('dummyos', 'ShowDummy', 'cli', 'equal')
+        empty = os.path.join('dummyos', 'ShowDummy', 'cli', 'empty')
+        os.makedirs(equal)
+        os.makedirs(empty)
+        self.write(equal, 'golden_output1_output.txt', 'a b')
+        self.write(equal, 'golden_output1_expected.py',
+                   "expected_output = {'words': ['a', 'b']}")
+        self.write(equal, 'golden_output2_output.txt', 'c')
+        self.write(equal, 'golden_output2_expected.py',
+                   "expected_output = {'words': ['d']}")
+        self.write(equal, 'golden_output10_output.txt', 'e')
+        self.write(equal, 'golden_output10_expected.py',
+                   "expected_output = {'words': ['e']}")
+        self.write(empty, 'empty_output_output.txt', '')
+        self.write('dummyos', 'show_dummy.py', PARSER_FILE)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def write(self, folder, name, content):
+        with open(os.path.join(folder, name), 'w') as f:
+            f.write(content)
+
+    def test_golden_files(self):
+        folder = os.path.join('dummyos', 'ShowDummy', 'cli', 'equal')
+        self.assertEqual([os.path.basename(f)
+                          for f in get_golden_files(folder)],
+                         ['golden_output1_output.txt',
+                          'golden_output2_output.txt',
+                          'golden_output10_output.txt'])
+        self.assertEqual([os.path.basename(f)
+                          for f in get_golden_files(folder, number=10)],
+                         ['golden_output10_output.txt'])
+
+    def test_golden(self):
+        results = run_golden(ShowDummy, 'dummyos')
+        self.assertEqual([(r['test'], r['result']) for r in results],
+                         [('golden_output1', 'passed'),
+                          ('golden_output2', 'failed'),
+                          ('golden_output10', 'passed')])
+        results = run_golden(ShowDummy, 'dummyos', number=2)
+        self.assertEqual([r['test'] for r in results], ['golden_output2'])
+
+    def test_empty(self):
+        self.assertEqual([(r['test'], r['result'])
+                          for r in run_empty(ShowDummy, 'dummyos')],
+                         [('empty_output', 'passed')])
+
+    def test_shard(self):
+        details = {'parse_file': os.path.abspath(
+                       os.path.join('dummyos', 'show_dummy.py')),
+                   'token': None}
+        results = run_shard('dummyos', details)
+        self.assertEqual({r['class'] for r in results}, {'ShowDummy'})
+        self.assertEqual(len(results), 4)
+        self.assertEqual(run_shard('dummyos', details, _class='ShowOther'), [])
+
+        # The module is loaded once per process
+        cached = [key for key in unittests._module_cache
+                  if key[1] == details['parse_file']]
+        self.assertEqual(len(cached), 1)
+
+    def test_summarize(self):
+        results = run_golden(ShowDummy, 'dummyos')
+        self.assertEqual(summarize(results), {
+            'dummyos': {'passed': 2, 'failed': 1, 'errored': 0},
+            'total': {'passed': 2, 'failed': 1, 'errored': 0}})
+
+
+if __name__ == '__main__':
+    unittest.main()
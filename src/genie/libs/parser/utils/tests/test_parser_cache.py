@@ -0,0 +1,94 @@
+
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.common import (
+    ParserCache,
+    get_parser,
+    clear_parser_cache,
+    get_parser_cache_info
+)
+from genie.libs.parser.utils.entry_points import add_parser
+
+
+class TestParserCache(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        cache = ParserCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.set('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(cache.info(), {'hits': 3, 'misses': 1,
+                                        'maxsize': 2, 'currsize': 2})
+
+    def test_disabled(self):
+        cache = ParserCache(maxsize=0)
+        cache.set('a', 1)
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(len(cache), 0)
+
+
+class TestGetParserCache(unittest.TestCase):
+
+    def setUp(self):
+        clear_parser_cache()
+        self.device = Mock(os='iosxe', platform='cat9k', model=None,
+                           pid=None, version=None, custom={})
+
+    def tearDown(self):
+        clear_parser_cache()
+
+    @patch.object(common, '_get_parser')
+    def test_repeated_dispatch(self, mock_get_parser):
+        mock_get_parser.return_value = ('ShowVersion', {})
+
+        self.assertEqual(get_parser('show version', self.device),
+                         ('ShowVersion', {}))
+        self.assertEqual(get_parser('show version', self.device),
+                         ('ShowVersion', {}))
+        self.assertEqual(mock_get_parser.call_count, 1)
+        self.assertEqual(get_parser_cache_info()['hits'], 1)
+        self.assertEqual(get_parser_cache_info()['misses'], 1)
+
+    @patch.object(common, '_get_parser')
+    def test_keyed_by_device_tokens(self, mock_get_parser):
+        mock_get_parser.return_value = ('ShowVersion', {})
+        other = Mock(os='nxos', platform='n9k', model=None,
+                     pid=None, version=None, custom={})
+
+        get_parser('show version', self.device)
+        get_parser('show version', other)
+        self.assertEqual(mock_get_parser.call_count, 2)
+
+    @patch.object(common, '_get_parser')
+    def test_kwargs_are_copied(self, mock_get_parser):
+        mock_get_parser.return_value = ('ShowIpRoute', {'vrf': 'RED'})
+
+        _, kwargs = get_parser('show ip route vrf RED', self.device)
+        kwargs['vrf'] = 'BLUE'
+        _, kwargs = get_parser('show ip route vrf RED', self.device)
+        self.assertEqual(kwargs, {'vrf': 'RED'})
+
+    @patch.object(common, '_get_parser')
+    def test_cleared_by_add_parser(self, mock_get_parser):
+        mock_get_parser.return_value = ('ShowVersion', {})
+        get_parser('show version', self.device)
+
+        mock_parser = Mock()
+        mock_parser.MockParser = Mock(
+            cli_command='show test_parser_cache_command')
+        mock_parser.MockParser.__name__ = 'asa.MockParser'
+        mock_parser.MockParser.__package__ = 'asa'
+        add_parser(parser=mock_parser.MockParser, os_name='asa')
+
+        get_parser('show version', self.device)
+        self.assertEqual(mock_get_parser.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
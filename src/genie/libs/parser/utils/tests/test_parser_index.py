@@ -0,0 +1,136 @@
+
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from genie.libs.parser.utils.index import (
+    INDEX_FILE,
+    META_FILE,
+    LazyParserData,
+    split_parser_data,
+    make_parser_index,
+    load_parser_index,
+    load_parser_meta
+)
+
+
+class TestParserIndex(unittest.TestCase):
+
+    parsers = {
+        'show version': {
+            'iosxe': {
+                'module_name': 'show_platform',
+                'package': 'genie.libs.parser',
+                'class': 'ShowVersion',
+                'doc': 'Parser for show version',
+                'schema': "{'version': {}}",
+                'uid': 'show_version',
+                'url': 'https://github.com/CiscoTestAutomation/genieparser'
+            },
+            'nxos': {
+                'n9k': {
+                    'module_name': 'show_platform',
+                    'package': 'genie.libs.parser',
+                    'class': 'ShowVersion',
+                    'doc': 'Parser for show version',
+                }
+            }
+        },
+        'tokens': ['iosxe', 'nxos', 'n9k']
+    }
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'parsers.json')
+        with open(self.path, 'w') as f:
+            json.dump(self.parsers, f)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_split(self):
+        dispatch, meta = split_parser_data(self.parsers)
+        self.assertEqual(dispatch, {
+            'show version': {
+                'iosxe': {'module_name': 'show_platform',
+                          'package': 'genie.libs.parser',
+                          'class': 'ShowVersion'},
+                'nxos': {'n9k': {'module_name': 'show_platform',
+                                 'package': 'genie.libs.parser',
+                                 'class': 'ShowVersion'}}},
+            'tokens': ['iosxe', 'nxos', 'n9k']})
+        self.assertEqual(meta['show version']['nxos']['n9k'],
+                         {'doc': 'Parser for show version'})
+        self.assertEqual(meta['show version']['iosxe']['uid'], 'show_version')
+        self.assertNotIn('tokens', meta)
+
+    def test_make_and_load(self):
+        dispatch = make_parser_index(self.path)
+        self.assertTrue(os.path.isfile(os.path.join(self.tmpdir, INDEX_FILE)))
+        self.assertTrue(os.path.isfile(os.path.join(self.tmpdir, META_FILE)))
+        self.assertEqual(load_parser_index(self.path), dispatch)
+        self.assertEqual(load_parser_meta(self.path),
+                         split_parser_data(self.parsers)[1])
+
+    def test_older_index(self):
+        # As extracted from a wheel, before parsers.json
+        dispatch = make_parser_index(self.path)
+        for name in (INDEX_FILE, META_FILE):
+            os.utime(os.path.join(self.tmpdir, name), (0, 0))
+        with patch('genie.libs.parser.utils.index.split_parser_data') as \
+                split:
+            self.assertEqual(load_parser_index(self.path), dispatch)
+            self.assertEqual(load_parser_meta(self.path),
+                             split_parser_data(self.parsers)[1])
+        split.assert_not_called()
+
+    def test_outdated_index(self):
+        make_parser_index(self.path)
+        parsers = json.loads(json.dumps(self.parsers))
+        parsers['tokens'].append('n7k')
+        parsers['show version']['iosxe']['doc'] = 'Parser for show ver'
+        with open(self.path, 'w') as f:
+            json.dump(parsers, f)
+        self.assertEqual(load_parser_index(self.path),
+                         split_parser_data(parsers)[0])
+        self.assertEqual(load_parser_meta(self.path),
+                         split_parser_data(parsers)[1])
+
+    def test_missing_index(self):
+        self.assertEqual(load_parser_index(self.path),
+                         split_parser_data(self.parsers)[0])
+        self.assertEqual(load_parser_meta(self.path),
+                         split_parser_data(self.parsers)[1])
+
+
+class TestLazyParserData(unittest.TestCase):
+
+    def test_loaded_on_first_use(self):
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return {'show version': {}}
+
+        data = LazyParserData(loader)
+        self.assertFalse(data.loaded)
+        self.assertEqual(calls, [])
+
+        self.assertIn('show version', data)
+        self.assertTrue(data.loaded)
+        self.assertEqual(len(data), 1)
+        self.assertEqual(list(data), ['show version'])
+        self.assertEqual(calls, [1])
+
+    def test_set_before_load(self):
+        data = LazyParserData(lambda: {'show version': {'iosxe': {}}})
+        data['show clock'] = {}
+        self.assertEqual(dict(data), {'show version': {'iosxe': {}},
+                                      'show clock': {}})
+
+
+if __name__ == '__main__':
+    unittest.main()
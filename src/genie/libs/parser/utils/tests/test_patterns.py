@@ -0,0 +1,154 @@
+
+import re
+import unittest
+from unittest.mock import patch
+
+from genie.libs.parser.utils.patterns import Patterns, LineDispatcher
+
+
+class TestPatterns(unittest.TestCase):
+
+    def test_lazy_compile(self):
+        patterns = Patterns(p1=r'^MTU +(?P<mtu>\d+)',
+                            p2=(r'^hardware +is +(?P<type>\S+)', re.I))
+
+        self.assertNotIn('p1', patterns.__dict__)
+        self.assertEqual(patterns.p1.match('MTU 1500 bytes').group('mtu'),
+                         '1500')
+        self.assertIn('p1', patterns.__dict__)
+        self.assertNotIn('p2', patterns.__dict__)
+
+        self.assertEqual(patterns.p2.match('Hardware is Loopback')
+                         .group('type'), 'Loopback')
+        self.assertEqual(patterns.p2.flags & re.I, re.I)
+
+    def test_pinned(self):
+        patterns = Patterns(p1=r'^Description: *(?P<description>.*)$')
+        compiled = patterns.p1
+        re.purge()
+        self.assertIs(patterns.p1, compiled)
+
+    def test_unknown_pattern(self):
+        patterns = Patterns(p1=r'^MTU')
+        with self.assertRaises(AttributeError):
+            patterns.p2
+
+    def test_compile_all(self):
+        patterns = Patterns(p1=r'^MTU', p2=r'^Hardware')
+        self.assertIs(patterns.compile_all(), patterns)
+        self.assertEqual(sorted(patterns), ['p1', 'p2'])
+        self.assertIn('p2', patterns.__dict__)
+        self.assertIn('p1', patterns)
+        self.assertEqual(len(patterns), 2)
+
+    def test_class_level(self):
+        class Parent(object):
+            patterns = Patterns(p1=r'^parent$')
+
+            def cli(self, line):
+                p = Parent.patterns
+                return bool(p.p1.match(line))
+
+        class Child(Parent):
+            patterns = Patterns(p1=r'^child$')
+
+        self.assertTrue(Child().cli('parent'))
+        self.assertFalse(Child().cli('child'))
+
+
+class TestLineDispatcher(unittest.TestCase):
+
+    patterns = Patterns(
+        p1=r'^(?P<interface>\S+) +is +(?P<enabled>[\w\s]+), +line +protocol',
+        p2=r'^Hardware +is +(?P<type>[\w\s]+)',
+        p3=r'^(?P<in_pkts>\d+) +packets +input',
+        p4=r'^(?P<out_pkts>\d+) +packets +output',
+        p5=r'^(?P<packets>\d+) +packets',
+        p6=(r'^description: +(?P<description>.*)$', re.I),
+        p7=r'^(Internet +address|Secondary +address) +(?P<ip>\S+)$',
+        p8=r'^(?P<vlan>\d*)$',
+    )
+
+    lines = [
+        'GigabitEthernet1 is up, line protocol is up',
+        'Hardware is CSR vNIC',
+        '13350 packets input, 2513375 bytes',
+        '23376 packets output, 3642296 bytes',
+        '0 packets dropped',
+        'Description: to core',
+        'DESCRIPTION: to edge',
+        'Internet address 10.1.1.1/24',
+        'Secondary address 10.2.2.2/24',
+        '',
+        '100',
+        'Hardware is \u00e9thernet',
+        '\u00e9 is up, line protocol is up',
+        'MTU 1500 bytes',
+    ]
+
+    def sequential(self, line):
+        for name in self.patterns:
+            m = getattr(self.patterns, name).match(line)
+            if m:
+                return name, m.groupdict()
+        return None, None
+
+    def test_first_match(self):
+        dispatcher = self.patterns.dispatcher()
+        for line in self.lines:
+            name, m = dispatcher.match(line)
+            self.assertEqual((name, m.groupdict() if m else None),
+                             self.sequential(line), line)
+
+    def test_candidates(self):
+        dispatcher = self.patterns.dispatcher()
+        self.assertEqual(dispatcher.candidates('Hardware is Loopback'),
+                         ['p2', 'p6'])
+        self.assertEqual(dispatcher.candidates('0 packets input'),
+                         ['p3', 'p4', 'p5', 'p6', 'p8'])
+        self.assertEqual(dispatcher.candidates('Secondary address 10.2.2.2'),
+                         ['p6', 'p7'])
+        self.assertEqual(dispatcher.candidates(''), ['p6', 'p8'])
+
+    def test_names(self):
+        dispatcher = self.patterns.dispatcher('p4', 'p5')
+        self.assertEqual(dispatcher.match('0 packets input')[0], 'p5')
+        self.assertEqual(dispatcher.match('0 packets output')[0], 'p4')
+        self.assertEqual(dispatcher.match('Hardware is Loopback'),
+                         (None, None))
+
+    def test_selected(self):
+        dispatcher = self.patterns.selected_dispatcher(['p5'])
+        self.assertIs(self.patterns.selected_dispatcher(['p5']), dispatcher)
+        # p1 and the packet patterns may match the lines of p5 first
+        self.assertEqual(dispatcher.names, ('p1', 'p3', 'p4', 'p5'))
+        for line in self.lines:
+            name, m = dispatcher.match(line)
+            expected, groups = self.sequential(line)
+            if name is None:
+                self.assertNotIn(expected, dispatcher.names)
+            else:
+                self.assertEqual((name, m.groupdict()), (expected, groups))
+
+    def test_patterns_match(self):
+        patterns = Patterns(p1=r'^MTU +(?P<mtu>\d+)', p2=r'^MTU')
+        name, m = patterns.match('MTU 1500 bytes')
+        self.assertEqual(name, 'p1')
+        self.assertEqual(m.group('mtu'), '1500')
+        self.assertEqual(patterns.match('BW 10000 Kbit'), (None, None))
+        self.assertEqual(patterns.match('MTU')[0], 'p2')
+
+    def test_patterns_match_bound(self):
+        patterns = Patterns(p1=r'^MTU +(?P<mtu>\d+)', p2=r'^MTU')
+        match = patterns.match
+        with patch.object(LineDispatcher, 'build',
+                          autospec=True,
+                          side_effect=LineDispatcher.build) as mock_build:
+            for _ in range(3):
+                self.assertEqual(match('MTU 1500 bytes')[0], 'p1')
+        # The dispatcher is built once
+        self.assertEqual(mock_build.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.projection import Projection
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+
+
+interfaces_output = '''
+GigabitEthernet1 is up, line protocol is up
+  Hardware is CSR vNIC, address is 5254.00ff.0e7e (bia 5254.00ff.0e7e)
+  Internet address is 10.1.1.1/24
+  MTU 1500 bytes, BW 1000000 Kbit/sec, DLY 10 usec,
+     reliability 255/255, txload 1/255, rxload 1/255
+  5 minute input rate 1000 bits/sec, 1 packets/sec
+  5 minute output rate 2000 bits/sec, 2 packets/sec
+     13350 packets input, 2513375 bytes, 0 no buffer
+     23376 packets output, 3642296 bytes, 0 underruns
+Tunnel0 is up, line protocol is down
+  Hardware is Tunnel
+  MTU 17912 bytes, BW 100 Kbit/sec, DLY 50000 usec,
+'''
+
+
+class TestProjection(unittest.TestCase):
+
+    data = {
+        'Gi1': {'oper_status': 'up',
+                'counters': {'in_pkts': 1, 'rate': {'in_rate': 2}},
+                'ipv4': {'10.1.1.1/24': {'ip': '10.1.1.1'}},
+                'port_channel': {}},
+        'Tunnel0': {'oper_status': 'down'},
+    }
+
+    def test_wants(self):
+        projection = Projection(['*.counters.rate', ('*', 'mtu')])
+        self.assertTrue(projection.wants('*'))
+        self.assertTrue(projection.wants('*', 'counters'))
+        self.assertTrue(projection.wants('Gi1', 'counters', 'rate', 'x'))
+        self.assertTrue(projection.wants('*', 'mtu'))
+        self.assertFalse(projection.wants('*', 'counters', 'in_pkts'))
+        self.assertFalse(projection.wants('*', 'ipv4'))
+        self.assertTrue(Projection().wants('*', 'ipv4'))
+
+    def test_project(self):
+        projection = Projection(['*.oper_status', '*.counters.rate',
+                                 '*.port_channel', '*.ipv4.*.mask'])
+        self.assertEqual(projection.project(self.data), {
+            'Gi1': {'oper_status': 'up',
+                    'counters': {'rate': {'in_rate': 2}},
+                    'port_channel': {}},
+            'Tunnel0': {'oper_status': 'down'},
+        })
+
+    def test_exclude(self):
+        projection = Projection(exclude=['in_rate', '(Tunnel.*)'])
+        self.assertEqual(projection.project(self.data), {
+            'Gi1': {'oper_status': 'up',
+                    'counters': {'in_pkts': 1},
+                    'ipv4': {'10.1.1.1/24': {'ip': '10.1.1.1'}},
+                    'port_channel': {}},
+        })
+
+    def test_from_parser(self):
+        self.assertIsNone(Projection.from_parser(ShowInterfaces))
+        projection = Projection.from_parser(ShowInterfaces, volatile=False)
+        self.assertEqual(len(projection.exclude),
+                         len(ShowInterfaces.exclude))
+        self.assertIsNone(projection.fields)
+
+
+class TestShowInterfacesProjection(unittest.TestCase):
+
+    def parse(self, **kwargs):
+        return ShowInterfaces(device=Mock()).cli(output=interfaces_output,
+                                                 **kwargs)
+
+    def test_fields(self):
+        fields = ['*.oper_status', '*.line_protocol', '*.bandwidth']
+        self.assertEqual(self.parse(fields=fields), {
+            'GigabitEthernet1': {'oper_status': 'up', 'line_protocol': 'up',
+                                 'bandwidth': 1000000},
+            'Tunnel0': {'oper_status': 'down', 'line_protocol': 'down',
+                        'bandwidth': 100},
+        })
+
+    def test_same_as_full_parse(self):
+        full = self.parse()
+        for fields in (['*.counters.rate'], ['*.ipv4', '*.type'],
+                       ['GigabitEthernet1.counters.in_pkts']):
+            self.assertEqual(self.parse(fields=fields),
+                             Projection(fields).project(full))
+
+    def test_volatile(self):
+        parsed = self.parse(volatile=False)
+        self.assertEqual(list(parsed), ['GigabitEthernet1'])
+        self.assertNotIn('mac_address', parsed['GigabitEthernet1'])
+        self.assertNotIn('in_pkts', parsed['GigabitEthernet1']['counters'])
+        self.assertEqual(parsed['GigabitEthernet1']['mtu'], 1500)
+
+
+if __name__ == '__main__':
+    unittest.main()
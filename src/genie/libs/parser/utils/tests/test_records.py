@@ -0,0 +1,171 @@
+
+import types
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.records import RecordParser, merge_record
+from genie.libs.parser.iosxe.show_arp import ShowIpArp
+from genie.libs.parser.iosxe.show_fdb import ShowMacAddressTable
+from genie.libs.parser.iosxr.show_routing import ShowRouteIpv4
+from genie.libs.parser.nxos.show_routing import ShowIpRoute
+
+
+class TestMergeRecord(unittest.TestCase):
+
+    def test_merge(self):
+        target = {'route': '10.4.1.1/32',
+                  'next_hop': {'next_hop_list': {1: {'index': 1}}}}
+        source = {'active': True,
+                  'next_hop': {'next_hop_list': {1: {'next_hop': '10.1.1.1'},
+                                                 2: {'index': 2}}}}
+        self.assertIs(merge_record(target, source), target)
+        self.assertEqual(target, {
+            'route': '10.4.1.1/32',
+            'active': True,
+            'next_hop': {'next_hop_list': {1: {'index': 1,
+                                               'next_hop': '10.1.1.1'},
+                                           2: {'index': 2}}}})
+        # Values only in source are not copied
+        self.assertIs(target['next_hop']['next_hop_list'][2],
+                      source['next_hop']['next_hop_list'][2])
+
+
+class TestRecordParser(unittest.TestCase):
+
+    class Table(RecordParser):
+        record_keys = ('name',)
+
+        def cli_iter(self, output):
+            for line in output.splitlines():
+                name, value = line.split()
+                yield {'name': name, 'value': value}
+
+        def add_record(self, parsed, record):
+            parsed.setdefault(record['name'], {}).update(
+                self.record_data(record))
+
+    def test_parse_iter(self):
+        parser = self.Table()
+        records = parser.parse_iter(output='a 1\nb 2')
+        self.assertIsInstance(records, types.GeneratorType)
+        self.assertEqual(list(records), [{'name': 'a', 'value': '1'},
+                                         {'name': 'b', 'value': '2'}])
+
+    def test_aggregate(self):
+        parser = self.Table()
+        self.assertEqual(parser.aggregate(parser.cli_iter(output='a 1\nb 2')),
+                         {'a': {'value': '1'}, 'b': {'value': '2'}})
+
+    def test_context(self):
+        parser = self.Table()
+        parser.context = 'yang'
+        with self.assertRaises(NotImplementedError):
+            parser.parse_iter()
+
+
+class TestTableParsers(unittest.TestCase):
+
+    mac_output = '''
+          Mac Address Table
+-------------------------------------------
+
+Vlan    Mac Address       Type        Ports
+----    -----------       --------    -----
+ All    0100.0cff.9999    STATIC      CPU
+  10    aaaa.bbff.8888    DYNAMIC     Gi1/0/1
+  10    aaaa.bbff.8888    DYNAMIC     Gi1/0/2
+  20    0000.0cff.9999    STATIC      Drop
+Total Mac Addresses for this criterion: 4
+'''
+
+    arp_output = '''
+Protocol  Address          Age (min)  Hardware Addr   Type   Interface
+Internet  10.1.7.1                -   0050.56ff.ba6b  ARPA   GigabitEthernet1
+Internet  10.1.7.250             30   0050.56ff.ba6c  ARPA   GigabitEthernet1
+Internet  10.169.197.93           -   fa16.3eff.b7ad  ARPA
+'''
+
+    nxos_route_output = '''
+IP Route Table for VRF "default"
+'*' denotes best ucast next-hop
+'**' denotes best mcast next-hop
+
+10.4.1.1/32, ubest/mbest: 2/0
+    *via 10.2.4.2, Eth1/2, [110/81], 01:01:18, ospf-1, intra
+    *via 10.3.4.3, Eth1/3, [110/81], 01:01:18, ospf-1, intra
+10.16.2.2/32, ubest/mbest: 1/0, attached
+    *via 10.16.2.2, Lo0, [0/0], 01:01:30, local
+
+IP Route Table for VRF "VRF1"
+'*' denotes best ucast next-hop
+'**' denotes best mcast next-hop
+'''
+
+    xr_route_output = '''
+Gateway of last resort is 172.16.0.88 to network 0.0.0.0
+
+S*   0.0.0.0/0 [1/0] via 172.16.0.88, 5w0d
+L    10.4.1.1/32 is directly connected, 01:51:13, Loopback0
+O    10.36.3.3/32 [110/3] via 10.2.3.3, 01:50:49, GigabitEthernet0/0/0/1
+                  [110/3] via 10.1.3.3, 01:50:49, GigabitEthernet0/0/0/3
+'''
+
+    def assertRecords(self, parser, output, count, **kwargs):
+        records = list(parser.parse_iter(output=output, **kwargs))
+        self.assertEqual(len(records), count)
+        for record in records:
+            self.assertNotIsInstance(next(iter(record.values())), dict)
+        self.assertEqual(parser.aggregate(iter(records)),
+                         parser.cli(output=output, **kwargs))
+        return records
+
+    def test_mac_address_table(self):
+        records = self.assertRecords(ShowMacAddressTable(device=Mock()),
+                                     self.mac_output, 5)
+        self.assertEqual(records[1], {'vlan': 10,
+                                      'mac_address': 'aaaa.bbff.8888',
+                                      'interface': 'GigabitEthernet1/0/1',
+                                      'entry_type': 'dynamic'})
+        self.assertEqual(records[-1], {'total_mac_addresses': 4})
+
+    def test_ip_arp(self):
+        records = self.assertRecords(ShowIpArp(device=Mock()),
+                                     self.arp_output, 3)
+        self.assertEqual(records[1], {'interface': 'GigabitEthernet1',
+                                      'ip': '10.1.7.250',
+                                      'link_layer_address': '0050.56ff.ba6c',
+                                      'type': 'ARPA',
+                                      'origin': 'dynamic',
+                                      'age': '30',
+                                      'protocol': 'Internet'})
+
+    def test_ip_arp_execute(self):
+        device = Mock(**{'execute.return_value': self.arp_output})
+        records = ShowIpArp(device=device).parse_iter(vrf='VRF1')
+        device.execute.assert_not_called()
+        self.assertEqual(len(list(records)), 3)
+        device.execute.assert_called_once_with('show ip arp vrf VRF1')
+
+    def test_nxos_ip_route(self):
+        records = self.assertRecords(ShowIpRoute(device=Mock()),
+                                     self.nxos_route_output, 4)
+        self.assertEqual([record.get('route') for record in records],
+                         [None, '10.4.1.1/32', '10.16.2.2/32', None])
+        self.assertEqual(
+            sorted(records[1]['next_hop']['next_hop_list']), [1, 2])
+        self.assertEqual(records[3], {'vrf': 'VRF1',
+                                      'address_family': 'ipv4'})
+
+    def test_iosxr_route_ipv4(self):
+        records = self.assertRecords(ShowRouteIpv4(device=Mock()),
+                                     self.xr_route_output, 4)
+        self.assertEqual(records[0], {'vrf': 'default',
+                                      'last_resort': {
+                                          'gateway': '172.16.0.88',
+                                          'to_network': '0.0.0.0'}})
+        self.assertEqual(
+            sorted(records[3]['next_hop']['next_hop_list']), [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
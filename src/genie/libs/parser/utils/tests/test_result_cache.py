@@ -0,0 +1,194 @@
+
+import copy
+import pickle
+import shutil
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.libs.parser.utils.result_cache import (
+    ResultCache,
+    ReadOnlyDict,
+    freeze,
+    result_key
+)
+from genie.libs.parser.iosxe.show_arp import ShowIpArp
+from genie.libs.parser.iosxr.show_ospf import ShowOspfVrfAllInclusiveInterface
+
+
+arp_output = '''
+Protocol  Address          Age (min)  Hardware Addr   Type   Interface
+Internet  10.1.7.1                -   0050.56ff.ba6b  ARPA   GigabitEthernet1
+'''
+
+arp_output_2 = '''
+Protocol  Address          Age (min)  Hardware Addr   Type   Interface
+Internet  10.1.7.2                -   0050.56ff.ba6c  ARPA   GigabitEthernet2
+'''
+
+
+class TestResultKey(unittest.TestCase):
+
+    def test_key(self):
+        key = result_key(ShowIpArp, arp_output, {'vrf': 'VRF1'})
+        self.assertEqual(key[0], 'genie.libs.parser.iosxe.show_arp.ShowIpArp')
+        self.assertEqual(key, result_key(ShowIpArp, arp_output,
+                                         {'vrf': 'VRF1'}))
+        self.assertNotEqual(key, result_key(ShowIpArp, arp_output))
+        self.assertNotEqual(key, result_key(ShowIpArp, arp_output_2,
+                                            {'vrf': 'VRF1'}))
+        self.assertNotEqual(key, result_key(ShowIpArp, arp_output,
+                                            {'vrf': 'VRF1'}, context='xml'))
+
+    def test_device_lookups(self):
+        r1, r2 = Mock(), Mock()
+        r1.name, r2.name = 'R1', 'R2'
+        # Not a part of the key of the other parsers
+        self.assertEqual(result_key(ShowIpArp, arp_output, device=r1),
+                         result_key(ShowIpArp, arp_output, device=r2))
+        self.assertNotEqual(
+            result_key(ShowOspfVrfAllInclusiveInterface, arp_output,
+                       device=r1),
+            result_key(ShowOspfVrfAllInclusiveInterface, arp_output,
+                       device=r2))
+
+
+class TestReadOnly(unittest.TestCase):
+
+    def test_freeze(self):
+        data = freeze({'a': {'b': [1, {'c': 2}]}})
+        self.assertIsInstance(data, dict)
+        self.assertEqual(data, {'a': {'b': [1, {'c': 2}]}})
+        with self.assertRaises(TypeError):
+            data['a']['d'] = 1
+        with self.assertRaises(TypeError):
+            data['a']['b'].append(3)
+        with self.assertRaises(TypeError):
+            data['a']['b'][1].update(c=3)
+        self.assertIs(freeze(data), data)
+
+    def test_copy(self):
+        data = freeze({'a': {'b': [1]}})
+        for copied in (copy.deepcopy(data),
+                       pickle.loads(pickle.dumps(data))):
+            self.assertIs(type(copied['a']), dict)
+            self.assertIs(type(copied['a']['b']), list)
+            copied['a']['b'].append(2)
+        self.assertEqual(data, {'a': {'b': [1]}})
+
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self.device = Mock()
+
+    def parse(self, cache, output=arp_output, **kwargs):
+        return cache.parse(ShowIpArp(device=self.device), output=output,
+                           **kwargs)
+
+    def test_parse(self):
+        cache = ResultCache()
+        with patch.object(ShowIpArp, 'parse',
+                          autospec=True,
+                          side_effect=ShowIpArp.parse) as mock_parse:
+            first = self.parse(cache)
+            second = self.parse(cache)
+            self.parse(cache, output=arp_output_2)
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertEqual(mock_parse.call_count, 2)
+        self.assertEqual(cache.info(), {'hits': 1, 'misses': 2,
+                                        'disk_hits': 0, 'maxsize': 1024,
+                                        'currsize': 2})
+
+    def test_copy_on_return(self):
+        cache = ResultCache()
+        first = self.parse(cache)
+        first['interfaces'].clear()
+        second = self.parse(cache)
+        self.assertIn('GigabitEthernet1', second['interfaces'])
+        second['interfaces'].clear()
+        self.assertIn('GigabitEthernet1', self.parse(cache)['interfaces'])
+
+    def test_readonly(self):
+        cache = ResultCache(readonly=True)
+        first = self.parse(cache)
+        self.assertIsInstance(first, ReadOnlyDict)
+        self.assertIs(self.parse(cache), first)
+        with self.assertRaises(TypeError):
+            first['interfaces'].clear()
+
+    def test_lru(self):
+        cache = ResultCache(maxsize=2)
+        self.parse(cache)
+        self.parse(cache, output=arp_output_2)
+        # Most recently used
+        self.parse(cache)
+        self.parse(cache, output=arp_output + '\n')
+        self.assertEqual(len(cache), 2)
+        self.parse(cache)
+        self.assertEqual(cache.info()['hits'], 2)
+        self.parse(cache, output=arp_output_2)
+        self.assertEqual(cache.info()['misses'], 4)
+
+    def test_context(self):
+        cache = ResultCache()
+        with patch.object(ShowIpArp, 'parse', autospec=True,
+                          return_value={'interfaces': {}}) as mock_parse:
+            cache.parse(ShowIpArp(device=self.device), output=arp_output)
+            cache.parse(ShowIpArp(device=self.device, context='xml'),
+                        output=arp_output)
+        self.assertEqual(mock_parse.call_count, 2)
+        self.assertEqual(len(cache), 2)
+
+    def test_no_output(self):
+        cache = ResultCache()
+        self.device.execute.return_value = arp_output
+        for _ in range(2):
+            self.assertIn('interfaces',
+                          cache.parse(ShowIpArp(device=self.device)))
+        self.assertEqual(self.device.execute.call_count, 2)
+        self.assertEqual(len(cache), 0)
+
+    def test_error(self):
+        cache = ResultCache()
+        with self.assertRaises(Exception):
+            self.parse(cache, output='')
+        self.assertEqual(len(cache), 0)
+
+
+class TestResultCachePath(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_persisted(self):
+        parsed = ResultCache(path=self.path).parse(
+            ShowIpArp(device=Mock()), output=arp_output)
+
+        for readonly in (False, True):
+            cache = ResultCache(path=self.path, readonly=readonly)
+            with patch.object(ShowIpArp, 'parse') as mock_parse:
+                self.assertEqual(cache.parse(ShowIpArp(device=Mock()),
+                                             output=arp_output), parsed)
+                mock_parse.assert_not_called()
+            self.assertEqual(cache.info()['disk_hits'], 1)
+
+    def test_clear(self):
+        cache = ResultCache(path=self.path)
+        cache.parse(ShowIpArp(device=Mock()), output=arp_output)
+        cache.clear()
+        cache.parse(ShowIpArp(device=Mock()), output=arp_output)
+        self.assertEqual(cache.info()['disk_hits'], 1)
+        cache.clear(disk=True)
+        cache.parse(ShowIpArp(device=Mock()), output=arp_output)
+        self.assertEqual(cache.info(), {'hits': 0, 'misses': 1,
+                                        'disk_hits': 0, 'maxsize': 1024,
+                                        'currsize': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,22 @@
+
+import unittest
+
+from genie.metaparser.util.schemaengine import Any, Optional
+
+from genie.libs.parser.utils.schema_keys import split_key
+
+
+class TestSplitKey(unittest.TestCase):
+
+    def test_split_key(self):
+        any_key = Any()
+        self.assertEqual(split_key('vrf'), ('vrf', False, False))
+        self.assertEqual(split_key(Optional('rd')), ('rd', True, False))
+        self.assertEqual(split_key(any_key), (any_key, False, True))
+        self.assertEqual(split_key(Optional(any_key)), (any_key, True, True))
+        self.assertEqual(split_key(str), (str, False, True))
+        self.assertEqual(split_key(Optional(int)), (int, True, True))
+
+
+if __name__ == '__main__':
+    unittest.main()
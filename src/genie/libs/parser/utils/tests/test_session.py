@@ -0,0 +1,159 @@
+
+import unittest
+from unittest.mock import Mock
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+from genie.libs.parser.utils.session import (
+    ParseSession,
+    get_session,
+    cached_execute,
+    cached_execute_many,
+    cached_parse
+)
+from genie.libs.parser.nxos.show_vrf import ShowVrf, ShowRunningConfigVrf
+
+
+outputs_all = {
+    'show vrf': '''
+VRF-Name                           VRF-ID State   Reason
+VRF1                                    3 Up      --
+default                                 1 Up      --
+''',
+    'show vrf VRF1': '''
+VRF-Name                           VRF-ID State   Reason
+VRF1                                    3 Up      --
+''',
+    "show running-config vrf VRF1 | sec '^vrf'": '''
+vrf context VRF1
+  vni 10100
+  rd auto
+''',
+    "show running-config vrf default | sec '^vrf'": '',
+}
+
+
+class TestParseSession(unittest.TestCase):
+
+    def setUp(self):
+        self.device = Mock(**{'execute.side_effect': outputs_all.get})
+
+    def test_no_session(self):
+        self.assertIsNone(get_session(self.device))
+        cached_execute(self.device, 'show vrf')
+        cached_execute(self.device, 'show vrf')
+        cached_parse(ShowVrf, self.device)
+        self.assertEqual(self.device.execute.call_count, 3)
+
+    def test_scope(self):
+        with ParseSession(self.device) as session:
+            self.assertIs(get_session(self.device), session)
+            self.assertIsNone(get_session(Mock()))
+            with ParseSession(self.device) as inner:
+                self.assertIs(get_session(self.device), inner)
+            self.assertIs(get_session(self.device), session)
+        self.assertIsNone(get_session(self.device))
+
+    def test_execute(self):
+        with ParseSession(self.device) as session:
+            self.assertEqual(cached_execute(self.device, 'show vrf'),
+                             outputs_all['show vrf'])
+            cached_execute(self.device, 'show vrf')
+            self.assertEqual(session.info(), {'hits': 1, 'misses': 1,
+                                              'outputs': 1, 'parsed': 0})
+        self.assertEqual(self.device.execute.call_count, 1)
+
+    def test_execute_many_no_session(self):
+        commands = ['show vrf VRF1', 'show vrf']
+        outputs = cached_execute_many(self.device, commands)
+        self.assertEqual(list(outputs), commands)
+        self.assertEqual(outputs['show vrf'], outputs_all['show vrf'])
+        self.assertEqual(self.device.execute.call_count, 2)
+
+    def test_execute_many_workers(self):
+        commands = ['show vrf', 'show vrf VRF1', 'show vrf']
+        with ParseSession(self.device, max_workers=4) as session:
+            cached_execute(self.device, 'show vrf')
+            outputs = cached_execute_many(self.device, commands)
+            self.assertEqual(session.info()['hits'], 2)
+        self.assertEqual(list(outputs), ['show vrf', 'show vrf VRF1'])
+        self.assertEqual(outputs['show vrf VRF1'], outputs_all['show vrf VRF1'])
+        self.assertEqual(self.device.execute.call_count, 2)
+
+    def test_execute_many_fanout(self):
+        calls = []
+
+        def fanout(commands):
+            calls.append(commands)
+            return [outputs_all[command] for command in commands]
+
+        commands = ['show vrf', 'show vrf VRF1']
+        with ParseSession(self.device, fanout=fanout):
+            self.assertEqual(cached_execute_many(self.device, commands),
+                             {command: outputs_all[command]
+                              for command in commands})
+            cached_execute_many(self.device, commands)
+        self.assertEqual(calls, [commands])
+        self.device.execute.assert_not_called()
+
+    def test_execute_many_fanout_partial(self):
+        commands = ['show vrf', 'show vrf VRF1']
+        expected = {command: outputs_all[command] for command in commands}
+        for fanout in (lambda commands: {'show vrf': outputs_all['show vrf']},
+                       lambda commands: [outputs_all['show vrf']]):
+            self.device.execute.reset_mock()
+            with ParseSession(self.device, fanout=fanout):
+                self.assertEqual(cached_execute_many(self.device, commands),
+                                 expected)
+            self.device.execute.assert_called_once_with('show vrf VRF1')
+
+    def test_parse(self):
+        with ParseSession(self.device) as session:
+            parsed = cached_parse(ShowVrf, self.device)
+            self.assertEqual(sorted(parsed['vrfs']), ['VRF1', 'default'])
+            cached_parse(ShowVrf, self.device, vrf='VRF1')
+            self.assertEqual(session.info()['parsed'], 2)
+
+            # Each caller gets its own copy
+            del parsed['vrfs']['VRF1']
+            again = cached_parse(ShowVrf, self.device)
+            self.assertEqual(sorted(again['vrfs']), ['VRF1', 'default'])
+            self.assertEqual(session.info()['misses'], 2)
+
+    def test_parse_arguments(self):
+        parser_cls = Mock(**{'return_value.parse.return_value': {'a': []}})
+        with ParseSession(self.device):
+            for _ in range(2):
+                self.assertEqual(cached_parse(parser_cls, self.device,
+                                              vrfs=['a', 'b']), {'a': []})
+            cached_parse(parser_cls, self.device, vrfs=['a'])
+        self.assertEqual(parser_cls.return_value.parse.call_count, 2)
+
+    def test_parse_error(self):
+        device = Mock(**{'execute.return_value': ''})
+        with ParseSession(device):
+            errors = []
+            for _ in range(3):
+                with self.assertRaises(SchemaEmptyParserError) as cm:
+                    cached_parse(ShowVrf, device)
+                errors.append(cm.exception)
+        self.assertEqual(device.execute.call_count, 1)
+        # New exceptions, chained from the cached one
+        self.assertIsNot(errors[1], errors[2])
+        self.assertIs(errors[1].__cause__, errors[0])
+        self.assertIs(errors[2].__cause__, errors[0])
+
+    def test_dependent_calls(self):
+        with ParseSession(self.device) as session:
+            first = ShowRunningConfigVrf(device=self.device).parse()
+            second = ShowRunningConfigVrf(device=self.device).parse()
+            self.assertEqual(session.info(), {'hits': 3, 'misses': 3,
+                                              'outputs': 2, 'parsed': 1})
+        self.assertEqual(first, second)
+        self.assertEqual(first['vrf']['VRF1']['vni'], 10100)
+        # show vrf and one show running-config per vrf, executed once
+        self.assertEqual(self.device.execute.call_count, 3)
+        self.assertEqual(session.info()['outputs'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+
+import io
+import mmap
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from genie.libs.parser.utils import stream
+from genie.libs.parser.utils.stream import iter_lines
+
+
+class TestIterLines(unittest.TestCase):
+
+    output = ('Routing entry for 10.4.1.1/32\r\n'
+              '  Known via "connected", distance 0, metric 0\n'
+              '\n'
+              '  Routing Descriptor Blocks:\r'
+              '  * directly connected, via Loopback0\x0c'
+              '      Route metric is 0, traffic share count is 1\n'
+              '\u00e9\u20ac')
+
+    def test_string(self):
+        self.assertEqual(list(iter_lines(self.output)),
+                         self.output.splitlines())
+        self.assertEqual(list(iter_lines('')), [])
+        self.assertEqual(list(iter_lines('\n')), [''])
+
+    def test_small_chunks(self):
+        # Chunk boundaries inside '\r\n' and inside multi bytes characters
+        for size in range(1, 8):
+            with patch.object(stream, 'CHUNK_SIZE', size):
+                self.assertEqual(list(iter_lines(self.output)),
+                                 self.output.splitlines())
+                self.assertEqual(list(iter_lines(self.output.encode())),
+                                 self.output.splitlines())
+
+    def test_bytes(self):
+        self.assertEqual(list(iter_lines(self.output.encode('utf-16'),
+                                         encoding='utf-16')),
+                         self.output.splitlines())
+        self.assertEqual(list(iter_lines(b'up\xff\ndown')),
+                         ['up\ufffd', 'down'])
+
+    def test_file(self):
+        self.assertEqual(list(iter_lines(io.StringIO(self.output,
+                                                     newline=''))),
+                         self.output.splitlines())
+        self.assertEqual(list(iter_lines(io.BytesIO(self.output.encode()))),
+                         self.output.splitlines())
+
+    def test_mmap(self):
+        with tempfile.TemporaryFile() as f:
+            f.write(self.output.encode())
+            f.flush()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                self.assertEqual(list(iter_lines(m)),
+                                 self.output.splitlines())
+
+    def test_iterable(self):
+        lines = ['Gateway of last resort is not set\n', '',
+                 b'C        10.4.1.1 is directly connected\r\n',
+                 'L        10.4.1.2 is directly connected']
+        self.assertEqual(list(iter_lines(iter(lines))),
+                         ['Gateway of last resort is not set', '',
+                          'C        10.4.1.1 is directly connected',
+                          'L        10.4.1.2 is directly connected'])
+
+    def test_lazy(self):
+        f = io.StringIO('line1\n' * 10)
+        with patch.object(stream, 'CHUNK_SIZE', 6):
+            lines = iter_lines(f)
+            self.assertEqual(next(lines), 'line1')
+            self.assertEqual(f.tell(), 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
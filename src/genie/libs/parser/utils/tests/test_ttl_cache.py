@@ -0,0 +1,52 @@
+
+import unittest
+
+from genie.libs.parser.utils.ttl_cache import TtlCache
+
+
+class TestTtlCache(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 0
+        self.cache = TtlCache(ttl=10, maxsize=2, timer=lambda: self.now)
+
+    def test_expiry(self):
+        self.cache.set('a', 1)
+        self.now = 9
+        self.assertEqual(self.cache.get('a'), 1)
+        self.now = 10
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(self.cache.get('a', 0), 0)
+        self.assertEqual(self.cache.info(), {'hits': 1, 'misses': 2,
+                                             'expired': 1, 'ttl': 10,
+                                             'maxsize': 2, 'currsize': 0})
+
+    def test_bounded(self):
+        for key in ('a', 'b', 'c'):
+            self.cache.set(key, key)
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(self.cache.get('c'), 'c')
+
+        # The expired values are evicted as new values are set
+        self.now = 10
+        self.cache.set('d', 'd')
+        self.assertEqual(len(self.cache), 1)
+        self.assertEqual(self.cache.pop('d'), 'd')
+        self.assertIsNone(self.cache.pop('d'))
+
+    def test_disabled(self):
+        cache = TtlCache(ttl=0)
+        cache.set('a', 1)
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(len(cache), 0)
+
+    def test_clear(self):
+        self.cache.set('a', 1)
+        self.cache.get('a')
+        self.cache.clear()
+        self.assertEqual(self.cache.info()['hits'], 0)
+        self.assertEqual(len(self.cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.metaparser import MetaParser
+from genie.metaparser.util.exceptions import (
+    SchemaEmptyParserError,
+    SchemaTypeError
+)
+from genie.metaparser.util.schemaengine import Any, Optional, Or, ListOf
+
+from genie.libs.parser.utils import validation
+from genie.libs.parser.utils.validation import (
+    compile_schema,
+    get_validator,
+    set_validation_mode,
+    validate,
+    validated_parse
+)
+
+
+class ShowDummySchema(MetaParser):
+    schema = {
+        'vrf': {
+            Any(): {
+                'state': Or('up', 'down'),
+                'vni': int,
+                Optional('rd'): Or(str, None),
+                Optional('rt'): ListOf({'value': str}),
+                Optional('flags'): [str],
+                Optional('counters'): {str: int},
+            }
+        }
+    }
+
+
+class ShowDummy(ShowDummySchema):
+    cli_command = 'show dummy'
+
+    def cli(self, output=None):
+        return output
+
+    def yang(self, output=None):
+        return {'vrf': {'VRF3': {'state': 'up', 'vni': 300}}}
+
+
+valid = {
+    'vrf': {
+        'VRF1': {'state': 'up', 'vni': 100, 'rd': None,
+                 'rt': [{'value': '1:1'}], 'flags': ['a'],
+                 'counters': {'in': 1}},
+        'VRF2': {'state': 'down', 'vni': 200, 'rd': '1:2'},
+    }
+}
+
+
+class TestCompiledSchema(unittest.TestCase):
+
+    def setUp(self):
+        validation.clear_validators()
+        self.engine = Mock()
+        self.engine.return_value.validate.side_effect = SchemaTypeError(
+            'engine error')
+        patcher = patch.object(validation, 'Schema', self.engine)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(set_validation_mode, 'full', sample=10)
+
+    def test_valid(self):
+        validator = compile_schema(ShowDummy.schema)
+        self.assertIs(validator(valid), valid)
+        empty = {'vrf': {}}
+        self.assertIs(validator(empty), empty)
+        self.engine.assert_not_called()
+
+    def test_invalid(self):
+        validator = compile_schema(ShowDummy.schema)
+        for data in [{},
+                     {'vrf': {'VRF1': {'state': 'up'}}},
+                     {'vrf': {'VRF1': {'state': 'unknown', 'vni': 1}}},
+                     {'vrf': {'VRF1': {'state': 'up', 'vni': '1'}}},
+                     {'vrf': {'VRF1': {'state': 'up', 'vni': 1, 'x': 1}}},
+                     {'vrf': {'VRF1': {'state': 'up', 'vni': 1,
+                                       'counters': {1: 1}}}},
+                     {'vrf': {'VRF1': {'state': 'up', 'vni': 1,
+                                       'rt': {'value': '1:1'}}}}]:
+            # The errors are the ones of the schema engine
+            with self.assertRaisesRegex(SchemaTypeError, 'engine error'):
+                validator(data)
+        self.assertEqual(self.engine.call_count, 7)
+        self.engine.assert_called_with(ShowDummy.schema)
+
+    def test_engine_result(self):
+        # Outputs the compiled checks do not accept are validated by the
+        # schema engine, like an empty list
+        self.engine.return_value.validate.side_effect = None
+        self.engine.return_value.validate.return_value = 'validated'
+        data = {'vrf': {'VRF1': {'state': 'up', 'vni': 1, 'flags': []}}}
+        self.assertEqual(compile_schema(ShowDummy.schema)(data), 'validated')
+
+    def test_unsupported(self):
+        schema = {Or('vty', 'tty'): int}
+        with self.assertRaises(SchemaTypeError):
+            compile_schema(schema)({'vty': 1})
+        self.engine.assert_called_once_with(schema)
+
+    def test_cached_per_class(self):
+        self.assertIs(get_validator(ShowDummy), get_validator(ShowDummy))
+
+    def test_modes(self):
+        invalid = {'vrf': {'VRF1': {}}}
+        set_validation_mode('skip')
+        self.assertIs(validate(ShowDummy, invalid), invalid)
+
+        set_validation_mode('sample', sample=3)
+        results = []
+        for _ in range(6):
+            try:
+                validate(ShowDummy, invalid)
+                results.append(True)
+            except SchemaTypeError:
+                results.append(False)
+        self.assertEqual(results, [False, True, True, False, True, True])
+
+        with self.assertRaises(ValueError):
+            set_validation_mode('fast')
+        with self.assertRaises(ValueError):
+            set_validation_mode('sample', sample=0)
+
+    def test_validated_parse(self):
+        self.assertIs(validated_parse(ShowDummy(device=Mock()), output=valid),
+                      valid)
+        with self.assertRaises(SchemaEmptyParserError):
+            validated_parse(ShowDummy(device=Mock()), output={})
+
+    def test_validated_parse_contexts(self):
+        parser = ShowDummy(device=Mock(), context=['yang', 'cli'])
+        parsed = validated_parse(parser, output=valid)
+        self.assertEqual(sorted(parsed['vrf']), ['VRF1', 'VRF2', 'VRF3'])
+
+        parser.yang_cli = Mock(return_value=valid)
+        self.assertIs(validated_parse(parser, output=valid), valid)
+        parser.yang_cli.assert_called_once_with(output=valid)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,186 @@
+
+import io
+import unittest
+from unittest.mock import Mock
+import xml.etree.ElementTree as ET
+from xml.etree.ElementTree import ParseError
+
+from genie.libs.parser.utils.xml_stream import XmlRow, iter_xml_rows
+from genie.libs.parser.nxos.show_bgp import ShowBgpVrfAllAllDampeningParameters
+
+
+output = '''<?xml version="1.0" encoding="ISO-8859-1"?>
+<nf:rpc-reply xmlns="http://www.cisco.com/nxos:7.0.3.I7.3.:bgp" xmlns:nf="urn:ietf:params:xml:ns:netconf:base:1.0">
+ <nf:data>
+  <show>
+   <bgp>
+    <__XML__PARAM__vrf-name>
+     <__XML__value>VRF1</__XML__value>
+     <summary>
+      <__readonly__>
+       <TABLE_vrf>
+        <ROW_vrf>
+         <vrf-name-out>VRF1</vrf-name-out>
+         <vrf-local-as>100</vrf-local-as>
+         <TABLE_neighbor>
+          <ROW_neighbor>
+           <neighborid>10.1.1.1</neighborid>
+           <state>Established</state>
+          </ROW_neighbor>
+          <ROW_neighbor>
+           <neighborid>10.1.1.2</neighborid>
+           <state>Idle</state>
+           <TABLE_af>
+            <ROW_af><af-name>IPv4 Unicast</af-name></ROW_af>
+           </TABLE_af>
+          </ROW_neighbor>
+         </TABLE_neighbor>
+         <vrf-router-id>10.0.0.1</vrf-router-id>
+        </ROW_vrf>
+       </TABLE_vrf>
+      </__readonly__>
+     </summary>
+    </__XML__PARAM__vrf-name>
+   </bgp>
+  </show>
+ </nf:data>
+</nf:rpc-reply>
+]]>]]>
+'''
+
+rows = [
+    XmlRow('vrf', '**/TABLE_vrf/ROW_vrf', {
+        'vrf-name-out': 'vrf',
+        'vrf-local-as': ('local_as', int),
+        'vrf-router-id': 'router_id',
+    }, rows=[
+        XmlRow('neighbor', 'TABLE_neighbor/ROW_*', {
+            'neighborid': 'neighbor',
+            'state': ('state', str.lower),
+            'TABLE_af/*/af-name': 'af',
+        }),
+    ]),
+]
+
+
+class TestXmlRow(unittest.TestCase):
+
+    def test_match(self):
+        row = XmlRow('vrf', '**/TABLE_vrf/ROW_vrf', {'vrf-*': 'name'})
+        path = 'rpc-reply/data/TABLE_vrf/ROW_vrf'
+        self.assertTrue(row.match(path, path.split('/')))
+        self.assertTrue(row.match(path, ['{urn:a}rpc-reply', '{urn:b}data',
+                                         '{urn:c}TABLE_vrf', 'ROW_vrf']))
+        self.assertFalse(row.match(path + '/ROW_af',
+                                   (path + '/ROW_af').split('/')))
+        self.assertEqual(row.field('vrf-name-out', ['vrf-name-out']),
+                         ('name', None))
+        self.assertIsNone(row.field('vrf/name', ['vrf', 'name']))
+
+        with self.assertRaises(ValueError):
+            XmlRow('vrf', 'TABLE_vrf/**')
+        with self.assertRaises(ValueError):
+            XmlRow('vrf', 'oc:TABLE_vrf/ROW_vrf')
+
+    def test_namespaces(self):
+        row = XmlRow('bgp', '**/oc:bgp', {'oc:global/as': 'as'},
+                     namespaces={'oc': 'http://openconfig.net/yang/bgp'})
+        tags = ['data', '{http://openconfig.net/yang/bgp}bgp']
+        self.assertTrue(row.match('data/bgp', tags))
+        self.assertFalse(row.match('data/bgp', ['data', '{urn:native}bgp']))
+        self.assertFalse(row.match('data/bgp', ['data', 'bgp']))
+        self.assertEqual(row.field('global/as', [
+            '{http://openconfig.net/yang/bgp}global',
+            '{http://openconfig.net/yang/bgp-types}as']), ('as', None))
+        self.assertIsNone(row.field('global/as', ['{urn:native}global',
+                                                  'as']))
+
+
+class TestIterXmlRows(unittest.TestCase):
+
+    def test_records(self):
+        records = list(iter_xml_rows(output, *rows))
+        self.assertEqual([name for name, _, _ in records],
+                         ['neighbor', 'neighbor', 'vrf'])
+
+        name, record, parents = records[0]
+        self.assertEqual(record, {'neighbor': '10.1.1.1',
+                                  'state': 'established'})
+        self.assertEqual(records[1][1]['af'], 'IPv4 Unicast')
+        # Leaves after the nested rows are in the record of the row only
+        self.assertIs(parents[0], records[2][1])
+        self.assertEqual(records[2][1], {'vrf': 'VRF1', 'local_as': 100,
+                                         'router_id': '10.0.0.1'})
+
+    def test_sources(self):
+        expected = list(iter_xml_rows(output, *rows))
+        data = output.encode()
+        self.assertEqual(list(iter_xml_rows(data, *rows)), expected)
+        self.assertEqual(list(iter_xml_rows(io.BytesIO(data), *rows)),
+                         expected)
+        chunks = (data[index:index + 7] for index in range(0, len(data), 7))
+        self.assertEqual(list(iter_xml_rows(chunks, *rows)), expected)
+
+    def test_command(self):
+        records = iter_xml_rows(output, *rows,
+                                command='show bgp VRF1 summary')
+        self.assertEqual(len(list(records)), 3)
+
+        with self.assertRaises(AssertionError):
+            list(iter_xml_rows(output, *rows, command='show bgp summary'))
+
+    def test_element(self):
+        root = ET.fromstring(output[:output.find(']]>]]>')])
+        self.assertEqual(list(iter_xml_rows(root, *rows)),
+                         list(iter_xml_rows(output, *rows)))
+        # Not cleared
+        self.assertEqual(len(root.findall('.//{*}ROW_neighbor')), 2)
+
+    def test_invalid(self):
+        with self.assertRaises(ParseError):
+            list(iter_xml_rows('', *rows))
+        with self.assertRaises(ParseError):
+            list(iter_xml_rows(output[:output.find('</TABLE_vrf>')], *rows))
+
+
+class TestShowBgpVrfAllAllDampeningParametersXml(unittest.TestCase):
+
+    output = '''<?xml version="1.0" encoding="ISO-8859-1"?>
+<nf:rpc-reply xmlns="http://www.cisco.com/nxos:7.0.3.I7.3.:bgp" xmlns:nf="urn:ietf:params:xml:ns:netconf:base:1.0">
+ <nf:data><show><bgp><vrf><all><all><dampening><parameters><__readonly__>
+  <TABLE_vrf><ROW_vrf>
+   <vrf-name-out>vpn1</vrf-name-out>
+   <TABLE_afi><ROW_afi><TABLE_safi><ROW_safi>
+    <af-name>VPNv4 Unicast</af-name>
+    <TABLE_rd>
+     <ROW_rd>
+      <rd_val>10.1.1.1:1</rd_val>
+      <damphalflife>15</damphalflife>
+     </ROW_rd>
+     <ROW_rd>
+      <rd_val>10.1.1.1:2</rd_val>
+      <damphalflife>15</damphalflife>
+      <TABLE_rpm><ROW_rpm>
+       <rpmdamphalflife>30</rpmdamphalflife>
+      </ROW_rpm></TABLE_rpm>
+     </ROW_rd>
+    </TABLE_rd>
+   </ROW_safi></TABLE_safi></ROW_afi></TABLE_afi>
+  </ROW_vrf></TABLE_vrf>
+ </__readonly__></parameters></dampening></all></all></vrf></bgp></show></nf:data>
+</nf:rpc-reply>
+]]>]]>
+'''
+
+    def test_route_distinguishers(self):
+        device = Mock(**{'execute.return_value': self.output})
+        parsed = ShowBgpVrfAllAllDampeningParameters(
+            device=device, context='xml').parse()
+        af = parsed['vrf']['vpn1']['address_family']['vpnv4 unicast']
+        self.assertEqual(af['route_distinguisher'], {
+            '10.1.1.1:1': {'dampening_half_life_time': '15'},
+            '10.1.1.1:2': {'dampening_half_life_time': '30'}})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+'''Values kept for a limited time
+
+The operational data read from a device, like a NETCONF reply, can be used
+by several parsers in a row, but goes stale. The TtlCache keeps each value
+for `ttl` seconds after it is set:
+
+    example:
+
+        >>> cache = TtlCache(ttl=10)
+        >>> reply = cache.get(key)
+        >>> if reply is None:
+        ...     reply = device.get(...)
+        ...     cache.set(key, reply)
+
+The cache is bounded, the oldest values are evicted first. A `ttl` of 0
+disables it.
+'''
+
+# python
+import time
+import threading
+from collections import OrderedDict
+
+
+class TtlCache(object):
+    '''Bounded cache of values which expire after a time to live
+
+        Args:
+            ttl (`float`): seconds a value is kept
+            maxsize (`int`): number of values kept
+            timer (`callable`): clock of the cache, in seconds
+    '''
+
+    def __init__(self, ttl=10, maxsize=1024, timer=time.monotonic):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.timer = timer
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        # key -> (expiry, value), by expiry
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        '''Return the value of a key, the default if it is not cached or
+        has expired'''
+        with self._lock:
+            try:
+                expiry, value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            if expiry <= self.timer():
+                del self._data[key]
+                self.expired += 1
+                self.misses += 1
+                return default
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        '''Keep the value of a key for the time to live'''
+        if not self.ttl or not self.maxsize:
+            return
+        with self._lock:
+            now = self.timer()
+            self._data.pop(key, None)
+            self._data[key] = (now + self.ttl, value)
+            # The oldest values come first, expired or not
+            while len(self._data) > self.maxsize or \
+                    next(iter(self._data.values()))[0] <= now:
+                self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        '''Remove a key and return its value, expired or not'''
+        with self._lock:
+            item = self._data.pop(key, None)
+        return default if item is None else item[1]
+
+    def clear(self):
+        '''Forget the values and reset the counters'''
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+            self.expired = 0
+
+    def info(self):
+        '''Return the cache statistics'''
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'expired': self.expired,
+                'ttl': self.ttl,
+                'maxsize': self.maxsize,
+                'currsize': len(self._data)}
@@ -5,6 +5,7 @@ import os
 import re
 import sys
 import glob
+import time
 import json
 import logging
 import inspect
@@ -12,6 +13,7 @@ import pathlib
 import argparse
 import importlib
 from unittest.mock import Mock
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # pyATS
 from pyats import aetest
@@ -82,6 +84,75 @@ def get_files(folder, token=None):
     return files
 
 
+def get_parse_files(operating_system, external_folder=None):
+    """Helper function to list the parser files of an OS, tokens included."""
+    if external_folder:
+        base_folder = external_folder / operating_system
+    else:
+        base_folder = pathlib.Path(f"{pathlib.Path(_parser.__file__).parent}/{operating_system}")
+    # Please refer to get_tokens comments for the how, the what is a genie token, such as
+    # "asr1k" or "c3850" to provide namespaced parsing.
+    tokens = get_tokens(base_folder)
+    parse_files = []
+    parse_files.extend(get_files(base_folder))
+    for token in tokens:
+        parse_files.extend(get_files(base_folder / token, token))
+    return parse_files
+
+
+# Parser modules already loaded in this process, by file
+_module_cache = {}
+
+
+def load_parse_module(operating_system, details):
+    """Helper function to load a parser file once per process."""
+    parse_file = details["parse_file"]
+    token = details["token"]
+    module_name = os.path.basename(parse_file[: -len(".py")])
+    if token:
+        module_name = f"{operating_system}_{token}_{module_name}"
+    else:
+        module_name = f"{operating_system}_{module_name}"
+
+    key = (module_name, parse_file)
+    if key not in _module_cache:
+        _module_cache[key] = importlib.machinery.SourceFileLoader(
+            module_name, parse_file
+        ).load_module()
+    return _module_cache[key]
+
+
+def get_test_classes(_module, operating_system, token=None, _class=None, _token=None):
+    """Helper function to find the parser classes of a module to be tested."""
+    classes = []
+    for name, local_class in inspect.getmembers(_module):
+        # The following methods determin when a test is not warranted, further detail will be provided for each method.
+
+        # If there is a token and the "class" was found to be a known whitelist (mainly since there was not existing tests),
+        # skip. Whitelisted items should be cleaned up over time, and this removed to enforce testing always happens.
+        if token and CLASS_SKIP.get(operating_system, {}).get(token, {}).get(
+            name
+        ):
+            continue
+        # Same as previous, but in cases without tokens (which is the majority.)
+        elif not token and CLASS_SKIP.get(operating_system, {}).get(name):
+            continue
+
+        # This is used in conjunction with the arguments that are run at command line, to skip over all tests you are
+        # not concerned with. Basically, it allows a user to not have to wait for 100s of tests to run, to run their
+        # one test.
+        if _token and _token != token:
+            continue
+        # Same as previous, however, for class
+        if _class and _class != name:
+            continue
+        # Each "globals()" is checked to see if it has a cli attribute, if so, assumed to be a parser. The _osxe, is
+        # since the ios module often refers to the iosxe parser, leveraging this naming convention.
+        if hasattr(local_class, "cli") and not name.endswith("_iosxe"):
+            classes.append((name, local_class))
+    return classes
+
+
 class FileBasedTest(aetest.Testcase):
     """Standard pyats testcase class."""
 
@@ -128,81 +199,36 @@ class FileBasedTest(aetest.Testcase):
     def test(self,operating_system, steps, _os, _class, _token, _number, _display_only_failed, _external_folder):
 
         """Loop through OS's and run appropriate tests."""
-        if _external_folder:
-            base_folder = _external_folder / operating_system
-        else:
-            base_folder = pathlib.Path(f"{pathlib.Path(_parser.__file__).parent}/{operating_system}")
-        # Please refer to get_tokens comments for the how, the what is a genie token, such as
-        # "asr1k" or "c3850" to provide namespaced parsing.
-        tokens = get_tokens(base_folder)
-        parse_files = []
-        parse_files.extend(get_files(base_folder))
-        for token in tokens:
-            parse_files.extend(get_files(base_folder / token, token))
-        start = False
+        parse_files = get_parse_files(operating_system, _external_folder)
         # Get all of the root level files
         for details in parse_files:
-            parse_file = details["parse_file"]
             token = details["token"]
             # Load all of the classes in each of those files, and search for classes
             # that have a `cli` method
-            _module = None
-            module_name = os.path.basename(parse_file[: -len(".py")])
-            if token:
-                module_name = f"{operating_system}_{token}_{module_name}"
-            else:
-                module_name = f"{operating_system}_{module_name}"
-            _module = importlib.machinery.SourceFileLoader(
-                module_name, parse_file
-            ).load_module()
-            for name, local_class in inspect.getmembers(_module):
-                # The following methods determin when a test is not warranted, further detail will be provided for each method.
-
-                # If there is a token and the "class" was found to be a known whitelist (mainly since there was not existing tests),
-                # skip. Whitelisted items should be cleaned up over time, and this removed to enforce testing always happens.
-                if token and CLASS_SKIP.get(operating_system, {}).get(token, {}).get(
-                    name
-                ):
-                    continue
-                # Same as previous, but in cases without tokens (which is the majority.)
-                elif not token and CLASS_SKIP.get(operating_system, {}).get(name):
-                    continue
-
-                # This is used in conjunction with the arguments that are run at command line, to skip over all tests you are
-                # not concerned with. Basically, it allows a user to not have to wait for 100s of tests to run, to run their
-                # one test.
-                if _token and _token != token:
-                    continue
-                # Same as previous, however, for class
-                if _class and _class != name:
-                    continue
-                # Each "globals()" is checked to see if it has a cli attribute, if so, assumed to be a parser. The _osxe, is
-                # since the ios module often refers to the iosxe parser, leveraging this naming convention.
-                if hasattr(local_class, "cli") and not name.endswith("_iosxe"):
-                    # if name == 'SomeClassName':
-                    #    start = True
-                    # if not start:
-                    #    continue
-                    if token:
-                        msg = f"{operating_system} -> Token -> {token} -> {name}"
-                    else:
-                        msg = f"{operating_system} -> {name}"
-                    with steps.start(msg, continue_=True) as class_step:
-                        with class_step.start(
-                            f"Test Golden -> {operating_system} -> {name}",
-                            continue_=True,
-                        ) as golden_steps:
-                            self.test_golden(
-                                golden_steps, local_class, operating_system, _display_only_failed, token, _number
-                            )
-
-                        with class_step.start(
-                            f"Test Empty -> {operating_system} -> {name}",
-                            continue_=True,
-                        ) as empty_steps:
-                            self.test_empty(
-                                empty_steps, local_class, operating_system, token
-                            )
+            _module = load_parse_module(operating_system, details)
+            for name, local_class in get_test_classes(
+                _module, operating_system, token, _class, _token
+            ):
+                if token:
+                    msg = f"{operating_system} -> Token -> {token} -> {name}"
+                else:
+                    msg = f"{operating_system} -> {name}"
+                with steps.start(msg, continue_=True) as class_step:
+                    with class_step.start(
+                        f"Test Golden -> {operating_system} -> {name}",
+                        continue_=True,
+                    ) as golden_steps:
+                        self.test_golden(
+                            golden_steps, local_class, operating_system, _display_only_failed, token, _number
+                        )
+
+                    with class_step.start(
+                        f"Test Empty -> {operating_system} -> {name}",
+                        continue_=True,
+                    ) as empty_steps:
+                        self.test_empty(
+                            empty_steps, local_class, operating_system, token
+                        )
 
 
     @screen_log_handling
@@ -951,6 +977,194 @@ EMPTY_SKIP = {
     },
 }
 
+# Parallel runner
+# Each parser file of each OS is a shard, run by a pool of processes. The
+# verdicts are the same as the ones of the aetest steps of FileBasedTest.
+
+def _result(operating_system, token, local_class, test, result, reason=None):
+    return {
+        "os": operating_system,
+        "token": token,
+        "class": local_class,
+        "test": test,
+        "result": result,
+        "reason": reason,
+    }
+
+
+def get_golden_files(folder_root, number=None):
+    """Helper function to list the golden outputs of a folder, in natural order."""
+    convert = lambda text: int(text) if text.isdigit() else text
+    aph_key = lambda key: [convert(c) for c in re.split("([0-9]+)", key)]
+    if number:
+        pattern = f"{folder_root}/golden_output{number}_output.txt"
+    else:
+        pattern = f"{folder_root}/*_output.txt"
+    return sorted(glob.glob(pattern), key=aph_key)
+
+
+def run_golden(local_class, operating_system, token=None, number=None):
+    """Parse the golden outputs of a class and compare to the expected ones."""
+    name = local_class.__name__
+    if token:
+        folder_root = pathlib.Path(f"{operating_system}/{token}/{name}/cli/equal")
+    else:
+        folder_root = pathlib.Path(f"{operating_system}/{name}/cli/equal")
+
+    output_glob = get_golden_files(folder_root, number)
+    if len(output_glob) == 0:
+        return [_result(operating_system, token, name, "golden", "failed",
+                        f"No files found in appropriate directory for {local_class}")]
+
+    results = []
+    for user_defined in output_glob:
+        user_test = os.path.basename(user_defined[: -len("_output.txt")])
+        try:
+            golden_output_str = read_from_file(f"{folder_root}/{user_test}_output.txt")
+            golden_parsed_output = read_python_file(f"{folder_root}/{user_test}_expected.py")
+            arguments = {}
+            if os.path.exists(f"{folder_root}/{user_test}_arguments.json"):
+                arguments = read_json_file(f"{folder_root}/{user_test}_arguments.json")
+
+            device = Mock(**{"execute.return_value": golden_output_str})
+            obj = local_class(device=device)
+            parsed_output = obj.parse(**arguments)
+        except Exception as e:
+            results.append(_result(operating_system, token, name, user_test,
+                                   "errored", f"{type(e).__name__}: {e}"))
+            continue
+
+        if parsed_output != golden_parsed_output:
+            dd = Diff(parsed_output, golden_parsed_output)
+            dd.findDiff()
+            results.append(_result(operating_system, token, name, user_test,
+                                   "failed", str(dd)))
+        else:
+            results.append(_result(operating_system, token, name, user_test, "passed"))
+    return results
+
+
+def run_empty(local_class, operating_system, token=None):
+    """Parse the empty outputs of a class, which are expected to fail."""
+    name = local_class.__name__
+    if token:
+        folder_root = f"{operating_system}/{token}/{name}/cli/empty"
+    else:
+        folder_root = f"{operating_system}/{name}/cli/empty"
+    output_glob = glob.glob(f"{folder_root}/*_output.txt")
+
+    results = []
+    if len(output_glob) == 0 and not EMPTY_SKIP.get(operating_system, {}).get(name):
+        results.append(_result(operating_system, token, name, "empty", "failed",
+                               f"No files found in appropriate directory for {local_class} empty file"))
+
+    for user_defined in output_glob:
+        user_test = os.path.basename(user_defined[: -len("_output.txt")])
+        try:
+            empty_output_str = read_from_file(f"{folder_root}/{user_test}_output.txt")
+            arguments = {}
+            if os.path.exists(f"{folder_root}/{user_test}_arguments.json"):
+                arguments = read_json_file(f"{folder_root}/{user_test}_arguments.json")
+            device = Mock(**{"execute.return_value": empty_output_str})
+            obj = local_class(device=device)
+            obj.parse(**arguments)
+            results.append(_result(operating_system, token, name, user_test, "failed",
+                                   f"File parsed, when expected not to for {local_class}"))
+        except (SchemaEmptyParserError, AttributeError):
+            # Same as test_empty, the first empty output parsed as
+            # expected ends the test
+            results.append(_result(operating_system, token, name, user_test, "passed"))
+            break
+        except Exception as e:
+            results.append(_result(operating_system, token, name, user_test,
+                                   "errored", f"{type(e).__name__}: {e}"))
+    return results
+
+
+def run_shard(operating_system, details, _class=None, _token=None, _number=None):
+    """Run the golden and empty tests of the parser classes of one file."""
+    token = details["token"]
+    try:
+        _module = load_parse_module(operating_system, details)
+    except Exception as e:
+        return [_result(operating_system, token, None, details["parse_file"],
+                        "errored", f"{type(e).__name__}: {e}")]
+
+    results = []
+    for name, local_class in get_test_classes(_module, operating_system, token, _class, _token):
+        results.extend(run_golden(local_class, operating_system, token, _number))
+        results.extend(run_empty(local_class, operating_system, token))
+    return results
+
+
+def run_parallel(_os=None, _class=None, _token=None, _number=None,
+                 _external_folder=None, workers=None):
+    """Run the folder based tests across a pool of processes.
+
+    Returns the results of every golden and empty output, in a stable order.
+    """
+    shards = []
+    for operating_system in get_operating_systems(_os):
+        for details in get_parse_files(operating_system, _external_folder):
+            if _token and _token != details["token"]:
+                continue
+            shards.append((operating_system, details))
+
+    # Largest files first, so the longest shards do not start last
+    shards.sort(key=lambda shard: os.path.getsize(shard[1]["parse_file"]), reverse=True)
+
+    results = []
+    with ProcessPoolExecutor(max_workers=workers or None) as executor:
+        futures = {
+            executor.submit(run_shard, operating_system, details, _class, _token, _number):
+                (operating_system, details)
+            for operating_system, details in shards
+        }
+        for future in as_completed(futures):
+            operating_system, details = futures[future]
+            try:
+                results.extend(future.result())
+            except Exception as e:
+                results.append(_result(operating_system, details["token"], None,
+                                       details["parse_file"], "errored",
+                                       f"{type(e).__name__}: {e}"))
+
+    results.sort(key=lambda r: (r["os"], r["token"] or "", r["class"] or "", r["test"]))
+    return results
+
+
+def summarize(results):
+    """Count the results per OS and overall."""
+    summary = {}
+    for result in results:
+        for key in (result["os"], "total"):
+            counts = summary.setdefault(key, {"passed": 0, "failed": 0, "errored": 0})
+            counts[result["result"]] += 1
+    return summary
+
+
+def report_parallel(results, elapsed, report=None):
+    """Print the merged results, and save them as json if asked to."""
+    summary = summarize(results)
+    for result in results:
+        if result["result"] == "passed":
+            continue
+        path = " -> ".join(str(part) for part in (
+            result["os"], result["token"], result["class"], result["test"]) if part)
+        print(f"{result['result'].upper()}: {path}")
+        if result["reason"]:
+            print(result["reason"])
+
+    for key, counts in sorted(summary.items(), key=lambda item: item[0] == "total"):
+        print(f"{key:<10} passed {counts['passed']:>6}  failed {counts['failed']:>6}"
+              f"  errored {counts['errored']:>6}")
+    print(f"Ran {len(results)} tests in {elapsed:.1f}s")
+
+    if report:
+        with open(report, "w") as f:
+            json.dump({"summary": summary, "results": results}, f, indent=2)
+
+
 def _parse_args(
         operating_system=None,
         class_name=None,
@@ -958,7 +1172,9 @@ def _parse_args(
         display_only_failed=None,
         number=None,
         external_folder=None,
-        o=None,c=None,t=None,f=None,n=None,e=None,
+        workers=None,
+        report=None,
+        o=None,c=None,t=None,f=None,n=None,e=None,j=None,r=None,
         **kwargs):
     
     # Create the parser
@@ -988,6 +1204,14 @@ def _parse_args(
                         type=pathlib.Path,
                         help="An external parser folder to work with",
                         default=None or external_folder or e)
+    my_parser.add_argument('-j', "--workers",
+                        type=int,
+                        help="Run the tests in parallel with this many processes, 0 for one per core",
+                        default=next((v for v in (workers, j) if v is not None), None))
+    my_parser.add_argument('-r', "--report",
+                        type=str,
+                        help="Save the results of a parallel run to this json file",
+                        default=None or report or r)
     args = my_parser.parse_known_args()[0]
 
     _os = args.operating_system
@@ -996,18 +1220,27 @@ def _parse_args(
     _display_only_failed = args.display_only_failed
     _number = args.number
     _external_folder = args.external_folder
+    _workers = args.workers
+    _report = args.report
 
-    return _os, _class, _token, _display_only_failed, _number, _external_folder
+    return _os, _class, _token, _display_only_failed, _number, _external_folder, _workers, _report
 
 def main(**kwargs):
     
-    _os, _class, _token, _display_only_failed, _number, _external_folder = _parse_args(**kwargs)
+    _os, _class, _token, _display_only_failed, _number, _external_folder, _workers, _report = _parse_args(**kwargs)
 
     if _number and (not _class or not _number):
         sys.exit("Unittest number provided but missing supporting arguments:"
                 "\n* '-c' or '--class_name' for the parser class"
                 "\n* '-o' or '--operating_system' for operating system")
 
+    if _workers is not None:
+        # Used for `python folder_parsing_job.py -j 8`
+        start = time.time()
+        results = run_parallel(_os, _class, _token, _number, _external_folder, _workers)
+        report_parallel(results, time.time() - start, _report)
+        sys.exit(int(any(r["result"] != "passed" for r in results)))
+
 
     if _display_only_failed and log.root.handlers:
         temporary_screen_handler = log.root.handlers.pop(0)
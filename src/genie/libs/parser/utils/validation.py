@@ -0,0 +1,300 @@
+'''Compiled validation of the parsed output against the parser schema
+
+The schema engine walks the schema of the parser class generically for
+every parse, which is a large part of the parse time of a large output.
+The schema of each parser class is compiled once into a tree of specialized
+check functions, which only accept an output the schema engine accepts.
+An output which is rejected by the compiled checks, or a schema using
+constructs which are not compiled, such as Use() or Default(), is handed
+to the schema engine, so the result and the error messages are the ones of
+the schema engine.
+
+Validation can also be sampled or skipped for the outputs of a trusted
+pipeline, with the `genie.libs.parser.validation` configuration:
+
+    * full: every output is validated (default)
+    * sample: one output in `genie.libs.parser.validation_sample` of each
+              parser class is validated, starting with the first one
+    * skip: the outputs are not validated
+
+    example:
+
+        >>> set_validation_mode('sample', sample=100)
+        >>> parsed = validated_parse(ShowVersion(device=device))
+'''
+
+# python
+import itertools
+import threading
+
+from genie.metaparser.util import merge_dict
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+from genie.metaparser.util.schemaengine import Schema, Any, Or, ListOf
+
+from pyats import configuration as cfg
+
+from .schema_keys import split_key
+
+VALIDATION_MODE = 'genie.libs.parser.validation'
+VALIDATION_SAMPLE = 'genie.libs.parser.validation_sample'
+VALIDATION_MODES = ('full', 'sample', 'skip')
+
+# Values compared as they are
+LITERAL_TYPES = (str, int, float, bool)
+
+# Compiled validator, by parser class
+_validators = {}
+# Parse counter of the sampled validation, by parser class
+_counters = {}
+_lock = threading.Lock()
+
+_config = {'mode': 'full', 'sample': 10}
+
+
+class UnsupportedSchema(Exception):
+    '''The schema uses a construct which is left to the schema engine'''
+
+
+def set_validation_mode(mode, sample=None):
+    '''Set how the parsed outputs are validated
+
+        Args:
+            mode (`str`): full, sample or skip
+            sample (`int`): validate one output in `sample` of each parser
+                            class, for the sample mode
+    '''
+    if mode not in VALIDATION_MODES:
+        raise ValueError("Validation mode '{}' is not one of {}".format(
+            mode, ', '.join(VALIDATION_MODES)))
+    if sample is not None:
+        if int(sample) < 1:
+            raise ValueError('The validation sample must be at least 1')
+        _config['sample'] = int(sample)
+    _config['mode'] = mode
+    _counters.clear()
+
+
+def get_validation_mode():
+    '''Return the validation mode and sample'''
+    return dict(_config)
+
+
+def _compile_literal(literal):
+    literal_type = type(literal)
+
+    def check(data):
+        return type(data) is literal_type and data == literal
+    return check
+
+
+def _compile_type(expected):
+    def check(data):
+        return type(data) is expected
+    return check
+
+
+def _compile_or(checks):
+    def check(data):
+        for alternative in checks:
+            if alternative(data):
+                return True
+        return False
+    return check
+
+
+def _compile_list(checks):
+    item_check = checks[0] if len(checks) == 1 else _compile_or(checks)
+
+    def check(data):
+        # An empty list is left to the schema engine
+        if type(data) is not list or not data:
+            return False
+        for item in data:
+            if not item_check(item):
+                return False
+        return True
+    return check
+
+
+def _compile_dict(schema):
+    required = []
+    fields = {}
+    wildcard = None
+    wildcard_type = None
+
+    for key, value in schema.items():
+        value_check = _compile(value)
+        key, optional, any_key = split_key(key)
+
+        if any_key:
+            if wildcard is not None:
+                raise UnsupportedSchema('More than one wildcard key')
+            # A wildcard key may match no key of the data
+            wildcard = value_check
+            wildcard_type = None if type(key) is Any else key
+        elif type(key) in LITERAL_TYPES:
+            fields[key] = value_check
+            if not optional:
+                required.append(key)
+        else:
+            raise UnsupportedSchema('Key {!r}'.format(key))
+
+    def check(data):
+        if type(data) is not dict:
+            return False
+        for key in required:
+            if key not in data:
+                return False
+
+        for key, value in data.items():
+            value_check = fields.get(key)
+            if value_check is None:
+                if wildcard is None:
+                    return False
+                if wildcard_type is not None and \
+                        type(key) is not wildcard_type:
+                    return False
+                if not wildcard(value):
+                    return False
+            elif not value_check(value):
+                return False
+        return True
+    return check
+
+
+def _accept(data):
+    return True
+
+
+def _compile(schema):
+    '''Compile a schema into a check function, which returns True when the
+    data is valid and False when it must be validated by the schema engine'''
+    schema_type = type(schema)
+
+    if schema_type is dict:
+        return _compile_dict(schema)
+    if schema_type is list:
+        if not schema:
+            raise UnsupportedSchema('Empty list')
+        return _compile_list([_compile(item) for item in schema])
+    if schema_type is ListOf:
+        return _compile_list([_compile(schema.schema)])
+    if schema_type is Or:
+        return _compile_or([_compile(item) for item in schema.args])
+    if schema_type is Schema:
+        return _compile(schema.schema)
+    if schema_type is Any:
+        return _accept
+    if schema is None:
+        return lambda data: data is None
+    if schema_type is type and schema in (str, int, float, bool, dict, list):
+        return _compile_type(schema)
+    if schema_type in LITERAL_TYPES:
+        return _compile_literal(schema)
+
+    raise UnsupportedSchema('{!r}'.format(schema))
+
+
+def compile_schema(schema):
+    '''Compile a parser schema into a validator function
+
+        Args:
+            schema (`dict`): schema of a parser class
+
+        Returns:
+            function validating an output, which returns the validated
+            output or raises the error of the schema engine
+    '''
+    if not schema:
+        return lambda data: data
+
+    try:
+        check = _compile(schema)
+    except (UnsupportedSchema, AttributeError):
+        check = None
+
+    def validate(data):
+        if check is not None and check(data):
+            return data
+        return Schema(schema).validate(data)
+    return validate
+
+
+def get_validator(parser_cls):
+    '''Return the compiled validator of a parser class, compiled on the
+    first call'''
+    try:
+        return _validators[parser_cls]
+    except KeyError:
+        pass
+
+    with _lock:
+        if parser_cls not in _validators:
+            _validators[parser_cls] = compile_schema(
+                getattr(parser_cls, 'schema', None))
+        return _validators[parser_cls]
+
+
+def clear_validators():
+    '''Forget the compiled validators and the sample counters'''
+    with _lock:
+        _validators.clear()
+        _counters.clear()
+
+
+def validate(parser_cls, data):
+    '''Validate a parsed output with the validation mode
+
+        Args:
+            parser_cls (`class`): parser class of the output
+            data (`dict`): parsed output
+
+        Returns:
+            the validated output
+    '''
+    mode = _config['mode']
+    if mode == 'skip':
+        return data
+    if mode == 'sample':
+        try:
+            counter = _counters[parser_cls]
+        except KeyError:
+            counter = _counters.setdefault(parser_cls, itertools.count())
+        if next(counter) % _config['sample']:
+            return data
+    return get_validator(parser_cls)(data)
+
+
+def validated_parse(parser, **kwargs):
+    '''Parse in the context of the parser and validate the output with the
+    compiled validator of its class, instead of parser.parse()
+
+        Args:
+            parser (`MetaParser`): parser instance
+            kwargs: arguments of the parser context, e.g. output
+
+        Returns:
+            the validated output
+    '''
+    context = parser.context
+    if isinstance(context, str):
+        parsed = getattr(parser, context)(**kwargs)
+    elif hasattr(parser, '_'.join(context)):
+        # Combined contexts, like ['yang', 'cli'] with yang_cli(), as
+        # MetaParser.parse()
+        parsed = getattr(parser, '_'.join(context))(**kwargs)
+    else:
+        parsed = {}
+        for mechanism in context:
+            parsed = merge_dict(parsed, getattr(parser, mechanism)(**kwargs))
+    if not parsed:
+        raise SchemaEmptyParserError(parsed)
+    return validate(type(parser), parsed)
+
+
+# Configured mode
+try:
+    set_validation_mode(cfg.get(VALIDATION_MODE, 'full'),
+                        sample=cfg.get(VALIDATION_SAMPLE, None))
+except ValueError:
+    set_validation_mode('full')
@@ -0,0 +1,278 @@
+'''Streaming extraction of the rows of the xml outputs
+
+The `| xml` output of a NX-OS command nests its values in TABLE_x/ROW_x
+elements, under a namespace which changes with the release. A parser
+declares the rows it reads, with their path and the leaves kept from them,
+instead of walking the whole tree:
+
+    example:
+
+        >>> rows = [
+        ...     XmlRow('vrf', '**/TABLE_vrf/ROW_vrf', {
+        ...         'vrf-name-out': 'vrf',
+        ...         'vrf-local-as': ('local_as', int),
+        ...     }, rows=[
+        ...         XmlRow('neighbor', 'TABLE_neighbor/ROW_neighbor', {
+        ...             'neighborid': 'neighbor',
+        ...             'state': ('state', str.lower),
+        ...         }),
+        ...     ]),
+        ... ]
+        >>> for name, record, parents in iter_xml_rows(out, *rows):
+        ...     if name == 'neighbor':
+        ...         vrf = parents[0]['vrf']
+
+The paths are made of the tags without their namespace, separated by `/`.
+`*` in a tag matches any characters and a `**` step matches any number of
+elements. The path of a row starts from its enclosing row, or from the
+root element for the rows given to `iter_xml_rows()`, and the path of a
+leaf from its row. A step is restricted to a namespace by a prefix of the
+namespaces of the row, as in ElementTree:
+
+    example:
+
+        >>> XmlRow('bgp', '**/oc:bgp', {'global/state/as': ('as', int)},
+        ...        namespaces={'oc': 'http://openconfig.net/yang/bgp'})
+
+A leaf without text is kept as None, without being converted.
+
+The output is read one block at a time and every element is cleared once
+it ends, so the memory used does not grow with the size of the output.
+The record of a row is given when the row ends, with the records of its
+enclosing rows, which hold the leaves seen so far: the leaves of a row
+which come before its nested rows, as the device sends them, are known
+to the nested rows.
+'''
+
+# python
+import re
+import xml.etree.ElementTree as ET
+
+from .stream import CHUNK_SIZE
+
+# Tags of the command elements which are not words of the command
+COMMAND_SKIP = ('__XML__PARAM__', '__XML__value', 'TABLE')
+
+# Separator of the tags in the patterns of the paths, as the namespaces
+# hold '/'
+TAG_SEP = '\x1e'
+
+
+def local_name(tag):
+    '''Return the tag of an element without its namespace'''
+    return tag.rpartition('}')[2]
+
+
+def _compile_path(path, namespaces=None):
+    '''Compile a path with wildcards or prefixes, None for a plain path'''
+    if '*' not in path and ':' not in path:
+        return None
+
+    steps = path.split('/')
+    if steps[-1] == '**':
+        raise ValueError("Path '{}' cannot end with '**'".format(path))
+
+    regex = ''
+    for step in steps:
+        if step == '**':
+            regex += '(?:[^{0}]*{0})*'.format(TAG_SEP)
+            continue
+
+        prefix, _, tag = step.rpartition(':')
+        if prefix:
+            try:
+                namespace = re.escape('{%s}' % namespaces[prefix])
+            except (KeyError, TypeError):
+                raise ValueError("Unknown namespace prefix '{}' in path "
+                                 "'{}'".format(prefix, path)) from None
+        else:
+            namespace = r'(?:\{[^}]*\})?'
+        regex += namespace + \
+            re.escape(tag).replace(r'\*', '[^{}]*'.format(TAG_SEP)) + TAG_SEP
+    return re.compile(regex[:-1] + r'\Z')
+
+
+class XmlRow(object):
+    '''Repeated element of a xml output and the leaves kept from it
+
+        Args:
+            name (`str`): name given to the records of the row
+            path (`str`): path of the row, like 'TABLE_vrf/ROW_vrf'
+            fields (`dict`): key, or (key, convert), of the record for
+                             the path of each leaf kept
+            rows (`list`): rows nested in the row
+            namespaces (`dict`): namespace of each prefix of the paths
+    '''
+
+    def __init__(self, name, path, fields=None, rows=(), namespaces=None):
+        self.name = name
+        self.path = path
+        self.rows = list(rows)
+        self._pattern = _compile_path(path, namespaces)
+        self._fields = {}
+        self._field_patterns = []
+
+        for leaf, key in (fields or {}).items():
+            field = key if isinstance(key, tuple) else (key, None)
+            pattern = _compile_path(leaf, namespaces)
+            if pattern is None:
+                self._fields[leaf] = field
+            else:
+                self._field_patterns.append((pattern, field))
+
+    def __repr__(self):
+        return '{}({!r}, {!r})'.format(type(self).__name__, self.name,
+                                       self.path)
+
+    def match(self, path, tags):
+        '''Tell if an element is the row
+
+            Args:
+                path (`str`): tags without namespace, joined by '/', of the
+                              element and its ancestors from the enclosing
+                              row
+                tags (`list`): same tags, with their namespace
+        '''
+        if self._pattern is None:
+            return path == self.path
+        return self._pattern.match(TAG_SEP.join(tags)) is not None
+
+    def field(self, path, tags):
+        '''Return the (key, convert) of a leaf, None when it is not kept,
+        with the path and tags of the leaf from the row'''
+        try:
+            return self._fields[path]
+        except KeyError:
+            pass
+        for pattern, field in self._field_patterns:
+            if pattern.match(TAG_SEP.join(tags)):
+                return field
+        return None
+
+
+def _walk(element):
+    yield 'start', element
+    for child in element:
+        # Not the comments and processing instructions of lxml
+        if isinstance(child.tag, str):
+            yield from _walk(child)
+    yield 'end', element
+
+
+def _parse(output):
+    parser = ET.XMLPullParser(events=('start', 'end'))
+    for chunk in _iter_chunks(output):
+        parser.feed(chunk)
+        yield from parser.read_events()
+    # Incomplete output
+    parser.close()
+
+
+def _iter_chunks(output):
+    if isinstance(output, (str, bytes)):
+        for start in range(0, len(output), CHUNK_SIZE):
+            yield output[start:start + CHUNK_SIZE]
+    elif hasattr(output, 'read'):
+        chunk = output.read(CHUNK_SIZE)
+        while chunk:
+            yield chunk
+            chunk = output.read(CHUNK_SIZE)
+    else:
+        for chunk in output:
+            yield chunk
+
+
+def _compare_command(words, command):
+    cli = ' '.join(words)
+    assert cli == command, \
+        'Cli created from XML tags does not match the actual cli:\n'\
+        'XML Tags cli: {c}\nCli command: {e}'.format(c=cli, e=command)
+
+
+def iter_xml_rows(output, *rows, command=None):
+    '''Yield the records of the rows of a xml output, as the rows end
+
+    Anything after the root element, like the `]]>]]>` end of a NETCONF
+    message, is not read. An output already parsed, like the data_ele of
+    a NETCONF reply, is walked as it is, without clearing its elements.
+
+        Args:
+            output (`str`, `bytes`, file-like, iterable or `Element`): xml
+                output, its blocks or its root element
+            rows (`XmlRow`): rows to read
+            command (`str`): command expected before the __readonly__
+                             element, like Common.compose_compare_command()
+
+        Returns:
+            iterator of (name, record, parents), with the record of the
+            leaves of the row and the records of its enclosing rows,
+            outermost first
+
+        Raises:
+            AssertionError: command of the output is not the expected one
+            xml.etree.ElementTree.ParseError: output is not valid xml
+    '''
+    if ET.iselement(output):
+        events = _walk(output)
+        owned = False
+    else:
+        events = _parse(output)
+        owned = True
+
+    # Open rows as (row, record, number of open elements at its start)
+    frames = [(XmlRow(None, '', rows=rows), None, 0)]
+    names = []
+    tags = []
+    elements = []
+    words = []
+    compared = command is None
+
+    for event, element in events:
+        if event == 'start':
+            name = local_name(element.tag)
+            names.append(name)
+            tags.append(element.tag)
+            elements.append(element)
+
+            if not compared:
+                if name.endswith('__readonly__'):
+                    _compare_command(words, command)
+                    compared = True
+                elif len(names) > 2 and \
+                        not any(skip in name for skip in COMMAND_SKIP):
+                    words.append(name)
+
+            row, record, depth = frames[-1]
+            path = '/'.join(names[depth:])
+            for nested in row.rows:
+                if nested.match(path, tags[depth:]):
+                    frames.append((nested, {}, len(names)))
+                    break
+            continue
+
+        row, record, depth = frames[-1]
+        text = element.text
+        if depth == len(names):
+            frames.pop()
+            yield row.name, record, tuple(frame[1] for frame in frames[1:])
+        elif record is not None:
+            field = row.field('/'.join(names[depth:]), tags[depth:])
+            if field is not None:
+                key, convert = field
+                record[key] = text if convert is None or text is None \
+                    else convert(text)
+
+        if not compared and '__XML__value' in names[-1] and text:
+            words.append(text)
+
+        names.pop()
+        tags.pop()
+        elements.pop()
+        if not elements:
+            # End of the root element
+            if not compared:
+                _compare_command(words, command)
+            return
+        if owned:
+            element.clear()
+            elements[-1].remove(element)
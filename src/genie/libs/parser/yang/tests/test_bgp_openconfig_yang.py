@@ -1,7 +1,7 @@
 
 # Python
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 import xml.etree.ElementTree as ET
 
 # ATS
@@ -12,7 +12,10 @@ from pyats.topology import loader
 from genie.metaparser.util.exceptions import SchemaEmptyParserError
 
 # YANG Parser
-from genie.libs.parser.yang.bgp_openconfig_yang import BgpOpenconfigYang
+from genie.libs.parser.utils.ttl_cache import TtlCache
+from genie.libs.parser.yang import bgp_openconfig_yang
+from genie.libs.parser.yang.bgp_openconfig_yang import BgpOpenconfigYang,\
+                                                      subtree_filter
 
 
 # =======================================
@@ -1934,5 +1937,105 @@ class test_yang_bgp_nxos(unittest.TestCase):
         self.assertEqual(parsed_output,self.golden_parsed_output)
 
 
+# ================================================
+#  Unit test for the filter and cache of the 'GET'
+# ================================================
+
+class test_yang_bgp_cache(unittest.TestCase):
+
+    class etree_holder():
+        def __init__(self):
+            self.data_ele = ET.fromstring('''
+                <data>
+                 <bgp xmlns="http://openconfig.net/yang/bgp">
+                  <global>
+                   <state>
+                    <as>100</as>
+                   </state>
+                  </global>
+                  <neighbors>
+                   <neighbor>
+                    <neighbor-address>10.4.1.1</neighbor-address>
+                    <state>
+                     <peer-as>100</peer-as>
+                     <session-state>IDLE</session-state>
+                    </state>
+                   </neighbor>
+                   <neighbor>
+                    <neighbor-address>10.16.2.2</neighbor-address>
+                    <state>
+                     <peer-as>200</peer-as>
+                    </state>
+                   </neighbor>
+                  </neighbors>
+                 </bgp>
+                </data>
+                ''')
+
+    yang_output = etree_holder()
+
+    def setUp(self):
+        self.now = 0
+        cache = TtlCache(ttl=10, timer=lambda: self.now)
+        patcher = patch.object(bgp_openconfig_yang, 'yang_cache', cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.device = Mock()
+        self.device.get = Mock(return_value=self.yang_output)
+
+    def test_subtree_filter(self):
+        namespace = 'xmlns="http://openconfig.net/yang/bgp"'
+        self.assertEqual(subtree_filter(),
+                         '<bgp {}></bgp>'.format(namespace))
+        self.assertEqual(subtree_filter(neighbors_only=True),
+                         '<bgp {}><neighbors/></bgp>'.format(namespace))
+        self.assertEqual(subtree_filter(neighbor='10.4.1.1'),
+                         '<bgp {}><neighbors><neighbor><neighbor-address>'
+                         '10.4.1.1</neighbor-address></neighbor></neighbors>'
+                         '</bgp>'.format(namespace))
+
+    def test_cached(self):
+        obj = BgpOpenconfigYang(device=self.device, context='yang')
+        parsed_output = obj.parse()
+        self.assertEqual(parsed_output['bgp_pid'], 100)
+        self.device.get.assert_called_once_with(('subtree', subtree_filter()))
+
+        # Modifying an output does not modify the cache
+        parsed_output['vrf'].clear()
+        self.assertEqual(obj.parse(), BgpOpenconfigYang(
+            device=self.device, context='yang').parse())
+        self.assertEqual(self.device.get.call_count, 1)
+
+        # Expired
+        self.now = 10
+        obj.parse()
+        self.assertEqual(self.device.get.call_count, 2)
+
+    def test_narrowed(self):
+        obj = BgpOpenconfigYang(device=self.device)
+        obj.yang()
+        self.assertEqual(obj.yang(vrf='default', neighbor='10.16.2.2'),
+                         {'vrf': {'default': {'neighbor': {
+                             '10.16.2.2': {'remote_as': 200}}}}})
+        self.assertEqual(self.device.get.call_count, 1)
+
+    def test_neighbor(self):
+        obj = BgpOpenconfigYang(device=self.device)
+        obj.yang(neighbor='10.4.1.1')
+        self.device.get.assert_called_once_with(
+            ('subtree', subtree_filter(neighbor='10.4.1.1')))
+
+        # The reply of a neighbor does not serve the whole tree
+        obj.yang(neighbors_only=True)
+        self.assertEqual(self.device.get.call_count, 2)
+        self.assertEqual(self.device.get.call_args[0][0],
+                         ('subtree', subtree_filter(neighbors_only=True)))
+
+    def test_other_vrf(self):
+        obj = BgpOpenconfigYang(device=self.device)
+        self.assertEqual(obj.yang(vrf='VRF1', neighbors_only=True), {})
+        self.assertFalse(self.device.get.called)
+
+
 if __name__ == '__main__':
     unittest.main()